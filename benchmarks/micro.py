@@ -0,0 +1,362 @@
+"""benchmarks/micro.py — hot-path microbenchmarks with stored baselines.
+
+Times the framework paths that dominate boot and request cost, using the
+example apps as the corpus:
+
+* ``lex``          — ``tokenize`` over every example DSL file
+* ``parse``        — ``Parser`` over the same files, pre-lexed
+* ``link``         — ``build_appspec`` for every example app, pre-parsed
+* ``predicate``    — ``compile_predicate`` for every scope rule of ``--app``
+* ``build_select`` — ``QueryBuilder.build_select`` for a scoped, filtered,
+  sorted, searched list page of each scoped entity of ``--app``
+* ``row_to_model`` — ``Repository._row_to_model`` over 100 rows of the
+  app's widest entity
+* ``render_table`` — ``render_data_table_rows`` for those 100 rows
+
+Rows come from ``dazzle.seed.scale``, so values honour enums, state
+machines and field lengths. Sampling, the results file and the
+significance test live in ``dazzle.perf.micro``. No database or server is
+needed.
+
+``run --compare`` exits 1 when any case is slower than the stored baseline
+by more than ``--threshold`` *and* the Mann-Whitney U test rejects "same
+distribution" at ``--alpha``. Timings are machine-specific: refresh the
+baseline (``run --save``) on the machine you compare on; the comparison
+warns when the two runs come from different interpreters or hosts.
+
+Usage::
+
+    python -m benchmarks.micro run                  # print timings
+    python -m benchmarks.micro run --save           # refresh results/micro_baseline.json
+    python -m benchmarks.micro run --compare        # flag significant regressions
+    python -m benchmarks.micro run --case lex --case parse --out /tmp/new.json
+    python -m benchmarks.micro compare OLD.json NEW.json
+
+Public API::
+
+    CASES: dict[str, Callable[[Corpus], Callable[[], object]]]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections.abc import Callable
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+from dazzle.core.appspec_loader import load_project_appspec
+from dazzle.core.dsl_parser_impl import Parser
+from dazzle.core.fileset import discover_dsl_files
+from dazzle.core.ir import FieldTypeKind
+from dazzle.core.lexer import tokenize
+from dazzle.core.linker import build_appspec
+from dazzle.core.manifest import load_manifest
+from dazzle.core.parser import parse_modules
+from dazzle.core.renderer_registry import known_renderer_names
+from dazzle.http.converters.entity_converter import convert_entities
+from dazzle.http.runtime.model_generator import generate_all_entity_models
+from dazzle.http.runtime.predicate_compiler import compile_predicate
+from dazzle.http.runtime.query_builder import QueryBuilder
+from dazzle.http.runtime.repository import Repository
+from dazzle.http.runtime.workspace_columns import field_kind_to_col_type
+from dazzle.perf.micro import (
+    DEFAULT_ALPHA,
+    DEFAULT_MIN_TIME,
+    DEFAULT_SAMPLES,
+    DEFAULT_THRESHOLD,
+    CaseResult,
+    MicroRun,
+    compare_runs,
+    environment,
+    environment_mismatch,
+    load_run,
+    measure,
+    regressions,
+    render_comparison,
+    render_run,
+    save_run,
+)
+from dazzle.render.fragment.primitives import DataTable, RowCapabilities
+from dazzle.render.fragment.renderer._data_row import render_data_table_rows
+from dazzle.seed.scale import RowFactory, plan_scale
+
+EXAMPLES_DIR = Path(__file__).resolve().parent.parent / "examples"
+BASELINE_PATH = Path(__file__).resolve().parent / "results" / "micro_baseline.json"
+DEFAULT_APP = "invoice_ops"
+TABLE_ROWS = 100
+
+_NO_COLUMN_KINDS = frozenset(
+    {
+        FieldTypeKind.HAS_MANY,
+        FieldTypeKind.HAS_ONE,
+        FieldTypeKind.EMBEDS,
+        FieldTypeKind.BELONGS_TO,
+    }
+)
+
+
+class Corpus:
+    """Inputs shared by the cases, built on first use so ``--case`` stays cheap."""
+
+    def __init__(self, examples_dir: Path, app: str) -> None:
+        self.examples_dir = examples_dir
+        self.app_dir = examples_dir / app
+
+    @cached_property
+    def projects(self) -> list[Path]:
+        return [p for p in sorted(self.examples_dir.iterdir()) if (p / "dazzle.toml").exists()]
+
+    @cached_property
+    def sources(self) -> list[tuple[Path, str]]:
+        files = [
+            f
+            for p in self.projects
+            for f in discover_dsl_files(p, load_manifest(p / "dazzle.toml"))
+        ]
+        return [(f, f.read_text(encoding="utf-8")) for f in files]
+
+    @cached_property
+    def appspec(self) -> Any:
+        return load_project_appspec(self.app_dir, use_cache=False)
+
+    @cached_property
+    def entity(self) -> Any:
+        """The app's widest entity — the most columns to convert and render."""
+        return max(self.appspec.domain.entities, key=lambda e: len(e.fields))
+
+    @cached_property
+    def rows(self) -> list[dict[str, str | None]]:
+        """``TABLE_ROWS`` rows of :attr:`entity` as a driver returns them (text)."""
+        entities = {e.name: e for e in self.appspec.domain.entities}
+        plan = plan_scale(self.appspec, {self.entity.name: TABLE_ROWS}, tenants=1)
+        factory = RowFactory(self.entity, plan, entities)
+        return [
+            {
+                col: None if value == "\\N" else value
+                for col, value in zip(factory.columns, line.split("\t"), strict=True)
+            }
+            for line in factory.lines(0, TABLE_ROWS).splitlines()
+        ]
+
+    @cached_property
+    def repository(self) -> Repository[Any]:
+        runtime = convert_entities(self.appspec.domain.entities)
+        models = generate_all_entity_models(runtime)
+        spec = next(e for e in runtime if e.name == self.entity.name)
+        return Repository(None, spec, models[spec.name])
+
+    def scope_predicates(self) -> list[tuple[str, Any]]:
+        return [
+            (entity.name, rule.predicate)
+            for entity in self.appspec.domain.entities
+            if entity.access is not None
+            for rule in entity.access.scopes
+            if rule.predicate is not None
+        ]
+
+
+# ---------------------------------------------------------------------------
+# Cases — each builder does its setup and returns the callable to time
+# ---------------------------------------------------------------------------
+
+
+def _lex(corpus: Corpus) -> Callable[[], object]:
+    sources = corpus.sources
+    return lambda: [tokenize(text, path) for path, text in sources]
+
+
+def _parse(corpus: Corpus) -> Callable[[], object]:
+    lexed = [(path, tokenize(text, path)) for path, text in corpus.sources]
+
+    def run() -> None:
+        for path, tokens in lexed:
+            parser = Parser(tokens, path)
+            parser.parse_module_header()
+            parser.parse()
+
+    return run
+
+
+def _link(corpus: Corpus) -> Callable[[], object]:
+    jobs = []
+    for project in corpus.projects:
+        manifest = load_manifest(project / "dazzle.toml")
+        modules = parse_modules(discover_dsl_files(project, manifest), workers=1)
+        jobs.append((modules, manifest.project_root, known_renderer_names(manifest)))
+    return lambda: [build_appspec(m, root, known_renderers=r) for m, root, r in jobs]
+
+
+def _predicate(corpus: Corpus) -> Callable[[], object]:
+    predicates = corpus.scope_predicates()
+    fk_graph = corpus.appspec.fk_graph
+    return lambda: [compile_predicate(p, name, fk_graph) for name, p in predicates]
+
+
+def _list_query(entity: Any, scope: tuple[str, list[Any]]) -> tuple[str, list[Any]]:
+    builder = QueryBuilder(table_name=entity.name, scope_predicate=scope)
+    for field in entity.fields:
+        if field.type.kind == FieldTypeKind.ENUM and field.type.enum_values:
+            builder.add_filter(field.name, field.type.enum_values[0])
+            break
+    text_fields = [f.name for f in entity.fields if f.type.kind == FieldTypeKind.STR]
+    builder.add_sort(f"-{entity.fields[-1].name}")
+    builder.set_search("acme", text_fields)
+    builder.set_pagination(page=2, page_size=25)
+    return builder.build_select()
+
+
+def _build_select(corpus: Corpus) -> Callable[[], object]:
+    fk_graph = corpus.appspec.fk_graph
+    scopes: dict[str, tuple[str, list[Any]]] = {}
+    for name, predicate in corpus.scope_predicates():
+        scopes.setdefault(name, compile_predicate(predicate, name, fk_graph))
+    entities = [(corpus.appspec.get_entity(name), scope) for name, scope in scopes.items()]
+    return lambda: [_list_query(entity, scope) for entity, scope in entities]
+
+
+def _row_to_model(corpus: Corpus) -> Callable[[], object]:
+    repo, rows = corpus.repository, corpus.rows
+    return lambda: [repo._row_to_model(row) for row in rows]
+
+
+def _table_columns(entity: Any) -> tuple[dict[str, Any], ...]:
+    columns: list[dict[str, Any]] = []
+    for field in entity.fields:
+        kind = field.type.kind
+        if field.is_primary_key or kind in _NO_COLUMN_KINDS:
+            continue
+        column = {
+            "key": field.name,
+            "label": field.name.replace("_", " ").title(),
+            "type": field_kind_to_col_type(field, entity),
+        }
+        if kind == FieldTypeKind.ENUM:
+            column["filter_options"] = list(field.type.enum_values or [])
+        elif kind == FieldTypeKind.MONEY:
+            column["key"] = f"{field.name}_minor"
+            column["currency_code"] = field.type.currency_code or "GBP"
+        columns.append(column)
+    return tuple(columns)
+
+
+def _render_table(corpus: Corpus) -> Callable[[], object]:
+    entity = corpus.entity
+    items = tuple(corpus.repository._row_to_model(row).model_dump() for row in corpus.rows)
+    table = DataTable(
+        columns=_table_columns(entity),
+        rows=items,
+        entity_name=entity.name,
+        api_endpoint=f"/{entity.name.lower()}s",
+        detail_url_template=f"/app/{entity.name.lower()}/{{id}}",
+        table_id=f"dt-{entity.name.lower()}",
+        capabilities=RowCapabilities(bulk_select=True, drill=True),
+    )
+    return lambda: render_data_table_rows(table)
+
+
+CASES: dict[str, Callable[[Corpus], Callable[[], object]]] = {
+    "lex": _lex,
+    "parse": _parse,
+    "link": _link,
+    "predicate": _predicate,
+    "build_select": _build_select,
+    "row_to_model": _row_to_model,
+    "render_table": _render_table,
+}
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def _run(args: argparse.Namespace) -> int:
+    unknown = [c for c in args.case if c not in CASES]
+    if unknown:
+        print(f"unknown case(s): {', '.join(unknown)}; choose from {', '.join(CASES)}")
+        return 2
+    corpus = Corpus(args.examples, args.app)
+    results: dict[str, CaseResult] = {}
+    for name in args.case or list(CASES):
+        fn = CASES[name](corpus)
+        results[name] = measure(name, fn, samples=args.samples, min_time=args.min_time)
+        print(f"  {name}: done", file=sys.stderr)
+    run = MicroRun(cases=results, environment=environment())
+    print(render_run(run))
+
+    out = BASELINE_PATH if args.save else args.out
+    if out is not None:
+        save_run(run, out)
+        print(f"\nwrote {out}")
+    if args.compare is not None:
+        return _report(load_run(args.compare), run, args)
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    return _report(load_run(args.baseline), load_run(args.current), args)
+
+
+def _report(baseline: MicroRun, current: MicroRun, args: argparse.Namespace) -> int:
+    rows = compare_runs(baseline, current, alpha=args.alpha, threshold=args.threshold)
+    print()
+    for note in environment_mismatch(baseline, current):
+        print(f"warning: environments differ ({note})")
+    print(render_comparison(rows))
+    slower = regressions(rows)
+    if slower:
+        print(f"\n{len(slower)} significant regression(s): {', '.join(r.name for r in slower)}")
+        return 1
+    return 0
+
+
+def _add_stats_options(ap: argparse.ArgumentParser) -> None:
+    ap.add_argument(
+        "--alpha", type=float, default=DEFAULT_ALPHA, help="Significance level (default 0.01)"
+    )
+    ap.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Ignore median shifts below this fraction (default 0.05)",
+    )
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="Time the cases")
+    run.add_argument("--case", action="append", default=[], help=f"One of {', '.join(CASES)}")
+    run.add_argument("--app", default=DEFAULT_APP, help=f"Example app (default {DEFAULT_APP})")
+    run.add_argument("--examples", type=Path, default=EXAMPLES_DIR, help="Examples directory")
+    run.add_argument("--samples", type=int, default=DEFAULT_SAMPLES, help="Samples per case")
+    run.add_argument(
+        "--min-time", type=float, default=DEFAULT_MIN_TIME, help="Seconds per sample (min)"
+    )
+    run.add_argument("--out", type=Path, help="Write the run to this JSON file")
+    run.add_argument("--save", action="store_true", help=f"Write the run to {BASELINE_PATH.name}")
+    run.add_argument(
+        "--compare",
+        type=Path,
+        nargs="?",
+        const=BASELINE_PATH,
+        help="Compare against a run file (default: the stored baseline)",
+    )
+    _add_stats_options(run)
+    run.set_defaults(handler=_run)
+
+    compare = sub.add_parser("compare", help="Compare two saved runs")
+    compare.add_argument("baseline", type=Path)
+    compare.add_argument("current", type=Path)
+    _add_stats_options(compare)
+    compare.set_defaults(handler=_compare)
+
+    args = ap.parse_args()
+    raise SystemExit(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""benchmarks/parse.py — sequential vs process-pool ``parse_modules`` timings.
+
+Parses the largest example projects (by DSL line count) plus a combined
+"monorepo" corpus made of every ``examples/*/dsl`` file, once sequentially
+(``workers=1``) and once through the process pool (``workers=N``), and
+prints the median wall time of each.
+
+The combined corpus stands in for a 40–70-file project: example files
+parse independently, so the corpus is valid input for ``parse_modules``
+even though it would not link as a single app.
+
+No database or server is needed. The parse cache is not involved —
+``parse_modules`` is called without one, so every run is a cold parse.
+
+Usage::
+
+    python -m benchmarks.parse                   # top 3 examples + combined
+    python -m benchmarks.parse --top 5 --repeat 7 --workers 8
+
+Public API::
+
+    bench_parse(files, workers, repeat) -> float  # median seconds
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import time
+from pathlib import Path
+
+from dazzle.core.parser import PARSE_WORKERS_ENV, parse_modules
+
+EXAMPLES_DIR = Path(__file__).resolve().parent.parent / "examples"
+
+
+def _project_files(project: Path) -> list[Path]:
+    return sorted(project.rglob("*.dsl"))
+
+
+def _line_count(files: list[Path]) -> int:
+    return sum(len(f.read_text(encoding="utf-8").splitlines()) for f in files)
+
+
+def bench_parse(files: list[Path], workers: int, repeat: int) -> float:
+    """Median wall-clock seconds for ``parse_modules(files, workers=workers)``."""
+    timings: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse_modules(files, workers=workers)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    ap.add_argument("--top", type=int, default=3, help="Largest N example projects (default 3)")
+    ap.add_argument("--repeat", type=int, default=5, help="Runs per cell (median reported)")
+    ap.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 2, help="Pool size for parallel runs"
+    )
+    args = ap.parse_args()
+    # The shared parser pool is sized from the environment when first created.
+    os.environ[PARSE_WORKERS_ENV] = str(args.workers)
+
+    projects = [p for p in sorted(EXAMPLES_DIR.iterdir()) if (p / "dazzle.toml").exists()]
+    sized = sorted(((_line_count(_project_files(p)), p) for p in projects), reverse=True)
+    cases: list[tuple[str, list[Path]]] = [
+        (p.name, _project_files(p)) for _, p in sized[: args.top]
+    ]
+    cases.append(("combined", [f for p in projects for f in sorted((p / "dsl").glob("*.dsl"))]))
+
+    # Warm imports and the pool's workers so the first cell is not penalised.
+    parse_modules(cases[0][1], workers=args.workers)
+
+    print(f"{'case':<16} {'files':>5} {'lines':>6} {'seq ms':>8} {'pool ms':>8} {'speedup':>7}")
+    for name, files in cases:
+        seq = bench_parse(files, 1, args.repeat)
+        par = bench_parse(files, args.workers, args.repeat)
+        print(
+            f"{name:<16} {len(files):>5} {_line_count(files):>6} "
+            f"{seq * 1000:>8.0f} {par * 1000:>8.0f} {seq / par:>6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -114,6 +114,11 @@ from dazzle.cli.fragment_audit import fragment_audit_command  # noqa: E402
 
 app.command(name="fragment-audit")(fragment_audit_command)
 
+# Bench command — AppSpec-derived concurrent load benchmark
+from dazzle.cli.bench import bench_command  # noqa: E402
+
+app.command(name="bench")(bench_command)
+
 # Sweep command group — unified health check across every example app.
 # `dazzle sweep examples` runs validate + lint + framework coverage snapshot
 # and emits a single report suitable for weekly scheduled runs.
@@ -306,6 +311,7 @@ from dazzle.cli.rbac import rbac_app  # noqa: E402
 from dazzle.cli.representation import representation_app  # noqa: E402
 from dazzle.cli.rhythm import rhythm_app  # noqa: E402
 from dazzle.cli.scaffold import scaffold_app  # noqa: E402
+from dazzle.cli.seed import seed_app  # noqa: E402
 from dazzle.cli.sentinel import sentinel_app  # noqa: E402
 from dazzle.cli.signing import signing_app  # noqa: E402
 from dazzle.cli.spec import spec_app  # noqa: E402
@@ -342,6 +348,7 @@ app.add_typer(vocab_app, name="vocab")
 app.add_typer(worker_app, name="worker")
 app.add_typer(stubs_app, name="stubs")
 app.add_typer(scaffold_app, name="scaffold")
+app.add_typer(seed_app, name="seed")
 app.add_typer(prove_app, name="prove")
 app.add_typer(representation_app, name="representation")
 app.add_typer(story_app, name="story")
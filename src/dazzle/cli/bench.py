@@ -0,0 +1,152 @@
+"""`dazzle bench` — concurrent load benchmark derived from the AppSpec.
+
+Builds a mixed list / detail / filter / search / create / workspace
+workload for every persona, authenticates each persona against a
+running server, and drives the workload concurrently. Reports
+throughput and p50/p95/p99 per route, and saves every request into the
+``dazzle perf`` store so runs can be compared.
+
+Usage
+-----
+    dazzle serve --local --test-mode &
+    dazzle bench                            # 30s closed loop, 10 workers
+    dazzle bench -c 50 --rate 200           # open loop, 200 req/s
+    dazzle bench --persona admin --read-only --json
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+import httpx
+import typer
+
+from dazzle.cli.utils import project_root_from_manifest
+from dazzle.core.appspec_loader import load_project_appspec
+from dazzle.core.manifest import resolve_api_url
+from dazzle.perf.bench import (
+    BenchContext,
+    BenchRun,
+    BenchTarget,
+    build_workload,
+    export_run,
+    prime_ids,
+    render_table,
+    run_bench,
+    runnable,
+    summarize,
+)
+from dazzle.perf.run_id import make_run_id
+from dazzle.testing.session_manager import SessionManager
+
+
+async def _authenticate(manager: SessionManager, personas: list[str]) -> dict[str, dict[str, str]]:
+    headers: dict[str, dict[str, str]] = {}
+    for persona in personas:
+        try:
+            session = await manager.create_session(persona)
+        except (RuntimeError, httpx.HTTPError) as exc:
+            typer.echo(f"  skipping persona {persona}: {exc}", err=True)
+            continue
+        headers[persona] = {"Cookie": f"dazzle_session={session.session_token}"}
+    return headers
+
+
+async def _run(
+    project_root: Path,
+    base_url: str,
+    targets: list[BenchTarget],
+    entities: dict[str, Any],
+    **options: Any,
+) -> tuple[list[BenchTarget], BenchRun]:
+    manager = SessionManager(project_root, base_url)
+    headers = await _authenticate(manager, sorted({t.persona for t in targets}))
+    targets = [t for t in targets if t.persona in headers]
+    context = BenchContext(headers=headers, entities=entities)
+    limits = httpx.Limits(max_connections=options["concurrency"])
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        headers={"Origin": base_url},
+        limits=limits,
+        timeout=30.0,
+    ) as client:
+        await prime_ids(client, targets, context)
+        targets = runnable(targets, context)
+        run = await run_bench(client, targets, context, **options)
+    return targets, run
+
+
+def bench_command(
+    manifest: str = typer.Option("dazzle.toml", "--manifest", "-m"),
+    url: str | None = typer.Option(
+        None, "--url", help="Server to benchmark (default: the project's API URL)."
+    ),
+    duration: float = typer.Option(30.0, "--duration", "-d", help="Seconds to run."),
+    concurrency: int = typer.Option(10, "--concurrency", "-c", help="Max requests in flight."),
+    rate: float | None = typer.Option(
+        None,
+        "--rate",
+        help="Open-loop arrivals per second (Poisson). Default: closed loop.",
+    ),
+    personas: list[str] = typer.Option(
+        [], "--persona", "-p", help="Limit to these personas (repeatable)."
+    ),
+    read_only: bool = typer.Option(False, "--read-only", help="Skip create requests."),
+    seed: int = typer.Option(0, "--seed", help="Seed for target picks and arrivals."),
+    as_json: bool = typer.Option(False, "--json", help="Emit per-route stats as JSON."),
+    export: bool = typer.Option(
+        True, "--export/--no-export", help="Save the run into .dazzle/perf/ for `dazzle perf`."
+    ),
+) -> None:
+    """Run an AppSpec-derived concurrent load benchmark against a running server.
+
+    Start the app with ``dazzle serve --test-mode`` first so each persona
+    can authenticate.
+    """
+    project_root = project_root_from_manifest(manifest)
+    appspec = load_project_appspec(project_root)
+    targets = build_workload(appspec, personas=personas or None, read_only=read_only)
+    if not targets:
+        typer.echo("No benchmark targets: the AppSpec has no list surfaces or workspaces.")
+        raise typer.Exit(1)
+
+    base_url = (url or resolve_api_url()).rstrip("/")
+    entities = {e.name: e for e in appspec.domain.entities}
+    typer.echo(f"Benchmarking {base_url}: {len(targets)} targets, {duration:.0f}s", err=True)
+    targets, run = asyncio.run(
+        _run(
+            project_root,
+            base_url,
+            targets,
+            entities,
+            duration=duration,
+            concurrency=concurrency,
+            rate=rate,
+            seed=seed,
+        )
+    )
+    if not run.samples:
+        typer.echo("No requests were issued — check that personas can authenticate.", err=True)
+        raise typer.Exit(1)
+
+    stats = summarize(run)
+    if as_json:
+        typer.echo(json.dumps([asdict(s) for s in stats], indent=2))
+    else:
+        typer.echo(render_table(run, stats))
+
+    if export:
+        run_id = make_run_id()
+        db_path = export_run(
+            run,
+            project_root / ".dazzle" / "perf" / f"{run_id}.db",
+            run_id=run_id,
+            app_name=appspec.name,
+            command_line=" ".join(["dazzle", *sys.argv[1:]]),
+        )
+        typer.echo(f"Saved run {run_id}: {db_path}", err=True)
@@ -2,6 +2,7 @@
 
 ``dazzle clean snapshots`` reclaims exploded ``.dazzle/spec_snapshots/``
 trees left by historical ops rollback mirrors (ADR-0051 retired the writer).
+``dazzle clean parse-cache`` drops the parse/link artifact cache.
 """
 
 from __future__ import annotations
@@ -18,6 +19,7 @@ from dazzle.core.local_snapshots import (
     remove_all_snapshots,
     snapshots_root,
 )
+from dazzle.core.parse_cache import ParseCache, project_parse_cache_dir
 
 clean_app = typer.Typer(
     help="Remove regenerable local state (gitignored). Does not touch git or source.",
@@ -100,3 +102,25 @@ def clean_snapshots_command(
 
     if dry_run:
         typer.echo("Dry run — no files deleted.")
+
+
+@clean_app.command("parse-cache")
+def clean_parse_cache_command(
+    project: Path = typer.Option(
+        Path("."),
+        "--project",
+        help="Project root (default: cwd).",
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        resolve_path=True,
+    ),
+) -> None:
+    """Clear the on-disk parse/link cache under ``.dazzle/cache/parse``.
+
+    The cache is content-hash keyed and never serves stale IR, so this is
+    only needed to reclaim disk or rule the cache out while debugging.
+    """
+    cache = ParseCache(project_parse_cache_dir(project))
+    removed = cache.clear()
+    typer.echo(f"Removed {removed} cached parse artifact(s) from {cache.cache_dir}.")
@@ -8,6 +8,7 @@ Wraps Alembic's programmatic API for managing PostgreSQL schema migrations:
 - current:  Show current revision
 - history:  Show migration history
 - stamp:    Mark a revision as applied without running it
+- advise-indexes: Recommend indexes for the DSL's access paths
 """
 
 import asyncio
@@ -23,6 +24,14 @@ from dazzle.core.environment import DAZZLE_ENV_VAR
 from dazzle.core.ir import TenancyMode
 from dazzle.core.ir.fields import FieldTypeKind
 from dazzle.core.ir.fk_graph import FKGraph
+from dazzle.db.closure import ClosureCheck, ClosureSpec, check_closure, closure_specs
+from dazzle.db.index_advisor import (
+    IndexAdvice,
+    advise_indexes,
+    catalog_indexes,
+    declared_indexes,
+    explain_advice,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -2261,3 +2270,181 @@ def explain_scope_command(
             console.print("[green]verdict:[/green] RLS")
         except ValueError as exc:
             console.print(f"[yellow]verdict:[/yellow] app-layer (degraded: {exc})")
+
+
+@db_app.command(name="advise-indexes")
+def advise_indexes_command(
+    database_url: str = typer.Option("", "--database-url", help="Database URL override"),
+    offline: bool = typer.Option(
+        False, "--offline", help="Diff against the declared schema only — no DB connection"
+    ),
+    as_json: bool = typer.Option(False, "--json", help="Output as JSON"),
+    as_sql: bool = typer.Option(
+        False, "--sql", help="Print concurrent index DDL to apply to a live table"
+    ),
+    write_migration: str = typer.Option(
+        "",
+        "--write-migration",
+        "-m",
+        help="Write the advice as a reviewable migration revision with this message",
+    ),
+    explain: bool = typer.Option(
+        False,
+        "--explain",
+        help="EXPLAIN each index against the (seeded) DB inside a rolled-back "
+        "transaction and report the planner cost before/after",
+    ),
+) -> None:
+    """Recommend indexes for the access paths the DSL declares.
+
+    Walks scope predicates, list-surface sorts / filters / search, ref fields
+    and workspace GROUP BYs, then drops whatever the declared schema (and, unless
+    ``--offline``, the live catalog) already covers. ``--explain`` builds each
+    index for real before rolling back — point it at a seeded copy, not
+    production.
+    """
+    import json as json_mod
+    from dataclasses import asdict
+
+    from dazzle.http.alembic.metadata_loader import load_target_metadata
+
+    project_root = Path.cwd().resolve()
+    appspec = load_project_appspec(project_root)
+    existing = declared_indexes(load_target_metadata())
+    url = "" if offline else _resolve_url(database_url)
+    if url:
+        existing += asyncio.run(_run_with_connection(project_root, url, catalog_indexes))
+    advice = advise_indexes(appspec, existing)
+
+    if as_json:
+        console.print(json_mod.dumps([asdict(a) | {"name": a.name} for a in advice], indent=2))
+    elif as_sql:
+        for item in advice:
+            print(f"{item.create_sql(concurrently=True)};")
+    else:
+        _print_index_advice(advice)
+
+    if explain and advice:
+        if not url:
+            console.print("[red]--explain needs a database connection[/red]")
+            raise typer.Exit(code=1)
+        _explain_index_advice(project_root, url, advice)
+    if write_migration and advice:
+        _write_index_migration(advice, write_migration)
+
+
+def _print_index_advice(advice: list[IndexAdvice]) -> None:
+    if not advice:
+        console.print("[green]No missing indexes.[/green]")
+        return
+    for item in advice:
+        console.print(f"\n[bold]{item.name}[/bold]")
+        console.print(f"  {item.create_sql()}")
+        console.print(f"  [dim]for: {'; '.join(item.reasons)}[/dim]")
+    console.print(f"\n{len(advice)} index(es) recommended.")
+
+
+def _explain_index_advice(project_root: Path, url: str, advice: list[IndexAdvice]) -> None:
+    async def _run(conn: Any) -> list[Any]:
+        return [await explain_advice(conn, item) for item in advice]
+
+    results = asyncio.run(_run_with_connection(project_root, url, _run))
+    console.print(
+        "\n[bold]Index                                     Before      After  Used[/bold]"
+    )
+    for r in results:
+        used = "[green]yes[/green]" if r.used else "[yellow]no[/yellow]"
+        console.print(
+            f"  {r.advice.name[:40]:<40} {r.cost_before:>8.1f} {r.cost_after:>10.1f}  {used}"
+        )
+
+
+def _write_index_migration(advice: list[IndexAdvice], message: str) -> None:
+    _write_sql_migration("dazzle_index_advice", advice, message, "Index")
+
+
+def _write_sql_migration(attribute: str, items: list[Any], message: str, label: str) -> None:
+    """Write a raw-SQL revision via the engine; ``attribute`` selects the env.py plan."""
+    from alembic import command
+
+    cfg = _get_alembic_cfg()
+    cfg.attributes["dazzle_use_engine"] = True
+    cfg.attributes[attribute] = items
+    heads = _get_heads(cfg)
+    if len(heads) > 1:
+        console.print(
+            f"[red]Cannot create a revision: {len(heads)} migration heads are present.[/red]\n"
+            "[dim]  Run `dazzle db reconcile-baseline` first (see #1309).[/dim]"
+        )
+        raise typer.Exit(1)
+    try:
+        rev = command.revision(
+            cfg,
+            message=message,
+            autogenerate=True,
+            version_path=str(_get_project_versions_dir()),
+        )
+        _inject_schema_snapshot(rev, cfg.attributes.get("dazzle_schema_snapshot"))
+    except Exception as e:
+        console.print(f"[red]Failed to write {label.lower()} migration: {e}[/red]")
+        raise typer.Exit(1)
+    console.print(f"[green]{label} migration created: {message}[/green] — review before upgrading")
+
+
+@db_app.command(name="closure")
+def closure_command(
+    database_url: str = typer.Option("", "--database-url", help="Database URL override"),
+    check: bool = typer.Option(
+        False, "--check", help="Diff each closure table against a recursive walk; exit 1 on drift"
+    ),
+    as_sql: bool = typer.Option(False, "--sql", help="Print the DDL, triggers and backfill"),
+    write_migration: str = typer.Option(
+        "",
+        "--write-migration",
+        "-m",
+        help="Write the closure tables as a reviewable migration revision with this message",
+    ),
+) -> None:
+    """Materialise closure tables for self-referential hierarchies.
+
+    Every ``descendants_of`` / ``ancestors_of`` field that walks a self-ref FK
+    gets an ``<Entity>_<fk>_closure`` table kept current by triggers. Once the
+    migration is applied, the runtime answers those fields with one indexed
+    join instead of a recursive walk (picked up on server restart).
+    """
+    project_root = Path.cwd().resolve()
+    specs = closure_specs(load_project_appspec(project_root))
+    if not specs:
+        console.print("[green]No self-referential hierarchies to materialise.[/green]")
+        return
+
+    if as_sql:
+        for spec in specs:
+            for sql in (*spec.create_sql(), *spec.backfill_sql()):
+                print(f"{sql};")
+    elif not check:
+        for spec in specs:
+            console.print(f"  {spec.entity}.{spec.parent_field} -> [bold]{spec.table}[/bold]")
+
+    if check:
+        _check_closures(project_root, _resolve_url(database_url), specs)
+    if write_migration:
+        _write_sql_migration("dazzle_closure_specs", specs, write_migration, "Closure")
+
+
+def _check_closures(project_root: Path, url: str, specs: list[ClosureSpec]) -> None:
+    async def _run(conn: Any) -> list[ClosureCheck]:
+        return [await check_closure(conn, spec) for spec in specs]
+
+    results = asyncio.run(_run_with_connection(project_root, url, _run))
+    for r in results:
+        if not r.exists:
+            console.print(f"  [dim]{r.spec.table}: not installed[/dim]")
+        elif r.ok:
+            console.print(f"  [green]{r.spec.table}: in sync[/green]")
+        else:
+            console.print(
+                f"  [red]{r.spec.table}: {r.missing} missing, {r.extra} extra row(s)[/red]"
+            )
+    if any(r.exists and not r.ok for r in results):
+        raise typer.Exit(code=1)
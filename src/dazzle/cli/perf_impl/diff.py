@@ -0,0 +1,35 @@
+"""``dazzle perf diff`` — compare two deploys or time windows of the production store."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import typer
+
+from dazzle.perf.bootstrap import PRODUCTION_DB
+from dazzle.perf.diff import build_diff, parse_selector, render_json, render_markdown
+
+
+def diff_command(
+    base: str = typer.Option(..., "--base", help="Run/deploy id, or START..END hour window"),
+    head: str = typer.Option(..., "--head", help="Run/deploy id, or START..END hour window"),
+    db: Path = typer.Option(PRODUCTION_DB, "--db", help="Production perf store"),
+    fmt: str = typer.Option("md", "--format", help="md|json"),
+    min_change: float = typer.Option(
+        20.0, "--min-change", help="Latency change (%) reported as a regression"
+    ),
+    min_calls: int = typer.Option(10, "--min-calls", help="Ignore keys with fewer calls"),
+) -> None:
+    if not db.exists():
+        typer.echo(f"No perf store at {db}. Run the app with DAZZLE_PERF_MODE=production.")
+        raise typer.Exit(1)
+    try:
+        base_sel, head_sel = parse_selector(base), parse_selector(head)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+
+    diff = build_diff(db, base_sel, head_sel, min_change_pct=min_change, min_calls=min_calls)
+    if fmt == "json":
+        typer.echo(render_json(diff))
+    else:
+        typer.echo(render_markdown(diff))
@@ -12,6 +12,9 @@ from dazzle.perf.run_id import latest_run_id
 
 def report_command(
     run: str | None = typer.Option(None, "--run", help="Run id (default: latest)"),
+    db: Path | None = typer.Option(
+        None, "--db", help="Read a shared store, e.g. the production one (requires --run)"
+    ),
     fmt: str = typer.Option("md", "--format", help="md|json"),
     top: int = typer.Option(10, "--top", help="Per-section row cap"),  # noqa: ARG001
     baseline: str | None = typer.Option(
@@ -21,11 +24,14 @@ def report_command(
     ),  # noqa: ARG001
 ) -> None:
     perf_dir = Path.cwd() / ".dazzle" / "perf"
+    if db is not None and run is None:
+        typer.echo("--db needs --run to pick a run (deploy) out of the store.")
+        raise typer.Exit(1)
     run_id = run or latest_run_id(perf_dir)
     if run_id is None:
         typer.echo("No perf runs found. Run `dazzle perf trace` first.")
         raise typer.Exit(1)
-    db_path = perf_dir / f"{run_id}.db"
+    db_path = db or perf_dir / f"{run_id}.db"
     if not db_path.exists():
         typer.echo(f"No trace file for run {run_id}")
         raise typer.Exit(1)
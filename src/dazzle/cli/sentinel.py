@@ -25,6 +25,9 @@ def sentinel_scan(
     format_: str = typer.Option("table", "--format", "-f"),
     agent: list[str] = typer.Option([], "--agent", "-a"),
     severity: str = typer.Option("info", "--severity", "-s"),
+    full: bool = typer.Option(
+        False, "--full", help="Re-scan every source file, ignoring cached per-file results"
+    ),
 ) -> None:
     """Run a sentinel scan against the project DSL."""
     from dazzle.mcp.server.handlers.sentinel import scan_handler
@@ -36,6 +39,8 @@ def sentinel_scan(
     }
     if agent:
         args["agents"] = agent
+    if full:
+        args["incremental"] = False
 
     try:
         from dazzle.cli.activity import cli_activity
@@ -1,8 +1,10 @@
 """`dazzle worker` CLI (#953 cycle 9, service wiring #992).
 
 Starts the background-job worker + scheduler loops alongside (or
-instead of) `dazzle serve`. Picks the queue backing per
-`REDIS_URL` env presence — Redis when set, in-memory otherwise.
+instead of) `dazzle serve`. Picks the queue backing per env —
+the Postgres job table when `DATABASE_URL` is set (where `dazzle
+serve` enqueues triggered jobs), Redis when only `REDIS_URL` is,
+in-memory otherwise.
 
 Wires SIGINT/SIGTERM to a shared `stop_event` so a Ctrl+C in dev
 or a `kill -TERM` from systemd shuts both loops down cleanly,
@@ -10,9 +12,9 @@ draining in-flight jobs.
 
 The worker opens its own DB pool (separate from `dazzle serve`'s)
 and builds CRUD services for `JobRun` + `AuditEntry`, so status
-transitions persist and the retention sweep actually deletes
-expired rows. Without `DATABASE_URL` set, falls back to log-only
-behaviour.
+transitions persist. The retention purge deletes expired rows from
+the same pool in batches. Without `DATABASE_URL` set, falls back to
+log-only behaviour.
 """
 
 from __future__ import annotations
@@ -21,12 +23,14 @@ import asyncio
 import logging
 import os
 import signal
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import typer
 
 from dazzle.cli.utils import load_project_appspec
+from dazzle.core.process_pools import pool_context
 
 worker_app = typer.Typer(help="Background-job worker + scheduler.")
 
@@ -44,7 +48,7 @@ def run(
     tick_interval: float = typer.Option(
         30.0,
         "--scheduler-tick",
-        help="Seconds between scheduler ticks (default 30s).",
+        help="Longest scheduler sleep between passes / lease retries (default 30s).",
     ),
     idle_timeout: float = typer.Option(
         1.0,
@@ -56,12 +60,33 @@ def run(
         "--redis-key",
         help="Redis list key (override per environment to avoid collisions).",
     ),
+    retention_batch: int = typer.Option(
+        5000,
+        "--retention-batch",
+        min=1,
+        help="Rows per retention purge DELETE (bounds each batch's lock time).",
+    ),
+    retention_pause: float = typer.Option(
+        0.0,
+        "--retention-pause",
+        min=0.0,
+        help="Seconds to sleep between retention purge batches.",
+    ),
+    processes: int = typer.Option(
+        0,
+        "--processes",
+        min=0,
+        help="Run sync job handlers in a pool of N processes and up to N jobs at "
+        "once (0 = one job at a time, in the worker process).",
+    ),
 ) -> None:
     """Run the background-job worker + scheduler until SIGINT/SIGTERM.
 
     The worker pulls jobs off the queue and runs them via the cycle-4
-    `process_one`. The scheduler ticks every ``--scheduler-tick``
-    seconds and submits any cron-due jobs to the same queue.
+    `process_one`. The scheduler wakes at each cron fire time (at
+    least every ``--scheduler-tick`` seconds) and submits due jobs to
+    the same queue; with ``DATABASE_URL`` set, one replica leads and
+    each fire is recorded once in ``schedule_fires``.
 
     Both loops share a stop event — closing one closes both.
     """
@@ -79,6 +104,9 @@ def run(
             tick_interval=tick_interval,
             idle_timeout=idle_timeout,
             redis_key=redis_key,
+            retention_batch=retention_batch,
+            retention_pause=retention_pause,
+            processes=processes,
         )
     )
 
@@ -89,16 +117,21 @@ async def _run_worker(
     tick_interval: float,
     idle_timeout: float,
     redis_key: str,
+    retention_batch: int = 5000,
+    retention_pause: float = 0.0,
+    processes: int = 0,
 ) -> None:
     """Main async entry — picks queue, wires signals, runs all loops."""
     from dazzle.http.runtime.job_loop import run_worker_loop
     from dazzle.http.runtime.job_scheduler import (
         parse_scheduled_jobs,
         run_scheduler_loop,
+        scheduled_catch_up,
     )
     from dazzle.http.runtime.retention_loop import run_retention_loop
 
-    queue, queue_kind = _build_queue(redis_key)
+    services, db_manager = await _build_services(appspec)
+    queue, queue_kind = _build_queue(redis_key, db_manager=db_manager, job_specs=appspec.jobs)
     typer.echo(f"Queue backing: {queue_kind}")
 
     # Build and start the process adapter (CONSUME side of the dual-boot-path).
@@ -115,12 +148,15 @@ async def _run_worker(
         f"{'' if len(audits) == 1 else 's'} (daily 03:00 UTC)"
     )
 
-    services, db_manager = await _build_services(appspec)
     if services:
         typer.echo(f"Services: {', '.join(sorted(services.keys()))} (writes will persist)")
     else:
         typer.echo("Services: none (DATABASE_URL not set — writes are log-only)")
 
+    executor = _handler_pool(processes)
+    if executor is not None:
+        typer.echo(f"Handlers: sync handlers in {processes} processes")
+
     stop_event = asyncio.Event()
     _install_signal_handlers(stop_event)
 
@@ -133,6 +169,8 @@ async def _run_worker(
                 job_service=services.get("JobRun"),
                 stop_event=stop_event,
                 idle_timeout=idle_timeout,
+                concurrency=max(1, processes),
+                executor=executor,
             )
         )
         scheduler_task = asyncio.create_task(
@@ -141,19 +179,26 @@ async def _run_worker(
                 queue=queue,
                 stop_event=stop_event,
                 tick_interval=tick_interval,
+                catch_up=scheduled_catch_up(list(appspec.jobs)),
+                dsn=os.environ.get("DATABASE_URL", "").strip(),
             )
         )
         retention_task = asyncio.create_task(
             run_retention_loop(
-                services=services,
+                db_manager=db_manager,
+                entities=services.keys(),
                 audits=audits,
                 stop_event=stop_event,
+                batch_size=retention_batch,
+                pause=retention_pause,
             )
         )
         worker_stats, scheduler_stats, retention_stats = await asyncio.gather(
             worker_task, scheduler_task, retention_task
         )
     finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
         await _teardown(queue=queue, process_adapter=process_adapter, db_manager=db_manager)
 
     typer.echo("")
@@ -168,6 +213,13 @@ async def _run_worker(
         typer.echo(f"  {k}: {v}")
 
 
+def _handler_pool(processes: int) -> ProcessPoolExecutor | None:
+    """Process pool for sync job handlers, or ``None`` when ``processes`` is 0."""
+    if processes <= 0:
+        return None
+    return ProcessPoolExecutor(max_workers=processes, mp_context=pool_context())
+
+
 async def _start_process_adapter(
     adapter_cls: type | None = None,
 ) -> Any | None:
@@ -277,20 +329,39 @@ def _build_process_adapter(
         return None
 
 
-def _build_queue(redis_key: str) -> tuple[Any, str]:
-    """Pick the queue backing per ``REDIS_URL`` env presence.
+def _build_queue(
+    redis_key: str,
+    *,
+    db_manager: Any | None = None,
+    job_specs: Any = (),
+) -> tuple[Any, str]:
+    """Pick the queue backing: Postgres, then ``REDIS_URL``, then in-memory.
+
+    ``db_manager`` is the worker's pool (present when ``DATABASE_URL``
+    is set); its job table is where ``dazzle serve`` enqueues. The lease
+    covers the longest ``timeout:`` in ``job_specs``.
 
     Returns (queue, label) — label printed at startup so the
     operator can see which backing was chosen.
     """
+    from dazzle.http.runtime import job_queue, postgres_job_queue, redis_job_queue
+
     redis_url = os.environ.get("REDIS_URL", "")
+    if db_manager is not None:
+        if redis_url:
+            logger.warning(
+                "Both DATABASE_URL and REDIS_URL are set; the job queue uses Postgres "
+                "(_dazzle_job_queue), which is where `dazzle serve` enqueues. "
+                "REDIS_URL is ignored for jobs."
+            )
+        lease = postgres_job_queue.visibility_timeout_for(job_specs)
+        return (
+            postgres_job_queue.PostgresJobQueue(db_manager, visibility_timeout=lease),
+            f"Postgres (_dazzle_job_queue, {lease:.0f}s lease)",
+        )
     if redis_url:
-        from dazzle.http.runtime.redis_job_queue import RedisJobQueue
-
-        return RedisJobQueue(redis_url, key=redis_key), f"Redis ({redis_key})"
-    from dazzle.http.runtime.job_queue import InMemoryJobQueue
-
-    return InMemoryJobQueue(), "in-memory (set REDIS_URL for persistence)"
+        return redis_job_queue.RedisJobQueue(redis_url, key=redis_key), f"Redis ({redis_key})"
+    return job_queue.InMemoryJobQueue(), "in-memory (set DATABASE_URL or REDIS_URL for persistence)"
 
 
 def _install_signal_handlers(stop_event: asyncio.Event) -> None:
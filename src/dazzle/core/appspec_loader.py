@@ -10,27 +10,70 @@ from pathlib import Path
 from dazzle.core.fileset import discover_dsl_files
 from dazzle.core.ir.appspec import AppSpec
 from dazzle.core.linker import build_appspec
-from dazzle.core.manifest import load_manifest
+from dazzle.core.manifest import ProjectManifest, load_manifest
+from dazzle.core.parse_cache import ParseCache, parse_cache_enabled
 from dazzle.core.parser import parse_modules
 from dazzle.core.renderer_registry import known_renderer_names
 
 _log = logging.getLogger(__name__)
 
 
-def load_project_appspec(project_root: Path) -> AppSpec:
+def load_project_appspec(project_root: Path, *, use_cache: bool = True) -> AppSpec:
     """Load and return the fully-linked AppSpec for a project.
 
     Combines the four-step boilerplate: manifest → discover → parse → build.
 
     Args:
         project_root: Path to the project directory containing ``dazzle.toml``.
+        use_cache: Serve unchanged projects from the on-disk parse cache
+            (``.dazzle/cache/parse``). Also disabled by ``DAZZLE_PARSE_CACHE=0``.
 
     Returns:
         Fully-linked AppSpec ready for runtime or analysis use.
     """
     manifest = load_manifest(project_root / "dazzle.toml")
     dsl_files = discover_dsl_files(project_root, manifest)
-    modules = parse_modules(dsl_files)
-    return build_appspec(
-        modules, manifest.project_root, known_renderers=known_renderer_names(manifest)
-    )
+    return build_project_appspec(project_root, manifest, dsl_files, use_cache=use_cache)
+
+
+def build_project_appspec(
+    project_root: Path,
+    manifest: ProjectManifest,
+    dsl_files: list[Path],
+    *,
+    use_cache: bool = True,
+) -> AppSpec:
+    """Parse and link already-discovered DSL files, consulting the parse cache.
+
+    When every file's content hash matches a previous load, the linked
+    AppSpec is returned straight from ``.dazzle/cache/parse/appspec``
+    without lexing, parsing or linking. Otherwise only the changed files
+    are re-parsed and the result is re-linked and cached.
+
+    Args:
+        project_root: Project directory; the cache lives under its ``.dazzle``.
+        manifest: Loaded project manifest.
+        dsl_files: DSL files as returned by ``discover_dsl_files``.
+        use_cache: Set False to always parse and link from scratch.
+
+    Returns:
+        Fully-linked AppSpec.
+    """
+    known_renderers = known_renderer_names(manifest)
+    if not (use_cache and parse_cache_enabled()):
+        modules = parse_modules(dsl_files)
+        return build_appspec(modules, manifest.project_root, known_renderers=known_renderers)
+
+    cache = ParseCache.for_project(project_root, dsl_files)
+    module_keys = [cache.module_key(f, f.read_text(encoding="utf-8")) for f in dsl_files]
+    appspec_key = cache.appspec_key(module_keys, manifest.project_root, known_renderers)
+    cached = cache.get_appspec(appspec_key)
+    if cached is not None:
+        _log.debug("Loaded AppSpec for %s from parse cache", project_root)
+        return cached
+
+    modules = parse_modules(dsl_files, cache=cache)
+    appspec = build_appspec(modules, manifest.project_root, known_renderers=known_renderers)
+    cache.put_appspec(appspec_key, appspec)
+    cache.prune()
+    return appspec
@@ -1,7 +1,8 @@
-"""Postgres coordination primitives — claim/lease queue mechanism.
+"""Postgres coordination primitives — claim/lease queue mechanism + scheduler.
 
-The five public names are the complete surface area for Phase 1 (process adapter)
-and Phase 2 (job queue). Import directly from this package:
+The claim names are the surface area for Phase 1 (process adapter) and
+Phase 2 (job queue); the schedule names back both scheduler loops. Import
+directly from this package:
 
     from dazzle.core.coordination import claim_due_work, complete_work, fail_work
 """
@@ -13,11 +14,33 @@ from dazzle.core.coordination.claim import (
     queue_columns_ddl,
     renew_lease,
 )
+from dazzle.core.coordination.schedule import (
+    JOB_SCHEDULER_LOCK_KEY,
+    PROCESS_SCHEDULER_LOCK_KEY,
+    MemoryScheduleLedger,
+    PgScheduleLedger,
+    ScheduleEntry,
+    ScheduleRunner,
+    cron_entry,
+    due_fires,
+    ensure_schedule_fires_table,
+    interval_entry,
+)
 
 __all__ = [
+    "JOB_SCHEDULER_LOCK_KEY",
+    "PROCESS_SCHEDULER_LOCK_KEY",
+    "MemoryScheduleLedger",
+    "PgScheduleLedger",
+    "ScheduleEntry",
+    "ScheduleRunner",
     "claim_due_work",
     "complete_work",
     "fail_work",
+    "cron_entry",
+    "due_fires",
+    "ensure_schedule_fires_table",
+    "interval_entry",
     "queue_columns_ddl",
     "renew_lease",
 ]
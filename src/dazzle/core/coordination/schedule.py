@@ -0,0 +1,465 @@
+"""Cluster-safe scheduler — leader lease + exactly-once fire ledger.
+
+Shared by the job scheduler (``dazzle.http.runtime.job_scheduler``) and
+``PostgresProcessAdapter``'s schedule loop. Every replica runs the loop;
+the guarantees come from Postgres rather than from in-process state:
+
+* **Leader lease.** A replica schedules only while it holds a session
+  ``pg_try_advisory_lock`` on its own connection. If that connection
+  dies (crash, deploy, network partition) Postgres drops the lock and
+  the next replica to ask becomes leader.
+* **Exactly-once fires.** Each fire is claimed with an ``INSERT`` into
+  ``schedule_fires``, keyed ``(schedule, fire_at)``, *before* it is
+  dispatched. Two leaders that briefly overlap both compute the same
+  fire time and only one ``INSERT`` wins. A failed dispatch deletes its
+  claim so the next pass retries it. The same statement prunes the
+  schedule's fires older than the catch-up horizon — no leader looks
+  back that far, so the ledger stays a bounded window per schedule.
+* **Catch-up.** A new leader resumes from the newest recorded fire of
+  each schedule, so windows missed while no replica was leading (a
+  deploy) are replayed per the schedule's ``JobCatchUp`` policy.
+* **No polling.** Between passes the loop sleeps until the earliest next
+  fire time (``next_fire``), capped at ``max_sleep`` so followers retry
+  the lease and the leader re-checks its connection.
+
+Fire times are deterministic — cron minutes, or interval multiples
+counted from the Unix epoch — so every replica agrees on the ledger key
+for a given window.
+
+Takes a connection factory — no driver import here, so the primitive
+stays layer-clean (same contract as ``claim.py``). Without a database,
+``MemoryScheduleLedger`` gives the same loop single-process semantics.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from functools import partial
+from typing import Any  # conn is any DBAPI connection — the primitive imports no driver
+
+from dazzle.core.cron import CronExpression, next_fire
+from dazzle.core.environment import skip_boot_schema_ddl
+from dazzle.core.ir.jobs import JobCatchUp
+
+logger = logging.getLogger(__name__)
+
+# Session advisory-lock keys for the two scheduler leases. Distinct from the
+# DDL xact-lock keys (0x667A646C framework, 0x647A646C auth, 0x70726F63
+# process, 0x61756474 audit) and from each other, so a worker can lead one
+# loop while another replica leads the other.
+JOB_SCHEDULER_LOCK_KEY = 0x7363686A  # "schj"
+PROCESS_SCHEDULER_LOCK_KEY = 0x73636870  # "schp"
+_SCHEDULE_DDL_LOCK_KEY = 0x73636864  # "schd"
+
+# How far back a new leader replays missed windows, and so how long the
+# ledger must remember a fire.
+DEFAULT_MAX_CATCH_UP = timedelta(days=1)
+
+
+def ensure_schedule_fires_table(cur: Any) -> None:  # cur: psycopg.Cursor
+    """Create the ``schedule_fires`` ledger. Idempotent; caller commits."""
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS schedule_fires (
+            schedule    text        NOT NULL,
+            fire_at     timestamptz NOT NULL,
+            fired_by    text        NOT NULL,
+            fired_at    timestamptz NOT NULL DEFAULT now(),
+            PRIMARY KEY (schedule, fire_at)
+        )
+    """)
+
+
+# ---------------------------------------------------------------------------
+# Schedules and fire times
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class ScheduleEntry:
+    """One schedule the loop fires.
+
+    Attributes:
+        name: Name handed to the fire callback (job or schedule name).
+        next_fire: First fire time strictly after a given instant, or
+            ``None`` if the schedule never fires again.
+        catch_up: What to do with windows missed while nobody led.
+    """
+
+    name: str
+    next_fire: Callable[[datetime], datetime | None]
+    catch_up: JobCatchUp = JobCatchUp.LATEST
+
+
+def cron_entry(
+    name: str, cron: CronExpression, catch_up: JobCatchUp = JobCatchUp.LATEST
+) -> ScheduleEntry:
+    return ScheduleEntry(name, partial(next_fire, cron), catch_up)
+
+
+def interval_entry(
+    name: str, seconds: float, catch_up: JobCatchUp = JobCatchUp.LATEST
+) -> ScheduleEntry:
+    """Every ``seconds``, on multiples counted from the Unix epoch."""
+    if seconds <= 0:
+        raise ValueError(f"interval must be > 0, got {seconds}")
+    return ScheduleEntry(name, partial(_next_interval, seconds), catch_up)
+
+
+def _next_interval(seconds: float, after: datetime) -> datetime:
+    slot = int(after.timestamp() // seconds) + 1
+    return datetime.fromtimestamp(slot * seconds, UTC)
+
+
+def due_fires(
+    entry: ScheduleEntry,
+    *,
+    after: datetime,
+    now: datetime,
+    grace: float = 60.0,
+    limit: int = 100,
+) -> tuple[list[datetime], int]:
+    """Fire times in ``(after, now]`` that ``entry``'s policy says to run.
+
+    Args:
+        entry: The schedule.
+        after: Newest window already handled.
+        now: Current time.
+        grace: Seconds a window stays "on time"; anything older is a
+            missed window and goes through the catch-up policy.
+        limit: Most windows ``JobCatchUp.ALL`` replays (the newest ones).
+
+    Returns:
+        ``(fire times to run, oldest first; count of windows dropped)``.
+    """
+    windows: list[datetime] = []
+    when = entry.next_fire(after)
+    while when is not None and when <= now:
+        windows.append(when)
+        when = entry.next_fire(when)
+    if not windows:
+        return [], 0
+
+    newest = windows[-1]
+    if entry.catch_up is JobCatchUp.ALL:
+        due = windows[-limit:]
+    elif entry.catch_up is JobCatchUp.LATEST or (now - newest).total_seconds() < grace:
+        due = [newest]
+    else:
+        due = []
+    return due, len(windows) - len(due)
+
+
+# ---------------------------------------------------------------------------
+# Ledgers
+# ---------------------------------------------------------------------------
+
+
+class MemoryScheduleLedger:
+    """Single-process ledger: always leader, recent fires remembered in memory."""
+
+    _KEEP = 512  # newest fires remembered per schedule
+
+    def __init__(self) -> None:
+        self._fires: dict[str, set[datetime]] = {}
+
+    def acquire(self) -> bool:
+        return True
+
+    def last_fires(self, keys: Iterable[str]) -> dict[str, datetime]:
+        return {k: max(self._fires[k]) for k in keys if self._fires.get(k)}
+
+    def claim(self, key: str, fire_at: datetime) -> bool:
+        fires = self._fires.setdefault(key, set())
+        if fire_at in fires:
+            return False
+        fires.add(fire_at)
+        if len(fires) > 2 * self._KEEP:
+            self._fires[key] = set(sorted(fires)[-self._KEEP :])
+        return True
+
+    def release(self, key: str, fire_at: datetime) -> None:
+        self._fires.get(key, set()).discard(fire_at)
+
+    def close(self) -> None:
+        pass
+
+
+class PgScheduleLedger:
+    """Postgres ledger: advisory-lock lease + ``schedule_fires`` claims.
+
+    Holds one connection for its lifetime — the session lock lives and
+    dies with it. Each call commits, so the connection is never left
+    idle in a transaction. Any error drops the connection (and with it
+    the lease); the next ``acquire`` reconnects as a follower.
+
+    Args:
+        connect: Opens a new (non-autocommit) DBAPI connection.
+        lock_key: Advisory-lock key naming the lease.
+        worker: Recorded as ``fired_by`` on each claim.
+        retain: Fires this much older than a newly claimed one are
+            pruned. Must be at least the runner's ``max_catch_up``, or
+            a new leader could replay a pruned window.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        *,
+        lock_key: int,
+        worker: str,
+        retain: timedelta = DEFAULT_MAX_CATCH_UP,
+    ) -> None:
+        self._connect = connect
+        self._lock_key = lock_key
+        self._worker = worker
+        self._retain = retain
+        self._conn: Any = None
+        self._leader = False
+        self._tables_ensured = False
+
+    def acquire(self) -> bool:
+        """Take (or confirm) the lease. True while this instance leads."""
+        if self._conn is None:
+            self._conn = self._connect()
+            self._leader = False
+        if self._leader:
+            self._execute("SELECT 1")
+        else:
+            row = self._execute("SELECT pg_try_advisory_lock(%s)", (self._lock_key,), fetch=True)
+            self._leader = bool(row and row[0])
+            if self._leader:
+                self._ensure()
+        return self._leader
+
+    def _ensure(self) -> None:
+        """Create ``schedule_fires`` when a replica first leads."""
+        if self._tables_ensured:
+            return
+        # Production schemas are migration-managed and the runtime may be a
+        # non-owner role (#1495) — the framework baseline owns the table there.
+        if skip_boot_schema_ddl():
+            self._tables_ensured = True
+            return
+        try:
+            with self._conn.cursor() as cur:
+                cur.execute("SELECT pg_advisory_xact_lock(%s)", (_SCHEDULE_DDL_LOCK_KEY,))
+                ensure_schedule_fires_table(cur)
+            self._conn.commit()
+        except Exception:
+            self._drop()
+            raise
+        self._tables_ensured = True
+
+    def last_fires(self, keys: Iterable[str]) -> dict[str, datetime]:
+        rows = self._execute(
+            "SELECT schedule, max(fire_at) FROM schedule_fires "
+            "WHERE schedule = ANY(%s) GROUP BY schedule",
+            (list(keys),),
+            fetch=True,
+            many=True,
+        )
+        return {str(r[0]): r[1] for r in rows or ()}
+
+    def claim(self, key: str, fire_at: datetime) -> bool:
+        row = self._execute(
+            "WITH pruned AS (DELETE FROM schedule_fires WHERE schedule = %s AND fire_at < %s) "
+            "INSERT INTO schedule_fires (schedule, fire_at, fired_by) VALUES (%s, %s, %s) "
+            "ON CONFLICT DO NOTHING RETURNING fire_at",
+            (key, fire_at - self._retain, key, fire_at, self._worker),
+            fetch=True,
+        )
+        return row is not None
+
+    def release(self, key: str, fire_at: datetime) -> None:
+        self._execute(
+            "DELETE FROM schedule_fires WHERE schedule = %s AND fire_at = %s", (key, fire_at)
+        )
+
+    def close(self) -> None:
+        self._drop()
+
+    def _execute(
+        self, sql: str, params: Sequence[Any] = (), *, fetch: bool = False, many: bool = False
+    ) -> Any:
+        if self._conn is None:
+            raise RuntimeError("schedule ledger is not connected")
+        try:
+            with self._conn.cursor() as cur:
+                cur.execute(sql, params)
+                result = (cur.fetchall() if many else cur.fetchone()) if fetch else None
+            self._conn.commit()
+        except Exception:
+            self._drop()
+            raise
+        return result
+
+    def _drop(self) -> None:
+        conn, self._conn, self._leader = self._conn, None, False
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                logger.warning("Schedule ledger connection close failed", exc_info=True)
+
+
+# ---------------------------------------------------------------------------
+# Loop
+# ---------------------------------------------------------------------------
+
+
+class ScheduleRunner:
+    """Fire schedules through ``fire`` while ``ledger`` grants the lease.
+
+    Schedules can be added while the loop runs (the process adapter
+    registers them after it starts); a newly added schedule resumes
+    from its own fire history on the next pass.
+
+    Args:
+        entries: Initial schedules.
+        fire: ``await fire(name, fire_at)`` dispatches one window.
+        ledger: ``PgScheduleLedger`` or ``MemoryScheduleLedger``.
+        scope: Prefix for ledger keys (``"job"``, ``"process"``) so job
+            and process schedules with the same name don't collide.
+        max_sleep: Longest sleep between passes (lease retry cadence).
+        max_catch_up: How far back a new leader looks for missed windows.
+        grace: Seconds a window counts as on time (see ``due_fires``).
+        limit: Most missed windows a ``JobCatchUp.ALL`` schedule replays.
+        clock: Current time (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[ScheduleEntry],
+        fire: Callable[[str, datetime], Awaitable[None]],
+        ledger: Any,
+        *,
+        scope: str,
+        max_sleep: float = 30.0,
+        max_catch_up: timedelta = DEFAULT_MAX_CATCH_UP,
+        grace: float = 60.0,
+        limit: int = 100,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        self._entries: dict[str, ScheduleEntry] = {e.name: e for e in entries}
+        self._fire = fire
+        self._ledger = ledger
+        self._scope = scope
+        self._max_sleep = max_sleep
+        self._max_catch_up = max_catch_up
+        self._grace = grace
+        self._limit = limit
+        self._clock = clock
+        self._leading = False
+        # Newest handled window per schedule; emptied when the lease is lost.
+        self._cursors: dict[str, datetime] = {}
+        self.stats: dict[str, int] = {"fired": 0, "skipped": 0, "ticks": 0, "loop_errors": 0}
+
+    def add(self, entry: ScheduleEntry) -> None:
+        """Add (or replace) a schedule."""
+        self._entries[entry.name] = entry
+        self._cursors.pop(entry.name, None)
+
+    async def run(self, stop_event: asyncio.Event) -> dict[str, int]:
+        """Tick until ``stop_event`` is set; returns ``stats``."""
+        try:
+            while not stop_event.is_set():
+                self.stats["ticks"] += 1
+                try:
+                    wait = await self.tick()
+                except Exception:
+                    self.stats["loop_errors"] += 1
+                    self._step_down()
+                    logger.exception("Scheduler tick crashed — continuing")
+                    wait = self._max_sleep
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=wait)
+                except TimeoutError:
+                    pass
+        finally:
+            self._ledger.close()
+        return self.stats
+
+    async def tick(self) -> float:
+        """One pass: hold the lease, fire what's due. Returns seconds to sleep."""
+        if not self._entries:
+            return self._max_sleep
+        now = self._clock()
+        if not await asyncio.to_thread(self._ledger.acquire):
+            if self._leading:
+                logger.info("Scheduler %s: lost the leader lease", self._scope)
+            self._step_down()
+            return self._max_sleep
+        if not self._leading:
+            self._leading = True
+            logger.info("Scheduler %s: leading %d schedule(s)", self._scope, len(self._entries))
+
+        entries = list(self._entries.values())
+        new = [e for e in entries if e.name not in self._cursors]
+        if new:
+            self._cursors.update(await self._resume(new, now))
+        healthy = True
+        for entry in entries:
+            healthy = await self._fire_due(entry, now) and healthy
+        return self._next_wait(entries, now) if healthy else self._max_sleep
+
+    def _step_down(self) -> None:
+        self._leading = False
+        self._cursors.clear()
+
+    async def _resume(self, entries: list[ScheduleEntry], now: datetime) -> dict[str, datetime]:
+        """Start each schedule at its newest recorded fire (bounded by the horizon)."""
+        last = await asyncio.to_thread(self._ledger.last_fires, [self._key(e) for e in entries])
+        horizon = now - self._max_catch_up
+        fresh = now - timedelta(seconds=self._grace)
+        cursors: dict[str, datetime] = {}
+        for entry in entries:
+            recorded = last.get(self._key(entry))
+            cursors[entry.name] = max(recorded, horizon) if recorded else fresh
+        return cursors
+
+    async def _fire_due(self, entry: ScheduleEntry, now: datetime) -> bool:
+        due, dropped = due_fires(
+            entry, after=self._cursors[entry.name], now=now, grace=self._grace, limit=self._limit
+        )
+        if dropped:
+            self.stats["skipped"] += dropped
+            logger.info(
+                "Schedule %s: %d missed window(s) dropped (catch_up=%s)",
+                entry.name,
+                dropped,
+                entry.catch_up.value,
+            )
+        key = self._key(entry)
+        for fire_at in due:
+            if not await asyncio.to_thread(self._ledger.claim, key, fire_at):
+                continue  # another replica already fired this window
+            try:
+                await self._fire(entry.name, fire_at)
+            except Exception:
+                await asyncio.to_thread(self._ledger.release, key, fire_at)
+                self.stats["loop_errors"] += 1
+                logger.warning(
+                    "Schedule %s fire at %s failed — will retry",
+                    entry.name,
+                    fire_at.isoformat(),
+                    exc_info=True,
+                )
+                return False
+            self.stats["fired"] += 1
+        self._cursors[entry.name] = now
+        return True
+
+    def _next_wait(self, entries: list[ScheduleEntry], now: datetime) -> float:
+        upcoming = [
+            when for e in entries if (when := e.next_fire(self._cursors[e.name])) is not None
+        ]
+        if not upcoming:
+            return self._max_sleep
+        return min(max((min(upcoming) - now).total_seconds(), 0.0), self._max_sleep)
+
+    def _key(self, entry: ScheduleEntry) -> str:
+        return f"{self._scope}:{entry.name}"
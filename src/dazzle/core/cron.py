@@ -0,0 +1,229 @@
+"""Minimal cron-expression parser + matcher (#953 cycle 7).
+
+Supports the standard 5-field cron format:
+
+    minute hour day month weekday
+
+Each field is a comma-list of items, where an item is one of:
+
+  * ``*`` — every value
+  * ``*/N`` — every N (e.g. ``*/5`` in minute = 0,5,10,…,55)
+  * a literal integer
+  * a range ``a-b``, optionally stepped (``a-b/N``)
+
+Named weekdays / months remain out of scope.
+
+Used by the job scheduler (``dazzle.http.runtime.job_scheduler``),
+the retention loop, and the process adapters' schedule loops:
+
+  * `parse_cron` each schedule at startup (raise early on invalid
+    expressions)
+  * `next_fire` computes when a schedule next fires, so the
+    cluster scheduler (``dazzle.core.coordination.schedule``) can
+    sleep until then instead of polling
+  * `cron_matches` / `due_jobs` answer "does this minute fire?"
+
+Lives in core so ``dazzle.core.process`` can share it; the old
+``dazzle.http.runtime.cron`` path re-exports it.
+
+Timezone handling is deferred — cycle 7 evaluates against UTC.
+`JobSchedule.timezone` is captured but not yet honoured; cycle 8+
+adds the ZoneInfo lookup.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+# Field bounds: (low_inclusive, high_inclusive)
+_FIELD_BOUNDS: list[tuple[int, int]] = [
+    (0, 59),  # minute
+    (0, 23),  # hour
+    (1, 31),  # day
+    (1, 12),  # month
+    (0, 6),  # weekday (0=Sunday, 6=Saturday — POSIX)
+]
+
+# Days `next_fire` scans before giving up. Four years plus a day
+# covers a Feb-29-only schedule; anything that never matches within
+# that window never matches at all (e.g. ``0 0 31 2 *``).
+_NEXT_FIRE_SEARCH_DAYS = 4 * 366 + 1
+
+
+@dataclass(frozen=True)
+class CronExpression:
+    """Parsed 5-field cron expression — frozen sets of valid values
+    per field. Used by `cron_matches` for O(1) per-field membership.
+    """
+
+    minute: frozenset[int]
+    hour: frozenset[int]
+    day: frozenset[int]
+    month: frozenset[int]
+    weekday: frozenset[int]
+
+
+class CronParseError(ValueError):
+    """Raised when a cron expression can't be parsed.
+
+    Caught by the cycle-7b scheduler at startup so a malformed
+    `JobSpec.schedule` aborts the deploy with a clear error rather
+    than silently never firing.
+    """
+
+
+def parse_cron(expr: str) -> CronExpression:
+    """Parse a 5-field cron expression into a `CronExpression`.
+
+    Raises:
+        CronParseError: If the expression isn't 5 fields, or any
+            field is malformed / out of bounds.
+    """
+    if not isinstance(expr, str):
+        raise CronParseError(f"Expected str, got {type(expr).__name__}")
+
+    fields = expr.strip().split()
+    if len(fields) != 5:
+        raise CronParseError(
+            f"Cron expression {expr!r} must have 5 fields (minute hour day month weekday)"
+        )
+
+    parsed: list[frozenset[int]] = []
+    for field, (low, high) in zip(fields, _FIELD_BOUNDS, strict=True):
+        try:
+            parsed.append(_parse_field(field, low, high))
+        except ValueError as exc:
+            raise CronParseError(f"Invalid cron field {field!r}: {exc}") from exc
+
+    return CronExpression(
+        minute=parsed[0],
+        hour=parsed[1],
+        day=parsed[2],
+        month=parsed[3],
+        weekday=parsed[4],
+    )
+
+
+def _parse_field(field: str, low: int, high: int) -> frozenset[int]:
+    """Parse one cron field — a comma-list of `*`, `*/N`, `a`, `a-b`, `a-b/N`."""
+    values: set[int] = set()
+    for item in field.split(","):
+        values |= _parse_item(item, low, high)
+    return frozenset(values)
+
+
+def _parse_item(item: str, low: int, high: int) -> set[int]:
+    base, has_step, step_str = item.partition("/")
+    step = 1
+    if has_step:
+        if not step_str.isdigit():
+            raise ValueError(f"step {step_str!r} must be a positive integer")
+        step = int(step_str)
+        if step <= 0:
+            raise ValueError(f"step must be > 0, got {step}")
+
+    if base == "*":
+        start, end = low, high
+    else:
+        first, has_range, last = base.partition("-")
+        start = _parse_value(first, low, high)
+        if has_range:
+            end = _parse_value(last, low, high)
+        else:
+            # `5/15` = from 5 every 15 (Vixie cron); bare `5` = just 5.
+            end = high if has_step else start
+        if start > end:
+            raise ValueError(f"range {base!r} runs backwards")
+    return set(range(start, end + 1, step))
+
+
+def _parse_value(text: str, low: int, high: int) -> int:
+    if not text.isdigit():
+        raise ValueError(
+            "only `*`, `*/N`, literal integers, `a-b` ranges and comma-lists are supported"
+        )
+    value = int(text)
+    if value < low or value > high:
+        raise ValueError(f"{value} out of bounds [{low}, {high}]")
+    return value
+
+
+def cron_matches(cron: CronExpression, when: datetime) -> bool:
+    """True when ``when`` matches the parsed cron expression.
+
+    POSIX weekday convention: 0 = Sunday … 6 = Saturday. Python's
+    `datetime.weekday()` returns 0 = Monday … 6 = Sunday, so we
+    rotate before comparing.
+    """
+    posix_weekday = (when.weekday() + 1) % 7
+    return (
+        when.minute in cron.minute
+        and when.hour in cron.hour
+        and when.day in cron.day
+        and when.month in cron.month
+        and posix_weekday in cron.weekday
+    )
+
+
+def next_fire(cron: CronExpression, after: datetime) -> datetime | None:
+    """First minute strictly after ``after`` that ``cron`` matches.
+
+    Walks day by day, skipping days the day / month / weekday
+    fields rule out, so a yearly schedule costs a few hundred cheap
+    checks rather than half a million minute probes. Keeps
+    ``after``'s tzinfo. Returns ``None`` for an expression that can
+    never fire.
+    """
+    when = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+    hours = sorted(cron.hour)
+    minutes = sorted(cron.minute)
+    for _ in range(_NEXT_FIRE_SEARCH_DAYS):
+        if (
+            when.month in cron.month
+            and when.day in cron.day
+            and (when.weekday() + 1) % 7 in cron.weekday
+        ):
+            for hour in (h for h in hours if h >= when.hour):
+                floor = when.minute if hour == when.hour else 0
+                minute = next((m for m in minutes if m >= floor), None)
+                if minute is not None:
+                    return when.replace(hour=hour, minute=minute)
+        when = (when + timedelta(days=1)).replace(hour=0, minute=0)
+    return None
+
+
+def due_jobs(
+    jobs: Iterable[tuple[str, CronExpression]],
+    *,
+    now: datetime,
+    last_fired_minute: dict[str, datetime],
+) -> list[str]:
+    """Return job names whose cron matches ``now`` and which
+    haven't already fired this minute.
+
+    Args:
+        jobs: ``(job_name, parsed_cron)`` pairs from the cycle-7b
+            scheduler's startup parse.
+        now: Current wall-clock time (UTC).
+        last_fired_minute: Per-job timestamp of the most recent
+            firing, truncated to the minute. Mutated in place by
+            the caller (cycle-7b loop) after the returned jobs
+            are enqueued — passed in so this function stays pure
+            on its own state.
+
+    Returns:
+        List of job names ready to enqueue. Empty when no cron
+        matches at this minute, or all matching jobs have already
+        fired.
+    """
+    minute_now = now.replace(second=0, microsecond=0)
+    due: list[str] = []
+    for job_name, cron in jobs:
+        if not cron_matches(cron, minute_now):
+            continue
+        if last_fired_minute.get(job_name) == minute_now:
+            continue  # already fired this minute
+        due.append(job_name)
+    return due
@@ -17,6 +17,7 @@ DSL shape::
 
     job daily_summary "Daily metrics roll-up":
       schedule: cron("0 1 * * *")
+      catch_up: all
       run: scripts/daily_summary.py
       timeout: 5m
 """
@@ -266,6 +267,7 @@ class _JobState:
 
     triggers: list[ir.JobTrigger] = field(default_factory=list)
     schedule: ir.JobSchedule | None = None
+    catch_up: ir.JobCatchUp | None = None
     run: str = ""
     retry: int = 3
     retry_backoff: ir.JobBackoff = ir.JobBackoff.EXPONENTIAL
@@ -326,6 +328,23 @@ def _j_kw_retry_backoff(parser: Any, state: _JobState) -> None:
     parser.skip_newlines()
 
 
+def _j_kw_catch_up(parser: Any, state: _JobState) -> None:
+    """``catch_up: skip | latest | all`` — enum-validated."""
+    parser.advance()
+    parser.expect(TokenType.COLON)
+    policy_token = parser.expect_identifier_or_keyword()
+    try:
+        state.catch_up = ir.JobCatchUp(policy_token.value)
+    except ValueError as exc:
+        raise make_parse_error(
+            f"Invalid catch_up {policy_token.value!r}; must be one of: skip, latest, all.",
+            parser.file,
+            policy_token.line,
+            policy_token.column,
+        ) from exc
+    parser.skip_newlines()
+
+
 def _j_kw_dead_letter(parser: Any, state: _JobState) -> None:
     parser.advance()
     parser.expect(TokenType.COLON)
@@ -360,6 +379,7 @@ _JOB_KEYWORDS: dict[TokenType, KeywordParser[_JobState]] = {
     TokenType.SCHEDULE: _j_kw_schedule,
     TokenType.RETRY: _j_kw_retry,
     TokenType.RETRY_BACKOFF: _j_kw_retry_backoff,
+    TokenType.CATCH_UP: _j_kw_catch_up,
     TokenType.DEAD_LETTER: _j_kw_dead_letter,
     TokenType.TIMEOUT: _j_kw_timeout,
 }
@@ -394,13 +414,16 @@ def _build_job(parser: Any, name: str, title: str | None, state: _JobState) -> i
             tok.line,
             tok.column,
         )
+    schedule = state.schedule
+    if schedule is not None and state.catch_up is not None:
+        schedule = schedule.model_copy(update={"catch_up": state.catch_up})
 
     return ir.JobSpec(
         name=name,
         title=title,
         run=state.run,
         triggers=state.triggers,
-        schedule=state.schedule,
+        schedule=schedule,
         retry=state.retry,
         retry_backoff=state.retry_backoff,
         dead_letter=state.dead_letter,
@@ -24,8 +24,9 @@ Usage:
 from __future__ import annotations
 
 import os
+from collections.abc import Callable
 from enum import StrEnum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     pass
@@ -111,6 +112,18 @@ def skip_boot_schema_ddl() -> bool:
     return is_production()
 
 
+def run_boot_schema_ddl(db_manager: Any, ensure: Callable[[Any], None]) -> None:
+    """Run a framework table's ``ensure(conn)`` bootstrap unless boot DDL is skipped.
+
+    Shared by the stores whose table DDL lives in a module-level
+    ``ensure_*`` function that ``ensure_framework_schema`` also calls.
+    """
+    if skip_boot_schema_ddl():
+        return
+    with db_manager.connection() as conn:
+        ensure(conn)
+
+
 def pin_production_env() -> None:
     """#1420: pin ``DAZZLE_ENV=production`` when it is unset.
 
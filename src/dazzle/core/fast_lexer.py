@@ -0,0 +1,303 @@
+"""
+Run-scanning fast path for the DAZZLE DSL lexer.
+
+``Lexer`` in :mod:`dazzle.core.lexer` walks the source one character at a
+time through ``current_char`` / ``peek_char`` / ``advance``. That keeps the
+reference implementation easy to read, but it costs several Python-level
+calls and branches per character, and tokenisation dominates parse time on
+large DSL files.
+
+``FastLexer`` produces the *same* token stream — same types, values, line
+and column numbers, and the same ``ParseError`` (message and location) on
+bad input — but scans whole runs at once:
+
+- one compiled master pattern classifies the token at the current offset
+  (whitespace, ASCII identifier, number, string, comment, newline,
+  operator) in a single C-level ``match`` call;
+- columns are derived from offsets (``pos - line_start + 1``) instead of
+  being incremented per character;
+- anything the master pattern does not cover (non-ASCII identifiers,
+  unterminated strings, stray characters) falls back to the reference
+  rules, so edge-case behaviour is inherited rather than re-specified.
+
+Differential tests over every ``examples/`` and ``fixtures/`` DSL file pin
+the two implementations together (``tests/unit/test_fast_lexer.py``).
+"""
+
+import re
+from collections.abc import Callable
+from pathlib import Path
+
+from .errors import make_parse_error
+from .lexer import KEYWORDS, Token, TokenType, emit_indentation
+
+# Valid compact-duration suffixes (``7d``, ``24h``, ``30min`` …) — must match
+# ``Lexer.read_number``.
+_DURATION_SUFFIXES = frozenset({"min", "h", "d", "w", "m", "y"})
+
+# Keyword spelling → token type, resolved once instead of per identifier.
+_KEYWORD_TYPES: dict[str, TokenType] = {value: TokenType(value) for value in KEYWORDS}
+
+_OPERATOR_TYPES: dict[str, TokenType] = {
+    ":": TokenType.COLON,
+    ",": TokenType.COMMA,
+    "(": TokenType.LPAREN,
+    ")": TokenType.RPAREN,
+    "[": TokenType.LBRACKET,
+    "]": TokenType.RBRACKET,
+    ".": TokenType.DOT,
+    "?": TokenType.QUESTION,
+    "/": TokenType.SLASH,
+    "+": TokenType.PLUS,
+    "*": TokenType.STAR,
+    "%": TokenType.PERCENT,
+    "$": TokenType.DOLLAR,
+    "|": TokenType.PIPE,
+    "=": TokenType.EQUALS,
+    "==": TokenType.DOUBLE_EQUALS,
+    "!=": TokenType.NOT_EQUALS,
+    ">": TokenType.GREATER_THAN,
+    ">=": TokenType.GREATER_EQUAL,
+    "-": TokenType.MINUS,
+    "->": TokenType.ARROW,
+    "<": TokenType.LESS_THAN,
+    "<-": TokenType.LARROW,
+    "<->": TokenType.BIARROW,
+    "<=": TokenType.LESS_EQUAL,
+}
+
+# Alternatives are ordered by frequency in real DSL (identifiers, then
+# whitespace, newlines and operators); multi-char operators are listed
+# longest-first so ``<->`` wins over ``<-`` and ``<``. Strings use the
+# unrolled ``"[^"\\]*(?:\\.[^"\\]*)*"`` form so long literals scan as runs.
+_MASTER = re.compile(
+    r"""
+    (?P<ident>[A-Za-z_][A-Za-z0-9_]*)
+    |(?P<ws>[ \t\r]+)
+    |(?P<nl>\n)
+    |(?P<op><->|<-|<=|==|!=|>=|->|[:,()\[\].?/+*%$|=<>\-])
+    |(?P<string>"[^"\\]*(?:\\.[^"\\]*)*"|'[^'\\]*(?:\\.[^'\\]*)*')
+    |(?P<number>[0-9][0-9.]*)
+    |(?P<comment>\#[^\n]*)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+_INDENT = re.compile(r"[ \t]*")
+_ESCAPE = re.compile(r"\\(.)", re.DOTALL)
+_ESCAPES = {"n": "\n", "t": "\t"}
+
+
+def _unescape(match: re.Match[str]) -> str:
+    ch = match.group(1)
+    return _ESCAPES.get(ch, ch)
+
+
+class FastLexer:
+    """
+    Run-scanning lexer, token-for-token identical to :class:`~dazzle.core.lexer.Lexer`.
+
+    The hot loop does one master-pattern ``match`` per token and dispatches on
+    the matched group name to a small scanner; each scanner consumes its run,
+    appends at most one token and reports whether a new line has started.
+    """
+
+    def __init__(self, text: str, file: Path):
+        """
+        Initialize lexer.
+
+        Args:
+            text: Source text to tokenize
+            file: Source file path (for error reporting)
+        """
+        self.text = text
+        self.file = file
+        self.pos = 0
+        self.line = 1
+        self.line_start = 0  # offset of the first character of the current line
+        self.tokens: list[Token] = []
+        self.indent_stack = [0]
+        self._scanners: dict[str | None, Callable[[re.Match[str]], bool]] = {
+            "ident": self._scan_identifier,
+            "ws": self._scan_skip,
+            "nl": self._scan_newline,
+            "op": self._scan_operator,
+            "string": self._scan_string,
+            "number": self._scan_number,
+            "comment": self._scan_skip,
+        }
+
+    def tokenize(self) -> list[Token]:
+        """
+        Tokenize the entire source text.
+
+        Returns:
+            List of tokens including INDENT/DEDENT and EOF
+
+        Raises:
+            ParseError: If syntax error encountered
+        """
+        text = self.text
+        n = len(text)
+        master_match = _MASTER.match
+        scanners = self._scanners
+        at_line_start = True
+
+        while self.pos < n:
+            if at_line_start:
+                if self._scan_line_start():
+                    continue
+                at_line_start = False
+                if self.pos >= n:
+                    break
+
+            m = master_match(text, self.pos)
+            if m is None:
+                self._scan_fallback()
+                continue
+            at_line_start = scanners[m.lastgroup](m)
+
+        column = n - self.line_start + 1
+        while len(self.indent_stack) > 1:
+            self.indent_stack.pop()
+            self.tokens.append(Token(TokenType.DEDENT, "", self.line, column))
+
+        self.tokens.append(Token(TokenType.EOF, "", self.line, column))
+        return self.tokens
+
+    # -- line start ---------------------------------------------------------
+
+    def _scan_line_start(self) -> bool:
+        """
+        Consume indentation and emit INDENT/DEDENT for a content line.
+
+        Returns:
+            True if the line was blank or comment-only (it has been consumed,
+            including its NEWLINE token), False if real content follows.
+        """
+        text = self.text
+        indent = _INDENT.match(text, self.pos)
+        assert indent is not None  # ``[ \t]*`` always matches
+        raw_indent = indent.group()
+        pos = indent.end()
+        ch = text[pos] if pos < len(text) else None
+
+        if ch == "#" or ch == "\n":
+            if ch == "#":
+                end = text.find("\n", pos)
+                pos = len(text) if end < 0 else end
+            self.pos = pos
+            if pos < len(text):
+                self._emit_newline()
+            return True
+
+        self.pos = pos
+        if ch is not None:
+            # Tabs count as four columns of indentation (see Lexer).
+            indent_level = len(raw_indent) + 3 * raw_indent.count("\t")
+            emit_indentation(self.tokens, self.indent_stack, indent_level, self.file, self.line)
+        return False
+
+    def _emit_newline(self) -> None:
+        """Append a NEWLINE token for the ``\\n`` at ``pos`` and start a new line."""
+        self.tokens.append(
+            Token(TokenType.NEWLINE, "\\n", self.line, self.pos - self.line_start + 1)
+        )
+        self.pos += 1
+        self.line += 1
+        self.line_start = self.pos
+
+    # -- per-kind scanners (dispatched on the master pattern's group) -------
+
+    def _scan_skip(self, m: re.Match[str]) -> bool:
+        """Whitespace and comments produce no token."""
+        self.pos = m.end()
+        return False
+
+    def _scan_newline(self, m: re.Match[str]) -> bool:
+        self._emit_newline()
+        return True
+
+    def _scan_identifier(self, m: re.Match[str]) -> bool:
+        text = self.text
+        start = self.pos
+        end = m.end()
+        # Identifiers may continue with non-ASCII alphanumerics.
+        while end < len(text) and (text[end].isalnum() or text[end] == "_"):
+            end += 1
+        self._emit_word(start, end)
+        return False
+
+    def _scan_operator(self, m: re.Match[str]) -> bool:
+        value = m.group()
+        self.tokens.append(
+            Token(_OPERATOR_TYPES[value], value, self.line, self.pos - self.line_start + 1)
+        )
+        self.pos = m.end()
+        return False
+
+    def _scan_number(self, m: re.Match[str]) -> bool:
+        text = self.text
+        value = m.group()
+        end = m.end()
+        token_type = TokenType.NUMBER
+        # Compact durations (7d, 24h, 30min) — integers only, as in Lexer.read_number.
+        if "." not in value and end < len(text) and text[end].isalpha():
+            suffix_end = end
+            while suffix_end < len(text) and text[suffix_end].isalpha():
+                suffix_end += 1
+            if text[end:suffix_end] in _DURATION_SUFFIXES:
+                value = text[self.pos : suffix_end]
+                end = suffix_end
+                token_type = TokenType.DURATION_LITERAL
+        self.tokens.append(Token(token_type, value, self.line, self.pos - self.line_start + 1))
+        self.pos = end
+        return False
+
+    def _scan_string(self, m: re.Match[str]) -> bool:
+        raw = m.group()
+        body = raw[1:-1]
+        if "\\" in body:
+            body = _ESCAPE.sub(_unescape, body)
+        self.tokens.append(Token(TokenType.STRING, body, self.line, self.pos - self.line_start + 1))
+        newlines = raw.count("\n")
+        if newlines:
+            self.line += newlines
+            self.line_start = self.pos + raw.rfind("\n") + 1
+        self.pos = m.end()
+        return False
+
+    def _scan_fallback(self) -> None:
+        """
+        Handle a position the master pattern cannot classify.
+
+        That is a non-ASCII identifier start, an unterminated string, or a
+        character the DSL does not allow.
+
+        Raises:
+            ParseError: for unterminated strings and unexpected characters.
+        """
+        text = self.text
+        ch = text[self.pos]
+        col = self.pos - self.line_start + 1
+        if ch in ('"', "'"):
+            raise make_parse_error("Unterminated string literal", self.file, self.line, col)
+        if not (ch.isalpha() or ch == "_"):
+            raise make_parse_error(f"Unexpected character: {ch!r}", self.file, self.line, col)
+        end = self.pos + 1
+        while end < len(text) and (text[end].isalnum() or text[end] == "_"):
+            end += 1
+        self._emit_word(self.pos, end)
+
+    def _emit_word(self, start: int, end: int) -> None:
+        """Append an identifier/keyword token for ``text[start:end]``."""
+        value = self.text[start:end]
+        self.tokens.append(
+            Token(
+                _KEYWORD_TYPES.get(value, TokenType.IDENTIFIER),
+                value,
+                self.line,
+                start - self.line_start + 1,
+            )
+        )
+        self.pos = end
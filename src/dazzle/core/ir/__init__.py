@@ -369,6 +369,7 @@ from .islands import (
 # Background Jobs (#953)
 from .jobs import (
     JobBackoff,
+    JobCatchUp,
     JobSchedule,
     JobSpec,
     JobTrigger,
@@ -1397,6 +1398,7 @@ __all__ = [
     "AuditSpec",
     # Background Jobs (#953)
     "JobBackoff",
+    "JobCatchUp",
     "JobSchedule",
     "JobSpec",
     "JobTrigger",
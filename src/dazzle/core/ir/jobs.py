@@ -23,6 +23,7 @@ DSL shape::
 
     job daily_summary "Daily metrics roll-up":
       schedule: cron("0 1 * * *")
+      catch_up: all
       run: scripts/daily_summary.py
       timeout: 5m
 """
@@ -42,6 +43,19 @@ class JobBackoff(StrEnum):
     EXPONENTIAL = "exponential"
 
 
+class JobCatchUp(StrEnum):
+    """What a scheduler does with fire times it missed (e.g. mid-deploy).
+
+    ``skip`` drops them, ``latest`` runs the most recent one once, and
+    ``all`` runs every missed window (bounded by the scheduler's
+    catch-up horizon).
+    """
+
+    SKIP = "skip"
+    LATEST = "latest"
+    ALL = "all"
+
+
 class JobTrigger(BaseModel):
     """Entity-event trigger that fires a job.
 
@@ -72,10 +86,13 @@ class JobSchedule(BaseModel):
             (``minute hour day month weekday``).
         timezone: IANA timezone for cron evaluation; empty falls back
             to UTC. Cycle 4 wires the scheduler.
+        catch_up: Policy for windows missed while no scheduler was
+            running.
     """
 
     cron: str
     timezone: str = ""
+    catch_up: JobCatchUp = JobCatchUp.LATEST
 
     model_config = ConfigDict(frozen=True)
 
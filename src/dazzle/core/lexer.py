@@ -730,7 +730,7 @@ _NON_KEYWORD_TOKENS = frozenset(
 KEYWORDS = frozenset({token.value for token in TokenType if token not in _NON_KEYWORD_TOKENS})
 
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     """
     A single token in the DSL.
@@ -751,6 +751,35 @@ class Token:
         return f"Token({self.type.value}, {self.value!r}, {self.line}:{self.column})"
 
 
+def emit_indentation(
+    tokens: list[Token], indent_stack: list[int], indent_level: int, file: Path, line: int
+) -> None:
+    """Append INDENT/DEDENT tokens for a line at ``indent_level``.
+
+    Shared by `Lexer` and the regex fast path (`fast_lexer.FastLexer`) so both
+    agree on token positions and on the inconsistent-indentation error.
+    """
+    current_indent = indent_stack[-1]
+
+    if indent_level > current_indent:
+        indent_stack.append(indent_level)
+        tokens.append(Token(TokenType.INDENT, "", line, 1))
+
+    elif indent_level < current_indent:
+        while indent_stack and indent_stack[-1] > indent_level:
+            indent_stack.pop()
+            tokens.append(Token(TokenType.DEDENT, "", line, 1))
+
+        if indent_stack[-1] != indent_level:
+            raise make_parse_error(
+                f"Inconsistent indentation (expected "
+                f"{indent_stack[-1]} spaces, got {indent_level})",
+                file,
+                line,
+                1,
+            )
+
+
 class Lexer:
     """
     Lexer for DAZZLE DSL.
@@ -908,25 +937,7 @@ class Lexer:
 
     def handle_indentation(self, indent_level: int) -> None:
         """Generate INDENT/DEDENT tokens based on indentation level."""
-        current_indent = self.indent_stack[-1]
-
-        if indent_level > current_indent:
-            self.indent_stack.append(indent_level)
-            self.tokens.append(Token(TokenType.INDENT, "", self.line, 1))
-
-        elif indent_level < current_indent:
-            while self.indent_stack and self.indent_stack[-1] > indent_level:
-                self.indent_stack.pop()
-                self.tokens.append(Token(TokenType.DEDENT, "", self.line, 1))
-
-            if self.indent_stack[-1] != indent_level:
-                raise make_parse_error(
-                    f"Inconsistent indentation (expected "
-                    f"{self.indent_stack[-1]} spaces, got {indent_level})",
-                    self.file,
-                    self.line,
-                    1,
-                )
+        emit_indentation(self.tokens, self.indent_stack, indent_level, self.file, self.line)
 
     def _handle_line_start(self) -> bool:
         """
@@ -1124,16 +1135,23 @@ class Lexer:
         return self.tokens
 
 
-def tokenize(text: str, file: Path) -> list[Token]:
+def tokenize(text: str, file: Path, *, fast: bool = True) -> list[Token]:
     """
     Convenience function to tokenize DSL text.
 
     Args:
         text: Source text
         file: Source file path
+        fast: Use the run-scanning ``FastLexer`` (default). ``False`` selects
+            the character-at-a-time reference ``Lexer``; both produce an
+            identical token stream.
 
     Returns:
         List of tokens
     """
+    if fast:
+        from .fast_lexer import FastLexer
+
+        return FastLexer(text, file).tokenize()
     lexer = Lexer(text, file)
     return lexer.tokenize()
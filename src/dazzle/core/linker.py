@@ -1131,7 +1131,7 @@ def _build_job_run_entity() -> ir.EntitySpec:
     A single shared platform entity captures every worker invocation
     across all declared jobs. The `job_name` discriminator + `status`
     + timing columns make it the read source for cycle-4's scheduler
-    (skip currently-running jobs) and cycle-6's retention sweep.
+    (skip currently-running jobs) and the retention purge.
 
     Mirrors the AIJob / AuditEntry shape — same access pattern (auth-
     required CRUD via the standard route generator).
@@ -1155,8 +1155,8 @@ def _build_job_run_entity() -> ir.EntitySpec:
     # through the standard service layer rather than a privileged
     # path. UPDATE is permitted so the worker can transition status
     # (pending → running → completed/failed). DELETE is intentionally
-    # absent — historical job-run rows are evidence; cycle-6 retention
-    # uses a different bulk-delete code path.
+    # absent — historical job-run rows are evidence; the retention
+    # purge deletes expired rows in SQL batches instead.
     access = ir.AccessSpec(
         permissions=[
             ir.PermissionRule(
@@ -1190,6 +1190,8 @@ def _build_job_run_entity() -> ir.EntitySpec:
         patterns=["system", "audit"],
         fields=fields,
         access=access,
+        # Drives the retention purge's batched range scan.
+        constraints=[ir.Constraint(kind=ir.ConstraintKind.INDEX, fields=["created_at"])],
     )
 
 
@@ -1249,6 +1251,8 @@ def _build_audit_entry_entity() -> ir.EntitySpec:
         patterns=["system", "audit"],
         fields=fields,
         access=access,
+        # Drives the per-entity retention purge's batched range scan.
+        constraints=[ir.Constraint(kind=ir.ConstraintKind.INDEX, fields=["entity_type", "at"])],
     )
 
 
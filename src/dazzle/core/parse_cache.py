@@ -0,0 +1,222 @@
+"""Content-hash-keyed on-disk cache for parsed modules and linked AppSpecs.
+
+Every ``dazzle serve`` boot, uvicorn worker, CLI command and LSP save
+re-lexes, re-parses and re-links the whole project. For unchanged DSL
+that work is pure waste, so this module persists two artifact kinds
+under ``.dazzle/cache/parse/``:
+
+- ``modules/<key>.pkl`` — one ``ModuleIR`` per DSL file, keyed by the
+  file path, the file's content hash, the vocabulary manifest hash and
+  the framework fingerprint.
+- ``appspec/<key>.pkl`` — the fully-linked ``AppSpec``, keyed by the
+  combined module keys plus the link inputs (root module name and the
+  known-renderer allowlist).
+
+Keys are content hashes, so invalidation is implicit: editing a file
+produces a new key and the stale entry is simply never read again
+(``prune`` reclaims the disk). Entries are written atomically
+(temp file + ``os.replace``) so concurrent workers booting against the
+same project never observe a torn pickle. Any read failure is treated
+as a miss — the cache can only ever make loading faster, never wrong.
+
+Set ``DAZZLE_PARSE_CACHE=0`` to bypass the cache entirely.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from collections.abc import Iterable
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from dazzle._version import get_version
+
+from . import ir
+from .paths import project_dazzle_dir
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk layout or the pickled payload shape changes in a
+# way the framework version alone would not capture.
+CACHE_FORMAT = "1"
+
+PARSE_CACHE_DIR = Path("cache") / "parse"
+PARSE_CACHE_ENV = "DAZZLE_PARSE_CACHE"
+
+# Appspec artifacts are large (100-400 KB) and only the newest few are
+# ever useful; module artifacts are small and churn with every edit.
+DEFAULT_KEEP_APPSPECS = 8
+DEFAULT_KEEP_MODULES = 2000
+
+
+def parse_cache_enabled() -> bool:
+    """Return False when ``DAZZLE_PARSE_CACHE`` disables the cache."""
+    return os.environ.get(PARSE_CACHE_ENV, "1").strip().lower() not in ("0", "false", "off", "no")
+
+
+def project_parse_cache_dir(project_root: Path) -> Path:
+    """Return the parse cache directory for a project."""
+    return project_dazzle_dir(project_root) / PARSE_CACHE_DIR
+
+
+@lru_cache(maxsize=1)
+def framework_fingerprint() -> str:
+    """Identify the parser/linker build that produced a cached artifact.
+
+    Released wheels are identified by version alone. In a source checkout
+    (editable install) the version does not move while the parser does,
+    so the newest mtime under ``dazzle/core`` is folded in as well — a
+    framework developer editing the linker must not be served stale IR.
+    """
+    parts = [get_version(), CACHE_FORMAT]
+    core_dir = Path(__file__).parent
+    if (core_dir.parent.parent.parent / "pyproject.toml").exists():
+        newest = max((p.stat().st_mtime_ns for p in core_dir.rglob("*.py")), default=0)
+        parts.append(str(newest))
+    return ":".join(parts)
+
+
+def _sha256(*parts: str | bytes) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode("utf-8") if isinstance(part, str) else part)
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class ParseCache:
+    """On-disk store of pickled ``ModuleIR`` and ``AppSpec`` artifacts."""
+
+    def __init__(self, cache_dir: Path, *, vocab_hash: str = "") -> None:
+        """
+        Initialize the parse cache.
+
+        Args:
+            cache_dir: Directory holding the ``modules/`` and ``appspec/`` stores
+            vocab_hash: Hash of the vocabulary manifest in effect ("" if none)
+        """
+        self.cache_dir = cache_dir
+        self.vocab_hash = vocab_hash
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def for_project(cls, project_root: Path, dsl_files: list[Path]) -> ParseCache:
+        """Build a cache for a project, hashing its vocabulary manifest if present."""
+        from .parser import vocabulary_manifest_path
+
+        vocab_hash = ""
+        manifest_path = vocabulary_manifest_path(dsl_files)
+        if manifest_path is not None and manifest_path.exists():
+            vocab_hash = _sha256(manifest_path.read_bytes())
+        return cls(project_parse_cache_dir(project_root), vocab_hash=vocab_hash)
+
+    # -- keys ---------------------------------------------------------------
+
+    def module_key(self, path: Path, text: str) -> str:
+        """Key for one DSL file's parsed ``ModuleIR``."""
+        return _sha256("module", framework_fingerprint(), self.vocab_hash, str(path), text)
+
+    def appspec_key(
+        self,
+        module_keys: Iterable[str],
+        root_module_name: str,
+        known_renderers: set[str] | None,
+    ) -> str:
+        """Key for a linked ``AppSpec`` built from the given modules."""
+        renderers = ",".join(sorted(known_renderers)) if known_renderers is not None else "-"
+        return _sha256(
+            "appspec", framework_fingerprint(), root_module_name, renderers, *module_keys
+        )
+
+    # -- module artifacts ---------------------------------------------------
+
+    def get_module(self, key: str) -> ir.ModuleIR | None:
+        """Return the cached ``ModuleIR`` for *key*, or None on a miss."""
+        module = self._read(self._path("modules", key))
+        return module if isinstance(module, ir.ModuleIR) else None
+
+    def put_module(self, key: str, module: ir.ModuleIR) -> None:
+        """Store a parsed ``ModuleIR`` under *key*."""
+        self._write(self._path("modules", key), module)
+
+    # -- appspec artifacts --------------------------------------------------
+
+    def get_appspec(self, key: str) -> ir.AppSpec | None:
+        """Return the cached linked ``AppSpec`` for *key*, or None on a miss."""
+        appspec = self._read(self._path("appspec", key))
+        return appspec if isinstance(appspec, ir.AppSpec) else None
+
+    def put_appspec(self, key: str, appspec: ir.AppSpec) -> None:
+        """Store a linked ``AppSpec`` under *key*."""
+        self._write(self._path("appspec", key), appspec)
+
+    # -- maintenance --------------------------------------------------------
+
+    def prune(
+        self,
+        *,
+        keep_appspecs: int = DEFAULT_KEEP_APPSPECS,
+        keep_modules: int = DEFAULT_KEEP_MODULES,
+    ) -> int:
+        """Drop all but the newest entries of each kind. Returns files removed."""
+        removed = 0
+        for kind, keep in (("appspec", keep_appspecs), ("modules", keep_modules)):
+            kind_dir = self.cache_dir / kind
+            if not kind_dir.is_dir():
+                continue
+            entries = sorted(
+                kind_dir.glob("*.pkl"), key=lambda p: p.stat().st_mtime_ns, reverse=True
+            )
+            for stale in entries[keep:]:
+                stale.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def clear(self) -> int:
+        """Remove every cached artifact. Returns files removed."""
+        return self.prune(keep_appspecs=0, keep_modules=0)
+
+    # -- internals ----------------------------------------------------------
+
+    def _path(self, kind: str, key: str) -> Path:
+        return self.cache_dir / kind / f"{key}.pkl"
+
+    def _read(self, path: Path) -> Any:
+        try:
+            data = path.read_bytes()
+        except OSError:
+            self.misses += 1
+            return None
+        try:
+            value = pickle.loads(data)
+        except Exception:
+            # Torn write from a crashed process or an artifact pickled by an
+            # incompatible build — drop it and fall back to a fresh parse.
+            logger.debug("Discarding unreadable parse cache entry %s", path, exc_info=True)
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def _write(self, path: Path, value: Any) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".pkl")
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    pickle.dump(value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_name, path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except Exception:
+            # Read-only project dirs (containers, CI checkouts) must not break
+            # loading — the cache is an optimisation only.
+            logger.debug("Could not write parse cache entry %s", path, exc_info=True)
@@ -1,15 +1,39 @@
+from __future__ import annotations
+
+import atexit
+import functools
 import logging
+import multiprocessing
+import os
+import sys
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
 
 from . import ir
 from .dsl_parser_impl import parse_dsl
 from .expander import VocabExpander
+from .process_pools import pool_context, shutdown_cached_pool
 from .vocab import load_manifest
 
+if TYPE_CHECKING:
+    from .parse_cache import ParseCache
+
 logger = logging.getLogger(__name__)
 
+# Below this many files to parse, process start-up costs more than it saves.
+PARALLEL_PARSE_THRESHOLD = 12
+PARSE_WORKERS_ENV = "DAZZLE_PARSE_WORKERS"
 
-def parse_modules(files: list[Path]) -> list[ir.ModuleIR]:
+
+def parse_modules(
+    files: list[Path],
+    *,
+    cache: ParseCache | None = None,
+    workers: int | None = None,
+) -> list[ir.ModuleIR]:
     """
     Parse DSL files into ModuleIR structures.
 
@@ -20,78 +44,231 @@ def parse_modules(files: list[Path]) -> list[ir.ModuleIR]:
 
     If a vocabulary manifest exists, expands @use directives before parsing.
 
+    Files are independent once expanded, so when at least
+    ``PARALLEL_PARSE_THRESHOLD`` files need parsing they are fanned out to a
+    process pool shared by every call. Results come back in input order and
+    the first failure in file order is raised — exactly as the sequential
+    loop would.
+
     Args:
         files: List of .dsl file paths to parse
+        cache: Optional content-hash-keyed cache; files whose content is
+            unchanged are loaded from it instead of being re-parsed
+        workers: Parser process count. None picks automatically (parallel
+            above the threshold, honouring ``DAZZLE_PARSE_WORKERS``); 1 forces
+            sequential parsing; N > 1 forces the shared pool regardless of size.
 
     Returns:
         List of ModuleIR objects with complete parsed IR fragments
     """
-    modules: list[ir.ModuleIR] = []
+    modules: dict[int, ir.ModuleIR] = {}
+    jobs: list[_ParseJob] = []
+    deferred_error: Exception | None = None
 
     # Try to load vocabulary manifest (optional)
-    expander = _load_vocabulary_expander(files)
+    expander = load_vocabulary_expander(files)
+
+    for index, f in enumerate(files):
+        try:
+            text = f.read_text(encoding="utf-8")
+
+            cache_key: str | None = None
+            if cache is not None:
+                cache_key = cache.module_key(f, text)
+                cached = cache.get_module(cache_key)
+                if cached is not None:
+                    modules[index] = cached
+                    continue
+
+            jobs.append(_ParseJob(index, f, expand_vocabulary(expander, f, text), cache_key))
+        except Exception as e:
+            # Files before this one still parse first, so a parse error in an
+            # earlier file wins — the same error the sequential loop reports.
+            deferred_error = e
+            break
+
+    for job, module in zip(jobs, _run_parse_jobs(jobs, workers), strict=False):
+        if cache is not None and job.cache_key is not None:
+            cache.put_module(job.cache_key, module)
+        modules[job.position] = module
+
+    if deferred_error is not None:
+        raise deferred_error
+
+    return [modules[index] for index in sorted(modules)]
+
+
+class _ParseJob(NamedTuple):
+    position: int
+    path: Path
+    text: str  # vocabulary-expanded source
+    cache_key: str | None
+
+
+def expand_vocabulary(expander: VocabExpander | None, f: Path, text: str) -> str:
+    """Expand vocabulary references if a manifest exists."""
+    if not expander:
+        return text
+    try:
+        return expander.expand_text(text)
+    except Exception as e:
+        # If expansion fails, include file context in error
+        from .errors import DazzleError
+
+        raise DazzleError(f"Vocabulary expansion failed in {f}: {e}")
 
-    for f in files:
-        text = f.read_text(encoding="utf-8")
 
-        # Expand vocabulary references if manifest exists
-        if expander:
+def parse_module_file(f: Path, text: str) -> ir.ModuleIR:
+    """
+    Parse one (already vocabulary-expanded) DSL file into a ModuleIR.
+
+    Module-level so process-pool workers can pickle a reference to it.
+
+    Args:
+        f: Source file path (module-name fallback and error locations)
+        text: DSL source text
+
+    Returns:
+        Parsed ModuleIR
+    """
+    module_name, app_name, app_title, app_config, uses, fragment = parse_dsl(text, f)
+
+    # Use filename as fallback module name
+    if module_name is None:
+        module_name = f.stem
+
+    return ir.ModuleIR(
+        name=module_name,
+        file=f,
+        app_name=app_name,
+        app_title=app_title,
+        app_config=app_config,
+        uses=uses,
+        fragment=fragment,
+    )
+
+
+def resolve_parse_workers(workers: int | None, job_count: int) -> int:
+    """
+    Decide how many parser processes to use for ``job_count`` files.
+
+    Args:
+        workers: Explicit request (None = automatic)
+        job_count: Number of files that actually need parsing
+
+    Returns:
+        Process count; 1 means parse sequentially in-process
+    """
+    if workers is None:
+        if job_count < PARALLEL_PARSE_THRESHOLD:
+            return 1
+        workers = os.cpu_count() or 1
+        override = os.environ.get(PARSE_WORKERS_ENV, "").strip()
+        if override:
             try:
-                text = expander.expand_text(text)
-            except Exception as e:
-                # If expansion fails, include file context in error
-                from .errors import DazzleError
+                workers = int(override)
+            except ValueError:
+                logger.warning("Ignoring non-integer %s=%r", PARSE_WORKERS_ENV, override)
+    return max(1, min(workers, job_count))
 
-                raise DazzleError(f"Vocabulary expansion failed in {f}: {e}")
 
-        # Parse DSL file
-        module_name, app_name, app_title, app_config, uses, fragment = parse_dsl(text, f)
+def _run_parse_jobs(jobs: list[_ParseJob], workers: int | None) -> Iterator[ir.ModuleIR]:
+    """Yield parsed modules in job order, in-process or via the shared process pool."""
+    pool: ProcessPoolExecutor | None = None
+    # Daemonic processes (e.g. multiprocessing workers) may not have children.
+    if (
+        resolve_parse_workers(workers, len(jobs)) > 1
+        and not multiprocessing.current_process().daemon
+    ):
+        pool = _parse_pool()
 
-        # Use filename as fallback module name
-        if module_name is None:
-            module_name = f.stem
+    if pool is None:
+        for job in jobs:
+            yield parse_module_file(job.path, job.text)
+        return
 
-        modules.append(
-            ir.ModuleIR(
-                name=module_name,
-                file=f,
-                app_name=app_name,
-                app_title=app_title,
-                app_config=app_config,
-                uses=uses,
-                fragment=fragment,
-            )
-        )
+    futures = [pool.submit(parse_module_file, job.path, job.text) for job in jobs]
+    try:
+        for future in futures:
+            yield future.result()
+    except BrokenProcessPool:
+        logger.error("Parser worker process died; recreating the pool for the next parse")
+        _parse_pool.cache_clear()
+        raise
+    finally:
+        for future in futures:
+            future.cancel()
 
-    return modules
 
+@functools.cache
+def _parse_pool() -> ProcessPoolExecutor | None:
+    """Create the shared parser pool once; None when multiprocessing is unusable.
 
-def _load_vocabulary_expander(files: list[Path]) -> VocabExpander | None:
+    Kept for the life of the process so repeated loads (LSP reloads,
+    ``dazzle serve`` workers) pay worker start-up once. Sized by
+    ``DAZZLE_PARSE_WORKERS`` or the CPU count; workers start on demand.
+    `functools.cache` holds the singleton without a module-level `global`
+    (ADR-0005). `shutdown_parse_pool` clears it.
     """
-    Try to load vocabulary manifest and create expander.
+    size = resolve_parse_workers(None, sys.maxsize)
+    try:
+        return ProcessPoolExecutor(max_workers=size, mp_context=pool_context())
+    except (OSError, ValueError):
+        # No usable multiprocessing (sandboxed /dev/shm, frozen builds…).
+        logger.debug("Parse pool unavailable, parsing sequentially", exc_info=True)
+        return None
+
+
+def shutdown_parse_pool(*, wait: bool = True) -> None:
+    """Stop the parser pool's workers. Safe when never started; runs at exit."""
+    shutdown_cached_pool(_parse_pool, wait=wait)
+
+
+atexit.register(shutdown_parse_pool)
+
+
+def vocabulary_manifest_path(files: list[Path]) -> Path | None:
+    """
+    Return where the vocabulary manifest for these DSL files would live.
 
     Looks for dazzle/local_vocab/manifest.yml relative to the first DSL file.
-    Returns None if no manifest exists (vocabulary is optional).
+    The path is returned whether or not the manifest exists; None means
+    there are no files to anchor the lookup.
 
     Args:
         files: List of DSL files being parsed
 
     Returns:
-        VocabExpander if manifest exists, None otherwise
+        Candidate manifest path, or None if files is empty
     """
     if not files:
         return None
 
-    # Look for manifest relative to first DSL file
     # Assume: project_root/dsl/*.dsl and
     # project_root/dazzle/local_vocab/manifest.yml
     first_file = files[0]
     project_root = (
         first_file.parent.parent if first_file.parent.name == "dsl" else first_file.parent
     )
-    manifest_path = project_root / "dazzle" / "local_vocab" / "manifest.yml"
+    return project_root / "dazzle" / "local_vocab" / "manifest.yml"
+
+
+def load_vocabulary_expander(files: list[Path]) -> VocabExpander | None:
+    """
+    Try to load vocabulary manifest and create expander.
+
+    Looks for dazzle/local_vocab/manifest.yml relative to the first DSL file.
+    Returns None if no manifest exists (vocabulary is optional).
+
+    Args:
+        files: List of DSL files being parsed
+
+    Returns:
+        VocabExpander if manifest exists, None otherwise
+    """
+    manifest_path = vocabulary_manifest_path(files)
 
-    if not manifest_path.exists():
+    if manifest_path is None or not manifest_path.exists():
         return None
 
     try:
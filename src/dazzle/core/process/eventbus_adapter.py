@@ -19,8 +19,10 @@ import logging
 import uuid
 from collections.abc import Callable, Coroutine
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
+from dazzle.core.cron import CronExpression, CronParseError, cron_matches, parse_cron
 from dazzle.core.ir.process import ProcessSpec, ScheduleSpec
 from dazzle.core.process.adapter import (
     ProcessAdapter,
@@ -54,6 +56,16 @@ def _resolve_param_ref(value: Any) -> Any:
     return value
 
 
+@lru_cache(maxsize=256)
+def _parse_schedule_cron(cron: str) -> CronExpression | None:
+    """Parse a schedule's cron once; an invalid one is logged once and never fires."""
+    try:
+        return parse_cron(cron)
+    except CronParseError as exc:
+        logger.warning("Invalid schedule cron %r — not scheduled: %s", cron, exc)
+        return None
+
+
 # Event type constants
 PROCESS_EXECUTE = "process.execution.requested"
 PROCESS_RESUME = "process.execution.resume"
@@ -585,30 +597,9 @@ class EventBusProcessAdapter(ProcessAdapter):
 
     @staticmethod
     def _cron_matches(cron: str, now: datetime) -> bool:
-        """Simple cron matching (minute hour dom month dow)."""
-        parts = cron.split()
-        if len(parts) < 5:
-            return False
-
-        def _match(pattern: str, value: int) -> bool:
-            if pattern == "*":
-                return True
-            if pattern.isdigit():
-                return int(pattern) == value
-            if "/" in pattern:
-                _, step = pattern.split("/", 1)
-                return value % int(step) == 0
-            if "," in pattern:
-                return str(value) in pattern.split(",")
-            return False
-
-        return (
-            _match(parts[0], now.minute)
-            and _match(parts[1], now.hour)
-            and _match(parts[2], now.day)
-            and _match(parts[3], now.month)
-            and _match(parts[4], now.weekday())
-        )
+        """Whether ``now`` falls in a minute ``cron`` fires (POSIX weekdays, 0 = Sunday)."""
+        parsed = _parse_schedule_cron(cron)
+        return parsed is not None and cron_matches(parsed, now)
 
     # -----------------------------------------------------------------------
     # Sync execution helpers (run in thread pool)
@@ -33,6 +33,7 @@ class PostgresProcessConfig:
     """Configuration for PostgresProcessAdapter."""
 
     dsn: str | None = None  # Defaults to DATABASE_URL env var at create time
+    workers: int | None = None  # Defaults to DAZZLE_PROCESS_WORKERS env var, else 5
 
 
 @dataclass
@@ -209,8 +210,10 @@ def _create_postgres_adapter(config: ProcessConfig) -> ProcessAdapter:
 
     Reads the DSN from config.postgres.dsn first, then falls back to the
     DATABASE_URL environment variable.  Raises ValueError if neither is set.
+    The worker count comes from config.postgres.workers, then
+    DAZZLE_PROCESS_WORKERS.
     """
-    from .postgres_adapter import PostgresProcessAdapter
+    from .postgres_adapter import DEFAULT_PROCESS_WORKERS, PostgresProcessAdapter
 
     dsn = config.postgres.dsn or os.environ.get("DATABASE_URL")
     if not dsn:
@@ -218,7 +221,15 @@ def _create_postgres_adapter(config: ProcessConfig) -> ProcessAdapter:
             "Postgres backend requested but no DSN provided. "
             "Set DATABASE_URL or pass PostgresProcessConfig(dsn=...)."
         )
-    return PostgresProcessAdapter(dsn=dsn)
+    workers = config.postgres.workers
+    if workers is None:
+        raw = os.environ.get("DAZZLE_PROCESS_WORKERS", "").strip()
+        try:
+            workers = int(raw) if raw else DEFAULT_PROCESS_WORKERS
+        except ValueError:
+            logger.warning("Ignoring DAZZLE_PROCESS_WORKERS=%r: not an integer", raw)
+            workers = DEFAULT_PROCESS_WORKERS
+    return PostgresProcessAdapter(dsn=dsn, workers=workers)
 
 
 def _create_eventbus_adapter(config: ProcessConfig) -> ProcessAdapter:
@@ -283,6 +283,11 @@ class PgProcessStateStore:
                 ON process_tasks (deliver_at)
                 WHERE status IN ('pending', 'claimed')
             """)
+            cur.execute("""
+                CREATE INDEX IF NOT EXISTS ix_process_tasks_open_due
+                ON process_tasks (due_at)
+                WHERE status IN ('pending', 'assigned', 'escalated')
+            """)
             conn.commit()
         self._tables_ensured = True
 
@@ -521,6 +526,26 @@ class PgProcessStateStore:
             rows = cur.fetchall()
         return [_row_to_task(dict(r)) for r in rows]
 
+    def list_overdue_task_ids(self, limit: int = 500) -> list[str]:
+        """IDs of open tasks past their ``due_at``, earliest deadline first.
+
+        Served by the ``ix_process_tasks_open_due`` partial index, so the
+        timeout sweep sees every overdue task however many are open.
+        """
+        with self._connect() as conn, conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT task_id FROM process_tasks
+                WHERE status IN ('pending', 'assigned', 'escalated')
+                  AND due_at <= now()
+                ORDER BY due_at
+                LIMIT %s
+                """,
+                (limit,),
+            )
+            rows = cur.fetchall()
+        return [r[0] for r in rows]
+
     # ── Entity Metadata (in-memory) ──────────────────────────────────────────
 
     def save_entity_meta(self, entity_name: str, meta: dict[str, Any]) -> None:
@@ -61,6 +61,34 @@ When a human-task step is hit, ``execute_process_steps`` returns
    (``status → 'pending'``, ``deliver_at → now()``).
 4. The next poll claims and resumes the run.
 
+Schedules
+---------
+``register_schedule`` hands each cron / interval schedule to a shared
+``ScheduleRunner`` (``dazzle.core.coordination.schedule``). Every replica
+runs the loop, but only the holder of the process-scheduler advisory lock
+fires, and each fire is claimed in ``schedule_fires`` first, so a window
+produces exactly one run cluster-wide. ``ScheduleSpec.catch_up`` picks
+whether windows missed during a deploy are replayed (``all``) or dropped
+(``skip``). The loop sleeps until the next fire time.
+
+Concurrent execution
+--------------------
+Claimed runs execute side by side on a dedicated thread pool of
+``workers`` threads, so one slow step no longer holds the rest of the
+batch (and their leases) hostage. Each claimed run gets its own
+heartbeat from the moment it is claimed — including while it queues for
+a free worker — and heartbeats renew on the default executor, never
+behind the runs they keep alive. A batch claims at most ``workers`` runs.
+
+Task timeouts
+-------------
+``_poll_task_timeouts`` asks the store for open tasks (``pending`` /
+``assigned`` / ``escalated``) whose ``due_at`` has passed — one query on
+the ``ix_process_tasks_open_due`` partial index, oldest deadline first —
+and escalates or expires each. The sweep runs at most once per
+``poll_interval``, including between refills while runs keep arriving,
+so sustained load never starves escalations.
+
 NOTIFY latency hint
 --------------------
 ``start_process`` sends a sync ``NOTIFY process_run`` so a waiting consumer
@@ -74,14 +102,26 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 import uuid
 from collections.abc import Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, cast
 
 if TYPE_CHECKING:
     from dazzle.core.process.process_state import ProcessStateStore
 
+from dazzle.core.coordination.schedule import (
+    PROCESS_SCHEDULER_LOCK_KEY,
+    PgScheduleLedger,
+    ScheduleEntry,
+    ScheduleRunner,
+    cron_entry,
+    interval_entry,
+)
+from dazzle.core.cron import CronParseError, parse_cron
+from dazzle.core.ir.jobs import JobCatchUp
 from dazzle.core.ir.process import ProcessSpec, ScheduleSpec
 from dazzle.core.process.adapter import (
     ProcessAdapter,
@@ -98,6 +138,12 @@ logger = logging.getLogger(__name__)
 # Channel name used for NOTIFY / LISTEN.
 _NOTIFY_CHANNEL = "process_run"
 
+# Runs executed concurrently per adapter (``DAZZLE_PROCESS_WORKERS``).
+DEFAULT_PROCESS_WORKERS = 5
+
+# Overdue tasks escalated / expired per poll; the rest wait for the next one.
+_TIMEOUT_SWEEP_LIMIT = 500
+
 
 def _resolve_param_ref(value: Any) -> Any:
     """Unwrap a ParamRef to its default (mirrors EventBusProcessAdapter)."""
@@ -109,11 +155,12 @@ def _resolve_param_ref(value: Any) -> Any:
 class PostgresProcessAdapter(ProcessAdapter):
     """ProcessAdapter backed by Postgres claim/lease + optional NOTIFY hint.
 
-    ``__init__(dsn, store=None)``
+    ``__init__(dsn, store=None, *, workers=DEFAULT_PROCESS_WORKERS)``
 
     * *dsn* — Postgres connection string (``postgresql://...``).
     * *store* — optional ``PgProcessStateStore`` instance; one is created
       from *dsn* if not supplied.
+    * *workers* — claimed runs executed concurrently.
 
     All public methods are ``async``; sync store / executor calls are
     wrapped via ``asyncio.to_thread`` (same pattern as
@@ -124,6 +171,8 @@ class PostgresProcessAdapter(ProcessAdapter):
         self,
         dsn: str,
         store: PgProcessStateStore | None = None,
+        *,
+        workers: int = DEFAULT_PROCESS_WORKERS,
     ) -> None:
         self._dsn = dsn
         self._store = store or PgProcessStateStore(dsn)
@@ -137,8 +186,24 @@ class PostgresProcessAdapter(ProcessAdapter):
         # Config knobs (can be overridden by tests / subclasses).
         self._poll_interval: float = 2.0
         self._lease_seconds: int = 60
-        self._batch_size: int = 5
+        # Monotonic time at which the next task timeout sweep is due.
+        self._next_timeout_sweep: float = 0.0
+        self._workers = max(1, workers)
+        self._batch_size: int = self._workers
+        self._run_executor = ThreadPoolExecutor(
+            max_workers=self._workers, thread_name_prefix="pg-process-run"
+        )
         self._worker_id: str = f"worker-{uuid.uuid4().hex[:8]}"
+        self._schedule_runner = ScheduleRunner(
+            [],
+            self._fire_schedule,
+            PgScheduleLedger(
+                self._scheduler_connection,
+                lock_key=PROCESS_SCHEDULER_LOCK_KEY,
+                worker=self._worker_id,
+            ),
+            scope="process",
+        )
         # Optional handlers wired by ProcessSubsystem at startup.
         # Mirrors EventBusProcessAdapter so the subsystem's hasattr checks
         # find them and both backends behave identically for SEND steps and
@@ -207,6 +272,9 @@ class PostgresProcessAdapter(ProcessAdapter):
                     await task
                 except asyncio.CancelledError:
                     pass
+        # Runs already on a worker thread finish; queued ones are dropped and
+        # reclaimed from their expired lease by another worker.
+        self._run_executor.shutdown(wait=False, cancel_futures=True)
 
     # -------------------------------------------------------------------------
     # Process Registration
@@ -223,7 +291,11 @@ class PostgresProcessAdapter(ProcessAdapter):
             "process_name": getattr(spec, "process_name", spec.name),
             "cron": _resolve_param_ref(getattr(spec, "cron", None)),
             "interval_seconds": _resolve_param_ref(getattr(spec, "interval_seconds", None)),
+            "catch_up": bool(getattr(spec, "catch_up", False)),
         }
+        entry = _schedule_entry(self._schedules[spec.name])
+        if entry is not None:
+            self._schedule_runner.add(entry)
         logger.debug("Registered schedule: %s", spec.name)
 
     async def register_entity_meta(self, entity_name: str, meta: dict[str, Any]) -> None:
@@ -557,60 +629,94 @@ class PostgresProcessAdapter(ProcessAdapter):
                 logger.warning("Heartbeat renewal failed for run %s: %s", run_id, exc)
 
     async def _claim_and_execute_batch(self) -> None:
-        """Claim a batch of due runs and execute each in a thread with a heartbeat."""
-        runs: list[ProcessRun] = await asyncio.to_thread(
-            self._store.claim_due_runs,
-            self._worker_id,
-            self._lease_seconds,
-            self._batch_size,
-        )
-        for run in runs:
-            # Start the heartbeat task BEFORE blocking in the thread so the lease
-            # stays fresh even if execution takes longer than lease_seconds.
-            heartbeat = asyncio.create_task(
-                self._heartbeat(run.run_id, self._lease_seconds),
-                name=f"pg-heartbeat-{run.run_id[:8]}",
+        """Claim due runs as execution slots free up, until none are due.
+
+        At most ``_batch_size`` runs are in flight. Whenever one finishes
+        (or a NOTIFY / poll tick arrives) the freed slots are refilled with
+        another claim, so one slow run never holds back the rest of a
+        batch. Returns once nothing is due and every claimed run is done.
+        Task timeouts are swept on the poll cadence throughout.
+        """
+        running: set[asyncio.Task[None]] = set()
+        try:
+            while not self._shutdown_event.is_set():
+                await self._sweep_timeouts_if_due()
+                self._notify_event.clear()
+                free = self._batch_size - len(running)
+                runs: list[ProcessRun] = []
+                if free > 0:
+                    runs = await asyncio.to_thread(
+                        self._store.claim_due_runs, self._worker_id, self._lease_seconds, free
+                    )
+                for run in runs:
+                    running.add(
+                        asyncio.create_task(
+                            self._execute_claimed(run.run_id), name=f"pg-run-{run.run_id[:8]}"
+                        )
+                    )
+                if not running:
+                    break
+                await self._wait_for_slot(running)
+        finally:
+            # Claimed runs hold leases; never abandon them mid-flight.
+            if running:
+                await asyncio.gather(*running)
+
+        await self._sweep_timeouts_if_due()
+
+    async def _wait_for_slot(self, running: set[asyncio.Task[None]]) -> None:
+        """Wait for a running execution to finish, a NOTIFY, or the poll interval."""
+        notified = asyncio.create_task(self._notify_event.wait())
+        try:
+            await asyncio.wait(
+                {*running, notified},
+                timeout=self._poll_interval,
+                return_when=asyncio.FIRST_COMPLETED,
             )
+        finally:
+            notified.cancel()
+        running.difference_update([task for task in running if task.done()])
+
+    async def _execute_claimed(self, run_id: str) -> None:
+        """Execute one claimed run on the run pool, heartbeating its lease throughout."""
+        # Start the heartbeat BEFORE handing the run to the pool so the lease
+        # stays fresh while it queues for a worker and while it executes.
+        heartbeat = asyncio.create_task(
+            self._heartbeat(run_id, self._lease_seconds),
+            name=f"pg-heartbeat-{run_id[:8]}",
+        )
+        try:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._run_executor, self._execute_process_sync, run_id)
+        except Exception as exc:
+            logger.error("Failed to execute process %s: %s", run_id, exc)
+        finally:
+            heartbeat.cancel()
             try:
-                await asyncio.to_thread(self._execute_process_sync, run.run_id)
-            except Exception as exc:
-                logger.error("Failed to execute process %s: %s", run.run_id, exc)
-            finally:
-                heartbeat.cancel()
-                try:
-                    await heartbeat
-                except asyncio.CancelledError:
-                    pass
+                await heartbeat
+            except asyncio.CancelledError:
+                pass
 
-        # Also handle task timeouts.
+    async def _sweep_timeouts_if_due(self) -> None:
+        """Run the task timeout sweep unless one ran within ``_poll_interval``."""
+        now = time.monotonic()
+        if now < self._next_timeout_sweep:
+            return
+        self._next_timeout_sweep = now + self._poll_interval
         await self._poll_task_timeouts()
 
     async def _poll_task_timeouts(self) -> None:
-        """Check for expired human tasks and escalate/expire them."""
+        """Escalate / expire every open human task whose deadline has passed."""
         try:
-            tasks = await asyncio.to_thread(
-                self._store.list_tasks,
-                status=TaskStatus.PENDING,
-                limit=50,
-            )
-            tasks += await asyncio.to_thread(
-                self._store.list_tasks,
-                status=TaskStatus.ASSIGNED,
-                limit=50,
-            )
-            tasks += await asyncio.to_thread(
-                self._store.list_tasks,
-                status=TaskStatus.ESCALATED,
-                limit=50,
+            task_ids = await asyncio.to_thread(
+                self._store.list_overdue_task_ids, limit=_TIMEOUT_SWEEP_LIMIT
             )
-            now = datetime.now(UTC)
-            for task in tasks:
-                if now > task.due_at:
-                    await asyncio.to_thread(
-                        check_task_timeout,
-                        cast("ProcessStateStore", self._store),
-                        task.task_id,
-                    )
+            for task_id in task_ids:
+                await asyncio.to_thread(
+                    check_task_timeout,
+                    cast("ProcessStateStore", self._store),
+                    task_id,
+                )
         except Exception as exc:
             logger.warning("Task timeout poll error: %s", exc)
 
@@ -678,39 +784,28 @@ class PostgresProcessAdapter(ProcessAdapter):
     # -------------------------------------------------------------------------
 
     async def _scheduler_loop(self) -> None:
-        """Background cron/interval schedule trigger loop."""
+        """Cluster-safe cron/interval schedule loop (see module docstring)."""
         logger.info("Postgres process scheduler loop starting")
-        last_check: dict[str, datetime] = {}
+        try:
+            await self._schedule_runner.run(self._shutdown_event)
+        except asyncio.CancelledError:
+            pass
+        logger.info("Postgres process scheduler loop stopped")
 
-        while not self._shutdown_event.is_set():
-            try:
-                now = datetime.now(UTC)
-                for name, schedule in self._schedules.items():
-                    interval = schedule.get("interval_seconds")
-                    if interval:
-                        last = last_check.get(name)
-                        if last is None or (now - last).total_seconds() >= interval:
-                            last_check[name] = now
-                            await self._trigger_schedule(name, schedule)
-
-                    cron = schedule.get("cron")
-                    if cron:
-                        if self._cron_matches(cron, now):
-                            last = last_check.get(name)
-                            if last is None or (now - last).total_seconds() >= 60:
-                                last_check[name] = now
-                                await self._trigger_schedule(name, schedule)
-
-                await asyncio.sleep(30.0)
-            except asyncio.CancelledError:
-                break
-            except Exception as exc:
-                logger.warning("Scheduler loop error: %s", exc, exc_info=True)
-                await asyncio.sleep(60.0)
+    def _scheduler_connection(self) -> Any:
+        """Dedicated connection for the scheduler lease + fire ledger."""
+        import psycopg  # noqa: PLC0415
 
-        logger.info("Postgres process scheduler loop stopped")
+        return psycopg.connect(self._dsn)
+
+    async def _fire_schedule(self, name: str, fire_at: datetime) -> None:
+        schedule = self._schedules.get(name)
+        if schedule is not None:
+            await self._trigger_schedule(name, schedule, fire_at=fire_at)
 
-    async def _trigger_schedule(self, name: str, schedule: dict[str, Any]) -> None:
+    async def _trigger_schedule(
+        self, name: str, schedule: dict[str, Any], *, fire_at: datetime | None = None
+    ) -> None:
         """Trigger a scheduled process by inserting a due run."""
         process_name = schedule.get("process_name", name)
         spec = await asyncio.to_thread(self._store.get_process_spec, process_name)
@@ -718,41 +813,39 @@ class PostgresProcessAdapter(ProcessAdapter):
             logger.warning("Schedule %s: process %s not found", name, process_name)
             return
 
+        inputs: dict[str, Any] = {"triggered_by": "schedule", "schedule_name": name}
+        if fire_at is not None:
+            inputs["scheduled_at"] = fire_at.isoformat()
         run_id = str(uuid.uuid4())
         run = ProcessRun(
             run_id=run_id,
             process_name=process_name,
             status=ProcessStatus.PENDING,
-            inputs={"triggered_by": "schedule", "schedule_name": name},
+            inputs=inputs,
         )
         await asyncio.to_thread(self._store.save_run, run)
-        await asyncio.to_thread(self._store.set_schedule_last_run, name, datetime.now(UTC))
+        last_run = fire_at or datetime.now(UTC)
+        await asyncio.to_thread(self._store.set_schedule_last_run, name, last_run)
         await self._notify()
         logger.info("Triggered scheduled process %s run %s", process_name, run_id)
 
-    @staticmethod
-    def _cron_matches(cron: str, now: datetime) -> bool:
-        """Simple cron matching (minute hour dom month dow)."""
-        parts = cron.split()
-        if len(parts) < 5:
-            return False
-
-        def _match(pattern: str, value: int) -> bool:
-            if pattern == "*":
-                return True
-            if pattern.isdigit():
-                return int(pattern) == value
-            if "/" in pattern:
-                _, step = pattern.split("/", 1)
-                return value % int(step) == 0
-            if "," in pattern:
-                return str(value) in pattern.split(",")
-            return False
-
-        return (
-            _match(parts[0], now.minute)
-            and _match(parts[1], now.hour)
-            and _match(parts[2], now.day)
-            and _match(parts[3], now.month)
-            and _match(parts[4], now.weekday())
-        )
+
+def _schedule_entry(schedule: dict[str, Any]) -> ScheduleEntry | None:
+    """Scheduler entry for a registered schedule; cron wins over interval.
+
+    ``catch_up: true`` replays every window missed during a deploy;
+    otherwise missed windows are dropped.
+    """
+    name = schedule["name"]
+    policy = JobCatchUp.ALL if schedule.get("catch_up") else JobCatchUp.SKIP
+    cron = schedule.get("cron")
+    if cron:
+        try:
+            return cron_entry(name, parse_cron(cron), policy)
+        except CronParseError as exc:
+            logger.warning("Schedule %s has invalid cron %r — not scheduled: %s", name, cron, exc)
+            return None
+    interval = schedule.get("interval_seconds")
+    if interval:
+        return interval_entry(name, float(interval), policy)
+    return None
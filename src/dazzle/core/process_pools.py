@@ -0,0 +1,40 @@
+"""Shared plumbing for the framework's process pools.
+
+The parser, PDF renderer, Sentinel scanner and ``dazzle worker
+--processes`` all fan CPU-bound work out to a ``ProcessPoolExecutor``
+from a host that already runs threads (uvicorn, the LSP, the worker's
+event loop). ``fork`` copies those threads' locks mid-flight, so every
+pool starts its workers from ``pool_context()`` instead.
+"""
+
+from __future__ import annotations
+
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+
+
+def pool_context() -> BaseContext:
+    """Forkserver where the platform has it, else ``spawn``; never ``fork``.
+
+    The returned context is the process-global one, so callers must not
+    change its forkserver preload — other pools share it.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def shutdown_cached_pool(
+    factory: functools._lru_cache_wrapper[ProcessPoolExecutor | None], *, wait: bool = True
+) -> None:
+    """Stop the pool a ``functools.cache`` factory holds, then forget it.
+
+    Safe when the factory never ran or returned None (no pool available).
+    """
+    if factory.cache_info().currsize:
+        pool = factory()
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+    factory.cache_clear()
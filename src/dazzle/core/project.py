@@ -7,11 +7,9 @@ Provides convenient functions for the common load → parse → build pipeline.
 from pathlib import Path
 
 from . import ir
+from .appspec_loader import build_project_appspec
 from .fileset import discover_dsl_files
-from .linker import build_appspec
 from .manifest import ProjectManifest, load_manifest
-from .parser import parse_modules
-from .renderer_registry import known_renderer_names
 
 
 def load_project(
@@ -54,10 +52,7 @@ def load_project(
 
     manifest = load_manifest(manifest_path)
     dsl_files = discover_dsl_files(project_dir, manifest)
-    modules = parse_modules(dsl_files)
-    return build_appspec(
-        modules, manifest.project_root, known_renderers=known_renderer_names(manifest)
-    )
+    return build_project_appspec(project_dir, manifest, dsl_files)
 
 
 def load_project_with_manifest(
@@ -91,8 +86,5 @@ def load_project_with_manifest(
 
     manifest = load_manifest(manifest_path)
     dsl_files = discover_dsl_files(project_dir, manifest)
-    modules = parse_modules(dsl_files)
-    appspec = build_appspec(
-        modules, manifest.project_root, known_renderers=known_renderer_names(manifest)
-    )
+    appspec = build_project_appspec(project_dir, manifest, dsl_files)
     return appspec, manifest
@@ -118,6 +118,13 @@ DB_ARTIFACTS: tuple[Artifact, ...] = (
         _ORCH,
         boot_entry="dazzle.core.process.pg_state.PgProcessStateStore._ensure",
     ),
+    # schedule_fires — exactly-once ledger for the cluster scheduler; the
+    # leader's first pass self-gates (skip_boot_schema_ddl).
+    _fw(
+        "schedule_fires",
+        "dazzle.core.coordination.schedule.ensure_schedule_fires_table",
+        boot_entry="dazzle.core.coordination.schedule.PgScheduleLedger._ensure",
+    ),
     _fw(
         "_dazzle_audit_log",
         "dazzle.http.runtime.audit_log.ensure_audit_log_table",
@@ -180,6 +187,20 @@ DB_ARTIFACTS: tuple[Artifact, ...] = (
         "dazzle.http.channels.outbox.ensure_outbox_table",
         boot_entry="dazzle.http.channels.outbox.OutboxRepository._ensure_table",
     ),
+    # _dazzle_mapping_redelivery — integration-mapping retries awaiting delayed
+    # re-delivery. Orchestrator-only: RedeliveryRepository runs no DDL.
+    _fw(
+        "_dazzle_mapping_redelivery",
+        "dazzle.http.runtime.mapping_redelivery.ensure_mapping_redelivery_table",
+        boot_entry=None,
+    ),
+    # _dazzle_job_queue — durable background-job queue (PostgresJobQueue); the
+    # boot path self-gates like _dazzle_outbox.
+    _fw(
+        "_dazzle_job_queue",
+        "dazzle.http.runtime.postgres_job_queue.ensure_job_queue_table",
+        boot_entry="dazzle.http.runtime.postgres_job_queue.PostgresJobQueue._ensure_table",
+    ),
     # _dazzle_usage_events (ADR-0050 Option A) — first-party usage-frequency capture
     # for UX inference. Orchestrator-only (no request-path boot entry → boot_entry=None).
     _fw(
@@ -0,0 +1,237 @@
+"""Materialised closure tables for self-referential hierarchies (``dazzle db closure``).
+
+A ``descendants_of self via parent`` / ``ancestors_of self via parent`` field
+is resolved per request by a ``WITH RECURSIVE`` walk over the host table
+(``repository._resolve_recursive_traversal_fields``). On deep org charts and
+category trees that walk dominates list latency, and its recursive step
+cannot use the host's tenant/RLS indexes.
+
+A closure table stores one ``(ancestor_id, descendant_id, depth)`` row per
+ancestor/descendant pair, plus a depth-0 row pairing each node with itself,
+so either direction is one indexed join. It is opt-in per database:
+
+  - ``closure_specs`` finds every (entity, self-ref FK) hierarchy that a
+    traversal field walks
+  - ``ClosureSpec.create_sql`` declares the table, its reverse index and
+    ``AFTER INSERT OR DELETE OR UPDATE OF <fk>`` / ``AFTER TRUNCATE``
+    triggers that keep it in step inside the writing transaction, rejecting
+    writes that would make the hierarchy cyclic. ``backfill_sql`` fills it
+    from existing rows
+  - ``migration_engine.build_closure_plan`` renders both as a revision
+  - ``check_closure`` diffs the table against the recursive definition
+
+The runtime switches a hierarchy to its closure table once the table exists
+(probed once per repository with ``CLOSURE_PROBE_SQL``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from typing import Any
+
+from dazzle.core.ir import FieldTypeKind
+from dazzle.db.connection import fetchrow
+from dazzle.db.sql import quote_id
+from dazzle.db.virtual import is_virtual_entity
+
+# Postgres identifier limit.
+_MAX_IDENT = 63
+
+_TRAVERSAL_KINDS = (FieldTypeKind.DESCENDANTS_OF, FieldTypeKind.ANCESTORS_OF)
+_ID_TYPES = {FieldTypeKind.UUID: "uuid", FieldTypeKind.INT: "bigint"}
+
+# Which of the candidate closure tables exist (the runtime's one-off probe).
+CLOSURE_PROBE_SQL = (
+    "SELECT name FROM unnest(%s::text[]) AS name WHERE to_regclass(quote_ident(name)) IS NOT NULL"
+)
+
+
+def _ident(*parts: str) -> str:
+    """Join ``parts`` into an identifier, hashed down to Postgres' 63-char limit."""
+    name = "_".join(parts)
+    if len(name) <= _MAX_IDENT:
+        return name
+    digest = hashlib.sha1(name.encode()).hexdigest()[:8]
+    return f"{name[: _MAX_IDENT - len(parts[-1]) - 10]}_{digest}_{parts[-1]}"
+
+
+def closure_table_name(entity: str, parent_field: str) -> str:
+    """Closure table for the hierarchy ``entity.parent_field`` describes."""
+    return _ident(entity, parent_field, "closure")
+
+
+@dataclass(frozen=True)
+class ClosureSpec:
+    """One self-referential hierarchy backed by a closure table.
+
+    Attributes:
+        entity: Host table (entity) name
+        parent_field: The self-ref FK column pointing at the parent row
+        id_type: SQL type of the host's primary key
+    """
+
+    entity: str
+    parent_field: str
+    id_type: str = "uuid"
+
+    @property
+    def table(self) -> str:
+        return closure_table_name(self.entity, self.parent_field)
+
+    @property
+    def function(self) -> str:
+        return _ident(self.table, "sync")
+
+    @property
+    def truncate_trigger(self) -> str:
+        return _ident(self.table, "truncate")
+
+    def create_sql(self) -> list[str]:
+        """Table, reverse index, maintenance function and trigger — idempotent."""
+        table, host = quote_id(self.table), quote_id(self.entity)
+        return [
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            f"ancestor_id {self.id_type} NOT NULL, "
+            f"descendant_id {self.id_type} NOT NULL, "
+            f"depth integer NOT NULL, "
+            f"PRIMARY KEY (ancestor_id, descendant_id))",
+            f"CREATE INDEX IF NOT EXISTS {quote_id(_ident(self.table, 'descendant'))} "
+            f"ON {table} (descendant_id, ancestor_id)",
+            self._function_sql(),
+            f"DROP TRIGGER IF EXISTS {quote_id(self.function)} ON {host}",
+            f"CREATE TRIGGER {quote_id(self.function)} "
+            f"AFTER INSERT OR DELETE OR UPDATE OF {quote_id(self.parent_field)} ON {host} "
+            f"FOR EACH ROW EXECUTE FUNCTION {quote_id(self.function)}()",
+            f"DROP TRIGGER IF EXISTS {quote_id(self.truncate_trigger)} ON {host}",
+            f"CREATE TRIGGER {quote_id(self.truncate_trigger)} AFTER TRUNCATE ON {host} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION {quote_id(self.function)}()",
+        ]
+
+    def _function_sql(self) -> str:
+        # UPDATE and DELETE first detach the row's subtree from its former
+        # ancestors; INSERT and UPDATE then attach it under the new parent.
+        table, parent = quote_id(self.table), quote_id(self.parent_field)
+        return f"""\
+CREATE OR REPLACE FUNCTION {quote_id(self.function)}() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        TRUNCATE {table};
+        RETURN NULL;
+    END IF;
+    IF TG_OP = 'UPDATE' AND OLD.{parent} IS NOT DISTINCT FROM NEW.{parent} THEN
+        RETURN NEW;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        DELETE FROM {table} c USING {table} sub
+         WHERE sub.ancestor_id = OLD.id
+           AND c.descendant_id = sub.descendant_id
+           AND c.ancestor_id NOT IN (
+               SELECT descendant_id FROM {table} WHERE ancestor_id = OLD.id);
+    END IF;
+    IF TG_OP = 'DELETE' THEN
+        DELETE FROM {table} WHERE ancestor_id = OLD.id OR descendant_id = OLD.id;
+        RETURN OLD;
+    END IF;
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO {table} (ancestor_id, descendant_id, depth) VALUES (NEW.id, NEW.id, 0);
+    END IF;
+    IF NEW.{parent} IS NOT NULL THEN
+        IF EXISTS (SELECT 1 FROM {table}
+                    WHERE ancestor_id = NEW.id AND descendant_id = NEW.{parent}) THEN
+            RAISE EXCEPTION '% %: parent % would create a cycle',
+                TG_TABLE_NAME, NEW.id, NEW.{parent}
+                USING ERRCODE = 'check_violation';
+        END IF;
+        INSERT INTO {table} (ancestor_id, descendant_id, depth)
+        SELECT up.ancestor_id, down.descendant_id, up.depth + down.depth + 1
+          FROM {table} up, {table} down
+         WHERE up.descendant_id = NEW.{parent} AND down.ancestor_id = NEW.id;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql"""
+
+    def walk_sql(self) -> str:
+        """The recursive definition: a ``closure`` CTE of every (ancestor, descendant, depth).
+
+        ``CYCLE`` stops the walk on hand-made cycles in legacy data rather
+        than recursing forever.
+        """
+        host, parent = quote_id(self.entity), quote_id(self.parent_field)
+        return (
+            "WITH RECURSIVE walk(ancestor_id, descendant_id, depth) AS ("
+            f"SELECT id, id, 0 FROM {host} "
+            "UNION ALL "
+            f"SELECT w.ancestor_id, t.id, w.depth + 1 FROM {host} t "
+            f"JOIN walk w ON t.{parent} = w.descendant_id"
+            ") CYCLE descendant_id SET is_cycle USING path, "
+            "closure AS (SELECT ancestor_id, descendant_id, depth FROM walk WHERE NOT is_cycle)"
+        )
+
+    def backfill_sql(self) -> list[str]:
+        """Rebuild the table from the host rows (run after the trigger exists)."""
+        table = quote_id(self.table)
+        return [
+            f"TRUNCATE {table}",
+            f"INSERT INTO {table} (ancestor_id, descendant_id, depth) "
+            f"{self.walk_sql()} SELECT ancestor_id, descendant_id, depth FROM closure",
+        ]
+
+    def drop_sql(self) -> list[str]:
+        host = quote_id(self.entity)
+        return [
+            f"DROP TRIGGER IF EXISTS {quote_id(self.truncate_trigger)} ON {host}",
+            f"DROP TRIGGER IF EXISTS {quote_id(self.function)} ON {host}",
+            f"DROP FUNCTION IF EXISTS {quote_id(self.function)}()",
+            f"DROP TABLE IF EXISTS {quote_id(self.table)}",
+        ]
+
+
+def closure_specs(appspec: Any) -> list[ClosureSpec]:
+    """Every self-referential hierarchy a ``descendants_of`` / ``ancestors_of`` field walks.
+
+    Junction-mediated traversals (``via ManagerLink.manager``) are left to
+    the recursive CTE: their edges live in another table.
+    """
+    specs: dict[tuple[str, str], ClosureSpec] = {}
+    for entity in appspec.domain.entities:
+        if is_virtual_entity(entity):
+            continue
+        pk = entity.primary_key
+        id_type = _ID_TYPES.get(pk.type.kind, "text") if pk is not None else "uuid"
+        for f in entity.fields:
+            if f.type.kind in _TRAVERSAL_KINDS and f.type.via_entity is None and f.type.via_field:
+                key = (entity.name, f.type.via_field)
+                specs.setdefault(key, ClosureSpec(entity.name, f.type.via_field, id_type))
+    return list(specs.values())
+
+
+@dataclass(frozen=True)
+class ClosureCheck:
+    """Closure rows missing from / extra to the recursive definition."""
+
+    spec: ClosureSpec
+    exists: bool
+    missing: int = 0
+    extra: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.exists and not self.missing and not self.extra
+
+
+async def check_closure(conn: Any, spec: ClosureSpec) -> ClosureCheck:
+    """Compare ``spec``'s closure table with a fresh recursive walk of the host."""
+    table = quote_id(spec.table)
+    found = await fetchrow(conn, "SELECT to_regclass(%s) IS NOT NULL AS present", [table])
+    if not found or not found["present"]:
+        return ClosureCheck(spec, exists=False)
+    stored = f"SELECT ancestor_id, descendant_id, depth FROM {table}"
+    row = await fetchrow(
+        conn,
+        f"{spec.walk_sql()} SELECT "
+        f"(SELECT count(*) FROM (SELECT * FROM closure EXCEPT {stored}) m) AS missing, "
+        f"(SELECT count(*) FROM ({stored} EXCEPT SELECT * FROM closure) x) AS extra",
+    )
+    return ClosureCheck(spec, exists=True, missing=int(row["missing"]), extra=int(row["extra"]))
@@ -0,0 +1,498 @@
+"""AppSpec-driven index advisor (``dazzle db advise-indexes``).
+
+The schema builder declares primary keys, uniques, the tenant column and one
+``(scope, default-sort)`` composite per list surface (#1202). Everything else
+an app queries by — the other anchors of its scope predicates, list filters,
+FK joins, full-text search, workspace GROUP BYs — is left to hand-written
+SQL, so a new app ships with sequential scans on exactly the columns every
+request filters on.
+
+This module reads those access paths off the linked AppSpec:
+
+  - Scope predicates (the IR ``predicate_compiler`` compiles): equality
+    anchors (``owner = current_user``, ``org = current_user.org``), the
+    first hop of a path check, polymorphic ``(type, id)`` pairs and the
+    junction columns of ``via`` EXISTS checks. Literal ``=`` / ``!=`` checks
+    ANDed with an anchor become the WHERE of a partial index
+  - List surfaces: ``ux.sort`` (appended to the scope anchor), ``ux.filter``
+  - Ref fields: the FK column (Postgres does not index the referencing side)
+  - ``ux.search``: a ``pg_trgm`` GIN index per searched field over the
+    ``CAST(col AS TEXT)`` the list search's ``LIKE '%q%'`` filters by — the
+    planner ORs them with a BitmapOr. The FTS backend builds its own
+    ``to_tsvector`` index, so the advisor does not duplicate it
+  - Workspace regions: ``group_by`` / ``group_by_dims`` of aggregate regions
+
+`advise_indexes` returns the recommendations not already covered by the
+declared schema or the live catalog; `IndexAdvice.create_sql` renders each,
+and `migration_engine.build_index_plan` turns them into a reviewable
+revision. `explain_advice` checks one against a seeded database by creating
+it inside a rolled-back transaction and comparing the planner's cost.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from dazzle.db.connection import fetchall, fetchval
+from dazzle.db.sql import quote_id
+from dazzle.db.virtual import is_virtual_entity
+
+# Postgres identifier limit.
+_MAX_IDENT = 63
+_TRGM_OPCLASS = "gin_trgm_ops"
+
+# One key of a ``pg_get_indexdef`` trigram index: ``title gin_trgm_ops`` or,
+# for a non-text column, ``((title)::text) gin_trgm_ops``.
+_TRGM_KEY = re.compile(r'\(*"?(?P<column>[^"()]+?)"?\)*(?:::text\)*)?\s+gin_trgm_ops')
+
+
+@dataclass(frozen=True)
+class IndexAdvice:
+    """One recommended index.
+
+    Attributes:
+        table: Table (entity) name
+        columns: Key columns, in order; for ``gin`` the searched field
+        method: ``btree``, or ``gin`` for a ``pg_trgm`` trigram index
+        where: Partial-index predicate SQL, or None for a full index
+        reasons: Where in the AppSpec the access path comes from
+    """
+
+    table: str
+    columns: tuple[str, ...]
+    method: str = "btree"
+    where: str | None = None
+    reasons: tuple[str, ...] = ()
+
+    @property
+    def key(self) -> tuple[str, tuple[str, ...], str, str | None]:
+        return (self.table, self.columns, self.method, self.where)
+
+    @property
+    def name(self) -> str:
+        """Deterministic index name, hashed down to Postgres' 63-char limit."""
+        suffix = "_".join(self.columns)
+        if self.method == "gin":
+            suffix += "_trgm"
+        if self.where:
+            suffix += "_partial"
+        name = f"ix_adv_{self.table}_{suffix}".lower()
+        if len(name) <= _MAX_IDENT:
+            return name
+        digest = hashlib.sha1("|".join(map(str, self.key)).encode()).hexdigest()[:8]
+        return f"{name[: _MAX_IDENT - 9]}_{digest}"
+
+    @property
+    def extension(self) -> str | None:
+        """Postgres extension the index's operator class needs, if any."""
+        return "pg_trgm" if self.method == "gin" else None
+
+    def key_sql(self) -> str:
+        if self.method == "gin":
+            return ", ".join(f"({search_expr(c)}) {_TRGM_OPCLASS}" for c in self.columns)
+        return ", ".join(quote_id(c) for c in self.columns)
+
+    def create_sql(self, *, concurrently: bool = False) -> str:
+        """``CREATE INDEX`` statement (``CONCURRENTLY`` for a live table)."""
+        using = " USING gin" if self.method == "gin" else ""
+        where = f" WHERE {self.where}" if self.where else ""
+        mode = " CONCURRENTLY" if concurrently else ""
+        return (
+            f"CREATE INDEX{mode} IF NOT EXISTS {quote_id(self.name)} "
+            f"ON {quote_id(self.table)}{using} ({self.key_sql()}){where}"
+        )
+
+    def drop_sql(self) -> str:
+        return f"DROP INDEX IF EXISTS {quote_id(self.name)}"
+
+    def merged(self, other: IndexAdvice) -> IndexAdvice:
+        reasons = self.reasons + tuple(r for r in other.reasons if r not in self.reasons)
+        return IndexAdvice(self.table, self.columns, self.method, self.where, reasons)
+
+
+@dataclass(frozen=True)
+class ExistingIndex:
+    """An index already declared (schema builder) or present (live catalog)."""
+
+    table: str
+    columns: tuple[str | None, ...]
+    method: str = "btree"
+    partial: bool = False
+    definition: str = ""
+
+
+def search_expr(column: str) -> str:
+    """The expression the list search matches ``LIKE`` against, per field."""
+    return f"CAST({quote_id(column)} AS TEXT)"
+
+
+# ---------------------------------------------------------------------------
+# Derivation from the AppSpec
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _Collector:
+    """Accumulates advice, merging reasons for the same index."""
+
+    columns_by_table: dict[str, set[str]]
+    advice: dict[tuple[str, tuple[str, ...], str, str | None], IndexAdvice] = field(
+        default_factory=dict
+    )
+
+    def add(
+        self,
+        table: str,
+        columns: Iterable[str],
+        reason: str,
+        *,
+        method: str = "btree",
+        where: str | None = None,
+    ) -> None:
+        cols = tuple(dict.fromkeys(columns))
+        known = self.columns_by_table.get(table)
+        if not cols or known is None or not set(cols) <= known:
+            return
+        item = IndexAdvice(table, cols, method, where, (reason,))
+        prior = self.advice.get(item.key)
+        self.advice[item.key] = prior.merged(item) if prior else item
+
+
+def derive_index_advice(appspec: Any) -> list[IndexAdvice]:
+    """Every index the AppSpec's access paths call for (before any diff)."""
+    entities = [e for e in appspec.domain.entities if not is_virtual_entity(e)]
+    collector = _Collector({e.name: _column_names(e) for e in entities})
+    sorts = _list_sorts(appspec)
+    for entity in entities:
+        _advise_foreign_keys(collector, entity)
+        _advise_scopes(collector, entity, sorts.get(entity.name))
+    _advise_surfaces(collector, appspec, sorts)
+    _advise_workspaces(collector, appspec)
+    return _drop_prefixes(list(collector.advice.values()))
+
+
+def _column_names(entity: Any) -> set[str]:
+    return {"id", *(f.name for f in entity.fields)}
+
+
+def _list_sorts(appspec: Any) -> dict[str, str]:
+    """Entity → first default-sort column of its first sorted list surface."""
+    sorts: dict[str, str] = {}
+    for surface in _list_surfaces(appspec):
+        if surface.ux is not None and surface.ux.sort:
+            sorts.setdefault(surface.entity_ref, surface.ux.sort[0].field)
+    return sorts
+
+
+def _list_surfaces(appspec: Any) -> Iterator[Any]:
+    for surface in appspec.surfaces or []:
+        mode = getattr(surface.mode, "value", surface.mode)
+        if mode == "list" and surface.entity_ref:
+            yield surface
+
+
+def _advise_foreign_keys(collector: _Collector, entity: Any) -> None:
+    for f in entity.fields:
+        kind = getattr(f.type.kind, "value", f.type.kind)
+        if kind == "ref" and f.type.ref_entity:
+            collector.add(entity.name, [f.name], f"FK {entity.name}.{f.name} → {f.type.ref_entity}")
+
+
+def _advise_scopes(collector: _Collector, entity: Any, sort: str | None) -> None:
+    access = getattr(entity, "access", None)
+    for rule in getattr(access, "scopes", None) or []:
+        if rule.predicate is None:
+            continue
+        op = getattr(rule.operation, "value", rule.operation)
+        reason = f"scope {entity.name}.{op}"
+        for table, cols, where in _predicate_paths(entity.name, rule.predicate):
+            tail = [sort] if sort and table == entity.name and op == "list" else []
+            collector.add(table, [*cols, *tail], reason, where=where)
+
+
+def _predicate_paths(
+    table: str, predicate: Any
+) -> Iterator[tuple[str, tuple[str, ...], str | None]]:
+    """(table, key columns, partial WHERE) access paths a predicate filters by."""
+    kind = getattr(predicate, "kind", None)
+    if kind == "bool_composite":
+        yield from _composite_paths(table, predicate)
+    elif kind in ("column_check", "user_attr_check"):
+        if _is_anchor(predicate):
+            yield table, (predicate.field,), None
+    elif kind == "path_check" and predicate.path:
+        yield table, (predicate.path[0],), None
+    elif kind == "poly_path":
+        yield table, (predicate.type_field, predicate.id_field), None
+        yield from _predicate_paths(predicate.target_entity, predicate.sub)
+    elif kind == "exists_check":
+        cols = tuple(b.junction_field for b in predicate.bindings)
+        yield predicate.target_entity, cols, None
+
+
+def _composite_paths(
+    table: str, predicate: Any
+) -> Iterator[tuple[str, tuple[str, ...], str | None]]:
+    op = getattr(predicate.op, "value", predicate.op)
+    if op == "not":
+        return
+    children = list(predicate.children)
+    # Literal checks ANDed with an anchor narrow its index to a partial one.
+    literal = [c for c in children if _literal_sql(c) is not None] if op == "and" else []
+    where = " AND ".join(sql for c in literal if (sql := _literal_sql(c))) or None
+    for child in children:
+        if child in literal:
+            continue
+        for path_table, cols, child_where in _predicate_paths(table, child):
+            partial = where if path_table == table and child_where is None else child_where
+            yield path_table, cols, partial
+
+
+def _is_anchor(check: Any) -> bool:
+    """An equality to a per-request value (user, user attr, tenant)."""
+    if getattr(check.op, "value", check.op) not in ("=", "in"):
+        return False
+    if check.kind == "user_attr_check":
+        return True
+    value = check.value
+    return bool(value.current_user or value.user_attr or value.current_tenant)
+
+
+def _literal_sql(check: Any) -> str | None:
+    """SQL for ``col = 'lit'`` / ``col != 'lit'``; None when not such a check."""
+    if getattr(check, "kind", None) != "column_check":
+        return None
+    op = getattr(check.op, "value", check.op)
+    literal = check.value.literal
+    if op not in ("=", "!=") or literal is None:
+        return None
+    if isinstance(literal, bool):
+        rendered = "TRUE" if literal else "FALSE"
+    elif isinstance(literal, int | float):
+        rendered = repr(literal)
+    else:
+        rendered = "'" + str(literal).replace("'", "''") + "'"
+    return f"{quote_id(check.field)} {'=' if op == '=' else '<>'} {rendered}"
+
+
+def _advise_surfaces(collector: _Collector, appspec: Any, sorts: dict[str, str]) -> None:
+    for surface in _list_surfaces(appspec):
+        ux = surface.ux
+        if ux is None:
+            continue
+        entity = surface.entity_ref
+        where = f"surface {surface.name}"
+        if ux.sort:
+            collector.add(entity, [s.field for s in ux.sort], f"{where} sort")
+        for name in ux.filter:
+            tail = [sorts[entity]] if entity in sorts else []
+            collector.add(entity, [name, *tail], f"{where} filter")
+        for name in ux.search:
+            collector.add(entity, [name], f"{where} search", method="gin")
+
+
+def _advise_workspaces(collector: _Collector, appspec: Any) -> None:
+    surface_entity = {s.name: s.entity_ref for s in appspec.surfaces or []}
+    for workspace in appspec.workspaces or []:
+        for region in workspace.regions:
+            dims = region.group_by_dims or ([region.group_by] if region.group_by else [])
+            if not dims or not region.source:
+                continue
+            table = surface_entity.get(region.source) or region.source
+            cols = [getattr(d, "field", d) for d in dims]
+            collector.add(table, cols, f"workspace {workspace.name}.{region.name} group_by")
+
+
+def _drop_prefixes(advice: list[IndexAdvice]) -> list[IndexAdvice]:
+    """Drop b-tree advice another advised index already serves.
+
+    That is one whose columns lead a wider index with the same WHERE, or a
+    partial index whose columns lead a full one.
+    """
+    kept: list[IndexAdvice] = []
+    for item in advice:
+        wider = next((o for o in advice if o is not item and _leads(item, o)), None)
+        if wider is None:
+            kept.append(item)
+    return sorted(kept, key=lambda a: (a.table, a.method, a.columns, a.where or ""))
+
+
+def _leads(item: IndexAdvice, other: IndexAdvice) -> bool:
+    if item.method != "btree" or other.method != "btree":
+        return False
+    if other.columns[: len(item.columns)] != item.columns:
+        return False
+    if item.where == other.where:
+        return len(other.columns) > len(item.columns)
+    return item.where is not None and other.where is None
+
+
+# ---------------------------------------------------------------------------
+# Diff against what exists
+# ---------------------------------------------------------------------------
+
+
+def declared_indexes(metadata: Any) -> list[ExistingIndex]:
+    """Indexes the schema builder declares (PKs, uniques, ``sa.Index``)."""
+    found: list[ExistingIndex] = []
+    for table in metadata.tables.values():
+        keyed = [tuple(c.name for c in ix.columns) for ix in table.indexes]
+        for constraint in table.constraints:
+            kind = type(constraint).__name__
+            if kind in ("PrimaryKeyConstraint", "UniqueConstraint"):
+                keyed.append(tuple(c.name for c in constraint.columns))
+        found.extend(ExistingIndex(table.name, cols) for cols in keyed if cols)
+    return found
+
+
+CATALOG_INDEXES_SQL = """
+SELECT t.relname AS table_name,
+       am.amname AS method,
+       ix.indpred IS NOT NULL AS partial,
+       pg_get_indexdef(ix.indexrelid) AS definition,
+       ARRAY(
+           SELECT a.attname
+           FROM unnest(ix.indkey) WITH ORDINALITY AS k(attnum, ord)
+           LEFT JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = k.attnum
+           ORDER BY k.ord
+       ) AS columns
+FROM pg_index ix
+JOIN pg_class t ON t.oid = ix.indrelid
+JOIN pg_class i ON i.oid = ix.indexrelid
+JOIN pg_am am ON am.oid = i.relam
+JOIN pg_namespace n ON n.oid = t.relnamespace
+WHERE n.nspname = current_schema()
+"""
+
+
+async def catalog_indexes(conn: Any) -> list[ExistingIndex]:
+    """Indexes present in the connected database's current schema."""
+    rows = await fetchall(conn, CATALOG_INDEXES_SQL)
+    return [
+        ExistingIndex(
+            table=r["table_name"],
+            columns=tuple(r["columns"]),
+            method=r["method"],
+            partial=bool(r["partial"]),
+            definition=r["definition"],
+        )
+        for r in rows
+    ]
+
+
+def is_covered(item: IndexAdvice, existing: Iterable[ExistingIndex]) -> bool:
+    """Whether an existing index already serves this access path."""
+    for ix in existing:
+        if ix.table != item.table or ix.method != item.method:
+            continue
+        if ix.partial:
+            continue
+        if item.method == "gin":
+            if _trgm_columns(ix.definition) == item.columns:
+                return True
+        elif ix.columns[: len(item.columns)] == item.columns:
+            return True
+    return False
+
+
+def _trgm_columns(definition: str) -> tuple[str, ...] | None:
+    """Columns of a trigram GIN index definition; None for any other GIN index."""
+    _, sep, keys = definition.partition(" USING gin (")
+    if not sep or not keys.endswith(")"):
+        return None
+    columns: list[str] = []
+    for key in _split_keys(keys[:-1]):
+        match = _TRGM_KEY.fullmatch(key.strip())
+        if match is None:
+            return None
+        columns.append(match["column"])
+    return tuple(columns)
+
+
+def _split_keys(keys: str) -> list[str]:
+    """Split an index key list on its top-level commas."""
+    parts, depth, start = [], 0, 0
+    for i, char in enumerate(keys):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append(keys[start:i])
+            start = i + 1
+    parts.append(keys[start:])
+    return parts
+
+
+def advise_indexes(appspec: Any, existing: Iterable[ExistingIndex]) -> list[IndexAdvice]:
+    """Recommended indexes the schema and catalog do not already provide."""
+    present = list(existing)
+    return [a for a in derive_index_advice(appspec) if not is_covered(a, present)]
+
+
+# ---------------------------------------------------------------------------
+# EXPLAIN validation
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class ExplainResult:
+    """Planner cost for a representative query, without and with the index."""
+
+    advice: IndexAdvice
+    cost_before: float
+    cost_after: float
+    used: bool
+
+    @property
+    def speedup(self) -> float:
+        return self.cost_before / self.cost_after if self.cost_after else 0.0
+
+
+def probe_sql(item: IndexAdvice) -> tuple[str, list[Any]]:
+    """A query shaped like the access path the advice serves."""
+    table = quote_id(item.table)
+    if item.method == "gin":
+        likes = " OR ".join(f"{search_expr(c)} LIKE %s" for c in item.columns)
+        return f"SELECT * FROM {table} WHERE {likes} LIMIT 20", ["%dazzle%"] * len(item.columns)
+    lead, *rest = item.columns
+    conds = [f"{quote_id(lead)} = (SELECT {quote_id(lead)} FROM {table} LIMIT 1)"]
+    if item.where:
+        conds.append(item.where)
+    order = f" ORDER BY {', '.join(quote_id(c) for c in rest)}" if rest else ""
+    return f"SELECT * FROM {table} WHERE {' AND '.join(conds)}{order} LIMIT 20", []
+
+
+async def explain_advice(conn: Any, item: IndexAdvice) -> ExplainResult:
+    """EXPLAIN the probe query before and after creating the index.
+
+    The index is built inside a transaction that is always rolled back, so the
+    database is left unchanged. Builds the index for real — run against a
+    seeded copy, not production.
+    """
+    sql, params = probe_sql(item)
+    async with conn.transaction(force_rollback=True):
+        before = await _plan(conn, sql, params)
+        if item.extension:
+            await conn.execute(f"CREATE EXTENSION IF NOT EXISTS {item.extension}")
+        await conn.execute(item.create_sql())
+        await conn.execute(f"ANALYZE {quote_id(item.table)}")
+        after = await _plan(conn, sql, params)
+    return ExplainResult(
+        advice=item,
+        cost_before=before["Total Cost"],
+        cost_after=after["Total Cost"],
+        used=item.name in json.dumps(after),
+    )
+
+
+async def _plan(conn: Any, sql: str, params: list[Any]) -> dict[str, Any]:
+    raw = await fetchval(conn, f"EXPLAIN (FORMAT JSON) {sql}", params)
+    doc = json.loads(raw) if isinstance(raw, str) else raw
+    plan: dict[str, Any] = doc[0]["Plan"]
+    return plan
@@ -11,6 +11,15 @@ Public API
     Pure function: diff two plain-dict Snapshots and render the result.
     Fully unit-testable without a project on disk.
 
+``build_index_plan(advice, snapshot) -> RevisionPlan``
+    Pure function: render ``dazzle db advise-indexes`` recommendations as
+    ``CREATE INDEX`` / ``DROP INDEX`` ops, carrying *snapshot* through unchanged;
+    ``generate_index_revision`` is its head-snapshot wrapper for env.py.
+
+``build_closure_plan(specs, snapshot) -> RevisionPlan``
+    The same shape for ``dazzle db closure``: closure tables, their
+    maintenance triggers and the backfill (``generate_closure_revision``).
+
 ``generate_revision(script_dir, appspec=None) -> RevisionPlan``
     Thin I/O wrapper: loads the head snapshot from *script_dir*, projects the
     current schema via ``project_current()``, and self-loads the project's
@@ -206,6 +215,78 @@ def generate_baseline_plan(
     )
 
 
+# ---------------------------------------------------------------------------
+# Advised indexes: raw-SQL ops outside the snapshot
+# ---------------------------------------------------------------------------
+
+
+def build_index_plan(advice: list[Any], snapshot: dict[str, Any]) -> RevisionPlan:
+    """Build a revision that creates the indexes ``db advise-indexes`` recommends.
+
+    Partial and expression (GIN) indexes are outside what the Snapshot models,
+    so the ops are ``op.execute`` statements rather than ``op.create_index``, and
+    the embedded ``SCHEMA_SNAPSHOT`` is *snapshot* (the head's) unchanged — the
+    next ``db revision`` therefore diffs exactly as if this revision were absent.
+    Extensions the indexes need (``pg_trgm``) are created first and left in
+    place on downgrade, since other objects may depend on them.
+
+    Parameters
+    ----------
+    advice:
+        ``IndexAdvice`` items (see ``dazzle.db.index_advisor``).
+    snapshot:
+        The head snapshot, re-embedded verbatim.
+    """
+    extensions = dict.fromkeys(item.extension for item in advice if item.extension)
+    return _sql_plan(
+        [f"CREATE EXTENSION IF NOT EXISTS {ext}" for ext in extensions]
+        + [item.create_sql() for item in advice],
+        [item.drop_sql() for item in reversed(advice)],
+        snapshot,
+    )
+
+
+def generate_index_revision(script_dir: Any, advice: list[Any]) -> RevisionPlan:
+    """``build_index_plan`` against the head migration's snapshot in *script_dir*."""
+    return build_index_plan(advice, load_head_snapshot(script_dir))
+
+
+def build_closure_plan(specs: list[Any], snapshot: dict[str, Any]) -> RevisionPlan:
+    """Build a revision that materialises closure tables for ``specs``.
+
+    Upgrade creates each table and its trigger, then backfills it from the
+    existing rows — in that order, so writes committed during the migration
+    are caught by the trigger. Like ``build_index_plan``, *snapshot* is
+    re-embedded unchanged: closure tables are derived data, not DSL schema.
+
+    Parameters
+    ----------
+    specs:
+        ``ClosureSpec`` items (see ``dazzle.db.closure``).
+    snapshot:
+        The head snapshot, re-embedded verbatim.
+    """
+    return _sql_plan(
+        [sql for spec in specs for sql in (*spec.create_sql(), *spec.backfill_sql())],
+        [sql for spec in reversed(specs) for sql in spec.drop_sql()],
+        snapshot,
+    )
+
+
+def generate_closure_revision(script_dir: Any, specs: list[Any]) -> RevisionPlan:
+    """``build_closure_plan`` against the head migration's snapshot in *script_dir*."""
+    return build_closure_plan(specs, load_head_snapshot(script_dir))
+
+
+def _sql_plan(upgrade: list[str], downgrade: list[str], snapshot: dict[str, Any]) -> RevisionPlan:
+    return RevisionPlan(
+        upgrade_ops=aops.UpgradeOps(ops=[aops.ExecuteSQLOp(sql) for sql in upgrade]),
+        downgrade_ops=aops.DowngradeOps(ops=[aops.ExecuteSQLOp(sql) for sql in downgrade]),
+        snapshot_literal=render_snapshot_literal(snapshot),
+        is_empty=not upgrade,
+    )
+
+
 # ---------------------------------------------------------------------------
 # I/O wrapper: generate_revision
 # ---------------------------------------------------------------------------
@@ -23,6 +23,13 @@ The public API is intentionally narrow:
       WeasyPrint with a sensible page-size default; pass a
       `PdfOptions(...)` to override.
 
+  ``async_render_document_pdf(template, ctx, cache=...) -> bytes``
+  ``stream_document_pdf(template, ctx, cache) -> AsyncIterator[bytes]``
+      For route handlers: WeasyPrint runs in a bounded process pool
+      (``DAZZLE_PDF_WORKERS``) so the event loop stays responsive, and
+      a `PdfCache` over the app's file storage serves an unchanged
+      document as a plain file stream.
+
 Designed for AI-agent + human authoring: a downstream Dazzle app
 defines its document templates as ordinary Python functions, gives
 them clear signatures, and the framework handles the rest.
@@ -32,14 +39,20 @@ from dazzle.documents.api import (
     DocumentContext,
     DocumentTemplate,
     PdfOptions,
+    async_render_document_pdf,
     render_document_html,
     render_document_pdf,
+    stream_document_pdf,
 )
+from dazzle.documents.pdf_cache import PdfCache
 
 __all__ = (
     "DocumentContext",
     "DocumentTemplate",
+    "PdfCache",
     "PdfOptions",
+    "async_render_document_pdf",
     "render_document_html",
     "render_document_pdf",
+    "stream_document_pdf",
 )
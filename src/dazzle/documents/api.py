@@ -5,17 +5,26 @@ sentinel base, the HTML + PDF rendering entry points, and the
 `PdfOptions` knob set.
 
 The PDF renderer imports WeasyPrint lazily — `render_document_html`
-works without the optional dep installed.
+works without the optional dep installed. The async entry points run
+WeasyPrint in the PDF process pool (`pdf_pool`) and can cache output
+by content (`pdf_cache`).
 """
 
 from __future__ import annotations
 
+import functools
+import importlib.metadata
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
-from typing import Any, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
+from dazzle.documents.pdf_pool import run_pdf_job
 from dazzle.render.fragment import Page
 from dazzle.render.fragment.renderer import FragmentRenderer
 
+if TYPE_CHECKING:
+    from dazzle.documents.pdf_cache import PdfCache
+
 
 class DocumentContext:
     """Base class for document-context dataclasses.
@@ -136,6 +145,78 @@ def render_document_pdf(
     Output is the raw PDF byte stream. Callers wrap it in a
     `Response(media_type="application/pdf")` (or write to disk)
     as needed.
+
+    Synchronous and CPU-bound — from a route handler use
+    `async_render_document_pdf`, which renders in the PDF process
+    pool and can serve repeats from a `PdfCache`.
+    """
+    return _html_to_pdf(render_document_html(template, ctx), options or PdfOptions())
+
+
+async def async_render_document_pdf(
+    template: DocumentTemplate,
+    ctx: Any,
+    /,
+    options: PdfOptions | None = None,
+    *,
+    cache: PdfCache | None = None,
+) -> bytes:
+    """Async variant of `render_document_pdf` — renders off the event loop.
+
+    The template runs here (cheap, and request context such as the
+    display locale is bound); WeasyPrint runs in the shared PDF process
+    pool. With ``cache``, an unchanged document is read back from
+    storage instead of re-rendered.
+    """
+    opts = options or PdfOptions()
+    html = render_document_html(template, ctx)
+    if cache is None:
+        return await run_pdf_job(_html_to_pdf, html, opts)
+    return await cache.get_or_render(
+        _cache_key(cache, html, opts), lambda: run_pdf_job(_html_to_pdf, html, opts)
+    )
+
+
+async def stream_document_pdf(
+    template: DocumentTemplate,
+    ctx: Any,
+    /,
+    cache: PdfCache,
+    options: PdfOptions | None = None,
+) -> AsyncIterator[bytes]:
+    """Render through ``cache`` and return the PDF as a byte stream.
+
+    A cache hit is a plain file stream from the storage backend — the
+    shape a download route wants::
+
+        body = await stream_document_pdf(render_invoice, ctx, cache)
+        return StreamingResponse(body, media_type="application/pdf")
+    """
+    opts = options or PdfOptions()
+    html = render_document_html(template, ctx)
+    return await cache.stream(
+        _cache_key(cache, html, opts), lambda: run_pdf_job(_html_to_pdf, html, opts)
+    )
+
+
+def _cache_key(cache: PdfCache, html: str, options: PdfOptions) -> str:
+    # The HTML already carries template, data and locale; the options and
+    # renderer version cover the rest of what shapes the output.
+    return cache.key_for(html, repr(options), f"weasyprint/{_weasyprint_version()}")
+
+
+@functools.cache
+def _weasyprint_version() -> str:
+    try:
+        return importlib.metadata.version("weasyprint")
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
+
+def _html_to_pdf(html: str, options: PdfOptions) -> bytes:
+    """Run WeasyPrint over a rendered document.
+
+    Module-level so the PDF process pool can pickle a reference to it.
     """
     try:
         import weasyprint  # noqa: F401  (presence check)
@@ -146,19 +227,16 @@ def render_document_pdf(
             "group already used by the compliance pipeline)."
         ) from exc
 
-    opts = options or PdfOptions()
-    html = render_document_html(template, ctx)
-
     import weasyprint  # safe — checked above
 
-    page_css = _build_pdf_stylesheet(opts)
+    page_css = _build_pdf_stylesheet(options)
     html_doc = weasyprint.HTML(
         string=html,
-        base_url=opts.base_url,
+        base_url=options.base_url,
     )
     result = html_doc.write_pdf(
         stylesheets=[page_css],
-        presentational_hints=opts.presentational_hints,
+        presentational_hints=options.presentational_hints,
     )
     # WeasyPrint returns `bytes | None`; `write_pdf` only returns None
     # when given a target= argument, which we don't pass.
@@ -0,0 +1,177 @@
+"""Content-addressed cache for rendered PDFs on a file-storage backend.
+
+A generated document is a pure function of its template, its data and the
+locale it is formatted for — and all three are already folded into the
+rendered HTML. `PdfCache` therefore keys each PDF on a SHA-256 of that HTML
+plus the renderer options, and keeps the bytes in the app's existing
+`StorageBackend` (local disk or S3) under ``pdf-cache/``:
+
+  - Repeat download of an unchanged document → a stream of the stored file,
+    no render at all
+  - Any change to the template, the record or the viewer's locale →
+    a different digest, so nothing is ever served stale and there is
+    nothing to invalidate
+  - A burst of identical requests for a cold document → one render; the
+    rest await it (single flight, per process)
+
+Since entries are never invalidated, they are expired instead: at most once
+per ``prune_interval`` a write kicks off a background `PdfCache.prune`,
+which deletes entries older than ``max_age`` and then the oldest ones until
+the cache fits in ``max_bytes``.
+
+Cache write failures are logged and the freshly rendered bytes are still
+returned — the cache is an optimisation, never a point of failure.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from dazzle.http.runtime.file_storage import StorageBackend
+
+logger = logging.getLogger(__name__)
+
+PDF_MEDIA_TYPE = "application/pdf"
+
+# Bump to orphan every cached PDF (e.g. after a renderer change that alters
+# output without altering the HTML).
+_CACHE_FORMAT = "1"
+
+
+class PdfCache:
+    """Render-once store for PDFs, addressed by the digest of their inputs.
+
+    Args:
+        storage: Backend holding the cached files
+        prefix: Key prefix inside the backend
+        max_age: Entries older than this are deleted (None: no age limit)
+        max_bytes: Size cap; the oldest entries beyond it are deleted
+            (None: no size limit)
+        prune_interval: Least seconds between two background prunes
+    """
+
+    def __init__(
+        self,
+        storage: StorageBackend,
+        *,
+        prefix: str = "pdf-cache",
+        max_age: timedelta | None = timedelta(days=30),
+        max_bytes: int | None = 1024 * 1024 * 1024,
+        prune_interval: float = 3600.0,
+    ) -> None:
+        self.storage = storage
+        self.prefix = prefix.strip("/")
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.prune_interval = prune_interval
+        self._inflight: dict[str, asyncio.Future[bytes]] = {}
+        self._last_prune = float("-inf")
+        self._prunes: set[asyncio.Task[int]] = set()
+
+    def key_for(self, *parts: str) -> str:
+        """Storage key for a PDF rendered from ``parts`` (HTML, options, …)."""
+        digest = hashlib.sha256()
+        for part in (_CACHE_FORMAT, *parts):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        hexdigest = digest.hexdigest()
+        return f"{self.prefix}/{hexdigest[:2]}/{hexdigest}.pdf"
+
+    async def get_or_render(self, key: str, render: Callable[[], Awaitable[bytes]]) -> bytes:
+        """Return the PDF at ``key``, rendering and storing it on a miss."""
+        rendered = await self._ensure(key, render)
+        if rendered is not None:
+            return rendered
+        return await self.storage.retrieve(key)
+
+    async def stream(
+        self, key: str, render: Callable[[], Awaitable[bytes]]
+    ) -> AsyncIterator[bytes]:
+        """Like `get_or_render`, but a hit is streamed straight from storage."""
+        rendered = await self._ensure(key, render)
+        if rendered is not None:
+            return _once(rendered)
+        return self.storage.stream(key)
+
+    async def _ensure(self, key: str, render: Callable[[], Awaitable[bytes]]) -> bytes | None:
+        """Make sure ``key`` is stored; return the bytes if this call rendered them."""
+        if await self._exists(key):
+            return None
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future: asyncio.Future[bytes] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            content = await render()
+            future.set_result(content)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # retrieved — no "never retrieved" warning without waiters
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        try:
+            await self.storage.put(key, content, PDF_MEDIA_TYPE)
+        except Exception:
+            logger.warning("PDF cache write failed for %s", key, exc_info=True)
+        else:
+            self._schedule_prune()
+        return content
+
+    async def prune(self) -> int:
+        """Delete expired entries, then the oldest beyond ``max_bytes``.
+
+        Returns:
+            Number of entries deleted
+        """
+        entries = [obj async for obj in self.storage.list_objects(self.prefix)]
+        entries.sort(key=lambda obj: obj.modified, reverse=True)
+        cutoff = datetime.now(UTC) - self.max_age if self.max_age is not None else None
+        total = 0
+        deleted = 0
+        for obj in entries:
+            total += obj.size
+            expired = cutoff is not None and obj.modified < cutoff
+            if expired or (self.max_bytes is not None and total > self.max_bytes):
+                deleted += int(await self.storage.delete(obj.key))
+        return deleted
+
+    def _schedule_prune(self) -> None:
+        now = time.monotonic()
+        if now - self._last_prune < self.prune_interval:
+            return
+        self._last_prune = now
+        task = asyncio.get_running_loop().create_task(self._prune_quietly())
+        self._prunes.add(task)
+        task.add_done_callback(self._prunes.discard)
+
+    async def _prune_quietly(self) -> int:
+        try:
+            return await self.prune()
+        except Exception:
+            logger.warning("PDF cache prune failed", exc_info=True)
+            return 0
+
+    async def _exists(self, key: str) -> bool:
+        try:
+            return await self.storage.exists(key)
+        except Exception:
+            logger.warning("PDF cache lookup failed for %s; rendering", key, exc_info=True)
+            return False
+
+
+async def _once(content: bytes) -> AsyncIterator[bytes]:
+    yield content
@@ -0,0 +1,94 @@
+"""Bounded process pool for CPU-heavy PDF rendering.
+
+WeasyPrint (`render_document_pdf`) and fpdf2 (`signing.service.generate_pdf`)
+are synchronous and hold the GIL for the whole render. Called from a route
+handler they stall the event loop — a burst of invoice downloads freezes
+every other request on the worker. `run_pdf_job` runs such a render in a
+long-lived process pool instead and awaits the result.
+
+The pool is created on first use and sized by ``DAZZLE_PDF_WORKERS``
+(default: ``min(4, cpu_count)``); the pool size is the concurrency bound,
+further jobs queue. ``DAZZLE_PDF_WORKERS=0`` — or a host where
+multiprocessing is unavailable — falls back to a worker thread, which still
+keeps the render off the event loop.
+
+Jobs must be picklable: a module-level function plus plain arguments.
+Anything request-scoped (display locale, tenant) has to be resolved by the
+caller and passed in, since context variables do not cross the process
+boundary.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+from dazzle.core.process_pools import pool_context, shutdown_cached_pool
+
+logger = logging.getLogger(__name__)
+
+PDF_WORKERS_ENV = "DAZZLE_PDF_WORKERS"
+DEFAULT_PDF_WORKERS = 4
+
+
+def resolve_pdf_workers() -> int:
+    """Pool size from ``DAZZLE_PDF_WORKERS``; 0 means render on a thread."""
+    default = min(DEFAULT_PDF_WORKERS, os.cpu_count() or 1)
+    raw = os.environ.get(PDF_WORKERS_ENV, "").strip()
+    if not raw:
+        return default
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning("Ignoring non-integer %s=%r", PDF_WORKERS_ENV, raw)
+        return default
+
+
+@functools.cache
+def _pdf_pool() -> ProcessPoolExecutor | None:
+    """Create the shared pool once; None when it cannot or should not exist.
+
+    `functools.cache` holds the singleton without a module-level `global`
+    (ADR-0005). `shutdown_pdf_pool` clears it.
+    """
+    workers = resolve_pdf_workers()
+    # Daemonic processes (e.g. multiprocessing workers) may not have children.
+    if workers == 0 or multiprocessing.current_process().daemon:
+        return None
+    try:
+        return ProcessPoolExecutor(max_workers=workers, mp_context=pool_context())
+    except (OSError, ValueError):
+        # No usable multiprocessing (sandboxed /dev/shm, frozen builds…).
+        logger.warning("PDF process pool unavailable, rendering on threads", exc_info=True)
+        return None
+
+
+async def run_pdf_job[T](fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run ``fn(*args, **kwargs)`` in the PDF pool and await its result.
+
+    Exceptions raised by ``fn`` propagate unchanged. A pool whose worker
+    died (OOM-killed mid-render) is discarded, so the next job gets a
+    fresh pool.
+    """
+    job = functools.partial(fn, *args, **kwargs)
+    pool = _pdf_pool()
+    if pool is None:
+        return await asyncio.to_thread(job)
+    try:
+        return await asyncio.get_running_loop().run_in_executor(pool, job)
+    except BrokenProcessPool:
+        logger.error("PDF worker process died; recreating the pool for the next job")
+        _pdf_pool.cache_clear()
+        raise
+
+
+def shutdown_pdf_pool(*, wait: bool = True) -> None:
+    """Stop the pool's workers (app shutdown, tests). Safe when never started."""
+    shutdown_cached_pool(_pdf_pool, wait=wait)
@@ -125,9 +125,23 @@ def _drive_snapshot_engine(cfg: Any, script: Any, *, baseline: bool = False) ->
     """
     from alembic.script import ScriptDirectory
 
-    from dazzle.db.migration_engine import generate_baseline_plan, generate_revision
+    from dazzle.db.migration_engine import (
+        generate_baseline_plan,
+        generate_closure_revision,
+        generate_index_revision,
+        generate_revision,
+    )
 
-    if baseline:
+    advice = cfg.attributes.get("dazzle_index_advice")
+    closures = cfg.attributes.get("dazzle_closure_specs")
+    if advice is not None:
+        # `db advise-indexes --write-migration`: index ops only, head snapshot
+        # carried through so the next `db revision` diffs as before.
+        plan = generate_index_revision(ScriptDirectory.from_config(cfg), advice)
+    elif closures is not None:
+        # `db closure --write-migration`: same, for closure tables + triggers.
+        plan = generate_closure_revision(ScriptDirectory.from_config(cfg), closures)
+    elif baseline:
         # Fresh-database baseline: diff against an empty prev and exclude
         # framework-owned tables (the framework baseline migration creates those).
         plan = generate_baseline_plan(table_filter=_framework_table_filter)
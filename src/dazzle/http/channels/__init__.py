@@ -5,7 +5,7 @@ This module provides:
 - Provider auto-detection for email, queue, and stream channels
 - Channel adapter base classes
 - Runtime channel resolution
-- Transactional outbox pattern
+- Transactional outbox pattern and its concurrent dispatcher
 - Template rendering
 
 Example:
@@ -23,6 +23,7 @@ from .detection import (
     ProviderDetector,
     ProviderStatus,
 )
+from .dispatcher import OutboxDispatcher
 from .manager import (
     ChannelManager,
     ChannelStatus,
@@ -62,6 +63,7 @@ __all__ = [
     "ChannelStatus",
     "create_channel_manager",
     # Outbox
+    "OutboxDispatcher",
     "OutboxMessage",
     "OutboxRepository",
     "OutboxStatus",
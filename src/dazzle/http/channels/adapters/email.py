@@ -8,6 +8,7 @@ Provides adapters for:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import smtplib
@@ -94,15 +95,16 @@ class MailpitAdapter(EmailAdapter):
             if email_data.get("html_body"):
                 msg.attach(MIMEText(email_data["html_body"], "html"))
 
-            # Send via SMTP
-            with smtplib.SMTP(self._smtp_host, self._smtp_port) as smtp:
-                recipients = [email_data["to"]]
-                if email_data.get("cc"):
-                    recipients.extend(email_data["cc"])
-                if email_data.get("bcc"):
-                    recipients.extend(email_data["bcc"])
+            recipients = [email_data["to"]]
+            if email_data.get("cc"):
+                recipients.extend(email_data["cc"])
+            if email_data.get("bcc"):
+                recipients.extend(email_data["bcc"])
 
-                smtp.sendmail(email_data["from"], recipients, msg.as_string())
+            # Blocking SMTP runs off the event loop so concurrent sends overlap.
+            await asyncio.to_thread(
+                self._smtp_send, email_data["from"], recipients, msg.as_string()
+            )
 
             latency = (time.monotonic() - start) * 1000
 
@@ -134,6 +136,10 @@ class MailpitAdapter(EmailAdapter):
                 error=str(e),
             )
 
+    def _smtp_send(self, sender: str, recipients: list[str], body: str) -> None:
+        with smtplib.SMTP(self._smtp_host, self._smtp_port) as smtp:
+            smtp.sendmail(sender, recipients, body)
+
     async def health_check(self) -> bool:
         """Check if Mailpit is accessible."""
         try:
@@ -0,0 +1,177 @@
+"""
+Concurrent outbox dispatcher for DAZZLE messaging.
+
+Drains the transactional outbox (see ``outbox.py``):
+
+1. Claims a large batch in one round trip (``OutboxRepository.claim_pending``,
+   ``FOR UPDATE SKIP LOCKED``), so any number of workers can dispatch
+   without contending for the same rows
+2. Sends the batch concurrently, bounded per channel and per provider so a
+   burst cannot overrun an SMTP relay or broker
+3. Records every success in one ``UPDATE``; failures go through
+   ``mark_failed`` for retry / dead-lettering
+4. Claims again immediately while a backlog remains; otherwise sleeps until
+   a ``NOTIFY`` from an insert (or an in-process ``wake()``) arrives, with
+   ``poll_interval`` as the floor for scheduled messages and lost notifies
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
+
+from .outbox import OUTBOX_NOTIFY_CHANNEL, OutboxMessage, OutboxRepository
+
+if TYPE_CHECKING:
+    from .adapters.base import BaseChannelAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 200
+# Concurrent sends allowed through one channel / one provider.
+DEFAULT_CHANNEL_CONCURRENCY = 8
+DEFAULT_PROVIDER_CONCURRENCY = 16
+
+
+class OutboxDispatcher:
+    """
+    Claims and sends outbox messages concurrently.
+
+    Args:
+        outbox: Outbox repository to claim from and record results in
+        adapters: Channel name → adapter (read at send time, so channels
+            resolved after construction are picked up)
+        batch_size: Messages claimed per round trip
+        channel_concurrency: Max in-flight sends per channel
+        provider_concurrency: Max in-flight sends per provider, across channels
+        poll_interval: Longest sleep between claims when no wake-up arrives
+        dsn: PostgreSQL URL for the ``LISTEN`` connection; None disables
+            cross-process wake-ups
+    """
+
+    def __init__(
+        self,
+        outbox: OutboxRepository,
+        adapters: Mapping[str, BaseChannelAdapter],
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        channel_concurrency: int = DEFAULT_CHANNEL_CONCURRENCY,
+        provider_concurrency: int = DEFAULT_PROVIDER_CONCURRENCY,
+        poll_interval: float = 5.0,
+        dsn: str | None = None,
+    ):
+        self.outbox = outbox
+        self.adapters = adapters
+        self.batch_size = batch_size
+        self.channel_concurrency = channel_concurrency
+        self.provider_concurrency = provider_concurrency
+        self.poll_interval = poll_interval
+        self.dsn = dsn
+
+        self._wake = asyncio.Event()
+        self._channel_limits: dict[str, asyncio.Semaphore] = {}
+        self._provider_limits: dict[str, asyncio.Semaphore] = {}
+
+    def wake(self) -> None:
+        """Start the next claim now instead of at the end of the sleep."""
+        self._wake.set()
+
+    async def dispatch_once(self, limit: int | None = None) -> int:
+        """
+        Claim and send one batch.
+
+        Args:
+            limit: Messages to claim (default ``batch_size``)
+
+        Returns:
+            Number of messages sent successfully
+        """
+        _claimed, sent = await self._dispatch_batch(limit or self.batch_size)
+        return sent
+
+    async def run(self) -> None:
+        """Dispatch until cancelled."""
+        listener = asyncio.create_task(self._listen(self.dsn)) if self.dsn else None
+        try:
+            while True:
+                # Cleared before claiming: a wake-up during the batch means
+                # new work may have missed this claim, so don't sleep on it.
+                self._wake.clear()
+                try:
+                    claimed, sent = await self._dispatch_batch(self.batch_size)
+                except Exception as e:
+                    logger.error("Outbox dispatcher error: %s", e)
+                    claimed = sent = 0
+                if sent:
+                    logger.debug("Dispatched %s outbox messages", sent)
+                if claimed < self.batch_size:
+                    await self._sleep()
+        finally:
+            if listener is not None:
+                listener.cancel()
+                await asyncio.gather(listener, return_exceptions=True)
+
+    async def _dispatch_batch(self, limit: int) -> tuple[int, int]:
+        """Claim up to ``limit`` messages and send them; return (claimed, sent)."""
+        claimed = await asyncio.to_thread(self.outbox.claim_pending, limit)
+        if not claimed:
+            return 0, 0
+        delivered = await asyncio.gather(*(self._deliver(msg) for msg in claimed))
+        sent_ids = [msg.id for msg, ok in zip(claimed, delivered, strict=True) if ok]
+        if sent_ids:
+            await asyncio.to_thread(self.outbox.mark_sent_many, sent_ids)
+        return len(claimed), len(sent_ids)
+
+    async def _deliver(self, msg: OutboxMessage) -> bool:
+        """Send one claimed message; record a failure and return False on error."""
+        adapter = self.adapters.get(msg.channel_name)
+        if adapter is None:
+            error = f"No adapter for channel '{msg.channel_name}'"
+        else:
+            channel_limit = _limit(self._channel_limits, msg.channel_name, self.channel_concurrency)
+            provider_limit = _limit(
+                self._provider_limits, adapter.provider_name, self.provider_concurrency
+            )
+            async with channel_limit, provider_limit:
+                try:
+                    result = await adapter.send(msg)
+                except Exception as e:
+                    logger.error("Error processing message %s: %s", msg.id, e)
+                    error = str(e)
+                else:
+                    if result.is_success:
+                        return True
+                    error = result.error or "Unknown error"
+
+        await asyncio.to_thread(self.outbox.mark_failed, msg.id, error)
+        return False
+
+    async def _sleep(self) -> None:
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=self.poll_interval)
+        except TimeoutError:
+            pass
+
+    async def _listen(self, dsn: str) -> None:
+        """Hold a ``LISTEN`` connection and wake the loop on every insert."""
+        try:
+            import psycopg
+
+            async with await psycopg.AsyncConnection.connect(dsn, autocommit=True) as conn:
+                await conn.execute(f"LISTEN {OUTBOX_NOTIFY_CHANNEL}")
+                async for _notify in conn.notifies():
+                    self._wake.set()
+        except asyncio.CancelledError:
+            pass
+        except Exception as exc:
+            # Best-effort: the poll interval still bounds delivery latency.
+            logger.warning("Outbox LISTEN ended (polling continues): %s", exc)
+
+
+def _limit(limits: dict[str, asyncio.Semaphore], key: str, size: int) -> asyncio.Semaphore:
+    semaphore = limits.get(key)
+    if semaphore is None:
+        semaphore = limits[key] = asyncio.Semaphore(size)
+    return semaphore
@@ -41,6 +41,7 @@ from .adapters import (
 )
 from .adapters.base import BaseChannelAdapter
 from .detection import ProviderStatus
+from .dispatcher import DEFAULT_BATCH_SIZE, OutboxDispatcher
 from .outbox import OutboxMessage, OutboxRepository, create_outbox_message
 from .resolver import ChannelResolution, ChannelResolver
 from .templates import render_template
@@ -120,6 +121,7 @@ class ChannelManager:
         self._adapters: dict[str, BaseChannelAdapter] = {}
         self._statuses: dict[str, ChannelStatus] = {}
         self._initialized = False
+        self._dispatcher: OutboxDispatcher | None = None
         self._processor_task: asyncio.Task[None] | None = None
 
     async def initialize(self) -> None:
@@ -136,6 +138,11 @@ class ChannelManager:
         # Initialize outbox if database is available
         if self.db_manager:
             self._outbox = OutboxRepository(self.db_manager)
+            self._dispatcher = OutboxDispatcher(
+                self._outbox,
+                self._adapters,
+                dsn=getattr(self.db_manager, "database_url", None),
+            )
             logger.info("Outbox repository initialized")
 
         # Resolve all channels
@@ -298,75 +305,43 @@ class ChannelManager:
         )
 
         self._outbox.create(msg)
+        if self._dispatcher:
+            self._dispatcher.wake()
         logger.info("Message queued in outbox: %s for %s:%s", msg.id, channel, operation)
         return msg
 
-    async def process_outbox(self, batch_size: int = 10) -> int:
+    async def process_outbox(self, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
         """
-        Process pending outbox messages.
+        Claim and send one batch of pending outbox messages.
 
         Args:
-            batch_size: Number of messages to process per batch
+            batch_size: Maximum messages to claim
 
         Returns:
-            Number of messages processed
+            Number of messages sent
         """
-        if not self._outbox:
+        if not self._dispatcher:
             return 0
-
-        pending = self._outbox.get_pending(limit=batch_size)
-        processed = 0
-
-        for msg in pending:
-            # Try to claim the message
-            if not self._outbox.mark_processing(msg.id):
-                continue
-
-            adapter = self._adapters.get(msg.channel_name)
-            if not adapter:
-                self._outbox.mark_failed(msg.id, f"No adapter for channel '{msg.channel_name}'")
-                continue
-
-            try:
-                result = await adapter.send(msg)
-
-                if result.is_success:
-                    self._outbox.mark_sent(msg.id)
-                    processed += 1
-                else:
-                    self._outbox.mark_failed(msg.id, result.error or "Unknown error")
-
-            except Exception as e:
-                logger.error("Error processing message %s: %s", msg.id, e)
-                self._outbox.mark_failed(msg.id, str(e))
-
-        return processed
+        return await self._dispatcher.dispatch_once(batch_size)
 
     async def start_processor(self, interval: float = 5.0) -> None:
         """
-        Start background outbox processor.
+        Start background outbox dispatching.
+
+        The dispatcher wakes on every insert (``NOTIFY`` across processes,
+        directly for sends from this process) and keeps claiming while a
+        backlog remains; ``interval`` only bounds how long it sleeps
+        without a wake-up (scheduled messages, missed notifications).
 
         Args:
-            interval: Processing interval in seconds
+            interval: Longest sleep between claims in seconds
         """
-        if self._processor_task:
+        if self._processor_task or not self._dispatcher:
             return
 
-        async def processor_loop() -> None:
-            while True:
-                try:
-                    processed = await self.process_outbox()
-                    if processed > 0:
-                        logger.debug("Processed %s outbox messages", processed)
-                except asyncio.CancelledError:
-                    break
-                except Exception as e:
-                    logger.error("Outbox processor error: %s", e)
-
-                await asyncio.sleep(interval)
-
-        self._processor_task = asyncio.create_task(processor_loop())
-        logger.info("Outbox processor started (interval: %ss)", interval)
+        self._dispatcher.poll_interval = interval
+        self._processor_task = asyncio.create_task(self._dispatcher.run())
+        logger.info("Outbox dispatcher started (poll floor: %ss)", interval)
 
     def get_channel_status(self, channel: str) -> ChannelStatus | None:
         """Get status of a specific channel."""
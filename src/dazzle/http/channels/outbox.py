@@ -19,13 +19,20 @@ from datetime import UTC, datetime
 from enum import StrEnum
 from typing import TYPE_CHECKING, Any
 
-from dazzle.core.environment import skip_boot_schema_ddl
+from dazzle.core.environment import run_boot_schema_ddl
 
 if TYPE_CHECKING:
     from dazzle.http.runtime.repository import DatabaseManager
 
 logger = logging.getLogger(__name__)
 
+# NOTIFY channel raised on every insert so dispatchers wake without polling.
+OUTBOX_NOTIFY_CHANNEL = "dazzle_outbox"
+
+# A message left in 'processing' this long (its worker died mid-send) is
+# claimable again.
+CLAIM_LEASE_SECONDS = 300
+
 
 class OutboxStatus(StrEnum):
     """Status of an outbox message."""
@@ -127,6 +134,18 @@ class OutboxMessage:
         )
 
 
+_OUTBOX_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx__dazzle_outbox_status ON _dazzle_outbox(status)",
+    "CREATE INDEX IF NOT EXISTS idx__dazzle_outbox_channel ON _dazzle_outbox(channel_name)",
+    "CREATE INDEX IF NOT EXISTS idx__dazzle_outbox_scheduled ON _dazzle_outbox(scheduled_for)",
+    "CREATE INDEX IF NOT EXISTS idx__dazzle_outbox_recipient "
+    "ON _dazzle_outbox(recipient, channel_name)",
+    # Claim scans walk claimable rows oldest-first; keep sent history out of it.
+    "CREATE INDEX IF NOT EXISTS idx__dazzle_outbox_claim ON _dazzle_outbox(created_at) "
+    "WHERE status IN ('pending', 'processing')",
+)
+
+
 def ensure_outbox_table(cur: Any) -> None:
     """Create the ``_dazzle_outbox`` table and its indexes (idempotent).
 
@@ -156,17 +175,8 @@ def ensure_outbox_table(cur: Any) -> None:
             metadata TEXT
         )
     """)
-    cur.execute("CREATE INDEX IF NOT EXISTS idx__dazzle_outbox_status ON _dazzle_outbox(status)")
-    cur.execute(
-        "CREATE INDEX IF NOT EXISTS idx__dazzle_outbox_channel ON _dazzle_outbox(channel_name)"
-    )
-    cur.execute(
-        "CREATE INDEX IF NOT EXISTS idx__dazzle_outbox_scheduled ON _dazzle_outbox(scheduled_for)"
-    )
-    cur.execute(
-        "CREATE INDEX IF NOT EXISTS idx__dazzle_outbox_recipient "
-        "ON _dazzle_outbox(recipient, channel_name)"
-    )
+    for ddl in _OUTBOX_INDEXES:
+        cur.execute(ddl)
 
 
 class OutboxRepository:
@@ -188,10 +198,7 @@ class OutboxRepository:
         (``ensure_framework_schema``) and the runtime may serve as a non-owner role
         under split-ownership RLS, where ``CREATE INDEX`` raises InsufficientPrivilege.
         """
-        if skip_boot_schema_ddl():
-            return
-        with self.db.connection() as conn:
-            ensure_outbox_table(conn)
+        run_boot_schema_ddl(self.db, ensure_outbox_table)
 
     def create(self, message: OutboxMessage, conn: Any | None = None) -> OutboxMessage:
         """Create a new outbox message.
@@ -208,12 +215,17 @@ class OutboxRepository:
         ph = self.db.placeholder
         placeholders = ", ".join(ph for _ in data)
         sql = f"INSERT INTO {self.TABLE_NAME} ({columns}) VALUES ({placeholders})"
+        # Delivered on commit, so dispatchers never wake for a rolled-back insert.
+        notify_sql = f"SELECT pg_notify({ph}, {ph})"
+        notify_params = (OUTBOX_NOTIFY_CHANNEL, message.channel_name)
 
         if conn:
             conn.execute(sql, list(data.values()))
+            conn.execute(notify_sql, notify_params)
         else:
             with self.db.connection() as c:
                 c.execute(sql, list(data.values()))
+                c.execute(notify_sql, notify_params)
 
         logger.debug(
             "Created outbox message %s for %s:%s",
@@ -286,6 +298,63 @@ class OutboxRepository:
             cursor = conn.execute(sql, (datetime.now(UTC).isoformat(), message_id))
             return bool(cursor.rowcount and cursor.rowcount > 0)
 
+    def claim_pending(
+        self,
+        limit: int = 100,
+        *,
+        channel_name: str | None = None,
+        lease_seconds: int = CLAIM_LEASE_SECONDS,
+    ) -> list[OutboxMessage]:
+        """Claim a batch of messages ready to be sent.
+
+        One ``UPDATE`` over a ``FOR UPDATE SKIP LOCKED`` subselect moves up to
+        ``limit`` rows to ``processing``: concurrent dispatchers skip rows
+        another worker is claiming instead of contending for them. Messages
+        stuck in ``processing`` for longer than ``lease_seconds`` are
+        reclaimed (at-least-once delivery).
+
+        Args:
+            limit: Maximum messages to claim
+            channel_name: Optional filter by channel
+            lease_seconds: Age after which a ``processing`` message is reclaimable
+
+        Returns:
+            Claimed messages, oldest first
+        """
+        from datetime import timedelta
+
+        ph = self.db.placeholder
+        now = datetime.now(UTC)
+        stale = (now - timedelta(seconds=lease_seconds)).isoformat()
+        channel_filter = f" AND channel_name = {ph}" if channel_name else ""
+        sql = f"""
+            UPDATE {self.TABLE_NAME} AS o
+            SET status = 'processing', updated_at = {ph}
+            FROM (
+                SELECT id FROM {self.TABLE_NAME}
+                WHERE (
+                    (status = 'pending' AND (scheduled_for IS NULL OR scheduled_for <= {ph}))
+                    OR (status = 'processing' AND updated_at < {ph})
+                ){channel_filter}
+                ORDER BY created_at ASC
+                LIMIT {ph}
+                FOR UPDATE SKIP LOCKED
+            ) AS due
+            WHERE o.id = due.id
+            RETURNING o.*
+        """
+        params: list[Any] = [now.isoformat(), now.isoformat(), stale]
+        if channel_name:
+            params.append(channel_name)
+        params.append(limit)
+
+        with self.db.connection() as conn:
+            cursor = conn.execute(sql, params)
+            claimed = [OutboxMessage.from_dict(dict(row)) for row in cursor.fetchall()]
+        # RETURNING does not preserve the subselect's order.
+        claimed.sort(key=lambda m: m.created_at)
+        return claimed
+
     def mark_sent(self, message_id: str) -> None:
         """Mark a message as successfully sent."""
         ph = self.db.placeholder
@@ -299,6 +368,21 @@ class OutboxRepository:
 
         logger.info("Outbox message %s sent successfully", message_id)
 
+    def mark_sent_many(self, message_ids: list[str]) -> None:
+        """Mark a batch of messages as successfully sent in one statement."""
+        if not message_ids:
+            return
+        ph = self.db.placeholder
+        sql = f"""
+            UPDATE {self.TABLE_NAME}
+            SET status = 'sent', updated_at = {ph}, attempts = attempts + 1
+            WHERE id = ANY({ph})
+        """
+        with self.db.connection() as conn:
+            conn.execute(sql, (datetime.now(UTC).isoformat(), list(message_ids)))
+
+        logger.info("%s outbox messages sent successfully", len(message_ids))
+
     def mark_failed(self, message_id: str, error: str) -> None:
         """Mark a message as failed with retry logic.
 
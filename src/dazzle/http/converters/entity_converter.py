@@ -97,6 +97,18 @@ def _map_field_type(dazzle_type: ir.FieldType) -> FieldType:
             kind="ref",
             ref_entity=dazzle_type.ref_entity,
         )
+    elif kind in (ir.FieldTypeKind.DESCENDANTS_OF, ir.FieldTypeKind.ANCESTORS_OF):
+        # Traversal (#1227): still a string column, but the repository needs
+        # the direction and the FK it walks to resolve the field on read.
+        return FieldType(
+            kind="scalar",
+            scalar_type=ScalarType.STR,
+            traversal=(
+                "descendants_of" if kind == ir.FieldTypeKind.DESCENDANTS_OF else "ancestors_of"
+            ),
+            via_field=dazzle_type.via_field,
+            via_entity=dazzle_type.via_entity,
+        )
     elif kind in scalar_map:
         # Scalar type
         return FieldType(
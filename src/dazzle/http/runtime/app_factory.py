@@ -12,7 +12,6 @@ from typing import TYPE_CHECKING, Any
 from dazzle.core.environment import pin_production_env
 from dazzle.core.ir import AppSpec
 from dazzle.core.manifest import resolve_database_url
-from dazzle.core.renderer_registry import known_renderer_names
 from dazzle.http.runtime.server import DazzleBackendApp, ServerConfig
 from dazzle.http.runtime.tenant.cache import TenantCache
 from dazzle.log_setup import ensure_dazzle_logging_configured
@@ -1197,11 +1196,10 @@ def create_app_factory(
 
     # Import Dazzle core modules (deferred to avoid circular imports)
     try:
+        from dazzle.core.appspec_loader import build_project_appspec
         from dazzle.core.errors import DazzleError, ParseError
         from dazzle.core.fileset import discover_dsl_files
-        from dazzle.core.linker import build_appspec
         from dazzle.core.manifest import load_manifest
-        from dazzle.core.parser import parse_modules
         from dazzle.core.sitespec_loader import load_sitespec_with_copy, sitespec_exists
     except ImportError as e:
         raise RuntimeError(
@@ -1248,20 +1246,17 @@ def create_app_factory(
     # DSL. If both are unset, build_server_config falls through to "basic".
     security_profile_override = os.environ.get("DAZZLE_SECURITY_PROFILE") or None
 
-    # Parse DSL and build spec. Pass `known_renderers=` so the linker
+    # Parse DSL and build spec. `build_project_appspec` passes
+    # `known_renderers=` so the linker
     # rejects `render: <unknown>` clauses against the framework defaults
     # PLUS any project-declared extras (`[renderers] extra` in
     # dazzle.toml) — see `dazzle.core.renderer_registry.known_renderer_names`
-    # (#1116).
+    # (#1116). Unchanged projects are served from the on-disk parse
+    # cache, so each uvicorn worker skips lex/parse/link entirely.
 
     try:
         dsl_files = discover_dsl_files(project_root, manifest)
-        modules = parse_modules(dsl_files)
-        appspec = build_appspec(
-            modules,
-            manifest.project_root,
-            known_renderers=known_renderer_names(manifest),
-        )
+        appspec = build_project_appspec(project_root, manifest, dsl_files)
     except (ParseError, DazzleError) as e:
         raise RuntimeError(f"Failed to parse DSL: {e}")
 
@@ -0,0 +1,237 @@
+"""SQL pushdown for computed fields.
+
+``computed_evaluator`` computes a field such as ``sum(OrderItem.amount)``
+in Python, over related rows that must already have been loaded into
+every record — so a list page either pulls every child row or shows an
+empty aggregate, and the database can neither sort nor filter by it.
+
+This module compiles the same ``ComputedExprSpec`` tree to a SQL
+expression over the entity's own table. Collection aggregates become a
+correlated subquery on the child table::
+
+    (SELECT SUM("_r"."amount") FROM "OrderItem" AS "_r"
+     WHERE "_r"."order_id" = "Order"."id")
+
+``QueryBuilder.computed_columns`` selects each compiled expression under
+the field's name and uses it in ``WHERE`` / ``ORDER BY`` when a filter or
+sort names the field.
+
+Translation mirrors the Python evaluator's semantics — ``NULL`` wherever
+it returns ``None`` (empty or all-null aggregates, a null operand, a
+division by zero), ``COUNT(*)`` over every child row. Anything it cannot
+translate faithfully compiles to ``None`` and stays on the Python
+evaluator:
+
+- field references to non-numeric or unknown columns, and multi-segment
+  references;
+- ``days_until`` / ``days_since`` over anything but a ``date`` column
+  (datetimes are bucketed in the tenant's timezone in Python);
+- aggregates whose child entity is unknown, or has zero or several
+  ``ref`` fields back to the parent, or whose column is not numeric.
+
+The SQL carries no bind parameters — identifiers are quoted, literals
+are numbers from the spec and "today" is a ``DATE`` literal — so the
+expressions can be spliced into the select list ahead of the ``WHERE``
+parameters.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+
+from dazzle.http.runtime.query_builder import quote_identifier
+from dazzle.http.specs.entity import (
+    AggregateFunctionKind,
+    ArithmeticOperatorKind,
+    ComputedExprSpec,
+    ComputedFieldSpec,
+    EntitySpec,
+    ScalarType,
+)
+from dazzle.i18n.display_locale import calendar_today
+
+if TYPE_CHECKING:
+    from dazzle.http.runtime.relation_loader import RelationRegistry
+
+# Alias of the child table inside an aggregate subquery — distinct from
+# the parent table name, so self-referential aggregates still correlate.
+_CHILD_ALIAS = '"_r"'
+
+_NUMERIC_TYPES: frozenset[ScalarType] = frozenset(
+    {ScalarType.INT, ScalarType.DECIMAL, ScalarType.FLOAT}
+)
+
+_COLUMN_AGGREGATES: dict[AggregateFunctionKind, str] = {
+    AggregateFunctionKind.SUM: "SUM",
+    AggregateFunctionKind.AVG: "AVG",
+    AggregateFunctionKind.MIN: "MIN",
+    AggregateFunctionKind.MAX: "MAX",
+}
+
+_OPERATORS: dict[ArithmeticOperatorKind, str] = {
+    ArithmeticOperatorKind.ADD: "+",
+    ArithmeticOperatorKind.SUBTRACT: "-",
+    ArithmeticOperatorKind.MULTIPLY: "*",
+    ArithmeticOperatorKind.DIVIDE: "/",
+}
+
+
+@dataclass(frozen=True)
+class ComputedSqlContext:
+    """What an expression is compiled against.
+
+    Attributes:
+        entity: The entity owning the computed fields.
+        entities: Every entity by name — aggregate children are looked up here.
+        registry: Resolves relation names (``count(items)``) to entities.
+        today: "Today" for ``days_until`` / ``days_since``; defaults to
+            the tenant-local calendar date, as the Python evaluator uses.
+    """
+
+    entity: EntitySpec
+    entities: Mapping[str, EntitySpec] = field(default_factory=dict)
+    registry: RelationRegistry | None = None
+    today: date | None = None
+
+    @property
+    def table(self) -> str:
+        return quote_identifier(self.entity.name)
+
+
+def compile_computed_fields(
+    computed_fields: list[ComputedFieldSpec], ctx: ComputedSqlContext
+) -> dict[str, str]:
+    """SQL for each computed field that can be pushed down, by field name."""
+    compiled: dict[str, str] = {}
+    for cf in computed_fields:
+        sql = compile_computed_expr(cf.expression, ctx)
+        if sql is not None:
+            compiled[cf.name] = sql
+    return compiled
+
+
+def compile_computed_expr(expr: ComputedExprSpec, ctx: ComputedSqlContext) -> str | None:
+    """Compile one expression to SQL, or ``None`` when it needs the Python evaluator."""
+    if expr.kind == "literal":
+        return _compile_literal(expr.value)
+    if expr.kind == "field_ref":
+        return _compile_field_ref(expr.path or [], ctx)
+    if expr.kind == "aggregate":
+        return _compile_aggregate(expr, ctx)
+    if expr.kind == "arithmetic":
+        return _compile_arithmetic(expr, ctx)
+    return None
+
+
+def coerce_computed_value(expr: ComputedExprSpec, value: Any) -> Any:
+    """Match a pushed-down value to the type the Python evaluator returns.
+
+    The evaluator does aggregate and arithmetic math in ``float``; Postgres
+    returns ``NUMERIC`` (``Decimal``) for ``AVG`` and decimal sums.
+    """
+    if isinstance(value, Decimal) and expr.kind != "field_ref":
+        return float(value)
+    return value
+
+
+def _compile_literal(value: int | float | None) -> str | None:
+    if value is None:
+        return "NULL"
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return repr(value)
+
+
+def _numeric_column(entity: EntitySpec, name: str) -> bool:
+    for f in entity.fields:
+        if f.name == name:
+            return f.type.kind == "scalar" and f.type.scalar_type in _NUMERIC_TYPES
+    return False
+
+
+def _compile_field_ref(path: list[str], ctx: ComputedSqlContext) -> str | None:
+    if len(path) != 1 or not _numeric_column(ctx.entity, path[0]):
+        return None
+    return f"{ctx.table}.{quote_identifier(path[0])}"
+
+
+def _compile_date_function(
+    func: AggregateFunctionKind, path: list[str], ctx: ComputedSqlContext
+) -> str | None:
+    if len(path) != 1:
+        return None
+    spec = next((f for f in ctx.entity.fields if f.name == path[0]), None)
+    if spec is None or spec.type.scalar_type != ScalarType.DATE:
+        return None
+    column = f"CAST({ctx.table}.{quote_identifier(path[0])} AS DATE)"
+    today = f"DATE '{(ctx.today or calendar_today()).isoformat()}'"
+    if func == AggregateFunctionKind.DAYS_UNTIL:
+        return f"({column} - {today})"
+    return f"({today} - {column})"
+
+
+def _child_of(name: str, ctx: ComputedSqlContext) -> tuple[EntitySpec, str] | None:
+    """The child entity an aggregate ranges over, and its FK column to the parent.
+
+    ``name`` is the child entity (``count(OrderItem)``) or a to-many
+    relation on the parent (``count(items)``).
+    """
+    child = ctx.entities.get(name)
+    if child is None and ctx.registry is not None:
+        relation = ctx.registry.get_relation(ctx.entity.name, name)
+        if relation is not None and relation.is_to_many:
+            child = ctx.entities.get(relation.to_entity)
+    if child is None:
+        return None
+    back_refs = [
+        f.name
+        for f in child.fields
+        if f.type.kind == "ref" and f.type.ref_entity == ctx.entity.name
+    ]
+    if len(back_refs) != 1:
+        return None
+    return child, back_refs[0]
+
+
+def _compile_aggregate(expr: ComputedExprSpec, ctx: ComputedSqlContext) -> str | None:
+    if expr.field is None or not expr.field.path or expr.function is None:
+        return None
+    func, path = expr.function, expr.field.path
+    if func in (AggregateFunctionKind.DAYS_UNTIL, AggregateFunctionKind.DAYS_SINCE):
+        return _compile_date_function(func, path, ctx)
+
+    resolved = _child_of(path[0], ctx)
+    if resolved is None:
+        return None
+    child, fk = resolved
+    if func == AggregateFunctionKind.COUNT:
+        measure = "COUNT(*)"
+    elif func in _COLUMN_AGGREGATES and len(path) > 1 and _numeric_column(child, path[-1]):
+        measure = f"{_COLUMN_AGGREGATES[func]}({_CHILD_ALIAS}.{quote_identifier(path[-1])})"
+    else:
+        return None
+    return (
+        f"(SELECT {measure} FROM {quote_identifier(child.name)} AS {_CHILD_ALIAS} "
+        f'WHERE {_CHILD_ALIAS}.{quote_identifier(fk)} = {ctx.table}."id")'
+    )
+
+
+def _compile_arithmetic(expr: ComputedExprSpec, ctx: ComputedSqlContext) -> str | None:
+    op = _OPERATORS.get(expr.operator) if expr.operator is not None else None
+    if expr.left is None or expr.right is None or op is None:
+        return None
+    left = compile_computed_expr(expr.left, ctx)
+    right = compile_computed_expr(expr.right, ctx)
+    if left is None or right is None:
+        return None
+    # The evaluator does the math in float and returns None on x / 0.
+    left = f"CAST({left} AS DOUBLE PRECISION)"
+    right = f"CAST({right} AS DOUBLE PRECISION)"
+    if expr.operator == ArithmeticOperatorKind.DIVIDE:
+        right = f"NULLIF({right}, 0)"
+    return f"({left} {op} {right})"
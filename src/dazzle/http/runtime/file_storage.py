@@ -7,6 +7,7 @@ Metadata is stored in PostgreSQL via psycopg.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import re
@@ -56,6 +57,16 @@ class FileMetadata(BaseModel):
     thumbnail_url: str | None = Field(default=None, description="Thumbnail URL")
 
 
+class StoredObject(BaseModel):
+    """One object listed by `StorageBackend.list_objects`."""
+
+    model_config = ConfigDict(frozen=True)
+
+    key: str = Field(description="Storage path/key")
+    size: int = Field(description="Object size in bytes")
+    modified: datetime = Field(description="Last write time (UTC)")
+
+
 # =============================================================================
 # Storage Backend Protocol
 # =============================================================================
@@ -157,6 +168,50 @@ class StorageBackend(ABC):
         """
         pass
 
+    @abstractmethod
+    async def put(self, storage_key: str, content: bytes, content_type: str) -> None:
+        """
+        Write content at a caller-chosen key, replacing any existing object.
+
+        Unlike ``store`` (which mints a unique key per upload) this is for
+        derived artifacts addressed by their content hash, e.g. the PDF
+        cache.
+
+        Args:
+            storage_key: Storage path/key (already sanitised by the caller)
+            content: Object bytes
+            content_type: MIME type
+        """
+        pass
+
+    @abstractmethod
+    async def exists(self, storage_key: str) -> bool:
+        """
+        Whether an object is stored at ``storage_key``.
+
+        Args:
+            storage_key: Storage path/key
+
+        Returns:
+            True if the object exists
+        """
+        pass
+
+    @abstractmethod
+    def list_objects(self, prefix: str) -> AsyncIterator[StoredObject]:
+        """
+        List the objects stored under ``prefix/``, in no particular order.
+
+        Used to expire derived artifacts written with ``put``.
+
+        Args:
+            prefix: Key prefix (a "directory", without trailing slash)
+
+        Yields:
+            One `StoredObject` per object
+        """
+        ...
+
 
 # =============================================================================
 # Local Storage Backend
@@ -290,6 +345,47 @@ class LocalStorageBackend(StorageBackend):
         safe_key = sanitize_storage_relpath(storage_key)
         return f"{self.base_url}/{safe_key}"
 
+    async def put(self, storage_key: str, content: bytes, content_type: str) -> None:
+        """Write to a fixed key; atomic rename so readers never see a partial file."""
+        await asyncio.to_thread(self._write_atomic, self._full_path(storage_key), content)
+
+    @staticmethod
+    def _write_atomic(full_path: Path, content: bytes) -> None:
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = full_path.with_name(f".{full_path.name}.{uuid4().hex}.tmp")
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, full_path)
+
+    async def exists(self, storage_key: str) -> bool:
+        """Check the local filesystem for the key."""
+        try:
+            full_path = self._full_path(storage_key)
+        except ValueError:
+            return False
+        return await asyncio.to_thread(full_path.is_file)
+
+    async def list_objects(self, prefix: str) -> AsyncIterator[StoredObject]:
+        """Walk the directory for ``prefix`` (off the event loop)."""
+        for obj in await asyncio.to_thread(self._scan, self._full_path(prefix)):
+            yield obj
+
+    def _scan(self, root: Path) -> list[StoredObject]:
+        found: list[StoredObject] = []
+        for path in root.rglob("*") if root.is_dir() else ():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # deleted mid-walk
+                continue
+            if path.is_file():
+                found.append(
+                    StoredObject(
+                        key=path.relative_to(self.base_path).as_posix(),
+                        size=stat.st_size,
+                        modified=datetime.fromtimestamp(stat.st_mtime, UTC),
+                    )
+                )
+        return found
+
 
 # =============================================================================
 # S3 Storage Backend
@@ -464,6 +560,56 @@ class S3StorageBackend(StorageBackend):
 
         return f"https://{self.bucket}.s3.{self.region}.amazonaws.com/{storage_key}"
 
+    async def put(self, storage_key: str, content: bytes, content_type: str) -> None:
+        """Write to a fixed key in S3."""
+        try:
+            import aioboto3
+        except ImportError:
+            raise ImportError("aioboto3 is required for S3 storage")
+
+        session = aioboto3.Session()
+        async with session.client("s3", **self._get_client_config()) as s3:
+            await s3.put_object(
+                Bucket=self.bucket,
+                Key=storage_key,
+                Body=content,
+                ContentType=content_type,
+            )
+
+    async def exists(self, storage_key: str) -> bool:
+        """HEAD the key in S3; a 404 means absent, other errors propagate."""
+        try:
+            import aioboto3
+            from botocore.exceptions import ClientError
+        except ImportError:
+            raise ImportError("aioboto3 is required for S3 storage")
+
+        session = aioboto3.Session()
+        async with session.client("s3", **self._get_client_config()) as s3:
+            try:
+                await s3.head_object(Bucket=self.bucket, Key=storage_key)
+            except ClientError as exc:
+                if exc.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                    return False
+                raise
+            return True
+
+    async def list_objects(self, prefix: str) -> AsyncIterator[StoredObject]:
+        """Page through ``ListObjectsV2`` for ``prefix/``."""
+        try:
+            import aioboto3
+        except ImportError:
+            raise ImportError("aioboto3 is required for S3 storage")
+
+        session = aioboto3.Session()
+        async with session.client("s3", **self._get_client_config()) as s3:
+            paginator = s3.get_paginator("list_objects_v2")
+            async for page in paginator.paginate(Bucket=self.bucket, Prefix=f"{prefix}/"):
+                for item in page.get("Contents", []):
+                    yield StoredObject(
+                        key=item["Key"], size=item["Size"], modified=item["LastModified"]
+                    )
+
     async def get_presigned_url(
         self,
         storage_key: str,
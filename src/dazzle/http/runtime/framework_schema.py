@@ -40,6 +40,7 @@ from typing import Any
 # DDL constants re-used from their canonical home modules (no duplication).
 # All imports are at module top — none of these create circular imports.
 from dazzle.core.coordination.claim import queue_columns_ddl
+from dazzle.core.coordination.schedule import ensure_schedule_fires_table
 from dazzle.http.channels.outbox import ensure_outbox_table
 from dazzle.http.events.inbox import CREATE_INBOX_INDEXES, CREATE_INBOX_TABLE
 from dazzle.http.events.outbox import CREATE_OUTBOX_INDEXES, CREATE_OUTBOX_TABLE
@@ -48,7 +49,9 @@ from dazzle.http.runtime.auth.store import ensure_auth_core_tables
 from dazzle.http.runtime.device_registry import ensure_device_tables
 from dazzle.http.runtime.file_storage import ensure_file_storage_tables
 from dazzle.http.runtime.grant_store import ensure_grant_tables
+from dazzle.http.runtime.mapping_redelivery import ensure_mapping_redelivery_table
 from dazzle.http.runtime.otp_store import ensure_otp_tables
+from dazzle.http.runtime.postgres_job_queue import ensure_job_queue_table
 from dazzle.http.runtime.recovery_codes import ensure_recovery_code_tables
 from dazzle.http.runtime.token_store import ensure_refresh_token_tables
 from dazzle.http.runtime.triggers import build_assert_subtype_kind_function
@@ -169,6 +172,16 @@ def _ensure_framework_schema_ddl(cur: Any) -> None:  # cur: psycopg.Cursor
         ON process_tasks (deliver_at)
         WHERE status IN ('pending', 'claimed')
     """)
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS ix_process_tasks_open_due
+        ON process_tasks (due_at)
+        WHERE status IN ('pending', 'assigned', 'escalated')
+    """)
+
+    # ── SCHEDULE FIRES (schedule_fires) ──────────────────────────────────
+    # Exactly-once ledger for the cluster scheduler. Delegated to
+    # ensure_schedule_fires_table (core/coordination/schedule.py).
+    ensure_schedule_fires_table(cur)
 
     # ── AUDIT TABLES ──────────────────────────────────────────────────────
     # Delegated to ensure_audit_log_table (audit_log.py) — single
@@ -241,6 +254,18 @@ def _ensure_framework_schema_ddl(cur: Any) -> None:  # cur: psycopg.Cursor
     # single ensure_outbox_table DDL (channels/outbox.py), like the other tables.
     ensure_outbox_table(cur)
 
+    # ── MAPPING REDELIVERY (_dazzle_mapping_redelivery) ──────────────────
+    # Integration-mapping retries parked for delayed re-delivery.
+    # Orchestrator-only (RedeliveryRepository runs no DDL) — single DDL source
+    # in mapping_redelivery.py.
+    ensure_mapping_redelivery_table(cur)
+
+    # ── JOB QUEUE (_dazzle_job_queue) ────────────────────────────────────
+    # Durable background-job queue (PostgresJobQueue). Boot path
+    # (PostgresJobQueue._ensure_table) self-gates; single DDL source in
+    # postgres_job_queue.py.
+    ensure_job_queue_table(cur)
+
     # ── USAGE SIGNAL (_dazzle_usage_events) ──────────────────────────────
     # ADR-0050 Option A: first-party usage-frequency capture feeding UX inference.
     # Orchestrator-only (no request-path boot entry) — single DDL source in
@@ -16,7 +16,7 @@ followed by ``render_snapshot_literal``.
     This is SEPARATE from ``project_schema``'s lossy ``list[str]`` format used
     by the #1431 app-entity migration-diffing path.  Do not conflate the two.
 
-**In-scope tables** (31): every entry in the FRAMEWORK_SCHEMA_SNAPSHOT dict
+**In-scope tables** (35): every entry in the FRAMEWORK_SCHEMA_SNAPSHOT dict
 key set (see the global-constraints list in the migration-baseline plan).
 
 **Excluded (not in this snapshot):** ops-database tables, event-bus
@@ -196,6 +196,62 @@ FRAMEWORK_SCHEMA_SNAPSHOT = {
         },
         "uniques": [],
     },
+    "_dazzle_job_queue": {
+        "columns": {
+            "attempt": {"default": "1", "nullable": False, "pk": False, "type": "integer"},
+            "created_at": {
+                "default": "now()",
+                "nullable": False,
+                "pk": False,
+                "type": "timestamptz",
+            },
+            "dead_at": {"default": None, "nullable": True, "pk": False, "type": "timestamptz"},
+            "deliveries": {"default": "0", "nullable": False, "pk": False, "type": "integer"},
+            "id": {"default": None, "nullable": False, "pk": True, "type": "text"},
+            "job_name": {"default": None, "nullable": False, "pk": False, "type": "text"},
+            "last_error": {"default": None, "nullable": True, "pk": False, "type": "text"},
+            "payload": {"default": None, "nullable": False, "pk": False, "type": "text"},
+            "priority": {"default": "0", "nullable": False, "pk": False, "type": "integer"},
+            "run_at": {"default": None, "nullable": False, "pk": False, "type": "timestamptz"},
+        },
+        "fks": {},
+        "indexes": {
+            "idx__dazzle_job_queue_claim": {
+                "columns": ["priority", "run_at"],
+                "predicate": "(dead_at IS NULL)",
+                "unique": False,
+            },
+        },
+        "uniques": [],
+    },
+    "_dazzle_mapping_redelivery": {
+        "columns": {
+            "attempt": {"default": None, "nullable": False, "pk": False, "type": "integer"},
+            "created_at": {
+                "default": "now()",
+                "nullable": False,
+                "pk": False,
+                "type": "timestamptz",
+            },
+            "data": {"default": None, "nullable": False, "pk": False, "type": "text"},
+            "due_at": {"default": None, "nullable": False, "pk": False, "type": "timestamptz"},
+            "entity_id": {"default": None, "nullable": False, "pk": False, "type": "text"},
+            "entity_name": {"default": None, "nullable": False, "pk": False, "type": "text"},
+            "event_type": {"default": None, "nullable": False, "pk": False, "type": "text"},
+            "id": {"default": None, "nullable": False, "pk": True, "type": "text"},
+            "integration": {"default": None, "nullable": False, "pk": False, "type": "text"},
+            "mapping": {"default": None, "nullable": False, "pk": False, "type": "text"},
+        },
+        "fks": {},
+        "indexes": {
+            "idx__dazzle_mapping_redelivery_due": {
+                "columns": ["due_at"],
+                "predicate": None,
+                "unique": False,
+            },
+        },
+        "uniques": [],
+    },
     "_dazzle_otp_codes": {
         "columns": {
             "attempts": {"default": "0", "nullable": True, "pk": False, "type": "integer"},
@@ -255,6 +311,11 @@ FRAMEWORK_SCHEMA_SNAPSHOT = {
                 "predicate": None,
                 "unique": False,
             },
+            "idx__dazzle_outbox_claim": {
+                "columns": ["created_at"],
+                "predicate": "(status = ANY (ARRAY['pending'::text, 'processing'::text]))",
+                "unique": False,
+            },
             "idx__dazzle_outbox_recipient": {
                 "columns": ["recipient", "channel_name"],
                 "predicate": None,
@@ -832,7 +893,12 @@ FRAMEWORK_SCHEMA_SNAPSHOT = {
                 "columns": ["deliver_at"],
                 "predicate": "(status = ANY (ARRAY['pending'::text, 'claimed'::text]))",
                 "unique": False,
-            }
+            },
+            "ix_process_tasks_open_due": {
+                "columns": ["due_at"],
+                "predicate": "(status = ANY (ARRAY['pending'::text, 'assigned'::text, 'escalated'::text]))",
+                "unique": False,
+            },
         },
         "uniques": [],
     },
@@ -880,6 +946,22 @@ FRAMEWORK_SCHEMA_SNAPSHOT = {
         "indexes": {},
         "uniques": [],
     },
+    "schedule_fires": {
+        "columns": {
+            "fire_at": {"default": None, "nullable": False, "pk": True, "type": "timestamptz"},
+            "fired_at": {
+                "default": "now()",
+                "nullable": False,
+                "pk": False,
+                "type": "timestamptz",
+            },
+            "fired_by": {"default": None, "nullable": False, "pk": False, "type": "text"},
+            "schedule": {"default": None, "nullable": False, "pk": True, "type": "text"},
+        },
+        "fks": {},
+        "indexes": {},
+        "uniques": [],
+    },
     "scim_group_members": {
         "columns": {
             "group_id": {"default": None, "nullable": False, "pk": True, "type": "text"},
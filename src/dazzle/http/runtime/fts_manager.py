@@ -1,7 +1,8 @@
 """
 Full-text search manager for the Dazzle runtime.
 
-Uses PostgreSQL tsvector/GIN backend exclusively.
+Uses PostgreSQL tsvector/GIN backend exclusively. Searchable fields are
+weighted by declaration order (see ``fts_postgres``).
 """
 
 from __future__ import annotations
@@ -100,7 +101,7 @@ class FTSManager:
         entity_name: str,
     ) -> None:
         """
-        Create FTS GIN index for an entity.
+        Index the entity for search (reusing ``search_vector`` when it fits).
 
         Args:
             conn: psycopg database connection
@@ -1,28 +1,92 @@
 """
 PostgreSQL full-text search backend.
 
-Uses tsvector, tsquery, and GIN indexes for text search.
+Entities with a DSL ``search`` block already carry the weighted, stored
+``search_vector`` column and GIN index from ``search_schema``. When that
+column covers the searchable fields (in the same text-search
+configuration), queries read it and nothing new is created. Otherwise
+the backend keeps a GIN *expression* index over the weighted vector — no
+column is added, so registering an entity never rewrites its table. The
+index is built and its predecessors dropped ``CONCURRENTLY``, so boot
+never blocks writes to a large table.
+
+Fields are weighted by their order: the first is ``A``, the second
+``B``, the rest ``C``. ``ts_rank_cd`` therefore ranks a title match
+above a body match when the title is declared first.
 """
 
-from dataclasses import dataclass
+import hashlib
+import re
+from dataclasses import dataclass, field
 from typing import Any
 
 from dazzle.http.runtime.query_builder import quote_identifier
+from dazzle.http.runtime.search_schema import SEARCH_VECTOR_COLUMN
+
+_FIELD_WEIGHTS = ("A", "B")
+_DEFAULT_WEIGHT = "C"
+
+
+def _field_weight(position: int) -> str:
+    """The tsvector weight for the searchable field at *position*."""
+    return _FIELD_WEIGHTS[position] if position < len(_FIELD_WEIGHTS) else _DEFAULT_WEIGHT
+
+
+def _first_value(row: Any, key: str) -> Any:
+    return row[0] if isinstance(row, (tuple, list)) else row.get(key)
+
+
+def _mentions_column(expression: str, column: str) -> bool:
+    """Whether a deparsed generation expression references *column*."""
+    pattern = rf'(?<![\w"])("{re.escape(column)}"|{re.escape(column)})(?![\w"])'
+    return re.search(pattern, expression) is not None
 
 
 @dataclass
 class PostgresFTSBackend:
-    """PostgreSQL full-text search using tsvector/tsquery/GIN."""
+    """PostgreSQL full-text search over ``search_vector`` or a GIN expression index."""
 
     _language: str = "english"
+    # Entity name → SQL of the vector its searches read, set by create_fts_index.
+    _vectors: dict[str, str] = field(default_factory=dict)
 
     def _build_tsvector_expr(self, fields: list[str]) -> str:
-        """Build a tsvector expression combining multiple columns."""
+        """Build a weighted tsvector expression combining multiple columns.
+
+        Weights follow the field's position in *fields*.
+        """
         parts = []
-        for field in fields:
-            col = quote_identifier(field)
-            parts.append(f"to_tsvector('{self._language}', COALESCE({col}, ''))")
-        return " || ' ' || ".join(parts)
+        for position, field_name in enumerate(fields):
+            col = quote_identifier(field_name)
+            parts.append(
+                f"setweight(to_tsvector('{self._language}', COALESCE({col}, '')), "
+                f"'{_field_weight(position)}')"
+            )
+        return " || ".join(parts)
+
+    def _vector(self, entity_name: str, searchable_fields: list[str]) -> str:
+        """The vector SQL searches match against."""
+        return self._vectors.get(entity_name) or f"({self._build_tsvector_expr(searchable_fields)})"
+
+    def _search_vector_covers(
+        self, cursor: Any, entity_name: str, searchable_fields: list[str]
+    ) -> bool:
+        """Whether ``search_vector`` exists and indexes every searchable field.
+
+        A vector missing a field (or built in another configuration)
+        would wrongly filter out rows, so it is only reused when it
+        covers them all.
+        """
+        cursor.execute(
+            "SELECT generation_expression FROM information_schema.columns "
+            "WHERE table_schema = current_schema() AND table_name = %s AND column_name = %s",
+            (entity_name, SEARCH_VECTOR_COLUMN),
+        )
+        row = cursor.fetchone()
+        expression = _first_value(row, "generation_expression") if row else None
+        if not isinstance(expression, str) or f"'{self._language}'" not in expression:
+            return False
+        return all(_mentions_column(expression, f) for f in searchable_fields)
 
     def create_fts_index(
         self,
@@ -30,17 +94,76 @@ class PostgresFTSBackend:
         entity_name: str,
         searchable_fields: list[str],
     ) -> None:
-        """Create GIN index for full-text search on an entity table."""
-        table = quote_identifier(entity_name)
-        tsvector_expr = self._build_tsvector_expr(searchable_fields)
-        index_name = f"idx_{entity_name}_fts"
+        """Reuse ``search_vector`` if it covers the fields, else add an expression index.
 
+        The expression index name carries a digest of the expression, so
+        a changed field list builds a new index rather than keeping a
+        stale one under the old name. Superseded ``idx_{entity}_fts``
+        indexes — the unsuffixed baseline one included — are dropped, since
+        every write would otherwise keep maintaining them.
+        """
         cursor = conn.cursor()
+        keep: str | None = None
+        if self._search_vector_covers(cursor, entity_name, searchable_fields):
+            self._vectors[entity_name] = quote_identifier(SEARCH_VECTOR_COLUMN)
+        else:
+            tsvector_expr = self._build_tsvector_expr(searchable_fields)
+            digest = hashlib.sha1(tsvector_expr.encode(), usedforsecurity=False).hexdigest()[:8]
+            keep = f"idx_{entity_name}_fts_{digest}"
+            self._vectors[entity_name] = f"({tsvector_expr})"
+
+        indexes = self._fts_indexes(cursor, entity_name)
+        # An interrupted concurrent build leaves an invalid index behind.
+        stale = [name for name, valid in indexes.items() if name != keep or not valid]
+        build = keep is not None and not indexes.get(keep, False)
+        if stale or build:
+            self._replace_fts_indexes(conn, entity_name, keep if build else None, stale)
+
+    def _fts_indexes(self, cursor: Any, entity_name: str) -> dict[str, bool]:
+        """This backend's indexes on *entity_name*, mapped to whether each is valid."""
         cursor.execute(
-            f"CREATE INDEX IF NOT EXISTS {quote_identifier(index_name)} "
-            f"ON {table} USING GIN(({tsvector_expr}))"
+            "SELECT c.relname AS indexname, i.indisvalid AS valid FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid "
+            "JOIN pg_class t ON t.oid = i.indrelid "
+            "WHERE t.relname = %s AND t.relnamespace = current_schema()::regnamespace",
+            (entity_name,),
         )
+        pattern = re.compile(rf"idx_{re.escape(entity_name)}_fts(_[0-9a-f]{{8}})?")
+        indexes: dict[str, bool] = {}
+        for row in cursor.fetchall() or []:
+            name = _first_value(row, "indexname")
+            if isinstance(name, str) and pattern.fullmatch(name):
+                indexes[name] = bool(row[1] if isinstance(row, (tuple, list)) else row["valid"])
+        return indexes
+
+    def _replace_fts_indexes(
+        self, conn: Any, entity_name: str, build: str | None, stale: list[str]
+    ) -> None:
+        """Build *build* and drop *stale* without blocking writes to the table.
+
+        ``CREATE`` / ``DROP INDEX CONCURRENTLY`` cannot run inside a
+        transaction block, so the introspection is committed first and the
+        statements run in autocommit. The new index is built before the
+        old ones go, so searches stay indexed throughout.
+        """
+        autocommit = conn.autocommit
         conn.commit()
+        conn.autocommit = True
+        try:
+            cursor = conn.cursor()
+            if build in stale:
+                cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {quote_identifier(build)}")
+            if build is not None:
+                cursor.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {quote_identifier(build)} "
+                    f"ON {quote_identifier(entity_name)} "
+                    f"USING GIN({self._vectors[entity_name]})"
+                )
+            for name in stale:
+                if name != build:
+                    cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {quote_identifier(name)}")
+        finally:
+            conn.autocommit = autocommit
 
     def search(
         self,
@@ -55,6 +178,12 @@ class PostgresFTSBackend:
         """
         Search for entities matching query.
 
+        One query returns the ranked page and, via ``count(*) OVER ()``,
+        the total match count. The indexed vector finds the candidates;
+        a search over a subset of the fields re-checks and ranks against
+        just those fields. A row matching the subset always matches the
+        full vector, so the index still applies.
+
         Returns:
             Tuple of (list of matching IDs, total count).
         """
@@ -62,40 +191,50 @@ class PostgresFTSBackend:
 
         # Determine which fields to search
         search_fields = fields if fields else searchable_fields
-        valid_fields = [f for f in search_fields if f in searchable_fields]
+        valid_fields = [f for f in searchable_fields if f in search_fields]
         if not valid_fields:
             valid_fields = searchable_fields
 
-        tsvector_expr = self._build_tsvector_expr(valid_fields)
-        tsquery = f"plainto_tsquery('{self._language}', %s)"
+        vector = self._vector(entity_name, searchable_fields)
+        where = f"{vector} @@ fts_query"
+        rank_vector = vector
+        if valid_fields != searchable_fields:
+            # Keep each field's full-vector weight so ranks stay comparable.
+            rank_vector = " || ".join(
+                f"setweight(to_tsvector('{self._language}', "
+                f"COALESCE({quote_identifier(f)}, '')), "
+                f"'{_field_weight(searchable_fields.index(f))}')"
+                for f in valid_fields
+            )
+            where += f" AND ({rank_vector}) @@ fts_query"
 
         cursor = conn.cursor()
-
-        # Count total matches
         cursor.execute(
-            f"SELECT COUNT(*) FROM {table} WHERE ({tsvector_expr}) @@ {tsquery}",
-            (query,),
-        )
-        row = cursor.fetchone()
-        total = row[0] if isinstance(row, (tuple, list)) else row.get("count", 0)
-
-        # Fetch IDs ranked by relevance
-        cursor.execute(
-            f'SELECT "id", ts_rank(({tsvector_expr}), {tsquery}) AS rank '
-            f"FROM {table} "
-            f"WHERE ({tsvector_expr}) @@ {tsquery} "
+            f'SELECT "id", ts_rank_cd({rank_vector}, fts_query) AS rank, '
+            f"count(*) OVER () AS total "
+            f"FROM {table}, plainto_tsquery('{self._language}', %s) AS fts_query "
+            f"WHERE {where} "
             f"ORDER BY rank DESC "
             f"LIMIT %s OFFSET %s",
-            (query, query, limit, offset),
+            (query, limit, offset),
         )
         rows = cursor.fetchall()
-        ids = []
-        for r in rows:
-            if isinstance(r, dict):
-                ids.append(r["id"])
-            else:
-                ids.append(r[0])
+        if rows:
+            total = int(rows[0]["total"] if isinstance(rows[0], dict) else rows[0][2])
+        elif offset:
+            # Paged past the last match — the window count came back
+            # with no rows, so count separately.
+            cursor.execute(
+                f"SELECT COUNT(*) "
+                f"FROM {table}, plainto_tsquery('{self._language}', %s) AS fts_query "
+                f"WHERE {where}",
+                (query,),
+            )
+            total = int(_first_value(cursor.fetchone(), "count") or 0)
+        else:
+            total = 0
 
+        ids = [r["id"] if isinstance(r, dict) else r[0] for r in rows]
         return ids, total
 
     def search_with_snippets(
@@ -108,42 +247,32 @@ class PostgresFTSBackend:
     ) -> list[dict[str, Any]]:
         """Search with highlighted snippets using ts_headline."""
         table = quote_identifier(entity_name)
-        tsvector_expr = self._build_tsvector_expr(searchable_fields)
-        tsquery = f"plainto_tsquery('{self._language}', %s)"
+        vector = self._vector(entity_name, searchable_fields)
 
         # Build snippet columns using ts_headline
         snippet_cols = []
-        for field in searchable_fields:
-            col = quote_identifier(field)
-            snippet_alias = quote_identifier(f"{field}_snippet")
+        for field_name in searchable_fields:
+            col = quote_identifier(field_name)
+            snippet_alias = quote_identifier(f"{field_name}_snippet")
             snippet_cols.append(
                 f"ts_headline('{self._language}', COALESCE({col}, ''), "
-                f"{tsquery}, "
+                f"fts_query, "
                 f"'StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15') "
                 f"AS {snippet_alias}"
             )
         snippet_str = ", ".join(snippet_cols)
 
-        # Parameter count: ts_rank has 1 tsquery (%s), each ts_headline
-        # has 1 tsquery (%s), WHERE has 1 tsquery (%s), LIMIT has 1 (%s).
-        # Total = 1 (ts_rank) + n_fields (ts_headline) + 1 (WHERE) + 1 (LIMIT)
-        n_fields = len(searchable_fields)
-        params: tuple[Any, ...] = (
-            query,  # ts_rank tsquery
-            *((query,) * n_fields),  # one for each ts_headline
-            query,  # WHERE clause tsquery
-            limit,
-        )
-
+        # The tsquery is bound once in FROM and shared by the rank,
+        # every ts_headline and the WHERE clause.
         cursor = conn.cursor()
         cursor.execute(
-            f'SELECT "id", ts_rank(({tsvector_expr}), {tsquery}) AS rank, '
+            f'SELECT "id", ts_rank_cd({vector}, fts_query) AS rank, '
             f"{snippet_str} "
-            f"FROM {table} "
-            f"WHERE ({tsvector_expr}) @@ {tsquery} "
+            f"FROM {table}, plainto_tsquery('{self._language}', %s) AS fts_query "
+            f"WHERE {vector} @@ fts_query "
             f"ORDER BY rank DESC "
             f"LIMIT %s",
-            params,
+            (query, limit),
         )
 
         results = []
@@ -152,8 +281,8 @@ class PostgresFTSBackend:
                 results.append(dict(row))
             else:
                 result: dict[str, Any] = {"id": row[0], "rank": row[1]}
-                for i, field in enumerate(searchable_fields):
-                    result[f"{field}_snippet"] = row[2 + i]
+                for i, field_name in enumerate(searchable_fields):
+                    result[f"{field_name}_snippet"] = row[2 + i]
                 results.append(result)
 
         return results
@@ -165,12 +294,12 @@ class PostgresFTSBackend:
         searchable_fields: list[str],
     ) -> int:
         """
-        Rebuild is a no-op for PostgreSQL — GIN indexes auto-maintain.
+        Rebuild is a no-op for PostgreSQL — the GIN index is maintained
+        on every write.
 
         Returns the current row count.
         """
         table = quote_identifier(entity_name)
         cursor = conn.cursor()
         cursor.execute(f"SELECT COUNT(*) FROM {table}")
-        row = cursor.fetchone()
-        return int(row[0] if isinstance(row, (tuple, list)) else row.get("count", 0))
+        return int(_first_value(cursor.fetchone(), "count"))
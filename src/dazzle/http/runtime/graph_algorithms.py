@@ -1,7 +1,16 @@
-"""Graph algorithm functions (#619 Phase 4). Pure functions on NetworkX graphs."""
+"""Graph algorithm functions (#619 Phase 4).
 
+Pure functions on NetworkX graphs, and their ``snapshot_*`` counterparts on
+the cached CSR ``GraphSnapshot`` the endpoints serve from.
+"""
+
+import heapq
+import math
+from collections import deque
 from typing import Any
 
+from dazzle.http.runtime.graph_snapshot import GraphSnapshot
+
 try:
     import networkx as nx
 except ImportError:
@@ -36,3 +45,87 @@ def connected_components(g: Any) -> dict[str, Any]:
         components = list(nx.connected_components(g))
     components.sort(key=len, reverse=True)
     return {"count": len(components), "components": [sorted(c) for c in components]}
+
+
+# ---------------------------------------------------------------------------
+# The same algorithms over a cached GraphSnapshot (CSR arrays, no NetworkX)
+# ---------------------------------------------------------------------------
+
+
+def snapshot_shortest_path(
+    snap: GraphSnapshot, source: str, target: str, weighted: bool = False
+) -> dict[str, Any]:
+    """``shortest_path`` over a snapshot: BFS, or Dijkstra when ``weighted``."""
+    if source not in snap:
+        return {"path": [], "length": None, "error": "source node not found in graph"}
+    if target not in snap:
+        return {"path": [], "length": None, "error": "target node not found in graph"}
+    src, tgt = snap.index[source], snap.index[target]
+    parent, dist = (_dijkstra if weighted else _bfs)(snap, src, tgt)
+    if tgt not in parent:
+        return {"path": [], "length": None}
+    path = [tgt]
+    while path[-1] != src:
+        path.append(parent[path[-1]])
+    ids = [snap.node_ids[i] for i in reversed(path)]
+    result: dict[str, Any] = {"path": ids, "length": len(ids) - 1}
+    if weighted:
+        result["weight"] = dist
+    return result
+
+
+def _bfs(snap: GraphSnapshot, src: int, tgt: int) -> tuple[dict[int, int], float]:
+    parent = {src: src}
+    frontier = deque([src])
+    while frontier and tgt not in parent:
+        node = frontier.popleft()
+        for k in range(snap.offsets[node], snap.offsets[node + 1]):
+            nxt = snap.adjacency[k]
+            if nxt not in parent:
+                parent[nxt] = node
+                frontier.append(nxt)
+    return parent, 0.0
+
+
+def _dijkstra(snap: GraphSnapshot, src: int, tgt: int) -> tuple[dict[int, int], float]:
+    best = {src: 0.0}
+    parent = {src: src}
+    done: set[int] = set()
+    heap = [(0.0, src)]
+    while heap:
+        d, node = heapq.heappop(heap)
+        if node in done:
+            continue
+        if node == tgt:
+            return parent, d
+        done.add(node)
+        for k in range(snap.offsets[node], snap.offsets[node + 1]):
+            nxt = snap.adjacency[k]
+            nd = d + snap.weights[snap.adjacency_edge[k]]
+            if nd < best.get(nxt, math.inf):
+                best[nxt] = nd
+                parent[nxt] = node
+                heapq.heappush(heap, (nd, nxt))
+    return parent, math.inf
+
+
+def snapshot_components(snap: GraphSnapshot) -> dict[str, Any]:
+    """``connected_components`` over a snapshot (weak for directed graphs)."""
+    root = list(range(len(snap.node_ids)))
+
+    def find(i: int) -> int:
+        while root[i] != i:
+            root[i] = root[root[i]]
+            i = root[i]
+        return i
+
+    for s, t in zip(snap.sources, snap.targets, strict=True):
+        rs, rt = find(s), find(t)
+        if rs != rt:
+            root[rs] = rt
+    groups: dict[int, list[str]] = {}
+    for i, node_id in enumerate(snap.node_ids):
+        if snap.degree[i]:  # skip slots of nodes whose last edge went
+            groups.setdefault(find(i), []).append(node_id)
+    components = sorted((sorted(c) for c in groups.values()), key=len, reverse=True)
+    return {"count": len(components), "components": components}
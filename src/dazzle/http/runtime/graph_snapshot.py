@@ -0,0 +1,481 @@
+"""Compact graph snapshots — cached CSR adjacency per graph and tenant (#619).
+
+The graph endpoints used to ``SELECT *`` both tables and build a fresh
+NetworkX graph on every request. A ``GraphSnapshot`` instead holds only the
+topology: node ids once, edges as parallel ``array`` columns, and a CSR
+(compressed sparse row) adjacency — ``offsets[i]:offsets[i + 1]`` slices
+``adjacency`` to node ``i``'s neighbours. That is a few machine words per
+edge rather than a dict-of-dicts, and it is built from a three-column
+projection of the edge table.
+
+``GraphSnapshotCache`` keeps one snapshot per (graph, tenant context,
+domain filters):
+
+  - ``track`` subscribes to the edge and node services' lifecycle
+    callbacks; an edge write is queued as a delta and spliced into the
+    snapshot on its next read (only the touched nodes' CSR rows are
+    rebuilt), a node delete (whose cascaded edges emit no
+    events) marks the graph stale
+  - writes made elsewhere — bulk SQL, other workers — are caught by a
+    freshness probe: before a cached snapshot is reused, the database sums a
+    per-edge digest (``checksum_sql``) over the same projection, and a
+    mismatch with the snapshot's own ``checksum`` forces a rebuild.
+    ``max_age`` still bounds how long any snapshot lives
+  - the tenant context (schema, tenant ids, RLS user attributes) is part of
+    the key, so a snapshot never answers for rows its reader could not see
+
+Algorithms over snapshots live in ``graph_algorithms``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import struct
+import time
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from dazzle.http.runtime.query_builder import quote_identifier
+from dazzle.http.runtime.tenant_isolation import (
+    get_current_host_tenant_id,
+    get_current_rls_user_attrs,
+    get_current_tenant_id,
+    get_current_tenant_schema,
+)
+
+EdgeRow = tuple[str, str, str, float]  # (edge id, source, target, weight)
+
+
+def row_checksum(row: EdgeRow) -> int:
+    """60-bit digest of one edge row; ``checksum_sql`` computes the same in SQL."""
+    edge_id, source, target, weight = row
+    payload = f"{edge_id}|{source}|{target}".encode() + struct.pack(">d", weight)
+    return int(hashlib.md5(payload, usedforsecurity=False).hexdigest()[:15], 16)
+
+
+def checksum_sql(graph_edge: Any) -> str:
+    """SQL aggregate equal to ``GraphSnapshot.checksum`` for the rows it ranges over.
+
+    The caller restricts it to the snapshot's rows: the same domain filters,
+    with both endpoints set (``edge_row`` skips the rest).
+    """
+    ident, source, target = (
+        quote_identifier(c) for c in ("id", graph_edge.source, graph_edge.target)
+    )
+    weight = (
+        f"{quote_identifier(graph_edge.weight_field)}::float8"
+        if graph_edge.weight_field
+        else "NULL::float8"
+    )
+    digest = (
+        f"md5(convert_to({ident}::text || '|' || {source}::text || '|' || {target}::text, "
+        f"'UTF8') || float8send(COALESCE({weight}, 1.0)))"
+    )
+    return f"COALESCE(SUM(('x' || left({digest}, 15))::bit(60)::bigint), 0)"
+
+
+class GraphSnapshot:
+    """Immutable CSR view of one graph's topology.
+
+    Attributes:
+        directed: Whether edges are followed source → target only
+        node_ids: Node id for each dense index
+        index: Node id → dense index, for nodes with at least one edge
+        degree: Edges touching each node; 0 for a node whose last edge was
+            removed by ``apply`` (its slot stays, with an empty row, until
+            the next full build)
+        edge_ids / sources / targets / weights: One entry per edge
+        edge_index: Edge id → its position in the edge columns
+        offsets / adjacency / adjacency_edge: CSR rows — neighbour index and
+            the edge that reaches it. Undirected graphs list both directions.
+        version: Bumped each time queued changes are folded in
+        checksum: Sum of ``row_checksum`` over the edges, kept in step with
+            ``apply`` so it can be compared with ``checksum_sql``
+        built_at: Clock reading of the last full read from the database
+    """
+
+    __slots__ = (
+        "directed",
+        "node_ids",
+        "index",
+        "degree",
+        "edge_ids",
+        "edge_index",
+        "sources",
+        "targets",
+        "weights",
+        "offsets",
+        "adjacency",
+        "adjacency_edge",
+        "version",
+        "checksum",
+        "built_at",
+    )
+
+    #: ``apply`` splices deltas up to this share of the edges; past it a
+    #: full rebuild is as cheap.
+    SPLICE_LIMIT = 0.25
+
+    def __init__(
+        self, directed: bool, rows: Iterable[EdgeRow], *, version: int = 1, built_at: float = 0.0
+    ) -> None:
+        self.directed = directed
+        self.version = version
+        self.built_at = built_at
+        self.checksum = 0
+        self.node_ids: list[str] = []
+        self.index: dict[str, int] = {}
+        self.degree = array("l")
+        self.edge_ids: list[str] = []
+        self.edge_index: dict[str, int] = {}
+        self.sources = array("l")
+        self.targets = array("l")
+        self.weights = array("d")
+        for row in rows:
+            self._append_edge(row)
+        self._build_csr()
+
+    def _intern(self, node_id: str) -> int:
+        idx = self.index.get(node_id)
+        if idx is None:
+            idx = self.index[node_id] = len(self.node_ids)
+            self.node_ids.append(node_id)
+            self.degree.append(0)
+        return idx
+
+    def _append_edge(self, row: EdgeRow) -> int:
+        edge_id, source, target, weight = row
+        s, t = self._intern(source), self._intern(target)
+        self.edge_index[edge_id] = len(self.edge_ids)
+        self.edge_ids.append(edge_id)
+        self.sources.append(s)
+        self.targets.append(t)
+        self.weights.append(weight)
+        self.degree[s] += 1
+        self.degree[t] += 1
+        self.checksum += row_checksum(row)
+        return len(self.edge_ids) - 1
+
+    def _build_csr(self) -> None:
+        arcs = [(s, t, e) for e, (s, t) in enumerate(zip(self.sources, self.targets, strict=True))]
+        if not self.directed:
+            arcs += [(t, s, e) for s, t, e in arcs if s != t]
+        counts = [0] * (len(self.node_ids) + 1)
+        for s, _, _ in arcs:
+            counts[s + 1] += 1
+        for i in range(len(self.node_ids)):
+            counts[i + 1] += counts[i]
+        self.offsets = array("l", counts)
+        fill = list(counts[:-1])
+        self.adjacency = array("l", [0] * len(arcs))
+        self.adjacency_edge = array("l", [0] * len(arcs))
+        for s, t, e in arcs:
+            self.adjacency[fill[s]] = t
+            self.adjacency_edge[fill[s]] = e
+            fill[s] += 1
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def rows(self) -> Iterator[EdgeRow]:
+        for e, edge_id in enumerate(self.edge_ids):
+            yield (
+                edge_id,
+                self.node_ids[self.sources[e]],
+                self.node_ids[self.targets[e]],
+                self.weights[e],
+            )
+
+    def apply(self, added: dict[str, EdgeRow], removed: set[str]) -> GraphSnapshot:
+        """A new snapshot with ``removed`` edge ids dropped and ``added`` upserted.
+
+        Only the CSR rows of the nodes the changes touch are rebuilt; every
+        other row is copied across in bulk. A delta larger than
+        ``SPLICE_LIMIT`` of the edges rebuilds the whole snapshot instead.
+        """
+        drop = {self.edge_index[e] for e in removed | added.keys() if e in self.edge_index}
+        if len(drop) + len(added) > self.SPLICE_LIMIT * len(self.edge_ids):
+            kept = (row for row in self.rows() if row[0] not in removed and row[0] not in added)
+            return GraphSnapshot(
+                self.directed,
+                [*kept, *added.values()],
+                version=self.version + 1,
+                built_at=self.built_at,
+            )
+        dropped = {self.edge_ids[d] for d in drop}
+        snap = self._copy()
+        touched = snap._remove_edges(drop)
+        new_edges = [snap._append_edge(row) for row in added.values()]
+        for e in new_edges:
+            touched.update((snap.sources[e], snap.targets[e]))
+        snap._splice_rows(self, touched, dropped, new_edges)
+        for n in touched:
+            if snap.degree[n] == 0:
+                snap.index.pop(snap.node_ids[n], None)
+        return snap
+
+    def _copy(self) -> GraphSnapshot:
+        snap = GraphSnapshot.__new__(GraphSnapshot)
+        snap.directed = self.directed
+        snap.version = self.version + 1
+        snap.built_at = self.built_at
+        snap.checksum = self.checksum
+        snap.node_ids = list(self.node_ids)
+        snap.index = dict(self.index)
+        snap.degree = self.degree[:]
+        snap.edge_ids = list(self.edge_ids)
+        snap.edge_index = dict(self.edge_index)
+        snap.sources = self.sources[:]
+        snap.targets = self.targets[:]
+        snap.weights = self.weights[:]
+        return snap
+
+    def _remove_edges(self, drop: set[int]) -> set[int]:
+        """Swap-remove the edges at ``drop``; returns the nodes whose rows change.
+
+        An edge moved into a freed slot changes index, so its endpoints'
+        rows (which name it in ``adjacency_edge``) are rebuilt too.
+        """
+        touched: set[int] = set()
+        for d in sorted(drop, reverse=True):
+            self.checksum -= row_checksum(
+                (
+                    self.edge_ids[d],
+                    self.node_ids[self.sources[d]],
+                    self.node_ids[self.targets[d]],
+                    self.weights[d],
+                )
+            )
+            touched.update((self.sources[d], self.targets[d]))
+            self.degree[self.sources[d]] -= 1
+            self.degree[self.targets[d]] -= 1
+            del self.edge_index[self.edge_ids[d]]
+            last = len(self.edge_ids) - 1
+            if d != last:
+                self.edge_ids[d] = self.edge_ids[last]
+                self.sources[d] = self.sources[last]
+                self.targets[d] = self.targets[last]
+                self.weights[d] = self.weights[last]
+                self.edge_index[self.edge_ids[d]] = d
+                touched.update((self.sources[d], self.targets[d]))
+            self.edge_ids.pop()
+            self.sources.pop()
+            self.targets.pop()
+            self.weights.pop()
+        return touched
+
+    def _row(
+        self, old: GraphSnapshot, node: int, dropped: set[str], new_edges: list[int]
+    ) -> tuple[list[int], list[int]]:
+        """``node``'s row: its surviving old arcs, re-indexed, then arcs of new edges."""
+        neighbours: list[int] = []
+        edges: list[int] = []
+        if node < len(old.node_ids):
+            for k in range(old.offsets[node], old.offsets[node + 1]):
+                edge_id = old.edge_ids[old.adjacency_edge[k]]
+                if edge_id not in dropped:
+                    neighbours.append(old.adjacency[k])
+                    edges.append(self.edge_index[edge_id])
+        for e in new_edges:
+            if self.sources[e] == node:
+                neighbours.append(self.targets[e])
+                edges.append(e)
+            elif not self.directed and self.targets[e] == node:
+                neighbours.append(self.sources[e])
+                edges.append(e)
+        return neighbours, edges
+
+    def _splice_rows(
+        self, old: GraphSnapshot, touched: set[int], dropped: set[str], new_edges: list[int]
+    ) -> None:
+        """Rebuild the CSR from ``old``'s: fresh rows for ``touched``, bulk copies between."""
+        offsets = array("l", [0])
+        adjacency = array("l")
+        adjacency_edge = array("l")
+        copied = 0  # nodes whose rows are already in place
+        for node in [*sorted(touched), len(self.node_ids)]:
+            end = min(node, len(old.node_ids))
+            if end > copied:
+                lo, hi = old.offsets[copied], old.offsets[end]
+                shift = len(adjacency) - lo
+                adjacency.extend(old.adjacency[lo:hi])
+                adjacency_edge.extend(old.adjacency_edge[lo:hi])
+                offsets.extend(map(shift.__add__, old.offsets[copied + 1 : end + 1]))
+                copied = end
+            # Nodes new in this delta that start no arc have empty rows.
+            offsets.extend([len(adjacency)] * (node - copied))
+            if node == len(self.node_ids):
+                break
+            neighbours, edges = self._row(old, node, dropped, new_edges)
+            adjacency.extend(neighbours)
+            adjacency_edge.extend(edges)
+            offsets.append(len(adjacency))
+            copied = node + 1
+        self.offsets = offsets
+        self.adjacency = adjacency
+        self.adjacency_edge = adjacency_edge
+
+
+def edge_row(record: dict[str, Any], graph_edge: Any) -> EdgeRow | None:
+    """The snapshot row for an edge record, or ``None`` when an endpoint is unset."""
+    source, target = record.get(graph_edge.source), record.get(graph_edge.target)
+    if source is None or target is None or record.get("id") is None:
+        return None
+    weight = record.get(graph_edge.weight_field) if graph_edge.weight_field else None
+    return (str(record["id"]), str(source), str(target), 1.0 if weight is None else float(weight))
+
+
+def tenant_context() -> tuple[Any, ...]:
+    """Everything that decides which rows the current request can see."""
+    attrs = get_current_rls_user_attrs()
+    return (
+        get_current_tenant_schema(),
+        get_current_tenant_id(),
+        get_current_host_tenant_id(),
+        tuple(sorted(attrs.items())),
+    )
+
+
+@dataclass
+class _Entry:
+    snapshot: GraphSnapshot
+    filters: dict[str, str]
+    added: dict[str, EdgeRow] = field(default_factory=dict)
+    removed: set[str] = field(default_factory=set)
+    stale: bool = False
+
+
+class GraphSnapshotCache:
+    """Snapshots keyed by (graph, tenant context, domain filters), LRU-bounded.
+
+    Args:
+        max_age: Seconds before a snapshot is re-read from the database
+        max_entries: Snapshots kept before the least recently used is dropped
+        max_pending: Queued edge changes before a snapshot is re-read instead
+        clock: Monotonic clock (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        *,
+        max_age: float = 60.0,
+        max_entries: int = 64,
+        max_pending: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self.max_pending = max_pending
+        self.clock = clock
+        self._entries: OrderedDict[tuple[Any, ...], _Entry] = OrderedDict()
+        self._tracked: set[str] = set()
+
+    def key(self, graph: str, filters: dict[str, Any] | None = None) -> tuple[Any, ...]:
+        items = tuple(sorted((k, str(v)) for k, v in (filters or {}).items()))
+        return (graph, tenant_context(), items)
+
+    def get(
+        self, key: tuple[Any, ...], probe: Callable[[], int] | None = None
+    ) -> GraphSnapshot | None:
+        """The fresh snapshot for ``key`` with queued changes folded in, else ``None``.
+
+        ``probe`` returns the database's ``checksum_sql`` for the snapshot's
+        rows; it runs only when a snapshot is cached, and a mismatch (a write
+        this process never saw) drops it.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.stale or self.clock() - entry.snapshot.built_at > self.max_age:
+            del self._entries[key]
+            return None
+        if entry.added or entry.removed:
+            entry.snapshot = entry.snapshot.apply(entry.added, entry.removed)
+            entry.added, entry.removed = {}, set()
+        if probe is not None and probe() != entry.snapshot.checksum:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry.snapshot
+
+    def build(self, key: tuple[Any, ...], directed: bool, rows: Iterable[EdgeRow]) -> GraphSnapshot:
+        """Store a snapshot freshly read from the database under ``key``."""
+        snapshot = GraphSnapshot(directed, rows, built_at=self.clock())
+        self._entries[key] = _Entry(snapshot, dict(key[2]))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return snapshot
+
+    def invalidate(self, graph: str) -> None:
+        for key, entry in self._entries.items():
+            if key[0] == graph:
+                entry.stale = True
+
+    def edge_changed(
+        self,
+        graph: str,
+        graph_edge: Any,
+        old: dict[str, Any] | None,
+        new: dict[str, Any] | None,
+    ) -> None:
+        """Queue an edge write against every snapshot of ``graph`` it can affect.
+
+        Snapshots taken under the writer's own tenant context get the change
+        as a delta; those of other readers in the same tenant (different RLS
+        attributes, so possibly a different view of the row) go stale.
+        """
+        context = tenant_context()
+        for key, entry in self._entries.items():
+            if key[0] != graph:
+                continue
+            if key[1] != context:
+                entry.stale = entry.stale or key[1][:3] == context[:3]
+                continue
+            _queue(entry, graph_edge, old, new)
+            if len(entry.added) + len(entry.removed) > self.max_pending:
+                entry.stale = True
+
+    def track(self, graph: str, graph_edge: Any, edge_service: Any, node_service: Any) -> None:
+        """Keep ``graph``'s snapshots current from its services' lifecycle callbacks."""
+        if graph in self._tracked:
+            return
+        self._tracked.add(graph)
+
+        def _edge_created(_entity: str, _id: str, data: dict[str, Any], _old: Any) -> None:
+            self.edge_changed(graph, graph_edge, None, data)
+
+        def _edge_updated(_entity: str, _id: str, data: dict[str, Any], old: Any) -> None:
+            self.edge_changed(graph, graph_edge, old or {"id": _id}, data)
+
+        def _edge_deleted(_entity: str, _id: str, data: dict[str, Any], _old: Any) -> None:
+            self.edge_changed(graph, graph_edge, data or {"id": _id}, None)
+
+        def _node_deleted(_entity: str, _id: str, _data: Any, _old: Any) -> None:
+            self.invalidate(graph)
+
+        if edge_service is not None:
+            edge_service.on_created(_edge_created)
+            edge_service.on_updated(_edge_updated)
+            edge_service.on_deleted(_edge_deleted)
+        if node_service is not None:
+            node_service.on_deleted(_node_deleted)
+
+
+def _queue(
+    entry: _Entry, graph_edge: Any, old: dict[str, Any] | None, new: dict[str, Any] | None
+) -> None:
+    if old is not None and old.get("id") is not None:
+        entry.added.pop(str(old["id"]), None)
+        entry.removed.add(str(old["id"]))
+    if new is None:
+        return
+    row = edge_row(new, graph_edge)
+    if row is not None and all(str(new.get(k)) == v for k, v in entry.filters.items()):
+        entry.added[row[0]] = row
@@ -9,6 +9,13 @@ domain-scope filter extraction (``_extract_domain_filters``,
 algorithm endpoints (``create_shortest_path_handler``,
 ``create_components_handler``).
 
+Given a ``GraphSnapshotCache`` the algorithm endpoints run on a cached CSR
+snapshot (``_load_snapshot`` reads only id/source/target/weight) and fetch
+full rows just for what they return; the neighborhood endpoint walks a
+fresh snapshot when one is cached and falls back to the CTE otherwise. A
+cached snapshot is reused only while ``_edge_checksum`` — one aggregate over
+the same projection — still matches it.
+
 A leaf module by design: it must not import ``route_generator`` at module
 level (``route_generator`` imports these names back at module level so the
 ``route_generator.<name>`` call sites, importers, and patch points keep
@@ -26,6 +33,14 @@ from uuid import UUID
 from fastapi import Depends, HTTPException, Query, Request
 
 from dazzle.http.runtime.auth import AuthContext
+from dazzle.http.runtime.graph_snapshot import (
+    GraphSnapshot,
+    GraphSnapshotCache,
+    checksum_sql,
+    edge_row,
+)
+from dazzle.http.runtime.neighborhood import NeighborhoodQueryBuilder, snapshot_neighborhood
+from dazzle.http.runtime.query_builder import quote_identifier
 
 if TYPE_CHECKING:
     from dazzle.core.ir.fk_graph import FKGraph
@@ -80,12 +95,10 @@ def _build_graph_filter_sql(
     """
     if not filters:
         return ""
-    from dazzle.http.runtime.query_builder import quote_identifier as _qi
-
     clauses: list[str] = []
     for i, (field, value) in enumerate(filters.items()):
         param_name = f"_f{i}"
-        clauses.append(f"{_qi(field)} = %({param_name})s")
+        clauses.append(f"{quote_identifier(field)} = %({param_name})s")
         params[param_name] = value
     return " WHERE " + " AND ".join(clauses)
 
@@ -102,8 +115,22 @@ async def _materialize_graph(
     Returns (nx_graph, node_dicts, edge_dicts).
     """
     from dazzle.http.runtime.graph_materializer import GraphMaterializer
-    from dazzle.http.runtime.query_builder import quote_identifier
 
+    str_nodes, str_edges = _fetch_graph_rows(
+        db_manager, node_table, edge_table, graph_edge_spec, filters
+    )
+    materializer = GraphMaterializer(graph_edge=graph_edge_spec)
+    return materializer.build(str_nodes, str_edges), str_nodes, str_edges
+
+
+def _fetch_graph_rows(
+    db_manager: Any,
+    node_table: str,
+    edge_table: str,
+    graph_edge_spec: Any,
+    filters: dict[str, Any] | None = None,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Every (filtered) edge row and the node rows they touch, UUIDs stringified."""
     filter_params: dict[str, Any] = {}
     filter_sql: str = _build_graph_filter_sql(filters, filter_params)
 
@@ -157,10 +184,91 @@ async def _materialize_graph(
             result.append(out)
         return result
 
-    str_nodes = _stringify(nodes)
-    str_edges = _stringify(edges)
-    materializer = GraphMaterializer(graph_edge=graph_edge_spec)
-    return materializer.build(str_nodes, str_edges), str_nodes, str_edges
+    return _stringify(nodes), _stringify(edges)
+
+
+def _edge_checksum(
+    db_manager: Any,
+    edge_table: str,
+    graph_edge_spec: Any,
+    filters: dict[str, Any] | None,
+) -> int:
+    """The database's ``checksum_sql`` over the rows a snapshot of this graph holds."""
+    params: dict[str, Any] = {}
+    where = _build_graph_filter_sql(filters, params)
+    endpoints = " AND ".join(
+        f"{quote_identifier(c)} IS NOT NULL"
+        for c in (graph_edge_spec.source, graph_edge_spec.target)
+    )
+    where = f"{where} AND {endpoints}" if where else f" WHERE {endpoints}"
+    sql = f"SELECT {checksum_sql(graph_edge_spec)} AS checksum FROM {quote_identifier(edge_table)}"
+    with db_manager.connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(sql + where, params)  # nosemgrep
+        return int(cursor.fetchone()["checksum"])
+
+
+def _load_snapshot(
+    db_manager: Any,
+    edge_table: str,
+    graph_edge_spec: Any,
+    filters: dict[str, Any] | None,
+    snapshots: GraphSnapshotCache,
+) -> GraphSnapshot:
+    """The cached snapshot for this graph + tenant + filters, read from the DB if absent.
+
+    A cached snapshot is first checked against the table, so writes from
+    other workers or outside the CRUD services are never served stale.
+    """
+    key = snapshots.key(edge_table, filters)
+    snap = snapshots.get(
+        key, lambda: _edge_checksum(db_manager, edge_table, graph_edge_spec, filters)
+    )
+    if snap is not None:
+        return snap
+    params: dict[str, Any] = {}
+    where = _build_graph_filter_sql(filters, params)
+    columns = ["id", graph_edge_spec.source, graph_edge_spec.target]
+    if graph_edge_spec.weight_field:
+        columns.append(graph_edge_spec.weight_field)
+    select = ", ".join(quote_identifier(c) for c in columns)
+    with db_manager.connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT " + select + " FROM " + quote_identifier(edge_table) + where,  # nosemgrep
+            params,
+        )
+        records = cursor.fetchall()
+    rows = (row for row in (edge_row(r, graph_edge_spec) for r in records) if row is not None)
+    return snapshots.build(key, graph_edge_spec.directed, rows)
+
+
+def _stringify_uuids(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [{k: str(v) if isinstance(v, UUID) else v for k, v in row.items()} for row in rows]
+
+
+def _fetch_subgraph(
+    db_manager: Any,
+    node_table: str,
+    edge_table: str,
+    graph_edge_spec: Any,
+    node_ids: list[str],
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Node rows for ``node_ids`` and the edges between them, UUIDs stringified."""
+    builder = NeighborhoodQueryBuilder(
+        node_table=node_table,
+        edge_table=edge_table,
+        graph_edge=graph_edge_spec,
+    )
+    with db_manager.connection() as conn:
+        cursor = conn.cursor()
+        node_sql, node_params = builder.node_fetch_query(node_ids)
+        cursor.execute(node_sql, node_params)
+        nodes = cursor.fetchall()
+        edge_sql, edge_params = builder.edge_fetch_query(node_ids)
+        cursor.execute(edge_sql, edge_params)
+        edges = cursor.fetchall()
+    return _stringify_uuids(nodes), _stringify_uuids(edges)
 
 
 _VALID_GRAPH_FORMATS = frozenset({"cytoscape", "d3", "raw"})
@@ -177,12 +285,12 @@ async def _neighborhood_handler_body(
     edge_table: str,
     db_manager: Any,
     node_service: Any,
+    snapshots: GraphSnapshotCache | None = None,
 ) -> Any:
     """Core logic for the neighborhood graph endpoint."""
     from starlette.responses import JSONResponse
 
     from dazzle.http.runtime.graph_serializer import GraphSerializer
-    from dazzle.http.runtime.neighborhood import NeighborhoodQueryBuilder
 
     # 1. Validate format
     if format not in _VALID_GRAPH_FORMATS:
@@ -198,51 +306,35 @@ async def _neighborhood_handler_body(
         await node_service.execute(operation="read", id=seed_id), f"{entity_name} not found"
     )
 
-    # 3. Build CTE
-    builder = NeighborhoodQueryBuilder(
-        node_table=node_table,
-        edge_table=edge_table,
-        graph_edge=graph_edge_spec,
+    # 3. Reachable node IDs: a fresh cached snapshot, else the recursive CTE
+    snap = (
+        snapshots.get(
+            snapshots.key(edge_table),
+            lambda: _edge_checksum(db_manager, edge_table, graph_edge_spec, None),
+        )
+        if snapshots is not None
+        else None
     )
-    cte_sql, cte_params = builder.cte_query(str(seed_id), depth)
-
-    # 4. Execute: CTE → node fetch → edge fetch
-    with db_manager.connection() as conn:
-        cursor = conn.cursor()
-
-        # Discover reachable node IDs
-        cursor.execute(cte_sql, cte_params)
-        cte_rows = cursor.fetchall()
-        node_ids = [str(row["node_id"]) for row in cte_rows]
-
-        if not node_ids:
-            # Seed exists but has no connections — return it alone
-            node_ids = [str(seed_id)]
-
-        # Fetch full node records
-        node_sql, node_params = builder.node_fetch_query(node_ids)
-        cursor.execute(node_sql, node_params)
-        nodes = cursor.fetchall()
-
-        # Fetch edges between discovered nodes
-        edge_sql, edge_params = builder.edge_fetch_query(node_ids)
-        cursor.execute(edge_sql, edge_params)
-        edges = cursor.fetchall()
-
-    # 5. Serialize UUIDs to strings
-    def _stringify_uuids(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        result = []
-        for row in rows:
-            out = {}
-            for k, v in row.items():
-                out[k] = str(v) if isinstance(v, UUID) else v
-            result.append(out)
-        return result
-
-    nodes = _stringify_uuids(nodes)
-    edges = _stringify_uuids(edges)
-
-    # 6. Return via GraphSerializer or raw
+    if snap is not None:
+        node_ids = snapshot_neighborhood(snap, str(seed_id), depth)
+    else:
+        builder = NeighborhoodQueryBuilder(
+            node_table=node_table,
+            edge_table=edge_table,
+            graph_edge=graph_edge_spec,
+        )
+        cte_sql, cte_params = builder.cte_query(str(seed_id), depth)
+        with db_manager.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(cte_sql, cte_params)
+            node_ids = [str(row["node_id"]) for row in cursor.fetchall()]
+        # Seed exists but has no connections — return it alone
+        node_ids = node_ids or [str(seed_id)]
+
+    # 4. Fetch full node records and the edges between them (UUIDs stringified)
+    nodes, edges = _fetch_subgraph(db_manager, node_table, edge_table, graph_edge_spec, node_ids)
+
+    # 5. Return via GraphSerializer or raw
     if format == "raw":
         return JSONResponse(content={"nodes": nodes, "edges": edges})
 
@@ -268,6 +360,7 @@ def create_neighborhood_handler(
     cedar_access_spec: "EntityAccessSpec | None" = None,
     fk_graph: "FKGraph | None" = None,
     ref_targets: dict[str, str] | None = None,
+    snapshots: GraphSnapshotCache | None = None,
 ) -> Callable[..., Any]:
     """Create a handler for graph neighborhood traversal (#619 Phase 3).
 
@@ -292,6 +385,7 @@ def create_neighborhood_handler(
                 edge_table=edge_table,
                 db_manager=db_manager,
                 node_service=node_service,
+                snapshots=snapshots,
             )
 
         _auth_handler.__annotations__ = {
@@ -319,6 +413,7 @@ def create_neighborhood_handler(
             edge_table=edge_table,
             db_manager=db_manager,
             node_service=node_service,
+            snapshots=snapshots,
         )
 
     _noauth_handler.__annotations__ = {
@@ -339,6 +434,7 @@ def create_shortest_path_handler(
     db_manager: Any,
     filter_fields: list[str] | None = None,
     optional_auth_dep: Callable[..., Any] | None = None,
+    snapshots: GraphSnapshotCache | None = None,
 ) -> Callable[..., Any]:
     """Create handler for GET /{entity}/{id}/graph/shortest-path?to={target_id}."""
 
@@ -351,7 +447,7 @@ def create_shortest_path_handler(
     ) -> Any:
         from starlette.responses import JSONResponse
 
-        from dazzle.http.runtime.graph_algorithms import shortest_path
+        from dazzle.http.runtime.graph_algorithms import shortest_path, snapshot_shortest_path
         from dazzle.http.runtime.graph_serializer import GraphSerializer
 
         if format not in _VALID_GRAPH_FORMATS:
@@ -361,15 +457,23 @@ def create_shortest_path_handler(
             )
 
         filters = _extract_domain_filters(request, filter_fields)
-        g, all_nodes, all_edges = await _materialize_graph(
-            db_manager,
-            node_table,
-            edge_table,
-            graph_edge_spec,
-            filters,
-        )
-
-        result = shortest_path(g, source=str(id), target=str(to), weighted=weighted)
+        if snapshots is not None:
+            snap = _load_snapshot(db_manager, edge_table, graph_edge_spec, filters, snapshots)
+            result = snapshot_shortest_path(snap, str(id), str(to), weighted=weighted)
+            all_nodes, all_edges = (
+                _fetch_subgraph(db_manager, node_table, edge_table, graph_edge_spec, result["path"])
+                if result["path"] and format != "raw"
+                else ([], [])
+            )
+        else:
+            g, all_nodes, all_edges = await _materialize_graph(
+                db_manager,
+                node_table,
+                edge_table,
+                graph_edge_spec,
+                filters,
+            )
+            result = shortest_path(g, source=str(id), target=str(to), weighted=weighted)
 
         if format == "raw":
             return JSONResponse(content=result)
@@ -414,6 +518,7 @@ def create_components_handler(
     db_manager: Any,
     filter_fields: list[str] | None = None,
     optional_auth_dep: Callable[..., Any] | None = None,
+    snapshots: GraphSnapshotCache | None = None,
 ) -> Callable[..., Any]:
     """Create handler for GET /{entity}/graph/components."""
 
@@ -423,7 +528,7 @@ def create_components_handler(
     ) -> Any:
         from starlette.responses import JSONResponse
 
-        from dazzle.http.runtime.graph_algorithms import connected_components
+        from dazzle.http.runtime.graph_algorithms import connected_components, snapshot_components
         from dazzle.http.runtime.graph_serializer import GraphSerializer
 
         if format not in _VALID_GRAPH_FORMATS:
@@ -433,15 +538,23 @@ def create_components_handler(
             )
 
         filters = _extract_domain_filters(request, filter_fields)
-        g, all_nodes, all_edges = await _materialize_graph(
-            db_manager,
-            node_table,
-            edge_table,
-            graph_edge_spec,
-            filters,
-        )
-
-        result = connected_components(g)
+        if snapshots is not None:
+            snap = _load_snapshot(db_manager, edge_table, graph_edge_spec, filters, snapshots)
+            result = snapshot_components(snap)
+            all_nodes, all_edges = (
+                ([], [])
+                if format == "raw"
+                else _fetch_graph_rows(db_manager, node_table, edge_table, graph_edge_spec, filters)
+            )
+        else:
+            g, all_nodes, all_edges = await _materialize_graph(
+                db_manager,
+                node_table,
+                edge_table,
+                graph_edge_spec,
+                filters,
+            )
+            result = connected_components(g)
 
         if format == "raw":
             return JSONResponse(content=result)
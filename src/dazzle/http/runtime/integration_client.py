@@ -0,0 +1,370 @@
+"""Pooled outbound HTTP for integrations — one client, bulkhead and breaker each.
+
+``MappingExecutor`` and ``IntegrationExecutor`` used to open a fresh
+``httpx.AsyncClient`` per call: a new TCP + TLS handshake for every
+entity event, and nothing to stop one dead partner API from tying up
+every event handler. :class:`IntegrationClientPool` keeps, per
+integration name:
+
+* **A long-lived client** — keep-alive connections, a connection cap
+  (an integration talks to one host, so this is the per-host limit),
+  and HTTP/2 when asked for and the ``h2`` package is installed.
+* **A bulkhead** — at most ``max_concurrency`` calls in flight. Callers
+  beyond that wait up to ``queue_timeout`` and then fail with
+  :class:`BulkheadFullError` instead of queueing without bound.
+* **A circuit breaker** — after ``failure_threshold`` consecutive
+  failures (transport errors, 429 and 5xx) the circuit opens and calls
+  fail fast with :class:`CircuitOpenError` for ``reset_timeout``
+  seconds. Then a single probe is let through; its outcome closes or
+  re-opens the circuit.
+
+Settings default to :class:`ClientSettings` and can be overridden per
+integration with ``DAZZLE_API_{NAME}_{SETTING}`` environment variables
+(the prefix of ``DAZZLE_API_{NAME}_URL``), e.g.
+``DAZZLE_API_SUMSUB_HTTP2=1`` or ``DAZZLE_API_SUMSUB_MAX_CONCURRENCY=4``.
+
+One pool per app (:func:`app_client_pool`, ADR-0005 ServerState); its
+clients are closed by the app's lifespan shutdown.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import os
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, fields, replace
+from functools import cache
+from typing import Any
+
+import httpx
+
+from dazzle.core.http_client import BACKOFF_SECONDS, AsyncAttemptCallback, async_retrying_request
+from dazzle.http.runtime.lifespan_hooks import register_lifespan_hook
+
+logger = logging.getLogger(__name__)
+
+
+class IntegrationUnavailableError(RuntimeError):
+    """The pool refused a call without contacting the upstream."""
+
+
+class CircuitOpenError(IntegrationUnavailableError):
+    """The integration's circuit is open — the upstream is failing."""
+
+
+class BulkheadFullError(IntegrationUnavailableError):
+    """Every concurrency slot stayed busy for the whole ``queue_timeout``."""
+
+
+#: Failures worth retrying later: the upstream was unreachable, slow or
+#: shedding load, or the pool refused the call. Anything else (4xx, a bad
+#: URL) will fail the same way again.
+TRANSIENT_ERRORS: tuple[type[Exception], ...] = (
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    httpx.RemoteProtocolError,
+    IntegrationUnavailableError,
+)
+
+
+def is_transient_status(status_code: int) -> bool:
+    """True for responses that say "try again later" (429, 502, 503, 504)."""
+    return status_code in (429, 502, 503, 504)
+
+
+def _counts_as_failure(status_code: int) -> bool:
+    return status_code == 429 or status_code >= 500
+
+
+def env_name(name: str) -> str:
+    """``"my-api.v2"`` → ``"MY_API_V2"`` — the ``DAZZLE_API_{NAME}_*`` infix."""
+    return name.upper().replace("-", "_").replace(".", "_")
+
+
+@dataclass(frozen=True)
+class ClientSettings:
+    """Per-integration client, bulkhead and breaker settings."""
+
+    timeout: float = 30.0
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    max_concurrency: int = 10
+    queue_timeout: float = 5.0
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+
+    def with_env_overrides(self, name: str) -> ClientSettings:
+        """Apply ``DAZZLE_API_{NAME}_{FIELD}`` overrides; bad values are logged and ignored."""
+        prefix = f"DAZZLE_API_{env_name(name)}_"
+        updates: dict[str, Any] = {}
+        for f in fields(self):
+            raw = os.environ.get(prefix + f.name.upper(), "").strip()
+            if not raw:
+                continue
+            kind = type(getattr(self, f.name))
+            if kind is bool:
+                updates[f.name] = raw.lower() in ("1", "true", "yes", "on")
+                continue
+            try:
+                updates[f.name] = kind(raw)
+            except ValueError:
+                logger.warning("Ignoring %s%s=%r: not a %s", prefix, f.name.upper(), raw, kind)
+        return replace(self, **updates)
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker (closed → open → half-open).
+
+    Not a lock: ``allow`` and the ``record_*`` calls run on the event loop
+    thread, so no two of them interleave.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._threshold = max(1, failure_threshold)
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        """``"closed"``, ``"open"`` or ``"half_open"``."""
+        if self._opened_at is None:
+            return "closed"
+        if self._clock() - self._opened_at >= self._reset_timeout:
+            return "half_open"
+        return "open"
+
+    @property
+    def failures(self) -> int:
+        return self._failures
+
+    def retry_after(self) -> float:
+        """Seconds until the circuit lets a probe through (0 unless open)."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self._reset_timeout - self._clock())
+
+    def allow(self) -> bool:
+        """May a call go out now? Half-open admits one probe at a time."""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._probing or self._failures >= self._threshold:
+            self._opened_at = self._clock()
+        self._probing = False
+
+    def release(self) -> None:
+        """End a call that says nothing about upstream health (cancelled, caller error).
+
+        Frees a half-open probe slot so the next call can probe instead.
+        """
+        self._probing = False
+
+
+@cache
+def _h2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def _build_client(name: str, settings: ClientSettings) -> httpx.AsyncClient:
+    http2 = settings.http2 and _h2_available()
+    if settings.http2 and not http2:
+        logger.warning(
+            "Integration '%s' asks for HTTP/2 but the 'h2' package is not installed "
+            "— using HTTP/1.1 (pip install 'httpx[http2]')",
+            name,
+        )
+    return httpx.AsyncClient(  # DZ-HTTP-NORETRY  pooled; calls retry via async_retrying_request
+        timeout=settings.timeout,
+        limits=httpx.Limits(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+            keepalive_expiry=settings.keepalive_expiry,
+        ),
+        http2=http2,
+    )
+
+
+@dataclass
+class _Slot:
+    settings: ClientSettings
+    client: httpx.AsyncClient
+    bulkhead: asyncio.Semaphore
+    breaker: CircuitBreaker
+    in_flight: int = 0
+
+
+class IntegrationClientPool:
+    """Long-lived clients, bulkheads and circuit breakers keyed by integration name.
+
+    Args:
+        defaults: Settings before per-integration env overrides.
+        clock: Monotonic clock for the breakers (tests pass a fake).
+    """
+
+    def __init__(
+        self,
+        defaults: ClientSettings | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._defaults = defaults or ClientSettings()
+        self._clock = clock
+        self._slots: dict[str, _Slot] = {}
+
+    def _slot(self, name: str) -> _Slot:
+        slot = self._slots.get(name)
+        if slot is None:
+            settings = self._defaults.with_env_overrides(name)
+            slot = _Slot(
+                settings=settings,
+                client=_build_client(name, settings),
+                bulkhead=asyncio.Semaphore(max(1, settings.max_concurrency)),
+                breaker=CircuitBreaker(
+                    settings.failure_threshold, settings.reset_timeout, clock=self._clock
+                ),
+            )
+            self._slots[name] = slot
+        return slot
+
+    def client(self, name: str) -> httpx.AsyncClient:
+        """The shared client for ``name`` (created on first use)."""
+        return self._slot(name).client
+
+    def breaker(self, name: str) -> CircuitBreaker:
+        return self._slot(name).breaker
+
+    async def request(
+        self,
+        name: str,
+        method: str,
+        url: str,
+        *,
+        max_retries: int = 0,
+        backoff: tuple[float, ...] = BACKOFF_SECONDS,
+        on_attempt: AsyncAttemptCallback | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send one request on ``name``'s client, through its bulkhead and breaker.
+
+        ``max_retries`` defaults to 0: callers on an event path park
+        transient failures for later re-delivery rather than sleeping
+        through a backoff here. A call that retries counts as one
+        outcome for the breaker. Only transport failures in
+        :data:`TRANSIENT_ERRORS` and 429/5xx responses count against the
+        breaker; a cancelled call records nothing.
+
+        Raises:
+            CircuitOpenError: The circuit is open (no request was sent).
+            BulkheadFullError: No concurrency slot freed up in time.
+            httpx.HTTPError: Transport failure after any retries.
+        """
+        slot = self._slot(name)
+        if slot.breaker.state == "open":
+            raise self._open_error(name, slot)
+        try:
+            await asyncio.wait_for(slot.bulkhead.acquire(), timeout=slot.settings.queue_timeout)
+        except TimeoutError:
+            raise BulkheadFullError(
+                f"Integration '{name}' has {slot.settings.max_concurrency} calls in flight; "
+                f"no slot freed within {slot.settings.queue_timeout:g}s"
+            ) from None
+        slot.in_flight += 1
+        try:
+            if not slot.breaker.allow():
+                raise self._open_error(name, slot)
+            try:
+                resp = await async_retrying_request(
+                    slot.client,
+                    method,
+                    url,
+                    max_retries=max_retries,
+                    backoff=backoff,
+                    on_attempt=on_attempt,
+                    **kwargs,
+                )
+            except TRANSIENT_ERRORS:
+                slot.breaker.record_failure()
+                raise
+            except BaseException:
+                # Cancellation, or a request that could never succeed (bad
+                # URL, unsupported protocol) — not the upstream's fault.
+                slot.breaker.release()
+                raise
+            if _counts_as_failure(resp.status_code):
+                slot.breaker.record_failure()
+            else:
+                slot.breaker.record_success()
+            return resp
+        finally:
+            slot.in_flight -= 1
+            slot.bulkhead.release()
+
+    @staticmethod
+    def _open_error(name: str, slot: _Slot) -> CircuitOpenError:
+        return CircuitOpenError(
+            f"Integration '{name}' circuit is open after {slot.breaker.failures} "
+            f"consecutive failures; next probe in {slot.breaker.retry_after():.0f}s"
+        )
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Per-integration breaker state and in-flight calls."""
+        return {
+            name: {
+                "state": slot.breaker.state,
+                "failures": slot.breaker.failures,
+                "in_flight": slot.in_flight,
+                "max_concurrency": slot.settings.max_concurrency,
+            }
+            for name, slot in self._slots.items()
+        }
+
+    async def aclose(self) -> None:
+        """Close every client. The pool can be reused; clients are rebuilt on demand."""
+        slots, self._slots = self._slots, {}
+        for name, slot in slots.items():
+            try:
+                await slot.client.aclose()
+            except Exception:
+                logger.warning("Closing HTTP client for integration '%s' failed", name)
+
+
+def app_client_pool(app: Any) -> IntegrationClientPool:
+    """Get-or-create the per-app :class:`IntegrationClientPool` on ``app.state``.
+
+    ``MappingExecutor`` and ``IntegrationExecutor`` are wired in different
+    setup paths; both fetch this one instance so an integration used by
+    both shares its connections, bulkhead and breaker. The first call
+    registers a lifespan shutdown hook that closes the clients.
+    """
+    pool = getattr(app.state, "integration_client_pool", None)
+    if pool is None:
+        pool = IntegrationClientPool()
+        app.state.integration_client_pool = pool
+        register_lifespan_hook(app, shutdown=pool.aclose)
+    return pool
@@ -8,9 +8,13 @@ Data flow::
     Surface submit → post-submit hook → IntegrationExecutor.execute_action()
         → resolve service config from env vars
         → evaluate call_mapping (form/entity data → request params)
-        → HTTP call via httpx
+        → HTTP call on the service's pooled client (IntegrationClientPool)
         → evaluate response_mapping (response → entity fields)
         → return ActionResult
+
+The call shares the service's keep-alive client, bulkhead and circuit
+breaker with ``MappingExecutor``. An open circuit fails the action at
+once instead of holding the form submit for the full timeout.
 """
 
 from __future__ import annotations
@@ -21,7 +25,8 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from dazzle.core import ir
-from dazzle.core.http_client import async_retrying_request
+from dazzle.core.http_client import MAX_RETRIES
+from dazzle.http.runtime.integration_client import IntegrationClientPool
 
 logger = logging.getLogger(__name__)
 
@@ -61,18 +66,21 @@ class ActionResult:
 class IntegrationExecutor:
     """Execute integration actions against external APIs.
 
-    Initialized with the ``AppSpec`` and optional pre-built ``fragment_sources``.
-    Provides methods to resolve services, evaluate expressions/mappings, and
-    make HTTP calls.
+    Initialized with the ``AppSpec``, optional pre-built ``fragment_sources``
+    and an optional shared ``client_pool`` (``app_client_pool``; a private
+    pool otherwise). Provides methods to resolve services, evaluate
+    expressions/mappings, and make HTTP calls.
     """
 
     def __init__(
         self,
         app_spec: ir.AppSpec | None = None,
         fragment_sources: dict[str, dict[str, Any]] | None = None,
+        client_pool: IntegrationClientPool | None = None,
     ) -> None:
         self._app_spec = app_spec
         self._fragment_sources = fragment_sources or {}
+        self._client_pool = client_pool if client_pool is not None else IntegrationClientPool()
         # Build a lookup of integration actions by surface name
         self._actions_by_surface: dict[str, list[IntegrationAction]] = {}
         if app_spec:
@@ -186,20 +194,16 @@ class IntegrationExecutor:
 
         # Make HTTP call
         try:
-            import httpx
-
             url = f"{service.base_url.rstrip('/')}/{action.call_operation}"
 
-            async with httpx.AsyncClient(
-                timeout=30.0
-            ) as client:  # DZ-HTTP-NORETRY  retry via async_retrying_request below
-                resp = await async_retrying_request(
-                    client,
-                    "POST",
-                    url,
-                    json=call_params,
-                    headers=service.headers,
-                )
+            resp = await self._client_pool.request(
+                action.call_service,
+                "POST",
+                url,
+                max_retries=MAX_RETRIES,
+                json=call_params,
+                headers=service.headers,
+            )
 
             response_data: dict[str, Any] = {}
             try:
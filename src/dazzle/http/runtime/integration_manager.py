@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Any
 
 from dazzle.core.ir import AppSpec, ChannelKind
 from dazzle.core.ir import ChannelSpec as IRChannelSpec
+from dazzle.http.runtime.integration_client import app_client_pool
 
 if TYPE_CHECKING:
     from fastapi import FastAPI
@@ -241,6 +242,7 @@ class IntegrationManager:
             self.integration_executor = IntegrationExecutor(
                 app_spec=self._appspec,
                 fragment_sources=self._fragment_sources,
+                client_pool=app_client_pool(self._app),
             )
 
             logging.getLogger(__name__).info("Integration executor initialized")
@@ -19,6 +19,13 @@ Design notes
   itself being cancelled) ends the loop.
 * Returns ``stats`` dict so tests + cycle-5b CLI can surface
   throughput / outcome counts to the operator.
+* ``concurrency`` messages may be in flight at once (default 1 —
+  strictly one after another). The loop only dequeues when a slot is
+  free, and on stop it waits for in-flight messages to finish.
+* On a `PostgresJobQueue` each message is settled once
+  `process_one` returns: acked, or dead-lettered for a
+  ``DEAD_LETTER`` outcome. A message whose `process_one` crashed
+  stays leased and is handed out again when the lease expires.
 """
 
 from __future__ import annotations
@@ -26,10 +33,12 @@ from __future__ import annotations
 import asyncio
 import logging
 from collections.abc import Mapping
+from concurrent.futures import Executor
 from typing import Any
 
-from dazzle.http.runtime.job_queue import JobQueue
+from dazzle.http.runtime.job_queue import JobMessage, JobQueue
 from dazzle.http.runtime.job_worker import WorkerOutcome, process_one
+from dazzle.http.runtime.postgres_job_queue import PostgresJobQueue
 
 logger = logging.getLogger(__name__)
 
@@ -41,13 +50,15 @@ async def run_worker_loop(
     job_service: Any,
     stop_event: asyncio.Event,
     idle_timeout: float = 1.0,
+    concurrency: int = 1,
+    executor: Executor | None = None,
 ) -> dict[str, int]:
     """Pump the queue until ``stop_event`` is set.
 
     Args:
-        queue: The `JobQueue` to dequeue from. cycle 3's
-            `InMemoryJobQueue` for tests / single-process; cycle 8
-            will add a `RedisJobQueue` satisfying the same Protocol.
+        queue: The `JobQueue` to dequeue from — `InMemoryJobQueue`
+            for tests / single-process, `RedisJobQueue` or
+            `PostgresJobQueue` across processes.
         job_specs: ``{job_name: JobSpec}`` from ``appspec.jobs``.
         job_service: The framework's `JobRun` service. None
             tolerated for early-bootstrap paths (matches
@@ -56,6 +67,9 @@ async def run_worker_loop(
             wire SIGINT / SIGTERM to ``stop_event.set()``.
         idle_timeout: Seconds to wait per dequeue when the queue is
             empty — bounds the shutdown latency.
+        concurrency: Messages processed at once.
+        executor: Process pool handed to `process_one` for sync
+            handlers.
 
     Returns:
         Stats dict mapping outcome code → count, plus a
@@ -71,16 +85,32 @@ async def run_worker_loop(
         "polled": 0,
         "loop_errors": 0,
     }
+    specs = dict(job_specs)
+    slots = asyncio.Semaphore(max(1, concurrency))
+    in_flight: set[asyncio.Task[None]] = set()
 
-    logger.info("Worker loop starting (idle_timeout=%.1fs)", idle_timeout)
+    async def _run(message: JobMessage) -> None:
+        try:
+            await _process_and_settle(message, specs, job_service, queue, executor, stats)
+        finally:
+            slots.release()
+
+    logger.info(
+        "Worker loop starting (idle_timeout=%.1fs, concurrency=%d)", idle_timeout, concurrency
+    )
 
     while not stop_event.is_set():
+        await slots.acquire()
+        if stop_event.is_set():
+            # Stopped while waiting for a slot — take no new work.
+            slots.release()
+            break
         try:
             message = await queue.dequeue(timeout=idle_timeout)
         except Exception:
-            # Queue impl could blow up (Redis down, etc.) — log and
-            # back off. Cycle 8's RedisJobQueue will have its own
-            # reconnect logic; this is the outer safety net.
+            # Queue impl could blow up (Redis / Postgres down, etc.) —
+            # log and back off; this is the outer safety net.
+            slots.release()
             stats["loop_errors"] += 1
             logger.warning("Queue dequeue failed — backing off", exc_info=True)
             await asyncio.sleep(idle_timeout)
@@ -89,26 +119,56 @@ async def run_worker_loop(
         if message is None:
             # Idle tick — let the stop_event check at the top of
             # the next loop fire promptly.
+            slots.release()
             stats["polled"] += 1
             continue
 
-        try:
-            outcome = await process_one(
-                message,
-                job_specs=dict(job_specs),
-                job_service=job_service,
-                queue=queue,
-            )
-            stats[outcome] = stats.get(outcome, 0) + 1
-        except Exception:
-            # `process_one` already swallows handler exceptions; an
-            # exception here means the worker plumbing itself blew
-            # up. Count it but keep the loop alive.
-            stats["loop_errors"] += 1
-            logger.exception(
-                "process_one crashed for job %s — continuing loop",
-                message.job_name,
-            )
+        task = asyncio.create_task(_run(message))
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
 
+    if in_flight:
+        await asyncio.gather(*in_flight)
     logger.info("Worker loop exiting; stats=%s", stats)
     return stats
+
+
+async def _process_and_settle(
+    message: JobMessage,
+    job_specs: dict[str, Any],
+    job_service: Any,
+    queue: JobQueue,
+    executor: Executor | None,
+    stats: dict[str, int],
+) -> None:
+    """Run one message through `process_one`, count its outcome and settle it."""
+    try:
+        outcome = await process_one(
+            message,
+            job_specs=job_specs,
+            job_service=job_service,
+            queue=queue,
+            executor=executor,
+        )
+    except Exception:
+        # `process_one` already swallows handler exceptions; an
+        # exception here means the worker plumbing itself blew
+        # up. Count it but keep the loop alive.
+        stats["loop_errors"] += 1
+        logger.exception(
+            "process_one crashed for job %s — continuing loop",
+            message.job_name,
+        )
+        return
+    stats[outcome] = stats.get(outcome, 0) + 1
+    if not isinstance(queue, PostgresJobQueue):
+        return
+    try:
+        if outcome == WorkerOutcome.DEAD_LETTER:
+            await queue.dead_letter(message.job_run_id, "retries exhausted")
+        else:
+            await queue.ack(message.job_run_id)
+    except Exception:
+        # Left leased — redelivered once the lease runs out.
+        stats["loop_errors"] += 1
+        logger.warning("Settling job %s failed", message.job_run_id, exc_info=True)
@@ -5,7 +5,8 @@ Distinct from `llm_queue.py` — that's the LLM-specific specialisation
 the generic primitive a project author's `job X:` declarations get
 enqueued into. Cycle 4 will add a Redis-backed implementation;
 cycle 3 ships an asyncio in-memory queue that's enough to wire the
-end-to-end flow and exercise the worker shape.
+end-to-end flow and exercise the worker shape. `PostgresJobQueue`
+(``postgres_job_queue.py``) is the durable table-backed option.
 
 Design notes
 ------------
@@ -42,12 +43,16 @@ class JobMessage:
         job_run_id: Foreign key to the `JobRun` row created at
             submit time. The worker writes status transitions
             against this row.
+        priority: Claim order on queues that support it
+            (`PostgresJobQueue`) — higher first. Carried so a retry
+            keeps its job's priority.
     """
 
     job_name: str
     payload: dict[str, Any] = field(default_factory=dict)
     attempt: int = 1
     job_run_id: str = ""
+    priority: int = 0
 
 
 class JobQueue(Protocol):
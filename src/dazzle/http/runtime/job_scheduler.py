@@ -1,38 +1,53 @@
 """Cron-driven job scheduler loop (#953 cycle 7b).
 
-Wraps cycle-7's pure cron primitives in an async loop that submits
-jobs to the cycle-3 queue when their cron matches. Cycle-9's
-`dazzle worker` CLI will start this alongside the worker loop.
+Submits scheduled jobs to the cycle-3 queue when their cron fires.
+The `dazzle worker` CLI starts this alongside the worker loop — on
+every replica.
 
 Design notes
 ------------
 
-* Each tick reads the current UTC time, calls `due_jobs`, and
-  enqueues each due job. `last_fired_minute` is tracked per job
-  to prevent double-firing if the loop ticks faster than a minute
-  or catches up after a slow cycle.
-* `tick_interval` defaults to 30s — fires twice per minute so a
-  cron-on-the-minute job is enqueued within 30s of its trigger
-  time. Tests can pass smaller values for fast feedback.
+* Backed by the shared cluster scheduler
+  (``dazzle.core.coordination.schedule``). With a ``dsn``, replicas
+  elect one leader through a Postgres advisory-lock lease, and every
+  fire is claimed in ``schedule_fires`` before it is enqueued, so a
+  job fires exactly once per window however many workers run.
+  Without one, an in-memory ledger gives the old single-process
+  behaviour.
+* Windows missed while no worker was leading (a deploy) are replayed
+  per ``JobSchedule.catch_up``: ``skip``, ``latest`` (default) or
+  ``all``.
+* The loop sleeps until the next fire time rather than ticking;
+  ``tick_interval`` only caps the sleep, which is how often a
+  follower retries the lease.
 * All exceptions inside the loop body are caught + logged + counted
   in `loop_errors` — the scheduler must keep ticking even if a
-  single submit blows up (queue down, etc.). Mirrors the cycle-5
-  worker loop's resilience contract.
+  single submit blows up (queue down, etc.). A failed submit
+  releases its claim and is retried on the next pass.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import UTC, datetime
+import uuid
+from collections.abc import Mapping
+from datetime import datetime
+from functools import partial
 from typing import Any
 
-from dazzle.http.runtime.cron import (
-    CronExpression,
-    CronParseError,
-    due_jobs,
-    parse_cron,
+import psycopg
+
+from dazzle.core.coordination.schedule import (
+    JOB_SCHEDULER_LOCK_KEY,
+    MemoryScheduleLedger,
+    PgScheduleLedger,
+    ScheduleRunner,
+    cron_entry,
 )
+from dazzle.core.cron import CronExpression, CronParseError, parse_cron
+from dazzle.core.db_url import normalise_postgres_scheme
+from dazzle.core.ir.jobs import JobCatchUp
 from dazzle.http.runtime.job_queue import JobQueue
 
 logger = logging.getLogger(__name__)
@@ -64,77 +79,88 @@ def parse_scheduled_jobs(jobs: list[Any]) -> list[tuple[str, CronExpression]]:
     return scheduled
 
 
+def scheduled_catch_up(jobs: list[Any]) -> dict[str, JobCatchUp]:
+    """`{job_name: catch_up policy}` for every scheduled job."""
+    return {
+        job.name: getattr(job.schedule, "catch_up", JobCatchUp.LATEST)
+        for job in jobs
+        if getattr(job, "schedule", None) is not None
+    }
+
+
+def schedule_ledger(dsn: str = "") -> PgScheduleLedger | MemoryScheduleLedger:
+    """Postgres-backed ledger when ``dsn`` is set, else in-memory."""
+    if not dsn:
+        return MemoryScheduleLedger()
+    return PgScheduleLedger(
+        partial(psycopg.connect, normalise_postgres_scheme(dsn)),
+        lock_key=JOB_SCHEDULER_LOCK_KEY,
+        worker=f"scheduler-{uuid.uuid4().hex[:8]}",
+    )
+
+
 async def run_scheduler_loop(
     *,
     scheduled: list[tuple[str, CronExpression]],
     queue: JobQueue,
     stop_event: asyncio.Event,
     tick_interval: float = 30.0,
+    catch_up: Mapping[str, JobCatchUp] | None = None,
+    dsn: str = "",
 ) -> dict[str, int]:
-    """Tick every `tick_interval` seconds, submitting due jobs.
+    """Submit each scheduled job when its cron fires.
 
     Args:
         scheduled: `(job_name, parsed_cron)` pairs from
             `parse_scheduled_jobs`. Empty list = scheduler returns
             immediately (no purely-scheduled jobs in this app).
         queue: Cycle-3 `JobQueue`. Each due job becomes one
-            submit per minute.
+            submit per fire time.
         stop_event: Trip to end the loop. Cycle-9 CLI wires
             SIGINT/SIGTERM to `stop_event.set()`.
-        tick_interval: Seconds between ticks. Default 30s ensures
-            cron-on-the-minute jobs fire within 30s. Tests pass
-            smaller values for fast feedback.
+        tick_interval: Longest sleep between passes. The loop
+            otherwise wakes exactly at the next fire time.
+        catch_up: Per-job missed-window policy from
+            `scheduled_catch_up`; jobs not listed use ``latest``.
+        dsn: Postgres DSN for the leader lease + fire ledger.
+            Empty = single-process, in-memory ledger.
 
     Returns:
-        Stats dict with `enqueued` (count of submits), `ticks`,
-        `loop_errors`. Dashboards / tests can rely on these keys
-        being present even with zero scheduled jobs.
+        Stats dict with `enqueued` (count of submits), `skipped`
+        (missed windows dropped by policy), `ticks`, `loop_errors`.
+        Dashboards / tests can rely on `enqueued` / `ticks` /
+        `loop_errors` being present even with zero scheduled jobs.
     """
     stats: dict[str, int] = {"enqueued": 0, "ticks": 0, "loop_errors": 0}
-    last_fired: dict[str, datetime] = {}
 
     if not scheduled:
         logger.info("Scheduler loop: no scheduled jobs — exiting")
         return stats
 
+    policies = catch_up or {}
+    entries = [
+        cron_entry(name, cron, policies.get(name, JobCatchUp.LATEST)) for name, cron in scheduled
+    ]
+
+    async def _submit(name: str, fire_at: datetime) -> None:
+        await queue.submit(name, payload={"scheduled_at": fire_at.isoformat()})
+
     logger.info(
-        "Scheduler loop starting (%d scheduled job%s, tick_interval=%.1fs)",
+        "Scheduler loop starting (%d scheduled job%s, %s ledger)",
         len(scheduled),
         "" if len(scheduled) == 1 else "s",
-        tick_interval,
+        "postgres" if dsn else "in-memory",
+    )
+    runner = ScheduleRunner(
+        entries, _submit, schedule_ledger(dsn), scope="job", max_sleep=tick_interval
+    )
+    result = await runner.run(stop_event)
+    stats.update(
+        enqueued=result["fired"],
+        skipped=result["skipped"],
+        ticks=result["ticks"],
+        loop_errors=result["loop_errors"],
     )
-
-    while not stop_event.is_set():
-        stats["ticks"] += 1
-        try:
-            now = datetime.now(UTC)
-            due = due_jobs(scheduled, now=now, last_fired_minute=last_fired)
-            minute_now = now.replace(second=0, microsecond=0)
-            for name in due:
-                try:
-                    await queue.submit(name, payload={"scheduled_at": minute_now.isoformat()})
-                    last_fired[name] = minute_now
-                    stats["enqueued"] += 1
-                except Exception:
-                    stats["loop_errors"] += 1
-                    logger.warning(
-                        "Scheduler enqueue failed for %s — skipping this tick",
-                        name,
-                        exc_info=True,
-                    )
-        except Exception:
-            # The cycle's own dispatch (due_jobs / now()) blew up —
-            # rare but log + count + keep ticking.
-            stats["loop_errors"] += 1
-            logger.exception("Scheduler tick crashed — continuing")
-
-        # Wait for the next tick OR the stop event, whichever comes
-        # first. Using wait_for(stop_event.wait(), timeout=...) keeps
-        # shutdown latency bounded by tick_interval.
-        try:
-            await asyncio.wait_for(stop_event.wait(), timeout=tick_interval)
-        except TimeoutError:
-            pass  # Normal — next tick
 
     logger.info("Scheduler loop exiting; stats=%s", stats)
     return stats
@@ -7,9 +7,10 @@ Processes a single dequeued ``JobMessage`` end-to-end:
   3. Resolve the handler from ``JobSpec.run`` via cycle-3's
      ``resolve_handler`` (lazy — failures land in
      ``error_message``).
-  4. Invoke the handler with the message payload. Sync handlers
-     run via ``asyncio.to_thread`` so a blocking handler doesn't
-     stall the worker loop.
+  4. Invoke the handler with the message payload. Given an
+     ``executor`` (``dazzle worker --processes N``), sync handlers
+     run in that process pool, off the event loop and out from
+     under the GIL; async handlers always run on the loop.
   5. On success: write ``status="completed"``, ``finished_at``,
      ``duration_ms``.
   6. On failure: increment ``attempt_number`` and either re-enqueue
@@ -24,16 +25,19 @@ a stub job service is enough to exercise the full state machine.
 from __future__ import annotations
 
 import asyncio
+import functools
 import inspect
 import logging
 import time
-from datetime import UTC, datetime
+from concurrent.futures import Executor
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from dazzle.core import ir
 from dazzle.core.ir.jobs import JobBackoff
 from dazzle.http.runtime.job_handler import JobHandlerNotFound, resolve_handler
 from dazzle.http.runtime.job_queue import JobMessage, JobQueue
+from dazzle.http.runtime.postgres_job_queue import PostgresJobQueue
 
 logger = logging.getLogger(__name__)
 
@@ -98,6 +102,7 @@ async def process_one(
     job_specs: dict[str, Any],
     job_service: Any,
     queue: JobQueue,
+    executor: Executor | None = None,
 ) -> str:
     """Process one dequeued message; return the cycle-4 outcome code.
 
@@ -113,6 +118,8 @@ async def process_one(
         queue: The same queue the message came from. Used to
             re-enqueue on retry-eligible failures with
             ``attempt + 1``.
+        executor: Process pool for sync handlers; ``None`` calls them
+            directly.
 
     Returns:
         One of the :class:`WorkerOutcome` constants — caller (tests
@@ -148,16 +155,7 @@ async def process_one(
     )
 
     try:
-        handler = resolve_handler(spec.run)
-        result = handler(**message.payload)
-        if inspect.isawaitable(result):
-            await result
-        elif inspect.iscoroutinefunction(handler):
-            # Belt-and-braces — `iscoroutinefunction` catches the
-            # case where `handler(**payload)` returned None because
-            # the body was unreachable; a coroutine itself would
-            # already match `isawaitable`.
-            pass
+        await _invoke_handler(spec.run, message.payload, executor)
     except JobHandlerNotFound as exc:
         # Misconfigured handler path — never retry; the spec needs
         # editing, not a retry.
@@ -194,6 +192,32 @@ async def process_one(
     return WorkerOutcome.COMPLETED
 
 
+async def _invoke_handler(
+    run_path: str, payload: dict[str, Any], executor: Executor | None
+) -> None:
+    """Resolve and call the handler — sync ones in ``executor`` when given.
+
+    The pool is handed the handler's path rather than the function, so
+    only the path and payload are pickled; the child resolves it itself.
+    """
+    handler = resolve_handler(run_path)
+    if executor is not None and not inspect.iscoroutinefunction(handler):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(executor, functools.partial(_run_resolved, run_path, payload))
+        return
+    result = handler(**payload)
+    if inspect.isawaitable(result):
+        await result
+
+
+def _run_resolved(run_path: str, payload: dict[str, Any]) -> None:
+    """Process-pool entry point: resolve ``run_path`` in the child and call it.
+
+    The return value is dropped — it would have to be picklable to come back.
+    """
+    resolve_handler(run_path)(**payload)
+
+
 async def _handle_failure(
     *,
     spec: ir.JobSpec,
@@ -236,19 +260,23 @@ async def _handle_failure(
         )
         backoff = getattr(spec, "retry_backoff", JobBackoff.EXPONENTIAL)
         delay = _compute_backoff_delay(backoff, message.attempt)
+        if isinstance(queue, PostgresJobQueue):
+            # The table holds the retry until its backoff has passed, so
+            # this worker moves straight on to the next message.
+            await queue.submit(
+                message.job_name,
+                payload=message.payload,
+                attempt=message.attempt + 1,
+                priority=message.priority,
+                run_at=_now() + timedelta(seconds=delay),
+            )
+            return WorkerOutcome.RETRIED
         if delay > 0:
             # Trade-off: the in-process ``asyncio.sleep`` blocks this
             # worker iteration for ``delay`` seconds — the single
             # worker can't pick up other messages during that window.
-            # A more scalable design is delayed-queue delivery via
-            # ``queue.submit(..., available_at=...)`` so the broker
-            # holds the message until the wakeup time and any worker
-            # can claim it. That requires queue-backend changes
-            # (Redis Streams ``XADD`` with a delay token, SQS visibility
-            # delay, etc.) and is left for a follow-up. For current
-            # low-volume background work this is acceptable; for
-            # high-throughput workloads, throughput will be visibly
-            # affected during retry storms.
+            # Only the in-memory and Redis queues get here; the
+            # Postgres queue takes the delay as ``run_at`` above.
             logger.info(
                 "Job %s backoff (%s, attempt %d): sleeping %.2fs before re-enqueue",
                 message.job_name,
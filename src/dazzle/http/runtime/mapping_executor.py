@@ -11,10 +11,20 @@ Data flow::
         → interpolate URL template with entity fields
         → apply request_mapping (entity → request body)
         → check cache (ApiResponseCache, if available)
-        → HTTP call via httpx (on cache miss)
+        → HTTP call on the integration's pooled client (on cache miss)
         → cache response (for GET requests)
         → apply response_mapping (response → entity field updates)
-        → handle errors per ErrorStrategy
+        → transient failure + ``retry`` → park for re-delivery
+        → otherwise handle errors per ErrorStrategy
+
+Outbound calls go through
+:class:`~dazzle.http.runtime.integration_client.IntegrationClientPool`: one
+keep-alive client per integration behind a bulkhead and a circuit breaker.
+Each call is a single attempt — retries never sleep inside
+``handle_event``. A retryable failure is parked in a
+:mod:`~dazzle.http.runtime.mapping_redelivery` store and re-run by the
+executor's redelivery loop (``start()`` / ``shutdown()``) once its backoff
+has elapsed.
 
 Cache layer (optional, requires ``redis`` package and ``REDIS_URL``)::
 
@@ -24,17 +34,15 @@ Cache layer (optional, requires ``redis`` package and ``REDIS_URL``)::
 
 from __future__ import annotations
 
-import asyncio  # noqa: F401 — required by tests that mock asyncio.sleep on this module
+import asyncio
 import logging
 import os
 import re
 from dataclasses import dataclass, field
+from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-import httpx
-
 from dazzle.core import ir
-from dazzle.core.http_client import async_retrying_request
 from dazzle.core.ir.expressions import FieldRef, Literal
 from dazzle.core.ir.integrations import (
     AuthType,
@@ -42,6 +50,18 @@ from dazzle.core.ir.integrations import (
     MappingTriggerType,
 )
 from dazzle.http.runtime.event_bus import EntityEvent, EntityEventType
+from dazzle.http.runtime.integration_client import (
+    TRANSIENT_ERRORS,
+    IntegrationClientPool,
+    is_transient_status,
+)
+from dazzle.http.runtime.mapping_redelivery import (
+    REDELIVERY_INTERVAL,
+    MemoryRedeliveryStore,
+    Redelivery,
+    RedeliveryStore,
+    RedeliveryWorker,
+)
 from dazzle.http.runtime.retry_accumulator import (
     RetryAccumulator,
     RetryEvent,
@@ -77,7 +97,6 @@ _EVENT_TO_TRIGGER: dict[EntityEventType, MappingTriggerType] = {
 }
 
 _MAX_RETRY_ATTEMPTS = 3
-_RETRY_BACKOFF_BASE = 0.5  # seconds
 _DEFAULT_CACHE_TTL = 86400  # 24 hours
 
 
@@ -93,6 +112,8 @@ class MappingResult:
     mapped_fields: dict[str, Any] = field(default_factory=dict)
     error: str | None = None
     cache_hit: bool = False
+    attempt: int = 1
+    next_retry_at: datetime | None = None
 
 
 # =============================================================================
@@ -114,6 +135,10 @@ class MappingExecutor:
         cache: Optional :class:`~dazzle.http.runtime.api_cache.ApiResponseCache`.
             When provided, GET request responses are cached and dedup-locked.
             ``None`` (default) = no caching.
+        client_pool: Shared per-integration HTTP clients (``app_client_pool``).
+            ``None`` = a private pool, closed by :meth:`shutdown`.
+        redelivery: Where retryable failures wait. ``None`` = in-memory.
+        redelivery_interval: Seconds between redelivery passes.
     """
 
     def __init__(
@@ -124,12 +149,19 @@ class MappingExecutor:
         update_entity: Any | None = None,
         cache: ApiResponseCache | None = None,
         retry_accumulator: RetryAccumulator | None = None,
+        client_pool: IntegrationClientPool | None = None,
+        redelivery: RedeliveryStore | None = None,
+        redelivery_interval: float = REDELIVERY_INTERVAL,
     ) -> None:
         self._appspec = appspec
         self._event_bus = event_bus
         self._update_entity = update_entity
         # Index: entity_name → list of (integration, mapping)
         self._mappings_by_entity: dict[str, list[tuple[IntegrationSpec, IntegrationMapping]]] = {}
+        # (integration, mapping) name → pair, to resolve parked retries
+        self._mappings_by_name: dict[
+            tuple[str, str], tuple[IntegrationSpec, IntegrationMapping]
+        ] = {}
         self._results: list[MappingResult] = []
         self._cache = cache
         self._pack_ttl_cache: dict[str, int | None] = {}  # integration:entity_ref → TTL
@@ -142,6 +174,13 @@ class MappingExecutor:
         self._retry_accumulator: RetryAccumulator = (
             retry_accumulator if retry_accumulator is not None else RetryAccumulator()
         )
+        self._owns_pool = client_pool is None
+        self._client_pool = client_pool or IntegrationClientPool()
+        self._redelivery = RedeliveryWorker(
+            redelivery or MemoryRedeliveryStore(),
+            self._redeliver,
+            interval=redelivery_interval,
+        )
 
     @property
     def results(self) -> list[MappingResult]:
@@ -161,6 +200,7 @@ class MappingExecutor:
                 if has_auto_trigger:
                     entity = mapping.entity_ref
                     self._mappings_by_entity.setdefault(entity, []).append((integration, mapping))
+                    self._mappings_by_name[integration.name, mapping.name] = (integration, mapping)
 
         if self._mappings_by_entity:
             self._event_bus.add_handler(self.handle_event)
@@ -260,6 +300,54 @@ class MappingExecutor:
 
         raise ValueError(f"Mapping '{mapping_name}' not found in integration '{integration_name}'")
 
+    # =========================================================================
+    # Redelivery
+    # =========================================================================
+
+    async def start(self) -> None:
+        """Start the background loop that re-runs parked retries."""
+        self._redelivery.start()
+
+    async def shutdown(self) -> None:
+        """Stop the redelivery loop and close a privately owned client pool.
+
+        Retries still parked stay in the store; a durable store hands
+        them to the next executor that starts.
+        """
+        await self._redelivery.stop()
+        if self._owns_pool:
+            await self._client_pool.aclose()
+
+    async def redeliver_due(self, now: datetime | None = None) -> int:
+        """Re-run every parked retry due at ``now``; returns how many ran."""
+        return await self._redelivery.run_due(now)
+
+    async def _redeliver(self, delivery: Redelivery) -> bool:
+        found = self._mappings_by_name.get((delivery.integration, delivery.mapping))
+        if found is None:
+            logger.warning(
+                "Dropping parked retry for %s/%s — mapping no longer declared",
+                delivery.integration,
+                delivery.mapping,
+            )
+            return True
+        integration, mapping = found
+        event = EntityEvent(
+            event_type=EntityEventType(delivery.event_type),
+            entity_name=delivery.entity_name,
+            entity_id=delivery.entity_id,
+            data=delivery.data,
+        )
+        result = await self._execute_mapping(
+            integration,
+            mapping,
+            delivery.data,
+            event,
+            attempt=delivery.attempt,
+            delivery_id=delivery.id,
+        )
+        return result.next_retry_at is None
+
     # =========================================================================
     # Internal Execution
     # =========================================================================
@@ -272,8 +360,15 @@ class MappingExecutor:
         event: EntityEvent | None = None,
         *,
         force_refresh: bool = False,
+        attempt: int = 1,
+        delivery_id: str | None = None,
     ) -> MappingResult:
-        """Execute a single mapping against an external API."""
+        """Execute a single mapping against an external API.
+
+        ``attempt`` and ``delivery_id`` are set when the redelivery loop
+        re-runs a parked retry, so a further failure re-parks the same
+        delivery one attempt later.
+        """
         result = MappingResult(
             mapping_name=mapping.name,
             integration_name=integration.name,
@@ -337,147 +432,167 @@ class MappingExecutor:
             self._results.append(result)
             return result
 
-        # Determine retry behavior
         should_retry = (
             mapping.on_error is not None and ErrorAction.RETRY in mapping.on_error.actions
         )
-        max_attempts = _MAX_RETRY_ATTEMPTS if should_retry else 1
+        result.attempt = attempt
 
-        # Execute HTTP request with optional retry
+        # One attempt on the integration's pooled client. Retries are parked
+        # for the redelivery loop below rather than slept through here.
+        transient = False
         try:
+            request_kwargs: dict[str, Any] = {"headers": headers}
+            if method in ("POST", "PUT", "PATCH"):
+                request_kwargs["json"] = body
             try:
-                request_kwargs: dict[str, Any] = {"headers": headers}
-                if method in ("POST", "PUT", "PATCH"):
-                    request_kwargs["json"] = body
-
-                # #1194: record each retry attempt's outcome into the
-                # in-process accumulator. Surfaced via
-                # /_dazzle/integrations/{name}/retries. Volatile; resets
-                # on restart.
-                payload_summary = self._summarize_payload(entity_data)
-                accumulator = self._retry_accumulator
-                integration_name = integration.name
-                mapping_name = mapping.name
-
-                async def _on_attempt(
-                    attempt: int,
-                    total_attempts: int,
-                    status_code: int | None,
-                    error: str | None,
-                    next_backoff: float | None,
-                ) -> None:
-                    succeeded = (
-                        status_code is not None and 200 <= status_code < 300 and error is None
-                    )
-                    accumulator.record(
-                        RetryEvent(
-                            integration=integration_name,
-                            mapping=mapping_name,
-                            attempt=attempt,
-                            max_attempts=total_attempts,
-                            status_code=status_code,
-                            error=error,
-                            payload_summary=payload_summary,
-                            next_retry_at=None,
-                            backoff_seconds=next_backoff,
-                            succeeded=succeeded,
-                        )
-                    )
-
-                async with httpx.AsyncClient(
-                    timeout=30.0
-                ) as client:  # DZ-HTTP-NORETRY  retry via async_retrying_request below
-                    resp = await async_retrying_request(
-                        client,
-                        method,
-                        url,
-                        max_retries=max_attempts - 1,
-                        backoff=tuple(
-                            _RETRY_BACKOFF_BASE * (2**i) for i in range(max_attempts - 1)
-                        ),
-                        on_attempt=_on_attempt,
-                        **request_kwargs,
-                    )
-
-                result.status_code = resp.status_code
-
-                try:
-                    result.response_data = resp.json()
-                except Exception:
-                    result.response_data = {"raw": resp.text[:1000]}
-
-                if 200 <= resp.status_code < 300:
-                    result.success = True
-
-                    # Cache successful GET responses
-                    if is_cacheable and cache is not None:
-                        cache_ttl = getattr(mapping, "cache_ttl", None)
-                        if cache_ttl is None:
-                            cache_ttl = self._lookup_pack_cache_ttl(integration, mapping)
-                        cache_ttl = cache_ttl or _DEFAULT_CACHE_TTL
-                        await cache.put(scope, url, result.response_data, ttl=cache_ttl)
-
-                    # Apply response mapping
-                    if mapping.response_mapping:
-                        mapped = self._apply_response_mapping(
-                            mapping.response_mapping, result.response_data
-                        )
-                        result.mapped_fields = mapped
-                        if mapped and self._update_entity and event:
-                            try:
-                                await self._update_entity(
-                                    event.entity_name, event.entity_id, mapped
-                                )
-                            except Exception as e:
-                                logger.warning(
-                                    "Failed to update entity %s/%s: %s",
-                                    event.entity_name,
-                                    event.entity_id,
-                                    e,
-                                )
-                else:
-                    # Non-2xx response (non-transient, or transient after all retries)
-                    logger.warning(
-                        "Mapping '%s' returned %d: %s",
-                        mapping.name,
-                        resp.status_code,
-                        resp.text[:200],
-                    )
-
+                resp = await self._client_pool.request(
+                    integration.name, method, url, **request_kwargs
+                )
             except Exception as e:
                 result.error = str(e)
+                transient = isinstance(e, TRANSIENT_ERRORS)
                 logger.warning("Mapping '%s' failed: %s", mapping.name, e)
-                # #1194: record the terminal failure (after retries
-                # exhausted, or non-transient). async_retrying_request's
-                # on_attempt fires for transient exceptions; a final
-                # entry here captures the post-loop terminal outcome
-                # with no further backoff.
-                self._retry_accumulator.record(
-                    RetryEvent(
-                        integration=integration.name,
-                        mapping=mapping.name,
-                        attempt=max_attempts,
-                        max_attempts=max_attempts,
-                        status_code=None,
-                        error=str(e),
-                        payload_summary=self._summarize_payload(entity_data),
-                        next_retry_at=None,
-                        backoff_seconds=None,
-                        succeeded=False,
-                    )
+            else:
+                transient = is_transient_status(resp.status_code)
+                await self._apply_response(
+                    integration, mapping, result, resp, event, url, cacheable=is_cacheable
                 )
         finally:
             # Always release dedup lock after the request completes
             if is_cacheable and cache is not None:
                 await cache.release_lock(scope, url)
 
-        # Handle error strategy if not successful
-        if not result.success:
+        backoff: float | None = None
+        if (
+            not result.success
+            and transient
+            and should_retry
+            and event is not None
+            and attempt < _MAX_RETRY_ATTEMPTS
+        ):
+            backoff = await self._park_for_redelivery(
+                integration, mapping, result, entity_data, event, delivery_id
+            )
+        self._record_attempt(
+            integration, mapping, result, entity_data, should_retry=should_retry, backoff=backoff
+        )
+
+        # Error strategy applies once the mapping has finally failed
+        if not result.success and result.next_retry_at is None:
             await self._handle_error(mapping, result, entity_data, event)
 
         self._results.append(result)
         return result
 
+    async def _apply_response(
+        self,
+        integration: IntegrationSpec,
+        mapping: IntegrationMapping,
+        result: MappingResult,
+        resp: Any,
+        event: EntityEvent | None,
+        url: str,
+        *,
+        cacheable: bool,
+    ) -> None:
+        """Fill ``result`` from an upstream response; cache and write back on 2xx."""
+        result.status_code = resp.status_code
+        try:
+            result.response_data = resp.json()
+        except Exception:
+            result.response_data = {"raw": resp.text[:1000]}
+
+        if not 200 <= resp.status_code < 300:
+            logger.warning(
+                "Mapping '%s' returned %d: %s",
+                mapping.name,
+                resp.status_code,
+                resp.text[:200],
+            )
+            return
+        result.success = True
+
+        # Cache successful GET responses
+        cache = self._cache
+        if cacheable and cache is not None:
+            cache_ttl = getattr(mapping, "cache_ttl", None)
+            if cache_ttl is None:
+                cache_ttl = self._lookup_pack_cache_ttl(integration, mapping)
+            cache_ttl = cache_ttl or _DEFAULT_CACHE_TTL
+            await cache.put(
+                f"{integration.name}:{mapping.name}", url, result.response_data, ttl=cache_ttl
+            )
+
+        if not mapping.response_mapping:
+            return
+        mapped = self._apply_response_mapping(mapping.response_mapping, result.response_data)
+        result.mapped_fields = mapped
+        if mapped and self._update_entity and event:
+            try:
+                await self._update_entity(event.entity_name, event.entity_id, mapped)
+            except Exception as e:
+                logger.warning(
+                    "Failed to update entity %s/%s: %s",
+                    event.entity_name,
+                    event.entity_id,
+                    e,
+                )
+
+    async def _park_for_redelivery(
+        self,
+        integration: IntegrationSpec,
+        mapping: IntegrationMapping,
+        result: MappingResult,
+        entity_data: dict[str, Any],
+        event: EntityEvent,
+        delivery_id: str | None,
+    ) -> float | None:
+        """Schedule the next attempt; returns its backoff, or ``None`` if parking failed."""
+        delivery, backoff = Redelivery.after_failure(
+            integration.name,
+            mapping.name,
+            event,
+            entity_data,
+            failed_attempt=result.attempt,
+            not_before=self._client_pool.breaker(integration.name).retry_after(),
+            delivery_id=delivery_id,
+        )
+        try:
+            await asyncio.to_thread(self._redelivery.store.schedule, delivery)
+        except Exception as e:
+            logger.warning("Could not park retry of mapping '%s': %s", mapping.name, e)
+            return None
+        result.next_retry_at = delivery.due_at
+        return backoff
+
+    def _record_attempt(
+        self,
+        integration: IntegrationSpec,
+        mapping: IntegrationMapping,
+        result: MappingResult,
+        entity_data: dict[str, Any],
+        *,
+        should_retry: bool,
+        backoff: float | None,
+    ) -> None:
+        """#1194: record the attempt's outcome for /_dazzle/integrations/{name}/retries."""
+        self._retry_accumulator.record(
+            RetryEvent(
+                integration=integration.name,
+                mapping=mapping.name,
+                attempt=result.attempt,
+                max_attempts=_MAX_RETRY_ATTEMPTS if should_retry else 1,
+                status_code=result.status_code or None,
+                error=result.error,
+                payload_summary=self._summarize_payload(entity_data),
+                next_retry_at=(
+                    result.next_retry_at.isoformat() if result.next_retry_at is not None else None
+                ),
+                backoff_seconds=backoff,
+                succeeded=result.success,
+            )
+        )
+
     # =========================================================================
     # URL and Mapping Helpers
     # =========================================================================
@@ -0,0 +1,357 @@
+"""Durable, delayed re-delivery for integration mappings.
+
+A mapping whose ``on_error`` includes ``retry`` used to retry inline in
+``MappingExecutor.handle_event``, sleeping through its backoff while
+every later entity event waited behind it. A transient failure is now
+parked here with a due time, and the executor's redelivery loop runs it
+again once it is due.
+
+Two stores share one small interface (:class:`RedeliveryStore`):
+
+* :class:`MemoryRedeliveryStore` — process-local, the default without a
+  database. Pending retries are lost on restart; leases expire as below.
+* :class:`RedeliveryRepository` — the ``_dazzle_mapping_redelivery``
+  table. ``claim_due`` leases rows through a ``FOR UPDATE SKIP LOCKED``
+  subselect (the ``_dazzle_outbox`` claim shape), so replicas never run
+  the same retry at once. A lease whose worker died expires and the row
+  is claimed again — at-least-once.
+
+Store methods are synchronous (DB I/O); :class:`RedeliveryWorker` — the
+loop that claims due retries and hands them back to the executor — calls
+them through ``asyncio.to_thread``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from dazzle.http.runtime.event_bus import EntityEvent
+    from dazzle.http.runtime.repository import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+# A claimed retry not completed or rescheduled within this window (its
+# worker died mid-call) is claimable again.
+CLAIM_LEASE_SECONDS = 300
+
+# Seconds between redelivery passes.
+REDELIVERY_INTERVAL = 1.0
+
+RETRY_BACKOFF_BASE = 0.5  # seconds
+
+
+@dataclass(frozen=True)
+class Redelivery:
+    """One mapping call waiting to be re-run.
+
+    Attributes:
+        integration: ``IntegrationSpec.name``.
+        mapping: ``IntegrationMapping.name`` within it.
+        entity_name: Entity of the triggering event.
+        entity_id: Record id of the triggering event.
+        event_type: ``EntityEventType`` value of the triggering event.
+        data: Entity data the mapping is applied to.
+        attempt: 1-indexed attempt number this delivery will run as.
+        due_at: Not run before this instant.
+        id: Stable across reschedules of the same event.
+    """
+
+    integration: str
+    mapping: str
+    entity_name: str
+    entity_id: str
+    event_type: str
+    data: dict[str, Any]
+    attempt: int
+    due_at: datetime
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+
+    @classmethod
+    def after_failure(
+        cls,
+        integration: str,
+        mapping: str,
+        event: EntityEvent,
+        data: dict[str, Any],
+        *,
+        failed_attempt: int,
+        not_before: float = 0.0,
+        delivery_id: str | None = None,
+    ) -> tuple[Redelivery, float]:
+        """The next attempt at ``event`` and its backoff in seconds.
+
+        Backs off exponentially from :data:`RETRY_BACKOFF_BASE`, and never
+        less than ``not_before`` (the wait until an open circuit lets a
+        probe through). ``delivery_id`` keeps a re-parked delivery's id.
+        """
+        backoff = max(RETRY_BACKOFF_BASE * (2.0 ** (failed_attempt - 1)), not_before)
+        delivery = cls(
+            integration=integration,
+            mapping=mapping,
+            entity_name=event.entity_name,
+            entity_id=event.entity_id,
+            event_type=event.event_type.value,
+            data=dict(data),
+            attempt=failed_attempt + 1,
+            due_at=datetime.now(UTC) + timedelta(seconds=backoff),
+            **({"id": delivery_id} if delivery_id else {}),
+        )
+        return delivery, backoff
+
+
+class RedeliveryStore(Protocol):
+    """Where parked mapping retries wait."""
+
+    def schedule(self, delivery: Redelivery) -> None:
+        """Park (or re-park, by ``id``) a delivery until ``due_at``."""
+        ...
+
+    def claim_due(self, now: datetime, limit: int = 100) -> list[Redelivery]:
+        """Lease up to ``limit`` deliveries due at ``now``, oldest first."""
+        ...
+
+    def complete(self, delivery_id: str) -> None:
+        """Forget a delivery — it succeeded or gave up."""
+        ...
+
+    def pending(self) -> int:
+        """Deliveries parked or leased — for tests / metrics."""
+        ...
+
+
+class MemoryRedeliveryStore:
+    """Process-local store (lost on restart).
+
+    Leases like :class:`RedeliveryRepository`: a claim pushes the
+    delivery's next claimable time out by the lease, so one whose run
+    crashed is handed out again once the lease expires.
+    """
+
+    def __init__(self, *, lease_seconds: int = CLAIM_LEASE_SECONDS) -> None:
+        # id -> (delivery, when it is next claimable)
+        self._entries: dict[str, tuple[Redelivery, datetime]] = {}
+        self._lease = timedelta(seconds=lease_seconds)
+        self._lock = threading.Lock()
+
+    def schedule(self, delivery: Redelivery) -> None:
+        with self._lock:
+            self._entries[delivery.id] = (delivery, delivery.due_at)
+
+    def claim_due(self, now: datetime, limit: int = 100) -> list[Redelivery]:
+        with self._lock:
+            due = sorted(
+                (entry for entry in self._entries.values() if entry[1] <= now),
+                key=lambda entry: entry[1],
+            )[:limit]
+            for delivery, _ in due:
+                self._entries[delivery.id] = (delivery, now + self._lease)
+            return [delivery for delivery, _ in due]
+
+    def complete(self, delivery_id: str) -> None:
+        with self._lock:
+            self._entries.pop(delivery_id, None)
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def ensure_mapping_redelivery_table(cur: Any) -> None:
+    """Create ``_dazzle_mapping_redelivery`` and its due-time index (idempotent).
+
+    Called only from ``ensure_framework_schema`` — the repository never
+    runs DDL itself, so a migration-managed schema is left alone.
+    """
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS _dazzle_mapping_redelivery (
+            id TEXT PRIMARY KEY,
+            integration TEXT NOT NULL,
+            mapping TEXT NOT NULL,
+            entity_name TEXT NOT NULL,
+            entity_id TEXT NOT NULL,
+            event_type TEXT NOT NULL,
+            data TEXT NOT NULL,
+            attempt INTEGER NOT NULL,
+            due_at TIMESTAMPTZ NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+    """)
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx__dazzle_mapping_redelivery_due "
+        "ON _dazzle_mapping_redelivery(due_at)"
+    )
+
+
+class RedeliveryRepository:
+    """Postgres-backed :class:`RedeliveryStore`.
+
+    The table comes from ``ensure_framework_schema`` (dev boot,
+    ``dazzle db``) or the app's migrations.
+    """
+
+    TABLE_NAME = "_dazzle_mapping_redelivery"
+
+    def __init__(self, db_manager: DatabaseManager, *, lease_seconds: int = CLAIM_LEASE_SECONDS):
+        self.db = db_manager
+        self._lease = timedelta(seconds=lease_seconds)
+
+    def schedule(self, delivery: Redelivery) -> None:
+        ph = self.db.placeholder
+        sql = f"""
+            INSERT INTO {self.TABLE_NAME}
+                (id, integration, mapping, entity_name, entity_id, event_type, data,
+                 attempt, due_at)
+            VALUES ({", ".join([ph] * 9)})
+            ON CONFLICT (id) DO UPDATE
+                SET attempt = EXCLUDED.attempt, due_at = EXCLUDED.due_at
+        """
+        params = (
+            delivery.id,
+            delivery.integration,
+            delivery.mapping,
+            delivery.entity_name,
+            delivery.entity_id,
+            delivery.event_type,
+            json.dumps(delivery.data, default=str),
+            delivery.attempt,
+            delivery.due_at,
+        )
+        with self.db.connection() as conn:
+            conn.execute(sql, params)
+
+    def claim_due(self, now: datetime, limit: int = 100) -> list[Redelivery]:
+        """Push ``due_at`` of up to ``limit`` due rows out by the lease and return them.
+
+        The returned deliveries carry the ``due_at`` they were claimed at.
+        """
+        ph = self.db.placeholder
+        sql = f"""
+            UPDATE {self.TABLE_NAME} AS r
+            SET due_at = {ph}
+            FROM (
+                SELECT id, due_at FROM {self.TABLE_NAME}
+                WHERE due_at <= {ph}
+                ORDER BY due_at ASC
+                LIMIT {ph}
+                FOR UPDATE SKIP LOCKED
+            ) AS due
+            WHERE r.id = due.id
+            RETURNING r.id, r.integration, r.mapping, r.entity_name, r.entity_id,
+                r.event_type, r.data, r.attempt, due.due_at
+        """
+        with self.db.connection() as conn:
+            cursor = conn.execute(sql, (now + self._lease, now, limit))
+            claimed = [_from_row(dict(row)) for row in cursor.fetchall()]
+        # RETURNING does not preserve the subselect's order.
+        claimed.sort(key=lambda d: d.due_at)
+        return claimed
+
+    def complete(self, delivery_id: str) -> None:
+        ph = self.db.placeholder
+        with self.db.connection() as conn:
+            conn.execute(f"DELETE FROM {self.TABLE_NAME} WHERE id = {ph}", (delivery_id,))
+
+    def pending(self) -> int:
+        with self.db.connection() as conn:
+            row = conn.execute(f"SELECT count(*) AS n FROM {self.TABLE_NAME}").fetchone()
+        return int(dict(row)["n"]) if row else 0
+
+
+def _from_row(row: dict[str, Any]) -> Redelivery:
+    due_at = row["due_at"]
+    if isinstance(due_at, str):
+        due_at = datetime.fromisoformat(due_at)
+    if due_at.tzinfo is None:
+        due_at = due_at.replace(tzinfo=UTC)
+    data = row["data"]
+    return Redelivery(
+        integration=row["integration"],
+        mapping=row["mapping"],
+        entity_name=row["entity_name"],
+        entity_id=row["entity_id"],
+        event_type=row["event_type"],
+        data=json.loads(data) if isinstance(data, str) else dict(data or {}),
+        attempt=int(row["attempt"]),
+        due_at=due_at,
+        id=row["id"],
+    )
+
+
+class RedeliveryWorker:
+    """Background loop that claims due deliveries and re-runs them.
+
+    Args:
+        store: Where the deliveries wait.
+        run: Re-runs one delivery; returns ``True`` when it is finished
+            (succeeded, gave up or was dropped) and ``False`` when it
+            re-parked itself for another attempt.
+        interval: Seconds between passes.
+    """
+
+    def __init__(
+        self,
+        store: RedeliveryStore,
+        run: Callable[[Redelivery], Awaitable[bool]],
+        *,
+        interval: float = REDELIVERY_INTERVAL,
+    ) -> None:
+        self.store = store
+        self._run = run
+        self._interval = interval
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = asyncio.Event()
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Stop the loop. Deliveries still parked stay in the store."""
+        self._stopping.set()
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def run_due(self, now: datetime | None = None) -> int:
+        """Re-run every delivery due at ``now``; returns how many ran."""
+        due = await asyncio.to_thread(self.store.claim_due, now or datetime.now(UTC))
+        outcomes = await asyncio.gather(*(self._run(d) for d in due), return_exceptions=True)
+        for delivery, outcome in zip(due, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                # Left leased — the store hands it out again once the lease expires.
+                logger.warning(
+                    "Redelivery of %s/%s crashed: %s",
+                    delivery.integration,
+                    delivery.mapping,
+                    outcome,
+                )
+            elif outcome:
+                await asyncio.to_thread(self.store.complete, delivery.id)
+        return len(due)
+
+    async def _loop(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await self.run_due()
+            except Exception:
+                logger.warning("Mapping redelivery pass failed", exc_info=True)
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self._interval)
+            except TimeoutError:
+                continue
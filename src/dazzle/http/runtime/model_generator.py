@@ -95,7 +95,10 @@ def _field_type_to_python(
     Returns:
         Python type for Pydantic model
     """
-    if field_type.kind == "scalar" and field_type.scalar_type:
+    if field_type.traversal:
+        # descendants_of / ancestors_of: the repository attaches the rows.
+        return list[dict[str, Any]]
+    elif field_type.kind == "scalar" and field_type.scalar_type:
         return _scalar_type_to_python(field_type.scalar_type)
     elif field_type.kind == "enum" and field_type.enum_values:
         return Annotated[
@@ -325,14 +328,15 @@ def _auto_excluded_fields(
 ) -> frozenset[str]:
     """Return the set of field names that should be excluded from create/update schemas.
 
-    Always excludes 'id', plus any fields marked auto_add or auto_update. auth
+    Always excludes 'id', plus any fields marked auto_add or auto_update and
+    read-only traversal fields (descendants_of / ancestors_of). auth
     Plan 1d: also excludes the framework-injected partition key for tenant-scoped
     entities — it is server-supplied (the DB default fills it from the bound
     session GUC), never a client input field.
     """
     excluded = {"id"}
     for field in entity.fields:
-        if field.auto_add or field.auto_update:
+        if field.auto_add or field.auto_update or field.type.traversal:
             excluded.add(field.name)
     if tenant_scoped and partition_key:
         excluded.add(partition_key)
@@ -1,10 +1,12 @@
 """Neighborhood query builder — recursive CTE SQL generation (#619 Phase 3).
 
 Generates PostgreSQL recursive CTEs for graph neighborhood traversal.
-Pure SQL generation — no DB execution.
+Pure SQL generation — no DB execution. ``snapshot_neighborhood`` answers the
+same question from a cached ``GraphSnapshot`` when one is fresh.
 """
 
 from dazzle.core.ir import GraphEdgeSpec
+from dazzle.http.runtime.graph_snapshot import GraphSnapshot
 
 
 class NeighborhoodQueryBuilder:
@@ -87,3 +89,22 @@ class NeighborhoodQueryBuilder:
             f"{scope_where}"
         )
         return sql, {"node_ids": tuple(node_ids)}
+
+
+def snapshot_neighborhood(snap: GraphSnapshot, seed: str, depth: int) -> list[str]:
+    """Node ids within ``depth`` hops of ``seed`` — the neighborhood CTE's answer."""
+    if seed not in snap:
+        return [seed]
+    start = snap.index[seed]
+    seen = {start}
+    frontier = [start]
+    for _ in range(depth):
+        nxt_frontier = []
+        for node in frontier:
+            for k in range(snap.offsets[node], snap.offsets[node + 1]):
+                nxt = snap.adjacency[k]
+                if nxt not in seen:
+                    seen.add(nxt)
+                    nxt_frontier.append(nxt)
+        frontier = nxt_frontier
+    return [snap.node_ids[i] for i in seen]
@@ -282,6 +282,15 @@ class PgConnectionWrapper:
         cursor.execute(sql, params or ())
         return cursor
 
+    @property
+    def autocommit(self) -> bool:
+        return bool(self._conn.autocommit)
+
+    @autocommit.setter
+    def autocommit(self, value: bool) -> None:
+        # Assignment does not go through __getattr__; forward it explicitly.
+        self._conn.autocommit = value
+
     def __getattr__(self, name: str) -> Any:
         return getattr(self._conn, name)
 
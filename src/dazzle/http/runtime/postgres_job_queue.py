@@ -0,0 +1,280 @@
+"""Postgres-backed job queue.
+
+A third `JobQueue` implementation next to `InMemoryJobQueue` and
+`RedisJobQueue`, for deployments that run Postgres but not Redis.
+Messages are rows in ``_dazzle_job_queue``; nothing is lost when a
+worker restarts or crashes mid-job.
+
+Design
+------
+
+* **Leases, not pops.** ``dequeue`` claims the next row through a
+  ``FOR UPDATE SKIP LOCKED`` subselect (the ``_dazzle_outbox`` /
+  ``_dazzle_mapping_redelivery`` claim shape) and pushes its
+  ``run_at`` out by the visibility timeout instead of deleting it.
+  The worker loop deletes the row (:meth:`PostgresJobQueue.ack`) once
+  the job is settled. If the worker dies first, the lease runs out and
+  another worker claims the row again — at-least-once, where Redis
+  ``BRPOP`` loses the message.
+* **Priorities and delayed run-at.** Claims take the highest
+  ``priority`` first, then the earliest ``run_at``. ``submit`` accepts
+  both, so the worker can re-enqueue a retry with its backoff as a
+  ``run_at`` rather than sleeping it out in-process.
+* **Dead letters.** A row claimed more than ``max_deliveries`` times
+  (its worker keeps dying on it) is parked with ``dead_at`` set instead
+  of being handed out again. The worker loop parks exhausted
+  ``dead_letter:`` jobs the same way. Dead rows stay in the table for
+  inspection and are excluded from ``size``.
+
+Store I/O is synchronous (``DatabaseManager``); the async queue methods
+run it through ``asyncio.to_thread``. ``dequeue`` polls every
+``poll_interval`` seconds while the queue is empty.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+from dazzle.core.environment import run_boot_schema_ddl
+from dazzle.http.runtime.job_queue import JobMessage
+
+if TYPE_CHECKING:
+    from dazzle.http.runtime.repository import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+# A claimed job neither acked nor dead-lettered within this window (its
+# worker died) is handed out again.
+DEFAULT_VISIBILITY_TIMEOUT = 300.0
+
+# Claims of one row before it is treated as a poison message.
+DEFAULT_MAX_DELIVERIES = 5
+
+# Seconds between claim attempts while the queue is empty.
+DEFAULT_POLL_INTERVAL = 0.5
+
+# Added to the longest declared job timeout when deriving the lease.
+_VISIBILITY_GRACE_SECONDS = 60.0
+
+
+def visibility_timeout_for(job_specs: Iterable[Any]) -> float:
+    """A lease long enough for the slowest job to finish within its ``timeout:``."""
+    longest = max((float(getattr(s, "timeout_seconds", 0)) for s in job_specs), default=0.0)
+    return max(DEFAULT_VISIBILITY_TIMEOUT, longest + _VISIBILITY_GRACE_SECONDS)
+
+
+def ensure_job_queue_table(cur: Any) -> None:
+    """Create ``_dazzle_job_queue`` and its claim index (idempotent).
+
+    Single DDL source for ``ensure_framework_schema`` and
+    ``PostgresJobQueue._ensure_table``, like ``ensure_outbox_table``.
+    """
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS _dazzle_job_queue (
+            id TEXT PRIMARY KEY,
+            job_name TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            attempt INTEGER NOT NULL DEFAULT 1,
+            priority INTEGER NOT NULL DEFAULT 0,
+            run_at TIMESTAMPTZ NOT NULL,
+            deliveries INTEGER NOT NULL DEFAULT 0,
+            dead_at TIMESTAMPTZ,
+            last_error TEXT,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+    """)
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx__dazzle_job_queue_claim "
+        "ON _dazzle_job_queue(priority DESC, run_at) WHERE dead_at IS NULL"
+    )
+
+
+class PostgresJobQueue:
+    """`JobQueue` implementation backed by the ``_dazzle_job_queue`` table.
+
+    Args:
+        db_manager: Database the queue table lives in.
+        visibility_timeout: Seconds a claimed job stays invisible to
+            other workers before it is handed out again.
+        max_deliveries: Claims of one job before it is dead-lettered.
+        poll_interval: Seconds between claim attempts on an empty queue.
+    """
+
+    TABLE_NAME = "_dazzle_job_queue"
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        *,
+        visibility_timeout: float = DEFAULT_VISIBILITY_TIMEOUT,
+        max_deliveries: int = DEFAULT_MAX_DELIVERIES,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> None:
+        self.db = db_manager
+        self._visibility = timedelta(seconds=visibility_timeout)
+        self._max_deliveries = max_deliveries
+        self._poll_interval = poll_interval
+        self._ensure_table()
+
+    def _ensure_table(self) -> None:
+        """Create the table at boot — skipped where the schema is migration-managed."""
+        run_boot_schema_ddl(self.db, ensure_job_queue_table)
+
+    # -- JobQueue protocol ---------------------------------------------------
+
+    async def submit(
+        self,
+        job_name: str,
+        payload: dict[str, Any] | None = None,
+        *,
+        attempt: int = 1,
+        priority: int = 0,
+        run_at: datetime | None = None,
+    ) -> str:
+        """Enqueue a job; return the new ``JobRun.id``.
+
+        Higher ``priority`` runs first; ``run_at`` holds the job back
+        until that instant.
+        """
+        job_run_id = str(uuid4())
+        await asyncio.to_thread(
+            self._insert,
+            job_run_id,
+            job_name,
+            payload or {},
+            attempt,
+            priority,
+            run_at or datetime.now(UTC),
+        )
+        return job_run_id
+
+    async def dequeue(self, *, timeout: float | None = None) -> JobMessage | None:
+        """Claim the next due job, polling until one is due or ``timeout`` passes."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            message = await asyncio.to_thread(self.claim, datetime.now(UTC))
+            if message is not None:
+                return message
+            wait = self._poll_interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                wait = min(wait, remaining)
+            await asyncio.sleep(wait)
+
+    async def size(self) -> int:
+        """Jobs waiting or leased (dead letters excluded) — for tests / metrics."""
+        return await asyncio.to_thread(self._count, "dead_at IS NULL")
+
+    # -- settlement ----------------------------------------------------------
+
+    async def ack(self, job_run_id: str) -> None:
+        """Forget a job the worker has settled (completed, failed or re-enqueued)."""
+        await asyncio.to_thread(self._delete, job_run_id)
+
+    async def dead_letter(self, job_run_id: str, reason: str) -> None:
+        """Park a job for inspection; it is never handed out again."""
+        await asyncio.to_thread(self._mark_dead, job_run_id, reason)
+
+    async def dead_letter_count(self) -> int:
+        """Jobs parked as dead letters."""
+        return await asyncio.to_thread(self._count, "dead_at IS NOT NULL")
+
+    # -- synchronous store I/O -----------------------------------------------
+
+    def claim(self, now: datetime) -> JobMessage | None:
+        """Lease the next due job, dead-lettering poison messages on the way."""
+        while True:
+            row = self._claim_row(now)
+            if row is None:
+                return None
+            if int(row["deliveries"]) <= self._max_deliveries:
+                return _message_from_row(row)
+            logger.warning(
+                "Job %s (%s) dead-lettered after %d deliveries",
+                row["job_name"],
+                row["id"],
+                self._max_deliveries,
+            )
+            self._mark_dead(row["id"], f"lease expired {self._max_deliveries} times")
+
+    def _claim_row(self, now: datetime) -> dict[str, Any] | None:
+        ph = self.db.placeholder
+        sql = f"""
+            UPDATE {self.TABLE_NAME} AS q
+            SET run_at = {ph}, deliveries = q.deliveries + 1
+            FROM (
+                SELECT id FROM {self.TABLE_NAME}
+                WHERE dead_at IS NULL AND run_at <= {ph}
+                ORDER BY priority DESC, run_at ASC
+                LIMIT 1
+                FOR UPDATE SKIP LOCKED
+            ) AS due
+            WHERE q.id = due.id
+            RETURNING q.id, q.job_name, q.payload, q.attempt, q.priority, q.deliveries
+        """
+        with self.db.connection() as conn:
+            row = conn.execute(sql, (now + self._visibility, now)).fetchone()
+        return dict(row) if row else None
+
+    def _insert(
+        self,
+        job_run_id: str,
+        job_name: str,
+        payload: dict[str, Any],
+        attempt: int,
+        priority: int,
+        run_at: datetime,
+    ) -> None:
+        ph = self.db.placeholder
+        sql = f"""
+            INSERT INTO {self.TABLE_NAME} (id, job_name, payload, attempt, priority, run_at)
+            VALUES ({", ".join([ph] * 6)})
+        """
+        params = (
+            job_run_id,
+            job_name,
+            json.dumps(payload, default=str),
+            attempt,
+            priority,
+            run_at,
+        )
+        with self.db.connection() as conn:
+            conn.execute(sql, params)
+
+    def _delete(self, job_run_id: str) -> None:
+        ph = self.db.placeholder
+        with self.db.connection() as conn:
+            conn.execute(f"DELETE FROM {self.TABLE_NAME} WHERE id = {ph}", (job_run_id,))
+
+    def _mark_dead(self, job_run_id: str, reason: str) -> None:
+        ph = self.db.placeholder
+        sql = f"UPDATE {self.TABLE_NAME} SET dead_at = {ph}, last_error = {ph} WHERE id = {ph}"
+        with self.db.connection() as conn:
+            conn.execute(sql, (datetime.now(UTC), reason, job_run_id))
+
+    def _count(self, condition: str) -> int:
+        with self.db.connection() as conn:
+            row = conn.execute(
+                f"SELECT count(*) AS n FROM {self.TABLE_NAME} WHERE {condition}"
+            ).fetchone()
+        return int(dict(row)["n"]) if row else 0
+
+
+def _message_from_row(row: dict[str, Any]) -> JobMessage:
+    payload = row["payload"]
+    return JobMessage(
+        job_name=row["job_name"],
+        payload=json.loads(payload) if isinstance(payload, str) else dict(payload or {}),
+        attempt=int(row["attempt"]),
+        job_run_id=str(row["id"]),
+        priority=int(row["priority"]),
+    )
@@ -149,5 +149,12 @@ def ensure_process_tables(conn: Any) -> None:  # conn: psycopg.Connection
             WHERE status IN ('pending', 'claimed')
         """)
 
+        # Partial index for the timeout sweep: open tasks past their deadline.
+        cur.execute("""
+            CREATE INDEX IF NOT EXISTS ix_process_tasks_open_due
+            ON process_tasks (due_at)
+            WHERE status IN ('pending', 'assigned', 'escalated')
+        """)
+
     conn.commit()
     logger.debug("process_runs + process_tasks ensured")
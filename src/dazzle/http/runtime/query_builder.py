@@ -165,6 +165,7 @@ class FilterCondition:
         self,
         table_alias: str | None = None,
         placeholder_style: str = "%s",
+        field_sql: str | None = None,
     ) -> tuple[str, list[Any]]:
         """
         Convert condition to SQL fragment and parameters.
@@ -172,6 +173,8 @@ class FilterCondition:
         Args:
             table_alias: Optional table alias for the field
             placeholder_style: SQL placeholder style (default "%s" for PostgreSQL)
+            field_sql: SQL expression standing in for the column (a pushed-down
+                computed field)
 
         Returns:
             Tuple of (sql_fragment, parameters)
@@ -181,6 +184,8 @@ class FilterCondition:
         # Build field reference with proper quoting
         quoted_field = quote_identifier(self.field)
         field_ref = f"{table_alias}.{quoted_field}" if table_alias else quoted_field
+        if field_sql is not None:
+            field_ref = field_sql
 
         # Convert value for SQL
         converted_value = self._convert_value(self.value)
@@ -296,10 +301,12 @@ class SortField:
         else:
             return cls(field=sort_str, descending=descending)
 
-    def to_sql(self, table_alias: str | None = None) -> str:
-        """Convert to SQL ORDER BY fragment."""
+    def to_sql(self, table_alias: str | None = None, field_sql: str | None = None) -> str:
+        """Convert to SQL ORDER BY fragment (``field_sql`` replaces the column)."""
         quoted_field = quote_identifier(self.field)
         field_ref = f"{table_alias}.{quoted_field}" if table_alias else quoted_field
+        if field_sql is not None:
+            field_ref = field_sql
         direction = "DESC" if self.descending else "ASC"
         return f"{field_ref} {direction}"
 
@@ -335,6 +342,10 @@ class QueryBuilder:
     search_fields: list[str] = field(default_factory=list)
     # Raw SQL scope predicate from the predicate compiler (sql, params)
     scope_predicate: tuple[str, list[Any]] | None = None
+    # Computed fields pushed down to SQL (``computed_sql``): field name ->
+    # parameter-free expression. Selected under the field name, and used in
+    # place of the column by filters and sorts on that name.
+    computed_columns: dict[str, str] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         """Validate table name on initialization."""
@@ -414,6 +425,7 @@ class QueryBuilder:
             sql, condition_params = condition.to_sql(
                 table_alias=source_alias,
                 placeholder_style=self.placeholder_style,
+                field_sql=self._computed_sql(condition.field, condition.relation_path),
             )
             fragments.append(sql)
             params.extend(condition_params)
@@ -442,9 +454,24 @@ class QueryBuilder:
         if not self.sorts:
             return ""
 
-        order_parts = [sort.to_sql() for sort in self.sorts]
+        order_parts = [
+            sort.to_sql(field_sql=self._computed_sql(sort.field, sort.relation_path))
+            for sort in self.sorts
+        ]
         return f"ORDER BY {', '.join(order_parts)}"
 
+    def _computed_sql(self, name: str, relation_path: list[str]) -> str | None:
+        """The pushed-down expression for a computed field on this table, if any."""
+        return None if relation_path else self.computed_columns.get(name)
+
+    def _computed_select_cols(self) -> list[str]:
+        """``<expr> AS "<name>"`` for each computed column the SELECT returns."""
+        return [
+            f"{sql} AS {quote_identifier(name)}"
+            for name, sql in self.computed_columns.items()
+            if not self.select_fields or name in self.select_fields
+        ]
+
     def build_limit_offset(self) -> tuple[str, list[int]]:
         """Build LIMIT/OFFSET clause."""
         offset = (self.page - 1) * self.page_size
@@ -469,10 +496,14 @@ class QueryBuilder:
             select = f"SELECT COUNT(*) FROM {table}"
         else:
             if self.select_fields:
-                base_cols = [quote_identifier(f) for f in self.select_fields]
+                base_cols = [
+                    quote_identifier(f)
+                    for f in self.select_fields
+                    if f not in self.computed_columns
+                ]
             else:
                 base_cols = [f"{table}.*"] if self.joins else ["*"]
-            all_cols = base_cols + list(self.extra_select_cols)
+            all_cols = base_cols + list(self.extra_select_cols) + self._computed_select_cols()
             select = f"SELECT {', '.join(all_cols)} FROM {table}"
             if self.joins:
                 select = f"{select} {' '.join(self.joins)}"
@@ -10,9 +10,13 @@ For the Fragment path: `FragmentSurfaceAdapter` builds a `Fragment` tree
 from the IR + ctx, then `FragmentRenderer` emits HTML from the tree.
 """
 
+from collections.abc import AsyncIterator, Awaitable, Mapping
 from typing import Any
 
+from starlette.responses import StreamingResponse
+
 from dazzle.core.ir.protocols import SurfaceLike
+from dazzle.render.fragment import Fragment, RenderContext
 from dazzle.render.fragment.renderer import FragmentRenderer
 
 
@@ -39,6 +43,31 @@ class FragmentSurfaceRenderer:
         return self._renderer.render(fragment)
 
 
+async def stream_fragment_response(
+    fragment: Fragment,
+    fills: Mapping[str, Awaitable[Fragment]],
+    *,
+    ctx: RenderContext | None = None,
+    headers: dict[str, str] | None = None,
+) -> StreamingResponse:
+    """Chunked HTML response for a Fragment tree with streamed `Slot` holes.
+
+    The shell goes out as soon as it renders; each slot follows in the same
+    response when its awaitable resolves (see
+    `FragmentRenderer.render_stream`). A slot/fill mismatch raises here,
+    before the response starts, so it still surfaces as an ordinary error.
+    """
+    chunks = FragmentRenderer().render_stream(fragment, fills, ctx)
+    first = await anext(chunks)
+
+    async def _body() -> AsyncIterator[str]:
+        yield first
+        async for chunk in chunks:
+            yield chunk
+
+    return StreamingResponse(_body(), media_type="text/html; charset=utf-8", headers=headers)
+
+
 # Backwards-compat alias: any caller still importing the bare
 # FragmentRenderer from this module keeps working through Plan 5.
-__all__ = ["FragmentSurfaceRenderer", "FragmentRenderer"]
+__all__ = ["FragmentSurfaceRenderer", "FragmentRenderer", "stream_fragment_response"]
@@ -22,6 +22,12 @@ from pydantic import BaseModel, ValidationError
 from dazzle.core import ir
 from dazzle.core.archetype_expander import _to_snake_case
 from dazzle.core.ir import FieldTypeKind
+from dazzle.db.closure import CLOSURE_PROBE_SQL, closure_table_name
+from dazzle.http.runtime.computed_sql import (
+    ComputedSqlContext,
+    coerce_computed_value,
+    compile_computed_fields,
+)
 from dazzle.http.runtime.query_builder import quote_identifier
 from dazzle.http.specs.entity import (
     ComputedFieldSpec,
@@ -29,9 +35,13 @@ from dazzle.http.specs.entity import (
     FieldType,
     ScalarType,
 )
+from dazzle.i18n.display_locale import calendar_today
 
 logger = logging.getLogger(__name__)
 
+# Window-count column `fts_search` adds to each row; stripped before return.
+_FTS_TOTAL_COLUMN = "_fts_total"
+
 # Build a tuple of IntegrityError types for PostgreSQL.
 _INTEGRITY_ERRORS: tuple[type[Exception], ...] = ()
 try:
@@ -197,11 +207,24 @@ def _resolve_latest_one_fields(
     return rows
 
 
+def _traversal_kind(field: Any) -> FieldTypeKind | None:
+    """``DESCENDANTS_OF`` / ``ANCESTORS_OF`` for a traversal field, else None.
+
+    Runtime specs keep ``kind="scalar"`` and carry the direction on
+    ``type.traversal``; IR specs carry it on ``type.kind``.
+    """
+    kind = getattr(field.type, "traversal", None) or getattr(field.type, "kind", None)
+    if kind in (FieldTypeKind.DESCENDANTS_OF, FieldTypeKind.ANCESTORS_OF):
+        return FieldTypeKind(kind)
+    return None
+
+
 def _resolve_recursive_traversal_fields(
     rows: list[dict[str, Any]],
     entity_spec: Any,
     db: Any,
     host_table: str,
+    closure_tables: dict[str, str] | None = None,
 ) -> list[dict[str, Any]]:
     """Resolve every ``descendants_of`` / ``ancestors_of`` field on the
     entity (#1227 Phase 3b.ii).
@@ -230,17 +253,16 @@ def _resolve_recursive_traversal_fields(
     rows. Each input row receives a list under the field name (empty
     list when no descendants/ancestors).
 
+    ``closure_tables`` maps a self-ref FK to its materialised closure table
+    (``dazzle db closure``); those fields are answered by one indexed join
+    against the closure table instead of the walk and second fetch.
+
     No-op when entity has no such fields or ``rows`` is empty.
     """
     if not rows or entity_spec is None:
         return rows
 
-    traversal_fields = [
-        f
-        for f in getattr(entity_spec, "fields", [])
-        if getattr(f.type, "kind", None)
-        in (FieldTypeKind.DESCENDANTS_OF, FieldTypeKind.ANCESTORS_OF)
-    ]
+    traversal_fields = [f for f in getattr(entity_spec, "fields", []) if _traversal_kind(f)]
     if not traversal_fields:
         return rows
 
@@ -255,7 +277,7 @@ def _resolve_recursive_traversal_fields(
     host_q = quote_identifier(host_table)
 
     for f in traversal_fields:
-        is_descendants = f.type.kind == FieldTypeKind.DESCENDANTS_OF
+        is_descendants = _traversal_kind(f) == FieldTypeKind.DESCENDANTS_OF
         via_field = f.type.via_field
         via_entity = f.type.via_entity
         if not via_field:
@@ -263,6 +285,14 @@ def _resolve_recursive_traversal_fields(
                 row[f.name] = []
             continue
 
+        if via_entity is None and closure_tables and via_field in closure_tables:
+            by_closure = _closure_traversal(
+                db, host_q, closure_tables[via_field], source_ids, descendants=is_descendants
+            )
+            for input_row in rows:
+                input_row[f.name] = by_closure.get(str(input_row.get("id")), [])
+            continue
+
         via_q = quote_identifier(via_field)
         in_placeholders = ", ".join(placeholder for _ in source_ids)
 
@@ -365,6 +395,40 @@ def _resolve_recursive_traversal_fields(
     return rows
 
 
+def _closure_traversal(
+    db: Any,
+    host_q: str,
+    closure_table: str,
+    source_ids: list[str],
+    *,
+    descendants: bool,
+) -> dict[str, list[dict[str, Any]]]:
+    """Descendants (or ancestors) of each source id, read from a closure table.
+
+    Rows come back nearest-first (``ORDER BY depth``), matching the
+    breadth-first order of the recursive walk.
+    """
+    root_col, hit_col = (
+        ("ancestor_id", "descendant_id") if descendants else ("descendant_id", "ancestor_id")
+    )
+    in_placeholders = ", ".join(db.placeholder for _ in source_ids)
+    sql = (
+        f"SELECT c.{root_col} AS _closure_root, t.* "
+        f"FROM {quote_identifier(closure_table)} c "
+        f"JOIN {host_q} t ON t.id = c.{hit_col} "
+        f"WHERE c.{root_col} IN ({in_placeholders}) AND c.depth > 0 "
+        f"ORDER BY c.depth"
+    )
+    by_root: dict[str, list[dict[str, Any]]] = {sid: [] for sid in source_ids}
+    with db.connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(sql, list(source_ids))  # nosemgrep
+        for r in cursor.fetchall():
+            row = dict(r)
+            by_root.setdefault(str(row.pop("_closure_root")), []).append(row)
+    return by_root
+
+
 def _discover_junction_child_fk(db: Any, junction_table: str, via_field: str) -> str | None:
     """Look up the junction's non-via FK column name.
 
@@ -635,6 +699,9 @@ class Repository[T: BaseModel]:
 
         # Store computed field specs for evaluation
         self._computed_fields: list[ComputedFieldSpec] = entity_spec.computed_fields or []
+        # Pushed-down computed SQL, compiled once per calendar day ("today"
+        # is a literal in days_until / days_since expressions).
+        self._pushdown_cache: tuple[date, dict[str, str]] | None = None
 
         # #1217 Phase 3e.iv: cache the subtype JOIN+columns at construction
         # time. Child entities have ONLY their subtype-specific fields in
@@ -658,6 +725,32 @@ class Repository[T: BaseModel]:
                 # rather than coerced Python types.
                 self._field_types.setdefault(f.name, f.type)
 
+        # Closure tables (``dazzle db closure``) backing this entity's
+        # self-ref traversal fields; probed lazily on first traversal.
+        self._closure_table_cache: dict[str, str] | None = None
+
+    def _closure_tables(self) -> dict[str, str]:
+        """Map each self-ref traversal FK to its closure table, if one exists.
+
+        Probed once per repository — a closure migration applied while the
+        server runs is picked up on the next restart.
+        """
+        if self._closure_table_cache is None:
+            candidates: dict[str, str] = {}
+            for f in self.entity_spec.fields:
+                via_field = getattr(f.type, "via_field", None)
+                if _traversal_kind(f) and getattr(f.type, "via_entity", None) is None and via_field:
+                    candidates[closure_table_name(self.table_name, via_field)] = via_field
+            found: dict[str, str] = {}
+            if candidates:
+                with self.db.connection() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute(CLOSURE_PROBE_SQL, [list(candidates)])
+                    for r in cursor.fetchall():
+                        found[candidates[r["name"]]] = r["name"]
+            self._closure_table_cache = found
+        return self._closure_table_cache
+
     def _record_query(self, query_type: str, latency_ms: float, rows: int = 0) -> None:
         """Record a database query metric."""
         if self._metrics:
@@ -739,6 +832,80 @@ class Repository[T: BaseModel]:
         row = cursor.fetchone()
         return self._row_to_model(row) if row is not None else None
 
+    def _tenant_slug_field(self) -> str | None:
+        """The ``tenant_host:`` slug column of this table, if it has one."""
+        from dazzle.tenant.cache_registry import slug_field_for
+
+        return slug_field_for(self.table_name)
+
+    def supports_set_update(self, field: str) -> bool:
+        """Can an update scoped by ``field = value`` run as one set-based ``UPDATE``?
+
+        Only for plain entities, where the rows ``UPDATE ... RETURNING *``
+        returns are exactly what ``read()`` would: no computed, latest_one or
+        traversal fields, no subtype JOIN, and no tenant slug to re-bust.
+        """
+        return (
+            field in self._field_types
+            and self._subtype_join_sql is None
+            and not self._computed_fields
+            and not any(
+                getattr(f.type, "kind", None) == FieldTypeKind.LATEST_ONE or _traversal_kind(f)
+                for f in self.entity_spec.fields
+            )
+            and self._tenant_slug_field() is None
+        )
+
+    def lock_matching_on_conn(self, conn: Any, field: str, value: Any) -> list[T]:
+        """Row-lock and return every visible row with ``field = value``, by id.
+
+        The first half of a set-based update: the caller validates the locked
+        rows and then writes them with ``update_ids_on_conn`` on the same
+        connection. Soft-deleted and (for temporal entities) closed rows are
+        skipped, as ``list()`` would.
+        """
+        ph = self.db.placeholder
+        table = quote_identifier(self.table_name)
+        clauses = [f"{quote_identifier(field)} = {ph}"]
+        if self.entity_spec.soft_delete:
+            clauses.append('"deleted_at" IS NULL')
+        temporal = self.entity_spec.temporal
+        if temporal is not None and temporal.default_filter == "active":
+            clauses.append(f"{quote_identifier(temporal.end_field)} IS NULL")
+        sql = (
+            f"SELECT * FROM {table} WHERE {' AND '.join(clauses)} "  # nosemgrep
+            'ORDER BY "id" FOR UPDATE'
+        )
+        start = time.perf_counter()
+        cursor = conn.cursor()
+        cursor.execute(sql, [self._python_to_db(value, self._field_types.get(field))])
+        rows = cursor.fetchall()
+        self._record_query("select", (time.perf_counter() - start) * 1000, rows=len(rows))
+        return [m for m in (self._safe_row_to_model(r) for r in rows) if m is not None]
+
+    def update_ids_on_conn(self, conn: Any, ids: list[UUID], data: dict[str, Any]) -> list[T]:
+        """Apply ``data`` to every row in ``ids`` with one ``UPDATE ... RETURNING``.
+
+        Runs on the caller's connection (the caller commits). Rows come back
+        ordered by id.
+        """
+        db_data = {k: self._python_to_db(v, self._field_types.get(k)) for k, v in data.items()}
+        ph = self.db.placeholder
+        table = quote_identifier(self.table_name)
+        set_clause = ", ".join(f"{quote_identifier(k)} = {ph}" for k in db_data)
+        sql = f'UPDATE {table} SET {set_clause} WHERE "id" = ANY({ph}) RETURNING *'  # nosemgrep
+        start = time.perf_counter()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(sql, [*db_data.values(), ids])
+            rows = cursor.fetchall()
+        except _INTEGRITY_ERRORS as exc:
+            raise _translate_integrity_error(exc, self.table_name) from exc
+        self._record_query("update", (time.perf_counter() - start) * 1000, rows=len(rows))
+        models = [self._row_to_model(r) for r in rows]
+        models.sort(key=lambda m: str(m.id))  # type: ignore[attr-defined]
+        return models
+
     async def create(self, data: dict[str, Any]) -> T:
         """
         Create a new entity.
@@ -857,6 +1024,7 @@ class Repository[T: BaseModel]:
                 extra_params = list(t_params)
             else:
                 temporal_clause = f' AND "{_temporal_read.end_field}" IS NULL'
+        computed_cols_sql = self._computed_select_sql()
         # #1217 Phase 3e follow-up: parity with list() — polymorphic-child
         # entities must JOIN to the base table on the shared id so that the
         # detail-row dict carries every base column (most importantly `kind`,
@@ -879,12 +1047,15 @@ class Repository[T: BaseModel]:
                 ", " + ", ".join(self._subtype_extra_cols) if self._subtype_extra_cols else ""
             )
             sql = (
-                f"SELECT {table}.*{extra_cols_sql} "
+                f"SELECT {table}.*{extra_cols_sql}{computed_cols_sql} "
                 f"FROM {table} {self._subtype_join_sql} "
                 f'WHERE {table}."id" = {ph}'
             )
         else:
-            sql = f'SELECT * FROM {table} WHERE "id" = {ph}{soft_delete_clause}{temporal_clause}'
+            sql = (
+                f"SELECT *{computed_cols_sql} FROM {table} "
+                f'WHERE "id" = {ph}{soft_delete_clause}{temporal_clause}'
+            )
         params: tuple[Any, ...] = (str(id), *extra_params)
 
         start = time.perf_counter()
@@ -906,11 +1077,7 @@ class Repository[T: BaseModel]:
             for f in self.entity_spec.fields
         )
         # #1227 Phase 3b.ii: descendants_of / ancestors_of resolution.
-        _has_traversal = any(
-            getattr(f.type, "kind", None)
-            in (FieldTypeKind.DESCENDANTS_OF, FieldTypeKind.ANCESTORS_OF)
-            for f in self.entity_spec.fields
-        )
+        _has_traversal = any(_traversal_kind(f) for f in self.entity_spec.fields)
 
         # If relations requested, load them and return dict
         if include and self._relation_loader:
@@ -932,7 +1099,7 @@ class Repository[T: BaseModel]:
                 )
             if _has_traversal:
                 row_dicts = _resolve_recursive_traversal_fields(
-                    row_dicts, self.entity_spec, self.db, self.table_name
+                    row_dicts, self.entity_spec, self.db, self.table_name, self._closure_tables()
                 )
             return self._convert_row_dict(row_dicts[0])
 
@@ -955,7 +1122,7 @@ class Repository[T: BaseModel]:
                 )
             if _has_traversal:
                 row_dicts_l = _resolve_recursive_traversal_fields(
-                    row_dicts_l, self.entity_spec, self.db, self.table_name
+                    row_dicts_l, self.entity_spec, self.db, self.table_name, self._closure_tables()
                 )
             return self._convert_row_dict(row_dicts_l[0])
 
@@ -991,9 +1158,7 @@ class Repository[T: BaseModel]:
         # we can bust the tenant cache for both old + new slugs after the
         # UPDATE commits. Skipped entirely on non-tenant-host entities so
         # the hot path stays a single SQL round-trip.
-        from dazzle.tenant.cache_registry import slug_field_for
-
-        slug_field = slug_field_for(self.table_name)
+        slug_field = self._tenant_slug_field()
         old_slug: str | None = None
         if slug_field is not None and slug_field in update_data:
             pre = await self.read(id)
@@ -1150,6 +1315,7 @@ class Repository[T: BaseModel]:
         if select_fields:
             builder.select_fields = list(select_fields)
         builder.set_pagination(page, page_size)
+        builder.computed_columns = self._pushdown_computed()
 
         # #1218 Option A: tombstone filter for soft-delete entities.
         # Composes via QueryBuilder so the predicate AND-merges with
@@ -1292,14 +1458,10 @@ class Repository[T: BaseModel]:
             )
 
         # #1227 Phase 3b.ii: descendants_of / ancestors_of resolution.
-        _has_traversal = any(
-            getattr(f.type, "kind", None)
-            in (FieldTypeKind.DESCENDANTS_OF, FieldTypeKind.ANCESTORS_OF)
-            for f in self.entity_spec.fields
-        )
+        _has_traversal = any(_traversal_kind(f) for f in self.entity_spec.fields)
         if _has_traversal:
             row_dicts = _resolve_recursive_traversal_fields(
-                row_dicts, self.entity_spec, self.db, self.table_name
+                row_dicts, self.entity_spec, self.db, self.table_name, self._closure_tables()
             )
 
         # Convert to models (or return dicts if relations/computed fields included)
@@ -1524,17 +1686,57 @@ class Repository[T: BaseModel]:
 
         # Add computed fields
         if self._computed_fields:
-            from dazzle.http.runtime.computed_evaluator import (
-                evaluate_computed_fields,
-            )
-
             # Use collected relations or provided related_data
             rel_data = related_data if related_data is not None else collected_relations
-            computed_values = evaluate_computed_fields(result, self._computed_fields, rel_data)
-            result.update(computed_values)
+            self._apply_computed_fields(result, row, rel_data)
 
         return result
 
+    def _apply_computed_fields(
+        self,
+        result: dict[str, Any],
+        row: dict[str, Any],
+        rel_data: dict[str, _list[dict[str, Any]]],
+    ) -> None:
+        """Fill computed fields: pushed-down values from ``row``, the rest in Python."""
+        from dazzle.http.runtime.computed_evaluator import (
+            evaluate_computed_fields,
+        )
+
+        pending: _list[ComputedFieldSpec] = []
+        for cf in self._computed_fields:
+            if cf.name in row:
+                result[cf.name] = coerce_computed_value(cf.expression, row[cf.name])
+            else:
+                pending.append(cf)
+        result.update(evaluate_computed_fields(result, pending, rel_data))
+
+    def _computed_select_sql(self) -> str:
+        """``, <expr> AS "<name>"`` per pushed-down computed field, for raw SELECTs."""
+        return "".join(
+            f", {sql} AS {quote_identifier(name)}"
+            for name, sql in self._pushdown_computed().items()
+        )
+
+    def _pushdown_computed(self) -> dict[str, str]:
+        """SQL for the computed fields the database can evaluate (see ``computed_sql``)."""
+        if not self._computed_fields:
+            return {}
+        today = calendar_today()
+        cached = self._pushdown_cache
+        if cached is not None and cached[0] == today:
+            return cached[1]
+        loader = self._relation_loader
+        ctx = ComputedSqlContext(
+            entity=self.entity_spec,
+            entities=loader.entity_map if loader else {},
+            registry=loader.registry if loader else None,
+            today=today,
+        )
+        compiled = compile_computed_fields(self._computed_fields, ctx)
+        self._pushdown_cache = (today, compiled)
+        return compiled
+
     async def fts_search(
         self,
         spec: ir.SearchSpec,
@@ -1597,20 +1799,6 @@ class Repository[T: BaseModel]:
                 params.extend(scope_params)
         where_clause = " AND ".join(where_parts)
 
-        # Count first so pagination metadata is correct.
-        # SQL is parameterised — `q` and scope params bind via cursor params;
-        # only safe identifiers (validated `config`, quoted `table`, hardcoded
-        # placeholder) are interpolated into the string.
-        count_sql = f"SELECT COUNT(*) FROM {table} WHERE {where_clause}"
-        with self.db.connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(count_sql, params)  # nosemgrep
-            row = cursor.fetchone()
-            total = row[0] if isinstance(row, (tuple, list)) else next(iter(row.values()))
-
-        if total == 0:
-            return {"items": [], "total": 0, "page": page, "page_size": page_size}
-
         # #954 cycle 4 — `ts_headline` snippet columns when the spec
         # opts in via `highlight: true`. Each searchable text field
         # gets a `<field>__snippet` column wrapping matched terms in
@@ -1636,13 +1824,18 @@ class Repository[T: BaseModel]:
             if snippet_parts:
                 snippet_sql = ", " + ", ".join(snippet_parts)
 
-        # Items: rank + full row + optional snippets. Param order
-        # matters: ts_rank's q, [snippet qs...], the WHERE clause's q,
-        # then any scope params, then page_size/offset.
+        # Items: rank + full row + optional snippets, plus the match
+        # count as a window aggregate so one query serves both the page
+        # and the pagination metadata. Param order matters: ts_rank's q,
+        # [snippet qs...], the WHERE clause's q, then any scope params,
+        # then page_size/offset.
+        # SQL is parameterised — `q` and scope params bind via cursor params;
+        # only safe identifiers (validated `config`, quoted `table`, hardcoded
+        # placeholder) are interpolated into the string.
         items_sql = (
             f"SELECT *, "
             f"ts_rank_cd(search_vector, websearch_to_tsquery('{config}', {ph})) "
-            f"AS rank{snippet_sql} "
+            f"AS rank{snippet_sql}, count(*) OVER () AS {_FTS_TOTAL_COLUMN} "
             f"FROM {table} WHERE {where_clause} "
             f"ORDER BY rank DESC LIMIT {ph} OFFSET {ph}"
         )
@@ -1652,8 +1845,19 @@ class Repository[T: BaseModel]:
             cursor = conn.cursor()
             cursor.execute(items_sql, items_params)  # nosemgrep
             rows = cursor.fetchall()
+            if not rows and offset:
+                # Paged past the last match — no row carried the count.
+                cursor.execute(  # nosemgrep
+                    f"SELECT COUNT(*) FROM {table} WHERE {where_clause}", params
+                )
+                row = cursor.fetchone()
+                total = row[0] if isinstance(row, (tuple, list)) else next(iter(row.values()))
+            else:
+                total = 0
 
         items = [dict(r) if not isinstance(r, dict) else r for r in rows]
+        for item in items:
+            total = item.pop(_FTS_TOTAL_COLUMN, total)
         result: dict[str, Any] = {
             "items": items,
             "total": int(total),
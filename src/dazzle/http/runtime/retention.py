@@ -1,131 +1,332 @@
-"""Generic retention-sweep helper (#953 cycle 10).
+"""Set-based retention purge engine (#953 / #956).
 
-Bulk-delete rows from a framework system entity older than a
-threshold. Reusable across both `JobRun` (#953) and `AuditEntry`
-(#956) — both have the same shape: a date column + a need to
-prevent unbounded historical growth.
+Deletes expired rows from framework system tables (`JobRun`,
+`AuditEntry`) in bounded, index-driven batches instead of paging
+through the service layer and deleting one id at a time. The old
+sweep issued one round trip, one lifecycle-hook pass and one WAL
+record per row. A month of audit history therefore competed with
+user traffic for hours.
 
-Cycle 11 will wire this for `JobRun` via a built-in scheduled
-job (uses the cycle-7b cron scheduler). Cycle 12 will wire it
-for `AuditEntry` per-spec from `AuditSpec.retention_days`.
+Each batch is one short transaction:
+
+    DELETE FROM t WHERE ctid IN (
+        SELECT ctid FROM t WHERE <date> < cutoff [AND <filters>]
+        LIMIT n FOR UPDATE SKIP LOCKED)
+
+The inner ``SELECT`` walks the date index (`AuditEntry(entity_type,
+at)`, `JobRun(created_at)`). ``SKIP LOCKED`` steps around rows a live
+request is holding. The batch size bounds how long any row lock is
+held.
+
+Tables an operator has range-partitioned on the date column are
+detected automatically. A partition whose upper bound is at or before
+the cutoff is detached (``DETACH PARTITION ... CONCURRENTLY``, so
+queries on the parent keep running) and then dropped — a catalog
+operation rather than a delete. Rows left in straddling partitions are
+then deleted partition by partition. Partitions are only dropped for
+unfiltered targets, because a partition holds rows of every
+`entity_type`; ``partition_values`` further restricts the drop to
+partitions holding nothing but the listed values.
+
+Every batch is timed. A ``PurgeReport`` carries throughput and
+per-batch lock times so operators can tune ``batch_size`` and
+``pause`` against live load.
 
 Design notes
 ------------
 
-* **Service-level delete, not raw SQL.** Goes through the
-  framework's repository/service layer so any tenant scoping +
-  cascade behaviour stays consistent. Some services don't
-  expose bulk delete yet; the helper falls back to per-row
-  delete and logs a hint to add a bulk path.
-* **Best-effort.** Failures during the sweep log + return a
-  partial count rather than raising — retention is housekeeping,
-  not safety-critical. The cycle-11 scheduled job will surface
-  failures via `JobRun.error_message` for operator triage.
-* **`older_than=0` is a no-op.** Both `JobSpec.retention_days`
-  and `AuditSpec.retention_days` use 0 to mean "keep forever";
-  the helper honours that without iterating the table.
+* **Raw SQL, not the service layer.** Retention targets are framework
+  tables with no user lifecycle hooks. Going through `service.delete`
+  cost more than the delete itself.
+* **Best-effort.** A failing batch is logged and ends that target
+  with a partial report rather than raising. Retention is
+  housekeeping, not safety-critical.
+* **`older_than_days=0` is a no-op.** Both `JobSpec.retention_days`
+  and `AuditSpec.retention_days` use 0 to mean "keep forever".
 """
 
 from __future__ import annotations
 
 import logging
+import statistics
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
+from dazzle.http.runtime.query_builder import quote_identifier
+
 logger = logging.getLogger(__name__)
 
+# Leaf partitions of ``table`` with whether each lies wholly before the
+# cutoff. ``expired`` is only computed for range partitions keyed on the
+# date column (the CASE keeps the bound cast away from other key types).
+# A plain table has no rows here.
+_PARTITIONS_SQL = """\
+SELECT t.relid::regclass::text AS name,
+       t.parentrelid::regclass::text AS parent,
+       p.partdefid <> 0 AS has_default,
+       greatest(c.reltuples, 0)::bigint AS estimate,
+       CASE WHEN pg_get_partkeydef(t.parentrelid) = ANY(%(keys)s)
+            THEN (regexp_match(pg_get_expr(c.relpartbound, c.oid),
+                               'TO \\(''([^'']+)''\\)'))[1]::timestamptz <= %(cutoff)s
+       END AS expired
+  FROM pg_partition_tree(to_regclass(%(table)s)) t
+  JOIN pg_class c ON c.oid = t.relid
+  JOIN pg_partitioned_table p ON p.partrelid = t.parentrelid
+ WHERE t.isleaf AND t.level > 0
+ ORDER BY 1"""
+
+
+@dataclass(frozen=True)
+class PurgeTarget:
+    """One retention rule: rows of ``table`` older than ``older_than_days``.
+
+    Attributes:
+        table: Table (entity) name
+        date_column: Timestamp column compared against the cutoff
+        older_than_days: Retention window; ``0`` keeps rows forever
+        where: Extra equality filters, e.g. ``{"entity_type": "Order"}``
+        label: Key the report is filed under (defaults to ``table``)
+        partitions_only: Only drop expired partitions, never delete rows
+        partition_values: Drop an expired partition only when every row's
+            value of each column is in the listed values, e.g.
+            ``{"entity_type": ("Order", "Invoice")}``; a partition also
+            holding other values is left to row-level targets
+    """
+
+    table: str
+    date_column: str
+    older_than_days: int
+    where: dict[str, Any] = field(default_factory=dict)
+    label: str = ""
+    partitions_only: bool = False
+    partition_values: dict[str, Sequence[Any]] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        return self.label or self.table
+
+
+@dataclass(frozen=True)
+class PurgeBatch:
+    """One statement's worth of work and how long its locks were held."""
+
+    relation: str
+    rows: int
+    lock_ms: float
+    dropped: bool = False
+
+
+@dataclass
+class PurgeReport:
+    """Outcome of purging one target.
+
+    ``deleted`` counts a dropped partition by the planner's row
+    estimate, since counting it exactly would mean scanning it.
+    """
+
+    target: str
+    batches: list[PurgeBatch] = field(default_factory=list)
+    elapsed: float = 0.0
+    error: str | None = None
+
+    @property
+    def deleted(self) -> int:
+        return sum(b.rows for b in self.batches)
 
-async def sweep_old_rows(
-    service: Any,
+    @property
+    def partitions_dropped(self) -> list[str]:
+        return [b.relation for b in self.batches if b.dropped]
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.deleted / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def lock_ms_p50(self) -> float:
+        return statistics.median(b.lock_ms for b in self.batches) if self.batches else 0.0
+
+    @property
+    def lock_ms_max(self) -> float:
+        return max((b.lock_ms for b in self.batches), default=0.0)
+
+    def summary(self) -> str:
+        dropped = len(self.partitions_dropped)
+        return (
+            f"{self.target}: {self.deleted} row(s) in {len(self.batches) - dropped} batch(es)"
+            f" + {dropped} partition(s), {self.rows_per_second:.0f} rows/s,"
+            f" lock p50 {self.lock_ms_p50:.1f}ms max {self.lock_ms_max:.1f}ms"
+            + (f" — stopped: {self.error}" if self.error else "")
+        )
+
+
+def purge_expired(
+    db_manager: Any,
+    target: PurgeTarget,
     *,
-    date_field: str,
-    older_than_days: int,
-    page_size: int = 200,
-) -> int:
-    """Delete rows from ``service`` whose ``date_field`` is older
-    than ``older_than_days``.
+    batch_size: int = 5000,
+    pause: float = 0.0,
+    now: datetime | None = None,
+    clock: Callable[[], float] = time.perf_counter,
+    sleep: Callable[[float], None] = time.sleep,
+) -> PurgeReport:
+    """Delete ``target``'s expired rows, dropping whole partitions where it can.
+
+    Blocking — the async runner calls this in a worker thread.
 
     Args:
-        service: A framework service (cycle-2 `JobRun` or
-            `AuditEntry`). Must expose `list(filters=..., page=...,
-            page_size=...)` and `delete(id=...)` async methods.
-        date_field: Name of the date column to compare against.
-            ``"created_at"`` for JobRun; ``"at"`` for AuditEntry.
-        older_than_days: Threshold in days. ``0`` means "keep
-            forever" — function returns 0 immediately.
-        page_size: Rows per fetched page during the sweep. Bounds
-            memory and avoids long-running transactions on big
-            tables.
+        db_manager: ``PostgresBackend`` (or anything with ``connection()``)
+        target: What to purge
+        batch_size: Rows per ``DELETE``; bounds each transaction's lock time
+        pause: Seconds to sleep between batches, yielding to live traffic
+        now: Reference time for the cutoff (defaults to the current UTC time)
+        clock: Timer for batch lock times (injectable for tests)
+        sleep: Sleep used for ``pause`` (injectable for tests)
 
     Returns:
-        Number of rows successfully deleted. Partial counts on
-        per-row failures (logged at WARNING).
+        A report of every batch; partial with ``error`` set if a batch failed.
     """
-    if older_than_days <= 0:
-        return 0
-    if service is None:
-        return 0
-
-    cutoff = datetime.now(UTC) - timedelta(days=older_than_days)
-    deleted = 0
-    page = 1
+    report = PurgeReport(target.key)
+    if target.older_than_days <= 0 or db_manager is None:
+        return report
 
-    while True:
-        try:
-            rows = await service.list(
-                filters={f"{date_field}__lt": cutoff},
-                page=page,
-                page_size=page_size,
-            )
-        except Exception:
-            logger.warning(
-                "Retention sweep list-page failed (page=%d) — stopping",
-                page,
-                exc_info=True,
-            )
-            break
-
-        items = _unwrap_items(rows)
-        if not items:
-            break
-
-        for row in items:
-            row_id = _row_id(row)
-            if row_id is None:
-                continue
-            try:
-                await service.delete(row_id)
-                deleted += 1
-            except Exception:
-                logger.warning(
-                    "Retention sweep delete failed for id=%s — continuing",
-                    row_id,
-                    exc_info=True,
+    cutoff = (now or datetime.now(UTC)) - timedelta(days=target.older_than_days)
+    started = clock()
+    try:
+        relations = _drop_expired_partitions(db_manager, target, cutoff, report, clock)
+        if not target.partitions_only:
+            for relation in relations:
+                _delete_batches(
+                    db_manager, target, relation, cutoff, report, batch_size, pause, clock, sleep
                 )
+    except Exception as exc:
+        report.error = str(exc) or type(exc).__name__
+        logger.warning("Retention purge of %s stopped early", target.key, exc_info=True)
+    report.elapsed = clock() - started
 
-        # Defensive: stop after one page when the page is short.
-        # Otherwise the same rows could re-appear on page 2 if the
-        # underlying list query isn't stable across deletes.
-        if len(items) < page_size:
-            break
-        page += 1
+    if report.batches or report.error:
+        logger.info("Retention purge %s (cutoff %s)", report.summary(), cutoff.isoformat())
+    return report
 
-    if deleted:
-        logger.info("Retention sweep deleted %d row(s) older than %s", deleted, cutoff)
-    return deleted
 
+def _drop_expired_partitions(
+    db_manager: Any,
+    target: PurgeTarget,
+    cutoff: datetime,
+    report: PurgeReport,
+    clock: Callable[[], float],
+) -> list[str]:
+    """Drop wholly-expired partitions; return the relations still to batch-delete."""
+    column = target.date_column
+    params = {
+        "table": quote_identifier(target.table),
+        "keys": [f"RANGE ({column})", f"RANGE ({quote_identifier(column)})"],
+        "cutoff": cutoff,
+    }
+    with db_manager.connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(_PARTITIONS_SQL, params)
+        partitions = cursor.fetchall()
+    if not partitions:
+        return [quote_identifier(target.table)]
 
-def _unwrap_items(rows: Any) -> list[Any]:
-    """Tolerate both list-of-dicts and paged-response shapes."""
-    if isinstance(rows, dict) and "items" in rows:
-        return list(rows["items"])
-    if isinstance(rows, list):
-        return rows
-    return []
+    remaining: list[str] = []
+    for part in partitions:
+        if not part["expired"] or target.where:
+            remaining.append(part["name"])
+            continue
+        if target.partition_values and _holds_other_values(
+            db_manager, part["name"], target.partition_values
+        ):
+            remaining.append(part["name"])
+            continue
+        began = clock()
+        _drop_partition(db_manager, part)
+        report.batches.append(
+            PurgeBatch(part["name"], int(part["estimate"]), (clock() - began) * 1000, dropped=True)
+        )
+    return remaining
+
+
+def _holds_other_values(db_manager: Any, relation: str, allowed: dict[str, Sequence[Any]]) -> bool:
+    """Whether any row of ``relation`` has a value outside ``allowed`` (NULL included)."""
+    conditions = []
+    params: dict[str, Any] = {}
+    for i, (column, values) in enumerate(sorted(allowed.items())):
+        conditions.append(f"NOT coalesce({quote_identifier(column)} = ANY(%(v{i})s), false)")
+        params[f"v{i}"] = list(values)
+    sql = f"SELECT EXISTS (SELECT 1 FROM {relation} WHERE {' OR '.join(conditions)}) AS other"
+    with db_manager.connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(sql, params)
+        row = cursor.fetchone()
+    return bool(row["other"])
+
+
+def _drop_partition(db_manager: Any, part: dict[str, Any]) -> None:
+    """Detach ``part`` without blocking queries on its parent, then drop it.
+
+    ``DETACH ... CONCURRENTLY`` cannot run inside a transaction block, so
+    the lease's session setup is committed first and the statements run in
+    autocommit. Postgres refuses it while the parent has a default
+    partition; a plain ``DROP`` is used then.
+    """
+    name = part["name"]
+    with db_manager.connection() as conn:
+        if part["has_default"]:
+            conn.cursor().execute(f"DROP TABLE IF EXISTS {name}")
+            return
+        conn.commit()
+        conn.autocommit = True
+        try:
+            cursor = conn.cursor()
+            cursor.execute(f"ALTER TABLE {part['parent']} DETACH PARTITION {name} CONCURRENTLY")
+            cursor.execute(f"DROP TABLE IF EXISTS {name}")
+        finally:
+            conn.autocommit = False
+
+
+def _delete_batches(
+    db_manager: Any,
+    target: PurgeTarget,
+    relation: str,
+    cutoff: datetime,
+    report: PurgeReport,
+    batch_size: int,
+    pause: float,
+    clock: Callable[[], float],
+    sleep: Callable[[float], None],
+) -> None:
+    """Delete ``relation``'s expired rows ``batch_size`` at a time until none are left."""
+    sql, params = _batch_delete_sql(target, relation, cutoff, batch_size)
+    while True:
+        began = clock()
+        with db_manager.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(sql, params)
+            rows = max(cursor.rowcount, 0)
+        if not rows:
+            return
+        report.batches.append(PurgeBatch(relation, rows, (clock() - began) * 1000))
+        if rows < batch_size:
+            return
+        if pause > 0:
+            sleep(pause)
 
 
-def _row_id(row: Any) -> Any:
-    """Extract `id` from a dict, Pydantic model, or attr-bearing object."""
-    if isinstance(row, dict):
-        return row.get("id")
-    return getattr(row, "id", None)
+def _batch_delete_sql(
+    target: PurgeTarget, relation: str, cutoff: datetime, batch_size: int
+) -> tuple[str, dict[str, Any]]:
+    conditions = [f"{quote_identifier(target.date_column)} < %(cutoff)s"]
+    params: dict[str, Any] = {"cutoff": cutoff, "limit": batch_size}
+    for i, (column, value) in enumerate(sorted(target.where.items())):
+        conditions.append(f"{quote_identifier(column)} = %(w{i})s")
+        params[f"w{i}"] = value
+    sql = (
+        f"DELETE FROM {relation} WHERE ctid IN ("
+        f"SELECT ctid FROM {relation} WHERE {' AND '.join(conditions)} "
+        f"LIMIT %(limit)s FOR UPDATE SKIP LOCKED)"
+    )
+    return sql, params
@@ -1,6 +1,6 @@
 """Retention sweep loop (#953 cycle 12 / #956 cycle 12).
 
-Wraps cycle-11's ``run_retention_sweep`` orchestrator in an async
+Wraps the ``run_retention_purge`` orchestrator in an async
 loop that fires daily on a configurable cron. Runs alongside the
 cycle-5 worker loop and cycle-7b scheduler loop in the cycle-9
 ``dazzle worker`` CLI.
@@ -11,7 +11,7 @@ the regular scheduler?
   * Retention is **framework-internal** — it doesn't go through
     `JobSpec.run` resolution (cycle 3) because there's no
     user-author callable to dispatch.
-  * Calling `run_retention_sweep` directly avoids a needless
+  * Calling `run_retention_purge` directly avoids a needless
     queue round-trip and keeps retention failures from showing
     up in the user's `JobRun` table as a generic "job failed"
     row.
@@ -24,31 +24,36 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Collection
 from datetime import UTC, datetime
 from typing import Any
 
-from dazzle.http.runtime.cron import CronParseError, cron_matches, parse_cron
-from dazzle.http.runtime.retention_runner import run_retention_sweep
+from dazzle.core.cron import CronParseError, cron_matches, parse_cron
+from dazzle.http.runtime.retention_runner import retention_targets, run_retention_purge
 
 logger = logging.getLogger(__name__)
 
 
 async def run_retention_loop(
     *,
-    services: dict[str, Any],
+    db_manager: Any,
+    entities: Collection[str] = (),
     audits: list[Any] | None = None,
     stop_event: asyncio.Event,
     cron: str = "0 3 * * *",
     jobrun_retention_days: int = 30,
     tick_interval: float = 60.0,
+    batch_size: int = 5000,
+    pause: float = 0.0,
 ) -> dict[str, int]:
     """Tick every ``tick_interval`` seconds, run retention when the
     cron matches.
 
     Args:
-        services: Same ``{entity_name: BaseService}`` dict the
-            cycle-9 CLI passes around. Looks up ``JobRun`` and
-            ``AuditEntry`` lazily inside the runner.
+        db_manager: The worker's ``PostgresBackend``; ``None``
+            (no ``DATABASE_URL``) makes every run a no-op.
+        entities: Entity names with services in the worker;
+            `JobRun` / `AuditEntry` are purged only when present.
         audits: ``appspec.audits`` list. None / empty = no audit
             cleanup (only JobRun retention runs).
         stop_event: Trip to end the loop. Cycle-9 CLI shares this
@@ -61,11 +66,13 @@ async def run_retention_loop(
         tick_interval: Seconds between cron-match checks. Default
             60s = once a minute, which is the resolution the
             5-field cron expression supports anyway.
+        batch_size: Rows per purge ``DELETE``.
+        pause: Seconds between purge batches.
 
     Returns:
         Stats dict with `runs` (count of retention sweeps),
         `ticks` (loop iterations), `loop_errors`, and the most
-        recent per-source delete counts under
+        recent per-target delete counts under
         ``last_*`` keys for cycle-9 CLI summary output.
     """
     stats: dict[str, int] = {"runs": 0, "ticks": 0, "loop_errors": 0}
@@ -76,12 +83,14 @@ async def run_retention_loop(
         logger.error("Invalid retention cron %r: %s — loop disabled", cron, exc)
         return stats
 
+    targets = retention_targets(entities, audits or [], jobrun_retention_days=jobrun_retention_days)
     last_fired: datetime | None = None
 
     logger.info(
-        "Retention loop starting (cron=%r, jobrun_retention_days=%d)",
+        "Retention loop starting (cron=%r, targets=%d, batch_size=%d)",
         cron,
-        jobrun_retention_days,
+        len(targets),
+        batch_size,
     )
 
     while not stop_event.is_set():
@@ -91,14 +100,15 @@ async def run_retention_loop(
             if cron_matches(parsed_cron, now) and last_fired != now:
                 logger.info("Retention sweep firing at %s", now.isoformat())
                 try:
-                    sweep_stats = await run_retention_sweep(
-                        services=services,
-                        audits=audits or [],
-                        jobrun_retention_days=jobrun_retention_days,
+                    reports = await run_retention_purge(
+                        db_manager=db_manager,
+                        targets=targets,
+                        batch_size=batch_size,
+                        pause=pause,
                     )
                     stats["runs"] += 1
-                    for k, v in sweep_stats.items():
-                        stats[f"last_{k}"] = v
+                    for k, report in reports.items():
+                        stats[f"last_{k}"] = report.deleted
                     last_fired = now
                 except Exception:
                     stats["loop_errors"] += 1
@@ -1,168 +1,116 @@
-"""Retention orchestrator (#953 cycle 11, also unblocks #956 cycle 12).
+"""Retention orchestrator (#953 cycle 11, #956 cycle 12).
 
-Single async entry point that sweeps both built-in framework
-retention targets in one pass:
+Turns the AppSpec's retention rules into purge targets and runs them
+through the set-based engine in ``retention``:
 
   * `JobRun` rows older than ``jobrun_retention_days`` (default
     30) — historical worker invocations.
   * `AuditEntry` rows older than each `AuditSpec.retention_days`
     declared in the AppSpec — user-visible change history per
     entity. Audit blocks with ``retention_days=0`` are skipped
-    (the IR's "keep forever" sentinel, honoured by the cycle-10
-    sweep helper too).
-
-Cycle 12 will register this with the cycle-7b scheduler as a
-synthetic daily job so the operator gets retention for free
-without needing to author a `job:` block themselves.
+    (the IR's "keep forever" sentinel).
+
+When every audit block has a finite window, an extra unfiltered
+`AuditEntry` target at the longest window lets a partitioned audit
+table shed whole partitions before the per-entity row deletes run.
+It only drops partitions holding nothing but those entity types; a
+partition that also holds rows of an entity with no window is left to
+the per-entity row deletes.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Collection
 from typing import Any
 
-from dazzle.http.runtime.retention import sweep_old_rows
+from dazzle.http.runtime.retention import PurgeReport, PurgeTarget, purge_expired
 
 logger = logging.getLogger(__name__)
 
 
-async def run_retention_sweep(
-    *,
-    services: dict[str, Any],
+def retention_targets(
+    entities: Collection[str],
     audits: list[Any] | None = None,
+    *,
     jobrun_retention_days: int = 30,
-    page_size: int = 200,
-) -> dict[str, int]:
-    """Sweep both JobRun and AuditEntry retention in one pass.
+) -> list[PurgeTarget]:
+    """Purge targets for the platform tables present in ``entities``.
 
     Args:
-        services: ``{entity_name: BaseService}`` from the running
-            server. Looks up `JobRun` and `AuditEntry` by name;
-            silently skips when either is missing (cycle-2
-            injection didn't fire because no jobs / audits were
-            declared).
+        entities: Entity names the AppSpec declares. `JobRun` and
+            `AuditEntry` are only targeted when the linker injected
+            them.
         audits: ``appspec.audits`` list. Each `AuditSpec.entity`
-            shares one `AuditEntry` table; the sweep filters by
-            `entity_type` so per-entity retention windows are
-            honoured. None / empty skips audit cleanup.
+            shares one `AuditEntry` table, so each target filters by
+            `entity_type`. None or empty skips audit cleanup.
         jobrun_retention_days: How long to keep `JobRun` rows.
-            ``0`` means "keep forever" (the IR convention) — the
-            cycle-10 sweep helper short-circuits without
-            touching the service.
-        page_size: Per-page batch size threaded through to the
-            sweep helper. Defaults to a value that keeps memory
-            bounded on big tables without being so small it
-            burns DB round-trips.
-
-    Returns:
-        Per-source delete count: ``{"JobRun": N, "AuditEntry:Manuscript":
-        N, ...}``. Useful for the cycle-12 scheduled-job wrapper to
-        log + surface via JobRun.error_message on failure.
+            ``0`` means "keep forever" (the IR convention).
     """
-    stats: dict[str, int] = {}
-
-    job_run = services.get("JobRun")
-    if job_run is not None:
-        deleted = await sweep_old_rows(
-            job_run,
-            date_field="created_at",
-            older_than_days=jobrun_retention_days,
-            page_size=page_size,
+    targets: list[PurgeTarget] = []
+    if "JobRun" in entities and jobrun_retention_days > 0:
+        targets.append(PurgeTarget("JobRun", "created_at", jobrun_retention_days))
+
+    if "AuditEntry" not in entities or not audits:
+        return targets
+    windows = {
+        name: int(getattr(a, "retention_days", 0) or 0)
+        for a in audits
+        if (name := getattr(a, "entity", ""))
+    }
+    if windows and all(days > 0 for days in windows.values()):
+        targets.append(
+            PurgeTarget(
+                "AuditEntry",
+                "at",
+                max(windows.values()),
+                partitions_only=True,
+                partition_values={"entity_type": tuple(sorted(windows))},
+            )
         )
-        stats["JobRun"] = deleted
-
-    audit_entry = services.get("AuditEntry")
-    if audit_entry is not None and audits:
-        for audit_spec in audits:
-            entity_name = getattr(audit_spec, "entity", "")
-            retention = int(getattr(audit_spec, "retention_days", 0) or 0)
-            if not entity_name or retention <= 0:
-                continue
-            deleted = await _sweep_audit_for_entity(
-                audit_entry,
-                entity_name=entity_name,
-                older_than_days=retention,
-                page_size=page_size,
+    for entity_name, days in windows.items():
+        if days <= 0:
+            continue
+        targets.append(
+            PurgeTarget(
+                "AuditEntry",
+                "at",
+                days,
+                where={"entity_type": entity_name},
+                label=f"AuditEntry:{entity_name}",
             )
-            stats[f"AuditEntry:{entity_name}"] = deleted
-
-    if stats:
-        logger.info("Retention sweep complete: %s", stats)
-    return stats
+        )
+    return targets
 
 
-async def _sweep_audit_for_entity(
-    audit_entry_service: Any,
+async def run_retention_purge(
     *,
-    entity_name: str,
-    older_than_days: int,
-    page_size: int,
-) -> int:
-    """Sweep `AuditEntry` rows for one audited entity type.
-
-    Wraps the cycle-10 helper with an additional `entity_type`
-    filter so per-entity retention windows are honoured (a
-    `Manuscript` audit block with 90-day retention shouldn't
-    delete `Order` audit rows that have a 365-day retention).
-    """
-    from datetime import UTC, datetime, timedelta
-
-    if older_than_days <= 0:
-        return 0
-
-    cutoff = datetime.now(UTC) - timedelta(days=older_than_days)
-    deleted = 0
-    page = 1
-    while True:
-        try:
-            rows = await audit_entry_service.list(
-                filters={"entity_type": entity_name, "at__lt": cutoff},
-                page=page,
-                page_size=page_size,
-            )
-        except Exception:
-            logger.warning(
-                "AuditEntry retention list-page failed for %s (page=%d) — stopping",
-                entity_name,
-                page,
-                exc_info=True,
-            )
-            break
-
-        items = _unwrap_items(rows)
-        if not items:
-            break
-
-        for row in items:
-            row_id = _row_id(row)
-            if row_id is None:
-                continue
-            try:
-                await audit_entry_service.delete(row_id)
-                deleted += 1
-            except Exception:
-                logger.warning(
-                    "AuditEntry retention delete failed for id=%s — continuing",
-                    row_id,
-                    exc_info=True,
-                )
-
-        if len(items) < page_size:
-            break
-        page += 1
-
-    return deleted
-
-
-def _unwrap_items(rows: Any) -> list[Any]:
-    if isinstance(rows, dict) and "items" in rows:
-        return list(rows["items"])
-    if isinstance(rows, list):
-        return rows
-    return []
+    db_manager: Any,
+    targets: list[PurgeTarget],
+    batch_size: int = 5000,
+    pause: float = 0.0,
+) -> dict[str, PurgeReport]:
+    """Purge every target in turn, off the event loop.
 
+    Args:
+        db_manager: The worker's ``PostgresBackend``. ``None`` (no
+            ``DATABASE_URL``) makes the run a no-op.
+        targets: From :func:`retention_targets`.
+        batch_size: Rows per ``DELETE`` statement.
+        pause: Seconds to sleep between batches.
 
-def _row_id(row: Any) -> Any:
-    if isinstance(row, dict):
-        return row.get("id")
-    return getattr(row, "id", None)
+    Returns:
+        ``{target key: PurgeReport}``, e.g. ``{"JobRun": ...,
+        "AuditEntry:Manuscript": ...}``.
+    """
+    reports: dict[str, PurgeReport] = {}
+    if db_manager is None:
+        return reports
+    for target in targets:
+        reports[target.key] = await asyncio.to_thread(
+            purge_expired, db_manager, target, batch_size=batch_size, pause=pause
+        )
+    if reports:
+        logger.info("Retention purge complete: %s", {k: r.deleted for k, r in reports.items()})
+    return reports
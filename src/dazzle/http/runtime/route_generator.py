@@ -85,6 +85,7 @@ from dazzle.http.runtime.audit_wrap import (  # noqa: F401  (re-exported for bac
     _record_to_dict,
     _wrap_with_auth,
 )
+from dazzle.http.runtime.graph_snapshot import GraphSnapshotCache
 
 # CRUD + graph handler factories live in the handlers/ package (#1361 final
 # slice). Same re-import contract as scope_filters / htmx_render / audit_wrap:
@@ -328,8 +329,20 @@ class RouteGenerator:
         # so forged file references are rejected before the write proceeds.
         self.file_service: Any | None = file_service
         self.entity_file_fields: dict[str, list[str]] = entity_file_fields or {}
+        # #619: CSR snapshots shared by every graph endpoint, kept current
+        # from the edge/node services' lifecycle callbacks.
+        self.graph_snapshots = GraphSnapshotCache()
         self._router = _APIRouter()
 
+    def _entity_service(self, entity_name: str) -> Any | None:
+        """The CRUD service for ``entity_name``, if it exposes lifecycle callbacks."""
+        for service in self.services.values():
+            if getattr(service, "entity_name", None) == entity_name and hasattr(
+                service, "on_deleted"
+            ):
+                return service
+        return None
+
     def generate_route(
         self,
         endpoint: EndpointSpec,
@@ -553,6 +566,12 @@ class RouteGenerator:
             # Register /graph neighborhood endpoint for graph_node entities (#619)
             _node_graph = self.node_graph_specs.get(entity_name or "")
             if _node_graph:
+                self.graph_snapshots.track(
+                    _node_graph["edge_table"],
+                    _node_graph["graph_edge"],
+                    self._entity_service(_node_graph["edge_table"]),
+                    service if hasattr(service, "on_deleted") else None,
+                )
                 _graph_path = endpoint.path.rstrip("/") + "/{id}/graph"
                 _graph_handler = create_neighborhood_handler(
                     entity_name=entity_name or "Item",
@@ -566,6 +585,7 @@ class RouteGenerator:
                     cedar_access_spec=_cedar_spec,
                     fk_graph=self.fk_graph,
                     ref_targets=self.entity_ref_targets.get(entity_name or ""),
+                    snapshots=self.graph_snapshots,
                 )
                 self._router.add_api_route(
                     _graph_path,
@@ -590,6 +610,7 @@ class RouteGenerator:
                     db_manager=self.db_manager,
                     filter_fields=_alg_filter_fields,
                     optional_auth_dep=self.optional_auth_dep,
+                    snapshots=self.graph_snapshots,
                 )
                 self._router.add_api_route(
                     _sp_path,
@@ -610,6 +631,7 @@ class RouteGenerator:
                     db_manager=self.db_manager,
                     filter_fields=_alg_filter_fields,
                     optional_auth_dep=self.optional_auth_dep,
+                    snapshots=self.graph_snapshots,
                 )
                 self._router.add_api_route(
                     _cc_path,
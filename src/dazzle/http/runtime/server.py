@@ -24,6 +24,7 @@ from dazzle.core.ir.fields import FieldTypeKind
 from dazzle.core.manifest import load_manifest
 from dazzle.core.strings import entity_slug as _entity_slug
 from dazzle.core.validator import validate_storage_refs
+from dazzle.documents.pdf_pool import shutdown_pdf_pool
 from dazzle.http.converters.entity_converter import convert_entities
 from dazzle.http.converters.surface_converter import convert_surfaces_to_services
 from dazzle.http.runtime.audit_wiring import register_audit_callbacks
@@ -1340,16 +1341,19 @@ class DazzleBackendApp:
 
         # #953 cycle 6 — wire job-trigger callbacks. Pure-scheduled
         # jobs (no triggers) are skipped here; cycle-7's cron
-        # scheduler enqueues those instead. The in-memory queue
-        # accumulates messages even before a worker is running;
-        # cycle-7+ will start the worker loop. Cycle-8 will swap
-        # the in-memory queue for `RedisJobQueue` satisfying the
-        # same Protocol — no caller change required.
+        # scheduler enqueues those instead. Triggered jobs go into
+        # the `_dazzle_job_queue` table, where `dazzle worker`
+        # processes claim them — they outlive this process.
         if self._appspec.jobs:
-            from dazzle.http.runtime.job_queue import InMemoryJobQueue
             from dazzle.http.runtime.job_triggers import register_job_triggers
+            from dazzle.http.runtime.postgres_job_queue import PostgresJobQueue
 
-            self._job_queue = InMemoryJobQueue()
+            if self._db_manager is None:
+                raise RuntimeError(
+                    "Jobs need a database for the _dazzle_job_queue table; "
+                    "set DATABASE_URL before booting an app that declares jobs."
+                )
+            self._job_queue = PostgresJobQueue(self._db_manager)
             register_job_triggers(self._services, list(self._appspec.jobs), self._job_queue)
 
         # #952 cycle 4 — wire notification dispatch callbacks against
@@ -2443,6 +2447,7 @@ class DazzleBackendApp:
                 )
                 if signing_router is not None:
                     self._app.include_router(signing_router)
+                    register_lifespan_hook(self._app, shutdown=shutdown_pdf_pool)
                     logger.info(
                         "  Signing: /sign/{entity}/{id} + /api/sign/{entity}/{id}"
                         " (file_service=%s)",
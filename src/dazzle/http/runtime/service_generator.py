@@ -20,7 +20,10 @@ from pydantic import BaseModel
 
 from dazzle.core.ir.params import ParamRef
 from dazzle.core.ir.state_machine import InvokeSourceKind
+from dazzle.http.runtime.grant_store import GrantStore
+from dazzle.http.runtime.invariant_evaluator import check_invariants_for_update
 from dazzle.http.runtime.model_generator import _create_date_factory, _is_date_expr
+from dazzle.http.runtime.state_machine import validate_status_update
 from dazzle.http.specs.entity import EntitySpec, StateMachineSpec
 from dazzle.http.specs.service import (
     ServiceSpec,
@@ -366,18 +369,7 @@ class CRUDService[T: BaseModel, CreateT: BaseModel, UpdateT: BaseModel](BaseServ
             validate_status_update,
         )
 
-        # Sanitize string/text input fields (v0.25 - #135)
-        self._sanitize_fields(data)
-
-        # Get update data, excluding None values
-        update_data = {k: v for k, v in data.model_dump().items() if v is not None}
-
-        # Inject auto_update timestamps (v0.25 - #132)
-        if self.entity_spec:
-            now = datetime.now(UTC)
-            for field in self.entity_spec.fields:
-                if field.auto_update:
-                    update_data[field.name] = now
+        update_data = self._prepare_update_data(data)
 
         # Read current entity for state machine validation
         current = await self.read(id)
@@ -487,6 +479,129 @@ class CRUDService[T: BaseModel, CreateT: BaseModel, UpdateT: BaseModel](BaseServ
 
         return updated
 
+    def _prepare_update_data(self, data: UpdateT) -> dict[str, Any]:
+        """Sanitized, non-None update fields plus auto_update timestamps."""
+        # Sanitize string/text input fields (v0.25 - #135)
+        self._sanitize_fields(data)
+
+        # Get update data, excluding None values
+        update_data = {k: v for k, v in data.model_dump().items() if v is not None}
+
+        # Inject auto_update timestamps (v0.25 - #132)
+        if self.entity_spec:
+            now = datetime.now(UTC)
+            for field in self.entity_spec.fields:
+                if field.auto_update:
+                    update_data[field.name] = now
+        return update_data
+
+    async def update_where(self, field: str, value: Any, data: UpdateT) -> builtins.list[T] | None:
+        """Apply one update to every row with ``field = value`` as a single write.
+
+        The set-based counterpart of calling :meth:`update` per matching row,
+        used by ``where:``-scoped process/transition effects. The matching rows
+        are locked, validated (state machine, invariants, references) and
+        written with one ``UPDATE ... RETURNING`` in a single transaction — a
+        failing row rolls the whole set back. ``on_updated`` callbacks then
+        fire per row in id order, with the same old/new data as the per-row
+        path, so audit and entity events are unchanged.
+
+        Returns:
+            The updated rows, or ``None`` when this entity needs the per-row
+            path (pre-update hooks, an ``invoke`` transition, or a repository
+            that cannot return rows faithfully). Nothing is written then.
+        """
+        if self._pre_update_hooks:
+            return None
+        update_data = self._prepare_update_data(data)
+        if self._repository is None:
+            return await self._update_where_in_memory(field, value, update_data)
+        if not self._repository.supports_set_update(field):
+            return None
+        await self._validate_references(update_data)
+
+        # The lock-validate-write transaction is blocking psycopg end to end;
+        # run it off the event loop so other requests keep being served.
+        written = await asyncio.to_thread(
+            self._update_where_txn, self._repository, field, value, update_data
+        )
+        if written is None:
+            return None
+        olds, updated = written
+        await self._notify_updated_many(
+            [(old, new.model_dump()) for old, new in zip(olds, updated, strict=True)]
+        )
+        return updated
+
+    def _update_where_txn(
+        self, repository: Any, field: str, value: Any, update_data: dict[str, Any]
+    ) -> tuple[builtins.list[dict[str, Any]], builtins.list[T]] | None:
+        """Lock, validate and write the matching rows in one transaction.
+
+        Returns the rows' old data and updated models, or ``None`` (nothing
+        written) when a row fails validation.
+        """
+        with repository.db.connection() as conn:
+            olds = [m.model_dump() for m in repository.lock_matching_on_conn(conn, field, value)]
+            grant_store = self._set_update_grant_store(conn, update_data)
+            if not self._check_set_update(olds, update_data, grant_store):
+                return None
+            updated = repository.update_ids_on_conn(conn, [old["id"] for old in olds], update_data)
+        return olds, updated
+
+    async def _update_where_in_memory(
+        self, field: str, value: Any, update_data: dict[str, Any]
+    ) -> builtins.list[T] | None:
+        """In-memory-store twin of the set-based update (tests / no database)."""
+        matching = sorted(
+            self._apply_filters(builtins.list(self._store.values()), {field: value}),
+            key=lambda m: str(m.id),  # type: ignore[attr-defined]
+        )
+        olds = [m.model_dump() for m in matching]
+        if not self._check_set_update(olds, update_data, None):
+            return None
+        updated = [self.model_class(**{**old, **update_data}) for old in olds]
+        for model in updated:
+            self._store[model.id] = model  # type: ignore[attr-defined]
+        await self._notify_updated_many(
+            [(old, new.model_dump()) for old, new in zip(olds, updated, strict=True)]
+        )
+        return updated
+
+    def _set_update_grant_store(self, conn: Any, update_data: dict[str, Any]) -> Any:
+        """A GrantStore for ``has_grant()`` guards when the update moves the status."""
+        if self.state_machine is None or self.state_machine.status_field not in update_data:
+            return None
+        return GrantStore(conn)
+
+    def _check_set_update(
+        self, olds: builtins.list[dict[str, Any]], update_data: dict[str, Any], grant_store: Any
+    ) -> bool:
+        """Validate each row of a set-based update; ``False`` = needs the per-row path.
+
+        Raises the same ``TransitionError`` / ``InvariantViolationError`` the
+        per-row :meth:`update` would for the first offending row.
+        """
+        invariants = self.entity_spec.invariants if self.entity_spec else None
+        for old in olds:
+            result = validate_status_update(
+                self.state_machine, old, update_data, grant_store=grant_store
+            )
+            if result is not None and not result.is_valid and result.error is not None:
+                raise result.error
+            if result is not None and getattr(result.transition, "invoke_flow", None) is not None:
+                return False
+            if invariants:
+                check_invariants_for_update(invariants, old, update_data, entity=self.entity_name)
+        return True
+
+    async def _notify_updated_many(
+        self, rows: builtins.list[tuple[dict[str, Any], dict[str, Any]]]
+    ) -> None:
+        """Notify ``on_updated`` callbacks for a batch of ``(old, new)`` rows, in order."""
+        for old, new in rows:
+            await self._notify_updated(str(new["id"]), new, old)
+
     async def _update_with_invoke(
         self,
         id: UUID,
@@ -4,6 +4,12 @@ Side-effect executor for process step effects.
 Executes create/update actions declared in process step `effects:` blocks.
 Each effect calls the target entity's CRUDService, which naturally fires
 downstream lifecycle events (process triggers, channel sends, etc.).
+
+A ``where:``-scoped update goes through ``CRUDService.update_where`` — one
+locked ``UPDATE ... RETURNING`` for every matching row instead of a list
+query plus an update per row. The service still fires ``on_updated`` per
+row, so audit and events are the same; entities it cannot batch (pre-update
+hooks, ``invoke`` transitions) fall back to the per-row loop.
 """
 
 from __future__ import annotations  # required: forward reference
@@ -15,6 +21,7 @@ from typing import Any
 from uuid import UUID
 
 from dazzle.core.ir.process import EffectAction, FieldAssignment, StepEffect
+from dazzle.http.runtime.service_generator import CRUDService
 
 logger = logging.getLogger(__name__)
 
@@ -148,6 +155,16 @@ class SideEffectExecutor:
     ) -> EffectResult:
         """Execute an update effect."""
         data = self._resolve_assignments(effect.assignments, context)
+        where = self._parse_where(effect, context)
+        if where is not None and isinstance(service, CRUDService):
+            rows = await service.update_where(*where, service.update_schema(**data))
+            if rows is not None:
+                logger.info("Effect: updated %d %s record(s)", len(rows), effect.entity_name)
+                return EffectResult(
+                    action="update",
+                    entity_name=effect.entity_name,
+                    affected_count=len(rows),
+                )
         target_ids = await self._resolve_where(effect, context, service)
 
         if not target_ids:
@@ -189,18 +206,10 @@ class SideEffectExecutor:
         service: Any,
     ) -> list[str]:
         """Resolve a where clause to a list of entity IDs."""
-        if not effect.where:
-            return []
-
-        # Parse simple "field = value" where clause
-        parts = effect.where.split("=", 1)
-        if len(parts) != 2:
-            logger.warning("Cannot parse where clause: %s", effect.where)
+        where = self._parse_where(effect, context)
+        if where is None:
             return []
-
-        field_name = parts[0].strip()
-        raw_value = parts[1].strip()
-        resolved_value = self._resolve_value(raw_value, context)
+        field_name, resolved_value = where
 
         # Use service.list with filter to find matching records
         result = await service.list(
@@ -221,6 +230,16 @@ class SideEffectExecutor:
 
         return ids
 
+    def _parse_where(self, effect: StepEffect, context: EffectContext) -> tuple[str, Any] | None:
+        """Parse a simple ``field = value`` where clause to ``(field, resolved value)``."""
+        if not effect.where:
+            return None
+        parts = effect.where.split("=", 1)
+        if len(parts) != 2:
+            logger.warning("Cannot parse where clause: %s", effect.where)
+            return None
+        return parts[0].strip(), self._resolve_value(parts[1].strip(), context)
+
     def _resolve_assignments(
         self,
         assignments: list[FieldAssignment],
@@ -15,6 +15,10 @@ from dazzle.core.ir.integrations import MappingTriggerType
 from dazzle.core.ir.process import StepEffect
 from dazzle.core.manifest import load_manifest
 from dazzle.core.strings import to_api_plural
+from dazzle.http.runtime.integration_client import app_client_pool
+from dazzle.http.runtime.lifespan_hooks import register_lifespan_hook
+from dazzle.http.runtime.mapping_redelivery import RedeliveryRepository
+from dazzle.http.runtime.retry_accumulator import app_retry_accumulator
 from dazzle.http.runtime.subsystems import SubsystemContext
 
 if TYPE_CHECKING:
@@ -327,7 +331,6 @@ class SystemRoutesSubsystem:
                     await repo.update(UUID(entity_id), fields)
 
             cache = ApiResponseCache()  # auto-detects REDIS_URL
-            from dazzle.http.runtime.retry_accumulator import app_retry_accumulator
 
             executor = MappingExecutor(
                 ctx.appspec,
@@ -336,8 +339,14 @@ class SystemRoutesSubsystem:
                 cache=cache,
                 # #1445: share the per-app accumulator with the retries route reader.
                 retry_accumulator=app_retry_accumulator(ctx.app),
+                client_pool=app_client_pool(ctx.app),
+                # Parked retries survive restarts when there is a database.
+                redelivery=(
+                    RedeliveryRepository(ctx.db_manager) if ctx.db_manager is not None else None
+                ),
             )
             executor.register_all()
+            register_lifespan_hook(ctx.app, startup=executor.start, shutdown=executor.shutdown)
 
             # Wire entity lifecycle events to the event bus
             self._wire_entity_events_to_bus(ctx, event_bus)
@@ -11,9 +11,11 @@ loops, which meant:
 
 This module builds the minimal set the loops actually use:
 
-- `JobRun` service — for the worker loop's status-write path and
-  retention's row-count sweep
-- `AuditEntry` service — for retention's per-entity-type sweep
+- `JobRun` service — for the worker loop's status-write path
+- `AuditEntry` service — present iff audits are declared
+
+Retention purges through the returned ``db_manager`` directly; the
+service keys only tell it which platform tables exist.
 
 The factory mirrors the relevant subset of `server.py`'s
 `_setup_models`, `_setup_database`, `_setup_services`, but stays
@@ -112,6 +112,8 @@ class FieldType(BaseModel):
         - ref: FieldType(kind="ref", ref_entity="Client")
         - file: FieldType(kind="scalar", scalar_type=ScalarType.FILE, file_config=FileFieldConfig())
         - richtext: FieldType(kind="scalar", scalar_type=ScalarType.RICHTEXT, richtext_config=RichTextConfig())
+        - descendants_of self via parent: FieldType(kind="scalar", scalar_type=ScalarType.STR,
+          traversal="descendants_of", via_field="parent")
     """
 
     kind: Literal["scalar", "enum", "ref"] = Field(
@@ -133,6 +135,15 @@ class FieldType(BaseModel):
     richtext_config: RichTextConfig | None = Field(
         default=None, description="Rich text configuration"
     )
+    # Recursive traversal (descendants_of / ancestors_of, #1227): resolved by
+    # the repository at read time, so the column type stays a plain scalar.
+    traversal: Literal["descendants_of", "ancestors_of"] | None = Field(
+        default=None, description="Traversal direction for descendants_of / ancestors_of"
+    )
+    via_field: str | None = Field(default=None, description="FK the traversal walks")
+    via_entity: str | None = Field(
+        default=None, description="Junction entity for junction-mediated traversals"
+    )
 
     model_config = ConfigDict(frozen=True)
 
@@ -0,0 +1,228 @@
+"""
+Incremental project analysis for the DAZZLE language server.
+
+Reloading a project means discovering, parsing and linking every DSL file,
+which takes long enough on large projects that diagnostics, hover and
+completion stall after every edit. ``ProjectAnalysis`` keeps each file's
+parsed ``ModuleIR`` between edits, so an edit re-parses only the edited
+file and re-links only when that file's IR actually changed — comment and
+blank-line edits that leave the IR identical skip linking entirely.
+
+Linking itself stays whole-program: archetype expansion, synthesised
+platform entities and the FK graph all read across modules, so the
+smallest sound re-link unit is "the project, from cached modules".
+
+``EditDebouncer`` coalesces a burst of ``didChange`` notifications into one
+analysis run and lets a run that has been overtaken by newer edits bail out
+before linking or publishing stale results. The run is scheduled on the
+server's event loop, so it never races the request handlers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from dazzle.core import ir
+from dazzle.core.errors import ParseError
+from dazzle.core.fileset import discover_dsl_files
+from dazzle.core.linker import build_appspec
+from dazzle.core.manifest import ProjectManifest, load_manifest
+from dazzle.core.parser import (
+    expand_vocabulary,
+    load_vocabulary_expander,
+    parse_module_file,
+    parse_modules,
+)
+from dazzle.core.renderer_registry import known_renderer_names
+
+logger = logging.getLogger(__name__)
+
+# Quiet period after the last keystroke before the project is re-analysed.
+EDIT_DEBOUNCE_SECONDS = 0.3
+
+Symbol = tuple[str, str]  # (fragment field, construct name), e.g. ("entities", "Task")
+
+
+@dataclass(frozen=True)
+class ModuleDelta:
+    """What an edit changed in one module."""
+
+    path: Path
+    added: frozenset[Symbol]
+    removed: frozenset[Symbol]
+    ir_changed: bool
+
+
+def declared_symbols(module: ir.ModuleIR) -> frozenset[Symbol]:
+    """Named constructs a module declares, keyed by fragment field."""
+    fragment = module.fragment
+    symbols: set[Symbol] = set()
+    for field_name in type(fragment).model_fields:
+        value = getattr(fragment, field_name)
+        if not isinstance(value, list):
+            continue
+        for spec in value:
+            name = getattr(spec, "name", None)
+            if isinstance(name, str):
+                symbols.add((field_name, name))
+    return frozenset(symbols)
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ProjectAnalysis:
+    """
+    Parsed state of one project, updated file-by-file as documents change.
+
+    Modules are kept in discovery order so re-links see the same module
+    order as a full load.
+    """
+
+    def __init__(self, project_root: Path, manifest: ProjectManifest, dsl_files: list[Path]):
+        self.project_root = project_root
+        self.manifest = manifest
+        self.dsl_files = dsl_files
+        self._expander = load_vocabulary_expander(dsl_files)
+        self._modules: dict[Path, ir.ModuleIR] = {}
+        self._digests: dict[Path, str] = {}
+        self._needs_link = True
+        # Files whose current editor text does not parse, with the error.
+        self.parse_errors: dict[Path, ParseError] = {}
+
+    @classmethod
+    def load(cls, project_root: Path) -> ProjectAnalysis:
+        """
+        Discover and parse every DSL file of the project.
+
+        Raises:
+            ParseError: If any file fails to parse
+        """
+        manifest = load_manifest(project_root / "dazzle.toml")
+        analysis = cls(project_root, manifest, discover_dsl_files(project_root, manifest))
+        modules = parse_modules(analysis.dsl_files)
+        for f, module in zip(analysis.dsl_files, modules, strict=True):
+            analysis._modules[f] = module
+            analysis._digests[f] = _digest(f.read_text(encoding="utf-8"))
+        return analysis
+
+    @property
+    def needs_link(self) -> bool:
+        """True when the cached modules have changed since the last link."""
+        return self._needs_link
+
+    def owns(self, path: Path) -> bool:
+        """Whether ``path`` is one of the project's DSL files."""
+        return path.resolve() in self._modules
+
+    def apply_edit(self, path: Path, text: str) -> ModuleDelta:
+        """
+        Re-parse one file from its (possibly unsaved) editor text.
+
+        Args:
+            path: A file for which ``owns`` is true
+            text: Current document contents
+
+        Returns:
+            The symbols the edit added and removed, and whether the IR changed
+
+        Raises:
+            ParseError: If the new text does not parse; the last good module
+                is kept, the error stays in ``parse_errors`` until the file
+                parses again, and the next edit of this file is always
+                re-parsed
+        """
+        path = path.resolve()
+        digest = _digest(text)
+        old = self._modules[path]
+        if self._digests.get(path) == digest:
+            return ModuleDelta(path, frozenset(), frozenset(), ir_changed=False)
+
+        try:
+            module = parse_module_file(path, expand_vocabulary(self._expander, path, text))
+        except Exception as exc:
+            # The published diagnostics now show this error, so the next
+            # good parse must re-link (and re-publish) even if its IR
+            # matches the last good module.
+            self._digests.pop(path, None)
+            self._needs_link = True
+            if isinstance(exc, ParseError):
+                self.parse_errors[path] = exc
+            raise
+
+        self.parse_errors.pop(path, None)
+        self._modules[path] = module
+        self._digests[path] = digest
+        ir_changed = module != old
+        if ir_changed:
+            self._needs_link = True
+
+        old_symbols = declared_symbols(old)
+        new_symbols = declared_symbols(module)
+        return ModuleDelta(
+            path,
+            added=new_symbols - old_symbols,
+            removed=old_symbols - new_symbols,
+            ir_changed=ir_changed,
+        )
+
+    def link(self) -> ir.AppSpec:
+        """
+        Link the cached modules into an AppSpec.
+
+        Raises:
+            LinkError: On unresolved references, cycles or duplicates
+            ValidationError: On invalid constructs
+        """
+        self._needs_link = False
+        return build_appspec(
+            [self._modules[f] for f in self.dsl_files],
+            self.manifest.project_root,
+            known_renderers=known_renderer_names(self.manifest),
+        )
+
+
+class EditDebouncer:
+    """
+    Run ``callback(generation)`` once edits have been quiet for ``delay`` seconds.
+
+    Every ``schedule()`` starts a new generation and restarts the timer. A
+    run in progress can call ``is_current(generation)`` at checkpoints and
+    abandon its work once a newer edit has arrived.
+
+    ``schedule()`` must be called from the event loop (the LSP handlers run
+    there); the callback then runs on that same loop, never on a thread.
+    """
+
+    def __init__(self, delay: float, callback: Callable[[int], None]):
+        self.delay = delay
+        self._callback = callback
+        self._timer: asyncio.TimerHandle | None = None
+        self._generation = 0
+
+    def schedule(self) -> int:
+        """Record an edit and (re)start the quiet-period timer."""
+        self._generation += 1
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = asyncio.get_running_loop().call_later(
+            self.delay, self._callback, self._generation
+        )
+        return self._generation
+
+    def is_current(self, generation: int) -> bool:
+        """False once an edit newer than ``generation`` has been scheduled."""
+        return generation == self._generation
+
+    def flush(self) -> int:
+        """Drop the pending timer and return the generation to run now."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return self._generation
@@ -49,10 +49,8 @@ from dazzle.core import ir
 from dazzle.core.errors import DazzleError, LinkError, ParseError, ValidationError
 from dazzle.core.fileset import discover_dsl_files
 from dazzle.core.ir.identity import spec_display_id
-from dazzle.core.linker import build_appspec
 from dazzle.core.manifest import load_manifest
-from dazzle.core.parser import parse_modules
-from dazzle.core.renderer_registry import known_renderer_names
+from dazzle.lsp.analysis import EDIT_DEBOUNCE_SECONDS, EditDebouncer, ProjectAnalysis
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -67,6 +65,15 @@ class DazzleLanguageServer(LanguageServer):
         super().__init__(name, version)
         self.workspace_root: Path | None = None
         self.appspec: ir.AppSpec | None = None
+        # Kept across edits so only the edited file is re-parsed.
+        self.analysis: ProjectAnalysis | None = None
+        # Refreshed in place after each link; hover/completion read it directly.
+        self.name_index: dict[str, tuple[str, Any]] = {}
+        # Unsaved document text awaiting the debounced analysis run.
+        self.pending_edits: dict[Path, str] = {}
+        self.debouncer = EditDebouncer(
+            EDIT_DEBOUNCE_SECONDS, lambda generation: _run_pending_analysis(self, generation)
+        )
 
 
 # Create server instance
@@ -187,59 +194,139 @@ def _load_project(ls: DazzleLanguageServer, file_path: Path | None = None) -> No
             logger.warning("No dazzle.toml found in %s or parent directories", ls.workspace_root)
         return
 
-    manifest_path = project_root / "dazzle.toml"
-
     try:
-        mf = load_manifest(manifest_path)
-        dsl_files = discover_dsl_files(project_root, mf)
+        ls.analysis = None
+        ls.analysis = ProjectAnalysis.load(project_root)
+        _link_project(ls, ls.analysis, file_path)
 
-        # Track all DSL file URIs so we can clear diagnostics on success
-        all_uris = {f.resolve().as_uri() for f in dsl_files}
+    except (ParseError, LinkError, ValidationError) as e:
+        ls.appspec = None
+        _publish_project_error(ls, e, file_path)
 
-        modules = parse_modules(dsl_files)
-        ls.appspec = build_appspec(
-            modules, mf.project_root, known_renderers=known_renderer_names(mf)
-        )
-        logger.info(
-            "Loaded project from %s with %s entities",
-            project_root,
-            len(ls.appspec.domain.entities),
-        )
+    except Exception as e:
+        logger.error("Error loading project: %s", e)
+        ls.appspec = None
 
-        # Publish link warnings if any
-        warnings = ls.appspec.metadata.get("link_warnings", [])
-        file_diagnostics: dict[str, list[Diagnostic]] = {}
-        if warnings and file_path:
-            uri = file_path.resolve().as_uri()
-            for msg in warnings:
-                diag = _make_diagnostic(
-                    message=msg,
-                    severity=DiagnosticSeverity.Information,
-                )
-                file_diagnostics.setdefault(uri, []).append(diag)
 
-        # Clear diagnostics on all DSL files (project is valid)
-        _publish_file_diagnostics(ls, file_diagnostics, all_uris)
+def _link_project(
+    ls: DazzleLanguageServer, analysis: ProjectAnalysis, file_path: Path | None
+) -> None:
+    """Link the analysed modules, refresh the name index and publish diagnostics."""
+    ls.appspec = analysis.link()
+    _update_name_index(ls.name_index, ls.appspec)
+    logger.info(
+        "Loaded project from %s with %s entities",
+        analysis.project_root,
+        len(ls.appspec.domain.entities),
+    )
+
+    # Track all DSL file URIs so we can clear diagnostics on success
+    all_uris = {f.resolve().as_uri() for f in analysis.dsl_files}
+
+    # Publish link warnings if any
+    warnings = ls.appspec.metadata.get("link_warnings", [])
+    file_diagnostics: dict[str, list[Diagnostic]] = {}
+    if warnings and file_path:
+        uri = file_path.resolve().as_uri()
+        for msg in warnings:
+            diag = _make_diagnostic(
+                message=msg,
+                severity=DiagnosticSeverity.Information,
+            )
+            file_diagnostics.setdefault(uri, []).append(diag)
+
+    # Clear diagnostics on all DSL files (project is valid)
+    _publish_file_diagnostics(ls, file_diagnostics, all_uris)
 
-    except (ParseError, LinkError, ValidationError) as e:
-        logger.error("Project error: %s", e)
-        ls.appspec = None
 
-        # Publish diagnostics for the error
-        file_diagnostics = _diagnostics_from_error(e)
+def _publish_project_error(
+    ls: DazzleLanguageServer, error: DazzleError, file_path: Path | None
+) -> None:
+    """Publish diagnostics for a parse/link/validation error."""
+    logger.error("Project error: %s", error)
+    file_diagnostics = _diagnostics_from_error(error)
 
-        # If the error has no file context, attach to the triggering file
-        fallback_diags = file_diagnostics.pop("__fallback__", [])
-        if fallback_diags and file_path:
-            uri = file_path.resolve().as_uri()
-            file_diagnostics.setdefault(uri, []).extend(fallback_diags)
+    # If the error has no file context, attach to the triggering file
+    fallback_diags = file_diagnostics.pop("__fallback__", [])
+    if fallback_diags and file_path:
+        uri = file_path.resolve().as_uri()
+        file_diagnostics.setdefault(uri, []).extend(fallback_diags)
 
-        for uri, diags in file_diagnostics.items():
-            _publish_diagnostics(ls, uri, diags)
+    for uri, diags in file_diagnostics.items():
+        _publish_diagnostics(ls, uri, diags)
+
+
+def _run_pending_analysis(ls: DazzleLanguageServer, generation: int) -> None:
+    """Debounced handler: apply the buffered edits unless newer ones arrived.
 
+    Runs on the server's event loop (see ``EditDebouncer``), like the
+    handlers that read and write the same state.
+    """
+    if not ls.debouncer.is_current(generation):
+        return
+    edits, ls.pending_edits = ls.pending_edits, {}
+    if edits:
+        _reanalyze(ls, edits, generation)
+
+
+def _reanalyze(ls: DazzleLanguageServer, edits: dict[Path, str], generation: int) -> None:
+    """Re-parse only the edited files, then re-link if their IR changed.
+
+    Unlike a full reload, a parse or link error keeps the last good AppSpec
+    so hover and completion keep working while the user is mid-edit.
+    """
+    analysis = ls.analysis
+    trigger = next(iter(edits))
+    if analysis is None or not all(analysis.owns(path) for path in edits):
+        # First load, a new file, or a file outside the loaded project.
+        _load_project(ls, trigger)
+        return
+
+    try:
+        _apply_edits(analysis, edits)
+        parse_errors = _parse_diagnostics(analysis)
+        if parse_errors:
+            # Linking would silently use the last good module of each
+            # broken file, and would clear the errors of files not in this
+            # edit; report every outstanding parse error instead.
+            edited = {path.resolve().as_uri() for path in edits}
+            _publish_file_diagnostics(ls, parse_errors, edited)
+            return
+        # Linking is the expensive step — skip it if more edits are queued.
+        if ls.debouncer.is_current(generation) and analysis.needs_link:
+            _link_project(ls, analysis, trigger)
+    except (LinkError, ValidationError) as e:
+        _publish_project_error(ls, e, trigger)
     except Exception as e:
-        logger.error("Error loading project: %s", e)
-        ls.appspec = None
+        logger.error("Error re-analysing project: %s", e)
+
+
+def _apply_edits(analysis: ProjectAnalysis, edits: dict[Path, str]) -> None:
+    """Re-parse every edited file; failures are kept in ``analysis.parse_errors``."""
+    for path, text in edits.items():
+        try:
+            delta = analysis.apply_edit(path, text)
+        except ParseError:
+            continue
+        if delta.added or delta.removed:
+            logger.info("%s: +%d/-%d symbols", path.name, len(delta.added), len(delta.removed))
+
+
+def _parse_diagnostics(analysis: ProjectAnalysis) -> dict[str, list[Diagnostic]]:
+    """Diagnostics for every file that currently fails to parse, keyed by URI."""
+    diagnostics: dict[str, list[Diagnostic]] = {}
+    for path, error in analysis.parse_errors.items():
+        file_diagnostics = _diagnostics_from_error(error)
+        fallback = file_diagnostics.pop("__fallback__", [])
+        if fallback:
+            file_diagnostics.setdefault(path.as_uri(), []).extend(fallback)
+        for uri, diags in file_diagnostics.items():
+            diagnostics.setdefault(uri, []).extend(diags)
+    return diagnostics
+
+
+def _document_path(uri: str) -> Path:
+    return Path(uri.replace("file://", ""))
 
 
 @server.feature(TEXT_DOCUMENT_DID_OPEN)
@@ -249,17 +336,20 @@ def did_open(ls: DazzleLanguageServer, params: DidOpenTextDocumentParams) -> Non
 
     # If we don't have an appspec yet, try to load from this file's location
     if not ls.appspec:
-        file_path = Path(params.text_document.uri.replace("file://", ""))
-        _load_project(ls, file_path)
+        _load_project(ls, _document_path(params.text_document.uri))
 
 
 @server.feature(TEXT_DOCUMENT_DID_CHANGE)
 def did_change(ls: DazzleLanguageServer, params: DidChangeTextDocumentParams) -> None:
-    """Handle document change."""
-    # Reload project on change
+    """Handle document change.
+
+    Edits are buffered and analysed once typing pauses for
+    ``EDIT_DEBOUNCE_SECONDS``; an analysis overtaken by a newer edit is dropped.
+    """
     try:
-        file_path = Path(params.text_document.uri.replace("file://", ""))
-        _load_project(ls, file_path)
+        document = ls.workspace.get_text_document(params.text_document.uri)
+        ls.pending_edits[_document_path(params.text_document.uri)] = document.source
+        ls.debouncer.schedule()
     except Exception as e:
         logger.error("Error reloading project: %s", e)
 
@@ -268,10 +358,13 @@ def did_change(ls: DazzleLanguageServer, params: DidChangeTextDocumentParams) ->
 def did_save(ls: DazzleLanguageServer, params: DidSaveTextDocumentParams) -> None:
     """Handle document save."""
     logger.info("Saved: %s", params.text_document.uri)
-    # Reload project on save
+    # Analyse immediately: a save ends the burst of edits.
     try:
-        file_path = Path(params.text_document.uri.replace("file://", ""))
-        _load_project(ls, file_path)
+        file_path = _document_path(params.text_document.uri)
+        generation = ls.debouncer.flush()
+        edits, ls.pending_edits = ls.pending_edits, {}
+        edits[file_path] = file_path.read_text(encoding="utf-8")
+        _reanalyze(ls, edits, generation)
     except Exception as e:
         logger.error("Error reloading project: %s", e)
 
@@ -350,6 +443,18 @@ def _build_name_index(appspec: ir.AppSpec) -> dict[str, tuple[str, Any]]:
     return index
 
 
+def _update_name_index(index: dict[str, tuple[str, Any]], appspec: ir.AppSpec) -> None:
+    """Bring an existing name index in line with a freshly linked AppSpec.
+
+    Only names that disappeared are deleted; every other entry is rebound to
+    the new spec, so readers holding the dict never see it empty.
+    """
+    fresh = _build_name_index(appspec)
+    for name in index.keys() - fresh.keys():
+        del index[name]
+    index.update(fresh)
+
+
 def _format_view_hover_section(spec: ir.ViewSpec, lines: list[str]) -> None:
     source = getattr(spec, "source_entity", None)
     if source:
@@ -517,9 +622,7 @@ def hover(ls: DazzleLanguageServer, params: HoverParams) -> Hover | None:
     if not word:
         return None
 
-    # Build name index for O(1) lookup
-    index = _build_name_index(ls.appspec)
-    match = index.get(word)
+    match = ls.name_index.get(word)
     if not match:
         return None
 
@@ -880,7 +983,7 @@ def completion(ls: DazzleLanguageServer, params: CompletionParams) -> Completion
         document.source, params.position.line, params.position.character
     )
 
-    index = _build_name_index(ls.appspec)
+    index = ls.name_index
     dispatcher = _COMPLETION_DISPATCHERS.get(ctx)
     items = dispatcher(index) if dispatcher else _complete_global(index)
 
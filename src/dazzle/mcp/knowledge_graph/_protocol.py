@@ -9,6 +9,7 @@ captures that contract so mypy can verify it without ``# type: ignore``.
 import sqlite3
 from typing import Any, Protocol
 
+from .adjacency import Adjacency
 from .models import Entity, PathResult, Relation
 
 
@@ -19,6 +20,12 @@ class KGStoreProtocol(Protocol):
 
     def _close_connection(self, conn: sqlite3.Connection) -> None: ...
 
+    _fts_enabled: bool
+
+    def _adjacency(self) -> Adjacency: ...
+
+    def _get_entities(self, entity_ids: set[str]) -> list[Entity]: ...
+
     def get_entity(self, entity_id: str) -> Entity | None: ...
 
     def get_relations(
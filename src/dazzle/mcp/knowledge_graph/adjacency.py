@@ -0,0 +1,157 @@
+"""
+In-memory adjacency for knowledge graph traversal.
+
+Path finding and neighbourhood queries used to go to SQLite hop by hop —
+``find_paths`` through a recursive CTE that grew comma-joined path
+strings with ``NOT LIKE`` cycle checks, neighbourhoods through one
+``get_relations`` query per visited node. Both now walk an
+:class:`Adjacency` snapshot of the ``relations`` table.
+
+The snapshot is tagged with the ``relations_version`` counter, which
+triggers on ``relations`` bump on every insert, update and delete —
+including cascaded deletes and writes made by other connections or
+processes on the same database file. A store rebuilds its snapshot the
+first time it sees the counter move.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+
+from .models import Relation
+
+RELATIONS_VERSION_DDL = """
+    CREATE TABLE IF NOT EXISTS relations_version (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        version INTEGER NOT NULL
+    );
+    INSERT OR IGNORE INTO relations_version (id, version) VALUES (1, 0);
+
+    CREATE TRIGGER IF NOT EXISTS relations_version_ai AFTER INSERT ON relations BEGIN
+        UPDATE relations_version SET version = version + 1 WHERE id = 1;
+    END;
+    CREATE TRIGGER IF NOT EXISTS relations_version_ad AFTER DELETE ON relations BEGIN
+        UPDATE relations_version SET version = version + 1 WHERE id = 1;
+    END;
+    CREATE TRIGGER IF NOT EXISTS relations_version_au AFTER UPDATE ON relations BEGIN
+        UPDATE relations_version SET version = version + 1 WHERE id = 1;
+    END;
+"""
+
+
+def relations_version(conn: sqlite3.Connection) -> int:
+    """Current value of the ``relations`` write counter."""
+    row = conn.execute("SELECT version FROM relations_version WHERE id = 1").fetchone()
+    return int(row[0]) if row else 0
+
+
+@dataclass
+class Adjacency:
+    """Every relation, indexed by the entities at either end.
+
+    Each list keeps ``get_relations`` order (newest first). A self-loop
+    appears once in ``both``.
+    """
+
+    version: int
+    outgoing: dict[str, list[Relation]] = field(default_factory=dict)
+    incoming: dict[str, list[Relation]] = field(default_factory=dict)
+    both: dict[str, list[Relation]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, conn: sqlite3.Connection, version: int) -> Adjacency:
+        """Snapshot the ``relations`` table."""
+        adjacency = cls(version=version)
+        rows = conn.execute(
+            "SELECT * FROM relations ORDER BY created_at DESC, source_id, target_id, relation_type"
+        ).fetchall()
+        for row in rows:
+            rel = Relation.from_row(row)
+            adjacency.outgoing.setdefault(rel.source_id, []).append(rel)
+            adjacency.incoming.setdefault(rel.target_id, []).append(rel)
+            adjacency.both.setdefault(rel.source_id, []).append(rel)
+            if rel.target_id != rel.source_id:
+                adjacency.both.setdefault(rel.target_id, []).append(rel)
+        return adjacency
+
+    def relations(self, entity_id: str, direction: str = "both") -> list[Relation]:
+        """Relations touching ``entity_id`` — ``"outgoing"``, ``"incoming"`` or ``"both"``."""
+        if direction == "outgoing":
+            return self.outgoing.get(entity_id, [])
+        if direction == "incoming":
+            return self.incoming.get(entity_id, [])
+        return self.both.get(entity_id, [])
+
+    def simple_paths(
+        self,
+        source_id: str,
+        target_id: str,
+        max_depth: int,
+        relation_types: list[str] | None = None,
+        limit: int = 10,
+    ) -> list[list[Relation]]:
+        """Up to ``limit`` directed paths from source to target, shortest first.
+
+        A path never visits an entity twice. Entities that cannot reach
+        the target in the hops left are never expanded, so the search
+        only explores the part of the graph that can contribute a path.
+        """
+        allowed = set(relation_types) if relation_types else None
+        distance = self._distances_to(target_id, max_depth, allowed)
+        if source_id == target_id or source_id not in distance:
+            return []
+        paths: list[list[Relation]] = []
+        for length in range(distance[source_id], max_depth + 1):
+            for path in self._walk(source_id, target_id, length, allowed, distance, [source_id]):
+                paths.append(path)
+                if len(paths) >= limit:
+                    return paths
+        return paths
+
+    def _edges(self, entity_id: str, allowed: set[str] | None) -> Iterator[Relation]:
+        for rel in self.outgoing.get(entity_id, ()):
+            if allowed is None or rel.relation_type in allowed:
+                yield rel
+
+    def _distances_to(
+        self, target_id: str, max_depth: int, allowed: set[str] | None
+    ) -> dict[str, int]:
+        """Fewest hops from each entity to ``target_id``, up to ``max_depth``."""
+        distance = {target_id: 0}
+        frontier = [target_id]
+        for hops in range(1, max_depth + 1):
+            next_frontier: list[str] = []
+            for entity_id in frontier:
+                for rel in self.incoming.get(entity_id, ()):
+                    if allowed is not None and rel.relation_type not in allowed:
+                        continue
+                    if rel.source_id not in distance:
+                        distance[rel.source_id] = hops
+                        next_frontier.append(rel.source_id)
+            frontier = next_frontier
+        return distance
+
+    def _walk(
+        self,
+        node: str,
+        target_id: str,
+        remaining: int,
+        allowed: set[str] | None,
+        distance: dict[str, int],
+        on_path: list[str],
+    ) -> Iterator[list[Relation]]:
+        """Paths of exactly ``remaining`` more hops from ``node`` to the target."""
+        for rel in self._edges(node, allowed):
+            nxt = rel.target_id
+            if nxt in on_path or distance.get(nxt, remaining) > remaining - 1:
+                continue
+            if nxt == target_id:
+                if remaining == 1:
+                    yield [rel]
+                continue
+            on_path.append(nxt)
+            for rest in self._walk(nxt, target_id, remaining - 1, allowed, distance, on_path):
+                yield [rel, *rest]
+            on_path.pop()
@@ -1,8 +1,9 @@
 """
 Knowledge Graph query mixin — path finding, neighbourhood traversal, search.
 
-Provides graph traversal capabilities via recursive CTEs and
-iterative BFS, plus text search and raw SQL query support.
+Traversals walk the store's in-memory adjacency snapshot (see
+``adjacency``); text search uses the ``entities_fts`` full-text index.
+Also provides raw SQL query support.
 """
 
 from __future__ import annotations
@@ -14,6 +15,12 @@ from .models import Entity, PathResult, Relation
 if TYPE_CHECKING:
     from ._protocol import KGStoreProtocol
 
+# Entities fetched per ``IN (...)`` query — well under SQLite's bound-variable limit.
+_ENTITY_BATCH = 500
+
+# The trigram index cannot answer a MATCH shorter than one trigram.
+_MIN_FTS_QUERY = 3
+
 
 class KnowledgeGraphQuery:
     """Mixin providing path-finding, neighbour queries, and search."""
@@ -30,7 +37,9 @@ class KnowledgeGraphQuery:
         relation_types: list[str] | None = None,
     ) -> list[PathResult]:
         """
-        Find all paths between two entities using recursive CTE.
+        Find up to 10 paths between two entities, shortest first.
+
+        Paths follow relations source → target and never revisit an entity.
 
         Args:
             source_id: Starting entity
@@ -38,74 +47,17 @@ class KnowledgeGraphQuery:
             max_depth: Maximum path length
             relation_types: Filter by relation types (None = all)
         """
-        type_filter = ""
-        params: list[Any] = [source_id, target_id, max_depth]
-
-        if relation_types:
-            placeholders = ",".join("?" * len(relation_types))
-            type_filter = f"AND r.relation_type IN ({placeholders})"
-            params = [source_id] + relation_types + [target_id, max_depth]
-
-        # Recursive CTE for path finding
-        query = f"""
-            WITH RECURSIVE paths(current, target, path, relations, depth) AS (
-                -- Base case: start from source
-                SELECT
-                    r.target_id,
-                    ?,
-                    r.source_id || ',' || r.target_id,
-                    r.relation_type,
-                    1
-                FROM relations r
-                WHERE r.source_id = ? {type_filter}
-
-                UNION ALL
-
-                -- Recursive case: extend path
-                SELECT
-                    r.target_id,
-                    p.target,
-                    p.path || ',' || r.target_id,
-                    p.relations || ',' || r.relation_type,
-                    p.depth + 1
-                FROM paths p
-                JOIN relations r ON r.source_id = p.current
-                WHERE p.depth < ?
-                  AND p.path NOT LIKE '%' || r.target_id || '%'
-                  {type_filter}
+        paths = self._adjacency().simple_paths(source_id, target_id, max_depth, relation_types)
+        return [
+            PathResult(
+                source=source_id,
+                target=target_id,
+                path=[source_id, *(rel.target_id for rel in path)],
+                relations=[rel.relation_type for rel in path],
+                length=len(path),
             )
-            SELECT path, relations, depth
-            FROM paths
-            WHERE current = target
-            ORDER BY depth
-            LIMIT 10
-        """
-
-        # Adjust params for the query structure
-        if relation_types:
-            params = [target_id, source_id] + relation_types + [max_depth] + relation_types
-        else:
-            params = [target_id, source_id, max_depth]
-
-        conn = self._get_connection()
-        try:
-            rows = conn.execute(query, params).fetchall()
-            results = []
-            for row in rows:
-                path_ids = row["path"].split(",")
-                rel_types = row["relations"].split(",")
-                results.append(
-                    PathResult(
-                        source=source_id,
-                        target=target_id,
-                        path=path_ids,
-                        relations=rel_types,
-                        length=row["depth"],
-                    )
-                )
-            return results
-        finally:
-            self._close_connection(conn)
+            for path in paths
+        ]
 
     def get_neighbourhood(
         self: KGStoreProtocol,
@@ -126,6 +78,7 @@ class KnowledgeGraphQuery:
         Returns:
             Dict with 'center', 'entities', 'relations' keys
         """
+        adjacency = self._adjacency()
         visited_ids: set[str] = {entity_id}
         all_relations: list[Relation] = []
         frontier = {entity_id}
@@ -133,14 +86,7 @@ class KnowledgeGraphQuery:
         for _ in range(depth):
             next_frontier: set[str] = set()
             for eid in frontier:
-                relations = self.get_relations(
-                    entity_id=eid,
-                    relation_type=relation_types[0]
-                    if relation_types and len(relation_types) == 1
-                    else None,
-                    direction=direction,
-                )
-                for rel in relations:
+                for rel in adjacency.relations(eid, direction):
                     # Filter by relation types if multiple specified
                     if relation_types and rel.relation_type not in relation_types:
                         continue
@@ -152,16 +98,9 @@ class KnowledgeGraphQuery:
                         visited_ids.add(neighbor)
             frontier = next_frontier
 
-        # Fetch entity details
-        entities = []
-        for eid in visited_ids:
-            entity = self.get_entity(eid)
-            if entity:
-                entities.append(entity)
-
         return {
             "center": entity_id,
-            "entities": entities,
+            "entities": self._get_entities(visited_ids),
             "relations": all_relations,
         }
 
@@ -181,16 +120,13 @@ class KnowledgeGraphQuery:
             transitive: Include transitive dependents
             max_depth: Max depth for transitive search
         """
+        adjacency = self._adjacency()
         if not transitive:
-            relations = self.get_relations(
-                entity_id=entity_id,
-                direction="incoming",
-            )
+            relations = adjacency.relations(entity_id, "incoming")
             if relation_types:
                 relations = [r for r in relations if r.relation_type in relation_types]
 
-            entity_ids = {r.source_id for r in relations}
-            return [e for eid in entity_ids if (e := self.get_entity(eid))]
+            return self._get_entities({r.source_id for r in relations})
 
         # Transitive: use recursive traversal
         visited: set[str] = set()
@@ -199,7 +135,7 @@ class KnowledgeGraphQuery:
         for _ in range(max_depth):
             next_frontier: set[str] = set()
             for eid in frontier:
-                relations = self.get_relations(entity_id=eid, direction="incoming")
+                relations = adjacency.relations(eid, "incoming")
                 if relation_types:
                     relations = [r for r in relations if r.relation_type in relation_types]
                 for rel in relations:
@@ -208,7 +144,7 @@ class KnowledgeGraphQuery:
                         next_frontier.add(rel.source_id)
             frontier = next_frontier
 
-        return [e for eid in visited if (e := self.get_entity(eid))]
+        return self._get_entities(visited)
 
     def get_dependencies(
         self: KGStoreProtocol,
@@ -226,16 +162,13 @@ class KnowledgeGraphQuery:
             transitive: Include transitive dependencies
             max_depth: Max depth for transitive search
         """
+        adjacency = self._adjacency()
         if not transitive:
-            relations = self.get_relations(
-                entity_id=entity_id,
-                direction="outgoing",
-            )
+            relations = adjacency.relations(entity_id, "outgoing")
             if relation_types:
                 relations = [r for r in relations if r.relation_type in relation_types]
 
-            entity_ids = {r.target_id for r in relations}
-            return [e for eid in entity_ids if (e := self.get_entity(eid))]
+            return self._get_entities({r.target_id for r in relations})
 
         # Transitive: use recursive traversal
         visited: set[str] = set()
@@ -244,7 +177,7 @@ class KnowledgeGraphQuery:
         for _ in range(max_depth):
             next_frontier: set[str] = set()
             for eid in frontier:
-                relations = self.get_relations(entity_id=eid, direction="outgoing")
+                relations = adjacency.relations(eid, "outgoing")
                 if relation_types:
                     relations = [r for r in relations if r.relation_type in relation_types]
                 for rel in relations:
@@ -253,7 +186,24 @@ class KnowledgeGraphQuery:
                         next_frontier.add(rel.target_id)
             frontier = next_frontier
 
-        return [e for eid in visited if (e := self.get_entity(eid))]
+        return self._get_entities(visited)
+
+    def _get_entities(self: KGStoreProtocol, entity_ids: set[str]) -> list[Entity]:
+        """Fetch entities by ID in batched ``IN`` queries; missing IDs are skipped."""
+        ids = sorted(entity_ids)
+        entities: list[Entity] = []
+        conn = self._get_connection()
+        try:
+            for start in range(0, len(ids), _ENTITY_BATCH):
+                batch = ids[start : start + _ENTITY_BATCH]
+                rows = conn.execute(
+                    f"SELECT * FROM entities WHERE id IN ({','.join('?' * len(batch))})",
+                    batch,
+                ).fetchall()
+                entities.extend(Entity.from_row(row) for row in rows)
+            return entities
+        finally:
+            self._close_connection(conn)
 
     # =========================================================================
     # DSL Adjacency
@@ -328,13 +278,24 @@ class KnowledgeGraphQuery:
         """
         Search entities by name/metadata text.
 
+        Matches ``text`` as a case-insensitive substring. Queries of three
+        or more characters are answered from the ``entities_fts`` index;
+        shorter ones (or stores without FTS5) scan with ``LIKE``.
+
         Args:
             text: Search text (matches name or metadata)
             entity_types: Filter by entity types
             limit: Max results
         """
-        conditions = ["(name LIKE ? OR metadata LIKE ?)"]
-        params: list[Any] = [f"%{text}%", f"%{text}%"]
+        conditions: list[str]
+        params: list[Any]
+        if self._fts_enabled and len(text) >= _MIN_FTS_QUERY:
+            phrase = '"' + text.replace('"', '""') + '"'
+            conditions = ["rowid IN (SELECT rowid FROM entities_fts WHERE entities_fts MATCH ?)"]
+            params = [phrase]
+        else:
+            conditions = ["(name LIKE ? OR metadata LIKE ?)"]
+            params = [f"%{text}%", f"%{text}%"]
 
         if entity_types:
             placeholders = ",".join("?" * len(entity_types))
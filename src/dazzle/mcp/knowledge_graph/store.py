@@ -5,7 +5,10 @@ Schema:
 - entities: id (prefixed), type, name, metadata (JSON), timestamps
 - relations: source_id, target_id, relation_type, metadata (JSON), timestamps
 
-Uses recursive CTEs for graph traversal (paths, neighborhoods).
+Text search goes through ``entities_fts``, an FTS5 trigram index over entity
+names and metadata kept in step by triggers. Graph traversal (paths,
+neighbourhoods) walks an in-memory adjacency snapshot that is rebuilt when
+the ``relations`` table changes (see ``adjacency``).
 
 Method groups are split into mixin classes for maintainability:
 - KnowledgeGraphQuery: path finding, neighbourhood traversal, search
@@ -15,12 +18,14 @@ Method groups are split into mixin classes for maintainability:
 
 import json
 import sqlite3
+import threading
 import time
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from .activity import KnowledgeGraphActivity
+from .adjacency import RELATIONS_VERSION_DDL, Adjacency, relations_version
 from .metadata import KnowledgeGraphMetadata
 from .models import Entity, Relation  # Entity/Relation used in this module's body
 from .query import KnowledgeGraphQuery
@@ -30,6 +35,30 @@ from .test_results import KnowledgeGraphTestResults
 # ActivityEvent, PathResult) live in `.models` — import them from there, not via store.
 __all__ = ["KnowledgeGraph"]
 
+# External-content FTS5 index over entities(name, metadata). The trigram
+# tokenizer matches any substring of three or more characters, so MATCH
+# answers what ``LIKE '%text%'`` did without scanning the table.
+_ENTITIES_FTS_DDL = """
+    CREATE VIRTUAL TABLE entities_fts USING fts5(
+        name, metadata, content='entities', content_rowid='rowid', tokenize='trigram'
+    );
+    CREATE TRIGGER IF NOT EXISTS entities_fts_ai AFTER INSERT ON entities BEGIN
+        INSERT INTO entities_fts (rowid, name, metadata)
+        VALUES (new.rowid, new.name, new.metadata);
+    END;
+    CREATE TRIGGER IF NOT EXISTS entities_fts_ad AFTER DELETE ON entities BEGIN
+        INSERT INTO entities_fts (entities_fts, rowid, name, metadata)
+        VALUES ('delete', old.rowid, old.name, old.metadata);
+    END;
+    CREATE TRIGGER IF NOT EXISTS entities_fts_au AFTER UPDATE ON entities BEGIN
+        INSERT INTO entities_fts (entities_fts, rowid, name, metadata)
+        VALUES ('delete', old.rowid, old.name, old.metadata);
+        INSERT INTO entities_fts (rowid, name, metadata)
+        VALUES (new.rowid, new.name, new.metadata);
+    END;
+    INSERT INTO entities_fts (entities_fts) VALUES ('rebuild');
+"""
+
 
 class KnowledgeGraph(
     KnowledgeGraphQuery,
@@ -40,8 +69,9 @@ class KnowledgeGraph(
     """
     SQLite-backed knowledge graph with graph traversal.
 
-    Designed for efficient queries via indexes and recursive CTEs.
-    Thread-safe via connection-per-call pattern.
+    Designed for efficient queries via indexes, a full-text index and an
+    in-memory adjacency snapshot. Thread-safe via one connection per thread
+    (one shared connection for in-memory databases), reused across calls.
 
     Method groups are provided by mixin classes:
     - KnowledgeGraphQuery: path finding, neighbourhood, search, stats
@@ -114,10 +144,20 @@ class KnowledgeGraph(
         """
         self._db_path = str(db_path)
         self._is_memory = self._db_path == ":memory:"
+        # Every connection opened, across threads, so close() reaches them all.
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        # Bumped by close(); a thread's cached connection from an earlier
+        # generation has been closed and is replaced on next use.
+        self._generation = 0
         # For in-memory DBs, keep a persistent connection to avoid losing data
         self._persistent_conn: sqlite3.Connection | None = None
         if self._is_memory:
             self._persistent_conn = self._create_connection()
+        self._local = threading.local()
+        self._fts_enabled = False
+        self._adjacency_cache: Adjacency | None = None
+        self._adjacency_lock = threading.Lock()
         self._init_schema()
 
     def _create_connection(self) -> sqlite3.Connection:
@@ -127,18 +167,39 @@ class KnowledgeGraph(
         conn.execute("PRAGMA foreign_keys = ON")
         if not self._is_memory:
             conn.execute("PRAGMA journal_mode = WAL")
+        with self._connections_lock:
+            self._connections.append(conn)
         return conn
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection."""
+        """Get this thread's database connection, opening it on first use."""
         if self._is_memory and self._persistent_conn:
             return self._persistent_conn
-        return self._create_connection()
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "generation", None) != self._generation:
+            conn = self._create_connection()
+            self._local.conn = conn
+            self._local.generation = self._generation
+        return conn
 
     def _close_connection(self, conn: sqlite3.Connection) -> None:
-        """Close a connection (but not the persistent one for in-memory DBs)."""
-        if not self._is_memory:
+        """Release a connection after a call.
+
+        Connections are kept for reuse; work the call left uncommitted is
+        rolled back, as closing the connection used to do.
+        """
+        if conn.in_transaction:
+            conn.rollback()
+
+    def close(self) -> None:
+        """Close every connection this graph opened, on any thread."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            self._generation += 1
+        for conn in connections:
             conn.close()
+        self._persistent_conn = None
+        self._local.conn = None
 
     def _init_schema(self) -> None:
         """Initialize database schema."""
@@ -282,6 +343,46 @@ class KnowledgeGraph(
                 conn.commit()
             except sqlite3.OperationalError:
                 pass  # Column already exists — no-op
+
+            conn.executescript(RELATIONS_VERSION_DDL)
+            self._fts_enabled = self._init_search_index(conn)
+        finally:
+            self._close_connection(conn)
+
+    def _init_search_index(self, conn: sqlite3.Connection) -> bool:
+        """Create (and on first creation, fill) the entity full-text index.
+
+        Returns ``False`` when this SQLite build has no FTS5 trigram
+        tokenizer; ``query()`` then falls back to ``LIKE`` scans.
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'entities_fts'"
+        ).fetchone()
+        if exists:
+            return True
+        try:
+            conn.executescript(_ENTITIES_FTS_DDL)
+        except sqlite3.OperationalError:
+            conn.rollback()
+            return False
+        return True
+
+    def _adjacency(self) -> Adjacency:
+        """The adjacency snapshot, rebuilt if ``relations`` changed since it was taken."""
+        conn = self._get_connection()
+        try:
+            version = relations_version(conn)
+            cached = self._adjacency_cache
+            if cached is not None and cached.version == version:
+                return cached
+            with self._adjacency_lock:
+                cached = self._adjacency_cache
+                if cached is None or cached.version != version:
+                    # Read after the version, so a concurrent write can only
+                    # make the snapshot newer than its tag — never staler.
+                    cached = Adjacency.load(conn, version)
+                    self._adjacency_cache = cached
+                return cached
         finally:
             self._close_connection(conn)
 
@@ -22,6 +22,7 @@ def sentinel_scan_impl(
     severity_threshold: str,
     trigger: str,
     detail: str,
+    incremental: bool = True,
 ) -> dict[str, Any]:
     """Run sentinel scan against project DSL. Returns scan result dict."""
     t0 = time.monotonic()
@@ -33,6 +34,7 @@ def sentinel_scan_impl(
         agents=agent_ids,
         severity_threshold=Severity(severity_threshold),
         trigger=ScanTrigger(trigger),
+        incremental=incremental,
     )
 
     from dazzle.sentinel.orchestrator import ScanOrchestrator
@@ -85,6 +87,7 @@ def scan_handler(project_path: Path, args: dict[str, Any]) -> str:
         severity_threshold=args.get("severity_threshold", "info"),
         trigger=args.get("trigger", "manual"),
         detail=args.get("detail", "issues"),
+        incremental=bool(args.get("incremental", True)),
     )
     by_sev = (
         out.get("summary", {}).get("by_severity", {})
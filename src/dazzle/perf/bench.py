@@ -0,0 +1,580 @@
+"""AppSpec-driven concurrent load benchmark (``dazzle bench``).
+
+``benchmarks/measure.py`` probes a handful of invoice_ops routes one
+request at a time, which hides exactly the failures that bite under
+load: lock contention, connection-pool exhaustion and event-loop
+blocking. This module derives a mixed workload from any project's IR
+and drives it concurrently against a running server.
+
+Pipeline:
+
+1. :func:`build_workload` — one :class:`BenchTarget` per (persona,
+   route): list pages of list-mode surfaces, their ``ux.filter`` /
+   ``ux.search`` variants, detail pages, create POSTs and workspace
+   pages. Reachability comes from the static RBAC matrix and the
+   workspace ``access:`` block, so a persona only requests what it may.
+2. :func:`prime_ids` — fetch a page of real ids per (persona, entity)
+   through the JSON API, so detail hits and required refs resolve.
+3. :func:`run_bench` — closed loop (``concurrency`` workers back to
+   back) or open loop (Poisson arrivals at ``rate`` per second, capped
+   at ``concurrency`` in flight). Open-loop latency is measured from the
+   *scheduled* arrival, so time spent queued behind a saturated server
+   is charged to the request instead of silently dropped.
+4. :func:`summarize` — per-route throughput and nearest-rank
+   p50/p95/p99; :func:`export_run` writes every request as a ``client``
+   span into the ``dazzle perf`` SQLite store for cross-run comparison.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as _dt
+import json
+import math
+import random
+import sqlite3
+import time
+import uuid
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from dazzle.core.field_values import generate_field_value
+from dazzle.core.ir import FieldTypeKind
+from dazzle.core.ir.workspaces import WorkspaceAccessLevel
+from dazzle.core.strings import entity_slug, to_api_plural
+from dazzle.page.app_paths import detail_path, list_path
+from dazzle.rbac.matrix import PolicyDecision, generate_access_matrix
+
+_SCHEMA_PATH = Path(__file__).parent / "schema.sql"
+
+APP_PREFIX = "/app"
+
+#: Relative share of requests per workload kind. Within a kind the share
+#: is split evenly across that kind's targets.
+DEFAULT_MIX: dict[str, float] = {
+    "list": 30.0,
+    "detail": 25.0,
+    "filter": 15.0,
+    "search": 10.0,
+    "workspace": 15.0,
+    "create": 5.0,
+}
+
+#: How many ids :func:`prime_ids` samples per (persona, entity).
+ID_SAMPLE_SIZE = 50
+
+_SEARCH_TERM = "a"
+_AUTO_FIELDS = frozenset({"id", "created_at", "updated_at"})
+
+
+@dataclass(frozen=True)
+class BenchTarget:
+    """One request shape in the workload.
+
+    ``route`` is the stable label results are grouped under
+    (``GET /app/task/{id}``); ``path`` is what is requested and still
+    contains ``{id}`` for detail targets.
+    """
+
+    persona: str
+    kind: str
+    method: str
+    path: str
+    route: str
+    entity: str | None = None
+
+
+@dataclass(frozen=True)
+class BenchSample:
+    """The outcome of one request. ``status`` is 0 on a transport error."""
+
+    route: str
+    kind: str
+    persona: str
+    status: int
+    started_ns: int
+    duration_ns: int
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 400
+
+
+@dataclass
+class BenchRun:
+    """Every sample from one benchmark run plus its wall-clock window."""
+
+    samples: list[BenchSample]
+    elapsed_s: float
+    started_at: str
+    ended_at: str
+    concurrency: int
+    rate: float | None = None
+
+
+@dataclass(frozen=True)
+class RouteStats:
+    route: str
+    kind: str
+    count: int
+    errors: int
+    throughput: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+@dataclass
+class BenchContext:
+    """Per-run state the runner needs besides the targets themselves."""
+
+    headers: dict[str, dict[str, str]]
+    ids: dict[tuple[str, str], list[str]] = field(default_factory=dict)
+    entities: dict[str, Any] = field(default_factory=dict)
+
+
+# ---------------------------------------------------------------------------
+# Workload
+# ---------------------------------------------------------------------------
+
+
+def _allowed(decision: PolicyDecision) -> bool:
+    return decision not in (PolicyDecision.DENY, PolicyDecision.PERMIT_NO_SCOPE)
+
+
+def _workspace_allowed(workspace: Any, persona: Any) -> bool:
+    access = workspace.access
+    if access is None:
+        return True
+    if persona.id in access.deny_personas:
+        return False
+    if access.level == WorkspaceAccessLevel.PERSONA:
+        return persona.id in access.allow_personas
+    return True
+
+
+def _filter_value(entity: Any, name: str) -> str | None:
+    """A value that is valid for *name*'s type, or ``None`` to skip it.
+
+    Only enums and booleans have a value that is both valid and
+    selective without looking at the data; ref and free-text filters are
+    left out rather than sending requests that match nothing.
+    """
+    spec = entity.get_field(name) if entity is not None else None
+    if spec is None:
+        return None
+    if spec.type.kind == FieldTypeKind.ENUM and spec.type.enum_values:
+        return str(spec.type.enum_values[0])
+    if spec.type.kind == FieldTypeKind.BOOL:
+        return "true"
+    return None
+
+
+def _surface_targets(
+    surface: Any, entity: Any, persona: str, matrix: Any, role: str
+) -> list[BenchTarget]:
+    name = surface.entity_ref
+    base = list_path(APP_PREFIX, entity_slug(name))
+    targets: list[BenchTarget] = []
+    if not _allowed(matrix.get(role, name, "list")):
+        return targets
+    targets.append(BenchTarget(persona, "list", "GET", base, f"GET {base}", name))
+    ux = surface.ux
+    for filt in ux.filter if ux is not None else []:
+        value = _filter_value(entity, filt)
+        if value is not None:
+            path = f"{base}?filter[{filt}]={value}"
+            targets.append(BenchTarget(persona, "filter", "GET", path, f"GET {path}", name))
+    if ux is not None and ux.search:
+        path = f"{base}?search={_SEARCH_TERM}"
+        targets.append(BenchTarget(persona, "search", "GET", path, f"GET {base}?search", name))
+    if _allowed(matrix.get(role, name, "read")):
+        path = detail_path(APP_PREFIX, entity_slug(name))
+        targets.append(BenchTarget(persona, "detail", "GET", path, f"GET {path}", name))
+    return targets
+
+
+def _create_target(entity_name: str, persona: str, matrix: Any, role: str) -> list[BenchTarget]:
+    if not _allowed(matrix.get(role, entity_name, "create")):
+        return []
+    path = f"/{to_api_plural(entity_name)}"
+    return [BenchTarget(persona, "create", "POST", path, f"POST {path}", entity_name)]
+
+
+def build_workload(
+    appspec: Any,
+    *,
+    personas: list[str] | None = None,
+    read_only: bool = False,
+) -> list[BenchTarget]:
+    """Derive the benchmark targets for every interactive persona.
+
+    Targets are de-duplicated per persona: two list surfaces over the
+    same entity share one page route.
+    """
+    matrix = generate_access_matrix(appspec)
+    entities = {e.name: e for e in appspec.domain.entities}
+    list_surfaces = [s for s in appspec.surfaces if s.mode == "list" and s.entity_ref in entities]
+    targets: dict[tuple[str, str, str], BenchTarget] = {}
+    for persona in appspec.personas:
+        if not persona.interactive or (personas and persona.id not in personas):
+            continue
+        role = persona.effective_role
+        found: list[BenchTarget] = []
+        for surface in list_surfaces:
+            entity = entities[surface.entity_ref]
+            found += _surface_targets(surface, entity, persona.id, matrix, role)
+            if not read_only:
+                found += _create_target(surface.entity_ref, persona.id, matrix, role)
+        for workspace in appspec.workspaces:
+            if _workspace_allowed(workspace, persona):
+                path = f"{APP_PREFIX}/workspaces/{workspace.name}"
+                found.append(BenchTarget(persona.id, "workspace", "GET", path, f"GET {path}"))
+        for target in found:
+            targets.setdefault((target.persona, target.method, target.path), target)
+    return list(targets.values())
+
+
+def target_weights(targets: list[BenchTarget], mix: Mapping[str, float]) -> list[float]:
+    """Split each kind's *mix* share evenly across that kind's targets."""
+    per_kind: dict[str, int] = {}
+    for target in targets:
+        per_kind[target.kind] = per_kind.get(target.kind, 0) + 1
+    return [mix.get(t.kind, 0.0) / per_kind[t.kind] for t in targets]
+
+
+def _required_refs(entity: Any) -> list[tuple[str, str]]:
+    return [
+        (f.name, f.type.ref_entity)
+        for f in entity.fields
+        if f.type.kind == FieldTypeKind.REF and f.is_required and f.type.ref_entity
+    ]
+
+
+def create_payload(entity: Any, index: int, ref_ids: Mapping[str, list[str]]) -> dict[str, Any]:
+    """A create body for *entity*: every required field, refs from *ref_ids*.
+
+    Raises ``KeyError`` when a required ref has no primed id to point at.
+    """
+    body: dict[str, Any] = {}
+    for spec in entity.fields:
+        if spec.name in _AUTO_FIELDS or spec.is_primary_key or not spec.is_required:
+            continue
+        if spec.type.kind == FieldTypeKind.REF:
+            pool = ref_ids[spec.type.ref_entity]
+            body[spec.name] = pool[index % len(pool)]
+            continue
+        if spec.type.kind == FieldTypeKind.MONEY:
+            body[f"{spec.name}_minor"] = 10000
+            body[f"{spec.name}_currency"] = spec.type.currency_code or "USD"
+            continue
+        value = generate_field_value(spec, index=index, unique_suffix=f"_b{index}")
+        if value is not None:
+            body[spec.name] = value
+    return body
+
+
+# ---------------------------------------------------------------------------
+# Setup
+# ---------------------------------------------------------------------------
+
+
+def _needed_ids(targets: list[BenchTarget], entities: Mapping[str, Any]) -> set[tuple[str, str]]:
+    needed: set[tuple[str, str]] = set()
+    for target in targets:
+        if target.entity is None:
+            continue
+        if target.kind == "detail":
+            needed.add((target.persona, target.entity))
+        elif target.kind == "create":
+            for _, ref in _required_refs(entities[target.entity]):
+                needed.add((target.persona, ref))
+    return needed
+
+
+async def prime_ids(
+    client: httpx.AsyncClient,
+    targets: list[BenchTarget],
+    context: BenchContext,
+) -> None:
+    """Sample real ids for detail targets and required create refs.
+
+    Each persona lists through its own session, so a scoped persona only
+    ever requests rows it can see.
+    """
+    for persona, entity in sorted(_needed_ids(targets, context.entities)):
+        try:
+            resp = await client.get(
+                f"/{to_api_plural(entity)}",
+                params={"page_size": ID_SAMPLE_SIZE},
+                headers=context.headers.get(persona, {}),
+            )
+            items = resp.json().get("items", []) if resp.status_code == 200 else []
+        except (httpx.HTTPError, ValueError):
+            continue
+        context.ids[(persona, entity)] = [str(i["id"]) for i in items if "id" in i]
+
+
+def runnable(targets: list[BenchTarget], context: BenchContext) -> list[BenchTarget]:
+    """Drop targets that cannot be issued: no id to view, no ref to point at."""
+    kept: list[BenchTarget] = []
+    for target in targets:
+        if target.kind == "detail" and not context.ids.get((target.persona, target.entity or "")):
+            continue
+        if target.kind == "create":
+            refs = _required_refs(context.entities[target.entity or ""])
+            if any(not context.ids.get((target.persona, ref)) for _, ref in refs):
+                continue
+        kept.append(target)
+    return kept
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+
+class _Runner:
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        targets: list[BenchTarget],
+        context: BenchContext,
+        mix: Mapping[str, float],
+        seed: int,
+    ) -> None:
+        self._client = client
+        self._targets = targets
+        self._weights = target_weights(targets, mix)
+        self._context = context
+        self._rng = random.Random(seed)
+        self._wall_base = time.time_ns()
+        self._mono_base = time.perf_counter_ns()
+        self._creates = 0
+        self.samples: list[BenchSample] = []
+
+    def pick(self) -> BenchTarget:
+        return self._rng.choices(self._targets, weights=self._weights)[0]
+
+    def _request_args(self, target: BenchTarget) -> dict[str, Any]:
+        args: dict[str, Any] = {"headers": self._context.headers.get(target.persona, {})}
+        if target.kind == "detail":
+            pool = self._context.ids[(target.persona, target.entity or "")]
+            args["url"] = target.path.replace("{id}", self._rng.choice(pool))
+            return args
+        args["url"] = target.path
+        if target.kind == "create":
+            entity = self._context.entities[target.entity or ""]
+            refs = {
+                ref: self._context.ids[(target.persona, ref)] for _, ref in _required_refs(entity)
+            }
+            self._creates += 1
+            args["json"] = create_payload(entity, self._creates, refs)
+        return args
+
+    async def issue(self, target: BenchTarget, scheduled_ns: int | None = None) -> None:
+        args = self._request_args(target)
+        start = time.perf_counter_ns() if scheduled_ns is None else scheduled_ns
+        try:
+            resp = await self._client.request(target.method, **args)
+            await resp.aread()
+            status = resp.status_code
+        except httpx.HTTPError:
+            status = 0
+        end = time.perf_counter_ns()
+        self.samples.append(
+            BenchSample(
+                route=target.route,
+                kind=target.kind,
+                persona=target.persona,
+                status=status,
+                started_ns=self._wall_base + (start - self._mono_base),
+                duration_ns=end - start,
+            )
+        )
+
+    async def closed_loop(self, concurrency: int, deadline: float) -> None:
+        async def worker() -> None:
+            while time.perf_counter() < deadline:
+                await self.issue(self.pick())
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    async def open_loop(self, concurrency: int, rate: float, deadline: float) -> None:
+        gate = asyncio.Semaphore(concurrency)
+        pending: set[asyncio.Task[None]] = set()
+
+        async def arrival(target: BenchTarget, scheduled_ns: int) -> None:
+            async with gate:
+                await self.issue(target, scheduled_ns)
+
+        next_at = time.perf_counter()
+        while next_at < deadline:
+            delay = next_at - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            task = asyncio.create_task(arrival(self.pick(), int(next_at * 1e9)))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+            next_at += self._rng.expovariate(rate)
+        if pending:
+            await asyncio.gather(*pending)
+
+
+async def run_bench(
+    client: httpx.AsyncClient,
+    targets: list[BenchTarget],
+    context: BenchContext,
+    *,
+    duration: float,
+    concurrency: int = 10,
+    rate: float | None = None,
+    mix: Mapping[str, float] = DEFAULT_MIX,
+    seed: int = 0,
+) -> BenchRun:
+    """Drive *targets* for *duration* seconds and collect every sample.
+
+    With ``rate`` unset the run is closed-loop: ``concurrency`` workers
+    issue requests back to back, which finds peak throughput. With a
+    ``rate`` the run is open-loop at that many arrivals per second, which
+    is what shows latency climbing as the server saturates.
+    """
+    runner = _Runner(client, targets, context, mix, seed)
+    started_at = _dt.datetime.now(_dt.UTC).isoformat()
+    begin = time.perf_counter()
+    deadline = begin + duration
+    if targets:
+        if rate:
+            await runner.open_loop(concurrency, rate, deadline)
+        else:
+            await runner.closed_loop(concurrency, deadline)
+    return BenchRun(
+        samples=runner.samples,
+        elapsed_s=time.perf_counter() - begin,
+        started_at=started_at,
+        ended_at=_dt.datetime.now(_dt.UTC).isoformat(),
+        concurrency=concurrency,
+        rate=rate,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Results
+# ---------------------------------------------------------------------------
+
+
+def percentile(ordered: list[int], pct: float) -> int:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(run: BenchRun) -> list[RouteStats]:
+    """Per-route throughput and latency percentiles, busiest route first."""
+    by_route: dict[str, list[BenchSample]] = {}
+    for sample in run.samples:
+        by_route.setdefault(sample.route, []).append(sample)
+    elapsed = run.elapsed_s or 1.0
+    stats: list[RouteStats] = []
+    for route, samples in by_route.items():
+        ordered = sorted(s.duration_ns for s in samples)
+        stats.append(
+            RouteStats(
+                route=route,
+                kind=samples[0].kind,
+                count=len(samples),
+                errors=sum(1 for s in samples if not s.ok),
+                throughput=len(samples) / elapsed,
+                p50_ms=percentile(ordered, 50) / 1e6,
+                p95_ms=percentile(ordered, 95) / 1e6,
+                p99_ms=percentile(ordered, 99) / 1e6,
+            )
+        )
+    return sorted(stats, key=lambda s: (-s.count, s.route))
+
+
+def render_table(run: BenchRun, stats: list[RouteStats]) -> str:
+    """Plain-text report: one row per route plus a totals line."""
+    width = max([len(s.route) for s in stats] + [5])
+    lines = [
+        f"{'route':<{width}}  {'reqs':>6}  {'err':>4}  {'req/s':>7}  "
+        f"{'p50 ms':>8}  {'p95 ms':>8}  {'p99 ms':>8}"
+    ]
+    for s in stats:
+        lines.append(
+            f"{s.route:<{width}}  {s.count:>6}  {s.errors:>4}  {s.throughput:>7.1f}  "
+            f"{s.p50_ms:>8.1f}  {s.p95_ms:>8.1f}  {s.p99_ms:>8.1f}"
+        )
+    total = len(run.samples)
+    errors = sum(1 for s in run.samples if not s.ok)
+    lines.append(
+        f"\n{total} requests, {errors} errors in {run.elapsed_s:.1f}s "
+        f"({total / (run.elapsed_s or 1.0):.1f} req/s, concurrency {run.concurrency})"
+    )
+    return "\n".join(lines)
+
+
+def export_run(
+    run: BenchRun,
+    db_path: Path,
+    *,
+    run_id: str,
+    app_name: str | None = None,
+    command_line: str = "",
+) -> Path:
+    """Write *run* into a ``dazzle perf`` store file, one span per request.
+
+    Spans are ``client`` kind, named by route, with persona, workload
+    kind and HTTP status as attributes — the same shape ``perf show`` and
+    ``perf report`` already read.
+    """
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    trace_id = uuid.uuid4().hex
+    rows = [
+        (
+            f"{index:016x}",
+            trace_id,
+            None,
+            run_id,
+            sample.route,
+            "client",
+            "ok" if sample.ok else "error",
+            sample.started_ns,
+            sample.started_ns + sample.duration_ns,
+            sample.duration_ns,
+            json.dumps(
+                {
+                    "bench.persona": sample.persona,
+                    "bench.kind": sample.kind,
+                    "http.status_code": sample.status,
+                }
+            ),
+        )
+        for index, sample in enumerate(run.samples, start=1)
+    ]
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.executescript(_SCHEMA_PATH.read_text(encoding="utf-8"))
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO runs "
+                "(run_id, started_at, ended_at, app_name, manifest_path, command_line) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (run_id, run.started_at, run.ended_at, app_name, None, command_line),
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO spans "
+                "(span_id, trace_id, parent_span_id, run_id, name, kind, status, "
+                " started_ns, ended_ns, duration_ns, attributes_json) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+    finally:
+        conn.close()
+    return db_path
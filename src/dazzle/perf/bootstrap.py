@@ -4,29 +4,62 @@ Wires the SQLite exporter when ``DAZZLE_PERF_ENABLED`` is set in the
 environment. Called at CLI entry so framework-boot spans (DSL parse,
 route generation) are captured — by the time ``_create_app`` ran
 previously, those phases had already executed against the no-op tracer.
+
+``DAZZLE_PERF_MODE=production`` switches to always-on sampled tracing
+into a rolling store (``.dazzle/perf/production/traces.db`` unless
+``DAZZLE_PERF_DB`` says otherwise). Set ``DAZZLE_PERF_RUN_ID`` to the
+deploy id so every worker of a deploy shares one run; tune with
+``DAZZLE_PERF_SAMPLE_RATE``, ``DAZZLE_PERF_SLOW_MS`` and
+``DAZZLE_PERF_MAX_MB``.
 """
 
 from __future__ import annotations
 
+import logging
 import os
 import sys
 from pathlib import Path
 
+from dazzle.perf.run_id import make_run_id
+
+logger = logging.getLogger(__name__)
+
+PRODUCTION_DB = Path(".dazzle") / "perf" / "production" / "traces.db"
+
 
 def maybe_configure_tracer() -> None:
     """Configure the OTel tracer if ``DAZZLE_PERF_ENABLED=1``.
 
     No-op when the env var is unset. Idempotent — repeated calls are
     harmless because OTel's set_tracer_provider tolerates re-assignment
-    (warning logged, no exception).
+    (warning logged, no exception). Production mode configures once per
+    process so the store is not opened twice.
     """
     if os.environ.get("DAZZLE_PERF_ENABLED") != "1":
         return
-    db_str = os.environ.get("DAZZLE_PERF_DB")
-    run_id = os.environ.get("DAZZLE_PERF_RUN_ID")
+    production = os.environ.get("DAZZLE_PERF_MODE") == "production"
+    db_str = os.environ.get("DAZZLE_PERF_DB") or (str(PRODUCTION_DB) if production else None)
+    run_id = os.environ.get("DAZZLE_PERF_RUN_ID") or (make_run_id() if production else None)
     if not db_str or not run_id:
         return
-    from dazzle.perf.tracer import configure_tracer
+    from dazzle.perf.tracer import SamplingPolicy, configure_tracer, current_provider
+
+    if production:
+        if current_provider() is not None:
+            return
+        default = SamplingPolicy()
+        configure_tracer(
+            run_id=run_id,
+            db_path=Path(db_str),
+            command_line=" ".join(sys.argv),
+            sampling=SamplingPolicy(
+                sample_rate=_env_float("DAZZLE_PERF_SAMPLE_RATE", default.sample_rate),
+                slow_ms=_env_float("DAZZLE_PERF_SLOW_MS", default.slow_ms),
+                max_bytes=int(_env_float("DAZZLE_PERF_MAX_MB", default.max_bytes / 2**20) * 2**20),
+                rollup_days=int(_env_float("DAZZLE_PERF_ROLLUP_DAYS", default.rollup_days)),
+            ),
+        )
+        return
 
     # batch=False → SimpleSpanProcessor, which exports each span to
     # SQLite synchronously as it ends. BatchSpanProcessor only flushes
@@ -42,3 +75,15 @@ def maybe_configure_tracer() -> None:
         batch=False,
         command_line=" ".join(sys.argv),
     )
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a numeric env var, falling back to ``default`` when unset or malformed."""
+    raw = os.environ.get(name)
+    if not raw:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        logger.warning("Ignoring %s=%r — not a number; using %s", name, raw, default)
+        return default
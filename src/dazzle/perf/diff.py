@@ -0,0 +1,307 @@
+"""Compare two slices of the production perf store.
+
+A slice is either a run id (in production mode, the deploy id) or a
+UTC hour window ``START..END`` — ``2026-10-18T00..2026-10-18T06``
+selects the six hours from midnight; either end may be left open.
+Slices are read from the hourly ``rollups`` table, which counts every
+request rather than only the sampled traces, so call counts and
+averages are exact.
+
+:func:`build_diff` reports the routes and queries whose average
+latency or error rate moved by more than a threshold, the ones that
+appeared or disappeared, and — when both slices are runs — the N+1
+patterns present in the head's sampled traces but not the base's.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime as _dt
+import sqlite3
+from pathlib import Path
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict
+
+from dazzle.perf.findings.extractor import detect_n_plus_one
+from dazzle.perf.findings.types import NPlusOne
+
+_HOUR_FORMAT = "%Y-%m-%dT%H:00"
+
+# A rise in error rate of at least this many percentage points is a
+# regression whatever the latency did.
+_ERROR_RATE_STEP = 0.01
+
+_Status = Literal["regressed", "improved", "new", "gone"]
+
+_STATUS_ORDER = {"regressed": 0, "new": 1, "improved": 2, "gone": 3}
+
+
+@dataclasses.dataclass(frozen=True)
+class Selector:
+    """One side of a diff: a run id, or a half-open hour window."""
+
+    run_id: str | None = None
+    start: str | None = None
+    end: str | None = None
+
+    def describe(self) -> str:
+        if self.run_id is not None:
+            return self.run_id
+        return f"{self.start or '…'}..{self.end or '…'}"
+
+
+def parse_selector(text: str) -> Selector:
+    """Parse ``RUN_ID`` or ``START..END`` (ISO dates or hours, UTC).
+
+    Raises:
+        ValueError: when a window bound is not an ISO date/time.
+    """
+    if ".." not in text:
+        return Selector(run_id=text)
+    start, end = text.split("..", 1)
+    return Selector(start=_hour(start), end=_hour(end))
+
+
+def _hour(text: str) -> str | None:
+    if not text:
+        return None
+    if len(text) == len("2026-10-18T06"):
+        text += ":00"
+    return _dt.datetime.fromisoformat(text).strftime(_HOUR_FORMAT)
+
+
+class RollupStat(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    kind: str
+    key: str
+    calls: int
+    errors: int
+    total_ms: float
+    max_ms: float
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.calls if self.calls else 0.0
+
+
+class RollupDelta(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    status: _Status
+    kind: str
+    key: str
+    base_calls: int
+    head_calls: int
+    base_avg_ms: float
+    head_avg_ms: float
+    change_pct: float | None
+    base_error_rate: float
+    head_error_rate: float
+
+
+class PerfDiff(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    base: str
+    head: str
+    changes: list[RollupDelta] = []
+    new_n_plus_one: list[NPlusOne] = []
+
+
+def load_rollups(db_path: Path, selector: Selector) -> dict[tuple[str, str], RollupStat]:
+    """Sum the ``rollups`` rows of one slice, keyed by ``(kind, key)``."""
+    clauses: list[str] = []
+    params: list[str] = []
+    if selector.run_id is not None:
+        clauses.append("run_id = ?")
+        params.append(selector.run_id)
+    if selector.start is not None:
+        clauses.append("hour >= ?")
+        params.append(selector.start)
+    if selector.end is not None:
+        clauses.append("hour < ?")
+        params.append(selector.end)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            f"SELECT kind, key, SUM(calls), SUM(errors), SUM(total_ns), MAX(max_ns) "
+            f"FROM rollups {where} GROUP BY kind, key",
+            params,
+        ).fetchall()
+    return {
+        (kind, key): RollupStat(
+            kind=kind,
+            key=key,
+            calls=calls,
+            errors=errors,
+            total_ms=total_ns / 1e6,
+            max_ms=max_ns / 1e6,
+        )
+        for kind, key, calls, errors, total_ns, max_ns in rows
+    }
+
+
+def diff_rollups(
+    base: dict[tuple[str, str], RollupStat],
+    head: dict[tuple[str, str], RollupStat],
+    *,
+    min_change_pct: float = 20.0,
+    min_calls: int = 10,
+) -> list[RollupDelta]:
+    """Routes and queries that moved between ``base`` and ``head``.
+
+    Keys with fewer than ``min_calls`` calls on the side(s) they appear
+    on are ignored — a handful of requests is noise, not a trend.
+    Regressions come first, largest added time (``Δavg × head calls``)
+    leading.
+    """
+    deltas: list[RollupDelta] = []
+    for ident in base.keys() | head.keys():
+        delta = _compare(ident, base.get(ident), head.get(ident), min_change_pct, min_calls)
+        if delta is not None:
+            deltas.append(delta)
+    deltas.sort(key=lambda d: (_STATUS_ORDER[d.status], -_impact(d)))
+    return deltas
+
+
+def _compare(
+    ident: tuple[str, str],
+    b: RollupStat | None,
+    h: RollupStat | None,
+    min_change_pct: float,
+    min_calls: int,
+) -> RollupDelta | None:
+    if any(stat is not None and stat.calls < min_calls for stat in (b, h)):
+        return None
+    change_pct = None
+    status: _Status | None
+    if b is None:
+        status = "new"
+    elif h is None:
+        status = "gone"
+    else:
+        change_pct = (h.avg_ms - b.avg_ms) / b.avg_ms * 100 if b.avg_ms else None
+        status = _classify(b, h, change_pct, min_change_pct)
+    if status is None:
+        return None
+    base_calls, base_avg, base_errors = _side(b)
+    head_calls, head_avg, head_errors = _side(h)
+    return RollupDelta(
+        status=status,
+        kind=ident[0],
+        key=ident[1],
+        base_calls=base_calls,
+        head_calls=head_calls,
+        base_avg_ms=base_avg,
+        head_avg_ms=head_avg,
+        change_pct=change_pct,
+        base_error_rate=base_errors,
+        head_error_rate=head_errors,
+    )
+
+
+def _classify(
+    b: RollupStat, h: RollupStat, change_pct: float | None, min_change_pct: float
+) -> _Status | None:
+    if h.error_rate - b.error_rate >= _ERROR_RATE_STEP:
+        return "regressed"
+    if change_pct is None:
+        return None
+    if change_pct >= min_change_pct:
+        return "regressed"
+    if change_pct <= -min_change_pct:
+        return "improved"
+    return None
+
+
+def _side(stat: RollupStat | None) -> tuple[int, float, float]:
+    if stat is None:
+        return 0, 0.0, 0.0
+    return stat.calls, stat.avg_ms, stat.error_rate
+
+
+def _impact(delta: RollupDelta) -> float:
+    calls = delta.head_calls or delta.base_calls
+    return abs(delta.head_avg_ms - delta.base_avg_ms) * calls
+
+
+def build_diff(
+    db_path: Path,
+    base: Selector,
+    head: Selector,
+    *,
+    min_change_pct: float = 20.0,
+    min_calls: int = 10,
+) -> PerfDiff:
+    """Diff two slices of the store at ``db_path``."""
+    changes = diff_rollups(
+        load_rollups(db_path, base),
+        load_rollups(db_path, head),
+        min_change_pct=min_change_pct,
+        min_calls=min_calls,
+    )
+    new_n_plus_one: list[NPlusOne] = []
+    if base.run_id is not None and head.run_id is not None:
+        known = {
+            (n.parent_span, n.child_statement) for n in detect_n_plus_one(db_path, base.run_id)
+        }
+        new_n_plus_one = [
+            n
+            for n in detect_n_plus_one(db_path, head.run_id)
+            if (n.parent_span, n.child_statement) not in known
+        ]
+    return PerfDiff(
+        base=base.describe(),
+        head=head.describe(),
+        changes=changes,
+        new_n_plus_one=new_n_plus_one,
+    )
+
+
+def render_json(diff: PerfDiff) -> str:
+    return diff.model_dump_json(indent=2)
+
+
+_SECTIONS = (
+    ("regressed", "Regressions"),
+    ("new", "New"),
+    ("improved", "Improvements"),
+    ("gone", "Gone"),
+)
+
+
+def render_markdown(diff: PerfDiff) -> str:
+    lines = [f"# Perf diff — {diff.base} → {diff.head}", ""]
+    if not diff.changes and not diff.new_n_plus_one:
+        lines.append("No significant changes.")
+    for status, title in _SECTIONS:
+        rows = [d for d in diff.changes if d.status == status]
+        if not rows:
+            continue
+        lines.append(f"## {title}")
+        lines.append("| Kind | Key | Calls | Avg (ms) | Change | Error rate |")
+        lines.append("|---|---|---|---|---|---|")
+        for d in rows:
+            change = f"{d.change_pct:+.0f}%" if d.change_pct is not None else "—"
+            lines.append(
+                f"| {d.kind} | `{d.key}` | {d.base_calls} → {d.head_calls} | "
+                f"{d.base_avg_ms:.1f} → {d.head_avg_ms:.1f} | {change} | "
+                f"{d.base_error_rate:.1%} → {d.head_error_rate:.1%} |"
+            )
+        lines.append("")
+
+    if diff.new_n_plus_one:
+        lines.append("## New N+1 patterns")
+        lines.append("| Parent span | Child query | Repetitions |")
+        lines.append("|---|---|---|")
+        for n in diff.new_n_plus_one:
+            lines.append(f"| `{n.parent_span}` | `{n.child_statement}` | {n.repetitions} |")
+        lines.append("")
+
+    return "\n".join(lines).rstrip() + "\n"
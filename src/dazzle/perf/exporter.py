@@ -1,11 +1,12 @@
-"""SQLite span exporter for the ``dazzle perf`` toolkit.
+"""SQLite span exporters for the ``dazzle perf`` toolkit.
 
-Writes spans into a 3-table schema owned by the framework — see
-``schema.sql``. Findings extraction reads the same schema directly, so
-keeping the writer + reader paired in this package avoids vendor-schema
-drift surprises.
+Writes spans into a framework-owned schema — see ``schema.sql``.
+Findings extraction reads the same schema directly, so keeping the
+writer + reader paired in this package avoids vendor-schema drift
+surprises.
 
-This exporter is intentionally simple:
+:class:`SQLiteSpanExporter` backs ``dazzle perf trace`` and is
+intentionally simple:
 
 - One SQLite file per ``run_id``. Opening more than one provider with
   the same ``db_path`` is undefined.
@@ -13,19 +14,41 @@ This exporter is intentionally simple:
   finalised (``ended_at``) on shutdown.
 - ``SimpleSpanProcessor`` is the recommended pairing for synchronous
   tests; the production path in ``tracer.py`` uses ``BatchSpanProcessor``.
+
+Production mode (``DAZZLE_PERF_MODE=production``) pairs
+:class:`RollingSpanExporter` with :class:`TailSamplingSpanProcessor`:
+
+- Every finished span is counted into hourly ``rollups`` per route and
+  per query fingerprint (:func:`~dazzle.perf.findings.extractor.normalise_statement`).
+- Whole traces are kept only when the trace id falls in the sample rate,
+  the root span was slow, or any span in it errored.
+- The store is shared by every process of a deploy (WAL) and bounded in
+  size: the oldest spans are evicted once they outgrow ``max_bytes``.
+  Rollups don't count against that budget; hours older than
+  ``rollup_days`` are aged out instead.
 """
 
 from __future__ import annotations
 
 import datetime as _dt
+import functools
 import json
+import logging
 import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
-from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
 from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
-from opentelemetry.trace import StatusCode
+from opentelemetry.trace import SpanKind, StatusCode
+
+from dazzle.perf.findings.extractor import normalise_statement
+
+logger = logging.getLogger(__name__)
 
 _SCHEMA_PATH = Path(__file__).parent / "schema.sql"
 
@@ -138,6 +161,260 @@ class SQLiteSpanExporter(SpanExporter):
         self._conn = None  # type: ignore[assignment]
 
 
+# Rollup row key (hour, kind, key); values are [calls, errors, total_ns, max_ns].
+_RollupKey = tuple[str, str, str]
+
+# Fraction of the remaining spans dropped per eviction pass.
+_EVICT_FRACTION = 10
+
+# Rough on-disk size of one rollup row (with its primary-key entry), for
+# SQLite builds without the ``dbstat`` table.
+_ROLLUP_ROW_BYTES = 160
+
+_HOUR_FORMAT = "%Y-%m-%dT%H:00"
+
+
+class RollingSpanExporter(SQLiteSpanExporter):
+    """A :class:`SQLiteSpanExporter` over a long-lived, size-bounded store.
+
+    Several processes (one per worker) may write the same file; each
+    connection runs in WAL mode with a busy timeout. After every export
+    the bytes held by traces are checked against ``max_bytes`` and the
+    oldest spans (with their events) are deleted until they fit. Freed
+    pages are reused, so the file stops growing rather than shrinking.
+
+    Rollups are excluded from the budget — evicting spans cannot shrink
+    them — and are bounded by age instead: each write drops the hours
+    older than ``rollup_days``.
+    """
+
+    def __init__(self, *, max_bytes: int, rollup_days: int = 90, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._max_bytes = max_bytes
+        self._rollup_days = rollup_days
+        self._lock = threading.Lock()
+        self._conn.execute("PRAGMA busy_timeout = 5000")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._rollup_bytes = self._measure_rollups()
+
+    def export(self, spans: list[ReadableSpan]) -> SpanExportResult:  # type: ignore[override]
+        with self._lock:
+            result = super().export(spans)
+            self._enforce_size_budget()
+        return result
+
+    def write_rollups(self, rows: dict[_RollupKey, list[int]]) -> None:
+        """Add per-hour totals to ``rollups`` (summing into existing rows)."""
+        params = [
+            (hour, self._run_id, kind, key, calls, errors, total_ns, max_ns)
+            for (hour, kind, key), (calls, errors, total_ns, max_ns) in rows.items()
+        ]
+        cutoff = _dt.datetime.now(_dt.UTC) - _dt.timedelta(days=self._rollup_days)
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO rollups "
+                    "(hour, run_id, kind, key, calls, errors, total_ns, max_ns) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (hour, run_id, kind, key) DO UPDATE SET "
+                    "calls = calls + excluded.calls, errors = errors + excluded.errors, "
+                    "total_ns = total_ns + excluded.total_ns, "
+                    "max_ns = max(max_ns, excluded.max_ns)",
+                    params,
+                )
+                self._conn.execute(
+                    "DELETE FROM rollups WHERE hour < ?", (cutoff.strftime(_HOUR_FORMAT),)
+                )
+            self._rollup_bytes = self._measure_rollups()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            super().shutdown()
+
+    def live_bytes(self) -> int:
+        """Bytes held by live pages — the file size minus reusable free pages."""
+        page_size = self._conn.execute("PRAGMA page_size").fetchone()[0]
+        pages = self._conn.execute("PRAGMA page_count").fetchone()[0]
+        free = self._conn.execute("PRAGMA freelist_count").fetchone()[0]
+        return int((pages - free) * page_size)
+
+    def trace_bytes(self) -> int:
+        """Live bytes less the rollups' share — what ``max_bytes`` bounds."""
+        return self.live_bytes() - self._rollup_bytes
+
+    def _measure_rollups(self) -> int:
+        """Bytes held by ``rollups``, re-measured only when rollups are written."""
+        try:
+            return sum(
+                self._conn.execute(
+                    "SELECT COALESCE(SUM(pgsize), 0) FROM dbstat WHERE name = ?", (name,)
+                ).fetchone()[0]
+                for name in ("rollups", "sqlite_autoindex_rollups_1")
+            )
+        except sqlite3.OperationalError:  # SQLite built without dbstat
+            rows = self._conn.execute("SELECT COUNT(*) FROM rollups").fetchone()[0]
+            return int(rows * _ROLLUP_ROW_BYTES)
+
+    def _enforce_size_budget(self) -> None:
+        while self.trace_bytes() > self._max_bytes:
+            row = self._conn.execute(
+                "SELECT started_ns FROM spans ORDER BY started_ns "
+                "LIMIT 1 OFFSET (SELECT COUNT(*) / ? FROM spans)",
+                (_EVICT_FRACTION,),
+            ).fetchone()
+            if row is None:
+                return
+            with self._conn:
+                self._conn.execute(
+                    "DELETE FROM events WHERE span_id IN "
+                    "(SELECT span_id FROM spans WHERE started_ns <= ?)",
+                    (row[0],),
+                )
+                deleted = self._conn.execute(
+                    "DELETE FROM spans WHERE started_ns <= ?", (row[0],)
+                ).rowcount
+            if not deleted:
+                return
+
+
+class TailSamplingSpanProcessor(SpanProcessor):
+    """Keep whole traces that are sampled, slow or errored; roll up the rest.
+
+    Every span is recorded, so the keep/drop decision can wait until the
+    trace's local root span ends:
+
+    - **head** — the trace id falls in ``sample_rate`` (the same
+      trace-id ratio test as OTel's ``TraceIdRatioBased``, so every
+      process agrees on it);
+    - **tail** — the root span took at least ``slow_ms``, or any span of
+      the trace ended with an error.
+
+    Kept traces are handed to ``delegate`` (normally a
+    ``BatchSpanProcessor`` over :class:`RollingSpanExporter`). Whatever
+    the decision, server spans and SQL client spans are counted into
+    hourly rollups. A background thread hands them to ``rollup_sink``
+    every ``rollup_interval`` seconds, and they are flushed on flush /
+    shutdown — never from ``on_end``, which runs on the request path.
+    At most ``max_pending_traces`` unfinished traces are buffered; the
+    oldest is dropped beyond that.
+    """
+
+    def __init__(
+        self,
+        delegate: SpanProcessor,
+        *,
+        sample_rate: float,
+        slow_ms: float,
+        rollup_sink: Callable[[dict[_RollupKey, list[int]]], None] | None = None,
+        rollup_interval: float = 60.0,
+        max_pending_traces: int = 10_000,
+    ) -> None:
+        if rollup_interval <= 0:
+            raise ValueError(f"rollup_interval must be > 0, got {rollup_interval}")
+        self._delegate = delegate
+        self._bound = round(max(0.0, min(1.0, sample_rate)) * (1 << 64))
+        self._slow_ns = int(slow_ms * 1e6)
+        self._rollup_sink = rollup_sink
+        self._rollup_interval = rollup_interval
+        self._max_pending = max_pending_traces
+        self._lock = threading.Lock()
+        self._pending: OrderedDict[int, list[ReadableSpan]] = OrderedDict()
+        self._errored: set[int] = set()
+        self._rollups: dict[_RollupKey, list[int]] = {}
+        self._stop = threading.Event()
+        self._flusher: threading.Thread | None = None
+        if rollup_sink is not None:
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="dazzle-perf-rollups", daemon=True
+            )
+            self._flusher.start()
+
+    def on_start(self, span: Span, parent_context: Context | None = None) -> None:
+        return None
+
+    def on_end(self, span: ReadableSpan) -> None:
+        trace_id = span.context.trace_id if span.context else 0
+        errored = span.status.status_code == StatusCode.ERROR
+        kept: list[ReadableSpan] = []
+        with self._lock:
+            self._count(span, errored)
+            self._pending.setdefault(trace_id, []).append(span)
+            if errored:
+                self._errored.add(trace_id)
+            if span.parent is not None and not span.parent.is_remote:
+                # Not the local root — wait for the rest of the trace.
+                self._bound_pending()
+            else:
+                trace = self._pending.pop(trace_id)
+                tail_kept = trace_id in self._errored or self._is_slow(span)
+                self._errored.discard(trace_id)
+                if tail_kept or self.head_sampled(trace_id):
+                    kept = trace
+        for finished in kept:
+            self._delegate.on_end(finished)
+
+    def head_sampled(self, trace_id: int) -> bool:
+        """Whether ``trace_id`` falls inside the head sample rate."""
+        return (trace_id & 0xFFFFFFFFFFFFFFFF) < self._bound
+
+    def shutdown(self) -> None:
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=self._rollup_interval)
+        self._flush_rollups()
+        self._delegate.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        self._flush_rollups()
+        return self._delegate.force_flush(timeout_millis)
+
+    def _is_slow(self, span: ReadableSpan) -> bool:
+        return (span.end_time or 0) - (span.start_time or 0) >= self._slow_ns
+
+    def _bound_pending(self) -> None:
+        while len(self._pending) > self._max_pending:
+            dropped, _ = self._pending.popitem(last=False)
+            self._errored.discard(dropped)
+
+    def _count(self, span: ReadableSpan, errored: bool) -> None:
+        if span.kind == SpanKind.SERVER:
+            key = ("route", span.name)
+        elif span.kind == SpanKind.CLIENT and span.attributes:
+            statement = span.attributes.get("db.statement")
+            if not isinstance(statement, str):
+                return
+            key = ("query", _fingerprint(statement))
+        else:
+            return
+        started = span.start_time or 0
+        duration = max(0, (span.end_time or started) - started)
+        hour = _dt.datetime.fromtimestamp(started / 1e9, _dt.UTC).strftime(_HOUR_FORMAT)
+        totals = self._rollups.setdefault((hour, *key), [0, 0, 0, 0])
+        totals[0] += 1
+        totals[1] += int(errored)
+        totals[2] += duration
+        totals[3] = max(totals[3], duration)
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(self._rollup_interval):
+            try:
+                self._flush_rollups()
+            except Exception:
+                logger.warning("Perf rollup flush failed", exc_info=True)
+
+    def _flush_rollups(self) -> None:
+        with self._lock:
+            rows, self._rollups = self._rollups, {}
+        if rows and self._rollup_sink is not None:
+            self._rollup_sink(rows)
+
+
+@functools.lru_cache(maxsize=4096)
+def _fingerprint(statement: str) -> str:
+    """Cached :func:`normalise_statement` — parameterised SQL repeats verbatim."""
+    return normalise_statement(statement)
+
+
 def _coerce(value: Any) -> Any:
     """Coerce non-JSON-serialisable OTel attribute values to strings."""
     if isinstance(value, bool | int | float | str | list | tuple | dict) or value is None:
@@ -0,0 +1,281 @@
+"""Microbenchmark sampling, stored baselines and regression detection.
+
+The hot-path cases themselves live in ``benchmarks/micro.py`` (they need the
+example apps); this module holds the parts that do not depend on them:
+
+* :func:`measure` — calibrated timing: enough calls per sample to clear
+  ``min_time``, reported as seconds per call
+* :class:`MicroRun` — a set of case results plus the interpreter/host they
+  were taken on, saved and loaded as JSON
+* :func:`compare_runs` — per-case Mann-Whitney U test, so a case is only
+  flagged when the samples differ significantly *and* the median moved by
+  more than the threshold
+
+No third-party statistics package is needed; the U test uses the normal
+approximation with tie correction, which is accurate from ~8 samples a side.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+SCHEMA_VERSION = 1
+DEFAULT_SAMPLES = 10
+DEFAULT_MIN_TIME = 0.05  # seconds per sample
+DEFAULT_ALPHA = 0.01
+DEFAULT_THRESHOLD = 0.05  # ignore significant shifts smaller than 5 %
+MAX_LOOPS = 1_000_000
+
+
+@dataclass
+class CaseResult:
+    """Per-call timings (seconds) for one case; each sample averages ``loops`` calls."""
+
+    name: str
+    loops: int
+    samples: list[float]
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def spread(self) -> float:
+        """Interquartile range relative to the median."""
+        if len(self.samples) < 2:
+            return 0.0
+        q1, _, q3 = statistics.quantiles(self.samples, n=4)
+        return (q3 - q1) / self.median if self.median else 0.0
+
+
+@dataclass
+class MicroRun:
+    cases: dict[str, CaseResult]
+    environment: dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": SCHEMA_VERSION,
+            "environment": self.environment,
+            "cases": {
+                name: {"loops": case.loops, "samples": case.samples}
+                for name, case in self.cases.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> MicroRun:
+        if data.get("version") != SCHEMA_VERSION:
+            raise ValueError(f"unsupported microbenchmark file version: {data.get('version')!r}")
+        cases = {
+            name: CaseResult(name, int(case["loops"]), [float(s) for s in case["samples"]])
+            for name, case in data["cases"].items()
+        }
+        return cls(cases=cases, environment=dict(data.get("environment", {})))
+
+
+def environment() -> dict[str, str]:
+    """Where a run was taken — baselines only compare like with like."""
+    return {
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": sys.implementation.name,
+        "platform": platform.platform(terse=True),
+        "machine": platform.machine(),
+        "host": platform.node(),
+    }
+
+
+def save_run(run: MicroRun, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(run.to_dict(), indent=2) + "\n", encoding="utf-8")
+
+
+def load_run(path: Path) -> MicroRun:
+    return MicroRun.from_dict(json.loads(path.read_text(encoding="utf-8")))
+
+
+# ---------------------------------------------------------------------------
+# Sampling
+# ---------------------------------------------------------------------------
+
+
+def measure(
+    name: str,
+    fn: Callable[[], object],
+    *,
+    samples: int = DEFAULT_SAMPLES,
+    min_time: float = DEFAULT_MIN_TIME,
+    clock: Callable[[], float] = time.perf_counter,
+) -> CaseResult:
+    """Time ``fn`` as ``samples`` batches of calls, each lasting at least ``min_time``.
+
+    The first call warms imports and caches and is discarded; the second
+    calibrates the batch size. The garbage collector is paused inside a
+    batch, as ``timeit`` does, so a collection triggered by an earlier case
+    does not land on this one.
+    """
+    fn()
+    start = clock()
+    fn()
+    once = clock() - start
+    loops = min(MAX_LOOPS, max(1, math.ceil(min_time / once))) if once > 0 else MAX_LOOPS
+    timings: list[float] = []
+    gc_was_enabled = gc.isenabled()
+    for _ in range(samples):
+        gc.disable()
+        try:
+            start = clock()
+            for _ in range(loops):
+                fn()
+            timings.append((clock() - start) / loops)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+    return CaseResult(name=name, loops=loops, samples=timings)
+
+
+# ---------------------------------------------------------------------------
+# Comparison
+# ---------------------------------------------------------------------------
+
+
+def mann_whitney_p(a: list[float], b: list[float]) -> float:
+    """Two-sided p-value of the Mann-Whitney U test (normal approximation)."""
+    n1, n2 = len(a), len(b)
+    if not n1 or not n2:
+        return 1.0
+    pooled = sorted([(v, 0) for v in a] + [(v, 1) for v in b])
+    n = n1 + n2
+    rank_a = 0.0
+    ties = 0.0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        rank = (i + j) / 2 + 1  # average rank of the tie block
+        rank_a += rank * sum(1 for k in range(i, j + 1) if pooled[k][1] == 0)
+        t = j - i + 1
+        ties += t**3 - t
+        i = j + 1
+    u = rank_a - n1 * (n1 + 1) / 2
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = max(abs(u - n1 * n2 / 2) - 0.5, 0.0) / math.sqrt(variance)
+    return min(1.0, math.erfc(z / math.sqrt(2)))
+
+
+@dataclass
+class Comparison:
+    name: str
+    baseline: float | None  # median seconds per call
+    current: float | None
+    p_value: float
+    verdict: str  # "slower" | "faster" | "same" | "new" | "removed"
+
+    @property
+    def ratio(self) -> float | None:
+        if not self.baseline or self.current is None:
+            return None
+        return self.current / self.baseline
+
+
+def compare_runs(
+    baseline: MicroRun,
+    current: MicroRun,
+    *,
+    alpha: float = DEFAULT_ALPHA,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Comparison]:
+    """Compare every case present in either run.
+
+    A case is ``slower``/``faster`` only when the U test rejects "same
+    distribution" at ``alpha`` and the median moved by more than
+    ``threshold`` — a statistically real 1 % shift is not worth failing on.
+    """
+    rows: list[Comparison] = []
+    for name in [*current.cases, *(n for n in baseline.cases if n not in current.cases)]:
+        old, new = baseline.cases.get(name), current.cases.get(name)
+        if old is None or new is None:
+            rows.append(
+                Comparison(
+                    name,
+                    old.median if old else None,
+                    new.median if new else None,
+                    1.0,
+                    "new" if old is None else "removed",
+                )
+            )
+            continue
+        p = mann_whitney_p(old.samples, new.samples)
+        ratio = new.median / old.median if old.median else 1.0
+        verdict = "same"
+        if p < alpha and ratio > 1 + threshold:
+            verdict = "slower"
+        elif p < alpha and ratio < 1 / (1 + threshold):
+            verdict = "faster"
+        rows.append(Comparison(name, old.median, new.median, p, verdict))
+    return rows
+
+
+def regressions(rows: list[Comparison]) -> list[Comparison]:
+    return [row for row in rows if row.verdict == "slower"]
+
+
+def environment_mismatch(baseline: MicroRun, current: MicroRun) -> list[str]:
+    """Environment keys that differ — timings across them are not comparable."""
+    keys = ("python", "implementation", "platform", "machine", "host")
+    return [
+        f"{key}: {baseline.environment.get(key, '?')} -> {current.environment.get(key, '?')}"
+        for key in keys
+        if baseline.environment.get(key) != current.environment.get(key)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Rendering
+# ---------------------------------------------------------------------------
+
+
+def format_seconds(seconds: float | None) -> str:
+    if seconds is None:
+        return "-"
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.1f} µs"
+
+
+def render_run(run: MicroRun) -> str:
+    lines = [f"{'case':<24} {'loops':>7} {'median':>11} {'iqr':>6}"]
+    for case in run.cases.values():
+        lines.append(
+            f"{case.name:<24} {case.loops:>7} {format_seconds(case.median):>11} {case.spread:>5.1%}"
+        )
+    return "\n".join(lines)
+
+
+def render_comparison(rows: list[Comparison]) -> str:
+    lines = [f"{'case':<24} {'baseline':>11} {'current':>11} {'change':>8} {'p':>7}  verdict"]
+    for row in rows:
+        ratio = row.ratio
+        change = f"{ratio - 1:+.1%}" if ratio is not None else "-"
+        lines.append(
+            f"{row.name:<24} {format_seconds(row.baseline):>11} "
+            f"{format_seconds(row.current):>11} {change:>8} {row.p_value:>7.4f}  {row.verdict}"
+        )
+    return "\n".join(lines)
@@ -25,6 +25,7 @@ CREATE TABLE IF NOT EXISTS spans (
 CREATE INDEX IF NOT EXISTS idx_spans_run_id          ON spans(run_id);
 CREATE INDEX IF NOT EXISTS idx_spans_parent          ON spans(run_id, parent_span_id);
 CREATE INDEX IF NOT EXISTS idx_spans_name_duration   ON spans(run_id, name, duration_ns DESC);
+CREATE INDEX IF NOT EXISTS idx_spans_started         ON spans(started_ns);
 
 CREATE TABLE IF NOT EXISTS events (
   event_id        INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -37,3 +38,18 @@ CREATE TABLE IF NOT EXISTS events (
 );
 
 CREATE INDEX IF NOT EXISTS idx_events_span ON events(span_id);
+
+-- Hourly per-route / per-query-fingerprint totals written by the
+-- production (sampled) tracer. Counted over every request, not just the
+-- sampled traces, and kept when the rolling store evicts old spans.
+CREATE TABLE IF NOT EXISTS rollups (
+  hour            TEXT NOT NULL,
+  run_id          TEXT NOT NULL,
+  kind            TEXT NOT NULL,
+  key             TEXT NOT NULL,
+  calls           INTEGER NOT NULL,
+  errors          INTEGER NOT NULL,
+  total_ns        INTEGER NOT NULL,
+  max_ns          INTEGER NOT NULL,
+  PRIMARY KEY (hour, run_id, kind, key)
+);
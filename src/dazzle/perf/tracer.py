@@ -22,6 +22,7 @@ which is only reached when tracing is explicitly requested.
 from __future__ import annotations
 
 import contextlib
+import dataclasses
 import logging
 import os
 from collections.abc import Iterator
@@ -68,6 +69,23 @@ _OBSERVABILITY_EXTRA_HINT = (
 _provider: TracerProvider | None = None
 
 
+@dataclasses.dataclass(frozen=True)
+class SamplingPolicy:
+    """Production tracing knobs — see :class:`~dazzle.perf.exporter.TailSamplingSpanProcessor`.
+
+    Attributes:
+        sample_rate: Fraction of traces kept regardless of outcome.
+        slow_ms: Traces whose root span took at least this long are kept.
+        max_bytes: Size budget of the rolling store's traces.
+        rollup_days: Days of hourly rollups kept.
+    """
+
+    sample_rate: float = 0.01
+    slow_ms: float = 1000.0
+    max_bytes: int = 256 * 1024 * 1024
+    rollup_days: int = 90
+
+
 def configure_tracer(
     *,
     run_id: str,
@@ -76,6 +94,7 @@ def configure_tracer(
     app_name: str | None = None,
     manifest_path: str | None = None,
     command_line: str = "",
+    sampling: SamplingPolicy | None = None,
 ) -> TracerProvider:
     """Initialise the global tracer provider to write to ``db_path``.
 
@@ -87,6 +106,9 @@ def configure_tracer(
             back inside the test body.
         app_name / manifest_path / command_line: Metadata persisted to
             the ``runs`` row.
+        sampling: Production mode — write sampled traces and hourly
+            rollups into a size-bounded store shared across processes
+            instead of every span into a per-run file. Always batched.
 
     Raises:
         RuntimeError: when the optional ``perf`` extra (opentelemetry)
@@ -102,18 +124,35 @@ def configure_tracer(
     except ModuleNotFoundError as exc:
         raise RuntimeError(_PERF_EXTRA_HINT) from exc
 
-    from dazzle.perf.exporter import SQLiteSpanExporter
+    from dazzle.perf.exporter import (
+        RollingSpanExporter,
+        SQLiteSpanExporter,
+        TailSamplingSpanProcessor,
+    )
 
     global _provider
     provider = TracerProvider()
-    exporter = SQLiteSpanExporter(
-        db_path=db_path,
-        run_id=run_id,
-        app_name=app_name,
-        manifest_path=manifest_path,
-        command_line=command_line,
-    )
-    processor: Any = BatchSpanProcessor(exporter) if batch else SimpleSpanProcessor(exporter)
+    run_meta: dict[str, Any] = {
+        "db_path": db_path,
+        "run_id": run_id,
+        "app_name": app_name,
+        "manifest_path": manifest_path,
+        "command_line": command_line,
+    }
+    processor: Any
+    if sampling is not None:
+        rolling = RollingSpanExporter(
+            max_bytes=sampling.max_bytes, rollup_days=sampling.rollup_days, **run_meta
+        )
+        processor = TailSamplingSpanProcessor(
+            BatchSpanProcessor(rolling),
+            sample_rate=sampling.sample_rate,
+            slow_ms=sampling.slow_ms,
+            rollup_sink=rolling.write_rollups,
+        )
+    else:
+        exporter = SQLiteSpanExporter(**run_meta)
+        processor = BatchSpanProcessor(exporter) if batch else SimpleSpanProcessor(exporter)
     provider.add_span_processor(processor)
     # OTLP push branch (#1192 slice 2). Additive — does not touch the
     # local SQLite processor above. The env-var check stays inside this
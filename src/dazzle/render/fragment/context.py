@@ -27,10 +27,15 @@ class RenderContext:
             CSP get nonce injection without per-primitive plumbing.
             Stays ``None`` for projects with no CSP layer; the
             renderer emits plain ``<script>`` tags in that case.
+        streamed_slots: Set by ``FragmentRenderer.render_stream``. When a
+            list, each ``Slot`` renders as a placeholder and its name is
+            appended in emit order; ``None`` (every other render) keeps an
+            unfilled ``Slot`` a hard error.
     """
 
     tokens: Tokens = field(default_factory=Tokens)
     csp_nonce: str | None = None
+    streamed_slots: list[str] | None = None
 
     def escape(self, text: str) -> str:
         """HTML-escape text content (between tags). Does NOT escape quotes —
@@ -55,13 +55,13 @@ def _format_link_value(value: Any) -> str:
     return str(value)
 
 
-def _item_format_map(item: dict[str, Any]) -> dict[str, str]:
-    """Build a format mapping for one row (skip null / unwrappable values)."""
+class _NullMap(dict[str, str]):
+    def __missing__(self, key: str) -> str:
+        raise KeyError(key)
 
-    class _NullMap(dict[str, str]):
-        def __missing__(self, key: str) -> str:
-            raise KeyError(key)
 
+def _item_format_map(item: dict[str, Any]) -> dict[str, str]:
+    """Build a format mapping for one row (skip null / unwrappable values)."""
     mapping = _NullMap()
     for k, v in item.items():
         if v is None:
@@ -14,6 +14,7 @@ byte-for-byte by `tests/unit/test_data_row_characterization_1505.py`.
 
 import html as _html_mod
 import re
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Any
@@ -221,186 +222,538 @@ def _json_summary(value: Any, *, max_pairs: int = 4, length: int = 80) -> str:
     return text[:length] + "…" if len(text) > length else text
 
 
-def _render_cell_display(
-    col: dict[str, Any],
-    value: Any,
-    *,
-    truncate: bool = True,
-    entity_name: str = "",
-    record_id: str = "",
-) -> str:
-    """Render the display-mode value for one table cell.
+# A compiled display-mode formatter for one column: `(value, entity_name,
+# record_id) -> html`. Chosen once per column by `_compile_cell_display`, so a
+# row never re-dispatches on the column type string.
+_CellDisplay = Callable[[Any, str, str], str]
 
-    Mirrors the type-dispatch in `table_rows.html` (badge / bool /
-    date / datetime / number / json / currency / sensitive / ref /
-    percentage / text default). #1491 1d: datetime/number/json are
-    humanised at the core so detail views (which feed the cell core
-    form-typed values) stop leaking raw ISO / `True` / full-precision
-    floats / mangled JSON.
+_EMPTY_VALUES = (None, "", "—")
 
-    ``truncate`` is consulted ONLY by the default text branch (#1533):
-    list cells clip prose to a scannable width; a detail page's whole
-    job is the full record, so its seam passes ``truncate=False`` and
-    the value renders whole in a ``dz-detail-text`` wrapper
-    (``white-space: pre-wrap`` — textarea paragraphs survive). Every
-    typed branch above the default is identical in both modes.
-    """
 
-    col_type = str(col.get("type", "") or "")
-    # Explicit `format:` override from the surface field wins over inference
-    # (#1470 Phase 2). List rows previously ignored format_kind and only the
-    # related-group path called format_cell.
-    format_kind = str(col.get("format_kind", "") or "")
-    if format_kind:
-        raw = format_cell(
-            value,
-            col_type or "text",
-            currency_code=str(col.get("currency_code", "") or ""),
-            override=ResolvedFormat(format_kind, col.get("format_arg") or None),
-        )
-        return _html_mod.escape(raw, quote=False)
+def _esc(text: str) -> str:
+    return _html_mod.escape(text, quote=False)
+
+
+def _cell_datetime(value: Any, _entity: str, _record: str) -> str:
     # #1491 1d: an empty value renders the em-dash placeholder for the humanised
     # types — a null `number` must NOT fabricate "0" and a null `json` must NOT
     # leak "None" (the detail seam guards upstream; list rows reach here directly).
-    if col_type in ("datetime", "number", "json") and value in (None, "", "—"):
+    if value in _EMPTY_VALUES:
         return "—"
-    if col_type == "datetime":
-        # #1597: DisplayLocaleProfile (tenant TZ + date_format), not hard UK
-        return _html_mod.escape(format_cell(value, "datetime"), quote=False)
-    if col_type == "number":
-        return _html_mod.escape(_metric_number_filter(value), quote=False)
-    if col_type == "json":
-        return _html_mod.escape(_json_summary(value), quote=False)
-    if col_type == "badge":
-        if value in (None, "", "—"):
-            return '<span class="dz-badge-empty" aria-label="No status">—</span>'
-        # #1493 slice 2: a declared `semantic:` binding (col["semantic_map"]) wins
-        # over the spelling-based name guess; None/empty → byte-identical default.
+    # #1597: DisplayLocaleProfile (tenant TZ + date_format), not hard UK
+    return _esc(format_cell(value, "datetime"))
+
+
+def _cell_number(value: Any, _entity: str, _record: str) -> str:
+    if value in _EMPTY_VALUES:
+        return "—"
+    return _esc(_metric_number_filter(value))
+
+
+def _cell_json(value: Any, _entity: str, _record: str) -> str:
+    if value in _EMPTY_VALUES:
+        return "—"
+    return _esc(_json_summary(value))
+
+
+def _cell_bool(value: Any, _entity: str, _record: str) -> str:
+    # `_bool_icon_filter` returns Markup with raw HTML — safe to emit.
+    return str(_bool_icon_filter(value))
+
+
+def _cell_date(value: Any, _entity: str, _record: str) -> str:
+    return _esc(format_cell(value, "date"))
+
+
+def _cell_bytes(value: Any, _entity: str, _record: str) -> str:
+    return _esc(format_cell(value, "bytes"))
+
+
+def _cell_color(value: Any, _entity: str, _record: str) -> str:
+    # #1626 R5 / P0-8 — swatch + hex (not bare text) for palette fields.
+    return _render_color_swatch_html(value)
+
+
+def _cell_sensitive(value: Any, _entity: str, _record: str) -> str:
+    raw = "" if value is None else str(value)
+    if len(raw) > 4:
+        return f"****{_esc(raw[-4:])}"
+    if raw:
+        return "****"
+    return ""
+
+
+def _cell_or_dash(render: Callable[[Any], str]) -> _CellDisplay:
+    """Adapt a clerk cell renderer that returns "" for unrenderable values."""
+
+    def _display(value: Any, _entity: str, _record: str) -> str:
+        html = render(value)
+        return html if html else "—"
+
+    return _display
+
+
+def _text_inner(value: Any, truncate: bool) -> str:
+    # Default text cell. #1491 1d: a dict/list value (an unmapped `json` field,
+    # e.g. a `text`-typed column over JSON data) is summarised rather than routed
+    # through `_truncate_filter` → `_ref_display_name`, which mangles a dict down
+    # to one arbitrary value. A float is rounded rather than leaking full binary
+    # precision.
+    if isinstance(value, (dict, list, tuple)):
+        return _json_summary(value)
+    if isinstance(value, float):
+        return _metric_number_filter(value)
+    if truncate:
+        return _truncate_filter(value or "")
+    return str(value or "")
+
+
+def _temporal_text(value: Any) -> str | None:
+    # Defensive temporal humanisation: when a column is mistyped as `text`
+    # (e.g. list-projection views that declare every field as text) but the
+    # value is clearly an ISO date/datetime (incl. Postgres timestamptz with
+    # microseconds), format via DisplayLocaleProfile instead of leaking raw ISO.
+    if isinstance(value, datetime):
+        return _esc(format_cell(value, "datetime"))
+    if isinstance(value, date):
+        return _esc(format_cell(value, "date"))
+    if isinstance(value, str):
+        s = value.strip()
+        if _ISO_DT_RE.match(s):
+            return _esc(format_cell(s, "datetime"))
+        if _ISO_DATE_RE.match(s):
+            return _esc(format_cell(s, "date"))
+    return None
+
+
+def _cell_text(value: Any, _entity: str, _record: str) -> str:
+    temporal = _temporal_text(value)
+    if temporal is not None:
+        return temporal
+    return f'<span class="dz-tr-cell-truncate">{_esc(_text_inner(value, True))}</span>'
+
+
+def _cell_detail_text(value: Any, _entity: str, _record: str) -> str:
+    temporal = _temporal_text(value)
+    if temporal is not None:
+        return temporal
+    return f'<span class="dz-detail-text">{_esc(_text_inner(value, False))}</span>'
 
-        tone = resolve_status_tone(value, col.get("semantic_map"))
+
+def _badge_display(col: dict[str, Any]) -> _CellDisplay:
+    # #1493 slice 2: a declared `semantic:` binding (col["semantic_map"]) wins
+    # over the spelling-based name guess; None/empty → byte-identical default.
+    semantic_map = col.get("semantic_map")
+
+    def _display(value: Any, _entity: str, _record: str) -> str:
+        if value in _EMPTY_VALUES:
+            return '<span class="dz-badge-empty" aria-label="No status">—</span>'
+        tone = resolve_status_tone(value, semantic_map)
         label = str(value).replace("_", " ").title()
         # #1493 slice 2 part 3: WCAG colour+icon+text (neutral → "" = unchanged).
         icon = badge_icon_html(tone)
         return (
             f'<span class="dz-badge" data-dz-tone="{_html_mod.escape(tone, quote=True)}" '
             f'role="status" aria-label="Status: {_html_mod.escape(label, quote=True)}">'
-            f"{icon}{_html_mod.escape(label, quote=False)}</span>"
+            f"{icon}{_esc(label)}</span>"
         )
-    if col_type == "bool":
-        # `_bool_icon_filter` returns Markup with raw HTML — safe to emit.
-        return str(_bool_icon_filter(value))
-    if col_type == "date":
-        return _html_mod.escape(format_cell(value, "date"), quote=False)
-    if col_type in ("currency", "money"):
-        currency_code = col.get("currency_code") or "GBP"
-        return _html_mod.escape(_currency_filter(value, currency_code), quote=False)
-    if col_type == "color":
-        # #1626 R5 / P0-8 — swatch + hex (not bare text) for palette fields.
-        return _render_color_swatch_html(value)
-    if col_type == "image":
-        # Goal B media — logo/preview thumbs (safe https only).
-        return _render_media_thumb_html(value, alt=str(col.get("label") or col.get("key") or ""))
-    if col_type == "sensitive":
-        raw = "" if value is None else str(value)
-        if len(raw) > 4:
-            return f"****{_html_mod.escape(raw[-4:], quote=False)}"
-        if raw:
-            return "****"
-        return ""
-    if col_type == "ref":
-        # Prefer explicit `_display` column; otherwise resolve the dict.
-        # Person-like refs (User, assigned_to, …) emit Avatar hyperpart chip
-        # by default (``dazzle.render.user_chip``); opt-out via avatar:false.
-        explicit = ""
-        # The caller supplies the row item; the column-level display
-        # column key is `<col.key>_display` per legacy convention. Look
-        # up the original `value` and the explicit pair.
+
+    return _display
+
+
+def _currency_display(col: dict[str, Any]) -> _CellDisplay:
+    currency_code = col.get("currency_code") or "GBP"
+
+    def _display(value: Any, _entity: str, _record: str) -> str:
+        return _esc(_currency_filter(value, currency_code))
+
+    return _display
+
+
+def _image_display(col: dict[str, Any]) -> _CellDisplay:
+    # Goal B media — logo/preview thumbs (safe https only).
+    alt = str(col.get("label") or col.get("key") or "")
+
+    def _display(value: Any, _entity: str, _record: str) -> str:
+        return _render_media_thumb_html(value, alt=alt)
+
+    return _display
+
+
+def _ref_display(col: dict[str, Any]) -> _CellDisplay:
+    # Person-like refs (User, assigned_to, …) emit Avatar hyperpart chip by
+    # default (``dazzle.render.user_chip``); opt-out via avatar:false. The
+    # explicit `<key>_display` column is the row caller's concern.
+    def _display(value: Any, _entity: str, _record: str) -> str:
         if looks_like_person_ref(value if value is not None else {}, col):
             chip = render_user_chip_linked_html(value, col)
             if chip:
                 return chip
         if isinstance(value, dict):
-            return _html_mod.escape(_ref_display_name(value), quote=False)
-        return _html_mod.escape(explicit or str(value or ""), quote=False)
-    if col_type in ("percentage", "percent_points"):
+            return _esc(_ref_display_name(value))
+        return _esc(str(value or ""))
+
+    return _display
+
+
+def _percent_display(col: dict[str, Any]) -> _CellDisplay:
+    key = col.get("key")
+
+    def _display(value: Any, _entity: str, _record: str) -> str:
         if value is None:
             return "—"
-        return _html_mod.escape(
-            clerk_percent_points_display(value, col.get("key"), typed=True), quote=False
-        )
-    if col_type == "bytes":
-        return _html_mod.escape(format_cell(value, "bytes"), quote=False)
-    if col_type == "tags":
-        html = clerk_tags_cell_html(value)
-        return html if html else "—"
-    if col_type == "rating":
-        html = clerk_rating_cell_html(value)
-        return html if html else "—"
-    if col_type == "email":
-        html = clerk_email_cell_html(value)
-        return html if html else "—"
-    if col_type == "phone":
-        html = clerk_phone_cell_html(value)
-        return html if html else "—"
-    if col_type == "temperature":
-        html = clerk_temperature_cell_html(value, col.get("key"))
-        return html if html else "—"
-    if col_type == "iban":
-        html = clerk_iban_cell_html(value)
-        return html if html else "—"
-    if col_type == "file":
-        # ADR-0049 Phase 2 / #1551: file fields render a download link via the
-        # scope-gated document route. ``entity_name`` + ``record_id`` are
-        # threaded from the row caller (``_render_table_row``); callers that
-        # don't have that context (e.g. the detail-view seam) fall back to the
-        # raw stored value as the href.
-        if value in (None, "", "—"):
+        return _esc(clerk_percent_points_display(value, key, typed=True))
+
+    return _display
+
+
+def _temperature_display(col: dict[str, Any]) -> _CellDisplay:
+    key = col.get("key")
+    return _cell_or_dash(lambda value: clerk_temperature_cell_html(value, key))
+
+
+def _file_display(col: dict[str, Any]) -> _CellDisplay:
+    # ADR-0049 Phase 2 / #1551: file fields render a download link via the
+    # scope-gated document route. ``entity_name`` + ``record_id`` are threaded
+    # from the row caller (``_render_table_row``); callers that don't have that
+    # context (e.g. the detail-view seam) fall back to the raw stored value as
+    # the href.
+    col_key = str(col.get("key", ""))
+
+    def _display(value: Any, entity_name: str, record_id: str) -> str:
+        if value in _EMPTY_VALUES:
             return "—"
         if entity_name and record_id:
-            col_key = str(col.get("key", ""))
             url = f"/_dazzle/documents/{entity_name}/{record_id}/{col_key}/file"
             href = _html_mod.escape(url, quote=True)
         else:
             href = _html_mod.escape(str(value), quote=True)
-        label = _html_mod.escape(str(_basename_or_url_filter(value)), quote=False)
+        label = _esc(str(_basename_or_url_filter(value)))
         return (
             f'<a href="{href}" target="_blank" rel="noopener" class="dz-detail-file-link">'
             f"{label}</a>"
         )
-    # Default text cell — truncated. #1491 1d: a dict/list value (an unmapped
-    # `json` field, e.g. a `text`-typed column over JSON data) is summarised
-    # rather than routed through `_truncate_filter` → `_ref_display_name`, which
-    # mangles a dict down to one arbitrary value. A float is rounded rather than
-    # leaking full binary precision.
-    #
-    # Defensive temporal humanisation: when a column is mistyped as `text`
-    # (e.g. list-projection views that declare every field as text) but the
-    # value is clearly an ISO date/datetime (incl. Postgres timestamptz with
-    # microseconds), format via DisplayLocaleProfile instead of leaking raw ISO.
-    if isinstance(value, datetime):
-        return _html_mod.escape(format_cell(value, "datetime"), quote=False)
-    if isinstance(value, date):
-        return _html_mod.escape(format_cell(value, "date"), quote=False)
-    if isinstance(value, str):
-        s = value.strip()
-        if _ISO_DT_RE.match(s):
-            return _html_mod.escape(format_cell(s, "datetime"), quote=False)
-        if _ISO_DATE_RE.match(s):
-            return _html_mod.escape(format_cell(s, "date"), quote=False)
-    if isinstance(value, (dict, list, tuple)):
-        inner = _json_summary(value)
-    elif isinstance(value, float):
-        inner = _metric_number_filter(value)
-    elif truncate:
-        inner = _truncate_filter(value or "")
+
+    return _display
+
+
+def _format_override_display(col: dict[str, Any], col_type: str) -> _CellDisplay:
+    # Explicit `format:` override from the surface field wins over inference
+    # (#1470 Phase 2). List rows previously ignored format_kind and only the
+    # related-group path called format_cell.
+    value_type = col_type or "text"
+    currency_code = str(col.get("currency_code", "") or "")
+    override = ResolvedFormat(str(col["format_kind"]), col.get("format_arg") or None)
+
+    def _display(value: Any, _entity: str, _record: str) -> str:
+        return _esc(format_cell(value, value_type, currency_code=currency_code, override=override))
+
+    return _display
+
+
+# Column types whose display depends only on the value.
+_CELL_DISPLAYS: dict[str, _CellDisplay] = {
+    "datetime": _cell_datetime,
+    "number": _cell_number,
+    "json": _cell_json,
+    "bool": _cell_bool,
+    "date": _cell_date,
+    "color": _cell_color,
+    "sensitive": _cell_sensitive,
+    "bytes": _cell_bytes,
+    "tags": _cell_or_dash(clerk_tags_cell_html),
+    "rating": _cell_or_dash(clerk_rating_cell_html),
+    "email": _cell_or_dash(clerk_email_cell_html),
+    "phone": _cell_or_dash(clerk_phone_cell_html),
+    "iban": _cell_or_dash(clerk_iban_cell_html),
+}
+
+# Column types whose display binds column options (semantic map, currency, key, …).
+_CELL_DISPLAY_FACTORIES: dict[str, Callable[[dict[str, Any]], _CellDisplay]] = {
+    "badge": _badge_display,
+    "currency": _currency_display,
+    "money": _currency_display,
+    "image": _image_display,
+    "ref": _ref_display,
+    "percentage": _percent_display,
+    "percent_points": _percent_display,
+    "temperature": _temperature_display,
+    "file": _file_display,
+}
+
+
+def _compile_cell_display(col: dict[str, Any], *, truncate: bool = True) -> _CellDisplay:
+    """Resolve one column's display formatter — type dispatch, badge / ref
+    handling and `format_cell` options — once, ahead of the rows."""
+    col_type = str(col.get("type", "") or "")
+    if col.get("format_kind"):
+        return _format_override_display(col, col_type)
+    fixed = _CELL_DISPLAYS.get(col_type)
+    if fixed is not None:
+        return fixed
+    factory = _CELL_DISPLAY_FACTORIES.get(col_type)
+    if factory is not None:
+        return factory(col)
+    return _cell_text if truncate else _cell_detail_text
+
+
+def _render_cell_display(
+    col: dict[str, Any],
+    value: Any,
+    *,
+    truncate: bool = True,
+    entity_name: str = "",
+    record_id: str = "",
+) -> str:
+    """Render the display-mode value for one table cell.
+
+    Mirrors the type-dispatch in `table_rows.html` (badge / bool /
+    date / datetime / number / json / currency / sensitive / ref /
+    percentage / text default). #1491 1d: datetime/number/json are
+    humanised at the core so detail views (which feed the cell core
+    form-typed values) stop leaking raw ISO / `True` / full-precision
+    floats / mangled JSON.
+
+    ``truncate`` is consulted ONLY by the default text branch (#1533):
+    list cells clip prose to a scannable width; a detail page's whole
+    job is the full record, so its seam passes ``truncate=False`` and
+    the value renders whole in a ``dz-detail-text`` wrapper
+    (``white-space: pre-wrap`` — textarea paragraphs survive). Every
+    typed branch above the default is identical in both modes.
+
+    One-off entry for single values (the detail seam); list rows use the
+    formatter compiled into the table's render plan instead.
+    """
+    return _compile_cell_display(col, truncate=truncate)(value, entity_name, record_id)
+
+
+@dataclass(frozen=True, slots=True)
+class _CellPlan:
+    """One visible column, resolved for every row of its table: the escaped
+    `<td>` opening, the compiled display formatter and — when the column is
+    inline-editable — the editor kind/label/options."""
+
+    col: dict[str, Any]
+    key: str
+    td_open: str
+    display: _CellDisplay
+    is_ref: bool
+    display_key: str
+    edit_kind: str = ""  # "" = not inline-editable
+    edit_label: str = ""
+    edit_options: Any = None
+
+
+@dataclass(frozen=True, slots=True)
+class _TablePlan:
+    """Everything about a data-table row that does not depend on the row's
+    item, compiled once per table by `_compile_table_plan`. The row renderer
+    only reads it, so one plan serves every row (and every request, via
+    `_PLAN_CACHE`)."""
+
+    cells: tuple[_CellPlan, ...]
+    entity_name: str
+    entity_name_attr: str
+    entity_name_lower_text: str
+    api_endpoint_attr: str
+    row_label_key: str
+    bulk_actions: bool
+    can_delete: bool
+    can_update: bool
+    detail_url_template: str
+    detail_url_candidates: tuple[str, ...]
+    detail_url_fallback_template: str
+    peek_expand: bool
+    peek_slide: bool
+    slideover_content_attr: str
+    slideover_panel_attr: str
+    state_transitions: tuple[Any, ...]
+    status_field: str
+    transition_endpoint: str
+
+
+# Inline-edit editor kind per column type; anything else edits as text.
+_EDIT_KINDS = {
+    "bool": "bool",
+    "badge": "select",
+    "date": "date",
+    "datetime": "time",
+    "time": "time",
+    "number": "number",
+}
+
+
+def _compile_cell_plan(col: dict[str, Any], inline_editable: frozenset[str]) -> _CellPlan:
+    col_key = str(col.get("key", ""))
+    col_type = str(col.get("type", "") or "")
+    cell_classes = "dz-tr-cell"
+    if col_type in ("currency", "percentage"):
+        cell_classes += " is-numeric"
+    # C2.1: no per-cell visibility binding — dz-grid-cols.js projects the
+    # hidden set onto [data-dz-col] cells after every swap.
+    # #1592 / #1598: data cells must NOT stopPropagation. C2.3 marks nearly
+    # every text|bool|badge|date|datetime column inline-editable, but grid
+    # edit opens on **dblclick** (dz-grid-edit.js) — a single click must
+    # bubble to the row's hx-get drill. stopPropagation stays on checkbox +
+    # actions cells only (and on the active editor element when open).
+    td_open = (
+        f'<td data-dz-col="{_html_mod.escape(col_key, quote=True)}" '  # nosemgrep
+        f'class="{cell_classes}">'
+    )
+    edit_kind = ""
+    options = None
+    if col_key in inline_editable:
+        edit_kind = _EDIT_KINDS.get(col_type, "text")
+        # A select editor with zero options was never usable — degrade to
+        # text before the model (which forbids optionless selects) sees it.
+        if edit_kind == "select" and not col.get("filter_options"):
+            edit_kind = "text"
+        if edit_kind == "select":
+            options = col.get("filter_options") or None
+    return _CellPlan(
+        col=col,
+        key=col_key,
+        td_open=td_open,
+        display=_compile_cell_display(col),
+        is_ref=col_type == "ref",
+        display_key=f"{col_key}_display",
+        edit_kind=edit_kind,
+        edit_label=str(col.get("label", col_key)),
+        edit_options=options,
+    )
+
+
+def _compile_cell_plans(
+    columns: list[dict[str, Any]], inline_editable: Any
+) -> tuple[_CellPlan, ...]:
+    editable = frozenset(inline_editable or ())
+    return tuple(_compile_cell_plan(col, editable) for col in columns if not col.get("hidden"))
+
+
+def _row_label_key(columns: list[dict[str, Any]]) -> str:
+    # Row label: first non-{ref,badge,bool,currency} column else id; ref dicts
+    # resolve via `_ref_display_name`.
+    for col in columns:
+        if col.get("type") not in ("ref", "badge", "bool", "currency"):
+            return str(col.get("key", "id"))
+    return "id"
+
+
+def _compile_table_plan(table: Mapping[str, Any]) -> _TablePlan:
+    """Resolve the row-invariant half of `_render_table_row` for one table."""
+    columns = table.get("columns") or []
+    entity_name = str(table.get("entity_name") or "Item")
+    # Mutation affordances — default True for fixtures without RBAC. List
+    # transport sets False when permit denies delete/update for this principal
+    # (humanqa: anon trash + hx-confirm still removed the painted row).
+    can_update = bool(table.get("can_update", True))
+
+    candidates = table.get("detail_url_candidates") or ()
+    if isinstance(candidates, str):
+        candidates = (candidates,)
+    # #1494 (2c): the row-peek chevron. `peek: expand` toggles a hidden *sibling
+    # panel row* in place; `peek: slide_over` loads the same detail body into the
+    # one shared right-side `SlideOver` panel for this list and reveals it. Only
+    # `off`/unset rows stay byte-identical to pre-#1494 (no chevron emitted).
+    peek_mode = str(table.get("peek_mode") or "").strip()
+    table_id = str(table.get("table_id") or "")
+    return _TablePlan(
+        cells=_compile_cell_plans(columns, table.get("inline_editable")),
+        entity_name=entity_name,
+        entity_name_attr=_html_mod.escape(entity_name, quote=True),
+        entity_name_lower_text=_esc(entity_name.lower()),
+        api_endpoint_attr=_html_mod.escape(str(table.get("api_endpoint", "") or ""), quote=True),
+        row_label_key=_row_label_key(columns),
+        bulk_actions=bool(table.get("bulk_actions")),
+        can_delete=bool(table.get("can_delete", True)),
+        can_update=can_update,
+        detail_url_template=str(table.get("detail_url_template") or ""),
+        detail_url_candidates=tuple(candidates),
+        detail_url_fallback_template=str(table.get("detail_url_fallback_template") or ""),
+        peek_expand=peek_mode == "expand",
+        peek_slide=peek_mode == "slide_over",
+        slideover_content_attr=_html_mod.escape(slideover_content_id(table_id), quote=True),
+        slideover_panel_attr=_html_mod.escape(slideover_panel_id(table_id), quote=True),
+        state_transitions=tuple(table.get("state_transitions") or ()) if can_update else (),
+        status_field=str(table.get("status_field") or ""),
+        transition_endpoint=str(table.get("transition_endpoint") or ""),
+    )
+
+
+def _ref_cell_html(
+    cell: _CellPlan, item: Mapping[str, Any], cell_value: Any, entity_name: str, item_id: str
+) -> str:
+    # For ref columns, prefer an explicit `<key>_display` value the
+    # relation loader may have injected, else resolve via dict shape.
+    # Person-like refs still emit Avatar chips when only a display string
+    # is present (cycle 1363: do not short-circuit past user_chip).
+    explicit = item.get(cell.display_key)
+    chip_probe = (
+        cell_value if isinstance(cell_value, dict) else {"name": str(explicit or cell_value or "")}
+    )
+    if looks_like_person_ref(chip_probe if chip_probe is not None else {}, cell.col):
+        if isinstance(cell_value, dict):
+            chip_val: Any = cell_value
+        elif explicit not in (None, ""):
+            chip_val = {"name": str(explicit), "id": cell_value}
+        else:
+            chip_val = cell_value
+        # Linked when ref_route present (parity with workspace region path).
+        chip = render_user_chip_linked_html(chip_val, cell.col)
+        return chip if chip else _esc(str(explicit or cell_value or ""))
+    if explicit not in (None, ""):
+        return _esc(str(explicit))
+    return cell.display(cell_value, entity_name, item_id)
+
+
+def _edit_cell_html(cell: _CellPlan, cell_value: Any, display_html: str) -> str:
+    # Convergence C2.3: the CELL owns its edit affordance — one seam
+    # span carrying everything the delegated dz-grid-edit.js extension
+    # needs (kind / raw value / select options / a11y label). No
+    # Alpine templates; the editor input is built by the controller
+    # and the typed buffer lives on the grid root, out of the morph
+    # path.
+    if cell.edit_kind == "bool":
+        raw = "true" if cell_value else "false"
     else:
-        inner = str(value or "")
-    if not truncate:
-        return f'<span class="dz-detail-text">{_html_mod.escape(inner, quote=False)}</span>'
-    return f'<span class="dz-tr-cell-truncate">{_html_mod.escape(inner, quote=False)}</span>'
+        raw = "" if cell_value is None else str(cell_value)
+    # #1573 closure: ONE ingestion boundary — the model's validator
+    # normalises the three producer shapes (dict/tuple/bare string);
+    # emission is derived from the model (see fragment/ingest.py for
+    # the contract source-of-truth pointer).
+    cell_model = GridEditCell(
+        col=cell.key,
+        kind=cell.edit_kind,  # type: ignore[arg-type]
+        value=raw,
+        label=cell.edit_label,
+        options=cell.edit_options,
+    )
+    title_attr = ""
+    if cell_value is not None:
+        title_attr = f' title="{_html_mod.escape(str(cell_value), quote=True)}"'
+    return (
+        f'<span class="dz-tr-cell-display" '
+        f"{edit_span_attrs(cell_model)}{title_attr}>{display_html}</span>"
+    )
+
+
+def _render_data_cells(plan: _TablePlan, item: Mapping[str, Any], item_id: str) -> list[str]:
+    """The row's data `<td>`s, driven entirely by the compiled cell plans."""
+    entity_name = plan.entity_name
+    cell_parts: list[str] = []
+    for cell in plan.cells:
+        cell_value = item.get(cell.key)
+        if cell.is_ref:
+            display_html = _ref_cell_html(cell, item, cell_value, entity_name, item_id)
+        else:
+            display_html = cell.display(cell_value, entity_name, item_id)
+        if cell.edit_kind:
+            display_html = _edit_cell_html(cell, cell_value, display_html)
+        cell_parts.append(f"{cell.td_open}{display_html}</td>")
+    return cell_parts
 
 
-def _render_table_row(table: dict[str, Any], item: dict[str, Any]) -> str:
+def _render_table_row(table: "dict[str, Any] | _TablePlan", item: dict[str, Any]) -> str:
     """Inline mirror of `fragments/table_rows.html`'s row branch (v0.67.68).
 
     Emits the `<tr>` for one row including:
@@ -408,45 +761,28 @@ def _render_table_row(table: dict[str, Any], item: dict[str, Any]) -> str:
       - optional checkbox cell when `bulk_actions` is set
       - per-column data cells (inline-editable + display dispatch)
       - hover row-action buttons (view / edit / delete)
+
+    `table` is either the legacy table dict (compiled here, for one row) or
+    a `_TablePlan` already compiled for the whole table.
     """
 
-    columns = table.get("columns") or []
-    bulk_actions = bool(table.get("bulk_actions"))
-    detail_url_template = table.get("detail_url_template") or ""
-    entity_name = str(table.get("entity_name") or "Item")
-    entity_name_attr = _html_mod.escape(entity_name, quote=True)
-    entity_name_lower = entity_name.lower()
-    api_endpoint = _html_mod.escape(str(table.get("api_endpoint", "") or ""), quote=True)
-    inline_editable = set(table.get("inline_editable") or [])
-    # Mutation affordances — default True for fixtures without RBAC. List
-    # transport sets False when permit denies delete/update for this principal
-    # (humanqa: anon trash + hx-confirm still removed the painted row).
-    can_delete = bool(table.get("can_delete", True))
-    can_update = bool(table.get("can_update", True))
+    plan = table if isinstance(table, _TablePlan) else _compile_table_plan(table)
+    bulk_actions = plan.bulk_actions
+    detail_url_template = plan.detail_url_template
+    entity_name_attr = plan.entity_name_attr
+    can_update = plan.can_update
 
     item_id = str(item.get("id", "") or "")
     item_id_attr = _html_mod.escape(item_id, quote=True)
 
-    # Row label: first non-{ref,badge,bool,currency} column else id; ref dicts
-    # resolve via `_ref_display_name`.
-    row_label_key = "id"
-    for col in columns:
-        if col.get("type") not in ("ref", "badge", "bool", "currency"):
-            row_label_key = col.get("key", "id")
-            break
-    raw_label = item.get(row_label_key, item.get("id", ""))
+    raw_label = item.get(plan.row_label_key, item.get("id", ""))
     if isinstance(raw_label, dict):
         raw_label = _ref_display_name(raw_label)
     row_label = _html_mod.escape(str(raw_label or ""), quote=False)
     row_label_attr = _html_mod.escape(str(raw_label or ""), quote=True)
 
-    # #1494 (2c): the row-peek chevron. `peek: expand` toggles a hidden *sibling
-    # panel row* in place; `peek: slide_over` loads the same detail body into the
-    # one shared right-side `SlideOver` panel for this list and reveals it. Only
-    # `off`/unset rows stay byte-identical to pre-#1494 (no chevron emitted).
-    peek_mode = str(table.get("peek_mode") or "").strip()
-    peek_expand = peek_mode == "expand"
-    peek_slide = peek_mode == "slide_over"
+    peek_expand = plan.peek_expand
+    peek_slide = plan.peek_slide
     peek_toggle_html = ""
 
     drill_attrs = ""
@@ -455,25 +791,22 @@ def _render_table_row(table: dict[str, Any], item: dict[str, Any]) -> str:
     # #1603: substitute all placeholders ({id}, {contact}, {assigned_to}, …)
     # via the shared format_map helper. #1614: null open-via FK falls back to
     # same-entity detail so the row keeps hx-trigger=click (shields #1613).
-    fallback_tmpl = str(table.get("detail_url_fallback_template") or "")
-    candidates = table.get("detail_url_candidates") or ()
-    if isinstance(candidates, str):
-        candidates = (candidates,) if candidates else ()
+    fallback_tmpl = plan.detail_url_fallback_template
+    candidates = plan.detail_url_candidates
     # (url, via_field) pairs — cycle 1577 retains via for relation-aware labels.
     open_chain: tuple[tuple[str, str], ...] = ()
     if detail_url_template or candidates:
-        cand_t = tuple(candidates) if candidates else ()
         _links = _resolve_row_links(
             [item],
-            str(detail_url_template or ""),
+            detail_url_template,
             fallback_template=fallback_tmpl,
-            candidate_templates=cand_t,
+            candidate_templates=candidates,
         )
         detail_url = _links[0] if _links else None
         open_chain = _resolve_row_open_chain(
             item,
-            candidate_templates=cand_t,
-            detail_url_template=str(detail_url_template or ""),
+            candidate_templates=candidates,
+            detail_url_template=detail_url_template,
             fallback_template=fallback_tmpl,
         )
     else:
@@ -565,10 +898,9 @@ def _render_table_row(table: dict[str, Any], item: dict[str, Any]) -> str:
             # <dialog> via the HM dz-dialog.js opener (data-dz-dialog-open
             # names the dialog id — Tier F2; replaces the inline hx-on
             # hidden-toggle). Close is the dialog's own (form/Esc/backdrop).
-            table_id = str(table.get("table_id") or "")
             slide_url_attr = _html_mod.escape(f"{detail_url}?peek=1", quote=True)
-            content_target = _html_mod.escape(slideover_content_id(table_id), quote=True)
-            panel_attr = _html_mod.escape(slideover_panel_id(table_id), quote=True)
+            content_target = plan.slideover_content_attr
+            panel_attr = plan.slideover_panel_attr
             peek_toggle_html = (
                 f'<button type="button" '  # nosemgrep
                 f'class="dz-tr-action dz-tr-peek-toggle" '
@@ -700,123 +1032,20 @@ def _render_table_row(table: dict[str, Any], item: dict[str, Any]) -> str:
             f'aria-label="Select {row_label_attr}" /></td>'
         )
 
-    # Data cells.
-    cell_parts: list[str] = []
-    for col in columns:
-        if col.get("hidden"):
-            continue
-        col_key = str(col.get("key", ""))
-        col_key_attr = _html_mod.escape(col_key, quote=True)
-        col_type = str(col.get("type", "") or "")
-        cell_classes = "dz-tr-cell"
-        if col_type in ("currency", "percentage"):
-            cell_classes += " is-numeric"
-        cell_value = item.get(col_key)
-        # For ref columns, prefer an explicit `<key>_display` value the
-        # relation loader may have injected, else resolve via dict shape.
-        # Person-like refs still emit Avatar chips when only a display string
-        # is present (cycle 1363: do not short-circuit past user_chip).
-        if col_type == "ref":
-            explicit = item.get(f"{col_key}_display")
-            chip_probe = (
-                cell_value
-                if isinstance(cell_value, dict)
-                else {"name": str(explicit or cell_value or "")}
-            )
-            if looks_like_person_ref(chip_probe if chip_probe is not None else {}, col):
-                if isinstance(cell_value, dict):
-                    chip_val: Any = cell_value
-                elif explicit not in (None, ""):
-                    chip_val = {"name": str(explicit), "id": cell_value}
-                else:
-                    chip_val = cell_value
-                # Linked when ref_route present (parity with workspace region path).
-                chip = render_user_chip_linked_html(chip_val, col)
-                display_html = (
-                    chip
-                    if chip
-                    else _html_mod.escape(str(explicit or cell_value or ""), quote=False)
-                )
-            elif explicit not in (None, ""):
-                display_html = _html_mod.escape(str(explicit), quote=False)
-            else:
-                display_html = _render_cell_display(
-                    col, cell_value, entity_name=entity_name, record_id=item_id
-                )
-        else:
-            display_html = _render_cell_display(
-                col, cell_value, entity_name=entity_name, record_id=item_id
-            )
-
-        if col_key in inline_editable:
-            # Convergence C2.3: the CELL owns its edit affordance — one seam
-            # span carrying everything the delegated dz-grid-edit.js extension
-            # needs (kind / raw value / select options / a11y label). No
-            # Alpine templates; the editor input is built by the controller
-            # and the typed buffer lives on the grid root, out of the morph
-            # path.
-            kind = {
-                "bool": "bool",
-                "badge": "select",
-                "date": "date",
-                "datetime": "time",
-                "time": "time",
-                "number": "number",
-            }.get(col_type, "text")
-            # A select editor with zero options was never usable — degrade to
-            # text before the model (which forbids optionless selects) sees it.
-            if kind == "select" and not col.get("filter_options"):
-                kind = "text"
-            if col_type == "bool":
-                raw = "true" if cell_value else "false"
-            else:
-                raw = "" if cell_value is None else str(cell_value)
-            # #1573 closure: ONE ingestion boundary — the model's validator
-            # normalises the three producer shapes (dict/tuple/bare string);
-            # emission is derived from the model (see fragment/ingest.py for
-            # the contract source-of-truth pointer).
-            cell_model = GridEditCell(
-                col=col_key,
-                kind=kind,  # type: ignore[arg-type]
-                value=raw,
-                label=str(col.get("label", col_key)),
-                options=(col.get("filter_options") or None) if kind == "select" else None,
-            )
-            title_attr = ""
-            if cell_value is not None:
-                title_attr = f' title="{_html_mod.escape(str(cell_value), quote=True)}"'
-            cell_inner = (
-                f'<span class="dz-tr-cell-display" '
-                f"{edit_span_attrs(cell_model)}{title_attr}>{display_html}</span>"
-            )
-        else:
-            cell_inner = display_html
-
-        # C2.1: no per-cell visibility binding — dz-grid-cols.js projects the
-        # hidden set onto [data-dz-col] cells after every swap.
-        # #1592 / #1598: data cells must NOT stopPropagation. C2.3 marks nearly
-        # every text|bool|badge|date|datetime column inline-editable, but grid
-        # edit opens on **dblclick** (dz-grid-edit.js) — a single click must
-        # bubble to the row's hx-get drill. stopPropagation stays on checkbox +
-        # actions cells only (and on the active editor element when open).
-        cell_parts.append(
-            f'<td data-dz-col="{col_key_attr}" '  # nosemgrep
-            f'class="{cell_classes}">'
-            f"{cell_inner}</td>"
-        )
+    cell_parts = _render_data_cells(plan, item, item_id)
 
     # Delete action — omitted when DELETE is denied for this principal.
     # #1613: hard-pin hx-trigger="click" so tbody hx-trigger=load cannot
     # inherit onto destructive controls (implicitInheritance=true).
     delete_button = ""
-    if can_delete:
+    if plan.can_delete:
         delete_button = (
             f'<button type="button" '  # nosemgrep
             f'data-dazzle-action="{entity_name_attr}.delete" '
             f'aria-label="Delete {row_label_attr}" '
-            f'hx-delete="{api_endpoint}/{item_id_attr}" '
+            f'hx-delete="{plan.api_endpoint_attr}/{item_id_attr}" '
             f'hx-trigger="click" '
-            f'hx-confirm="Delete this {_html_mod.escape(entity_name_lower, quote=False)}?" '
+            f'hx-confirm="Delete this {plan.entity_name_lower_text}?" '
             f'hx-target="closest tr" '
             f'hx-swap="outerHTML swap:300ms" '
             f'class="dz-tr-action is-destructive">'
@@ -827,9 +1056,9 @@ def _render_table_row(table: dict[str, Any], item: dict[str, Any]) -> str:
     # identical when the entity has no state machine (empty state_transitions).
     # Also suppressed when UPDATE is denied (SM chips are mutations).
     transition_buttons = ""
-    state_transitions = table.get("state_transitions") or () if can_update else ()
-    status_field = str(table.get("status_field") or "")
-    transition_endpoint = str(table.get("transition_endpoint") or "")
+    state_transitions = plan.state_transitions
+    status_field = plan.status_field
+    transition_endpoint = plan.transition_endpoint
     if state_transitions and status_field and transition_endpoint and item_id:
         current_state = str(item.get(status_field, "") or "")
         valid = gated_row_transitions(list(state_transitions), current_state)
@@ -894,9 +1123,15 @@ def _render_table_row(table: dict[str, Any], item: dict[str, Any]) -> str:
     )
 
 
-def render_data_row(
+# Compiled plans keyed by the table spec's repr. Column specs are plain
+# mappings built once per surface, so a list page hits the same entry on every
+# request; the bound keeps a churn of ad-hoc specs from growing it unchecked.
+_PLAN_CACHE: dict[str, _TablePlan] = {}
+_PLAN_CACHE_MAX = 256
+
+
+def _data_row_plan(
     columns: tuple[Any, ...],
-    item: dict[str, Any],
     caps: RowCapabilities,
     *,
     entity_name: str = "Item",
@@ -908,14 +1143,26 @@ def render_data_row(
     state_transitions: tuple[Any, ...] = (),
     status_field: str = "",
     transition_endpoint: str = "",
-) -> str:
-    """Render one rich data-table `<tr>` from typed inputs (#1505).
-
-    Byte-identical to the retired `_render_table_row` for the `data-table`
-    archetype. `caps` gates the varying parts (bulk-select, inline-edit,
-    drill); the always-on structure (row-state binds, per-cell column
-    visibility, the actions cell) is intrinsic to this archetype.
-    """
+) -> _TablePlan:
+    """The (cached) render plan for one data-table spec — see `render_data_row`."""
+    key = repr(
+        (
+            columns,
+            caps,
+            entity_name,
+            api_endpoint,
+            detail_url_template,
+            tuple(detail_url_candidates),
+            detail_url_fallback_template,
+            table_id,
+            state_transitions,
+            status_field,
+            transition_endpoint,
+        )
+    )
+    plan = _PLAN_CACHE.get(key)
+    if plan is not None:
+        return plan
     table: dict[str, Any] = {
         "columns": list(columns),
         "entity_name": entity_name,
@@ -944,7 +1191,53 @@ def render_data_row(
         "can_delete": caps.delete,
         "can_update": caps.update,
     }
-    return _render_table_row(table, dict(item))
+    plan = _compile_table_plan(table)
+    if len(_PLAN_CACHE) >= _PLAN_CACHE_MAX:
+        _PLAN_CACHE.pop(next(iter(_PLAN_CACHE)), None)
+    _PLAN_CACHE[key] = plan
+    return plan
+
+
+def render_data_row(
+    columns: tuple[Any, ...],
+    item: dict[str, Any],
+    caps: RowCapabilities,
+    *,
+    entity_name: str = "Item",
+    api_endpoint: str = "",
+    detail_url_template: str = "",
+    detail_url_candidates: tuple[str, ...] | list[str] = (),
+    detail_url_fallback_template: str = "",
+    table_id: str = "dt-table",
+    state_transitions: tuple[Any, ...] = (),
+    status_field: str = "",
+    transition_endpoint: str = "",
+) -> str:
+    """Render one rich data-table `<tr>` from typed inputs (#1505).
+
+    Byte-identical to the retired `_render_table_row` for the `data-table`
+    archetype. `caps` gates the varying parts (bulk-select, inline-edit,
+    drill); the always-on structure (row-state binds, per-cell column
+    visibility, the actions cell) is intrinsic to this archetype.
+
+    The row-invariant work (column type dispatch, formatter options, escaped
+    attrs) comes from a render plan compiled once per table spec and cached
+    across requests; only the item-dependent parts run per row.
+    """
+    plan = _data_row_plan(
+        columns,
+        caps,
+        entity_name=entity_name,
+        api_endpoint=api_endpoint,
+        detail_url_template=detail_url_template,
+        detail_url_candidates=detail_url_candidates,
+        detail_url_fallback_template=detail_url_fallback_template,
+        table_id=table_id,
+        state_transitions=state_transitions,
+        status_field=status_field,
+        transition_endpoint=transition_endpoint,
+    )
+    return _render_table_row(plan, dict(item))
 
 
 def render_data_table_rows(dt: DataTable) -> str:
@@ -954,22 +1247,19 @@ def render_data_table_rows(dt: DataTable) -> str:
     and the (Phase-2) http/ HTMX-refresh transport adapter call down into this,
     so first-paint and refresh can never diverge. Returns the rows alone (no
     `<tbody>` wrapper) for an `innerHTML`/`innerMorph` swap into an existing
-    table body.
+    table body. The table's render plan is resolved once for all its rows.
     """
-    return "".join(
-        render_data_row(
-            dt.columns,
-            dict(item),
-            dt.capabilities,
-            entity_name=dt.entity_name,
-            api_endpoint=dt.api_endpoint,
-            detail_url_template=dt.detail_url_template,
-            detail_url_candidates=getattr(dt, "detail_url_candidates", ()) or (),
-            detail_url_fallback_template=getattr(dt, "detail_url_fallback_template", "") or "",
-            table_id=dt.table_id,
-            state_transitions=dt.state_transitions,
-            status_field=dt.status_field,
-            transition_endpoint=dt.transition_endpoint,
-        )
-        for item in dt.rows
+    plan = _data_row_plan(
+        dt.columns,
+        dt.capabilities,
+        entity_name=dt.entity_name,
+        api_endpoint=dt.api_endpoint,
+        detail_url_template=dt.detail_url_template,
+        detail_url_candidates=getattr(dt, "detail_url_candidates", ()) or (),
+        detail_url_fallback_template=getattr(dt, "detail_url_fallback_template", "") or "",
+        table_id=dt.table_id,
+        state_transitions=dt.state_transitions,
+        status_field=dt.status_field,
+        transition_endpoint=dt.transition_endpoint,
     )
+    return "".join(_render_table_row(plan, dict(item)) for item in dt.rows)
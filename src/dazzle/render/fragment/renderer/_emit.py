@@ -163,6 +163,7 @@ from dazzle.render.fragment.renderer._render_shell import (
     _load_static,  # noqa: F401, E402
     _RenderShellMixin,
 )
+from dazzle.render.fragment.renderer._render_stream import _RenderStreamMixin
 from dazzle.render.fragment.renderer._render_tables import _RenderTablesMixin
 
 
@@ -173,6 +174,7 @@ class FragmentRenderer(
     _RenderInteractiveMixin,
     _RenderLayoutMixin,
     _RenderShellMixin,
+    _RenderStreamMixin,
     _RenderTablesMixin,
 ):
     """Emit HTML from a Fragment tree.
@@ -193,11 +195,8 @@ class FragmentRenderer(
             # Escape hatches first — most likely path is RawHTML interop
             case RawHTML(html=html):
                 return html
-            case Slot(name=name):
-                raise FragmentError(
-                    f"unfilled slot {name!r} reached the renderer; "
-                    f"slots must be substituted before render() is called"
-                )
+            case Slot():
+                return self._emit_slot(fragment, ctx)
             # Assets (#1130)
             case Script():
                 return self._emit_script(fragment, ctx)
@@ -0,0 +1,189 @@
+"""Streamed progressive rendering — `Slot` placeholders filled in-stream.
+
+`FragmentRenderer.render_stream` renders a Fragment tree whose slow parts
+(an aggregate tile, a chart, a related list) are `Slot` holes:
+
+  1. The shell — everything that is ready now — is yielded as the first
+     chunk, with a `<div data-dz-slot>` placeholder at each hole
+  2. Each slot's awaitable resolves on its own schedule; its Fragment is
+     yielded into the same chunked response as a `<template>` plus a
+     one-line script that moves it into the placeholder (completion order)
+  3. A full-page shell is split at its last `</body>`, so the fills land
+     inside the body and the closing tags go out last
+
+Time-to-first-byte is the shell's render time instead of the slowest
+region's query. A failed fill is logged and replaced by a short notice, so
+no placeholder is left busy forever.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator, Awaitable, Iterable, Mapping
+from typing import TYPE_CHECKING
+
+from dazzle.render.fragment.context import RenderContext
+from dazzle.render.fragment.errors import FragmentError
+from dazzle.render.fragment.escape import Script, Slot, _attr_escape
+
+if TYPE_CHECKING:
+    from dazzle.render.fragment.primitives import Fragment
+
+logger = logging.getLogger(__name__)
+
+# Sent once, ahead of the first fill. A classic (not module) script so every
+# fill runs as soon as the parser reaches it; `htmx.process` wires the hx-*
+# attributes inside the filled region.
+_FILL_BOOTSTRAP = (
+    "window.dzFillSlot=window.dzFillSlot||function(n){"
+    'var t=document.getElementById("dz-slot-fill-"+n),'
+    's=document.getElementById("dz-slot-"+n);'
+    "if(!t||!s)return;"
+    "s.replaceChildren(t.content);"
+    's.removeAttribute("aria-busy");'
+    "t.remove();"
+    "if(window.htmx)window.htmx.process(s);};"
+)
+
+_FILL_FAILED = '<p class="dz-slot-error" role="alert">This section could not be loaded.</p>'
+
+
+class _RenderStreamMixin:
+    """Mixin adding `render_stream` and the `Slot` placeholder emit to
+    `FragmentRenderer`.
+
+    Mixin contract: the host class provides `render(fragment, ctx)` and
+    `_emit(fragment, ctx)`; declared here as TYPE_CHECKING stubs.
+    """
+
+    if TYPE_CHECKING:
+
+        def render(self, fragment: Fragment, ctx: RenderContext | None = None) -> str: ...
+
+        def _emit(self, fragment: Fragment, ctx: RenderContext) -> str: ...
+
+    def _emit_slot(self, slot: Slot, ctx: RenderContext) -> str:
+        """Placeholder for a streamed slot; outside `render_stream` an
+        unfilled slot is a programmer error, not user data — fail loudly."""
+        if ctx.streamed_slots is None:
+            raise FragmentError(
+                f"unfilled slot {slot.name!r} reached the renderer; "
+                f"slots must be substituted before render() is called"
+            )
+        if slot.name in ctx.streamed_slots:
+            raise FragmentError(f"slot {slot.name!r} appears twice in one streamed render")
+        ctx.streamed_slots.append(slot.name)
+        name = _attr_escape(slot.name)
+        return (
+            f'<div id="dz-slot-{name}" class="dz-slot" data-dz-slot="{name}" '
+            f'aria-busy="true"></div>'
+        )
+
+    async def render_stream(
+        self,
+        fragment: Fragment,
+        fills: Mapping[str, Awaitable[Fragment]],
+        ctx: RenderContext | None = None,
+    ) -> AsyncIterator[str]:
+        """Yield the shell with `Slot` placeholders, then each fill as it resolves.
+
+        Args:
+            fragment: Page or region tree; its `Slot` holes are the deferred parts
+            fills: Slot name → awaitable producing that slot's Fragment. Must
+                name exactly the slots in ``fragment``
+            ctx: Render context (tokens, CSP nonce) shared by shell and fills
+
+        Raises:
+            FragmentError: The tree's slots and ``fills`` disagree (raised
+                before anything is yielded)
+        """
+        ctx = ctx if ctx is not None else RenderContext()
+        shell_ctx = RenderContext(tokens=ctx.tokens, csp_nonce=ctx.csp_nonce, streamed_slots=[])
+        try:
+            shell = self.render(fragment, shell_ctx)
+            _check_fills(shell_ctx.streamed_slots or [], fills)
+        except BaseException:
+            _discard(fills.values())
+            raise
+
+        cut = shell.rfind("</body>")
+        head, tail = (shell[:cut], shell[cut:]) if cut >= 0 else (shell, "")
+        yield head
+        if fills:
+            yield self._emit(Script(body=_FILL_BOOTSTRAP, type=""), ctx)
+            async for name, filled in _completed(fills):
+                yield self._slot_fill(name, filled, ctx)
+        if tail:
+            yield tail
+
+    def _slot_fill(self, name: str, filled: Fragment | None, ctx: RenderContext) -> str:
+        html = _FILL_FAILED
+        if filled is not None:
+            # The response is already under way, so a render error can only
+            # be reported in place, not as a 500.
+            try:
+                html = self.render(
+                    filled, RenderContext(tokens=ctx.tokens, csp_nonce=ctx.csp_nonce)
+                )
+            except Exception:
+                logger.exception("Streamed slot %r failed to render", name)
+        fill_id = _attr_escape(f"dz-slot-fill-{name}")
+        script = self._emit(Script(body=f"dzFillSlot({_js_string(name)})", type=""), ctx)
+        return f'<template id="{fill_id}">{html}</template>{script}'
+
+
+def _check_fills(emitted: list[str], fills: Mapping[str, Awaitable[Fragment]]) -> None:
+    missing = [n for n in emitted if n not in fills]
+    unused = [n for n in fills if n not in emitted]
+    if missing or unused:
+        raise FragmentError(
+            f"streamed slots and fills disagree — no fill for {missing}, no slot for {unused}"
+        )
+
+
+def _js_string(value: str) -> str:
+    """A JS string literal for ``value``; ``<`` is escaped so no tag can open."""
+    return json.dumps(value).replace("<", "\\u003c")
+
+
+def _discard(awaitables: Iterable[Awaitable[Fragment]]) -> None:
+    """Close never-awaited coroutines so they don't warn on garbage collection."""
+    for aw in awaitables:
+        if asyncio.iscoroutine(aw):
+            aw.close()
+
+
+async def _completed(
+    fills: Mapping[str, Awaitable[Fragment]],
+) -> AsyncIterator[tuple[str, Fragment | None]]:
+    """Yield ``(name, fragment)`` in completion order; None for a failed fill.
+
+    Each task queues itself as it finishes, so fills that complete in the
+    same event-loop turn still come out in the order they completed.
+    Pending fills are cancelled if the consumer stops early (client gone).
+    """
+    finished: asyncio.Queue[asyncio.Future[Fragment]] = asyncio.Queue()
+    tasks: dict[asyncio.Future[Fragment], str] = {}
+    for name, aw in fills.items():
+        task: asyncio.Future[Fragment] = asyncio.ensure_future(aw)
+        task.add_done_callback(finished.put_nowait)
+        tasks[task] = name
+    try:
+        for _ in range(len(tasks)):
+            task = await finished.get()
+            name = tasks[task]
+            if task.cancelled() or task.exception() is not None:
+                logger.warning(
+                    "Streamed slot %r failed: %s",
+                    name,
+                    "cancelled" if task.cancelled() else task.exception(),
+                )
+                yield name, None
+            else:
+                yield name, task.result()
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
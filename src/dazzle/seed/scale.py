@@ -0,0 +1,452 @@
+"""Schema-generic synthetic data at production scale (``dazzle seed scale``).
+
+``benchmarks/seed.py`` shows ``COPY`` is the only practical way to build a
+multi-million-row dataset, but it is hand-written for invoice_ops, and
+``DemoDataLoader`` posts one row per HTTP request. This module derives the
+same kind of dataset for any AppSpec:
+
+- **FK-consistent.** Row ids are a pure function of ``(entity, index,
+  seed)``, so a child picks its parent by *index* and never holds the
+  parent's ids in memory. Entities load parents-first
+  (:func:`dazzle.db.graph.parents_first`). Required ref targets that were
+  not asked for are added with ``parent_rows`` rows each.
+- **Tenant-partitioned.** Under ``tenancy: mode: shared_schema`` row ``i``
+  of a tenant-scoped entity belongs to tenant ``i % tenants``, and its refs
+  to other tenant-scoped entities only pick parents from the same tenant,
+  so the composite ``(tenant_id, fk)`` foreign keys hold.
+- **Valid against the IR.** Enum columns cycle through their declared
+  values, a state machine's status column only takes states reachable from
+  the initial state, strings honour ``max_length``, unique columns carry
+  the row index and decimals fit their precision. Everything else comes
+  from :func:`dazzle.core.field_values.generate_field_value` — the
+  generator the demo and test data paths use — via a small per-column
+  value pool, so the per-row cost is a list lookup.
+
+Rows are rendered straight to ``COPY`` text format and streamed in chunks;
+only columns that exist in the live table are written, so framework-managed
+columns keep their defaults. ``COPY FROM`` is refused on tables with
+row-level security enabled unless the role bypasses RLS — run it as the
+schema owner / migration role.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import random
+import uuid
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from dazzle.core.field_values import generate_field_value
+from dazzle.core.ir import ArchetypeKind, FieldTypeKind, TenancyMode
+from dazzle.db.connection import fetchall
+from dazzle.db.graph import get_ref_fields, parents_first
+from dazzle.db.sql import quote_id
+from dazzle.db.virtual import is_virtual_entity
+
+#: Rows generated for a required ref target nobody asked for.
+DEFAULT_PARENT_ROWS = 100
+
+#: Tenants generated when the app is tenanted and ``tenants`` is not given.
+DEFAULT_TENANTS = 10
+
+#: Distinct pooled values per non-unique column.
+POOL_SIZE = 64
+
+#: Rows rendered per ``COPY`` write.
+CHUNK_ROWS = 5000
+
+_NULL = "\\N"
+_SPREAD = 2654435761  # Knuth's multiplicative hash: scatters child → parent picks
+_NO_COLUMN_KINDS = frozenset(
+    {
+        FieldTypeKind.HAS_MANY,
+        FieldTypeKind.HAS_ONE,
+        FieldTypeKind.EMBEDS,
+    }
+)
+
+ColumnWriter = Callable[[int, int], str]
+
+
+@dataclass(frozen=True)
+class ScalePlan:
+    """Row counts per entity, in load order, plus the tenant layout."""
+
+    counts: dict[str, int]
+    order: list[str]
+    tenant_entity: str | None = None
+    partition_key: str | None = None
+    tenants: int = 1
+    seed: int = 0
+    notes: list[str] = field(default_factory=list)
+
+    @property
+    def total_rows(self) -> int:
+        return sum(self.counts.values())
+
+
+def parse_row_counts(specs: list[str]) -> dict[str, int]:
+    """Parse ``["Task=1000000", "User=5000"]`` into a row-count map."""
+    counts: dict[str, int] = {}
+    for spec in specs:
+        name, sep, raw = spec.partition("=")
+        try:
+            count = int(raw.replace("_", ""))
+        except ValueError:
+            count = -1
+        if not sep or not name.strip() or count < 0:
+            raise ValueError(f"--rows expects ENTITY=N, got {spec!r}")
+        counts[name.strip()] = count
+    return counts
+
+
+def row_id(entity: str, index: int, seed: int = 0) -> uuid.UUID:
+    """Deterministic id of row *index* of *entity*.
+
+    The high 64 bits are a digest of the entity name and seed, the low 64
+    bits are the index — unique per row and computable without a lookup.
+    """
+    return uuid.UUID(int=_id_prefix(entity, seed) | index)
+
+
+@functools.cache
+def _id_prefix(entity: str, seed: int) -> int:
+    digest = hashlib.blake2b(f"{seed}:{entity}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") << 64
+
+
+def copy_text(value: Any) -> str:
+    """Render one value in PostgreSQL ``COPY`` text format."""
+    if value is None:
+        return _NULL
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, dict | list):
+        value = json.dumps(value)
+    text = str(value)
+    if "\\" in text or "\t" in text or "\n" in text or "\r" in text:
+        text = (
+            text.replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
+    return text
+
+
+# ---------------------------------------------------------------------------
+# Plan
+# ---------------------------------------------------------------------------
+
+
+def _tenant_layout(appspec: Any) -> tuple[str | None, str | None]:
+    tenancy = getattr(appspec, "tenancy", None)
+    if tenancy is None or tenancy.isolation.mode != TenancyMode.SHARED_SCHEMA:
+        return None, None
+    for entity in appspec.domain.entities:
+        if entity.is_tenant_root or entity.archetype_kind == ArchetypeKind.TENANT:
+            return entity.name, tenancy.isolation.partition_key
+    return None, None
+
+
+def _loadable(appspec: Any) -> dict[str, Any]:
+    return {
+        e.name: e
+        for e in appspec.domain.entities
+        if not is_virtual_entity(e) and e.subtype_of is None
+    }
+
+
+def _is_scoped(entity: Any, partition_key: str | None) -> bool:
+    return partition_key is not None and any(f.name == partition_key for f in entity.fields)
+
+
+def _add_required_parents(
+    entities: Mapping[str, Any],
+    counts: dict[str, int],
+    scoped: set[str],
+    floor: int,
+    parent_rows: int,
+) -> list[str]:
+    """Add every transitively required ref target to *counts*; return notes."""
+    notes: list[str] = []
+    pending = list(counts)
+    while pending:
+        entity = entities[pending.pop()]
+        for ref in get_ref_fields(entity):
+            target = ref.type.ref_entity
+            if not ref.is_required or target in counts or target not in entities:
+                continue
+            counts[target] = max(parent_rows, floor if target in scoped else 1)
+            notes.append(f"{target}: {counts[target]} rows (required by {entity.name}.{ref.name})")
+            pending.append(target)
+    for name in sorted(scoped & set(counts)):
+        if counts[name] < floor:
+            notes.append(f"{name}: raised to {floor} rows so every tenant has one")
+            counts[name] = floor
+    return notes
+
+
+def plan_scale(
+    appspec: Any,
+    rows: Mapping[str, int],
+    *,
+    tenants: int | None = None,
+    parent_rows: int = DEFAULT_PARENT_ROWS,
+    seed: int = 0,
+) -> ScalePlan:
+    """Resolve requested row counts into a loadable, FK-closed plan.
+
+    Raises ``ValueError`` for an entity that is unknown or has no table of
+    its own (virtual entities, table-per-type subtypes).
+    """
+    entities = _loadable(appspec)
+    unknown = sorted(set(rows) - set(entities))
+    if unknown:
+        raise ValueError(f"Not a seedable entity: {', '.join(unknown)}")
+    counts = {name: n for name, n in rows.items() if n > 0}
+    tenant_entity, partition_key = _tenant_layout(appspec)
+    scoped = {n for n, e in entities.items() if _is_scoped(e, partition_key)}
+    if not scoped & set(counts):
+        tenant_entity = partition_key = None
+        scoped = set()
+    n_tenants = 1
+    if tenant_entity is not None:
+        n_tenants = counts.get(tenant_entity) or tenants or DEFAULT_TENANTS
+        counts[tenant_entity] = n_tenants
+
+    notes = _add_required_parents(entities, counts, scoped, n_tenants, parent_rows)
+    order = [n for n in parents_first(list(entities.values())) if n in counts]
+    return ScalePlan(
+        counts={n: counts[n] for n in order},
+        order=order,
+        tenant_entity=tenant_entity,
+        partition_key=partition_key,
+        tenants=n_tenants,
+        seed=seed,
+        notes=notes,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Row generation
+# ---------------------------------------------------------------------------
+
+
+def _reachable_states(entity: Any) -> list[str]:
+    machine = entity.state_machine
+    states = machine.state_names() if hasattr(machine, "state_names") else list(machine.states)
+    if not states:
+        return []
+    status = entity.get_field(machine.status_field)
+    initial = status.default if status is not None and status.default in states else states[0]
+    seen = [initial]
+    for state in seen:
+        for target in sorted(machine.get_allowed_targets(state)):
+            if target in states and target not in seen:
+                seen.append(target)
+    return seen
+
+
+def _decimal_pool(spec: Any, rng: random.Random) -> list[str]:
+    scale = spec.type.scale if spec.type.scale is not None else 2
+    ceiling = 10 ** (spec.type.precision - scale) - 1 if spec.type.precision else 100_000
+    return [f"{rng.uniform(0, max(ceiling, 1)):.{scale}f}" for _ in range(POOL_SIZE)]
+
+
+def _value_pool(entity: Any, spec: Any, rng: random.Random) -> list[str]:
+    machine = entity.state_machine
+    if machine is not None and spec.name == machine.status_field:
+        states = _reachable_states(entity)
+        if states:
+            return states
+    if spec.type.kind == FieldTypeKind.ENUM and spec.type.enum_values:
+        return list(spec.type.enum_values)
+    if spec.type.kind == FieldTypeKind.DECIMAL:
+        return _decimal_pool(spec, rng)
+    if spec.type.kind == FieldTypeKind.INT:
+        return [str(rng.randint(0, 1000)) for _ in range(POOL_SIZE)]
+    if spec.type.kind == FieldTypeKind.FLOAT:
+        return [f"{rng.uniform(0, 1000):.3f}" for _ in range(POOL_SIZE)]
+    state = random.getstate()
+    random.seed(rng.random())
+    try:
+        values = [generate_field_value(spec, index=k, realistic=True) for k in range(POOL_SIZE)]
+    finally:
+        random.setstate(state)
+    max_len = spec.type.max_length
+    return [copy_text(v)[:max_len] if max_len else copy_text(v) for v in values]
+
+
+def _unique_writer(spec: Any, rng: random.Random) -> ColumnWriter:
+    if spec.type.kind in (FieldTypeKind.INT, FieldTypeKind.DECIMAL):
+        return lambda i, t: str(i + 1)
+    # Seeded, and distinct per row: the index only touches the low bits,
+    # which the version/variant fields of a v4 UUID leave alone.
+    base = rng.getrandbits(128)
+    if spec.type.kind == FieldTypeKind.UUID:
+        return lambda i, t: str(uuid.UUID(int=base ^ i, version=4))
+    max_len = spec.type.max_length or 50
+    if spec.type.kind == FieldTypeKind.STR and max_len <= 16:
+        # generate_field_value would draw these from uuid4() — unseeded.
+        return lambda i, t: f"{base ^ i:032x}"[-max_len:]
+
+    def write(i: int, t: int) -> str:
+        value = generate_field_value(spec, index=i, unique_suffix=f"-{i}")
+        if value is None:
+            return str(uuid.UUID(int=base ^ i, version=4))
+        return copy_text(value)
+
+    return write
+
+
+class RowFactory:
+    """Renders rows of one entity as ``COPY`` text lines.
+
+    ``columns`` lists every column the IR can fill; pass a subset to
+    :meth:`lines` to match the live table.
+    """
+
+    def __init__(self, entity: Any, plan: ScalePlan, entities: Mapping[str, Any]) -> None:
+        self.entity = entity
+        self.count = plan.counts[entity.name]
+        self._plan = plan
+        self._entities = entities
+        self._scoped = _is_scoped(entity, plan.partition_key)
+        self._rng = random.Random(f"{plan.seed}:{entity.name}")
+        self.writers: dict[str, ColumnWriter] = {}
+        for spec in entity.fields:
+            self._add_field(spec)
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self.writers)
+
+    def tenant_of(self, index: int) -> int:
+        return index % self._plan.tenants if self._scoped else 0
+
+    def _add_field(self, spec: Any) -> None:
+        kind = spec.type.kind
+        if kind in _NO_COLUMN_KINDS:
+            return
+        if spec.is_primary_key:
+            name, seed = self.entity.name, self._plan.seed
+            self.writers[spec.name] = lambda i, t: str(row_id(name, i, seed))
+        elif kind in (FieldTypeKind.REF, FieldTypeKind.BELONGS_TO):
+            self._add_ref(spec)
+        elif kind == FieldTypeKind.MONEY:
+            minors = [str(self._rng.randint(100, 10_000_000)) for _ in range(POOL_SIZE)]
+            currency = spec.type.currency_code or "USD"
+            self.writers[f"{spec.name}_minor"] = lambda i, t: minors[i % POOL_SIZE]
+            self.writers[f"{spec.name}_currency"] = lambda i, t: currency
+        elif spec.is_unique:
+            self.writers[spec.name] = _unique_writer(spec, self._rng)
+        else:
+            pool = _value_pool(self.entity, spec, self._rng)
+            size = len(pool)
+            self.writers[spec.name] = lambda i, t: pool[(i * _SPREAD >> 16) % size]
+
+    def _add_ref(self, spec: Any) -> None:
+        target = spec.type.ref_entity
+        parents = self._plan.counts.get(target, 0)
+        if target not in self._entities or parents == 0:
+            if spec.is_required:
+                raise ValueError(f"{self.entity.name}.{spec.name}: no {target} rows to point at")
+            self.writers[spec.name] = lambda i, t: _NULL
+            return
+        self.writers[spec.name] = self._parent_writer(target, parents, spec.is_required)
+
+    def _parent_writer(self, target: str, parents: int, required: bool) -> ColumnWriter:
+        seed = self._plan.seed
+        tenants = self._plan.tenants
+        if self._scoped and target == self._plan.tenant_entity:
+            return lambda i, t: str(row_id(target, t, seed))
+        same_tenant = self._scoped and _is_scoped(self._entities[target], self._plan.partition_key)
+        self_ref = target == self.entity.name
+
+        def write(i: int, t: int) -> str:
+            if not required and i % 5 == 4:
+                return _NULL
+            if same_tenant:
+                # Parents of tenant t are the indexes t, t + T, t + 2T, …
+                span = (parents - t + tenants - 1) // tenants
+                if self_ref:
+                    span = min(span, i // tenants + 1)
+                index = t + ((i * _SPREAD) % span) * tenants
+            else:
+                span = min(parents, i + 1) if self_ref else parents
+                index = (i * _SPREAD) % span
+            if self_ref and index == i and not required:
+                return _NULL  # a root, rather than its own parent
+            return str(row_id(target, index, seed))
+
+        return write
+
+    def lines(self, start: int, stop: int, columns: list[str] | None = None) -> str:
+        """``COPY`` text for rows ``start``..``stop`` (one line per row)."""
+        writers = [self.writers[c] for c in (columns or self.columns)]
+        out: list[str] = []
+        for i in range(start, stop):
+            t = self.tenant_of(i)
+            out.append("\t".join([w(i, t) for w in writers]))
+        return "\n".join(out) + "\n" if out else ""
+
+    def chunks(self, columns: list[str] | None = None) -> Iterator[bytes]:
+        for start in range(0, self.count, CHUNK_ROWS):
+            stop = min(start + CHUNK_ROWS, self.count)
+            yield self.lines(start, stop, columns).encode()
+
+
+# ---------------------------------------------------------------------------
+# Load
+# ---------------------------------------------------------------------------
+
+LIVE_COLUMNS_SQL = (
+    "SELECT column_name FROM information_schema.columns "
+    "WHERE table_schema = current_schema() AND table_name = %s"
+)
+
+
+async def live_columns(conn: Any, table: str) -> set[str]:
+    return {row["column_name"] for row in await fetchall(conn, LIVE_COLUMNS_SQL, (table,))}
+
+
+async def load_scale(
+    conn: Any,
+    appspec: Any,
+    plan: ScalePlan,
+    *,
+    truncate: bool = False,
+    on_entity: Callable[[str, int], None] | None = None,
+) -> dict[str, int]:
+    """Stream *plan* into Postgres with ``COPY``, parents first, in one transaction.
+
+    ``on_entity(name, rows)`` is called after each table finishes.
+    Returns rows written per entity.
+    """
+    entities = _loadable(appspec)
+    factories = [RowFactory(entities[name], plan, entities) for name in plan.order]
+    written: dict[str, int] = {}
+    async with conn.transaction():
+        if truncate and plan.order:
+            tables = ", ".join(quote_id(name) for name in plan.order)
+            await conn.execute(f"TRUNCATE {tables} CASCADE")
+        for factory in factories:
+            name = factory.entity.name
+            live = await live_columns(conn, name)
+            if not live:
+                raise ValueError(f"Table {name!r} does not exist — run `dazzle db upgrade` first")
+            columns = [c for c in factory.columns if c in live]
+            column_sql = ", ".join(quote_id(c) for c in columns)
+            async with conn.cursor() as cur:
+                async with cur.copy(f"COPY {quote_id(name)} ({column_sql}) FROM STDIN") as copy:
+                    for chunk in factory.chunks(columns):
+                        await copy.write(chunk)
+            written[name] = factory.count
+            if on_entity is not None:
+                on_entity(name, factory.count)
+    return written
@@ -11,8 +11,14 @@ if TYPE_CHECKING:
     from .base import DetectionAgent
 
 
-def get_all_agents(*, project_path: Path | None = None) -> list[DetectionAgent]:
-    """Return an instance of every registered detection agent."""
+def get_all_agents(
+    *, project_path: Path | None = None, incremental: bool = True
+) -> list[DetectionAgent]:
+    """Return an instance of every registered detection agent.
+
+    ``incremental=False`` makes source-scanning agents ignore results
+    cached from the previous scan.
+    """
     from .auth_authorization import AuthAuthorizationAgent
     from .business_logic import BusinessLogicAgent
     from .data_integrity import DataIntegrityAgent
@@ -32,7 +38,7 @@ def get_all_agents(*, project_path: Path | None = None) -> list[DetectionAgent]:
         PerformanceResourceAgent(),
         OperationalHygieneAgent(),
         BusinessLogicAgent(),
-        PythonAuditAgent(project_path=project_path),
+        PythonAuditAgent(project_path=project_path, incremental=incremental),
     ]
 
 
@@ -9,18 +9,30 @@ Three detection layers:
 from __future__ import annotations
 
 import ast
+import hashlib
 import re
 from collections.abc import Iterator
-from contextlib import suppress
+from contextlib import contextmanager, suppress
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from dazzle.sentinel.agents.base import DetectionAgent, heuristic
-from dazzle.sentinel.models import AgentId, Severity
+from dazzle.sentinel.models import (
+    AgentId,
+    Confidence,
+    Evidence,
+    Finding,
+    Remediation,
+    RemediationEffort,
+    Severity,
+)
+from dazzle.sentinel.scan_engine import FileCheck, ScanEngine
+from dazzle.sentinel.store import FindingStore
 
 if TYPE_CHECKING:
     from dazzle.core.ir.appspec import AppSpec
-    from dazzle.sentinel.models import AgentResult, Finding
+    from dazzle.sentinel.models import AgentResult
 
 
 # ---------------------------------------------------------------------------
@@ -1015,6 +1027,519 @@ def _should_include(min_version_str: str, target: tuple[int, int]) -> bool:
         return True
 
 
+# ---------------------------------------------------------------------------
+# Per-file checks — run by the scan engine on each file's shared AST
+# ---------------------------------------------------------------------------
+
+
+def _check_requests_imports(f: Path, tree: ast.Module, source_lines: list[str]) -> list[Finding]:
+    """PA-LLM-01 candidates for one file — its ``requests`` imports.
+
+    The agent only reports them when the project also has async code.
+    """
+    lines: list[int] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            lines.extend(node.lineno for alias in node.names if alias.name == "requests")
+        if isinstance(node, ast.ImportFrom) and node.module == "requests":
+            lines.append(node.lineno)
+    return [
+        Finding(
+            agent=AgentId.PA,
+            heuristic_id="PA-LLM-01",
+            category="python_audit",
+            subcategory="llm_bias",
+            severity=Severity.LOW,
+            confidence=Confidence.LIKELY,
+            title="requests library used in async codebase",
+            description="Project has async code but uses requests (sync-only). httpx provides the same API with native async support.",
+            evidence=[
+                Evidence(
+                    evidence_type="source_pattern",
+                    location=f"{f}:{line}",
+                )
+            ],
+        )
+        for line in lines
+    ]
+
+
+def _check_manual_dunders(f: Path, tree: ast.Module, source_lines: list[str]) -> list[Finding]:
+    """PA-LLM-03 findings for one file."""
+    dunder_set = {"__init__", "__repr__", "__eq__"}
+
+    findings: list[Finding] = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ClassDef):
+            continue
+        has_dataclass = any(
+            (isinstance(d, ast.Name) and d.id == "dataclass")
+            or (
+                isinstance(d, ast.Call)
+                and isinstance(d.func, ast.Name)
+                and d.func.id == "dataclass"
+            )
+            or (isinstance(d, ast.Attribute) and d.attr == "dataclass")
+            for d in node.decorator_list
+        )
+        if has_dataclass:
+            continue
+        methods = {
+            n.name for n in node.body if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))
+        }
+        has_init = "__init__" in methods
+        has_other = bool(methods & (dunder_set - {"__init__"}))
+        if has_init and has_other:
+            findings.append(
+                Finding(
+                    agent=AgentId.PA,
+                    heuristic_id="PA-LLM-03",
+                    category="python_audit",
+                    subcategory="llm_bias",
+                    severity=Severity.LOW,
+                    confidence=Confidence.POSSIBLE,
+                    title=f"Class '{node.name}' has manual dunders — consider @dataclass",
+                    description=f"Class '{node.name}' defines __init__ plus __repr__/__eq__ manually. @dataclass generates these automatically.",
+                    evidence=[
+                        Evidence(
+                            evidence_type="source_pattern",
+                            location=f"{f}:{node.lineno}",
+                        )
+                    ],
+                    remediation=Remediation(
+                        summary="Replace with @dataclass and type-annotated fields",
+                        effort=RemediationEffort.SMALL,
+                    ),
+                )
+            )
+    return findings
+
+
+def _check_unittest_imports(f: Path, tree: ast.Module, source_lines: list[str]) -> list[Finding]:
+    """PA-LLM-04 findings for one file."""
+    findings: list[Finding] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name == "unittest":
+                    findings.append(
+                        Finding(
+                            agent=AgentId.PA,
+                            heuristic_id="PA-LLM-04",
+                            category="python_audit",
+                            subcategory="llm_bias",
+                            severity=Severity.INFO,
+                            confidence=Confidence.LIKELY,
+                            title="unittest used in pytest project",
+                            description="This project uses pytest (conftest.py present) but this file imports unittest. Use pytest functions + fixtures instead.",
+                            evidence=[
+                                Evidence(
+                                    evidence_type="source_pattern",
+                                    location=f"{f}:{node.lineno}",
+                                )
+                            ],
+                            remediation=Remediation(
+                                summary="Rewrite as pytest functions with assert statements",
+                                effort=RemediationEffort.MEDIUM,
+                            ),
+                        )
+                    )
+    return findings
+
+
+def _check_exceptions_as_control_flow(
+    py_file: Path, tree: ast.Module, source_lines: list[str]
+) -> list[Finding]:
+    """PA-LLM-07 findings for one file."""
+    detectors = (
+        ("silent_swallow", _detect_silent_swallow, Confidence.CONFIRMED),
+        ("fallback", _detect_fallback_control_flow, Confidence.LIKELY),
+        ("validation", _detect_validation_via_exception, Confidence.LIKELY),
+        ("conditional", _detect_try_as_conditional, Confidence.CONFIRMED),
+    )
+
+    catalogue_url = (
+        "https://github.com/cyfutureuk/dazzle/blob/main/"
+        "docs/counter-priors/exceptions-as-control-flow.md"
+    )
+
+    findings: list[Finding] = []
+    for shape_name, detector, confidence in detectors:
+        for hit in detector(tree, py_file):
+            # Check for noqa suppression on: handler line, line above handler,
+            # or the try: line itself (hit.try_line).
+            handler_text = source_lines[hit.line - 1] if 0 < hit.line <= len(source_lines) else ""
+            if "noqa: PA-LLM-07" in handler_text:
+                continue
+            above_handler = (
+                source_lines[hit.line - 2]
+                if hit.line >= 2 and hit.line - 2 < len(source_lines)
+                else ""
+            )
+            if "noqa: PA-LLM-07" in above_handler:
+                continue
+            try_line_text = (
+                source_lines[hit.try_line - 1]
+                if hit.try_line and 0 < hit.try_line <= len(source_lines)
+                else ""
+            )
+            if "noqa: PA-LLM-07" in try_line_text:
+                continue
+            findings.append(
+                Finding(
+                    agent=AgentId.PA,
+                    heuristic_id="PA-LLM-07",
+                    category="python_audit",
+                    subcategory="llm_bias",
+                    severity=Severity.MEDIUM,
+                    confidence=confidence,
+                    title=f"Exceptions as control flow ({shape_name})",
+                    description=(
+                        f"This try/except matches the {shape_name!r} antipattern from "
+                        "the counter-prior catalogue. See linked entry for the right shape."
+                    ),
+                    evidence=[
+                        Evidence(
+                            evidence_type="source_pattern",
+                            location=f"{py_file}:{hit.line}",
+                            snippet=hit.snippet,
+                        )
+                    ],
+                    remediation=Remediation(
+                        summary=(
+                            "Replace with explicit conditional / structured error / "
+                            "specific exception + recovery."
+                        ),
+                        effort=RemediationEffort.SMALL,
+                        guidance=(
+                            "See docs/counter-priors/exceptions-as-control-flow.md "
+                            "for the four canonical wrong shapes and the right shapes."
+                        ),
+                        references=[catalogue_url],
+                    ),
+                    catalogue_entry="exceptions-as-control-flow",
+                )
+            )
+    return findings
+
+
+def _check_n_plus_one(py_file: Path, tree: ast.Module, source_lines: list[str]) -> list[Finding]:
+    """PA-LLM-08 findings for one file."""
+    catalogue_url = (
+        "https://github.com/cyfutureuk/dazzle/blob/main/"
+        "docs/counter-priors/n-plus-one-in-user-code.md"
+    )
+
+    findings: list[Finding] = []
+    for hit in _detect_n_plus_one(tree, py_file):
+        call_line_text = source_lines[hit.line - 1] if 0 < hit.line <= len(source_lines) else ""
+        for_line_text = (
+            source_lines[hit.try_line - 1]
+            if hit.try_line and 0 < hit.try_line <= len(source_lines)
+            else ""
+        )
+        if "noqa: PA-LLM-08" in call_line_text:
+            continue
+        if "noqa: PA-LLM-08" in for_line_text:
+            continue
+
+        findings.append(
+            Finding(
+                agent=AgentId.PA,
+                heuristic_id="PA-LLM-08",
+                category="python_audit",
+                subcategory="llm_bias",
+                severity=Severity.MEDIUM,
+                confidence=Confidence.LIKELY,
+                title=f"N+1 query in loop ({hit.shape})",
+                description=(
+                    f"This for-loop body matches the {hit.shape!r} N+1 shape. "
+                    "Pull the inner call up to a batched aggregate / fetch "
+                    "before the loop. See linked catalogue entry."
+                ),
+                evidence=[
+                    Evidence(
+                        evidence_type="source_pattern",
+                        location=f"{py_file}:{hit.line}",
+                        snippet=hit.snippet,
+                    )
+                ],
+                remediation=Remediation(
+                    summary=(
+                        "Replace with Repository.aggregate or batched fetch outside the loop."
+                    ),
+                    effort=RemediationEffort.SMALL,
+                    guidance=(
+                        "See docs/counter-priors/n-plus-one-in-user-code.md "
+                        "for the right shapes (aggregate / latest_per_group / prefetch)."
+                    ),
+                    references=[catalogue_url],
+                ),
+                catalogue_entry="n-plus-one-in-user-code",
+            )
+        )
+    return findings
+
+
+def _check_optional_instead_of_result(
+    py_file: Path, tree: ast.Module, source_lines: list[str]
+) -> list[Finding]:
+    """PA-LLM-09 findings for one file."""
+    catalogue_url = (
+        "https://github.com/cyfutureuk/dazzle/blob/main/"
+        "docs/counter-priors/optional-instead-of-result.md"
+    )
+
+    findings: list[Finding] = []
+    for hit in _detect_optional_instead_of_result(tree, py_file):
+        def_line_text = source_lines[hit.line - 1] if 0 < hit.line <= len(source_lines) else ""
+        if "noqa: PA-LLM-09" in def_line_text:
+            continue
+
+        findings.append(
+            Finding(
+                agent=AgentId.PA,
+                heuristic_id="PA-LLM-09",
+                category="python_audit",
+                subcategory="llm_bias",
+                severity=Severity.MEDIUM,
+                confidence=Confidence.LIKELY,
+                title=f"Optional-instead-of-Result ({hit.shape})",
+                description=(
+                    f"Function `{hit.snippet}` collapses multiple distinct failure "
+                    "modes into None. Use Result[T, E] with a tagged error union "
+                    "so the caller can distinguish failure modes."
+                ),
+                evidence=[
+                    Evidence(
+                        evidence_type="source_pattern",
+                        location=f"{py_file}:{hit.line}",
+                        snippet=hit.snippet,
+                    )
+                ],
+                remediation=Remediation(
+                    summary=(
+                        "Return `Result[T, ErrorUnion]` from dazzle.result with "
+                        "a tagged union of error variants."
+                    ),
+                    effort=RemediationEffort.MEDIUM,
+                    guidance=(
+                        "See docs/counter-priors/optional-instead-of-result.md for "
+                        "the canonical right-shape pattern using dazzle.result + "
+                        "frozen-dataclass error variants."
+                    ),
+                    references=[catalogue_url],
+                ),
+                catalogue_entry="optional-instead-of-result",
+            )
+        )
+    return findings
+
+
+def _check_magic_string_typing(
+    py_file: Path, tree: ast.Module, source_lines: list[str]
+) -> list[Finding]:
+    """PA-LLM-10 findings for one file."""
+    catalogue_url = (
+        "https://github.com/cyfutureuk/dazzle/blob/main/docs/counter-priors/magic-string-typing.md"
+    )
+
+    findings: list[Finding] = []
+    for hit in _detect_magic_string_id(tree, py_file):
+        def_line_text = (
+            source_lines[hit.try_line - 1]
+            if hit.try_line and 0 < hit.try_line <= len(source_lines)
+            else ""
+        )
+        param_line_text = source_lines[hit.line - 1] if 0 < hit.line <= len(source_lines) else ""
+        if "noqa: PA-LLM-10" in def_line_text:
+            continue
+        if "noqa: PA-LLM-10" in param_line_text:
+            continue
+
+        findings.append(
+            Finding(
+                agent=AgentId.PA,
+                heuristic_id="PA-LLM-10",
+                category="python_audit",
+                subcategory="llm_bias",
+                severity=Severity.MEDIUM,
+                confidence=Confidence.LIKELY,
+                title=f"Magic-string ID parameter: {hit.snippet}",
+                description=(
+                    f"Parameter `{hit.snippet}` is typed as bare `str`. "
+                    "Use a NewType-branded alias so the type checker "
+                    "distinguishes this identifier class from other str values."
+                ),
+                evidence=[
+                    Evidence(
+                        evidence_type="source_pattern",
+                        location=f"{py_file}:{hit.line}",
+                        snippet=hit.snippet,
+                    )
+                ],
+                remediation=Remediation(
+                    summary=(
+                        "Declare a brand: `from dazzle.types import NewType; "
+                        "MyId = NewType('MyId', str)`. Use `MyId` in the signature."
+                    ),
+                    effort=RemediationEffort.SMALL,
+                    guidance=(
+                        "See docs/counter-priors/magic-string-typing.md for the "
+                        "canonical right-shape pattern (branded IDs in app/ids.py + "
+                        "StrEnum for closed value sets)."
+                    ),
+                    references=[catalogue_url],
+                ),
+                catalogue_entry="magic-string-typing",
+            )
+        )
+
+    # #1274 sub-shape (b): enum-dispatch chains.
+    for hit in _detect_enum_dispatch_chain(tree, py_file):
+        # `try_line` points at the opening `if` of the chain.
+        if_line_text = (
+            source_lines[hit.try_line - 1]
+            if hit.try_line and 0 < hit.try_line <= len(source_lines)
+            else ""
+        )
+        if "noqa: PA-LLM-10" in if_line_text:
+            continue
+
+        findings.append(
+            Finding(
+                agent=AgentId.PA,
+                heuristic_id="PA-LLM-10",
+                category="python_audit",
+                subcategory="llm_bias",
+                severity=Severity.MEDIUM,
+                confidence=Confidence.LIKELY,
+                title=f"Enum-dispatch chain on string literals: {hit.snippet}",
+                description=(
+                    f"`{hit.snippet}` — an if/elif chain of ≥3 branches "
+                    "comparing the same variable against string literals. "
+                    "A StrEnum + `match` would let the type checker prove "
+                    "exhaustiveness and catch typos in the literal values; "
+                    "the corpus default of bare-string dispatch silently "
+                    "accepts typos and forgets cases."
+                ),
+                evidence=[
+                    Evidence(
+                        evidence_type="source_pattern",
+                        location=f"{py_file}:{hit.line}",
+                        snippet=hit.snippet,
+                    )
+                ],
+                remediation=Remediation(
+                    summary=(
+                        "Define a `StrEnum` for the discriminator values, "
+                        "type the variable as that enum, and `match` on it: "
+                        "`match status: case Status.PENDING: ... case "
+                        "Status.ACTIVE: ...`. The type checker will then "
+                        "warn on missing cases."
+                    ),
+                    effort=RemediationEffort.MEDIUM,
+                    guidance=(
+                        "See docs/counter-priors/magic-string-typing.md for "
+                        "the StrEnum + match right-shape pattern. Suppress "
+                        "with `# noqa: PA-LLM-10 — <reason>` on the opening "
+                        "`if` line when the chain is legitimately string-"
+                        "valued (e.g. user-input dispatch with no closed set)."
+                    ),
+                    references=[catalogue_url],
+                ),
+                catalogue_entry="magic-string-typing",
+            )
+        )
+    return findings
+
+
+def _check_raw_sql_string_building(
+    py_file: Path, tree: ast.Module, source_lines: list[str]
+) -> list[Finding]:
+    """PA-LLM-11 findings for one file."""
+    catalogue_url = (
+        "https://github.com/cyfutureuk/dazzle/blob/main/"
+        "docs/counter-priors/raw-sql-string-building.md"
+    )
+
+    findings: list[Finding] = []
+    for hit in _detect_raw_sql_string_building(tree, py_file):
+        call_line_text = source_lines[hit.line - 1] if 0 < hit.line <= len(source_lines) else ""
+        if "noqa: PA-LLM-11" in call_line_text:
+            continue
+
+        findings.append(
+            Finding(
+                agent=AgentId.PA,
+                heuristic_id="PA-LLM-11",
+                category="python_audit",
+                subcategory="llm_bias",
+                severity=Severity.MEDIUM,
+                confidence=Confidence.LIKELY,
+                title=f"Raw-SQL string-building: {hit.snippet}",
+                description=(
+                    f"`{hit.snippet}` is called with a SQL string built via "
+                    "f-string / string-concat / %-format / `.format()`. If any "
+                    "interpolated value originates from a request, header, "
+                    "cookie, or other untrusted source, this is a SQL "
+                    "injection vulnerability. Even when the inputs are "
+                    "trusted today, the raw-SQL shape bypasses Dazzle's "
+                    "predicate algebra (ADR-0009) — the substrate's RBAC "
+                    "scope guarantees stop applying at this call site."
+                ),
+                evidence=[
+                    Evidence(
+                        evidence_type="source_pattern",
+                        location=f"{py_file}:{hit.line}",
+                        snippet=hit.snippet,
+                    )
+                ],
+                remediation=Remediation(
+                    summary=(
+                        "Prefer `Repository.list(scope={...})` / .aggregate() / "
+                        ".get() which compile through the scope-validated "
+                        "predicate algebra. When raw SQL is genuinely required, "
+                        "use the driver's parameter substitution: "
+                        '`cur.execute("... %s ...", (val,))` — values are passed '
+                        "as a separate argument, not interpolated into the SQL "
+                        "string."
+                    ),
+                    effort=RemediationEffort.SMALL,
+                    guidance=(
+                        "See docs/counter-priors/raw-sql-string-building.md "
+                        "for the wrong/right shape pairing and the substrate "
+                        "rationale (ADR-0009). If you're reaching for raw SQL "
+                        "frequently, the Repository helpers are likely missing "
+                        "a shape — file an issue."
+                    ),
+                    references=[catalogue_url],
+                ),
+                catalogue_entry="raw-sql-string-building",
+            )
+        )
+    return findings
+
+
+# check id → (per-file check, file scope — see PythonAuditAgent._scope_files)
+_FILE_CHECKS: dict[str, tuple[FileCheck, str]] = {
+    "PA-LLM-01": (_check_requests_imports, "python_files"),
+    "PA-LLM-03": (_check_manual_dunders, "python_files"),
+    "PA-LLM-04": (_check_unittest_imports, "pytest_files"),
+    "PA-LLM-07": (_check_exceptions_as_control_flow, "app"),
+    "PA-LLM-08": (_check_n_plus_one, "app"),
+    "PA-LLM-09": (_check_optional_instead_of_result, "app"),
+    "PA-LLM-10": (_check_magic_string_typing, "app"),
+    "PA-LLM-11": (_check_raw_sql_string_building, "app_scripts"),
+}
+
+
+@lru_cache(maxsize=1)
+def _checks_fingerprint() -> str:
+    """Changes whenever this module (i.e. any per-file check) changes."""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+
 # ---------------------------------------------------------------------------
 # Agent
 # ---------------------------------------------------------------------------
@@ -1023,8 +1548,12 @@ def _should_include(min_version_str: str, target: tuple[int, int]) -> bool:
 class PythonAuditAgent(DetectionAgent):
     """Detects obsolete Python patterns in user project code."""
 
-    def __init__(self, project_path: Path | None = None) -> None:
+    def __init__(self, project_path: Path | None = None, *, incremental: bool = True) -> None:
         self._project_path = project_path or Path.cwd()
+        # Reuse per-file results from the previous scan for unchanged files.
+        self._incremental = incremental
+        self._engine: ScanEngine | None = None
+        self._scopes: dict[str, list[Path]] = {}
 
     @property
     def agent_id(self) -> AgentId:
@@ -1056,14 +1585,27 @@ class PythonAuditAgent(DetectionAgent):
         except Exception as exc:
             errors.append(f"semgrep: {exc}")
 
-        # Layer 3: @heuristic methods
+        # Layer 3: @heuristic methods — per-file checks share one parse per
+        # file, fan out to a process pool, and skip files unchanged since the
+        # last scan.
+        store = FindingStore(self._project_path)
+        engine = self._start_scan(store.load_file_index() if self._incremental else None)
+        engine.prefetch(
+            {cid: self._scope_files(scope) for cid, (_check, scope) in _FILE_CHECKS.items()}
+        )
         heuristics = self.get_heuristics()
-        for meta, method in heuristics:
-            try:
-                findings = method(appspec)
-                all_findings.extend(findings)
-            except Exception as exc:
-                errors.append(f"{meta.heuristic_id}: {exc}")
+        try:
+            for meta, method in heuristics:
+                try:
+                    all_findings.extend(method(appspec))
+                except Exception as exc:
+                    errors.append(f"{meta.heuristic_id}: {exc}")
+        finally:
+            self._engine = None
+        try:
+            store.save_file_index(engine.file_index())
+        except OSError as exc:
+            errors.append(f"file index: {exc}")
 
         elapsed = (time.monotonic() - t0) * 1000
         return AR(
@@ -1270,51 +1812,10 @@ class PythonAuditAgent(DetectionAgent):
     )
     def check_requests_in_async_codebase(self, appspec: AppSpec) -> list[Finding]:
         """Flag `import requests` when project has async code."""
-        import ast
-
-        from dazzle.sentinel.models import Confidence, Evidence, Finding, Severity
-
-        files = self._get_python_files()
-        has_async = False
-        requests_files: list[tuple[Path, int]] = []
-
-        for f in files:
-            try:
-                tree = ast.parse(f.read_text(encoding="utf-8"), filename=str(f))
-            except (SyntaxError, UnicodeDecodeError):
-                continue
-            for node in ast.walk(tree):
-                if isinstance(node, ast.AsyncFunctionDef):
-                    has_async = True
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        if alias.name == "requests":
-                            requests_files.append((f, node.lineno))
-                if isinstance(node, ast.ImportFrom) and node.module == "requests":
-                    requests_files.append((f, node.lineno))
-
-        if not has_async:
+        requests_findings = self._file_findings("PA-LLM-01")
+        if not requests_findings or not self._has_async_code():
             return []
-
-        return [
-            Finding(
-                agent=AgentId.PA,
-                heuristic_id="PA-LLM-01",
-                category="python_audit",
-                subcategory="llm_bias",
-                severity=Severity.LOW,
-                confidence=Confidence.LIKELY,
-                title="requests library used in async codebase",
-                description="Project has async code but uses requests (sync-only). httpx provides the same API with native async support.",
-                evidence=[
-                    Evidence(
-                        evidence_type="source_pattern",
-                        location=f"{path}:{line}",
-                    )
-                ],
-            )
-            for path, line in requests_files
-        ]
+        return requests_findings
 
     @heuristic(
         heuristic_id="PA-LLM-03",
@@ -1324,71 +1825,7 @@ class PythonAuditAgent(DetectionAgent):
     )
     def check_manual_dunders(self, appspec: AppSpec) -> list[Finding]:
         """Flag classes with manual __init__ + __repr__/__eq__ but no @dataclass."""
-        import ast
-
-        from dazzle.sentinel.models import (
-            Confidence,
-            Evidence,
-            Finding,
-            Remediation,
-            RemediationEffort,
-            Severity,
-        )
-
-        findings: list[Finding] = []
-        dunder_set = {"__init__", "__repr__", "__eq__"}
-
-        for f in self._get_python_files():
-            try:
-                tree = ast.parse(f.read_text(encoding="utf-8"), filename=str(f))
-            except (SyntaxError, UnicodeDecodeError):
-                continue
-            for node in ast.walk(tree):
-                if not isinstance(node, ast.ClassDef):
-                    continue
-                has_dataclass = any(
-                    (isinstance(d, ast.Name) and d.id == "dataclass")
-                    or (
-                        isinstance(d, ast.Call)
-                        and isinstance(d.func, ast.Name)
-                        and d.func.id == "dataclass"
-                    )
-                    or (isinstance(d, ast.Attribute) and d.attr == "dataclass")
-                    for d in node.decorator_list
-                )
-                if has_dataclass:
-                    continue
-                methods = {
-                    n.name
-                    for n in node.body
-                    if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))
-                }
-                has_init = "__init__" in methods
-                has_other = bool(methods & (dunder_set - {"__init__"}))
-                if has_init and has_other:
-                    findings.append(
-                        Finding(
-                            agent=AgentId.PA,
-                            heuristic_id="PA-LLM-03",
-                            category="python_audit",
-                            subcategory="llm_bias",
-                            severity=Severity.LOW,
-                            confidence=Confidence.POSSIBLE,
-                            title=f"Class '{node.name}' has manual dunders — consider @dataclass",
-                            description=f"Class '{node.name}' defines __init__ plus __repr__/__eq__ manually. @dataclass generates these automatically.",
-                            evidence=[
-                                Evidence(
-                                    evidence_type="source_pattern",
-                                    location=f"{f}:{node.lineno}",
-                                )
-                            ],
-                            remediation=Remediation(
-                                summary="Replace with @dataclass and type-annotated fields",
-                                effort=RemediationEffort.SMALL,
-                            ),
-                        )
-                    )
-        return findings
+        return self._file_findings("PA-LLM-03")
 
     @heuristic(
         heuristic_id="PA-LLM-04",
@@ -1398,53 +1835,7 @@ class PythonAuditAgent(DetectionAgent):
     )
     def check_unittest_in_pytest_project(self, appspec: AppSpec) -> list[Finding]:
         """Flag unittest usage when conftest.py exists (indicating pytest)."""
-        import ast
-
-        from dazzle.sentinel.models import (
-            Confidence,
-            Evidence,
-            Finding,
-            Remediation,
-            RemediationEffort,
-            Severity,
-        )
-
-        if not (self._project_path / "conftest.py").exists():
-            return []
-
-        findings: list[Finding] = []
-        for f in self._get_python_files():
-            try:
-                tree = ast.parse(f.read_text(encoding="utf-8"), filename=str(f))
-            except (SyntaxError, UnicodeDecodeError):
-                continue
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        if alias.name == "unittest":
-                            findings.append(
-                                Finding(
-                                    agent=AgentId.PA,
-                                    heuristic_id="PA-LLM-04",
-                                    category="python_audit",
-                                    subcategory="llm_bias",
-                                    severity=Severity.INFO,
-                                    confidence=Confidence.LIKELY,
-                                    title="unittest used in pytest project",
-                                    description="This project uses pytest (conftest.py present) but this file imports unittest. Use pytest functions + fixtures instead.",
-                                    evidence=[
-                                        Evidence(
-                                            evidence_type="source_pattern",
-                                            location=f"{f}:{node.lineno}",
-                                        )
-                                    ],
-                                    remediation=Remediation(
-                                        summary="Rewrite as pytest functions with assert statements",
-                                        effort=RemediationEffort.MEDIUM,
-                                    ),
-                                )
-                            )
-        return findings
+        return self._file_findings("PA-LLM-04")
 
     @heuristic(
         heuristic_id="PA-LLM-05",
@@ -1569,99 +1960,7 @@ class PythonAuditAgent(DetectionAgent):
         See docs/counter-priors/exceptions-as-control-flow.md for the
         full taxonomy and why these patterns are corrosive.
         """
-        from dazzle.sentinel.models import (
-            Confidence,
-            Evidence,
-            Finding,
-            Remediation,
-            RemediationEffort,
-            Severity,
-        )
-
-        app_dir = self._project_path / "app"
-        if not app_dir.exists():
-            return []
-
-        detectors = (
-            ("silent_swallow", _detect_silent_swallow, Confidence.CONFIRMED),
-            ("fallback", _detect_fallback_control_flow, Confidence.LIKELY),
-            ("validation", _detect_validation_via_exception, Confidence.LIKELY),
-            ("conditional", _detect_try_as_conditional, Confidence.CONFIRMED),
-        )
-
-        catalogue_url = (
-            "https://github.com/cyfutureuk/dazzle/blob/main/"
-            "docs/counter-priors/exceptions-as-control-flow.md"
-        )
-
-        findings: list[Finding] = []
-        for py_file in sorted(app_dir.rglob("*.py")):
-            try:
-                source_text = py_file.read_text(encoding="utf-8")
-                tree = ast.parse(source_text, filename=str(py_file))
-            except (SyntaxError, UnicodeDecodeError):
-                continue
-            source_lines = source_text.splitlines()
-
-            for shape_name, detector, confidence in detectors:
-                for hit in detector(tree, py_file):
-                    # Check for noqa suppression on: handler line, line above handler,
-                    # or the try: line itself (hit.try_line).
-                    handler_text = (
-                        source_lines[hit.line - 1] if 0 < hit.line <= len(source_lines) else ""
-                    )
-                    if "noqa: PA-LLM-07" in handler_text:
-                        continue
-                    above_handler = (
-                        source_lines[hit.line - 2]
-                        if hit.line >= 2 and hit.line - 2 < len(source_lines)
-                        else ""
-                    )
-                    if "noqa: PA-LLM-07" in above_handler:
-                        continue
-                    try_line_text = (
-                        source_lines[hit.try_line - 1]
-                        if hit.try_line and 0 < hit.try_line <= len(source_lines)
-                        else ""
-                    )
-                    if "noqa: PA-LLM-07" in try_line_text:
-                        continue
-                    findings.append(
-                        Finding(
-                            agent=AgentId.PA,
-                            heuristic_id="PA-LLM-07",
-                            category="python_audit",
-                            subcategory="llm_bias",
-                            severity=Severity.MEDIUM,
-                            confidence=confidence,
-                            title=f"Exceptions as control flow ({shape_name})",
-                            description=(
-                                f"This try/except matches the {shape_name!r} antipattern from "
-                                "the counter-prior catalogue. See linked entry for the right shape."
-                            ),
-                            evidence=[
-                                Evidence(
-                                    evidence_type="source_pattern",
-                                    location=f"{py_file}:{hit.line}",
-                                    snippet=hit.snippet,
-                                )
-                            ],
-                            remediation=Remediation(
-                                summary=(
-                                    "Replace with explicit conditional / structured error / "
-                                    "specific exception + recovery."
-                                ),
-                                effort=RemediationEffort.SMALL,
-                                guidance=(
-                                    "See docs/counter-priors/exceptions-as-control-flow.md "
-                                    "for the four canonical wrong shapes and the right shapes."
-                                ),
-                                references=[catalogue_url],
-                            ),
-                            catalogue_entry="exceptions-as-control-flow",
-                        )
-                    )
-        return findings
+        return self._file_findings("PA-LLM-07")
 
     @heuristic(
         heuristic_id="PA-LLM-08",
@@ -1676,83 +1975,7 @@ class PythonAuditAgent(DetectionAgent):
         full taxonomy and the right shapes (Repository.aggregate, batched
         fetch, latest_per_group).
         """
-        from dazzle.sentinel.models import (
-            Confidence,
-            Evidence,
-            Finding,
-            Remediation,
-            RemediationEffort,
-            Severity,
-        )
-
-        app_dir = self._project_path / "app"
-        if not app_dir.exists():
-            return []
-
-        catalogue_url = (
-            "https://github.com/cyfutureuk/dazzle/blob/main/"
-            "docs/counter-priors/n-plus-one-in-user-code.md"
-        )
-
-        findings: list[Finding] = []
-        for py_file in sorted(app_dir.rglob("*.py")):
-            try:
-                source_text = py_file.read_text(encoding="utf-8")
-                tree = ast.parse(source_text, filename=str(py_file))
-            except (SyntaxError, UnicodeDecodeError):
-                continue
-            source_lines = source_text.splitlines()
-
-            for hit in _detect_n_plus_one(tree, py_file):
-                call_line_text = (
-                    source_lines[hit.line - 1] if 0 < hit.line <= len(source_lines) else ""
-                )
-                for_line_text = (
-                    source_lines[hit.try_line - 1]
-                    if hit.try_line and 0 < hit.try_line <= len(source_lines)
-                    else ""
-                )
-                if "noqa: PA-LLM-08" in call_line_text:
-                    continue
-                if "noqa: PA-LLM-08" in for_line_text:
-                    continue
-
-                findings.append(
-                    Finding(
-                        agent=AgentId.PA,
-                        heuristic_id="PA-LLM-08",
-                        category="python_audit",
-                        subcategory="llm_bias",
-                        severity=Severity.MEDIUM,
-                        confidence=Confidence.LIKELY,
-                        title=f"N+1 query in loop ({hit.shape})",
-                        description=(
-                            f"This for-loop body matches the {hit.shape!r} N+1 shape. "
-                            "Pull the inner call up to a batched aggregate / fetch "
-                            "before the loop. See linked catalogue entry."
-                        ),
-                        evidence=[
-                            Evidence(
-                                evidence_type="source_pattern",
-                                location=f"{py_file}:{hit.line}",
-                                snippet=hit.snippet,
-                            )
-                        ],
-                        remediation=Remediation(
-                            summary=(
-                                "Replace with Repository.aggregate or batched fetch outside the loop."
-                            ),
-                            effort=RemediationEffort.SMALL,
-                            guidance=(
-                                "See docs/counter-priors/n-plus-one-in-user-code.md "
-                                "for the right shapes (aggregate / latest_per_group / prefetch)."
-                            ),
-                            references=[catalogue_url],
-                        ),
-                        catalogue_entry="n-plus-one-in-user-code",
-                    )
-                )
-        return findings
+        return self._file_findings("PA-LLM-08")
 
     @heuristic(
         heuristic_id="PA-LLM-09",
@@ -1767,78 +1990,7 @@ class PythonAuditAgent(DetectionAgent):
         full taxonomy and the right shape (dazzle.result + tagged
         ParseError union).
         """
-        from dazzle.sentinel.models import (
-            Confidence,
-            Evidence,
-            Finding,
-            Remediation,
-            RemediationEffort,
-            Severity,
-        )
-
-        app_dir = self._project_path / "app"
-        if not app_dir.exists():
-            return []
-
-        catalogue_url = (
-            "https://github.com/cyfutureuk/dazzle/blob/main/"
-            "docs/counter-priors/optional-instead-of-result.md"
-        )
-
-        findings: list[Finding] = []
-        for py_file in sorted(app_dir.rglob("*.py")):
-            try:
-                source_text = py_file.read_text(encoding="utf-8")
-                tree = ast.parse(source_text, filename=str(py_file))
-            except (SyntaxError, UnicodeDecodeError):
-                continue
-            source_lines = source_text.splitlines()
-
-            for hit in _detect_optional_instead_of_result(tree, py_file):
-                def_line_text = (
-                    source_lines[hit.line - 1] if 0 < hit.line <= len(source_lines) else ""
-                )
-                if "noqa: PA-LLM-09" in def_line_text:
-                    continue
-
-                findings.append(
-                    Finding(
-                        agent=AgentId.PA,
-                        heuristic_id="PA-LLM-09",
-                        category="python_audit",
-                        subcategory="llm_bias",
-                        severity=Severity.MEDIUM,
-                        confidence=Confidence.LIKELY,
-                        title=f"Optional-instead-of-Result ({hit.shape})",
-                        description=(
-                            f"Function `{hit.snippet}` collapses multiple distinct failure "
-                            "modes into None. Use Result[T, E] with a tagged error union "
-                            "so the caller can distinguish failure modes."
-                        ),
-                        evidence=[
-                            Evidence(
-                                evidence_type="source_pattern",
-                                location=f"{py_file}:{hit.line}",
-                                snippet=hit.snippet,
-                            )
-                        ],
-                        remediation=Remediation(
-                            summary=(
-                                "Return `Result[T, ErrorUnion]` from dazzle.result with "
-                                "a tagged union of error variants."
-                            ),
-                            effort=RemediationEffort.MEDIUM,
-                            guidance=(
-                                "See docs/counter-priors/optional-instead-of-result.md for "
-                                "the canonical right-shape pattern using dazzle.result + "
-                                "frozen-dataclass error variants."
-                            ),
-                            references=[catalogue_url],
-                        ),
-                        catalogue_entry="optional-instead-of-result",
-                    )
-                )
-        return findings
+        return self._file_findings("PA-LLM-09")
 
     @heuristic(
         heuristic_id="PA-LLM-10",
@@ -1853,142 +2005,7 @@ class PythonAuditAgent(DetectionAgent):
         taxonomy and right-shape patterns (dazzle.types.NewType for IDs,
         enum.StrEnum for closed sets).
         """
-        from dazzle.sentinel.models import (
-            Confidence,
-            Evidence,
-            Finding,
-            Remediation,
-            RemediationEffort,
-            Severity,
-        )
-
-        app_dir = self._project_path / "app"
-        if not app_dir.exists():
-            return []
-
-        catalogue_url = (
-            "https://github.com/cyfutureuk/dazzle/blob/main/"
-            "docs/counter-priors/magic-string-typing.md"
-        )
-
-        findings: list[Finding] = []
-        for py_file in sorted(app_dir.rglob("*.py")):
-            try:
-                source_text = py_file.read_text(encoding="utf-8")
-                tree = ast.parse(source_text, filename=str(py_file))
-            except (SyntaxError, UnicodeDecodeError):
-                continue
-            source_lines = source_text.splitlines()
-
-            for hit in _detect_magic_string_id(tree, py_file):
-                def_line_text = (
-                    source_lines[hit.try_line - 1]
-                    if hit.try_line and 0 < hit.try_line <= len(source_lines)
-                    else ""
-                )
-                param_line_text = (
-                    source_lines[hit.line - 1] if 0 < hit.line <= len(source_lines) else ""
-                )
-                if "noqa: PA-LLM-10" in def_line_text:
-                    continue
-                if "noqa: PA-LLM-10" in param_line_text:
-                    continue
-
-                findings.append(
-                    Finding(
-                        agent=AgentId.PA,
-                        heuristic_id="PA-LLM-10",
-                        category="python_audit",
-                        subcategory="llm_bias",
-                        severity=Severity.MEDIUM,
-                        confidence=Confidence.LIKELY,
-                        title=f"Magic-string ID parameter: {hit.snippet}",
-                        description=(
-                            f"Parameter `{hit.snippet}` is typed as bare `str`. "
-                            "Use a NewType-branded alias so the type checker "
-                            "distinguishes this identifier class from other str values."
-                        ),
-                        evidence=[
-                            Evidence(
-                                evidence_type="source_pattern",
-                                location=f"{py_file}:{hit.line}",
-                                snippet=hit.snippet,
-                            )
-                        ],
-                        remediation=Remediation(
-                            summary=(
-                                "Declare a brand: `from dazzle.types import NewType; "
-                                "MyId = NewType('MyId', str)`. Use `MyId` in the signature."
-                            ),
-                            effort=RemediationEffort.SMALL,
-                            guidance=(
-                                "See docs/counter-priors/magic-string-typing.md for the "
-                                "canonical right-shape pattern (branded IDs in app/ids.py + "
-                                "StrEnum for closed value sets)."
-                            ),
-                            references=[catalogue_url],
-                        ),
-                        catalogue_entry="magic-string-typing",
-                    )
-                )
-
-            # #1274 sub-shape (b): enum-dispatch chains.
-            for hit in _detect_enum_dispatch_chain(tree, py_file):
-                # `try_line` points at the opening `if` of the chain.
-                if_line_text = (
-                    source_lines[hit.try_line - 1]
-                    if hit.try_line and 0 < hit.try_line <= len(source_lines)
-                    else ""
-                )
-                if "noqa: PA-LLM-10" in if_line_text:
-                    continue
-
-                findings.append(
-                    Finding(
-                        agent=AgentId.PA,
-                        heuristic_id="PA-LLM-10",
-                        category="python_audit",
-                        subcategory="llm_bias",
-                        severity=Severity.MEDIUM,
-                        confidence=Confidence.LIKELY,
-                        title=f"Enum-dispatch chain on string literals: {hit.snippet}",
-                        description=(
-                            f"`{hit.snippet}` — an if/elif chain of ≥3 branches "
-                            "comparing the same variable against string literals. "
-                            "A StrEnum + `match` would let the type checker prove "
-                            "exhaustiveness and catch typos in the literal values; "
-                            "the corpus default of bare-string dispatch silently "
-                            "accepts typos and forgets cases."
-                        ),
-                        evidence=[
-                            Evidence(
-                                evidence_type="source_pattern",
-                                location=f"{py_file}:{hit.line}",
-                                snippet=hit.snippet,
-                            )
-                        ],
-                        remediation=Remediation(
-                            summary=(
-                                "Define a `StrEnum` for the discriminator values, "
-                                "type the variable as that enum, and `match` on it: "
-                                "`match status: case Status.PENDING: ... case "
-                                "Status.ACTIVE: ...`. The type checker will then "
-                                "warn on missing cases."
-                            ),
-                            effort=RemediationEffort.MEDIUM,
-                            guidance=(
-                                "See docs/counter-priors/magic-string-typing.md for "
-                                "the StrEnum + match right-shape pattern. Suppress "
-                                "with `# noqa: PA-LLM-10 — <reason>` on the opening "
-                                "`if` line when the chain is legitimately string-"
-                                "valued (e.g. user-input dispatch with no closed set)."
-                            ),
-                            references=[catalogue_url],
-                        ),
-                        catalogue_entry="magic-string-typing",
-                    )
-                )
-        return findings
+        return self._file_findings("PA-LLM-10")
 
     @heuristic(
         heuristic_id="PA-LLM-11",
@@ -2011,98 +2028,67 @@ class PythonAuditAgent(DetectionAgent):
         when raw SQL is genuinely required, use the driver's
         parameter substitution (`cursor.execute("... %s ...", (val,))`).
         """
-        from dazzle.sentinel.models import (
-            Confidence,
-            Evidence,
-            Finding,
-            Remediation,
-            RemediationEffort,
-            Severity,
-        )
-
-        app_dir = self._project_path / "app"
-        scripts_dir = self._project_path / "scripts"
-        scan_dirs = [d for d in (app_dir, scripts_dir) if d.exists()]
-        if not scan_dirs:
-            return []
-
-        catalogue_url = (
-            "https://github.com/cyfutureuk/dazzle/blob/main/"
-            "docs/counter-priors/raw-sql-string-building.md"
-        )
-
-        findings: list[Finding] = []
-        for scan_dir in scan_dirs:
-            for py_file in sorted(scan_dir.rglob("*.py")):
-                try:
-                    source_text = py_file.read_text(encoding="utf-8")
-                    tree = ast.parse(source_text, filename=str(py_file))
-                except (SyntaxError, UnicodeDecodeError):
-                    continue
-                source_lines = source_text.splitlines()
-
-                for hit in _detect_raw_sql_string_building(tree, py_file):
-                    call_line_text = (
-                        source_lines[hit.line - 1] if 0 < hit.line <= len(source_lines) else ""
-                    )
-                    if "noqa: PA-LLM-11" in call_line_text:
-                        continue
-
-                    findings.append(
-                        Finding(
-                            agent=AgentId.PA,
-                            heuristic_id="PA-LLM-11",
-                            category="python_audit",
-                            subcategory="llm_bias",
-                            severity=Severity.MEDIUM,
-                            confidence=Confidence.LIKELY,
-                            title=f"Raw-SQL string-building: {hit.snippet}",
-                            description=(
-                                f"`{hit.snippet}` is called with a SQL string built via "
-                                "f-string / string-concat / %-format / `.format()`. If any "
-                                "interpolated value originates from a request, header, "
-                                "cookie, or other untrusted source, this is a SQL "
-                                "injection vulnerability. Even when the inputs are "
-                                "trusted today, the raw-SQL shape bypasses Dazzle's "
-                                "predicate algebra (ADR-0009) — the substrate's RBAC "
-                                "scope guarantees stop applying at this call site."
-                            ),
-                            evidence=[
-                                Evidence(
-                                    evidence_type="source_pattern",
-                                    location=f"{py_file}:{hit.line}",
-                                    snippet=hit.snippet,
-                                )
-                            ],
-                            remediation=Remediation(
-                                summary=(
-                                    "Prefer `Repository.list(scope={...})` / .aggregate() / "
-                                    ".get() which compile through the scope-validated "
-                                    "predicate algebra. When raw SQL is genuinely required, "
-                                    "use the driver's parameter substitution: "
-                                    '`cur.execute("... %s ...", (val,))` — values are passed '
-                                    "as a separate argument, not interpolated into the SQL "
-                                    "string."
-                                ),
-                                effort=RemediationEffort.SMALL,
-                                guidance=(
-                                    "See docs/counter-priors/raw-sql-string-building.md "
-                                    "for the wrong/right shape pairing and the substrate "
-                                    "rationale (ADR-0009). If you're reaching for raw SQL "
-                                    "frequently, the Repository helpers are likely missing "
-                                    "a shape — file an issue."
-                                ),
-                                references=[catalogue_url],
-                            ),
-                            catalogue_entry="raw-sql-string-building",
-                        )
-                    )
-        return findings
+        return self._file_findings("PA-LLM-11")
 
     # ------------------------------------------------------------------
     # Scanning helpers
     # ------------------------------------------------------------------
 
+    def _start_scan(self, previous: dict[str, Any] | None = None) -> ScanEngine:
+        """Begin a scan with a fresh source cache (and optional previous index)."""
+        self._scopes = {}
+        self._engine = ScanEngine(
+            {cid: check for cid, (check, _scope) in _FILE_CHECKS.items()},
+            fingerprint=_checks_fingerprint(),
+            previous=previous,
+        )
+        return self._engine
+
+    @contextmanager
+    def _active_engine(self) -> Iterator[ScanEngine]:
+        """The engine of the scan in progress, or a one-off one outside ``run``."""
+        if self._engine is not None:
+            yield self._engine
+            return
+        engine = self._start_scan()
+        try:
+            yield engine
+        finally:
+            self._engine = None
+
+    def _file_findings(self, check_id: str) -> list[Finding]:
+        """Run a per-file check over its scope via the current scan's engine."""
+        with self._active_engine() as engine:
+            return engine.findings(check_id, self._scope_files(_FILE_CHECKS[check_id][1]))
+
+    def _scope_files(self, scope: str) -> list[Path]:
+        """Files covered by a ``_FILE_CHECKS`` scope, memoised per scan."""
+        if scope not in self._scopes:
+            root = self._project_path
+            if scope == "python_files":
+                files = self._get_python_files()
+            elif scope == "pytest_files":
+                files = self._get_python_files() if (root / "conftest.py").exists() else []
+            else:
+                dirs = (
+                    [root / "app", root / "scripts"] if scope == "app_scripts" else [root / "app"]
+                )
+                files = [f for d in dirs if d.exists() for f in sorted(d.rglob("*.py"))]
+            self._scopes[scope] = files
+        return self._scopes[scope]
+
+    def _has_async_code(self) -> bool:
+        """Whether any project file defines an ``async def``."""
+        with self._active_engine() as engine:
+            for f in self._scope_files("python_files"):
+                source = engine.sources.get(f)
+                # Text pre-check so files without "async" are never parsed here.
+                if source is None or "async" not in source.text or source.tree is None:
+                    continue
+                if any(isinstance(node, ast.AsyncFunctionDef) for node in ast.walk(source.tree)):
+                    return True
+        return False
+
     def _get_scan_dirs(self) -> list[Path]:
         """Return directories to scan."""
         root = self._project_path
@@ -132,6 +132,8 @@ class ScanConfig(BaseModel):
     surface_filter: str | None = None
     trigger: ScanTrigger = ScanTrigger.MANUAL
     include_suppressed: bool = False
+    # Reuse per-file results for source files unchanged since the last scan.
+    incremental: bool = True
 
     model_config = ConfigDict(frozen=True)
 
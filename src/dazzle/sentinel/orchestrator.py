@@ -5,6 +5,7 @@ Scan orchestrator: runs agents, deduplicates findings, builds summary.
 from __future__ import annotations
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -23,6 +24,8 @@ from .store import FindingStore
 if TYPE_CHECKING:
     from dazzle.core.ir.appspec import AppSpec
 
+    from .agents.base import DetectionAgent
+
 _SEVERITY_ORDER = {
     Severity.CRITICAL: 0,
     Severity.HIGH: 1,
@@ -32,6 +35,20 @@ _SEVERITY_ORDER = {
 }
 
 
+def _run_agents(agents: list[DetectionAgent], appspec: AppSpec) -> list[AgentResult]:
+    """
+    Run agents side by side in threads.
+
+    Agents only read the AppSpec, and the slow ones wait on subprocesses
+    (ruff, semgrep) or fan out to their own process pool, so threads let
+    those waits overlap without pickling the AppSpec into workers.
+    """
+    if len(agents) <= 1:
+        return [agent.run(appspec) for agent in agents]
+    with ThreadPoolExecutor(max_workers=len(agents), thread_name_prefix="sentinel") as pool:
+        return list(pool.map(lambda agent: agent.run(appspec), agents))
+
+
 class ScanOrchestrator:
     """Run sentinel agents against an AppSpec and manage findings lifecycle."""
 
@@ -47,17 +64,15 @@ class ScanOrchestrator:
         # Select agents
         from .agents import get_all_agents
 
-        agents = get_all_agents(project_path=self._project_path)
+        agents = get_all_agents(project_path=self._project_path, incremental=config.incremental)
         if config.agents:
             wanted = set(config.agents)
             agents = [a for a in agents if a.agent_id in wanted]
 
-        # Run each agent
-        agent_results: list[AgentResult] = []
+        # Run agents concurrently; results keep agent order.
+        agent_results = _run_agents(agents, appspec)
         all_findings: list[Finding] = []
-        for agent in agents:
-            result = agent.run(appspec)
-            agent_results.append(result)
+        for result in agent_results:
             all_findings.extend(result.findings)
 
         # Stamp trigger + timestamps on each finding
@@ -0,0 +1,285 @@
+"""
+Shared source cache and incremental per-file scan engine for Sentinel.
+
+Source-level heuristics (the PA-LLM-* checks) each used to walk the
+project and ``ast.parse`` every file themselves, so one scan parsed each
+file once per heuristic. The engine instead:
+
+- reads and parses each file at most once per scan (``SourceCache``) and
+  passes the same tree and lines to every check;
+- runs all checks for one file in a single pass, fanning files out to a
+  process pool when enough of them need scanning;
+- remembers each file's content digest and per-check findings in a file
+  index (persisted by ``FindingStore``), so on the next scan an unchanged
+  file is hashed but neither parsed nor re-checked.
+
+The index is tagged with a fingerprint of the check implementations;
+changing the heuristics invalidates it wholesale.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import logging
+import multiprocessing
+import os
+from collections.abc import Callable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+from dazzle.core.process_pools import pool_context
+
+from .models import Finding
+
+logger = logging.getLogger(__name__)
+
+# Below this many files to scan, process start-up costs more than it saves.
+PARALLEL_SCAN_THRESHOLD = 24
+SENTINEL_WORKERS_ENV = "DAZZLE_SENTINEL_WORKERS"
+
+
+@dataclass
+class ParsedSource:
+    """One Python file's text, digest and (lazily) its AST."""
+
+    path: Path
+    text: str
+    digest: str
+
+    @cached_property
+    def lines(self) -> list[str]:
+        return self.text.splitlines()
+
+    @cached_property
+    def tree(self) -> ast.Module | None:
+        """Parsed module, or None if the file is not valid Python."""
+        try:
+            return ast.parse(self.text, filename=str(self.path))
+        except SyntaxError:
+            return None
+
+
+def load_source(path: Path) -> ParsedSource | None:
+    """Read ``path``; None if it is unreadable or not UTF-8."""
+    try:
+        text = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    return ParsedSource(path, text, hashlib.sha256(text.encode("utf-8")).hexdigest())
+
+
+class SourceCache:
+    """Per-scan cache: each file is read, hashed and parsed at most once."""
+
+    def __init__(self) -> None:
+        self._sources: dict[Path, ParsedSource | None] = {}
+
+    def get(self, path: Path) -> ParsedSource | None:
+        if path not in self._sources:
+            self._sources[path] = load_source(path)
+        return self._sources[path]
+
+    def tree(self, path: Path) -> ast.Module | None:
+        """AST for ``path``, or None if unreadable or unparsable."""
+        source = self.get(path)
+        return source.tree if source is not None else None
+
+
+# A per-file check: (path, parsed module, source lines) → findings. Must be a
+# module-level function so process-pool workers can pickle a reference to it.
+FileCheck = Callable[[Path, ast.Module, list[str]], list[Finding]]
+
+
+@dataclass
+class _FileEntry:
+    digest: str
+    findings: dict[str, list[Finding]] = field(default_factory=dict)
+
+
+class ScanEngine:
+    """
+    Run per-file checks over a project with shared parsing and reuse.
+
+    Args:
+        checks: Check id → per-file check function
+        fingerprint: Identifies the check implementations; a previous index
+            with a different fingerprint is ignored
+        previous: File index from the last scan (``FindingStore.load_file_index``)
+        workers: Process count for ``prefetch`` (None = automatic)
+    """
+
+    def __init__(
+        self,
+        checks: Mapping[str, FileCheck],
+        *,
+        fingerprint: str,
+        previous: dict[str, Any] | None = None,
+        workers: int | None = None,
+    ) -> None:
+        self.checks = dict(checks)
+        self.fingerprint = fingerprint
+        self.workers = workers
+        self.sources = SourceCache()
+        self._previous = _decode_index(previous, fingerprint)
+        self._entries: dict[str, _FileEntry] = {}
+        self.files_reused = 0
+
+    @property
+    def files_scanned(self) -> int:
+        """Files seen this scan whose results were not reused from the index."""
+        return len(self._entries) - self.files_reused
+
+    # ------------------------------------------------------------------
+    # Running checks
+    # ------------------------------------------------------------------
+
+    def findings(self, check_id: str, files: list[Path]) -> list[Finding]:
+        """Findings of ``check_id`` over ``files``, in file order."""
+        results: list[Finding] = []
+        for path in files:
+            results.extend(self._file_findings(check_id, path))
+        return results
+
+    def _file_findings(self, check_id: str, path: Path) -> list[Finding]:
+        source = self.sources.get(path)
+        if source is None:
+            return []
+        entry = self._entry(path, source.digest)
+        if check_id not in entry.findings:
+            if source.tree is None:
+                entry.findings[check_id] = []
+            else:
+                entry.findings[check_id] = self.checks[check_id](path, source.tree, source.lines)
+        return entry.findings[check_id]
+
+    def _entry(self, path: Path, digest: str) -> _FileEntry:
+        key = str(path)
+        entry = self._entries.get(key)
+        if entry is None or entry.digest != digest:
+            previous = self._previous.get(key)
+            if previous is not None and previous.digest == digest:
+                entry = _FileEntry(digest, dict(previous.findings))
+                self.files_reused += 1
+            else:
+                entry = _FileEntry(digest)
+            self._entries[key] = entry
+        return entry
+
+    def prefetch(self, plan: Mapping[str, list[Path]]) -> None:
+        """
+        Compute every (check, file) pair in ``plan`` ahead of ``findings``.
+
+        Files whose digest matches the previous index are skipped; the rest
+        are parsed once and run through all their checks, in a process pool
+        above ``PARALLEL_SCAN_THRESHOLD`` files. Any pool failure leaves the
+        work to ``findings``, which computes missing results inline.
+        """
+        pending: dict[Path, list[str]] = {}
+        for check_id, files in plan.items():
+            for path in files:
+                source = self.sources.get(path)
+                if source is None:
+                    continue
+                if check_id not in self._entry(path, source.digest).findings:
+                    pending.setdefault(path, []).append(check_id)
+
+        process_count = _resolve_workers(self.workers, len(pending))
+        if process_count <= 1 or multiprocessing.current_process().daemon:
+            return  # findings() computes inline, sharing the parsed sources
+        try:
+            self._prefetch_in_pool(pending, process_count)
+        except Exception:
+            logger.warning("Sentinel scan pool failed; scanning inline", exc_info=True)
+
+    def _prefetch_in_pool(self, pending: dict[Path, list[str]], process_count: int) -> None:
+        with ProcessPoolExecutor(max_workers=process_count, mp_context=pool_context()) as pool:
+            futures = {
+                path: pool.submit(
+                    _scan_file, path, tuple((cid, self.checks[cid]) for cid in check_ids)
+                )
+                for path, check_ids in pending.items()
+            }
+            for path, future in futures.items():
+                result = future.result()
+                if result is None:
+                    continue
+                digest, by_check = result
+                self._entry(path, digest).findings.update(by_check)
+
+    # ------------------------------------------------------------------
+    # Index persistence
+    # ------------------------------------------------------------------
+
+    def file_index(self) -> dict[str, Any]:
+        """JSON-serialisable index of this scan, for ``FindingStore.save_file_index``."""
+        return {
+            "fingerprint": self.fingerprint,
+            "files": {
+                key: {
+                    "digest": entry.digest,
+                    "findings": {
+                        cid: [f.model_dump(mode="json") for f in found]
+                        for cid, found in entry.findings.items()
+                    },
+                }
+                for key, entry in self._entries.items()
+            },
+        }
+
+
+def _decode_index(data: dict[str, Any] | None, fingerprint: str) -> dict[str, _FileEntry]:
+    if not data or data.get("fingerprint") != fingerprint:
+        return {}
+    entries: dict[str, _FileEntry] = {}
+    try:
+        for key, raw in data.get("files", {}).items():
+            entries[key] = _FileEntry(
+                raw["digest"],
+                {
+                    cid: [Finding.model_validate(f) for f in found]
+                    for cid, found in raw.get("findings", {}).items()
+                },
+            )
+    except (KeyError, TypeError, ValueError):
+        logger.debug("Ignoring malformed sentinel file index", exc_info=True)
+        return {}
+    return entries
+
+
+def _resolve_workers(workers: int | None, file_count: int) -> int:
+    if workers is None:
+        if file_count < PARALLEL_SCAN_THRESHOLD:
+            return 1
+        workers = os.cpu_count() or 1
+        override = os.environ.get(SENTINEL_WORKERS_ENV, "").strip()
+        if override.isdigit():
+            workers = int(override)
+    return max(1, min(workers, file_count))
+
+
+def _scan_file(
+    path: Path, checks: tuple[tuple[str, FileCheck], ...]
+) -> tuple[str, dict[str, list[Finding]]] | None:
+    """Pool worker: parse ``path`` once and run each check on it.
+
+    A check that raises is left out of the result, so the caller recomputes
+    it inline and the error surfaces through the agent's normal handling.
+    """
+    source = load_source(path)
+    if source is None:
+        return None
+    if source.tree is None:
+        return source.digest, {cid: [] for cid, _ in checks}
+    results: dict[str, list[Finding]] = {}
+    for check_id, check in checks:
+        try:
+            results[check_id] = check(path, source.tree, source.lines)
+        except Exception:
+            logger.warning(
+                "%s failed on %s in scan worker; recomputing inline", check_id, path, exc_info=True
+            )
+    return source.digest, results
@@ -12,6 +12,9 @@ from typing import Any
 
 from .models import Finding, FindingStatus, ScanResult
 
+# Per-file content digests + findings from the last scan (see scan_engine).
+_FILE_INDEX = "file_index.json"
+
 
 class FindingStore:
     """Persist and retrieve Sentinel scan results as JSON files."""
@@ -34,6 +37,15 @@ class FindingStore:
         path.write_text(json.dumps(result.model_dump(), indent=2), encoding="utf-8")
         return path
 
+    def save_file_index(self, index: dict[str, Any]) -> Path:
+        """Write the per-file scan index used for incremental scans."""
+        self._ensure_dir()
+        path = self._dir / _FILE_INDEX
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(index), encoding="utf-8")
+        tmp.replace(path)
+        return path
+
     # ------------------------------------------------------------------
     # Read
     # ------------------------------------------------------------------
@@ -52,6 +64,10 @@ class FindingStore:
             return []
         return self._load_findings(files[0])
 
+    def load_file_index(self) -> dict[str, Any] | None:
+        """Return the per-file index from the previous scan, or None."""
+        return self._read_json(self._dir / _FILE_INDEX)
+
     def load_scan(self, scan_id: str) -> ScanResult | None:
         """Load a specific scan by ID."""
         for path in self._scan_files():
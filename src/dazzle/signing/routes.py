@@ -46,7 +46,7 @@ from dazzle.http.runtime.byte_serving import AccessDecision, serve_bytes
 from dazzle.http.runtime.document_routes import _extract_file_id
 from dazzle.http.runtime.file_storage import FileMetadata
 from dazzle.http.runtime.http_errors import require_found
-from dazzle.signing.service import PdfBranding, async_sign_pdf, generate_pdf
+from dazzle.signing.service import PdfBranding, async_generate_pdf, async_sign_pdf
 from dazzle.signing.tokens import (
     InvalidTokenError,
     SigningError,
@@ -404,7 +404,7 @@ async def _handle_post(
     # {"detail": "Internal Server Error"} that tells the signer nothing
     # (#1377 — burned two trial persona runs before anyone saw the cause).
     try:
-        pdf = generate_pdf(
+        pdf = await async_generate_pdf(
             document_body,
             signer_name=signatory_name,
             branding=branding,
@@ -642,7 +642,7 @@ def _invoke_template(dotted_path: str, *, entity: EntitySpec, row: Any) -> str:
     """Resolve and invoke a project-supplied ``signing_template``.
 
     Function must return the document body HTML as a ``str``. The
-    framework feeds the result into ``generate_pdf`` for fpdf2 to
+    framework feeds the result into ``async_generate_pdf`` for fpdf2 to
     render. Async templates are not supported in phase 6a — the
     rendering happens inside a request handler that's already awaiting
     other work, and adding asyncio.run-from-inside-async ergonomics
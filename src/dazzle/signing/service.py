@@ -35,6 +35,7 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
+from dazzle.documents.pdf_pool import run_pdf_job
 from dazzle.i18n.display_locale import get_display_locale
 from dazzle.signing.tokens import SigningError
 
@@ -126,7 +127,49 @@ def generate_pdf(
 
     Letter dates use the request/tenant :class:`DisplayLocaleProfile`
     (#1597 D) — not a hard-coded UTC ``strftime``.
+
+    Synchronous and CPU-bound; from async code (route handlers) use
+    :func:`async_generate_pdf`, which renders in the PDF process pool.
     """
+    header_date, signed_date = _letter_date_strings()
+    return _render_letter_pdf(
+        letter_html, signer_name, branding, signature_png_bytes, header_date, signed_date
+    )
+
+
+async def async_generate_pdf(
+    letter_html: str,
+    signer_name: str,
+    branding: PdfBranding,
+    signature_png_bytes: bytes | None = None,
+) -> bytes:
+    """Async variant of :func:`generate_pdf` — renders off the event loop.
+
+    The letter dates are resolved here, where the request's display-locale
+    context is bound; the fpdf2 render itself runs in the shared PDF
+    process pool (``DAZZLE_PDF_WORKERS``).
+    """
+    header_date, signed_date = _letter_date_strings()
+    return await run_pdf_job(
+        _render_letter_pdf,
+        letter_html,
+        signer_name,
+        branding,
+        signature_png_bytes,
+        header_date,
+        signed_date,
+    )
+
+
+def _render_letter_pdf(
+    letter_html: str,
+    signer_name: str,
+    branding: PdfBranding,
+    signature_png_bytes: bytes | None,
+    header_date: str,
+    signed_date: str,
+) -> bytes:
+    """The fpdf2 render. Module-level and context-free so a pool worker can run it."""
     try:
         from fpdf import FPDF
     except ImportError as exc:
@@ -152,7 +195,6 @@ def generate_pdf(
     pdf.ln(5)
 
     pdf.set_font("Helvetica", "", 10)
-    header_date, signed_date = _letter_date_strings()
     pdf.cell(0, 6, f"Date: {header_date}", new_x="LMARGIN", new_y="NEXT")
     pdf.ln(5)
 
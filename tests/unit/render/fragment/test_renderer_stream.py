@@ -0,0 +1,161 @@
+"""Streamed progressive rendering: `Slot` placeholders filled in-stream.
+
+`FragmentRenderer.render_stream` flushes the shell first, then appends each
+slot's Fragment to the same response as its awaitable resolves.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from dazzle.http.runtime.renderers.fragment import stream_fragment_response
+from dazzle.render.fragment import (
+    FragmentError,
+    FragmentRenderer,
+    RawHTML,
+    RenderContext,
+    Sequence,
+    Slot,
+    Text,
+)
+
+
+async def _after(event: asyncio.Event, fragment: object) -> object:
+    await event.wait()
+    return fragment
+
+
+async def _value(fragment: object) -> object:
+    return fragment
+
+
+async def _boom() -> object:
+    raise RuntimeError("query timed out")
+
+
+async def _collect(stream) -> list[str]:
+    return [chunk async for chunk in stream]
+
+
+def _page(*children: object) -> Sequence:
+    return Sequence(children=(RawHTML("<html><body>"), *children, RawHTML("</body></html>")))
+
+
+class TestShellFirst:
+    async def test_shell_is_yielded_before_slow_fill_resolves(self) -> None:
+        release = asyncio.Event()
+        stream = FragmentRenderer().render_stream(
+            _page(Text("fast"), Slot("tile")), {"tile": _after(release, Text("slow"))}
+        )
+
+        shell = await anext(stream)
+        assert "fast" in shell
+        assert (
+            '<div id="dz-slot-tile" class="dz-slot" data-dz-slot="tile" aria-busy="true">' in shell
+        )
+        assert "slow" not in shell
+
+        release.set()
+        rest = "".join(await _collect(stream))
+        assert '<template id="dz-slot-fill-tile">' in rest
+        assert "slow" in rest
+        assert 'dzFillSlot("tile")' in rest
+
+    async def test_fills_stream_in_completion_order_inside_body(self) -> None:
+        first_done = asyncio.Event()
+        page = _page(Slot("chart"), Slot("kpi"))
+        chunks = await _collect(
+            FragmentRenderer().render_stream(
+                page,
+                {"chart": _after(first_done, Text("chart body")), "kpi": _signal(first_done)},
+            )
+        )
+
+        html = "".join(chunks)
+        assert html.index("dz-slot-fill-kpi") < html.index("dz-slot-fill-chart")
+        assert html.endswith("</body></html>")
+        assert chunks[-1] == "</body></html>"
+
+    async def test_fills_finishing_in_one_loop_turn_keep_completion_order(self) -> None:
+        for _ in range(20):
+            html = "".join(
+                await _collect(
+                    FragmentRenderer().render_stream(
+                        Sequence(children=(Slot("a"), Slot("b"), Slot("c"))),
+                        {"c": _value(Text("c")), "b": _value(Text("b")), "a": _value(Text("a"))},
+                    )
+                )
+            )
+            fills = [html.index(f"dz-slot-fill-{n}") for n in "cba"]
+            assert fills == sorted(fills)
+
+    async def test_no_slots_is_a_single_chunk(self) -> None:
+        chunks = await _collect(FragmentRenderer().render_stream(Text("plain"), {}))
+        assert chunks == [FragmentRenderer().render(Text("plain"))]
+
+
+async def _signal(event: asyncio.Event) -> object:
+    event.set()
+    return Text("kpi body")
+
+
+class TestFailures:
+    async def test_failed_fill_renders_notice_and_stream_completes(self) -> None:
+        html = "".join(
+            await _collect(
+                FragmentRenderer().render_stream(
+                    _page(Slot("ok"), Slot("bad")), {"ok": _value(Text("fine")), "bad": _boom()}
+                )
+            )
+        )
+        assert "fine" in html
+        assert 'id="dz-slot-fill-bad"><p class="dz-slot-error" role="alert">' in html
+
+    async def test_mismatched_fills_raise_before_any_output(self) -> None:
+        stream = FragmentRenderer().render_stream(Slot("tile"), {"other": _value(Text("x"))})
+        with pytest.raises(FragmentError, match="no fill for \\['tile'\\]"):
+            await anext(stream)
+
+    async def test_duplicate_slot_raises(self) -> None:
+        stream = FragmentRenderer().render_stream(
+            Sequence(children=(Slot("tile"), Slot("tile"))), {"tile": _value(Text("x"))}
+        )
+        with pytest.raises(FragmentError, match="appears twice"):
+            await anext(stream)
+
+    def test_plain_render_still_rejects_slots(self) -> None:
+        with pytest.raises(FragmentError, match="unfilled slot"):
+            FragmentRenderer().render(Slot("tile"))
+
+
+class TestScripts:
+    async def test_fill_scripts_carry_csp_nonce(self) -> None:
+        html = "".join(
+            await _collect(
+                FragmentRenderer().render_stream(
+                    Slot("tile"), {"tile": _value(Text("x"))}, RenderContext(csp_nonce="n0nce")
+                )
+            )
+        )
+        assert html.count('<script nonce="n0nce">') == 2
+
+    def test_fill_script_encodes_the_slot_name(self) -> None:
+        # `Slot` names are validated, but the fill script must not rely on it.
+        html = FragmentRenderer()._slot_fill('x");alert(1);("</b>', Text("x"), RenderContext())
+        assert 'dzFillSlot("x\\");alert(1);(\\"\\u003c/b>")' in html
+
+
+class TestStreamingResponse:
+    async def test_response_streams_shell_then_fills(self) -> None:
+        response = await stream_fragment_response(
+            _page(Slot("tile")), {"tile": _value(Text("late"))}
+        )
+        assert response.media_type == "text/html; charset=utf-8"
+        body = "".join(await _collect(response.body_iterator))
+        assert body.index("dz-slot-tile") < body.index("late")
+
+    async def test_mismatch_raises_before_response(self) -> None:
+        with pytest.raises(FragmentError):
+            await stream_fragment_response(Slot("tile"), {})
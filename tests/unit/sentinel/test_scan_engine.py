@@ -0,0 +1,136 @@
+"""Tests for the shared-parse, incremental Sentinel scan engine."""
+
+import ast
+from pathlib import Path
+
+import pytest
+
+from dazzle.sentinel.models import AgentId, Evidence, Finding, Severity
+from dazzle.sentinel.scan_engine import ScanEngine, SourceCache
+from dazzle.sentinel.store import FindingStore
+
+
+def _finding(path: Path, line: int) -> Finding:
+    return Finding(
+        agent=AgentId.PA,
+        heuristic_id="T-01",
+        category="test",
+        subcategory="test",
+        severity=Severity.LOW,
+        title="Function defined",
+        description="test finding",
+        evidence=[Evidence(evidence_type="code_pattern", location=f"{path.name}:{line}")],
+    )
+
+
+def _locations(findings: list[Finding]) -> list[str]:
+    return [f.evidence[0].location for f in findings]
+
+
+def _count_functions(path: Path, tree: ast.Module, lines: list[str]) -> list[Finding]:
+    return [_finding(path, n.lineno) for n in ast.walk(tree) if isinstance(n, ast.FunctionDef)]
+
+
+def _must_not_run(path: Path, tree: ast.Module, lines: list[str]) -> list[Finding]:
+    raise AssertionError(f"check re-ran on unchanged {path}")
+
+
+@pytest.fixture
+def files(tmp_path: Path) -> list[Path]:
+    a = tmp_path / "a.py"
+    a.write_text("def f():\n    pass\n")
+    b = tmp_path / "b.py"
+    b.write_text("x = 1\n\ndef g():\n    pass\n")
+    return [a, b]
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestSharedParsing:
+    def test_each_file_parsed_once_across_checks(self, files: list[Path]) -> None:
+        trees: list[ast.Module] = []
+
+        def _record(path: Path, tree: ast.Module, lines: list[str]) -> list[Finding]:
+            trees.append(tree)
+            return []
+
+        engine = ScanEngine({"A": _record, "B": _record}, fingerprint="v1")
+        engine.findings("A", files[:1])
+        engine.findings("B", files[:1])
+
+        assert len(trees) == 2
+        assert trees[0] is trees[1]
+
+    def test_results_follow_file_order(self, files: list[Path]) -> None:
+        engine = ScanEngine({"T-01": _count_functions}, fingerprint="v1")
+        found = engine.findings("T-01", files)
+        assert _locations(found) == ["a.py:1", "b.py:3"]
+
+    def test_unparsable_file_yields_no_findings(self, tmp_path: Path) -> None:
+        bad = tmp_path / "bad.py"
+        bad.write_text("def broken(:\n")
+        engine = ScanEngine({"T-01": _must_not_run}, fingerprint="v1")
+        assert engine.findings("T-01", [bad]) == []
+        assert SourceCache().tree(bad) is None
+
+
+class TestIncrementalReuse:
+    def test_unchanged_files_reuse_previous_findings(self, files: list[Path]) -> None:
+        first = ScanEngine({"T-01": _count_functions}, fingerprint="v1")
+        expected = first.findings("T-01", files)
+
+        second = ScanEngine({"T-01": _must_not_run}, fingerprint="v1", previous=first.file_index())
+        assert second.findings("T-01", files) == expected
+        assert second.files_reused == 2
+        assert second.files_scanned == 0
+
+    def test_changed_file_is_rescanned(self, files: list[Path]) -> None:
+        first = ScanEngine({"T-01": _count_functions}, fingerprint="v1")
+        first.findings("T-01", files)
+        files[1].write_text("def g():\n    pass\n\ndef h():\n    pass\n")
+
+        second = ScanEngine(
+            {"T-01": _count_functions}, fingerprint="v1", previous=first.file_index()
+        )
+        found = second.findings("T-01", files)
+
+        assert _locations(found) == ["a.py:1", "b.py:1", "b.py:4"]
+        assert second.files_reused == 1
+        assert second.files_scanned == 1
+
+    def test_fingerprint_change_discards_index(self, files: list[Path]) -> None:
+        first = ScanEngine({"T-01": _count_functions}, fingerprint="v1")
+        first.findings("T-01", files)
+
+        second = ScanEngine(
+            {"T-01": _count_functions}, fingerprint="v2", previous=first.file_index()
+        )
+        second.findings("T-01", files)
+        assert second.files_reused == 0
+
+    def test_malformed_index_is_ignored(self, files: list[Path]) -> None:
+        engine = ScanEngine(
+            {"T-01": _count_functions},
+            fingerprint="v1",
+            previous={"fingerprint": "v1", "files": {str(files[0]): {"findings": {}}}},
+        )
+        assert len(engine.findings("T-01", files)) == 2
+        assert engine.files_reused == 0
+
+
+class TestFileIndexPersistence:
+    def test_round_trip(self, tmp_path: Path, files: list[Path]) -> None:
+        engine = ScanEngine({"T-01": _count_functions}, fingerprint="v1")
+        engine.findings("T-01", files)
+        store = FindingStore(tmp_path)
+
+        store.save_file_index(engine.file_index())
+
+        assert store.load_file_index() == engine.file_index()
+        assert store.list_scans() == []
+
+    def test_missing_index_loads_as_none(self, tmp_path: Path) -> None:
+        assert FindingStore(tmp_path).load_file_index() is None
@@ -14,8 +14,11 @@ from dazzle.db.artifact_registry import (
     in_baseline_tables,
 )
 
-# The framework tables in the ADR-0044 baseline (32 since ADR-0050 added
-# _dazzle_usage_events; was 31 since #1499 added _dazzle_outbox).
+# The framework tables in the ADR-0044 baseline (35 since the Postgres
+# job queue added _dazzle_job_queue; 34 since mapping redelivery added
+# _dazzle_mapping_redelivery; 33 since the cluster
+# scheduler added schedule_fires; was 32 since ADR-0050 added
+# _dazzle_usage_events, 31 since #1499 added _dazzle_outbox).
 _EXPECTED_BASELINE = frozenset(
     {
         "_dazzle_params",
@@ -37,6 +40,7 @@ _EXPECTED_BASELINE = frozenset(
         "join_requests",
         "process_runs",
         "process_tasks",
+        "schedule_fires",
         "_dazzle_audit_log",
         "_dazzle_atomic_audit",
         "dazzle_files",
@@ -49,6 +53,8 @@ _EXPECTED_BASELINE = frozenset(
         "_dazzle_event_inbox",
         "_dazzle_event_outbox",
         "_dazzle_outbox",
+        "_dazzle_mapping_redelivery",
+        "_dazzle_job_queue",
         "_dazzle_usage_events",
     }
 )
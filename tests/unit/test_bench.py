@@ -0,0 +1,230 @@
+"""``dazzle bench``: AppSpec → workload, concurrent runner, stats, perf-store export."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+from dazzle.perf.bench import (
+    DEFAULT_MIX,
+    BenchContext,
+    BenchRun,
+    BenchSample,
+    BenchTarget,
+    build_workload,
+    create_payload,
+    export_run,
+    percentile,
+    prime_ids,
+    run_bench,
+    runnable,
+    summarize,
+    target_weights,
+)
+from dazzle.perf.storage import get_run, iter_spans
+
+_DSL = """\
+module test
+app test_app "Test App"
+
+entity User "User":
+  id: uuid pk
+  email: str(200) required
+
+entity Task "Task":
+  id: uuid pk
+  title: str(200) required
+  status: enum[todo,done]=todo
+  priority: int
+  archived: bool = false
+  owner: ref User required
+
+  permit:
+    list: role(member) or role(admin)
+    read: role(member) or role(admin)
+    create: role(admin)
+
+  scope:
+    list: all
+      as: *
+    read: all
+      as: *
+    create: all
+      as: admin
+
+surface task_list "Tasks":
+  uses entity Task
+  mode: list
+
+  section main "Tasks":
+    field title "Title"
+
+  ux:
+    filter: status, archived, priority
+    search: title
+
+workspace board "Board":
+  access: persona(admin)
+
+  tasks:
+    source: Task
+    display: list
+
+persona admin "Admin":
+  goals: ["Run the board"]
+
+persona member "Member":
+  goals: ["Do tasks"]
+"""
+
+
+def _build_appspec(dsl: str) -> Any:
+    from dazzle.core.linker import build_appspec
+    from dazzle.core.parser import parse_modules
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".dsl", delete=False) as f:
+        f.write(dsl)
+        fpath = Path(f.name)
+    try:
+        modules = parse_modules([fpath])
+        return build_appspec(modules, modules[0].name)
+    finally:
+        os.unlink(fpath)
+
+
+@pytest.fixture(scope="module")
+def appspec() -> Any:
+    return _build_appspec(_DSL)
+
+
+def _routes(targets: list[BenchTarget], persona: str) -> set[str]:
+    return {t.route for t in targets if t.persona == persona}
+
+
+class TestWorkload:
+    def test_each_persona_gets_list_filter_search_and_detail(self, appspec: Any) -> None:
+        routes = _routes(build_workload(appspec), "member")
+        assert {
+            "GET /app/task",
+            "GET /app/task?filter[status]=todo",
+            "GET /app/task?filter[archived]=true",
+            "GET /app/task?search",
+            "GET /app/task/{id}",
+        } <= routes
+
+    def test_filters_without_a_safe_value_are_skipped(self, appspec: Any) -> None:
+        routes = _routes(build_workload(appspec), "member")
+        assert not any("priority" in r for r in routes)
+
+    def test_create_and_workspace_follow_access_rules(self, appspec: Any) -> None:
+        targets = build_workload(appspec)
+        assert {"POST /tasks", "GET /app/workspaces/board"} <= _routes(targets, "admin")
+        assert not {"POST /tasks", "GET /app/workspaces/board"} & _routes(targets, "member")
+
+    def test_read_only_and_persona_filter(self, appspec: Any) -> None:
+        targets = build_workload(appspec, personas=["admin"], read_only=True)
+        assert {t.persona for t in targets} == {"admin"}
+        assert all(t.kind != "create" for t in targets)
+
+    def test_mix_is_split_evenly_within_a_kind(self) -> None:
+        targets = [
+            BenchTarget("a", "list", "GET", "/x", "GET /x"),
+            BenchTarget("a", "list", "GET", "/y", "GET /y"),
+            BenchTarget("a", "create", "POST", "/xs", "POST /xs"),
+        ]
+        assert target_weights(targets, DEFAULT_MIX) == [15.0, 15.0, 5.0]
+
+    def test_create_payload_fills_required_fields_and_refs(self, appspec: Any) -> None:
+        task = appspec.get_entity("Task")
+        body = create_payload(task, 3, {"User": ["u1", "u2"]})
+        assert body["owner"] == "u2"
+        assert body["title"]
+        assert "id" not in body and "priority" not in body
+
+
+def _server(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/tasks" and request.method == "GET":
+        return httpx.Response(200, json={"items": [{"id": "t1"}, {"id": "t2"}]})
+    if request.url.path == "/users":
+        return httpx.Response(200, json={"items": [{"id": "u1"}]})
+    if request.method == "POST":
+        return httpx.Response(201, json=json.loads(request.content))
+    if request.url.path == "/app/task/missing":
+        return httpx.Response(404)
+    return httpx.Response(200, text="<html></html>")
+
+
+class TestRunner:
+    async def _run(self, appspec: Any, **options: Any) -> tuple[list[BenchTarget], BenchRun]:
+        targets = build_workload(appspec)
+        context = BenchContext(
+            headers={"admin": {"Cookie": "a"}, "member": {"Cookie": "m"}},
+            entities={e.name: e for e in appspec.domain.entities},
+        )
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(_server), base_url="http://bench"
+        ) as client:
+            await prime_ids(client, targets, context)
+            targets = runnable(targets, context)
+            run = await run_bench(client, targets, context, duration=0.2, **options)
+        return targets, run
+
+    async def test_closed_loop_issues_every_kind(self, appspec: Any) -> None:
+        targets, run = await self._run(appspec, concurrency=4)
+        assert {s.kind for s in run.samples} == {t.kind for t in targets}
+        assert all(s.ok for s in run.samples)
+        detail = next(s for s in run.samples if s.kind == "detail")
+        assert detail.route == "GET /app/task/{id}"
+
+    async def test_open_loop_respects_the_arrival_rate(self, appspec: Any) -> None:
+        _, run = await self._run(appspec, concurrency=2, rate=50.0)
+        # ~10 Poisson arrivals expected in 0.2s; far below the closed-loop count.
+        assert 0 < len(run.samples) < 60
+        assert run.rate == 50.0
+
+    async def test_detail_without_ids_is_dropped(self, appspec: Any) -> None:
+        context = BenchContext(headers={}, entities={"Task": appspec.get_entity("Task")})
+        targets = [t for t in build_workload(appspec) if t.kind in ("detail", "create")]
+        assert runnable(targets, context) == []
+
+
+def _sample(route: str, ms: int, status: int = 200) -> BenchSample:
+    return BenchSample(route, "list", "admin", status, 1_000, ms * 1_000_000)
+
+
+class TestResults:
+    def test_nearest_rank_percentile(self) -> None:
+        ordered = list(range(1, 101))
+        assert percentile(ordered, 50) == 50
+        assert percentile(ordered, 99) == 99
+        assert percentile([7], 95) == 7
+        assert percentile([], 50) == 0
+
+    def test_summary_per_route(self) -> None:
+        samples = [_sample("GET /a", ms) for ms in range(1, 21)] + [_sample("GET /b", 5, 500)]
+        run = BenchRun(samples, elapsed_s=2.0, started_at="s", ended_at="e", concurrency=1)
+        a, b = summarize(run)
+        assert (a.route, a.count, a.errors, a.throughput) == ("GET /a", 20, 0, 10.0)
+        assert (a.p50_ms, a.p95_ms, a.p99_ms) == (10.0, 19.0, 20.0)
+        assert (b.route, b.errors) == ("GET /b", 1)
+
+    def test_export_is_readable_by_the_perf_store(self, tmp_path: Path) -> None:
+        samples = [_sample("GET /a", 3), _sample("GET /a", 4, 503)]
+        run = BenchRun(samples, elapsed_s=1.0, started_at="s", ended_at="e", concurrency=1)
+        db = export_run(run, tmp_path / "perf" / "r1.db", run_id="r1", command_line="dazzle bench")
+
+        stored = get_run(db, "r1")
+        assert stored is not None and stored.ended_at == "e"
+        spans = list(iter_spans(db, "r1"))
+        assert [(s.name, s.kind, s.status) for s in spans] == [
+            ("GET /a", "client", "ok"),
+            ("GET /a", "client", "error"),
+        ]
+        assert spans[1].attributes["http.status_code"] == 503
+        assert spans[0].duration_ns == 3_000_000
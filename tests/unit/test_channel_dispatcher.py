@@ -0,0 +1,210 @@
+"""
+Unit tests for the concurrent channel outbox dispatcher.
+
+Runs against an in-memory outbox so claiming, concurrency caps and the
+wake-up loop are exercised without a database.
+"""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from dazzle.http.channels.adapters import FileEmailAdapter, SendResult
+from dazzle.http.channels.adapters.base import EmailAdapter, SendStatus
+from dazzle.http.channels.detection import DetectionResult, ProviderStatus
+from dazzle.http.channels.dispatcher import OutboxDispatcher
+from dazzle.http.channels.outbox import OutboxMessage, create_outbox_message
+
+
+class MemoryOutbox:
+    """Stands in for OutboxRepository: claim pops, results are recorded."""
+
+    def __init__(self, messages: list[OutboxMessage] | None = None):
+        self.pending = list(messages or [])
+        self.claims: list[int] = []
+        self.sent: list[str] = []
+        self.sent_calls = 0
+        self.failed: dict[str, str] = {}
+
+    def claim_pending(self, limit: int = 100) -> list[OutboxMessage]:
+        batch, self.pending = self.pending[:limit], self.pending[limit:]
+        self.claims.append(len(batch))
+        return batch
+
+    def mark_sent_many(self, message_ids: list[str]) -> None:
+        self.sent_calls += 1
+        self.sent.extend(message_ids)
+
+    def mark_failed(self, message_id: str, error: str) -> None:
+        self.failed[message_id] = error
+
+
+class SlowAdapter(EmailAdapter):
+    """Records how many sends are in flight at once."""
+
+    def __init__(self, provider: str = "slow", *, fail_for: str | None = None):
+        super().__init__(
+            DetectionResult(
+                provider_name=provider,
+                status=ProviderStatus.AVAILABLE,
+                detection_method="test",
+            )
+        )
+        self._provider = provider
+        self._fail_for = fail_for
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def provider_name(self) -> str:
+        return self._provider
+
+    async def send(self, message: OutboxMessage) -> SendResult:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        if message.recipient == self._fail_for:
+            return SendResult(status=SendStatus.FAILED, error="mailbox full")
+        return SendResult(status=SendStatus.SUCCESS, message_id=message.id)
+
+
+def _messages(count: int, channel: str = "notifications") -> list[OutboxMessage]:
+    return [
+        create_outbox_message(
+            channel_name=channel,
+            operation_name="welcome",
+            message_type="WelcomeEmail",
+            payload={"to": f"user{i}@example.com", "subject": "Welcome"},
+            recipient=f"user{i}@example.com",
+        )
+        for i in range(count)
+    ]
+
+
+class TestDispatchBatch:
+    """One claim → concurrent sends → bulk result write."""
+
+    @pytest.mark.asyncio
+    async def test_sends_batch_concurrently_and_marks_sent_once(self):
+        outbox = MemoryOutbox(_messages(20))
+        adapter = SlowAdapter()
+        dispatcher = OutboxDispatcher(outbox, {"notifications": adapter}, channel_concurrency=20)
+
+        sent = await dispatcher.dispatch_once()
+
+        assert sent == 20
+        assert outbox.claims == [20]
+        assert outbox.sent_calls == 1
+        assert adapter.max_in_flight > 1
+
+    @pytest.mark.asyncio
+    async def test_channel_concurrency_cap(self):
+        outbox = MemoryOutbox(_messages(12))
+        adapter = SlowAdapter()
+        dispatcher = OutboxDispatcher(outbox, {"notifications": adapter}, channel_concurrency=3)
+
+        assert await dispatcher.dispatch_once() == 12
+        assert adapter.max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_provider_cap_spans_channels(self):
+        outbox = MemoryOutbox(_messages(8, "alerts") + _messages(8, "digests"))
+        shared = SlowAdapter("smtp")
+        dispatcher = OutboxDispatcher(
+            outbox,
+            {"alerts": shared, "digests": shared},
+            channel_concurrency=8,
+            provider_concurrency=4,
+        )
+
+        assert await dispatcher.dispatch_once() == 16
+        assert shared.max_in_flight == 4
+
+    @pytest.mark.asyncio
+    async def test_failures_are_recorded_individually(self):
+        messages = _messages(3) + _messages(1, "unknown")
+        outbox = MemoryOutbox(messages)
+
+        class Exploding(SlowAdapter):
+            async def send(self, message: OutboxMessage) -> SendResult:
+                if message.recipient == "user1@example.com":
+                    raise ConnectionError("relay down")
+                return await super().send(message)
+
+        adapter = Exploding(fail_for="user2@example.com")
+        dispatcher = OutboxDispatcher(outbox, {"notifications": adapter})
+
+        assert await dispatcher.dispatch_once() == 1
+        assert outbox.sent == [messages[0].id]
+        assert outbox.failed == {
+            messages[1].id: "relay down",
+            messages[2].id: "mailbox full",
+            messages[3].id: "No adapter for channel 'unknown'",
+        }
+
+    @pytest.mark.asyncio
+    async def test_file_sender_receives_every_message(self, tmp_path: Path):
+        adapter = FileEmailAdapter(
+            DetectionResult(
+                provider_name="file",
+                status=ProviderStatus.AVAILABLE,
+                connection_url=f"file://{tmp_path}",
+                detection_method="fallback",
+            )
+        )
+        await adapter.initialize()
+        outbox = MemoryOutbox(_messages(10))
+        dispatcher = OutboxDispatcher(outbox, {"notifications": adapter})
+
+        assert await dispatcher.dispatch_once() == 10
+        index = json.loads((tmp_path / "index.json").read_text())
+        assert len(index["messages"]) == 10
+
+
+class TestRunLoop:
+    """Back-to-back claims under backlog; wake-ups instead of sleeping."""
+
+    @pytest.mark.asyncio
+    async def test_drains_backlog_without_sleeping(self):
+        outbox = MemoryOutbox(_messages(25))
+        dispatcher = OutboxDispatcher(
+            outbox, {"notifications": SlowAdapter()}, batch_size=10, poll_interval=60
+        )
+
+        task = asyncio.create_task(dispatcher.run())
+        try:
+            for _ in range(200):
+                if len(outbox.sent) == 25:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        assert len(outbox.sent) == 25
+        assert outbox.claims[:3] == [10, 10, 5]
+
+    @pytest.mark.asyncio
+    async def test_wake_starts_next_claim_immediately(self):
+        outbox = MemoryOutbox()
+        dispatcher = OutboxDispatcher(outbox, {"notifications": SlowAdapter()}, poll_interval=60)
+
+        task = asyncio.create_task(dispatcher.run())
+        try:
+            await asyncio.sleep(0.05)  # first (empty) claim, now sleeping
+            outbox.pending.extend(_messages(2))
+            dispatcher.wake()
+            for _ in range(100):
+                if len(outbox.sent) == 2:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        assert len(outbox.sent) == 2
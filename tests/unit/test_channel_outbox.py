@@ -204,6 +204,70 @@ class TestOutboxRepository:
         claimed_again = outbox_repo.mark_processing(msg.id)
         assert claimed_again is False
 
+    def test_claim_pending_claims_batch_once(self, outbox_repo):
+        """A claimed batch is moved to processing and not handed out again."""
+        for i in range(3):
+            outbox_repo.create(
+                create_outbox_message(
+                    channel_name="notifications",
+                    operation_name="test",
+                    message_type="TestMessage",
+                    payload={},
+                    recipient=f"user{i}@example.com",
+                )
+            )
+        outbox_repo.create(
+            create_outbox_message(
+                channel_name="notifications",
+                operation_name="test",
+                message_type="TestMessage",
+                payload={},
+                recipient="later@example.com",
+                scheduled_for=datetime.now(UTC) + timedelta(hours=1),
+            )
+        )
+
+        claimed = outbox_repo.claim_pending(limit=10)
+
+        assert [m.recipient for m in claimed] == [f"user{i}@example.com" for i in range(3)]
+        assert all(m.status == OutboxStatus.PROCESSING for m in claimed)
+        assert outbox_repo.claim_pending(limit=10) == []
+
+    def test_claim_pending_reclaims_stale_processing(self, outbox_repo):
+        """A message stuck in processing past the lease is claimable again."""
+        msg = create_outbox_message(
+            channel_name="notifications",
+            operation_name="test",
+            message_type="TestMessage",
+            payload={},
+            recipient="user@example.com",
+        )
+        outbox_repo.create(msg)
+        assert len(outbox_repo.claim_pending()) == 1
+
+        assert outbox_repo.claim_pending(lease_seconds=300) == []
+        assert [m.id for m in outbox_repo.claim_pending(lease_seconds=-1)] == [msg.id]
+
+    def test_mark_sent_many(self, outbox_repo):
+        """Bulk success write marks every message sent."""
+        messages = [
+            create_outbox_message(
+                channel_name="notifications",
+                operation_name="test",
+                message_type="TestMessage",
+                payload={},
+                recipient=f"user{i}@example.com",
+            )
+            for i in range(2)
+        ]
+        for msg in messages:
+            outbox_repo.create(msg)
+
+        outbox_repo.mark_sent_many([m.id for m in messages])
+
+        for msg in messages:
+            assert outbox_repo.get(msg.id).status == OutboxStatus.SENT
+
     def test_mark_sent(self, outbox_repo):
         """Test marking a message as sent."""
         msg = create_outbox_message(
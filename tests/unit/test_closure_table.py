@@ -0,0 +1,251 @@
+"""Closure tables for self-referential hierarchies (``dazzle db closure``)."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+import uuid
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from alembic.operations import ops as aops
+from pydantic import BaseModel
+
+from dazzle.db.closure import (
+    ClosureCheck,
+    ClosureSpec,
+    check_closure,
+    closure_specs,
+    closure_table_name,
+)
+from dazzle.db.migration_engine import build_closure_plan
+from dazzle.http.converters.entity_converter import convert_entity
+from dazzle.http.runtime.model_generator import (
+    generate_create_schema,
+    generate_entity_model,
+    generate_update_schema,
+)
+from dazzle.http.runtime.repository import Repository, _resolve_recursive_traversal_fields
+
+_PG = os.environ.get("TEST_DATABASE_URL") or os.environ.get("DATABASE_URL")
+
+_DSL = """\
+module test
+app test_app "Test App"
+
+entity Department "Department":
+  id: uuid pk
+  name: str(100) required
+  parent_department: ref Department
+  all_descendants: descendants_of self via parent_department
+  ancestor_chain: ancestors_of self via parent_department
+
+entity Person "Person":
+  id: uuid pk
+  all_reports: descendants_of self via ManagerLink.manager
+
+entity ManagerLink "ManagerLink":
+  id: uuid pk
+  manager: ref Person required
+  report: ref Person required
+"""
+
+
+def _build_appspec(dsl: str) -> Any:
+    from dazzle.core.linker import build_appspec
+    from dazzle.core.parser import parse_modules
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".dsl", delete=False) as f:
+        f.write(dsl)
+        fpath = Path(f.name)
+    try:
+        modules = parse_modules([fpath])
+        return build_appspec(modules, modules[0].name)
+    finally:
+        os.unlink(fpath)
+
+
+@pytest.fixture(scope="module")
+def appspec() -> Any:
+    return _build_appspec(_DSL)
+
+
+def _make_db(*query_responses: list[dict]) -> MagicMock:
+    cursor = MagicMock()
+    cursor.fetchall = MagicMock(side_effect=list(query_responses))
+    conn = MagicMock()
+    conn.cursor = MagicMock(return_value=cursor)
+    ctx = MagicMock()
+    ctx.__enter__ = MagicMock(return_value=conn)
+    ctx.__exit__ = MagicMock(return_value=False)
+    db = MagicMock()
+    db.placeholder = "%s"
+    db.connection = MagicMock(return_value=ctx)
+    db._mock_cursor = cursor
+    return db
+
+
+def _department(appspec: Any) -> Any:
+    return next(e for e in appspec.domain.entities if e.name == "Department")
+
+
+class TestSpecs:
+    def test_one_spec_per_self_ref_hierarchy(self, appspec: Any) -> None:
+        # Both traversal fields share the FK; the junction walk is skipped.
+        assert closure_specs(appspec) == [ClosureSpec("Department", "parent_department", "uuid")]
+
+    def test_long_names_are_hashed_under_the_identifier_limit(self) -> None:
+        name = closure_table_name("OrganisationalUnitHierarchy" * 2, "parent_organisational_unit")
+        assert len(name) == 63
+        assert name.endswith("_closure")
+        assert name != closure_table_name("OrganisationalUnitHierarchy" * 2, "parent_unit_other")
+
+
+class TestSql:
+    spec = ClosureSpec("Department", "parent_department")
+
+    def test_create_declares_table_index_and_triggers(self) -> None:
+        ddl = self.spec.create_sql()
+        assert ddl[0].startswith(
+            'CREATE TABLE IF NOT EXISTS "Department_parent_department_closure"'
+        )
+        assert "PRIMARY KEY (ancestor_id, descendant_id)" in ddl[0]
+        assert "(descendant_id, ancestor_id)" in ddl[1]
+        assert "RETURNS trigger" in ddl[2] and "check_violation" in ddl[2]
+        assert 'AFTER INSERT OR DELETE OR UPDATE OF "parent_department"' in ddl[4]
+        assert "AFTER TRUNCATE" in ddl[6]
+
+    def test_backfill_walks_with_cycle_guard(self) -> None:
+        truncate, insert = self.spec.backfill_sql()
+        assert truncate == 'TRUNCATE "Department_parent_department_closure"'
+        assert "WITH RECURSIVE walk" in insert
+        assert "CYCLE descendant_id SET is_cycle" in insert
+        assert 't."parent_department" = w.descendant_id' in insert
+
+    def test_plan_creates_then_backfills_and_drops_in_reverse(self) -> None:
+        plan = build_closure_plan([self.spec], {"Department": {"columns": {}}})
+        upgrade = [op.sqltext for op in plan.upgrade_ops.ops]
+        assert all(isinstance(op, aops.ExecuteSQLOp) for op in plan.upgrade_ops.ops)
+        assert upgrade == [*self.spec.create_sql(), *self.spec.backfill_sql()]
+        assert [op.sqltext for op in plan.downgrade_ops.ops] == self.spec.drop_sql()
+        assert "Department" in plan.snapshot_literal
+        assert build_closure_plan([], {}).is_empty
+
+    def test_check_ok_needs_an_installed_table_without_drift(self) -> None:
+        assert ClosureCheck(self.spec, exists=True).ok
+        assert not ClosureCheck(self.spec, exists=False).ok
+        assert not ClosureCheck(self.spec, exists=True, missing=2).ok
+
+
+class TestRuntime:
+    closures = {"parent_department": "Department_parent_department_closure"}
+
+    def test_closure_join_replaces_walk_and_second_fetch(self, appspec: Any) -> None:
+        db = _make_db(
+            [
+                {"_closure_root": "d1", "id": "d2", "name": "Child"},
+                {"_closure_root": "d1", "id": "d3", "name": "Grandchild"},
+            ],
+            [{"_closure_root": "d2", "id": "d1", "name": "Root"}],
+        )
+        rows = [{"id": "d1"}, {"id": "d2"}]
+        _resolve_recursive_traversal_fields(
+            rows, _department(appspec), db, "Department", self.closures
+        )
+
+        descendants_sql, ancestors_sql = (c.args[0] for c in db._mock_cursor.execute.call_args_list)
+        assert "WITH RECURSIVE" not in descendants_sql
+        assert 'FROM "Department_parent_department_closure" c' in descendants_sql
+        assert "t.id = c.descendant_id WHERE c.ancestor_id IN (%s, %s)" in descendants_sql
+        assert "t.id = c.ancestor_id WHERE c.descendant_id IN" in ancestors_sql
+        assert [r["name"] for r in rows[0]["all_descendants"]] == ["Child", "Grandchild"]
+        assert rows[1]["all_descendants"] == []
+        assert rows[1]["ancestor_chain"] == [{"id": "d1", "name": "Root"}]
+
+    def test_converted_spec_keeps_the_traversal(self, appspec: Any) -> None:
+        # The runtime spec is what Repository sees; a plain str mapping here
+        # left every traversal (and closure) branch unreachable.
+        fields = {f.name: f for f in convert_entity(_department(appspec)).fields}
+        descendants = fields["all_descendants"].type
+        assert (descendants.traversal, descendants.via_field) == (
+            "descendants_of",
+            "parent_department",
+        )
+        assert fields["ancestor_chain"].type.traversal == "ancestors_of"
+        assert fields["name"].type.traversal is None
+
+    def test_models_treat_traversals_as_read_only_lists(self, appspec: Any) -> None:
+        spec = convert_entity(_department(appspec))
+        model = generate_entity_model(spec)
+        row = model(id=uuid.uuid4(), name="Root", all_descendants=[{"id": "d2"}])
+        assert row.all_descendants == [{"id": "d2"}]
+        assert "all_descendants" not in generate_create_schema(spec).model_fields
+        assert "ancestor_chain" not in generate_update_schema(spec).model_fields
+
+    def test_repository_probes_once_and_caches(self, appspec: Any) -> None:
+        db = _make_db([{"name": "Department_parent_department_closure"}])
+        repo = Repository(db, convert_entity(_department(appspec)), BaseModel)
+        assert repo._closure_tables() == self.closures
+        assert repo._closure_tables() == self.closures
+        assert db._mock_cursor.execute.call_count == 1
+        assert db._mock_cursor.execute.call_args.args[1] == [
+            ["Department_parent_department_closure"]
+        ]
+
+
+@pytest.mark.postgres
+@pytest.mark.skipif(not _PG, reason="no TEST_DATABASE_URL / DATABASE_URL — needs real Postgres")
+class TestTriggerOnPostgres:
+    """The PL/pgSQL trigger keeps the closure equal to the recursive walk."""
+
+    def test_insert_reparent_and_delete_keep_the_closure_in_step(self) -> None:
+        import psycopg
+        from psycopg.rows import dict_row
+
+        spec = ClosureSpec(f"dept_{uuid.uuid4().hex[:8]}", "parent_department")
+        host = f'"{spec.entity}"'
+        root, other, child, grandchild, leaf = (uuid.uuid4() for _ in range(5))
+
+        async def run() -> list[ClosureCheck]:
+            checks = []
+            async with await psycopg.AsyncConnection.connect(
+                _PG, autocommit=True, row_factory=dict_row
+            ) as conn:
+                await conn.execute(
+                    f"CREATE TABLE {host} (id uuid PRIMARY KEY, parent_department uuid)"
+                )
+                try:
+                    for sql in spec.create_sql():
+                        await conn.execute(sql)
+                    insert = f"INSERT INTO {host} (id, parent_department) VALUES (%s, %s)"
+                    for node, parent in (
+                        (root, None),
+                        (other, None),
+                        (child, root),
+                        (grandchild, child),
+                        (leaf, grandchild),
+                    ):
+                        await conn.execute(insert, [node, parent])
+                    checks.append(await check_closure(conn, spec))
+
+                    move = f"UPDATE {host} SET parent_department = %s WHERE id = %s"
+                    await conn.execute(move, [other, child])
+                    checks.append(await check_closure(conn, spec))
+
+                    with pytest.raises(psycopg.errors.CheckViolation):
+                        await conn.execute(move, [leaf, other])
+
+                    await conn.execute(f"DELETE FROM {host} WHERE id = %s", [grandchild])
+                    checks.append(await check_closure(conn, spec))
+                finally:
+                    for sql in spec.drop_sql():
+                        await conn.execute(sql)
+                    await conn.execute(f"DROP TABLE {host}")
+            return checks
+
+        checks = asyncio.run(run())
+        assert [(c.missing, c.extra) for c in checks] == [(0, 0)] * 3
+        assert all(c.ok for c in checks)
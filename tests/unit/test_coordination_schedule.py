@@ -0,0 +1,356 @@
+"""Tests for the cluster-safe scheduler (``dazzle.core.coordination.schedule``).
+
+Tests cover:
+
+  * `due_fires` — on-time window, catch-up policies (skip / latest /
+    all), the `all` replay limit
+  * Interval schedules fire on epoch-aligned slots
+  * `ScheduleRunner.tick` — fires once per window, resumes from the
+    ledger's newest fire, never double-fires a window another replica
+    claimed, releases the claim on a failed dispatch, followers fire
+    nothing, schedules added mid-run, sleeps until the next fire
+  * `PgScheduleLedger` — lease SQL, claim/release SQL, boot-DDL gate,
+    connection dropped (lease lost) on error
+  * Process schedules — cron over interval, `catch_up` → policy,
+    invalid cron not scheduled
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from dazzle.core.coordination.schedule import (
+    MemoryScheduleLedger,
+    PgScheduleLedger,
+    ScheduleRunner,
+    cron_entry,
+    due_fires,
+    interval_entry,
+)
+from dazzle.core.cron import parse_cron
+from dazzle.core.ir.jobs import JobCatchUp
+from dazzle.core.process.postgres_adapter import _schedule_entry
+
+_T0 = datetime(2026, 7, 1, 12, 0, tzinfo=UTC)
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def _hourly(catch_up: JobCatchUp = JobCatchUp.LATEST):
+    return cron_entry("hourly", parse_cron("0 * * * *"), catch_up)
+
+
+# ---------------------------------------------------------------------------
+# due_fires
+# ---------------------------------------------------------------------------
+
+
+class TestDueFires:
+    def test_on_time_window_fires_under_every_policy(self):
+        for policy in JobCatchUp:
+            due, dropped = due_fires(
+                _hourly(policy), after=_T0 - timedelta(minutes=1), now=_T0 + timedelta(seconds=5)
+            )
+            assert (due, dropped) == ([_T0], 0)
+
+    def test_nothing_due_between_windows(self):
+        assert due_fires(_hourly(), after=_T0, now=_T0 + timedelta(minutes=30)) == ([], 0)
+
+    @pytest.mark.parametrize(
+        ("policy", "expected", "dropped"),
+        [
+            (JobCatchUp.SKIP, [], 3),
+            (JobCatchUp.LATEST, [_T0 + timedelta(hours=2)], 2),
+            (
+                JobCatchUp.ALL,
+                [_T0, _T0 + timedelta(hours=1), _T0 + timedelta(hours=2)],
+                0,
+            ),
+        ],
+    )
+    def test_missed_windows(self, policy, expected, dropped):
+        # Down from 11:30 until 14:10 — the 12:00, 13:00 and 14:00 windows were missed.
+        due, n = due_fires(
+            _hourly(policy),
+            after=_T0 - timedelta(minutes=30),
+            now=_T0 + timedelta(hours=2, minutes=10),
+        )
+        assert due == expected
+        assert n == dropped
+
+    def test_all_replays_only_the_newest_limit(self):
+        due, dropped = due_fires(
+            _hourly(JobCatchUp.ALL), after=_T0, now=_T0 + timedelta(hours=10), limit=3
+        )
+        assert due == [_T0 + timedelta(hours=h) for h in (8, 9, 10)]
+        assert dropped == 7
+
+    def test_interval_slots_are_epoch_aligned(self):
+        entry = interval_entry("every_15m", 900)
+        assert entry.next_fire(_T0 + timedelta(minutes=7)) == _T0 + timedelta(minutes=15)
+        assert entry.next_fire(_T0) == _T0 + timedelta(minutes=15)
+
+    def test_interval_must_be_positive(self):
+        with pytest.raises(ValueError, match="must be > 0"):
+            interval_entry("bad", 0)
+
+
+# ---------------------------------------------------------------------------
+# ScheduleRunner
+# ---------------------------------------------------------------------------
+
+
+class _Clock:
+    def __init__(self, now: datetime) -> None:
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+class _Follower(MemoryScheduleLedger):
+    def acquire(self) -> bool:
+        return False
+
+
+def _runner(entries, ledger=None, *, clock, fired=None, fail=False, **kwargs):
+    fired = fired if fired is not None else []
+
+    async def _fire(name: str, fire_at: datetime) -> None:
+        if fail:
+            raise RuntimeError("queue down")
+        fired.append((name, fire_at))
+
+    runner = ScheduleRunner(
+        entries, _fire, ledger or MemoryScheduleLedger(), scope="job", clock=clock, **kwargs
+    )
+    return runner, fired
+
+
+class TestScheduleRunner:
+    def test_fires_each_window_once(self):
+        clock = _Clock(_T0 + timedelta(seconds=2))
+        runner, fired = _runner([_hourly()], clock=clock)
+        _run(runner.tick())
+        _run(runner.tick())
+        clock.now = _T0 + timedelta(hours=1, seconds=1)
+        _run(runner.tick())
+        assert fired == [("hourly", _T0), ("hourly", _T0 + timedelta(hours=1))]
+        assert runner.stats["fired"] == 2
+
+    def test_sleeps_until_the_next_fire(self):
+        clock = _Clock(_T0 + timedelta(minutes=59, seconds=50))
+        runner, _ = _runner([_hourly()], clock=clock, max_sleep=300)
+        assert _run(runner.tick()) == 10.0
+
+    def test_sleep_capped_by_max_sleep(self):
+        runner, _ = _runner([_hourly()], clock=_Clock(_T0 + timedelta(minutes=5)), max_sleep=30)
+        assert _run(runner.tick()) == 30
+
+    def test_new_leader_catches_up_from_the_ledger(self):
+        ledger = MemoryScheduleLedger()
+        ledger.claim("job:hourly", _T0 - timedelta(hours=1))  # previous leader's last fire
+        clock = _Clock(_T0 + timedelta(hours=2, minutes=5))
+        runner, fired = _runner([_hourly(JobCatchUp.ALL)], ledger, clock=clock)
+        _run(runner.tick())
+        assert [f for _, f in fired] == [_T0 + timedelta(hours=h) for h in range(3)]
+
+    def test_first_run_does_not_replay_history(self):
+        clock = _Clock(_T0 + timedelta(minutes=5))
+        runner, fired = _runner([_hourly(JobCatchUp.ALL)], clock=clock)
+        _run(runner.tick())
+        assert fired == []
+
+    def test_window_claimed_elsewhere_not_fired(self):
+        ledger = MemoryScheduleLedger()
+        ledger.claim("job:hourly", _T0)  # another replica got there first
+        runner, fired = _runner([_hourly()], ledger, clock=_Clock(_T0 + timedelta(seconds=1)))
+        _run(runner.tick())
+        assert fired == []
+
+    def test_failed_fire_releases_claim_and_retries(self):
+        ledger = MemoryScheduleLedger()
+        clock = _Clock(_T0 + timedelta(seconds=1))
+        runner, _ = _runner([_hourly()], ledger, clock=clock, fail=True, max_sleep=5)
+        assert _run(runner.tick()) == 5
+        assert runner.stats["loop_errors"] == 1
+        assert ledger.claim("job:hourly", _T0) is True  # claim was released
+
+    def test_follower_fires_nothing(self):
+        runner, fired = _runner([_hourly()], _Follower(), clock=_Clock(_T0), max_sleep=15)
+        assert _run(runner.tick()) == 15
+        assert fired == []
+
+    def test_schedule_added_while_running(self):
+        clock = _Clock(_T0 + timedelta(seconds=1))
+        runner, fired = _runner([], clock=clock)
+        _run(runner.tick())
+        runner.add(_hourly())
+        _run(runner.tick())
+        assert fired == [("hourly", _T0)]
+
+    def test_run_stops_on_event_and_closes_ledger(self):
+        closed: list[bool] = []
+
+        class _Ledger(MemoryScheduleLedger):
+            def close(self) -> None:
+                closed.append(True)
+
+        async def go():
+            stop = asyncio.Event()
+            asyncio.get_running_loop().call_later(0.05, stop.set)
+            runner, _ = _runner([_hourly()], _Ledger(), clock=_Clock(_T0), max_sleep=0.01)
+            return await runner.run(stop)
+
+        stats = _run(go())
+        assert stats["ticks"] >= 1
+        assert closed == [True]
+
+
+# ---------------------------------------------------------------------------
+# PgScheduleLedger
+# ---------------------------------------------------------------------------
+
+
+class _FakeConn:
+    def __init__(self, rows: list[Any]) -> None:
+        self.rows = rows
+        self.statements: list[tuple[str, Any]] = []
+        self.commits = 0
+        self.closed = False
+        self.fail = False
+
+    def cursor(self) -> _FakeConn:
+        return self
+
+    def __enter__(self) -> _FakeConn:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def execute(self, sql: str, params: Any = None) -> None:
+        if self.fail:
+            raise RuntimeError("connection lost")
+        self.statements.append((" ".join(sql.split()), params))
+
+    def fetchone(self) -> Any:
+        return self.rows.pop(0) if self.rows else None
+
+    def fetchall(self) -> Any:
+        return self.rows.pop(0) if self.rows else []
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _ledger(conn: _FakeConn) -> PgScheduleLedger:
+    return PgScheduleLedger(lambda: conn, lock_key=42, worker="w1")
+
+
+class TestPgScheduleLedger:
+    def test_leader_takes_lock_and_ensures_table(self):
+        conn = _FakeConn([(True,)])
+        with patch("dazzle.core.coordination.schedule.skip_boot_schema_ddl", return_value=False):
+            assert _ledger(conn).acquire() is True
+        sqls = [s for s, _ in conn.statements]
+        assert sqls[0] == "SELECT pg_try_advisory_lock(%s)"
+        assert conn.statements[0][1] == (42,)
+        assert any("CREATE TABLE IF NOT EXISTS schedule_fires" in s for s in sqls)
+
+    def test_production_skips_boot_ddl(self):
+        conn = _FakeConn([(True,)])
+        with patch("dazzle.core.coordination.schedule.skip_boot_schema_ddl", return_value=True):
+            _ledger(conn).acquire()
+        assert not any("CREATE TABLE" in s for s, _ in conn.statements)
+
+    def test_follower_keeps_asking(self):
+        conn = _FakeConn([(False,), (False,)])
+        ledger = _ledger(conn)
+        assert ledger.acquire() is False
+        assert ledger.acquire() is False
+        assert [s for s, _ in conn.statements] == ["SELECT pg_try_advisory_lock(%s)"] * 2
+
+    def test_leader_confirms_connection(self):
+        conn = _FakeConn([(True,)])
+        ledger = _ledger(conn)
+        with patch("dazzle.core.coordination.schedule.skip_boot_schema_ddl", return_value=True):
+            ledger.acquire()
+            assert ledger.acquire() is True
+        assert conn.statements[-1][0] == "SELECT 1"
+
+    def test_claim_is_insert_on_conflict(self):
+        conn = _FakeConn([(_T0,), None])
+        ledger = _ledger(conn)
+        ledger._conn = conn
+        assert ledger.claim("job:hourly", _T0) is True
+        assert ledger.claim("job:hourly", _T0) is False
+        sql, params = conn.statements[0]
+        assert "ON CONFLICT DO NOTHING RETURNING fire_at" in sql
+        assert params == ("job:hourly", _T0 - timedelta(days=1), "job:hourly", _T0, "w1")
+        assert conn.commits == 2
+
+    def test_claim_prunes_fires_past_the_retention_window(self):
+        conn = _FakeConn([(_T0,)])
+        ledger = PgScheduleLedger(lambda: conn, lock_key=42, worker="w1", retain=timedelta(hours=2))
+        ledger._conn = conn
+        ledger.claim("job:hourly", _T0)
+        sql, params = conn.statements[0]
+        assert sql.startswith(
+            "WITH pruned AS (DELETE FROM schedule_fires WHERE schedule = %s AND fire_at < %s)"
+        )
+        assert params[:2] == ("job:hourly", _T0 - timedelta(hours=2))
+
+    def test_last_fires_and_release(self):
+        conn = _FakeConn([[("job:hourly", _T0)]])
+        ledger = _ledger(conn)
+        ledger._conn = conn
+        assert ledger.last_fires(["job:hourly"]) == {"job:hourly": _T0}
+        ledger.release("job:hourly", _T0)
+        assert conn.statements[-1] == (
+            "DELETE FROM schedule_fires WHERE schedule = %s AND fire_at = %s",
+            ("job:hourly", _T0),
+        )
+
+    def test_error_drops_connection_and_lease(self):
+        conn = _FakeConn([(True,)])
+        ledger = _ledger(conn)
+        with patch("dazzle.core.coordination.schedule.skip_boot_schema_ddl", return_value=True):
+            ledger.acquire()
+        conn.fail = True
+        with pytest.raises(RuntimeError):
+            ledger.claim("job:hourly", _T0)
+        assert conn.closed
+        assert ledger._conn is None
+
+
+# ---------------------------------------------------------------------------
+# Process schedules
+# ---------------------------------------------------------------------------
+
+
+class TestProcessScheduleEntry:
+    def test_cron_preferred_over_interval(self):
+        entry = _schedule_entry({"name": "nightly", "cron": "0 2 * * *", "interval_seconds": 60})
+        assert entry is not None
+        assert entry.next_fire(_T0) == _T0 + timedelta(hours=14)
+
+    def test_catch_up_flag_maps_to_policy(self):
+        replay = _schedule_entry({"name": "a", "interval_seconds": 60, "catch_up": True})
+        drop = _schedule_entry({"name": "b", "interval_seconds": 60})
+        assert replay is not None and replay.catch_up is JobCatchUp.ALL
+        assert drop is not None and drop.catch_up is JobCatchUp.SKIP
+
+    def test_invalid_or_empty_schedule_not_scheduled(self):
+        assert _schedule_entry({"name": "bad", "cron": "every day"}) is None
+        assert _schedule_entry({"name": "none"}) is None
@@ -6,10 +6,11 @@ enqueue purely-scheduled jobs.
 
 Tests cover:
 
-  * `parse_cron` — `*`, `*/N`, literal int, all 5 fields,
-    invalid-format / out-of-bounds rejection
+  * `parse_cron` — `*`, `*/N`, literal int, ranges, comma-lists,
+    all 5 fields, invalid-format / out-of-bounds rejection
   * `cron_matches` — datetime → bool for every field
   * `due_jobs` — multi-job dispatch + last-fired dedupe
+  * `next_fire` — next matching minute, day skipping, never-fires
   * POSIX weekday convention (0 = Sunday)
 """
 
@@ -23,6 +24,7 @@ from dazzle.http.runtime.cron import (
     CronParseError,
     cron_matches,
     due_jobs,
+    next_fire,
     parse_cron,
 )
 
@@ -98,11 +100,34 @@ class TestParseCronErrors:
             parse_cron(None)  # type: ignore[arg-type]
 
     def test_unsupported_form_rejected(self):
-        # Comma-lists / ranges out of scope for cycle 7.
+        # Named weekdays / months stay out of scope.
         with pytest.raises(CronParseError, match="only"):
-            parse_cron("1,5,10 * * * *")
+            parse_cron("0 0 * * MON")
         with pytest.raises(CronParseError, match="only"):
-            parse_cron("1-5 * * * *")
+            parse_cron("1,,5 * * * *")
+
+    def test_backwards_range_rejected(self):
+        with pytest.raises(CronParseError, match="runs backwards"):
+            parse_cron("0 0 * * 5-1")
+
+
+class TestParseCronListsAndRanges:
+    def test_comma_list(self):
+        assert parse_cron("1,5,10 * * * *").minute == frozenset({1, 5, 10})
+
+    def test_range(self):
+        assert parse_cron("0 0 * * 1-5").weekday == frozenset({1, 2, 3, 4, 5})
+
+    def test_stepped_range_and_start_step(self):
+        assert parse_cron("10-30/10 * * * *").minute == frozenset({10, 20, 30})
+        assert parse_cron("45/5 * * * *").minute == frozenset({45, 50, 55})
+
+    def test_list_of_mixed_items(self):
+        assert parse_cron("0 1,12-13 * * *").hour == frozenset({1, 12, 13})
+
+    def test_range_bounds_checked(self):
+        with pytest.raises(CronParseError, match="out of bounds"):
+            parse_cron("0 20-25 * * *")
 
 
 # ---------------------------------------------------------------------------
@@ -249,3 +274,44 @@ class TestDueJobs:
             last_fired_minute={},
         )
         assert result == expected
+
+
+# ---------------------------------------------------------------------------
+# next_fire
+# ---------------------------------------------------------------------------
+
+
+class TestNextFire:
+    def test_next_minute_is_strictly_after(self):
+        c = parse_cron("* * * * *")
+        assert next_fire(c, _at(hour=1, minute=0)) == _at(hour=1, minute=1)
+
+    def test_seconds_ignored(self):
+        c = parse_cron("* * * * *")
+        after = datetime(2026, 5, 4, 1, 0, 30, tzinfo=UTC)
+        assert next_fire(c, after) == _at(hour=1, minute=1)
+
+    def test_later_the_same_day(self):
+        c = parse_cron("30 9,17 * * *")
+        assert next_fire(c, _at(hour=10)) == _at(hour=17, minute=30)
+
+    def test_rolls_to_the_next_matching_day(self):
+        # Weekdays only: Friday 2026-05-08 18:00 → Monday 2026-05-11 09:00.
+        c = parse_cron("0 9 * * 1-5")
+        assert next_fire(c, _at(day=8, hour=18)) == _at(day=11, hour=9)
+
+    def test_yearly_schedule(self):
+        c = parse_cron("0 0 1 1 *")
+        assert next_fire(c, _at()) == _at(year=2027, month=1, day=1)
+
+    def test_leap_day(self):
+        c = parse_cron("0 0 29 2 *")
+        assert next_fire(c, _at()) == _at(year=2028, month=2, day=29)
+
+    def test_never_fires(self):
+        assert next_fire(parse_cron("0 0 31 2 *"), _at()) is None
+
+    def test_agrees_with_cron_matches(self):
+        c = parse_cron("*/20 3 * * 0")
+        when = next_fire(c, _at())
+        assert when is not None and cron_matches(c, when)
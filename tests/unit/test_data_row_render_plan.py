@@ -0,0 +1,133 @@
+"""The compiled per-table render plan behind the rich data-table row.
+
+`render_data_row` / `render_data_table_rows` resolve a table's column type
+dispatch, formatter options and escaped attrs once (`_TablePlan`) and reuse
+it for every row and every request. These tests pin the reuse and that the
+plan path renders exactly what a freshly compiled table dict does — the
+bytes themselves are pinned by `test_data_row_characterization_1505.py`.
+"""
+
+import pytest
+
+from dazzle.render.fragment.primitives import DataTable, RowCapabilities
+from dazzle.render.fragment.renderer import _data_row
+from dazzle.render.fragment.renderer._data_row import (
+    _compile_cell_display,
+    _data_row_plan,
+    _render_cell_display,
+    _render_table_row,
+    render_data_row,
+    render_data_table_rows,
+)
+
+
+def _columns() -> tuple[dict, ...]:
+    return (
+        {"key": "title", "type": "text", "label": "Title"},
+        {"key": "status", "type": "badge", "filter_options": ["open", "done"]},
+        {"key": "owner", "type": "ref"},
+        {"key": "amount", "type": "currency", "currency_code": "EUR"},
+        {"key": "due", "type": "date"},
+        {"key": "internal", "type": "text", "hidden": True},
+    )
+
+
+_CAPS = RowCapabilities(bulk_select=True, inline_editable=("title", "status"), drill=True)
+_ITEMS = [
+    {
+        "id": f"r{i}",
+        "title": f"Row {i}",
+        "status": "open" if i % 2 else "done",
+        "owner": {"id": "u1", "name": "Ada"},
+        "amount": 10.5 * i,
+        "due": "2026-06-28",
+    }
+    for i in range(5)
+]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_data_row, "_PLAN_CACHE", {})
+
+
+class TestPlanReuse:
+    def test_equal_specs_share_one_plan(self) -> None:
+        first = _data_row_plan(_columns(), _CAPS, entity_name="Task")
+        # Fresh but equal column mappings (a new request) hit the same entry.
+        assert _data_row_plan(_columns(), _CAPS, entity_name="Task") is first
+
+    def test_spec_change_compiles_a_new_plan(self) -> None:
+        plan = _data_row_plan(_columns(), _CAPS, entity_name="Task")
+        denied = RowCapabilities(bulk_select=True, inline_editable=("title",), update=False)
+        assert _data_row_plan(_columns(), denied, entity_name="Task") is not plan
+        assert _data_row_plan(_columns(), _CAPS, entity_name="Note") is not plan
+
+    def test_columns_compiled_once_per_table(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls: list[str] = []
+        real = _data_row._compile_cell_display
+
+        def _counting(col, **kwargs):
+            calls.append(col["key"])
+            return real(col, **kwargs)
+
+        monkeypatch.setattr(_data_row, "_compile_cell_display", _counting)
+        dt = DataTable(
+            columns=_columns(), rows=tuple(_ITEMS), entity_name="Task", capabilities=_CAPS
+        )
+
+        render_data_table_rows(dt)
+        render_data_table_rows(dt)
+
+        # Hidden columns are never compiled; visible ones once, not per row.
+        assert calls == ["title", "status", "owner", "amount", "due"]
+
+    def test_cache_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(_data_row, "_PLAN_CACHE_MAX", 3)
+        for i in range(6):
+            _data_row_plan(_columns(), _CAPS, table_id=f"t{i}")
+        assert len(_data_row._PLAN_CACHE) == 3
+
+
+class TestPlanParity:
+    def test_table_rows_match_per_row_compilation(self) -> None:
+        table = {
+            "columns": list(_columns()),
+            "entity_name": "Task",
+            "api_endpoint": "/api/tasks",
+            "detail_url_template": "/app/task/{id}",
+            "bulk_actions": True,
+            "inline_editable": ["title", "status"],
+            "table_id": "dt-table",
+            "peek_mode": "off",
+        }
+        dt = DataTable(
+            columns=_columns(),
+            rows=tuple(_ITEMS),
+            entity_name="Task",
+            api_endpoint="/api/tasks",
+            detail_url_template="/app/task/{id}",
+            capabilities=_CAPS,
+        )
+        expected = "".join(_render_table_row(table, dict(item)) for item in _ITEMS)
+        assert render_data_table_rows(dt) == expected
+
+    def test_cached_plan_renders_each_row_independently(self) -> None:
+        html = [render_data_row(_columns(), item, _CAPS, entity_name="Task") for item in _ITEMS]
+        assert len(set(html)) == len(_ITEMS)
+        assert 'data-dz-row-id="r3"' in html[3]
+        assert "Row 3" in html[3]
+
+    def test_file_formatter_takes_row_context_per_call(self) -> None:
+        display = _compile_cell_display({"type": "file", "key": "doc"})
+        assert "/_dazzle/documents/Task/r1/doc/file" in display("a.pdf", "Task", "r1")
+        assert "/_dazzle/documents/Task/r2/doc/file" in display("a.pdf", "Task", "r2")
+        # No row context (the detail seam) → the stored value is the href.
+        assert _render_cell_display({"type": "file", "key": "doc"}, "a.pdf").startswith(
+            '<a href="a.pdf"'
+        )
+
+    def test_detail_text_wrapper_is_a_separate_formatter(self) -> None:
+        col = {"type": "text"}
+        assert "dz-tr-cell-truncate" in _compile_cell_display(col)("x", "", "")
+        assert "dz-detail-text" in _compile_cell_display(col, truncate=False)("x", "", "")
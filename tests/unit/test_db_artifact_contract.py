@@ -45,15 +45,26 @@ def _resolve(dotted: str) -> object:
     raise ModuleNotFoundError(dotted)
 
 
+_RUN_BOOT_SCHEMA_DDL = "dazzle.core.environment.run_boot_schema_ddl"
+
+
 def _calls_skip_boot(dotted: str) -> bool:
     """True iff the function actually GUARDS on skip_boot_schema_ddl — i.e. contains
     ``if skip_boot_schema_ddl(): <return/raise>``. Checks the guard structure, not mere
     name presence, so a copy-paste that calls skip_boot_schema_ddl() without the
-    early-return (the result ignored) does NOT pass."""
+    early-return (the result ignored) does NOT pass. Delegating to the shared
+    ``run_boot_schema_ddl`` helper counts, since it carries that guard itself."""
     fn = _resolve(dotted)
     src = textwrap.dedent(inspect.getsource(fn))  # type: ignore[arg-type]
     tree = ast.parse(src)
     for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id == "run_boot_schema_ddl"
+            and dotted != _RUN_BOOT_SCHEMA_DDL
+        ):
+            return _calls_skip_boot(_RUN_BOOT_SCHEMA_DDL)
         if (
             isinstance(node, ast.If)
             and isinstance(node.test, ast.Call)
@@ -124,9 +135,11 @@ _ALLOWLIST = frozenset(
         "dazzle.http.runtime.pg_backend._create_table_sql",
         "dazzle.http.runtime.pg_backend._create_index_sql",
         "dazzle.http.runtime.relation_loader.get_foreign_key_indexes",
-        "dazzle.http.runtime.fts_postgres.PostgresFTSBackend.create_fts_index",
+        "dazzle.http.runtime.fts_postgres.PostgresFTSBackend._replace_fts_indexes",
         "dazzle.http.runtime.search_schema.build_search_index_ddl",
         "dazzle.cli.runtime_impl.build._generate_sql_target",  # codegen SQL target
+        "dazzle.db.index_advisor.IndexAdvice.create_sql",  # advised app-entity indexes
+        "dazzle.db.closure.ClosureSpec.create_sql",  # opt-in app-entity closure tables
         # ── non-app-DB stores (SQLite / ops) ──
         "dazzle.mcp.knowledge_graph.store.KnowledgeGraph._init_schema",  # SQLite KG (ADR-0008 ok)
         "dazzle.core.process.version_manager.VersionManager.initialize",  # SQLite version store
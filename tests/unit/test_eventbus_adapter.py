@@ -520,6 +520,14 @@ class TestEventBusProcessAdapter:
         assert not EventBusProcessAdapter._cron_matches(
             "*/5 * * * *", datetime(2026, 2, 22, 10, 31)
         )
+        # POSIX weekdays: 2026-02-22 is a Sunday, which is 0.
+        assert EventBusProcessAdapter._cron_matches("30 10 * * 0", datetime(2026, 2, 22, 10, 30))
+        assert not EventBusProcessAdapter._cron_matches(
+            "30 10 * * 6", datetime(2026, 2, 22, 10, 30)
+        )
+        # Ranges are understood; an invalid expression never fires.
+        assert EventBusProcessAdapter._cron_matches("25-35 * * * *", datetime(2026, 2, 22, 10, 30))
+        assert not EventBusProcessAdapter._cron_matches("61 * * * *", datetime(2026, 2, 22, 10, 30))
 
     @pytest.mark.asyncio
     async def test_register_process(self):
@@ -0,0 +1,102 @@
+"""Differential tests: ``FastLexer`` must be bit-identical to the reference ``Lexer``.
+
+Every DSL file under ``examples/`` and ``fixtures/`` is tokenised by both
+implementations and the token streams compared field-for-field. Hand-written
+edge cases and a Hypothesis property cover the shapes the corpus does not
+(unicode identifiers, CRLF, tabs, escapes, unterminated strings, stray
+characters) — including that errors carry the same message and location.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from hypothesis import HealthCheck, given, settings
+from hypothesis import strategies as st
+
+from dazzle.core.errors import ParseError
+from dazzle.core.fast_lexer import FastLexer
+from dazzle.core.lexer import Lexer, Token, tokenize
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+_CORPUS = sorted(
+    p for d in ("examples", "fixtures") for p in (REPO_ROOT / d).rglob("*.dsl") if p.is_file()
+)
+
+_FILE = Path("t.dsl")
+
+
+def _run(lexer_cls: type[Lexer] | type[FastLexer], text: str) -> list[Token] | tuple[str, object]:
+    try:
+        return lexer_cls(text, _FILE).tokenize()
+    except ParseError as e:
+        ctx = e.context
+        return ("error", (e.message, ctx.line if ctx else None, ctx.column if ctx else None))
+
+
+def _assert_identical(text: str) -> None:
+    assert _run(FastLexer, text) == _run(Lexer, text)
+
+
+def test_corpus_is_non_trivial() -> None:
+    assert len(_CORPUS) > 50
+
+
+@pytest.mark.parametrize("path", _CORPUS, ids=lambda p: str(p.relative_to(REPO_ROOT)))
+def test_corpus_file_identical(path: Path) -> None:
+    _assert_identical(path.read_text(encoding="utf-8"))
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "module a\n",
+        "module a",
+        "entity Task:\n  id: uuid pk\n\tname: str\n",
+        "entity T:\r\n  a: int\r\n\r\n  b: int\r\n",
+        "  # indented comment\n# top comment\nx\n",
+        "x # trailing comment",
+        "name café_2 naïve _x ünïcode²\n",
+        "a: 7d 24h 30min 2w 3m 1y 7days 1.5d 7d_x 12abc 1..2\n",
+        'a "esc \\n \\t \\\\ \\" \\q" \'it\\\'s "q"\'\n',
+        'a "multi\nline" b\n  c\n',
+        "a == b != c >= d <= e -> f <- g <-> h < i > j = k - l\n",
+        "f(a, [b]) . ? / + * % $ |\n",
+        "a:\n    b:\n  c\n",
+        "a:\n  b:\n    c\n",
+        "a\n   \n  b\n",
+        '"unterminated',
+        'ok "bad \\',
+        "a ! b",
+        "a @ b",
+        "a \x0b b",
+        "x ٣ y",
+        "a:\n  b\n c\n",
+    ],
+)
+def test_edge_cases_identical(text: str) -> None:
+    _assert_identical(text)
+
+
+_ALPHABET = st.sampled_from(
+    list("abcxyz_AZ0179 \t\r\n\"'\\#:,()[].?/+*%$|=<>-!@é²٣")
+    + ["entity ", "surface ", "min", "\n  ", "\n    ", "7d", "->", "<->"]
+)
+
+
+@settings(max_examples=300, suppress_health_check=[HealthCheck.too_slow], deadline=None)
+@given(st.lists(_ALPHABET, max_size=80).map("".join))
+def test_random_input_identical(text: str) -> None:
+    _assert_identical(text)
+
+
+def test_tokenize_defaults_to_fast_path() -> None:
+    text = 'module a\napp a "A"\n'
+    assert tokenize(text, _FILE) == tokenize(text, _FILE, fast=False)
+
+
+def test_tokens_are_slotted() -> None:
+    token = tokenize("a", _FILE)[0]
+    assert not hasattr(token, "__dict__")
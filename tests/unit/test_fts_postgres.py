@@ -49,113 +49,228 @@ def _make_entity_spec(name: str, fields: list[str]) -> MagicMock:
 # ===========================================================================
 
 
+def _executed(cursor) -> list[str]:
+    return [c[0][0] for c in cursor.execute.call_args_list]
+
+
+_SEARCH_VECTOR_EXPR = (
+    "(setweight(to_tsvector('english'::regconfig, COALESCE(title, ''::text)), 'A'::\"char\") "
+    "|| setweight(to_tsvector('english'::regconfig, COALESCE(description, ''::text)), "
+    "'C'::\"char\"))"
+)
+
+
 class TestPostgresFTSBackendCreateIndex:
-    def test_creates_gin_index(self):
+    def test_reuses_covering_search_vector(self):
         backend = PostgresFTSBackend()
-        conn, cursor = _make_mock_conn()
+        conn, cursor = _make_mock_conn(fetchone_val=(_SEARCH_VECTOR_EXPR,))
 
         backend.create_fts_index(conn, "Task", ["title", "description"])
 
+        introspect, indexes = _executed(cursor)
+        assert "information_schema.columns" in introspect
+        assert "pg_index" in indexes
+        assert cursor.execute.call_args_list[0][0][1] == ("Task", "search_vector")
+        conn.commit.assert_not_called()
+
+        conn, cursor = _make_mock_conn(fetchall_val=[])
+        backend.search(conn, "Task", "hello", ["title", "description"])
         sql = cursor.execute.call_args[0][0]
-        assert "CREATE INDEX IF NOT EXISTS" in sql
-        assert '"idx_Task_fts"' in sql
-        assert "USING GIN" in sql
-        assert "to_tsvector" in sql
-        assert '"title"' in sql
-        assert '"description"' in sql
+        assert 'WHERE "search_vector" @@ fts_query ' in sql
+        assert "to_tsvector" not in sql
+
+    def test_expression_index_when_search_vector_misses_a_field(self):
+        backend = PostgresFTSBackend()
+        conn, cursor = _make_mock_conn(fetchone_val=(_SEARCH_VECTOR_EXPR,))
+        conn.autocommit = False
+
+        backend.create_fts_index(conn, "Task", ["title", "body"])
+
+        create = _executed(cursor)[2]
+        assert create.startswith('CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_Task_fts_')
+        assert 'ON "Task" USING GIN((setweight(' in create
+        assert "ADD COLUMN" not in " ".join(_executed(cursor))
         conn.commit.assert_called_once()
+        assert conn.autocommit is False
+
+    def test_expression_index_when_configuration_differs(self):
+        backend = PostgresFTSBackend(_language="spanish")
+        conn, cursor = _make_mock_conn(fetchone_val=(_SEARCH_VECTOR_EXPR,))
+
+        backend.create_fts_index(conn, "Task", ["title"])
 
-    def test_single_field_index(self):
+        assert "'spanish'" in _executed(cursor)[2]
+
+    def test_expression_index_when_no_search_vector(self):
         backend = PostgresFTSBackend()
         conn, cursor = _make_mock_conn()
+        cursor.fetchone.return_value = None
 
         backend.create_fts_index(conn, "Note", ["body"])
 
-        sql = cursor.execute.call_args[0][0]
-        assert '"body"' in sql
-        assert "|| ' ' ||" not in sql  # single field, no concatenation
+        create = _executed(cursor)[2]
+        assert '"body"' in create
+        assert "||" not in create  # single field, no concatenation
 
-    def test_custom_language(self):
-        backend = PostgresFTSBackend(_language="spanish")
+    def test_changed_fields_get_a_new_index_name(self):
+        names = []
+        for fields in (["title"], ["title", "body"]):
+            conn, cursor = _make_mock_conn()
+            cursor.fetchone.return_value = None
+            PostgresFTSBackend().create_fts_index(conn, "Task", fields)
+            names.append(_executed(cursor)[2].split('"')[1])
+        assert names[0] != names[1]
+
+    def test_weights_follow_field_order(self):
+        backend = PostgresFTSBackend()
         conn, cursor = _make_mock_conn()
+        cursor.fetchone.return_value = None
 
-        backend.create_fts_index(conn, "Task", ["title"])
+        backend.create_fts_index(conn, "Task", ["title", "summary", "body", "notes"])
 
-        sql = cursor.execute.call_args[0][0]
-        assert "'spanish'" in sql
+        create = _executed(cursor)[2]
+        for field, weight in [("title", "A"), ("summary", "B"), ("body", "C"), ("notes", "C")]:
+            assert f"COALESCE(\"{field}\", '')), '{weight}')" in create
+
+    def _index_name(self, fields: list[str]) -> str:
+        conn, cursor = _make_mock_conn(fetchall_val=[])
+        cursor.fetchone.return_value = None
+        PostgresFTSBackend().create_fts_index(conn, "Task", fields)
+        return _executed(cursor)[2].split('"')[1]
+
+    def test_superseded_indexes_are_dropped_concurrently(self):
+        current = self._index_name(["title", "body"])
+        conn, cursor = _make_mock_conn(
+            fetchall_val=[
+                ("idx_Task_fts", True),
+                ("idx_Task_fts_0123abcd", True),
+                (current, True),
+                ("idx_Task_ftsearch", True),  # not ours
+            ]
+        )
+        cursor.fetchone.return_value = None
+
+        PostgresFTSBackend().create_fts_index(conn, "Task", ["title", "body"])
+
+        ddl = _executed(cursor)[2:]
+        assert ddl == [
+            'DROP INDEX CONCURRENTLY IF EXISTS "idx_Task_fts"',
+            'DROP INDEX CONCURRENTLY IF EXISTS "idx_Task_fts_0123abcd"',
+        ]
+
+    def test_covering_search_vector_drops_expression_indexes(self):
+        conn, cursor = _make_mock_conn(
+            fetchone_val=(_SEARCH_VECTOR_EXPR,), fetchall_val=[("idx_Task_fts_0123abcd", True)]
+        )
+
+        PostgresFTSBackend().create_fts_index(conn, "Task", ["title", "description"])
+
+        assert _executed(cursor)[2:] == [
+            'DROP INDEX CONCURRENTLY IF EXISTS "idx_Task_fts_0123abcd"'
+        ]
+
+    def test_current_index_is_left_alone(self):
+        current = self._index_name(["title"])
+        conn, cursor = _make_mock_conn(fetchall_val=[(current, True)])
+        cursor.fetchone.return_value = None
+
+        PostgresFTSBackend().create_fts_index(conn, "Task", ["title"])
+
+        assert len(_executed(cursor)) == 2
+        conn.commit.assert_not_called()
+
+    def test_invalid_current_index_is_rebuilt(self):
+        current = self._index_name(["title"])
+        conn, cursor = _make_mock_conn(fetchall_val=[(current, False)])
+        cursor.fetchone.return_value = None
+
+        PostgresFTSBackend().create_fts_index(conn, "Task", ["title"])
+
+        drop, create = _executed(cursor)[2:]
+        assert drop == f'DROP INDEX CONCURRENTLY IF EXISTS "{current}"'
+        assert create.startswith(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{current}"')
 
 
 class TestPostgresFTSBackendSearch:
-    def test_search_generates_correct_sql(self):
+    def test_search_is_one_ranked_query_with_window_count(self):
         backend = PostgresFTSBackend()
-        conn, cursor = _make_mock_conn(fetchone_val=(3,), fetchall_val=[])
+        conn, cursor = _make_mock_conn(fetchall_val=[("id-1", 0.5, 3), ("id-2", 0.2, 3)])
 
         ids, total = backend.search(conn, "Task", "hello", ["title", "description"])
 
         assert total == 3
-        assert ids == []
-        # Two execute calls: count + search
-        assert cursor.execute.call_count == 2
+        assert ids == ["id-1", "id-2"]
+        assert cursor.execute.call_count == 1
 
-        count_sql = cursor.execute.call_args_list[0][0][0]
-        assert "COUNT(*)" in count_sql
-        assert "plainto_tsquery" in count_sql
-        assert "@@" in count_sql
-
-        search_sql = cursor.execute.call_args_list[1][0][0]
-        assert "ts_rank" in search_sql
-        assert "ORDER BY rank DESC" in search_sql
-        assert "LIMIT %s OFFSET %s" in search_sql
+        sql = cursor.execute.call_args[0][0]
+        assert "count(*) OVER () AS total" in sql
+        assert "ts_rank_cd((setweight(" in sql
+        assert "plainto_tsquery('english', %s) AS fts_query" in sql
+        # Matches the expression index's expression exactly.
+        assert "'A') || setweight(" in sql
+        assert "ORDER BY rank DESC" in sql
+        assert "LIMIT %s OFFSET %s" in sql
 
     def test_search_with_field_filter(self):
         backend = PostgresFTSBackend()
-        conn, cursor = _make_mock_conn(
-            fetchone_val=(1,),
-            fetchall_val=[("id-1", 0.5)],
-        )
+        conn, cursor = _make_mock_conn(fetchall_val=[("id-1", 0.5, 1)])
 
         ids, total = backend.search(
-            conn, "Task", "hello", ["title", "description"], fields=["title"]
+            conn, "Task", "hello", ["title", "description"], fields=["description"]
         )
 
         assert total == 1
         assert ids == ["id-1"]
 
-        # The count SQL should only use the 'title' tsvector
-        count_sql = cursor.execute.call_args_list[0][0][0]
-        assert '"title"' in count_sql
-        # Description should NOT be in the count query
-        assert '"description"' not in count_sql
+        sql = cursor.execute.call_args[0][0]
+        # Indexed vector narrows the candidates; the subset re-checks them.
+        assert "'B')) @@ fts_query AND (" in sql
+        assert "COALESCE(\"description\", '')), 'B')) @@ fts_query" in sql
 
     def test_search_invalid_fields_falls_back(self):
         backend = PostgresFTSBackend()
-        conn, cursor = _make_mock_conn(fetchone_val=(0,), fetchall_val=[])
+        conn, cursor = _make_mock_conn(fetchall_val=[])
 
         backend.search(conn, "Task", "hello", ["title"], fields=["nonexistent"])
 
-        # Should fall back to all searchable_fields
-        count_sql = cursor.execute.call_args_list[0][0][0]
-        assert '"title"' in count_sql
+        # Should fall back to all searchable_fields — the full vector alone
+        sql = cursor.execute.call_args[0][0]
+        assert " AND (" not in sql
 
     def test_search_params_count(self):
         backend = PostgresFTSBackend()
-        conn, cursor = _make_mock_conn(fetchone_val=(0,), fetchall_val=[])
+        conn, cursor = _make_mock_conn(fetchall_val=[("id-1", 0.5, 6)])
 
         backend.search(conn, "Task", "test", ["title", "body"], limit=10, offset=5)
 
-        # Count query: 1 param (query)
-        count_params = cursor.execute.call_args_list[0][0][1]
+        # The tsquery is bound once in FROM: query + limit + offset
+        sql, params = cursor.execute.call_args[0]
+        assert params == ("test", 10, 5)
+        assert sql.count("%s") == len(params)
+
+    def test_offset_past_last_match_counts_separately(self):
+        backend = PostgresFTSBackend()
+        conn, cursor = _make_mock_conn(fetchone_val=(4,), fetchall_val=[])
+
+        ids, total = backend.search(conn, "Task", "test", ["title"], offset=50)
+
+        assert ids == []
+        assert total == 4
+        count_sql, count_params = cursor.execute.call_args_list[1][0]
+        assert "COUNT(*)" in count_sql
         assert count_params == ("test",)
 
-        # Search query: 2 params (query for ts_rank tsquery, query for WHERE tsquery) + limit + offset
-        search_params = cursor.execute.call_args_list[1][0][1]
-        assert search_params == ("test", "test", 10, 5)
+    def test_no_matches_issue_no_count(self):
+        backend = PostgresFTSBackend()
+        conn, cursor = _make_mock_conn(fetchall_val=[])
+
+        assert backend.search(conn, "Task", "test", ["title"]) == ([], 0)
+        assert cursor.execute.call_count == 1
 
     def test_search_dict_row_handling(self):
         backend = PostgresFTSBackend()
         conn, cursor = _make_mock_conn(
-            fetchone_val={"count": 2},
-            fetchall_val=[{"id": "a"}, {"id": "b"}],
+            fetchall_val=[{"id": "a", "total": 2}, {"id": "b", "total": 2}],
         )
 
         ids, total = backend.search(conn, "Task", "hello", ["title"])
@@ -192,9 +307,9 @@ class TestPostgresFTSBackendSearchWithSnippets:
         placeholder_count = sql.count("%s")
         assert len(params) == placeholder_count
 
-        # For 2 fields: 1 (ts_rank) + 2 (ts_headline) + 1 (WHERE) + 1 (LIMIT) = 5
-        assert len(params) == 5
-        assert params == ("hello", "hello", "hello", "hello", 50)
+        # The tsquery is bound once in FROM and shared: query + LIMIT
+        assert params == ("hello", 50)
+        assert sql.count("fts_query, 'StartSel") == 2
 
     def test_snippet_single_field(self):
         backend = PostgresFTSBackend()
@@ -203,8 +318,7 @@ class TestPostgresFTSBackendSearchWithSnippets:
         backend.search_with_snippets(conn, "Task", "test", ["title"], limit=10)
 
         params = cursor.execute.call_args[0][1]
-        # 1 (ts_rank) + 1 (ts_headline) + 1 (WHERE) + 1 (LIMIT) = 4
-        assert len(params) == 4
+        assert params == ("test", 10)
 
     def test_snippet_tuple_row_parsing(self):
         backend = PostgresFTSBackend()
@@ -269,17 +383,19 @@ class TestFTSManager:
         manager._configs["Task"] = FTSConfig(entity_name="Task", searchable_fields=["title"])
         conn, cursor = _make_mock_conn()
 
+        cursor.fetchone.return_value = None
+
         manager.create_fts_table(conn, "Task")
 
         # Should have called cursor.execute with CREATE INDEX
         sql = cursor.execute.call_args[0][0]
-        assert "USING GIN" in sql
+        assert "USING GIN((setweight(" in sql
         assert "Task" in manager._initialized
 
     def test_search_uses_postgres_backend(self):
         manager = FTSManager(database_url="postgresql://localhost/test")
         manager._configs["Task"] = FTSConfig(entity_name="Task", searchable_fields=["title"])
-        conn, cursor = _make_mock_conn(fetchone_val=(0,), fetchall_val=[])
+        conn, cursor = _make_mock_conn(fetchall_val=[])
 
         ids, total = manager.search(conn, "Task", "hello")
         assert total == 0
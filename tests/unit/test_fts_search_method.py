@@ -3,7 +3,8 @@
 Cycle 2 created the `search_vector` GENERATED column + GIN index.
 This cycle adds the query path: a focused method that builds raw
 SQL using `websearch_to_tsquery` + `ts_rank`, applies a scope
-predicate when supplied, and returns ranked rows.
+predicate when supplied, and returns ranked rows. The page and the
+total match count come back from one query (`count(*) OVER ()`).
 
 These tests verify the SQL shape via a stub connection that
 captures (sql, params). Real PostgreSQL execution lives in the
@@ -45,7 +46,8 @@ class _StubCursor:
         return self._rows[0] if self._rows else None
 
     def fetchall(self) -> list[dict[str, Any]]:
-        return self._rows
+        # The items query carries the total as a window column.
+        return [{**r, "_fts_total": self._count} for r in self._rows]
 
 
 class _StubDb:
@@ -116,13 +118,15 @@ class TestEmptyQuery:
 
 
 class TestSqlShape:
-    def test_count_then_items_query_pair(self):
+    def test_single_query_carries_window_count(self):
         repo = _build_repo(count=3)
-        asyncio.run(repo.fts_search(_spec(), "hello"))
+        result = asyncio.run(repo.fts_search(_spec(), "hello"))
         queries = repo.db.cursor_obj.queries
-        assert len(queries) == 2
-        assert "COUNT(*)" in queries[0][0]
-        assert "ORDER BY rank DESC" in queries[1][0]
+        assert len(queries) == 1
+        assert "count(*) OVER ()" in queries[0][0]
+        assert "ts_rank_cd(search_vector" in queries[0][0]
+        assert result["total"] == 3
+        assert "_fts_total" not in result["items"][0]
 
     @pytest.mark.parametrize(
         "expected",
@@ -142,7 +146,7 @@ class TestSqlShape:
     def test_items_sql_contains(self, expected: str) -> None:
         repo = _build_repo(table_name="Manuscript")
         asyncio.run(repo.fts_search(_spec(), "hello"))
-        items_sql = repo.db.cursor_obj.queries[1][0]
+        items_sql = repo.db.cursor_obj.queries[0][0]
         assert expected in items_sql
 
     def test_query_string_is_parameterised(self):
@@ -164,13 +168,13 @@ class TestTokenizerInterpolation:
     def test_default_tokenizer_english(self):
         repo = _build_repo()
         asyncio.run(repo.fts_search(_spec("english"), "hello"))
-        items_sql = repo.db.cursor_obj.queries[1][0]
+        items_sql = repo.db.cursor_obj.queries[0][0]
         assert "websearch_to_tsquery('english'," in items_sql
 
     def test_explicit_french_tokenizer(self):
         repo = _build_repo()
         asyncio.run(repo.fts_search(_spec("french"), "bonjour"))
-        items_sql = repo.db.cursor_obj.queries[1][0]
+        items_sql = repo.db.cursor_obj.queries[0][0]
         assert "websearch_to_tsquery('french'," in items_sql
 
     def test_non_alpha_tokenizer_falls_back_safely(self):
@@ -185,7 +189,7 @@ class TestTokenizerInterpolation:
             fields=[],
         )
         asyncio.run(repo.fts_search(spec, "hello"))
-        items_sql = repo.db.cursor_obj.queries[1][0]
+        items_sql = repo.db.cursor_obj.queries[0][0]
         # Falls back to english, and definitely no injection.
         assert "DROP TABLE" not in items_sql
         assert "websearch_to_tsquery('english'," in items_sql
@@ -200,7 +204,7 @@ class TestScopePredicate:
     def test_no_scope_predicate_omits_extra_where(self):
         repo = _build_repo()
         asyncio.run(repo.fts_search(_spec(), "hello"))
-        items_sql = repo.db.cursor_obj.queries[1][0]
+        items_sql = repo.db.cursor_obj.queries[0][0]
         # Single WHERE term — no AND clause introduced.
         # (Allows `AND` to appear inside ORDER BY etc.)
         where_clause = items_sql.split("WHERE", 1)[1].split("ORDER BY", 1)[0]
@@ -210,8 +214,8 @@ class TestScopePredicate:
         repo = _build_repo()
         scope = ('"school_id" = %s', ["sch-42"])
         asyncio.run(repo.fts_search(_spec(), "hello", scope_predicate=scope))
-        items_sql = repo.db.cursor_obj.queries[1][0]
-        items_params = repo.db.cursor_obj.queries[1][1]
+        items_sql = repo.db.cursor_obj.queries[0][0]
+        items_params = repo.db.cursor_obj.queries[0][1]
         assert '"school_id" = %s' in items_sql
         # Param order: q (FTS), q (count's residual), scope param, q again, page_size, offset
         # Just check the scope param made it through.
@@ -219,19 +223,21 @@ class TestScopePredicate:
 
     def test_scope_predicate_applied_to_count_too(self):
         # Pagination metadata must reflect the scoped row count, not
-        # the global match count.
-        repo = _build_repo(count=2)
+        # the global match count — including the past-the-end fallback.
+        repo = _build_repo(count=2, rows=[])
         scope = ('"school_id" = %s', ["sch-42"])
-        asyncio.run(repo.fts_search(_spec(), "hello", scope_predicate=scope))
-        count_sql = repo.db.cursor_obj.queries[0][0]
+        asyncio.run(repo.fts_search(_spec(), "hello", page=5, scope_predicate=scope))
+        count_sql, count_params = repo.db.cursor_obj.queries[1]
+        assert "COUNT(*)" in count_sql
         assert '"school_id" = %s' in count_sql
+        assert count_params == ["hello", "sch-42"]
 
     def test_empty_scope_sql_treated_as_none(self):
         # The predicate compiler returns ('', []) for tautologies
         # (no filter needed). Must not blow up the WHERE clause.
         repo = _build_repo()
         asyncio.run(repo.fts_search(_spec(), "hello", scope_predicate=("", [])))
-        items_sql = repo.db.cursor_obj.queries[1][0]
+        items_sql = repo.db.cursor_obj.queries[0][0]
         # No spurious AND () in the WHERE clause
         assert "AND ()" not in items_sql
 
@@ -248,23 +254,30 @@ class TestPagination:
         assert result["page"] == 1
         assert result["page_size"] == 20
         # Limit + offset land in the items query as the last two params.
-        items_params = repo.db.cursor_obj.queries[1][1]
+        items_params = repo.db.cursor_obj.queries[0][1]
         assert items_params[-2:] == [20, 0]
 
     def test_explicit_page_offset_calculation(self):
         repo = _build_repo(count=100)
         asyncio.run(repo.fts_search(_spec(), "hello", page=3, page_size=15))
-        items_params = repo.db.cursor_obj.queries[1][1]
+        items_params = repo.db.cursor_obj.queries[0][1]
         # page 3, page_size 15 → offset = 30
         assert items_params[-2:] == [15, 30]
 
-    def test_zero_total_skips_items_query(self):
-        # If count returns 0, no need to issue a second query.
+    def test_no_matches_on_first_page_needs_no_count(self):
         repo = _build_repo(count=0, rows=[])
         result = asyncio.run(repo.fts_search(_spec(), "hello"))
         assert result["total"] == 0
         assert result["items"] == []
-        assert len(repo.db.cursor_obj.queries) == 1  # count only
+        assert len(repo.db.cursor_obj.queries) == 1  # items only
+
+    def test_page_past_the_end_counts_separately(self):
+        # No rows means no window count — a COUNT(*) fills it in.
+        repo = _build_repo(count=7, rows=[])
+        result = asyncio.run(repo.fts_search(_spec(), "hello", page=9))
+        assert result["total"] == 7
+        assert result["items"] == []
+        assert len(repo.db.cursor_obj.queries) == 2
 
 
 # ---------------------------------------------------------------------------
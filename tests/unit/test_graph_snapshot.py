@@ -0,0 +1,291 @@
+"""Cached CSR graph snapshots: structure, algorithms, deltas and invalidation (#619)."""
+
+from __future__ import annotations
+
+import os
+import random
+import uuid
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from dazzle.core.ir import GraphEdgeSpec
+from dazzle.http.runtime.graph_algorithms import snapshot_components, snapshot_shortest_path
+from dazzle.http.runtime.graph_snapshot import (
+    GraphSnapshot,
+    GraphSnapshotCache,
+    checksum_sql,
+    row_checksum,
+)
+from dazzle.http.runtime.handlers.graph_handlers import _edge_checksum, _load_snapshot
+from dazzle.http.runtime.neighborhood import snapshot_neighborhood
+from dazzle.http.runtime.tenant_isolation import (
+    _current_tenant_schema,
+    set_current_tenant_schema,
+)
+
+_EDGE = GraphEdgeSpec(source="src", target="tgt", weight_field="cost")
+_PG = os.environ.get("TEST_DATABASE_URL") or os.environ.get("DATABASE_URL")
+
+
+def _snap(*edges: tuple[str, str], directed: bool = True) -> GraphSnapshot:
+    return GraphSnapshot(directed, [(f"e{i}", s, t, 1.0) for i, (s, t) in enumerate(edges)])
+
+
+class _Clock:
+    now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSnapshot:
+    def test_csr_rows_list_out_neighbours(self) -> None:
+        snap = _snap(("a", "b"), ("a", "c"), ("b", "c"))
+        a = snap.index["a"]
+        row = snap.adjacency[snap.offsets[a] : snap.offsets[a + 1]]
+        assert sorted(snap.node_ids[i] for i in row) == ["b", "c"]
+        assert len(snap.adjacency) == 3
+
+    def test_undirected_lists_both_directions(self) -> None:
+        snap = _snap(("a", "b"), ("b", "b"), directed=False)
+        assert len(snap.adjacency) == 3  # the self-loop once
+
+    def test_apply_upserts_and_removes(self) -> None:
+        snap = _snap(("a", "b"), ("b", "c"))
+        after = snap.apply({"e1": ("e1", "b", "d", 1.0), "e9": ("e9", "d", "a", 1.0)}, {"e0"})
+        assert sorted(after.rows()) == [("e1", "b", "d", 1.0), ("e9", "d", "a", 1.0)]
+        assert after.version == snap.version + 1
+        assert after.checksum == sum(map(row_checksum, after.rows()))
+
+    @pytest.mark.parametrize("directed", [True, False])
+    def test_spliced_delta_matches_a_fresh_build(self, directed: bool) -> None:
+        rng = random.Random(11)
+
+        def _edge(i: int) -> tuple[str, str, str, float]:
+            return (f"e{i}", f"n{rng.randrange(40)}", f"n{rng.randrange(40)}", float(i))
+
+        snap = GraphSnapshot(directed, [_edge(i) for i in range(200)])
+        for step in range(30):
+            live = [row[0] for row in snap.rows()]
+            removed = set(rng.sample(live, 4))
+            added = {row[0]: row for row in (_edge(rng.randrange(260)) for _ in range(5))}
+            expected = GraphSnapshot(
+                directed,
+                [
+                    *(r for r in snap.rows() if r[0] not in removed and r[0] not in added),
+                    *added.values(),
+                ],
+            )
+            snap = snap.apply(added, removed)
+            assert snap.version == step + 2
+            assert _structure(snap) == _structure(expected)
+            assert snap.checksum == expected.checksum
+            assert snapshot_components(snap) == snapshot_components(expected)
+
+    def test_splice_drops_orphaned_nodes(self) -> None:
+        snap = _snap(*[(f"a{i}", f"b{i}") for i in range(8)])
+        after = snap.apply({}, {"e0"})
+        assert "a0" not in after and "b0" not in after
+        assert len(after) == 14
+        assert snapshot_shortest_path(after, "a0", "b0")["error"]
+        again = after.apply({"e0": ("e0", "a0", "b0", 1.0)}, set())
+        assert snapshot_shortest_path(again, "a0", "b0")["path"] == ["a0", "b0"]
+
+
+def _structure(snap: GraphSnapshot) -> tuple[set[Any], dict[str, list[tuple[str, str]]]]:
+    """Edges and each node's (neighbour, edge) arcs, by id — independent of dense indices."""
+    arcs = {
+        node_id: sorted(
+            (snap.node_ids[snap.adjacency[k]], snap.edge_ids[snap.adjacency_edge[k]])
+            for k in range(snap.offsets[i], snap.offsets[i + 1])
+        )
+        for node_id, i in snap.index.items()
+    }
+    return set(snap.rows()), arcs
+
+
+class TestAlgorithms:
+    def test_shortest_path_follows_direction(self) -> None:
+        snap = _snap(("a", "b"), ("b", "c"), ("c", "a"))
+        assert snapshot_shortest_path(snap, "a", "c") == {"path": ["a", "b", "c"], "length": 2}
+        assert snapshot_shortest_path(snap, "c", "b")["length"] == 2
+        assert snapshot_shortest_path(snap, "a", "z")["error"] == "target node not found in graph"
+        assert snapshot_shortest_path(snap, "a", "a") == {"path": ["a"], "length": 0}
+
+    def test_weighted_prefers_cheaper_detour(self) -> None:
+        snap = GraphSnapshot(
+            True, [("1", "a", "b", 1.0), ("2", "b", "c", 1.0), ("3", "a", "c", 10.0)]
+        )
+        assert snapshot_shortest_path(snap, "a", "c", weighted=True) == {
+            "path": ["a", "b", "c"],
+            "length": 2,
+            "weight": 2.0,
+        }
+        assert snapshot_shortest_path(snap, "c", "a", weighted=True)["path"] == []
+
+    def test_components_match_networkx(self) -> None:
+        nx = pytest.importorskip("networkx")
+        from dazzle.http.runtime.graph_algorithms import connected_components
+
+        rng = random.Random(7)
+        edges = [(f"n{rng.randrange(60)}", f"n{rng.randrange(60)}") for _ in range(50)]
+        g = nx.DiGraph()
+        g.add_edges_from(edges)
+        ours = snapshot_components(_snap(*edges))
+        theirs = connected_components(g)
+        assert ours["count"] == theirs["count"]
+        assert sorted(map(tuple, ours["components"])) == sorted(map(tuple, theirs["components"]))
+
+    def test_neighborhood_respects_depth_and_direction(self) -> None:
+        snap = _snap(("a", "b"), ("b", "c"), ("d", "a"))
+        assert sorted(snapshot_neighborhood(snap, "a", 1)) == ["a", "b"]
+        assert sorted(snapshot_neighborhood(snap, "a", 2)) == ["a", "b", "c"]
+        undirected = _snap(("a", "b"), ("b", "c"), ("d", "a"), directed=False)
+        assert sorted(snapshot_neighborhood(undirected, "a", 1)) == ["a", "b", "d"]
+        assert snapshot_neighborhood(snap, "lonely", 3) == ["lonely"]
+
+
+class TestCache:
+    def test_edge_writes_fold_in_on_next_read(self) -> None:
+        cache = GraphSnapshotCache()
+        key = cache.key("Edge")
+        cache.build(key, True, [("e1", "a", "b", 1.0)])
+        cache.edge_changed("Edge", _EDGE, None, {"id": "e2", "src": "b", "tgt": "c", "cost": 3})
+        cache.edge_changed("Edge", _EDGE, {"id": "e1", "src": "a", "tgt": "b"}, None)
+        snap = cache.get(key)
+        assert snap is not None
+        assert list(snap.rows()) == [("e2", "b", "c", 3.0)]
+        assert snap.version == 2
+
+    def test_filtered_snapshot_only_takes_matching_edges(self) -> None:
+        cache = GraphSnapshotCache()
+        key = cache.key("Edge", {"team": "red"})
+        cache.build(key, True, [])
+        for team, eid in (("red", "e1"), ("blue", "e2")):
+            cache.edge_changed(
+                "Edge", _EDGE, None, {"id": eid, "src": "a", "tgt": "b", "team": team}
+            )
+        assert [r[0] for r in cache.get(key).rows()] == ["e1"]  # type: ignore[union-attr]
+
+    def test_age_node_delete_and_overflow_force_a_rebuild(self) -> None:
+        clock = _Clock()
+        cache = GraphSnapshotCache(max_age=10, max_pending=1, clock=clock)
+        key = cache.key("Edge")
+        cache.build(key, True, [])
+        clock.now += 11
+        assert cache.get(key) is None
+
+        cache.build(key, True, [])
+        cache.invalidate("Edge")
+        assert cache.get(key) is None
+
+        cache.build(key, True, [])
+        for eid in ("e1", "e2"):
+            cache.edge_changed("Edge", _EDGE, None, {"id": eid, "src": "a", "tgt": "b"})
+        assert cache.get(key) is None
+
+    def test_probe_drops_a_snapshot_the_table_no_longer_matches(self) -> None:
+        cache = GraphSnapshotCache()
+        key = cache.key("Edge")
+        probe = MagicMock(return_value=row_checksum(("e1", "a", "b", 1.0)))
+        assert cache.get(key, probe) is None
+        probe.assert_not_called()  # nothing cached, nothing to check
+
+        cache.build(key, True, [("e1", "a", "b", 1.0)])
+        cache.edge_changed("Edge", _EDGE, None, {"id": "e2", "src": "b", "tgt": "c"})
+        assert cache.get(key, probe) is None  # e2 not in the table yet
+        cache.build(key, True, [("e1", "a", "b", 1.0)])
+        assert cache.get(key, probe) is not None
+        probe.return_value += 1  # a write this process never saw
+        assert cache.get(key, probe) is None
+        assert cache.get(key) is None
+
+    def test_tenants_are_isolated(self) -> None:
+        cache = GraphSnapshotCache()
+        token = set_current_tenant_schema("tenant_a")
+        try:
+            key_a = cache.key("Edge")
+            cache.build(key_a, True, [])
+        finally:
+            _current_tenant_schema.reset(token)
+        token = set_current_tenant_schema("tenant_b")
+        try:
+            assert cache.key("Edge") != key_a
+            cache.edge_changed("Edge", _EDGE, None, {"id": "e1", "src": "a", "tgt": "b"})
+        finally:
+            _current_tenant_schema.reset(token)
+        assert list(cache.get(key_a).rows()) == []  # type: ignore[union-attr]
+
+    def test_track_wires_service_callbacks_once(self) -> None:
+        cache = GraphSnapshotCache()
+        edges, nodes = MagicMock(), MagicMock()
+        cache.track("Edge", _EDGE, edges, nodes)
+        cache.track("Edge", _EDGE, edges, nodes)
+        assert edges.on_created.call_count == 1
+        key = cache.key("Edge")
+        cache.build(key, True, [])
+        created = edges.on_created.call_args.args[0]
+        created("Edge", "e1", {"id": "e1", "src": "a", "tgt": "b"}, None)
+        assert len(cache.get(key)) == 2  # type: ignore[arg-type]
+        nodes.on_deleted.call_args.args[0]("Node", "a", {}, None)
+        assert cache.get(key) is None
+
+
+def test_load_snapshot_reads_a_projection_once_then_only_probes() -> None:
+    cursor = MagicMock()
+    cursor.fetchall.return_value = [{"id": "e1", "src": "a", "tgt": "b", "cost": None}]
+    cursor.fetchone.return_value = {"checksum": row_checksum(("e1", "a", "b", 1.0))}
+    conn = MagicMock()
+    conn.cursor.return_value = cursor
+    db = MagicMock()
+    db.connection.return_value.__enter__.return_value = conn
+    cache = GraphSnapshotCache()
+
+    snap = _load_snapshot(db, "Edge", _EDGE, {"team": "red"}, cache)
+    assert _load_snapshot(db, "Edge", _EDGE, {"team": "red"}, cache) is snap
+    (projection, params), (probe, probe_params) = (c.args for c in cursor.execute.call_args_list)
+    assert projection == 'SELECT "id", "src", "tgt", "cost" FROM "Edge" WHERE "team" = %(_f0)s'
+    assert params == probe_params == {"_f0": "red"}
+    assert probe.startswith(f"SELECT {checksum_sql(_EDGE)} AS checksum FROM")
+    assert probe.endswith('"team" = %(_f0)s AND "src" IS NOT NULL AND "tgt" IS NOT NULL')
+    assert list(snap.rows()) == [("e1", "a", "b", 1.0)]
+
+    # Another worker deletes e1: the probe disagrees and the snapshot is re-read.
+    cursor.fetchone.return_value = {"checksum": 0}
+    cursor.fetchall.return_value = []
+    assert list(_load_snapshot(db, "Edge", _EDGE, {"team": "red"}, cache).rows()) == []
+    assert cursor.execute.call_count == 4
+
+
+@pytest.mark.postgres
+@pytest.mark.skipif(not _PG, reason="no TEST_DATABASE_URL / DATABASE_URL — needs real Postgres")
+def test_checksum_sql_matches_the_snapshot_on_postgres() -> None:
+    import psycopg
+    from psycopg.rows import dict_row
+
+    table = f"edge_{uuid.uuid4().hex[:8]}"
+    ids = [uuid.uuid4() for _ in range(4)]
+    a, b, c = (str(uuid.uuid4()) for _ in range(3))
+    db = MagicMock()
+    with psycopg.connect(_PG, autocommit=True, row_factory=dict_row) as conn:
+        db.connection.return_value.__enter__.return_value = conn
+        conn.execute(
+            f'CREATE TABLE "{table}" (id uuid PRIMARY KEY, src uuid, tgt uuid, '
+            "cost numeric(10, 3), team text)"
+        )
+        try:
+            for row in (
+                (ids[0], a, b, "2.5", "red"),
+                (ids[1], b, c, None, "red"),
+                (ids[2], c, None, "1", "red"),  # no target: never in a snapshot
+                (ids[3], a, c, "0.1", "blue"),
+            ):
+                conn.execute(f'INSERT INTO "{table}" VALUES (%s, %s, %s, %s, %s)', row)
+            snap = GraphSnapshot(True, [(str(ids[0]), a, b, 2.5), (str(ids[1]), b, c, 1.0)])
+            assert _edge_checksum(db, table, _EDGE, {"team": "red"}) == snap.checksum
+            conn.execute(f'UPDATE "{table}" SET cost = 3 WHERE id = %s', [ids[0]])
+            assert _edge_checksum(db, table, _EDGE, {"team": "red"}) != snap.checksum
+        finally:
+            conn.execute(f'DROP TABLE "{table}"')
@@ -0,0 +1,206 @@
+"""Index advisor: AppSpec access paths → recommended indexes (``db advise-indexes``)."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import pytest
+from alembic.operations import ops as aops
+
+from dazzle.db.index_advisor import (
+    ExistingIndex,
+    IndexAdvice,
+    advise_indexes,
+    declared_indexes,
+    derive_index_advice,
+    is_covered,
+    probe_sql,
+)
+from dazzle.db.migration_engine import build_index_plan
+from dazzle.http.runtime.sa_schema import build_metadata
+
+_DSL = """\
+module test
+app test_app "Test App"
+
+entity User "User":
+  id: uuid pk
+  email: str(200) required
+  org: str(100)
+
+entity Task "Task":
+  id: uuid pk
+  title: str(200) required
+  description: text
+  status: enum[todo,done]=todo
+  priority: enum[low,high]=low
+  archived: bool = false
+  owner: ref User
+  org: str(100)
+  created_at: datetime auto_add
+
+  permit:
+    list: role(member) or role(manager)
+
+  scope:
+    list: owner = current_user and archived = false
+      as: member
+    list: org = current_user.org
+      as: manager
+
+surface task_list "Tasks":
+  uses entity Task
+  mode: list
+
+  section main "Tasks":
+    field title "Title"
+
+  ux:
+    sort: created_at desc
+    filter: status, priority
+    search: title, description
+
+workspace board "Board":
+  by_status:
+    source: Task
+    display: kanban
+    group_by: status
+"""
+
+
+def _build_appspec(dsl: str) -> Any:
+    from dazzle.core.linker import build_appspec
+    from dazzle.core.parser import parse_modules
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".dsl", delete=False) as f:
+        f.write(dsl)
+        fpath = Path(f.name)
+    try:
+        modules = parse_modules([fpath])
+        return build_appspec(modules, modules[0].name)
+    finally:
+        os.unlink(fpath)
+
+
+@pytest.fixture(scope="module")
+def appspec() -> Any:
+    return _build_appspec(_DSL)
+
+
+def _by_columns(advice: list[IndexAdvice]) -> dict[tuple[str, ...], IndexAdvice]:
+    return {a.columns: a for a in advice if a.table == "Task"}
+
+
+class TestDerive:
+    def test_scope_anchor_leads_the_default_sort(self, appspec: Any) -> None:
+        advice = _by_columns(derive_index_advice(appspec))
+        assert ("org", "created_at") in advice
+        assert "scope Task.list" in advice[("org", "created_at")].reasons
+
+    def test_literal_check_in_scope_becomes_partial_where(self, appspec: Any) -> None:
+        owner = _by_columns(derive_index_advice(appspec))[("owner", "created_at")]
+        assert owner.where == '"archived" = FALSE'
+        assert owner.create_sql().endswith('WHERE "archived" = FALSE')
+
+    def test_list_filters_and_fk(self, appspec: Any) -> None:
+        advice = _by_columns(derive_index_advice(appspec))
+        assert ("status", "created_at") in advice
+        assert ("priority", "created_at") in advice
+        # A partial (owner, …) index cannot serve every FK lookup.
+        assert advice[("owner",)].reasons == ("FK Task.owner → User",)
+
+    def test_search_becomes_a_trigram_gin_per_field(self, appspec: Any) -> None:
+        gins = [a for a in derive_index_advice(appspec) if a.method == "gin" and a.table == "Task"]
+        assert [g.columns for g in gins] == [("description",), ("title",)]
+        sql = gins[1].create_sql()
+        assert 'USING gin ((CAST("title" AS TEXT)) gin_trgm_ops)' in sql
+        assert gins[1].name == "ix_adv_task_title_trgm"
+
+    def test_workspace_group_by_is_served_by_the_wider_filter_index(self, appspec: Any) -> None:
+        advice = _by_columns(derive_index_advice(appspec))
+        assert ("status", "created_at") in advice
+        # The kanban GROUP BY status leads (status, created_at), so it is dropped.
+        assert ("status",) not in advice
+
+    def test_long_names_fit_postgres_identifier_limit(self) -> None:
+        item = IndexAdvice("T" * 40, ("a_very_long_column", "another_long_column"))
+        assert len(item.name) == 63
+
+
+class TestDiff:
+    def test_declared_list_index_covers_its_advice(self, appspec: Any) -> None:
+        metadata = build_metadata(appspec.domain.entities, surfaces=list(appspec.surfaces))
+        existing = declared_indexes(metadata)
+        advice = advise_indexes(appspec, existing)
+        columns = {a.columns for a in advice if a.table == "Task"}
+        # The schema builder indexes only the first scope anchor (owner) …
+        assert ("owner", "created_at") not in columns
+        # … so the second rule's anchor and the list filters are the gap.
+        assert ("org", "created_at") in columns
+        assert ("status", "created_at") in columns
+
+    def test_wider_existing_index_covers_a_prefix(self) -> None:
+        existing = [ExistingIndex("Task", ("status", "created_at", "id"))]
+        assert is_covered(IndexAdvice("Task", ("status", "created_at")), existing)
+        assert not is_covered(IndexAdvice("Task", ("created_at",)), existing)
+
+    def test_partial_existing_index_does_not_cover_a_full_one(self) -> None:
+        existing = [ExistingIndex("Task", ("status",), partial=True)]
+        assert not is_covered(IndexAdvice("Task", ("status",)), existing)
+
+    def test_gin_covered_only_by_a_trigram_index_on_the_same_columns(self) -> None:
+        advice = IndexAdvice("Task", ("title",), "gin")
+
+        def gin(keys: str) -> list[ExistingIndex]:
+            definition = f'CREATE INDEX ix ON public."Task" USING gin ({keys})'
+            return [ExistingIndex("Task", (None,), "gin", definition=definition)]
+
+        assert is_covered(advice, gin("title gin_trgm_ops"))
+        assert is_covered(advice, gin("((title)::text) gin_trgm_ops"))
+        # The FTS expression index cannot serve LIKE '%q%' …
+        assert not is_covered(advice, gin("to_tsvector('english'::regconfig, title)"))
+        # … and a column name appearing inside another key is not a match.
+        assert not is_covered(advice, gin("subtitle gin_trgm_ops"))
+        assert not is_covered(advice, gin("title gin_trgm_ops, body gin_trgm_ops"))
+
+
+class TestMigrationPlan:
+    def test_index_plan_executes_create_and_reverses_drops(self) -> None:
+        advice = [IndexAdvice("Task", ("a",)), IndexAdvice("Task", ("b",))]
+        plan = build_index_plan(advice, {"Task": {"columns": {}}})
+
+        upgrade = [op.sqltext for op in plan.upgrade_ops.ops]
+        downgrade = [op.sqltext for op in plan.downgrade_ops.ops]
+        assert all(isinstance(op, aops.ExecuteSQLOp) for op in plan.upgrade_ops.ops)
+        assert upgrade == [a.create_sql() for a in advice]
+        assert downgrade == [a.drop_sql() for a in reversed(advice)]
+        assert "Task" in plan.snapshot_literal
+        assert not plan.is_empty
+
+    def test_trigram_advice_creates_the_extension_first(self) -> None:
+        advice = [IndexAdvice("Task", ("title",), "gin"), IndexAdvice("Task", ("body",), "gin")]
+        plan = build_index_plan(advice, {"Task": {"columns": {}}})
+
+        upgrade = [op.sqltext for op in plan.upgrade_ops.ops]
+        assert upgrade[0] == "CREATE EXTENSION IF NOT EXISTS pg_trgm"
+        assert upgrade[1:] == [a.create_sql() for a in advice]
+        assert len(plan.downgrade_ops.ops) == 2
+
+    def test_no_advice_is_empty(self) -> None:
+        assert build_index_plan([], {}).is_empty
+
+
+class TestProbe:
+    def test_btree_probe_filters_the_lead_and_orders_the_rest(self) -> None:
+        sql, params = probe_sql(IndexAdvice("Task", ("org", "created_at"), where='"x" = 1'))
+        assert 'WHERE "org" = (SELECT "org" FROM "Task" LIMIT 1) AND "x" = 1' in sql
+        assert 'ORDER BY "created_at"' in sql
+        assert params == []
+
+    def test_gin_probe_matches_the_list_search(self) -> None:
+        sql, params = probe_sql(IndexAdvice("Task", ("title",), "gin"))
+        assert 'WHERE CAST("title" AS TEXT) LIKE %s' in sql
+        assert params == ["%dazzle%"]
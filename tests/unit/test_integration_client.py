@@ -0,0 +1,308 @@
+"""Tests for the pooled, circuit-broken integration client.
+
+Pool behaviour runs against a stub HTTP server on localhost, so keep-alive
+reuse, breaker trips and bulkhead limits are exercised over real sockets.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+import pytest
+
+from dazzle.http.runtime import integration_client
+from dazzle.http.runtime.integration_client import (
+    BulkheadFullError,
+    CircuitBreaker,
+    CircuitOpenError,
+    ClientSettings,
+    IntegrationClientPool,
+    app_client_pool,
+    is_transient_status,
+)
+
+# ---------------------------------------------------------------------------
+# Stub upstream
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _Upstream:
+    """What the stub server answers, and what it saw."""
+
+    statuses: list[int] = field(default_factory=list)
+    delay: float = 0.0
+    client_ports: list[int] = field(default_factory=list)
+
+    @property
+    def hits(self) -> int:
+        return len(self.client_ports)
+
+
+@pytest.fixture
+def upstream() -> Iterator[tuple[str, _Upstream]]:
+    state = _Upstream()
+
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive
+
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            self.rfile.read(length)
+            state.client_ports.append(self.client_address[1])
+            if state.delay:
+                threading.Event().wait(state.delay)
+            status = state.statuses.pop(0) if state.statuses else 200
+            body = b'{"ok": true}'
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", state
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# ---------------------------------------------------------------------------
+# Circuit breaker
+# ---------------------------------------------------------------------------
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold(self) -> None:
+        breaker = CircuitBreaker(3, 30.0, clock=_Clock())
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.state == "closed"
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert breaker.allow() is False
+
+    def test_success_resets_count(self) -> None:
+        breaker = CircuitBreaker(2, 30.0, clock=_Clock())
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == "closed"
+
+    def test_half_open_admits_one_probe(self) -> None:
+        clock = _Clock()
+        breaker = CircuitBreaker(1, 30.0, clock=clock)
+        breaker.record_failure()
+        assert breaker.retry_after() == 30.0
+        clock.now += 30
+        assert breaker.state == "half_open"
+        assert breaker.allow() is True
+        assert breaker.allow() is False
+
+    def test_failed_probe_reopens(self) -> None:
+        clock = _Clock()
+        breaker = CircuitBreaker(5, 30.0, clock=clock)
+        for _ in range(5):
+            breaker.record_failure()
+        clock.now += 30
+        assert breaker.allow() is True
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert breaker.retry_after() == 30.0
+
+    def test_successful_probe_closes(self) -> None:
+        clock = _Clock()
+        breaker = CircuitBreaker(1, 30.0, clock=clock)
+        breaker.record_failure()
+        clock.now += 30
+        assert breaker.allow() is True
+        breaker.record_success()
+        assert breaker.state == "closed"
+        assert breaker.retry_after() == 0.0
+
+
+# ---------------------------------------------------------------------------
+# Settings
+# ---------------------------------------------------------------------------
+
+
+class TestSettings:
+    def test_env_overrides_per_integration(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("DAZZLE_API_MY_API_HTTP2", "true")
+        monkeypatch.setenv("DAZZLE_API_MY_API_MAX_CONCURRENCY", "4")
+        monkeypatch.setenv("DAZZLE_API_MY_API_TIMEOUT", "2.5")
+        settings = ClientSettings().with_env_overrides("my-api")
+        assert settings.http2 is True
+        assert settings.max_concurrency == 4
+        assert settings.timeout == 2.5
+        assert ClientSettings().with_env_overrides("other") == ClientSettings()
+
+    def test_bad_value_ignored(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("DAZZLE_API_X_MAX_CONNECTIONS", "lots")
+        assert ClientSettings().with_env_overrides("x").max_connections == 20
+
+    @pytest.mark.parametrize(("status", "transient"), [(429, True), (503, True), (500, False)])
+    def test_transient_status(self, status: int, transient: bool) -> None:
+        assert is_transient_status(status) is transient
+
+    def test_http2_falls_back_without_h2(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        monkeypatch.setattr(integration_client, "_h2_available", lambda: False)
+        pool = IntegrationClientPool(ClientSettings(http2=True))
+        with caplog.at_level(logging.WARNING):
+            pool.client("partner")
+        assert "HTTP/2" in caplog.text
+        asyncio.run(pool.aclose())
+
+
+# ---------------------------------------------------------------------------
+# Pool against a stub server
+# ---------------------------------------------------------------------------
+
+
+class TestPool:
+    def test_keep_alive_reuses_connection(self, upstream: tuple[str, _Upstream]) -> None:
+        url, state = upstream
+        pool = IntegrationClientPool()
+
+        async def _go() -> None:
+            for _ in range(3):
+                resp = await pool.request("partner", "POST", url, json={"n": 1})
+                assert resp.status_code == 200
+            await pool.aclose()
+
+        asyncio.run(_go())
+        assert state.hits == 3
+        assert len(set(state.client_ports)) == 1
+
+    def test_breaker_fails_fast_once_open(self, upstream: tuple[str, _Upstream]) -> None:
+        url, state = upstream
+        state.statuses = [500, 500]
+        pool = IntegrationClientPool(ClientSettings(failure_threshold=2, reset_timeout=60.0))
+
+        async def _go() -> None:
+            for _ in range(2):
+                assert (await pool.request("partner", "POST", url)).status_code == 500
+            with pytest.raises(CircuitOpenError):
+                await pool.request("partner", "POST", url)
+            assert pool.stats()["partner"]["state"] == "open"
+            await pool.aclose()
+
+        asyncio.run(_go())
+        assert state.hits == 2
+
+    def test_breakers_are_per_integration(self, upstream: tuple[str, _Upstream]) -> None:
+        url, state = upstream
+        state.statuses = [503]
+        pool = IntegrationClientPool(ClientSettings(failure_threshold=1))
+
+        async def _go() -> None:
+            await pool.request("flaky", "POST", url)
+            assert (await pool.request("healthy", "POST", url)).status_code == 200
+            await pool.aclose()
+
+        asyncio.run(_go())
+        assert state.hits == 2
+
+    def test_bulkhead_caps_concurrency(self, upstream: tuple[str, _Upstream]) -> None:
+        url, state = upstream
+        state.delay = 0.3
+        pool = IntegrationClientPool(ClientSettings(max_concurrency=1, queue_timeout=0.05))
+
+        async def _go() -> tuple[list[Any], dict[str, Any]]:
+            results = await asyncio.gather(
+                pool.request("partner", "POST", url),
+                pool.request("partner", "POST", url),
+                return_exceptions=True,
+            )
+            stats = pool.stats()["partner"]
+            await pool.aclose()
+            return results, stats
+
+        results, stats = asyncio.run(_go())
+        assert sum(isinstance(r, BulkheadFullError) for r in results) == 1
+        assert state.hits == 1
+        # A refused call is not an upstream failure
+        assert stats["failures"] == 0
+        assert stats["in_flight"] == 0
+
+    def test_transport_error_counts_as_failure(self) -> None:
+        pool = IntegrationClientPool(ClientSettings(failure_threshold=1, timeout=0.5))
+
+        async def _go() -> None:
+            # Nothing listens on port 9 (discard) on localhost.
+            with pytest.raises(httpx.ConnectError):
+                await pool.request("partner", "POST", "http://127.0.0.1:9/")
+            assert pool.stats()["partner"]["state"] == "open"
+            await pool.aclose()
+
+        asyncio.run(_go())
+
+    def test_caller_error_does_not_count(self) -> None:
+        pool = IntegrationClientPool(ClientSettings(failure_threshold=1))
+
+        async def _go() -> None:
+            with pytest.raises(httpx.UnsupportedProtocol):
+                await pool.request("partner", "POST", "ftp://127.0.0.1/")
+            assert pool.stats()["partner"]["failures"] == 0
+            await pool.aclose()
+
+        asyncio.run(_go())
+
+    def test_cancelled_probe_frees_the_half_open_slot(
+        self, upstream: tuple[str, _Upstream]
+    ) -> None:
+        url, state = upstream
+        state.statuses = [500]
+        clock = _Clock()
+        pool = IntegrationClientPool(
+            ClientSettings(failure_threshold=1, reset_timeout=30.0), clock=clock
+        )
+
+        async def _go() -> None:
+            await pool.request("partner", "POST", url)
+            clock.now += 30.0
+            state.delay = 0.5
+            probe = asyncio.create_task(pool.request("partner", "POST", url))
+            await asyncio.sleep(0.1)
+            probe.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await probe
+            assert pool.stats()["partner"]["failures"] == 1
+            state.delay = 0.0
+            # The next call probes instead of failing fast on a stuck probe
+            assert (await pool.request("partner", "POST", url)).status_code == 200
+            assert pool.stats()["partner"]["state"] == "closed"
+            await pool.aclose()
+
+        asyncio.run(_go())
+
+
+def test_app_pool_is_shared_and_closed_on_shutdown() -> None:
+    app = SimpleNamespace(state=SimpleNamespace())
+    pool = app_client_pool(app)
+    assert app_client_pool(app) is pool
+    assert app.state._dazzle_lifespan_shutdown == [pool.aclose]
@@ -12,7 +12,7 @@ import textwrap
 
 import pytest
 
-from dazzle.core.ir import JobBackoff
+from dazzle.core.ir import JobBackoff, JobCatchUp
 
 
 @pytest.fixture()
@@ -140,6 +140,41 @@ class TestScheduledJob:
         assert job.schedule.cron == "0 1 * * *"
         assert job.timeout_seconds == 300  # 5m → 300s
         assert job.triggers == []
+        assert job.schedule.catch_up == JobCatchUp.LATEST
+
+    def test_catch_up_policy(self, parse_dsl, tmp_path):
+        appspec = parse_dsl(
+            """
+            module test
+            app jobs_test "Jobs Test"
+
+            job nightly "Nightly":
+              schedule: cron("0 2 * * *")
+              catch_up: all
+              run: scripts/nightly.py
+            """,
+            tmp_path,
+        )
+        job = next(j for j in appspec.jobs if j.name == "nightly")
+        assert job.schedule is not None
+        assert job.schedule.catch_up == JobCatchUp.ALL
+
+    def test_invalid_catch_up_rejected(self, parse_dsl, tmp_path):
+        from dazzle.core.errors import ParseError
+
+        with pytest.raises(ParseError, match="Invalid catch_up"):
+            parse_dsl(
+                """
+                module test
+                app jobs_test "Jobs Test"
+
+                job nightly "Nightly":
+                  schedule: cron("0 2 * * *")
+                  catch_up: sometimes
+                  run: scripts/nightly.py
+                """,
+                tmp_path,
+            )
 
 
 class TestRetryAndDeadLetter:
@@ -19,14 +19,18 @@ from __future__ import annotations
 import asyncio
 from dataclasses import dataclass
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
+from dazzle.core.ir import JobCatchUp
 from dazzle.http.runtime.cron import CronParseError, parse_cron
 from dazzle.http.runtime.job_queue import InMemoryJobQueue
 from dazzle.http.runtime.job_scheduler import (
     parse_scheduled_jobs,
     run_scheduler_loop,
+    schedule_ledger,
+    scheduled_catch_up,
 )
 
 # ---------------------------------------------------------------------------
@@ -38,6 +42,7 @@ from dazzle.http.runtime.job_scheduler import (
 class _Schedule:
     cron: str
     timezone: str = ""
+    catch_up: JobCatchUp = JobCatchUp.LATEST
 
 
 @dataclass
@@ -238,3 +243,50 @@ class TestSchedulerLoop:
         msg = _run(go())
         if msg is not None:  # may be None if no tick fired in window
             assert "scheduled_at" in msg.payload
+
+
+# ---------------------------------------------------------------------------
+# Catch-up policy + ledger selection
+# ---------------------------------------------------------------------------
+
+
+class TestClusterWiring:
+    def test_catch_up_per_scheduled_job(self):
+        jobs = [
+            _JobSpec(name="nightly", schedule=_Schedule("0 2 * * *", catch_up=JobCatchUp.ALL)),
+            _JobSpec(name="hourly", schedule=_Schedule("0 * * * *")),
+            _JobSpec(name="triggered"),
+        ]
+        assert scheduled_catch_up(jobs) == {
+            "nightly": JobCatchUp.ALL,
+            "hourly": JobCatchUp.LATEST,
+        }
+
+    def test_ledger_is_in_memory_without_dsn(self):
+        assert type(schedule_ledger("")).__name__ == "MemoryScheduleLedger"
+        assert type(schedule_ledger("postgres://db/app")).__name__ == "PgScheduleLedger"
+
+    def test_same_window_not_resubmitted_across_restarts_sharing_a_ledger(self):
+        # Two scheduler runs sharing one ledger (two replicas, or a
+        # restart) submit the current minute once between them.
+        ledger = schedule_ledger("")
+
+        async def go():
+            queue = InMemoryJobQueue()
+            for _ in range(2):
+                stop = asyncio.Event()
+                asyncio.get_running_loop().call_later(0.05, stop.set)
+                with patch(
+                    "dazzle.http.runtime.job_scheduler.schedule_ledger", lambda _dsn: ledger
+                ):
+                    await run_scheduler_loop(
+                        scheduled=[("x", parse_cron("* * * * *"))],
+                        queue=queue,
+                        stop_event=stop,
+                        tick_interval=0.02,
+                    )
+            return await queue.size()
+
+        size = _run(go())
+        # A minute boundary can fall inside the test window; never more.
+        assert 1 <= size <= 2
@@ -0,0 +1,199 @@
+"""Tests for the Knowledge Graph full-text index and adjacency snapshot."""
+
+import importlib.util
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+
+def _import_knowledge_graph_module(module_name: str):
+    """Import knowledge graph modules directly to avoid MCP package init issues."""
+    module_path = (
+        Path(__file__).parent.parent.parent
+        / "src"
+        / "dazzle"
+        / "mcp"
+        / "knowledge_graph"
+        / f"{module_name}.py"
+    )
+    spec = importlib.util.spec_from_file_location(
+        f"dazzle.mcp.knowledge_graph.{module_name}",
+        module_path,
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[f"dazzle.mcp.knowledge_graph.{module_name}"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+_store_module = _import_knowledge_graph_module("store")
+KnowledgeGraph = _store_module.KnowledgeGraph
+
+
+def _ids(entities) -> set[str]:
+    return {e.id for e in entities}
+
+
+def _searchable_graph(path=":memory:") -> KnowledgeGraph:
+    graph = KnowledgeGraph(path)
+    graph.create_entity("entity:Task", "Task", metadata={"module": "todo"})
+    graph.create_entity("entity:TaskItem", "TaskItem", metadata={"note": 'say "hi"'})
+    graph.create_entity("surface:task_list", "task_list", metadata={"mode": "list"})
+    graph.create_entity("concept:parser", "Parser", metadata={"description": "DSL parsing"})
+    graph.create_entity("concept:bare", "bare")
+    return graph
+
+
+class TestFullTextSearch:
+    @pytest.mark.parametrize(
+        "text",
+        ["task", "TASK", "ask_l", "todo", "pars", '"hi"', "module", "nothing here", "ta", ""],
+    )
+    def test_matches_like_scan(self, text: str) -> None:
+        graph = _searchable_graph()
+        assert graph._fts_enabled
+        indexed = _ids(graph.query(text, limit=100))
+        graph._fts_enabled = False
+        assert indexed == _ids(graph.query(text, limit=100))
+
+    def test_index_follows_updates_and_deletes(self) -> None:
+        graph = _searchable_graph()
+        graph.create_entity("entity:Task", "Chore", metadata={"module": "home"})
+        assert "entity:Task" not in _ids(graph.query("todo"))
+        assert "entity:Task" in _ids(graph.query("chore"))
+
+        graph.delete_by_metadata_key("mode", "list")
+        graph.delete_entity("concept:parser")
+        assert _ids(graph.query("list")) == set()
+        assert _ids(graph.query("pars")) == set()
+
+    def test_entity_type_filter_and_limit(self) -> None:
+        graph = _searchable_graph()
+        assert _ids(graph.query("task", entity_types=["dsl_surface"])) == {"surface:task_list"}
+        assert len(graph.query("task", limit=2)) == 2
+
+    def test_existing_database_is_indexed_on_open(self, tmp_path: Path) -> None:
+        db = tmp_path / "kg.db"
+        _searchable_graph(db).close()
+        conn = sqlite3.connect(db)
+        conn.executescript(
+            "DROP TRIGGER entities_fts_ai; DROP TRIGGER entities_fts_ad; "
+            "DROP TRIGGER entities_fts_au; DROP TABLE entities_fts;"
+        )
+        conn.close()
+
+        assert _ids(KnowledgeGraph(db).query("task")) == {
+            "entity:Task",
+            "entity:TaskItem",
+            "surface:task_list",
+        }
+
+
+def _chain_graph() -> KnowledgeGraph:
+    graph = KnowledgeGraph(":memory:")
+    graph.create_relation("a", "b", "calls")
+    graph.create_relation("b", "c", "calls")
+    graph.create_relation("a", "c", "imports")
+    graph.create_relation("c", "a", "calls")  # cycle back to the start
+    graph.create_relation("c", "d", "calls")
+    return graph
+
+
+class TestFindPaths:
+    def test_shortest_first_without_revisits(self) -> None:
+        paths = _chain_graph().find_paths("a", "d")
+        assert [(p.path, p.relations, p.length) for p in paths] == [
+            (["a", "c", "d"], ["imports", "calls"], 2),
+            (["a", "b", "c", "d"], ["calls", "calls", "calls"], 3),
+        ]
+
+    def test_relation_type_filter_and_depth(self) -> None:
+        graph = _chain_graph()
+        assert [p.path for p in graph.find_paths("a", "d", relation_types=["calls"])] == [
+            ["a", "b", "c", "d"]
+        ]
+        assert [p.path for p in graph.find_paths("a", "d", max_depth=2)] == [["a", "c", "d"]]
+        assert graph.find_paths("d", "a") == []
+
+    def test_prefix_named_entities_are_not_treated_as_visited(self) -> None:
+        graph = KnowledgeGraph(":memory:")
+        graph.create_relation("entity:TaskItem", "entity:Task", "references")
+        paths = graph.find_paths("entity:TaskItem", "entity:Task")
+        assert [p.path for p in paths] == [["entity:TaskItem", "entity:Task"]]
+
+    def test_result_limit(self) -> None:
+        graph = KnowledgeGraph(":memory:")
+        for i in range(15):
+            graph.create_relation("s", f"m{i}", "calls")
+            graph.create_relation(f"m{i}", "t", "calls")
+        assert len(graph.find_paths("s", "t")) == 10
+
+
+class TestAdjacencySnapshot:
+    def test_reused_until_relations_change(self) -> None:
+        graph = _chain_graph()
+        first = graph._adjacency()
+        graph.create_entity("x", "unrelated")
+        assert graph._adjacency() is first
+
+        graph.delete_relation("c", "d", "calls")
+        assert graph._adjacency() is not first
+        assert graph.find_paths("a", "d") == []
+
+    def test_cascaded_delete_invalidates(self) -> None:
+        graph = _chain_graph()
+        assert graph.find_paths("a", "d")
+        graph.delete_entity("c")
+        assert graph.find_paths("a", "d") == []
+        assert _ids(graph.get_neighbourhood("a")["entities"]) == {"a", "b"}
+
+    def test_write_from_another_store_invalidates(self, tmp_path: Path) -> None:
+        reader = KnowledgeGraph(tmp_path / "kg.db")
+        writer = KnowledgeGraph(tmp_path / "kg.db")
+        writer.create_relation("a", "b", "calls")
+        assert reader.compute_adjacency("a", "b") == 1
+        writer.delete_relation("a", "b", "calls")
+        assert reader.compute_adjacency("a", "b") == -1
+
+    def test_neighbourhood_and_dependents(self) -> None:
+        graph = _chain_graph()
+        graph.create_relation("d", "d", "references")
+
+        hood = graph.get_neighbourhood("d", depth=2, direction="both")
+        assert _ids(hood["entities"]) == {"a", "b", "c", "d"}
+        assert sum(r.source_id == r.target_id for r in hood["relations"]) == 1
+
+        assert _ids(graph.get_dependents("c", relation_types=["calls"])) == {"b"}
+        assert _ids(graph.get_dependencies("a", transitive=True, max_depth=2)) == {"b", "c", "d"}
+
+
+def test_connection_is_reused_per_thread(tmp_path: Path) -> None:
+    graph = KnowledgeGraph(tmp_path / "kg.db")
+    conn = graph._get_connection()
+    assert graph._get_connection() is conn
+
+    other: list[sqlite3.Connection] = []
+    thread = threading.Thread(target=lambda: other.append(graph._get_connection()))
+    thread.start()
+    thread.join()
+    assert other[0] is not conn
+
+
+def test_close_closes_every_thread_connection(tmp_path: Path) -> None:
+    graph = KnowledgeGraph(tmp_path / "kg.db")
+    mine = graph._get_connection()
+    other: list[sqlite3.Connection] = []
+    thread = threading.Thread(target=lambda: other.append(graph._get_connection()))
+    thread.start()
+    thread.join()
+
+    graph.close()
+    for conn in (mine, other[0]):
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+    # A later call opens a fresh connection rather than reusing a closed one.
+    assert graph._get_connection().execute("SELECT 1").fetchone()[0] == 1
+    graph.close()
@@ -0,0 +1,206 @@
+"""Incremental re-analysis in the language server.
+
+An edit must re-parse only the edited file, skip re-linking when the
+file's IR is unchanged, and refresh the name index in place; bursts of
+edits must collapse into one debounced analysis run.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from dazzle.core import parser as parser_mod
+from dazzle.core.errors import ParseError
+from dazzle.lsp.analysis import EditDebouncer, ProjectAnalysis
+
+_TOML = '[project]\nname = "t"\nversion = "0.1.0"\nroot = "t"\n[modules]\npaths = ["./dsl"]\n'
+
+_APP = """module t
+app T "T"
+
+entity Task "Task":
+  id: uuid pk
+  title: str(200) required
+"""
+
+_EXTRA = """module t.extra
+
+entity Note "Note":
+  id: uuid pk
+  body: text
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    dsl_dir = tmp_path / "dsl"
+    dsl_dir.mkdir()
+    (dsl_dir / "app.dsl").write_text(_APP)
+    (dsl_dir / "extra.dsl").write_text(_EXTRA)
+    (tmp_path / "dazzle.toml").write_text(_TOML)
+    return tmp_path
+
+
+@pytest.fixture
+def count_parses(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    parsed: list[Path] = []
+    real = parser_mod.parse_dsl
+
+    def _spy(text: str, path: Path):  # type: ignore[no-untyped-def]
+        parsed.append(path)
+        return real(text, path)
+
+    monkeypatch.setattr(parser_mod, "parse_dsl", _spy)
+    return parsed
+
+
+def _loaded(project: Path) -> ProjectAnalysis:
+    analysis = ProjectAnalysis.load(project)
+    analysis.link()
+    return analysis
+
+
+def test_edit_reparses_only_the_edited_file(project: Path, count_parses: list[Path]) -> None:
+    analysis = _loaded(project)
+    count_parses.clear()
+
+    extra = project / "dsl" / "extra.dsl"
+    delta = analysis.apply_edit(extra, _EXTRA.replace("Note", "Memo"))
+
+    assert count_parses == [extra.resolve()]
+    assert delta.added == {("entities", "Memo")}
+    assert delta.removed == {("entities", "Note")}
+    assert analysis.needs_link
+    appspec = analysis.link()
+    assert {e.name for e in appspec.domain.entities} >= {"Task", "Memo"}
+
+
+def test_unchanged_text_is_not_reparsed(project: Path, count_parses: list[Path]) -> None:
+    analysis = _loaded(project)
+    count_parses.clear()
+
+    delta = analysis.apply_edit(project / "dsl" / "app.dsl", _APP)
+
+    assert count_parses == []
+    assert not delta.ir_changed
+    assert not analysis.needs_link
+
+
+def test_comment_only_edit_skips_relink(project: Path) -> None:
+    analysis = _loaded(project)
+
+    delta = analysis.apply_edit(project / "dsl" / "extra.dsl", _EXTRA + "# trailing note\n")
+
+    assert not delta.ir_changed
+    assert not analysis.needs_link
+
+
+def test_parse_error_keeps_last_good_module_and_forces_relink(project: Path) -> None:
+    analysis = _loaded(project)
+    extra = project / "dsl" / "extra.dsl"
+
+    with pytest.raises(ParseError):
+        analysis.apply_edit(extra, "entity Broken:\n  id uuid pk\n  ???\n")
+    assert analysis.needs_link
+
+    # Reverting to the last good text must re-link so the error is cleared.
+    delta = analysis.apply_edit(extra, _EXTRA)
+    assert not delta.ir_changed
+    assert analysis.needs_link
+    assert "Note" in {e.name for e in analysis.link().domain.entities}
+
+
+def test_owns_only_project_files(project: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+    analysis = _loaded(project)
+    assert analysis.owns(project / "dsl" / "app.dsl")
+    assert not analysis.owns(tmp_path_factory.mktemp("other") / "app.dsl")
+
+
+def test_name_index_updated_in_place(project: Path) -> None:
+    from dazzle.lsp.server import _update_name_index
+
+    analysis = _loaded(project)
+    index: dict[str, tuple[str, object]] = {}
+    _update_name_index(index, analysis.link())
+    same_dict = index
+    assert "Note" in index
+
+    analysis.apply_edit(project / "dsl" / "extra.dsl", _EXTRA.replace("Note", "Memo"))
+    _update_name_index(index, analysis.link())
+
+    assert index is same_dict
+    assert "Memo" in index and "Note" not in index
+    assert index["Task"][0] == "entity"
+
+
+async def test_debouncer_coalesces_bursts_on_the_event_loop() -> None:
+    loop = asyncio.get_running_loop()
+    done: asyncio.Future[int] = loop.create_future()
+
+    def _run(generation: int) -> None:
+        assert asyncio.get_running_loop() is loop
+        done.set_result(generation)
+
+    debouncer = EditDebouncer(0.05, _run)
+    for _ in range(5):
+        last = debouncer.schedule()
+
+    assert await asyncio.wait_for(done, 2) == last
+    assert debouncer.is_current(last)
+
+
+async def test_debouncer_marks_overtaken_runs_stale() -> None:
+    debouncer = EditDebouncer(60, lambda _generation: None)
+    first = debouncer.schedule()
+    second = debouncer.schedule()
+
+    assert not debouncer.is_current(first)
+    assert debouncer.flush() == second
+    assert debouncer.is_current(second)
+
+
+async def test_reanalyze_reports_parse_errors_in_every_edited_file(project: Path) -> None:
+    from dazzle.lsp.server import _reanalyze
+
+    published: dict[str, list[object]] = {}
+    ls = SimpleNamespace(
+        analysis=_loaded(project),
+        debouncer=EditDebouncer(60, lambda _generation: None),
+        text_document_publish_diagnostics=lambda p: published.__setitem__(p.uri, p.diagnostics),
+    )
+    broken = "entity Broken:\n  id uuid pk\n  ???\n"
+    app, extra = project / "dsl" / "app.dsl", project / "dsl" / "extra.dsl"
+
+    _reanalyze(ls, {app: broken, extra: broken}, ls.debouncer.flush())  # type: ignore[arg-type]
+
+    assert set(published) == {app.resolve().as_uri(), extra.resolve().as_uri()}
+    assert all(published.values())
+
+
+async def test_parse_error_survives_a_valid_edit_of_another_file(project: Path) -> None:
+    from dazzle.lsp.server import _reanalyze
+
+    published: dict[str, list[object]] = {}
+    ls = SimpleNamespace(
+        analysis=_loaded(project),
+        appspec=None,
+        name_index={},
+        debouncer=EditDebouncer(60, lambda _generation: None),
+        text_document_publish_diagnostics=lambda p: published.__setitem__(p.uri, p.diagnostics),
+    )
+    app, extra = project / "dsl" / "app.dsl", project / "dsl" / "extra.dsl"
+
+    _reanalyze(ls, {extra: "entity Broken:\n  id uuid pk\n  ???\n"}, ls.debouncer.flush())  # type: ignore[arg-type]
+    _reanalyze(ls, {app: _APP.replace("Task", "Job")}, ls.debouncer.flush())  # type: ignore[arg-type]
+
+    # extra.dsl is still broken: its error must not be cleared by the re-link
+    assert published[extra.resolve().as_uri()]
+    assert published[app.resolve().as_uri()] == []
+
+    _reanalyze(ls, {extra: _EXTRA}, ls.debouncer.flush())  # type: ignore[arg-type]
+    assert published[extra.resolve().as_uri()] == []
+    assert not ls.analysis.parse_errors
@@ -1,9 +1,11 @@
 """Tests for the integration mapping executor (v0.30.0)."""
 
 import asyncio
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from dazzle.core.ir.integrations import (
@@ -21,6 +23,7 @@ from dazzle.core.ir.integrations import (
     MappingTriggerType,
 )
 from dazzle.http.runtime.event_bus import EntityEvent, EntityEventBus, EntityEventType
+from dazzle.http.runtime.integration_client import ClientSettings, IntegrationClientPool
 from dazzle.http.runtime.mapping_executor import MappingExecutor
 
 # ---------------------------------------------------------------------------
@@ -416,7 +419,7 @@ class TestBaseUrlResolution:
 
 
 class TestEventHandling:
-    @patch("dazzle.http.runtime.mapping_executor.httpx.AsyncClient")
+    @patch("dazzle.http.runtime.integration_client.httpx.AsyncClient")
     def test_on_create_triggers_mapping(self, mock_client_cls: MagicMock) -> None:
         """Entity created event triggers an ON_CREATE mapping."""
         mock_resp = MagicMock()
@@ -454,7 +457,7 @@ class TestEventHandling:
         assert executor.results[0].mapped_fields == {"external_id": "ext-1"}
         update_fn.assert_called_once()
 
-    @patch("dazzle.http.runtime.mapping_executor.httpx.AsyncClient")
+    @patch("dazzle.http.runtime.integration_client.httpx.AsyncClient")
     def test_on_update_triggers_mapping(self, mock_client_cls: MagicMock) -> None:
         mock_resp = MagicMock()
         mock_resp.status_code = 200
@@ -525,7 +528,7 @@ class TestEventHandling:
 
 
 class TestRequestMappingIntegration:
-    @patch("dazzle.http.runtime.mapping_executor.httpx.AsyncClient")
+    @patch("dazzle.http.runtime.integration_client.httpx.AsyncClient")
     def test_request_body_built_from_mapping(self, mock_client_cls: MagicMock) -> None:
         mock_resp = MagicMock()
         mock_resp.status_code = 201
@@ -577,7 +580,7 @@ class TestRequestMappingIntegration:
 
 
 class TestErrorStrategy:
-    @patch("dazzle.http.runtime.mapping_executor.httpx.AsyncClient")
+    @patch("dazzle.http.runtime.integration_client.httpx.AsyncClient")
     def test_ignore_error(self, mock_client_cls: MagicMock) -> None:
         mock_resp = MagicMock()
         mock_resp.status_code = 500
@@ -606,7 +609,7 @@ class TestErrorStrategy:
         assert len(executor.results) == 1
         assert executor.results[0].success is False
 
-    @patch("dazzle.http.runtime.mapping_executor.httpx.AsyncClient")
+    @patch("dazzle.http.runtime.integration_client.httpx.AsyncClient")
     def test_set_fields_on_error(self, mock_client_cls: MagicMock) -> None:
         mock_resp = MagicMock()
         mock_resp.status_code = 422
@@ -640,7 +643,7 @@ class TestErrorStrategy:
         # set_fields should have been applied
         update_fn.assert_called_once_with("Company", "abc-123", {"kyc_status": "error"})
 
-    @patch("dazzle.http.runtime.mapping_executor.httpx.AsyncClient")
+    @patch("dazzle.http.runtime.integration_client.httpx.AsyncClient")
     def test_revert_transition(self, mock_client_cls: MagicMock) -> None:
         mock_resp = MagicMock()
         mock_resp.status_code = 500
@@ -685,9 +688,9 @@ class TestErrorStrategy:
         # Should revert status to previous state
         update_fn.assert_any_call("Company", "abc-123", {"status": "reviewed"})
 
-    @patch("dazzle.http.runtime.mapping_executor.httpx.AsyncClient")
-    def test_retry_on_failure(self, mock_client_cls: MagicMock) -> None:
-        """Retry should attempt up to 3 times."""
+    @patch("dazzle.http.runtime.integration_client.httpx.AsyncClient")
+    def test_retry_parks_instead_of_sleeping(self, mock_client_cls: MagicMock) -> None:
+        """A transient failure is parked for re-delivery — one call, no inline sleep."""
         mock_resp = MagicMock()
         mock_resp.status_code = 503
         mock_resp.json.return_value = {"error": "unavailable"}
@@ -695,30 +698,64 @@ class TestErrorStrategy:
 
         mock_client = AsyncMock()
         mock_client.request = AsyncMock(return_value=mock_resp)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
         mock_client_cls.return_value = mock_client
 
         mapping = _make_mapping(
-            on_error=ErrorStrategy(actions=[ErrorAction.RETRY]),
+            on_error=ErrorStrategy(actions=[ErrorAction.RETRY], set_fields={"sync": "failed"}),
         )
         integration = _make_integration(mappings=[mapping])
         appspec = _make_appspec(integration)
         bus = EntityEventBus()
 
-        executor = MappingExecutor(appspec, bus)
+        update_fn = AsyncMock()
+        executor = MappingExecutor(appspec, bus, update_entity=update_fn)
         executor.register_all()
 
-        # Patch sleep to speed up test
-        with patch("dazzle.http.runtime.mapping_executor.asyncio.sleep", new_callable=AsyncMock):
-            event = _make_event()
-            _run(executor.handle_event(event))
+        _run(executor.handle_event(_make_event()))
 
-        # Should have retried 3 times total
-        assert mock_client.request.call_count == 3
+        assert mock_client.request.call_count == 1
         assert executor.results[0].success is False
+        assert executor.results[0].next_retry_at is not None
+        assert executor._redelivery.store.pending() == 1
+        # Error strategy waits for the final attempt
+        update_fn.assert_not_called()
+
+    @patch("dazzle.http.runtime.integration_client.httpx.AsyncClient")
+    def test_redelivery_gives_up_after_max_attempts(self, mock_client_cls: MagicMock) -> None:
+        mock_resp = MagicMock()
+        mock_resp.status_code = 503
+        mock_resp.json.return_value = {"error": "unavailable"}
+        mock_resp.text = "unavailable"
 
-    @patch("dazzle.http.runtime.mapping_executor.httpx.AsyncClient")
+        mock_client = AsyncMock()
+        mock_client.request = AsyncMock(return_value=mock_resp)
+        mock_client_cls.return_value = mock_client
+
+        mapping = _make_mapping(
+            on_error=ErrorStrategy(actions=[ErrorAction.RETRY], set_fields={"sync": "failed"}),
+        )
+        integration = _make_integration(mappings=[mapping])
+        appspec = _make_appspec(integration)
+        bus = EntityEventBus()
+
+        update_fn = AsyncMock()
+        executor = MappingExecutor(appspec, bus, update_entity=update_fn)
+        executor.register_all()
+        later = datetime.now(UTC) + timedelta(hours=1)
+
+        _run(executor.handle_event(_make_event()))
+        assert _run(executor.redeliver_due(later)) == 1
+        assert _run(executor.redeliver_due(later)) == 1
+        assert _run(executor.redeliver_due(later)) == 0
+
+        # Should have tried 3 times total
+        assert mock_client.request.call_count == 3
+        assert [r.attempt for r in executor.results] == [1, 2, 3]
+        assert executor.results[-1].next_retry_at is None
+        assert executor._redelivery.store.pending() == 0
+        update_fn.assert_called_once_with("Company", "abc-123", {"sync": "failed"})
+
+    @patch("dazzle.http.runtime.integration_client.httpx.AsyncClient")
     def test_retry_succeeds_on_second_attempt(self, mock_client_cls: MagicMock) -> None:
         fail_resp = MagicMock()
         fail_resp.status_code = 503
@@ -732,8 +769,6 @@ class TestErrorStrategy:
 
         mock_client = AsyncMock()
         mock_client.request = AsyncMock(side_effect=[fail_resp, success_resp])
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
         mock_client_cls.return_value = mock_client
 
         mapping = _make_mapping(
@@ -746,12 +781,84 @@ class TestErrorStrategy:
         executor = MappingExecutor(appspec, bus)
         executor.register_all()
 
-        with patch("dazzle.http.runtime.mapping_executor.asyncio.sleep", new_callable=AsyncMock):
-            event = _make_event()
-            _run(executor.handle_event(event))
+        _run(executor.handle_event(_make_event()))
+        _run(executor.redeliver_due(datetime.now(UTC) + timedelta(hours=1)))
 
         assert mock_client.request.call_count == 2
-        assert executor.results[0].success is True
+        assert executor.results[-1].success is True
+        assert executor._redelivery.store.pending() == 0
+
+    @patch("dazzle.http.runtime.integration_client.httpx.AsyncClient")
+    def test_non_transient_failure_not_retried(self, mock_client_cls: MagicMock) -> None:
+        mock_resp = MagicMock()
+        mock_resp.status_code = 422
+        mock_resp.json.return_value = {"error": "validation"}
+        mock_resp.text = "validation"
+
+        mock_client = AsyncMock()
+        mock_client.request = AsyncMock(return_value=mock_resp)
+        mock_client_cls.return_value = mock_client
+
+        mapping = _make_mapping(on_error=ErrorStrategy(actions=[ErrorAction.RETRY]))
+        executor = MappingExecutor(
+            _make_appspec(_make_integration(mappings=[mapping])), EntityEventBus()
+        )
+        executor.register_all()
+
+        _run(executor.handle_event(_make_event()))
+
+        assert executor.results[0].next_retry_at is None
+        assert executor._redelivery.store.pending() == 0
+
+    @patch("dazzle.http.runtime.integration_client.httpx.AsyncClient")
+    def test_open_circuit_parks_until_probe(self, mock_client_cls: MagicMock) -> None:
+        """A call refused by an open circuit is parked no sooner than the next probe."""
+        mock_client = AsyncMock()
+        mock_client.request = AsyncMock(side_effect=httpx.ConnectError("refused"))
+        mock_client_cls.return_value = mock_client
+
+        mapping = _make_mapping(on_error=ErrorStrategy(actions=[ErrorAction.RETRY]))
+        pool = IntegrationClientPool(ClientSettings(failure_threshold=1, reset_timeout=60.0))
+        executor = MappingExecutor(
+            _make_appspec(_make_integration(mappings=[mapping])),
+            EntityEventBus(),
+            client_pool=pool,
+        )
+        executor.register_all()
+
+        _run(executor.handle_event(_make_event()))
+        _run(executor.handle_event(_make_event(entity_id="def-456")))
+
+        assert mock_client.request.call_count == 1
+        refused = executor.results[1]
+        assert "circuit is open" in (refused.error or "")
+        assert refused.next_retry_at is not None
+        assert refused.next_retry_at >= datetime.now(UTC) + timedelta(seconds=50)
+
+    @patch("dazzle.http.runtime.integration_client.httpx.AsyncClient")
+    def test_client_reused_across_events(self, mock_client_cls: MagicMock) -> None:
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.json.return_value = {}
+        mock_resp.text = "{}"
+
+        mock_client = AsyncMock()
+        mock_client.request = AsyncMock(return_value=mock_resp)
+        mock_client_cls.return_value = mock_client
+
+        mapping = _make_mapping()
+        executor = MappingExecutor(
+            _make_appspec(_make_integration(mappings=[mapping])), EntityEventBus()
+        )
+        executor.register_all()
+
+        _run(executor.handle_event(_make_event()))
+        _run(executor.handle_event(_make_event(entity_id="def-456")))
+        _run(executor.shutdown())
+
+        assert mock_client.request.call_count == 2
+        assert mock_client_cls.call_count == 1
+        mock_client.aclose.assert_awaited_once()
 
 
 # ---------------------------------------------------------------------------
@@ -783,7 +890,7 @@ class TestNoBaseUrl:
 
 
 class TestManualExecution:
-    @patch("dazzle.http.runtime.mapping_executor.httpx.AsyncClient")
+    @patch("dazzle.http.runtime.integration_client.httpx.AsyncClient")
     def test_execute_manual(self, mock_client_cls: MagicMock) -> None:
         mock_resp = MagicMock()
         mock_resp.status_code = 200
@@ -830,7 +937,7 @@ class TestManualExecution:
 
 
 class TestTransitionTrigger:
-    @patch("dazzle.http.runtime.mapping_executor.httpx.AsyncClient")
+    @patch("dazzle.http.runtime.integration_client.httpx.AsyncClient")
     def test_transition_match(self, mock_client_cls: MagicMock) -> None:
         mock_resp = MagicMock()
         mock_resp.status_code = 200
@@ -868,7 +975,7 @@ class TestTransitionTrigger:
         assert len(executor.results) == 1
         assert executor.results[0].success is True
 
-    @patch("dazzle.http.runtime.mapping_executor.httpx.AsyncClient")
+    @patch("dazzle.http.runtime.integration_client.httpx.AsyncClient")
     def test_transition_no_match(self, mock_client_cls: MagicMock) -> None:
         mapping = _make_mapping(
             triggers=[
@@ -0,0 +1,136 @@
+"""Tests for the mapping redelivery stores."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+from dazzle.http.runtime.event_bus import EntityEvent, EntityEventType
+from dazzle.http.runtime.mapping_redelivery import (
+    MemoryRedeliveryStore,
+    Redelivery,
+    RedeliveryWorker,
+    _from_row,
+)
+
+_NOW = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+
+
+def _delivery(due_in: float, **kw: object) -> Redelivery:
+    fields: dict = {
+        "integration": "crm",
+        "mapping": "push_contact",
+        "entity_name": "Contact",
+        "entity_id": "c-1",
+        "event_type": "created",
+        "data": {"id": "c-1"},
+        "attempt": 2,
+        "due_at": _NOW + timedelta(seconds=due_in),
+        **kw,
+    }
+    return Redelivery(**fields)
+
+
+class TestMemoryStore:
+    def test_claims_only_due_oldest_first(self) -> None:
+        store = MemoryRedeliveryStore()
+        late, early, future = _delivery(-1), _delivery(-5), _delivery(60)
+        for d in (late, early, future):
+            store.schedule(d)
+        assert store.claim_due(_NOW) == [early, late]
+        assert store.claim_due(_NOW) == []
+        assert store.pending() == 3
+
+    def test_limit(self) -> None:
+        store = MemoryRedeliveryStore()
+        for i in range(5):
+            store.schedule(_delivery(-i))
+        assert len(store.claim_due(_NOW, limit=2)) == 2
+
+    def test_reschedule_same_id_replaces(self) -> None:
+        store = MemoryRedeliveryStore()
+        first = _delivery(-1)
+        store.schedule(first)
+        (claimed,) = store.claim_due(_NOW)
+        store.schedule(_delivery(30, id=claimed.id, attempt=3))
+        assert store.pending() == 1
+        (again,) = store.claim_due(_NOW + timedelta(seconds=30))
+        assert again.id == first.id
+        assert again.attempt == 3
+
+    def test_complete_forgets(self) -> None:
+        store = MemoryRedeliveryStore()
+        d = _delivery(-1)
+        store.schedule(d)
+        store.claim_due(_NOW)
+        store.complete(d.id)
+        assert store.pending() == 0
+
+
+class TestWorker:
+    def test_completes_finished_and_keeps_reparked(self) -> None:
+        store = MemoryRedeliveryStore()
+        done, again = _delivery(-2), _delivery(-1)
+        store.schedule(done)
+        store.schedule(again)
+
+        async def _run(d: Redelivery) -> bool:
+            if d.id == again.id:
+                store.schedule(_delivery(60, id=d.id, attempt=3))
+                return False
+            return True
+
+        worker = RedeliveryWorker(store, _run)
+        assert asyncio.run(worker.run_due(_NOW)) == 2
+        assert store.pending() == 1
+        assert store.claim_due(_NOW + timedelta(seconds=60))[0].attempt == 3
+
+    def test_crash_leaves_delivery_leased(self) -> None:
+        store = MemoryRedeliveryStore()
+        store.schedule(_delivery(-1))
+
+        async def _run(d: Redelivery) -> bool:
+            raise RuntimeError("boom")
+
+        assert asyncio.run(RedeliveryWorker(store, _run).run_due(_NOW)) == 1
+        assert store.pending() == 1
+        assert store.claim_due(_NOW) == []
+
+
+def test_expired_memory_lease_is_claimed_again() -> None:
+    store = MemoryRedeliveryStore(lease_seconds=60)
+    d = _delivery(-1)
+    store.schedule(d)
+    assert store.claim_due(_NOW) == [d]
+    assert store.claim_due(_NOW + timedelta(seconds=59)) == []
+    assert store.claim_due(_NOW + timedelta(seconds=60)) == [d]
+
+
+def test_backoff_respects_open_circuit() -> None:
+    event = EntityEvent(EntityEventType.CREATED, "Contact", "c-1")
+    first, backoff = Redelivery.after_failure("crm", "push", event, {}, failed_attempt=1)
+    assert backoff == 0.5
+    assert first.attempt == 2
+    second, backoff = Redelivery.after_failure(
+        "crm", "push", event, {}, failed_attempt=2, not_before=30.0, delivery_id=first.id
+    )
+    assert backoff == 30.0
+    assert second.id == first.id
+
+
+def test_row_round_trip() -> None:
+    row = {
+        "id": "r-1",
+        "integration": "crm",
+        "mapping": "push_contact",
+        "entity_name": "Contact",
+        "entity_id": "c-1",
+        "event_type": "updated",
+        "data": '{"id": "c-1", "n": 2}',
+        "attempt": 3,
+        "due_at": datetime(2026, 1, 1, 12, 0),
+    }
+    d = _from_row(row)
+    assert d.data == {"id": "c-1", "n": 2}
+    assert d.due_at.tzinfo is UTC
+    assert d.attempt == 3
@@ -0,0 +1,110 @@
+"""Process-pool mode of ``parse_modules``.
+
+The pool must be invisible to callers: identical ModuleIR output in input
+order, and the same first error (in file order) the sequential loop raises.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from pathlib import Path
+
+import pytest
+
+from dazzle.core.errors import DazzleError, ParseError
+from dazzle.core.parser import (
+    PARALLEL_PARSE_THRESHOLD,
+    _parse_pool,
+    parse_modules,
+    resolve_parse_workers,
+    shutdown_parse_pool,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+INVOICE_OPS_DSL = sorted((REPO_ROOT / "examples" / "invoice_ops").rglob("*.dsl"))
+
+
+def test_below_threshold_is_sequential() -> None:
+    assert resolve_parse_workers(None, PARALLEL_PARSE_THRESHOLD - 1) == 1
+
+
+def test_explicit_workers_capped_by_job_count() -> None:
+    assert resolve_parse_workers(8, 3) == 3
+    assert resolve_parse_workers(1, 100) == 1
+    assert resolve_parse_workers(4, 0) == 1
+
+
+def test_env_override_above_threshold(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DAZZLE_PARSE_WORKERS", "3")
+    assert resolve_parse_workers(None, PARALLEL_PARSE_THRESHOLD) == 3
+    monkeypatch.setenv("DAZZLE_PARSE_WORKERS", "1")
+    assert resolve_parse_workers(None, PARALLEL_PARSE_THRESHOLD) == 1
+
+
+def test_pool_output_matches_sequential() -> None:
+    sequential = parse_modules(INVOICE_OPS_DSL, workers=1)
+    pooled = parse_modules(INVOICE_OPS_DSL, workers=2)
+    assert [m.file for m in pooled] == INVOICE_OPS_DSL
+    assert pooled == sequential
+
+
+def test_pool_is_shared_across_calls() -> None:
+    parse_modules(INVOICE_OPS_DSL, workers=2)
+    pool = _parse_pool()
+    parse_modules(INVOICE_OPS_DSL, workers=2)
+    assert pool is not None and _parse_pool() is pool
+
+    shutdown_parse_pool()
+    assert _parse_pool.cache_info().currsize == 0
+
+
+@pytest.mark.skipif(
+    "forkserver" not in multiprocessing.get_all_start_methods(), reason="no forkserver"
+)
+def test_pool_leaves_the_shared_forkserver_preload_alone(monkeypatch: pytest.MonkeyPatch) -> None:
+    preloads: list[list[str]] = []
+    ctx_type = type(multiprocessing.get_context("forkserver"))
+    monkeypatch.setattr(
+        ctx_type, "set_forkserver_preload", lambda _ctx, mods: preloads.append(mods)
+    )
+    shutdown_parse_pool()
+
+    parse_modules(INVOICE_OPS_DSL, workers=2)
+    assert preloads == []
+
+
+def _write(tmp_path: Path, bodies: list[str]) -> list[Path]:
+    files = []
+    for i, body in enumerate(bodies):
+        f = tmp_path / f"m{i}.dsl"
+        f.write_text(body)
+        files.append(f)
+    return files
+
+
+def _first_error(files: list[Path], workers: int) -> str:
+    with pytest.raises(DazzleError) as exc_info:
+        parse_modules(files, workers=workers)
+    return str(exc_info.value)
+
+
+def test_pool_raises_first_error_in_file_order(tmp_path: Path) -> None:
+    files = _write(
+        tmp_path,
+        [
+            "module m0\n",
+            "module m1\nentity X:\n  id uuid\n",
+            "module m2\nentity Y:\n  !!\n",
+            "module m3\n",
+        ],
+    )
+    sequential = _first_error(files, workers=1)
+    assert "m1.dsl" in sequential
+    assert _first_error(files, workers=2) == sequential
+
+
+def test_read_error_after_parse_error_is_not_reported_first(tmp_path: Path) -> None:
+    files = _write(tmp_path, ["module m0\n", "module m1\nentity X:\n  id uuid\n"])
+    files.append(tmp_path / "missing.dsl")
+    with pytest.raises(ParseError):
+        parse_modules(files, workers=2)
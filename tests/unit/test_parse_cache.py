@@ -0,0 +1,142 @@
+"""Content-hash-keyed parse/link cache for AppSpec loading.
+
+Unchanged projects must load from ``.dazzle/cache/parse`` without
+re-parsing; any content change must invalidate exactly the affected
+entries; a corrupt entry must degrade to a fresh parse.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from dazzle.core import parser as parser_mod
+from dazzle.core.appspec_loader import load_project_appspec
+from dazzle.core.parse_cache import (
+    ParseCache,
+    parse_cache_enabled,
+    project_parse_cache_dir,
+)
+
+_TOML = '[project]\nname = "t"\nversion = "0.1.0"\nroot = "t"\n[modules]\npaths = ["./dsl"]\n'
+
+_APP = """module t
+app T "T"
+
+entity Task "Task":
+  id: uuid pk
+  title: str(200) required
+"""
+
+_EXTRA = """module t.extra
+
+entity Note "Note":
+  id: uuid pk
+  body: text
+"""
+
+
+def _project(tmp_path: Path) -> Path:
+    dsl_dir = tmp_path / "dsl"
+    dsl_dir.mkdir()
+    (dsl_dir / "app.dsl").write_text(_APP)
+    (dsl_dir / "extra.dsl").write_text(_EXTRA)
+    (tmp_path / "dazzle.toml").write_text(_TOML)
+    return tmp_path
+
+
+@pytest.fixture
+def count_parses(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    parsed: list[Path] = []
+    real = parser_mod.parse_dsl
+
+    def _spy(text: str, path: Path):  # type: ignore[no-untyped-def]
+        parsed.append(path)
+        return real(text, path)
+
+    monkeypatch.setattr(parser_mod, "parse_dsl", _spy)
+    return parsed
+
+
+def test_second_load_served_from_appspec_cache(tmp_path: Path, count_parses: list[Path]) -> None:
+    root = _project(tmp_path)
+    first = load_project_appspec(root)
+    assert len(count_parses) == 2
+
+    second = load_project_appspec(root)
+    assert len(count_parses) == 2, "unchanged project must not be re-parsed"
+    assert second == first
+    assert list((project_parse_cache_dir(root) / "appspec").glob("*.pkl"))
+
+
+def test_edit_reparses_only_changed_file(tmp_path: Path, count_parses: list[Path]) -> None:
+    root = _project(tmp_path)
+    load_project_appspec(root)
+    count_parses.clear()
+
+    (root / "dsl" / "extra.dsl").write_text(_EXTRA + "  pinned: bool=false\n")
+    appspec = load_project_appspec(root)
+
+    assert [p.name for p in count_parses] == ["extra.dsl"]
+    note = next(e for e in appspec.domain.entities if e.name == "Note")
+    assert any(f.name == "pinned" for f in note.fields)
+
+
+def test_uncached_load_matches_cached(tmp_path: Path) -> None:
+    root = _project(tmp_path)
+    cached = load_project_appspec(root)
+    assert load_project_appspec(root, use_cache=False) == cached
+
+
+def test_corrupt_entry_is_a_miss(tmp_path: Path, count_parses: list[Path]) -> None:
+    root = _project(tmp_path)
+    load_project_appspec(root)
+    for entry in project_parse_cache_dir(root).rglob("*.pkl"):
+        entry.write_bytes(b"not a pickle")
+    count_parses.clear()
+
+    appspec = load_project_appspec(root)
+    assert len(count_parses) == 2
+    assert {e.name for e in appspec.domain.entities} >= {"Task", "Note"}
+
+
+def test_env_var_disables_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, count_parses: list[Path]
+) -> None:
+    monkeypatch.setenv("DAZZLE_PARSE_CACHE", "0")
+    assert not parse_cache_enabled()
+    root = _project(tmp_path)
+    load_project_appspec(root)
+    load_project_appspec(root)
+    assert len(count_parses) == 4
+    assert not project_parse_cache_dir(root).exists()
+
+
+def test_vocab_manifest_changes_module_keys(tmp_path: Path) -> None:
+    root = _project(tmp_path)
+    files = [root / "dsl" / "app.dsl"]
+    before = ParseCache.for_project(root, files).module_key(files[0], _APP)
+
+    vocab_dir = root / "dazzle" / "local_vocab"
+    vocab_dir.mkdir(parents=True)
+    (vocab_dir / "manifest.yml").write_text("version: 1.0.0\napp_id: t\nentries: []\n")
+    after = ParseCache.for_project(root, files).module_key(files[0], _APP)
+
+    assert before != after
+
+
+def test_appspec_key_covers_link_inputs(tmp_path: Path) -> None:
+    cache = ParseCache(tmp_path)
+    base = cache.appspec_key(["a", "b"], "t", {"x"})
+    assert cache.appspec_key(["a", "b"], "t", {"x", "y"}) != base
+    assert cache.appspec_key(["a", "b"], "other", {"x"}) != base
+    assert cache.appspec_key(["b", "a"], "t", {"x"}) != base
+
+
+def test_prune_keeps_newest(tmp_path: Path) -> None:
+    root = _project(tmp_path)
+    load_project_appspec(root)
+    cache = ParseCache(project_parse_cache_dir(root))
+    assert cache.prune(keep_appspecs=0, keep_modules=1) == 2
+    assert cache.clear() == 1
@@ -0,0 +1,220 @@
+"""Off-loop PDF rendering: the shared process pool and the content-addressed cache.
+
+`run_pdf_job` moves WeasyPrint / fpdf2 renders off the event loop;
+`PdfCache` serves an unchanged document from file storage instead of
+re-rendering it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from dazzle.documents import PdfCache, async_render_document_pdf, stream_document_pdf
+from dazzle.documents import api as documents_api
+from dazzle.documents.pdf_pool import (
+    PDF_WORKERS_ENV,
+    resolve_pdf_workers,
+    run_pdf_job,
+    shutdown_pdf_pool,
+)
+from dazzle.http.runtime.file_storage import LocalStorageBackend, StorageBackend
+from dazzle.render.fragment import Page, Text
+
+
+@dataclass
+class _Ctx:
+    name: str
+
+
+def _template(ctx: _Ctx) -> Page:
+    return Page(title="Doc", body=Text(body=f"Hello {ctx.name}"), css_links=(), js_scripts=())
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool() -> Iterator[None]:
+    shutdown_pdf_pool()
+    yield
+    shutdown_pdf_pool()
+
+
+@pytest.fixture
+def fake_weasyprint(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Render on a thread with a stand-in for WeasyPrint; records each render."""
+    monkeypatch.setenv(PDF_WORKERS_ENV, "0")
+    renders: list[str] = []
+
+    def _html_to_pdf(html: str, options: object) -> bytes:
+        renders.append(html)
+        return b"%PDF-fake " + html.encode()
+
+    monkeypatch.setattr(documents_api, "_html_to_pdf", _html_to_pdf)
+    return renders
+
+
+class TestPool:
+    def test_worker_count_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(PDF_WORKERS_ENV, "3")
+        assert resolve_pdf_workers() == 3
+        monkeypatch.setenv(PDF_WORKERS_ENV, "nope")
+        assert resolve_pdf_workers() == min(4, os.cpu_count() or 1)
+
+    async def test_job_runs_in_another_process(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(PDF_WORKERS_ENV, "1")
+        assert await run_pdf_job(os.getpid) != os.getpid()
+
+    async def test_zero_workers_renders_on_a_thread(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(PDF_WORKERS_ENV, "0")
+        assert await run_pdf_job(os.getpid) == os.getpid()
+
+    async def test_job_errors_propagate(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(PDF_WORKERS_ENV, "0")
+        with pytest.raises(ValueError):
+            await run_pdf_job(int, "not a number")
+
+
+class TestCache:
+    async def test_repeat_download_is_served_from_storage(
+        self, fake_weasyprint: list[str], tmp_path: Path
+    ) -> None:
+        cache = PdfCache(LocalStorageBackend(tmp_path))
+        first = await async_render_document_pdf(_template, _Ctx("Ada"), cache=cache)
+        second = await async_render_document_pdf(_template, _Ctx("Ada"), cache=cache)
+
+        assert first == second
+        assert len(fake_weasyprint) == 1
+        assert list((tmp_path / "pdf-cache").rglob("*.pdf"))
+
+    async def test_changed_data_is_a_different_entry(
+        self, fake_weasyprint: list[str], tmp_path: Path
+    ) -> None:
+        cache = PdfCache(LocalStorageBackend(tmp_path))
+        await async_render_document_pdf(_template, _Ctx("Ada"), cache=cache)
+        changed = await async_render_document_pdf(_template, _Ctx("Grace"), cache=cache)
+
+        assert b"Grace" in changed
+        assert len(fake_weasyprint) == 2
+
+    async def test_concurrent_misses_render_once(self, tmp_path: Path) -> None:
+        cache = PdfCache(LocalStorageBackend(tmp_path))
+        calls = 0
+
+        async def render() -> bytes:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return b"%PDF-once"
+
+        key = cache.key_for("<html>")
+        results = await asyncio.gather(*(cache.get_or_render(key, render) for _ in range(5)))
+        assert results == [b"%PDF-once"] * 5
+        assert calls == 1
+
+    async def test_hit_streams_the_stored_file(
+        self, fake_weasyprint: list[str], tmp_path: Path
+    ) -> None:
+        cache = PdfCache(LocalStorageBackend(tmp_path))
+        cold = b"".join([c async for c in await stream_document_pdf(_template, _Ctx("A"), cache)])
+        warm = b"".join([c async for c in await stream_document_pdf(_template, _Ctx("A"), cache)])
+        assert cold == warm
+        assert len(fake_weasyprint) == 1
+
+    async def test_storage_failure_still_returns_the_pdf(
+        self, fake_weasyprint: list[str], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        storage = LocalStorageBackend(tmp_path)
+
+        async def broken_put(*args: object) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(storage, "put", broken_put)
+        pdf = await async_render_document_pdf(_template, _Ctx("Ada"), cache=PdfCache(storage))
+        assert pdf.startswith(b"%PDF-")
+
+
+def _age(storage: LocalStorageBackend, key: str, days: float) -> None:
+    path = storage.base_path / key
+    mtime = path.stat().st_mtime - days * 86400
+    os.utime(path, (mtime, mtime))
+
+
+class TestEviction:
+    async def test_prune_drops_expired_then_oldest_beyond_the_cap(self, tmp_path: Path) -> None:
+        storage = LocalStorageBackend(tmp_path)
+        cache = PdfCache(storage, max_age=timedelta(days=7), max_bytes=10)
+        keys = [cache.key_for(str(i)) for i in range(4)]
+        for key in keys:
+            await storage.put(key, b"x" * 4, "application/pdf")
+        for key, days in zip(keys, [30, 3, 2, 1], strict=True):
+            _age(storage, key, days)
+        await storage.put("uploads/keep.txt", b"x" * 100, "text/plain")
+
+        assert await cache.prune() == 2
+        # The 30-day entry expired; of the rest only the newest 10 bytes fit.
+        assert [await storage.exists(k) for k in keys] == [False, False, True, True]
+        assert await storage.exists("uploads/keep.txt")
+
+    async def test_writes_schedule_at_most_one_prune_per_interval(self, tmp_path: Path) -> None:
+        storage = LocalStorageBackend(tmp_path)
+        cache = PdfCache(storage, max_age=timedelta(days=1), prune_interval=3600)
+        stale = cache.key_for("stale")
+        await storage.put(stale, b"old", "application/pdf")
+        _age(storage, stale, 2)
+
+        async def render() -> bytes:
+            return b"%PDF"
+
+        await cache.get_or_render(cache.key_for("a"), render)
+        await asyncio.gather(*cache._prunes)
+        assert not await storage.exists(stale)
+
+        await storage.put(stale, b"old", "application/pdf")
+        _age(storage, stale, 2)
+        await cache.get_or_render(cache.key_for("b"), render)
+        assert not cache._prunes
+        assert await storage.exists(stale)
+
+
+class TestLocalFixedKeys:
+    async def test_put_then_exists_and_retrieve(self, tmp_path: Path) -> None:
+        storage = LocalStorageBackend(tmp_path)
+        assert not await storage.exists("pdf-cache/ab/abc.pdf")
+        await storage.put("pdf-cache/ab/abc.pdf", b"%PDF-1", "application/pdf")
+        assert await storage.exists("pdf-cache/ab/abc.pdf")
+        assert await storage.retrieve("pdf-cache/ab/abc.pdf") == b"%PDF-1"
+        # No temp files left behind by the atomic write.
+        assert [p.name for p in (tmp_path / "pdf-cache" / "ab").iterdir()] == ["abc.pdf"]
+
+    async def test_put_writes_off_the_event_loop(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        threads: list[int] = []
+        write = LocalStorageBackend._write_atomic
+
+        def _record(full_path: Path, content: bytes) -> None:
+            threads.append(threading.get_ident())
+            write(full_path, content)
+
+        monkeypatch.setattr(LocalStorageBackend, "_write_atomic", staticmethod(_record))
+        await LocalStorageBackend(tmp_path).put("k/a.pdf", b"%PDF", "application/pdf")
+        assert threads and threads[0] != threading.get_ident()
+
+    async def test_list_objects_under_a_prefix(self, tmp_path: Path) -> None:
+        storage = LocalStorageBackend(tmp_path)
+        await storage.put("pdf-cache/ab/abc.pdf", b"%PDF-1", "application/pdf")
+        await storage.put("other/x.bin", b"x", "application/octet-stream")
+        listed = [obj async for obj in storage.list_objects("pdf-cache")]
+        assert [(o.key, o.size) for o in listed] == [("pdf-cache/ab/abc.pdf", 6)]
+        assert [o async for o in storage.list_objects("missing")] == []
+
+
+def test_fixed_key_methods_are_abstract() -> None:
+    missing = StorageBackend.__abstractmethods__
+    assert {"put", "exists", "list_objects"} <= missing
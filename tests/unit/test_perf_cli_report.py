@@ -52,3 +52,16 @@ def test_report_no_runs_returns_error(tmp_path: Path, monkeypatch: pytest.Monkey
     monkeypatch.chdir(tmp_path)
     result = CliRunner().invoke(app, ["perf", "report"])
     assert result.exit_code != 0
+
+
+def test_report_reads_shared_store_with_db(seeded_perf_dir: Path) -> None:
+    store = seeded_perf_dir / "20260519-120000-aaaaaaaa.db"
+    shared = store.rename(seeded_perf_dir.parent / "traces.db")
+    result = CliRunner().invoke(
+        app, ["perf", "report", "--db", str(shared), "--run", "20260519-120000-aaaaaaaa"]
+    )
+    assert result.exit_code == 0
+    assert "GET /tasks" in result.stdout
+
+    result = CliRunner().invoke(app, ["perf", "report", "--db", str(shared)])
+    assert result.exit_code != 0
@@ -0,0 +1,107 @@
+"""dazzle perf diff — rollup comparison across deploys and time windows."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from dazzle.cli import app
+from dazzle.perf.diff import build_diff, parse_selector
+from dazzle.perf.exporter import _SCHEMA_PATH
+
+_MS = 1_000_000
+
+
+def _rollup(
+    conn: sqlite3.Connection, hour: str, run_id: str, key: str, calls: int, avg_ms: float
+) -> None:
+    conn.execute(
+        "INSERT INTO rollups VALUES (?, ?, 'route', ?, ?, 0, ?, ?)",
+        (hour, run_id, key, calls, int(calls * avg_ms * _MS), int(avg_ms * _MS)),
+    )
+
+
+def _n_plus_one(conn: sqlite3.Connection, run_id: str, parent: str) -> None:
+    conn.execute(
+        "INSERT INTO spans VALUES (?, 't', NULL, ?, ?, 'server', 'ok', 0, 100, 100, '{}')",
+        (f"{run_id}-p", run_id, parent),
+    )
+    for i in range(3):
+        conn.execute(
+            "INSERT INTO spans VALUES (?, 't', ?, ?, 'q', 'client', 'ok', 0, 1, 1, ?)",
+            (
+                f"{run_id}-c{i}",
+                f"{run_id}-p",
+                run_id,
+                json.dumps({"db.statement": f"SELECT * FROM tag WHERE id = {i}"}),
+            ),
+        )
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> Path:
+    db = tmp_path / "traces.db"
+    conn = sqlite3.connect(db)
+    conn.executescript(_SCHEMA_PATH.read_text())
+    _rollup(conn, "2026-10-17T10:00", "deploy-1", "GET /tasks", 100, 10.0)
+    _rollup(conn, "2026-10-17T10:00", "deploy-1", "GET /stable", 100, 5.0)
+    _rollup(conn, "2026-10-17T10:00", "deploy-1", "GET /legacy", 50, 5.0)
+    _rollup(conn, "2026-10-18T10:00", "deploy-2", "GET /tasks", 100, 30.0)
+    _rollup(conn, "2026-10-18T10:00", "deploy-2", "GET /stable", 100, 5.5)
+    _rollup(conn, "2026-10-18T10:00", "deploy-2", "GET /reports", 20, 80.0)
+    _rollup(conn, "2026-10-18T11:00", "deploy-2", "GET /noise", 2, 500.0)
+    _n_plus_one(conn, "deploy-2", "GET /tasks")
+    conn.commit()
+    conn.close()
+    return db
+
+
+def test_deploy_diff_reports_regressions_new_and_gone(store: Path) -> None:
+    diff = build_diff(store, parse_selector("deploy-1"), parse_selector("deploy-2"))
+
+    by_key = {d.key: d for d in diff.changes}
+    assert by_key["GET /tasks"].status == "regressed"
+    assert by_key["GET /tasks"].change_pct == pytest.approx(200.0)
+    assert by_key["GET /reports"].status == "new"
+    assert by_key["GET /legacy"].status == "gone"
+    # Within the threshold, and below min_calls, respectively.
+    assert "GET /stable" not in by_key
+    assert "GET /noise" not in by_key
+    assert diff.changes[0].key == "GET /tasks"
+
+    [pattern] = diff.new_n_plus_one
+    assert pattern.parent_span == "GET /tasks"
+
+
+def test_window_selector_bounds_hours(store: Path) -> None:
+    selector = parse_selector("2026-10-18T00..2026-10-18T11")
+    assert (selector.start, selector.end) == ("2026-10-18T00:00", "2026-10-18T11:00")
+
+    diff = build_diff(store, parse_selector("..2026-10-18"), selector, min_calls=1)
+    assert {d.key for d in diff.changes} == {"GET /tasks", "GET /reports", "GET /legacy"}
+    assert diff.new_n_plus_one == []
+
+
+def test_cli_markdown_and_json(store: Path) -> None:
+    args = ["perf", "diff", "--db", str(store), "--base", "deploy-1", "--head", "deploy-2"]
+    result = CliRunner().invoke(app, args)
+    assert result.exit_code == 0
+    assert "# Perf diff — deploy-1 → deploy-2" in result.stdout
+    assert "## Regressions" in result.stdout
+    assert "## New N+1 patterns" in result.stdout
+
+    result = CliRunner().invoke(app, [*args, "--format", "json", "--min-change", "500"])
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    assert {d["status"] for d in payload["changes"]} == {"new", "gone"}
+
+
+def test_cli_rejects_bad_window(store: Path) -> None:
+    result = CliRunner().invoke(
+        app, ["perf", "diff", "--db", str(store), "--base", "yesterday..", "--head", "deploy-2"]
+    )
+    assert result.exit_code != 0
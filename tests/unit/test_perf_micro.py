@@ -0,0 +1,103 @@
+"""Microbenchmark sampling, baseline round-trip and regression verdicts."""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+from dazzle.perf.micro import (
+    CaseResult,
+    MicroRun,
+    compare_runs,
+    environment_mismatch,
+    load_run,
+    mann_whitney_p,
+    measure,
+    regressions,
+    render_comparison,
+    save_run,
+)
+
+
+def _run(**medians: float) -> MicroRun:
+    rng = random.Random(0)
+    return MicroRun(
+        cases={
+            name: CaseResult(name, 1, [m * rng.uniform(0.98, 1.02) for _ in range(10)])
+            for name, m in medians.items()
+        },
+        environment={"python": "3.12.1", "host": "ci"},
+    )
+
+
+class TestMeasure:
+    def test_calibrates_loops_to_min_time(self) -> None:
+        # Fake clock: every fn() call costs exactly 1 ms.
+        calls = [0]
+
+        def fn() -> None:
+            calls[0] += 1
+
+        def clock() -> float:
+            return calls[0] * 0.001
+
+        result = measure("noop", fn, samples=4, min_time=0.01, clock=clock)
+        assert result.loops == 10
+        assert result.samples == pytest.approx([0.001] * 4)
+        assert calls[0] == 2 + 4 * 10
+
+    def test_zero_duration_call_is_capped(self) -> None:
+        result = measure("free", lambda: None, samples=1, min_time=1.0, clock=lambda: 0.0)
+        assert result.loops == 1_000_000
+
+
+class TestMannWhitney:
+    def test_identical_samples_are_not_significant(self) -> None:
+        assert mann_whitney_p([1.0] * 10, [1.0] * 10) == 1.0
+        assert mann_whitney_p([1, 2, 3, 4], [1, 2, 3, 4]) > 0.5
+
+    def test_disjoint_samples_are_significant(self) -> None:
+        a = [1.0 + i * 0.01 for i in range(10)]
+        b = [2.0 + i * 0.01 for i in range(10)]
+        # Exact two-sided p for complete separation at 10 v 10 is ~1.1e-5.
+        assert mann_whitney_p(a, b) < 0.001
+        assert mann_whitney_p(a, b) == pytest.approx(mann_whitney_p(b, a))
+
+
+class TestCompare:
+    def test_verdicts(self) -> None:
+        baseline = _run(lex=1.0, parse=1.0, link=1.0, gone=1.0)
+        current = _run(lex=1.3, parse=0.7, link=1.02, fresh=1.0)
+        verdicts = {row.name: row.verdict for row in compare_runs(baseline, current)}
+        assert verdicts == {
+            "lex": "slower",
+            "parse": "faster",
+            "link": "same",
+            "fresh": "new",
+            "gone": "removed",
+        }
+        assert [r.name for r in regressions(compare_runs(baseline, current))] == ["lex"]
+
+    def test_significant_but_small_shift_is_ignored(self) -> None:
+        rows = compare_runs(_run(lex=1.0), _run(lex=1.04), threshold=0.05)
+        assert rows[0].verdict == "same"
+        assert rows[0].p_value < 0.01
+
+    def test_render_lists_every_case(self) -> None:
+        text = render_comparison(compare_runs(_run(lex=0.002), _run(lex=0.003)))
+        assert "lex" in text and "+50" in text and "slower" in text
+
+
+def test_run_round_trip_and_environment_mismatch(tmp_path: Path) -> None:
+    run = _run(lex=0.5)
+    path = tmp_path / "results" / "micro.json"
+    save_run(run, path)
+    loaded = load_run(path)
+    assert loaded.cases["lex"].samples == run.cases["lex"].samples
+    other = MicroRun(cases={}, environment={"python": "3.13.0", "host": "ci"})
+    assert environment_mismatch(loaded, other) == ["python: 3.12.1 -> 3.13.0"]
+    path.write_text('{"version": 99, "cases": {}}')
+    with pytest.raises(ValueError, match="version"):
+        load_run(path)
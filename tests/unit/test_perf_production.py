@@ -0,0 +1,230 @@
+"""Production-mode tracing — tail sampling, rollups and the rolling store."""
+
+from __future__ import annotations
+
+import datetime as _dt
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+from dazzle.perf import bootstrap
+from dazzle.perf.exporter import RollingSpanExporter, TailSamplingSpanProcessor
+from dazzle.perf.tracer import current_provider, reset_tracer
+
+
+class _Collect(SimpleSpanProcessor):
+    """Delegate that records what the sampler forwarded."""
+
+    def __init__(self) -> None:
+        self.spans: list[ReadableSpan] = []
+
+    def on_end(self, span: ReadableSpan) -> None:
+        self.spans.append(span)
+
+    def shutdown(self) -> None:
+        return None
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:  # noqa: ARG002
+        return True
+
+
+def _sampler(**kwargs: Any) -> tuple[TracerProvider, _Collect, list[dict[Any, list[int]]]]:
+    delegate = _Collect()
+    flushed: list[dict[Any, list[int]]] = []
+    options: dict[str, Any] = {"sample_rate": 0.0, "slow_ms": 10_000.0}
+    options.update(kwargs)
+    provider = TracerProvider()
+    provider.add_span_processor(
+        TailSamplingSpanProcessor(delegate, rollup_sink=flushed.append, **options)
+    )
+    return provider, delegate, flushed
+
+
+def _request(provider: TracerProvider, *, fail: bool = False, queries: int = 1) -> None:
+    tracer = provider.get_tracer("test")
+    with tracer.start_as_current_span("GET /tasks", kind=SpanKind.SERVER) as root:
+        for i in range(queries):
+            with tracer.start_as_current_span(
+                "SELECT", kind=SpanKind.CLIENT, attributes={"db.statement": f"SELECT {i}"}
+            ):
+                pass
+        if fail:
+            root.set_status(Status(StatusCode.ERROR))
+
+
+class TestTailSampling:
+    def test_unremarkable_traces_dropped(self) -> None:
+        provider, delegate, _ = _sampler()
+        _request(provider)
+        assert delegate.spans == []
+
+    def test_errored_trace_kept_whole(self) -> None:
+        provider, delegate, _ = _sampler()
+        _request(provider, fail=True, queries=2)
+        assert sorted(s.name for s in delegate.spans) == ["GET /tasks", "SELECT", "SELECT"]
+
+    def test_slow_trace_kept(self) -> None:
+        provider, delegate, _ = _sampler(slow_ms=0.0)
+        _request(provider)
+        assert len(delegate.spans) == 2
+
+    def test_head_sample_is_a_trace_id_ratio(self) -> None:
+        processor = TailSamplingSpanProcessor(_Collect(), sample_rate=0.5, slow_ms=1.0)
+        assert processor.head_sampled(1)
+        assert not processor.head_sampled((1 << 64) - 1)
+        provider, delegate, _ = _sampler(sample_rate=1.0)
+        _request(provider)
+        assert len(delegate.spans) == 2
+
+    def test_pending_traces_bounded(self) -> None:
+        processor = TailSamplingSpanProcessor(
+            _Collect(), sample_rate=1.0, slow_ms=1.0, max_pending_traces=2
+        )
+        provider = TracerProvider()
+        provider.add_span_processor(processor)
+        tracer = provider.get_tracer("test")
+        for _ in range(5):
+            with tracer.start_as_current_span("root"):
+                # A child ending keeps its trace pending until the root ends.
+                tracer.start_span("child").end()
+                assert len(processor._pending) <= 2
+
+
+class TestRollups:
+    def test_dropped_traces_still_counted(self) -> None:
+        provider, delegate, flushed = _sampler()
+        for _ in range(3):
+            _request(provider, queries=2)
+        _request(provider, fail=True)
+        provider.force_flush()
+
+        assert len(delegate.spans) == 2
+        [rows] = flushed
+        totals = {key[1:]: value for key, value in rows.items()}
+        assert totals[("route", "GET /tasks")][:2] == [4, 1]
+        # Literals are normalised, so both statements share one fingerprint.
+        assert totals[("query", "SELECT ?")][0] == 7
+
+    def test_flushed_on_interval_off_the_request_thread(self) -> None:
+        threads: list[int] = []
+        processor = TailSamplingSpanProcessor(
+            _Collect(),
+            sample_rate=0.0,
+            slow_ms=10_000.0,
+            rollup_sink=lambda _rows: threads.append(threading.get_ident()),
+            rollup_interval=0.01,
+        )
+        provider = TracerProvider()
+        provider.add_span_processor(processor)
+        _request(provider)
+        deadline = time.monotonic() + 5
+        while not threads and time.monotonic() < deadline:
+            time.sleep(0.01)
+        processor.shutdown()
+        assert threads and threads[0] != threading.get_ident()
+
+    def test_interval_must_be_positive(self) -> None:
+        with pytest.raises(ValueError, match="rollup_interval"):
+            TailSamplingSpanProcessor(_Collect(), sample_rate=0.0, slow_ms=1.0, rollup_interval=0)
+
+
+class TestRollingStore:
+    def test_rollups_upserted(self, tmp_path: Path) -> None:
+        db = tmp_path / "traces.db"
+        store = RollingSpanExporter(max_bytes=1 << 30, db_path=db, run_id="deploy-1")
+        store.write_rollups({("2026-10-18T06:00", "route", "GET /"): [2, 1, 30, 20]})
+        store.write_rollups({("2026-10-18T06:00", "route", "GET /"): [1, 0, 50, 50]})
+        store.shutdown()
+
+        row = (
+            sqlite3.connect(db)
+            .execute("SELECT run_id, calls, errors, total_ns, max_ns FROM rollups")
+            .fetchone()
+        )
+        assert row == ("deploy-1", 3, 1, 80, 50)
+
+    def test_rollups_older_than_retention_aged_out(self, tmp_path: Path) -> None:
+        db = tmp_path / "traces.db"
+        store = RollingSpanExporter(max_bytes=1 << 30, rollup_days=7, db_path=db, run_id="d")
+        now = _dt.datetime.now(_dt.UTC)
+        old = (now - _dt.timedelta(days=8)).strftime("%Y-%m-%dT%H:00")
+        recent = now.strftime("%Y-%m-%dT%H:00")
+        store.write_rollups({(old, "route", "GET /"): [1, 0, 1, 1]})
+        store.write_rollups({(recent, "route", "GET /"): [1, 0, 1, 1]})
+        hours = [r[0] for r in store._conn.execute("SELECT hour FROM rollups")]
+        store.shutdown()
+        assert hours == [recent]
+
+    def test_oldest_spans_evicted_over_budget(self, tmp_path: Path) -> None:
+        db = tmp_path / "traces.db"
+        store = RollingSpanExporter(max_bytes=1 << 30, db_path=db, run_id="deploy-1")
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(store))
+        tracer = provider.get_tracer("test")
+        for i in range(300):
+            with tracer.start_as_current_span(f"op-{i}", attributes={"pad": "x" * 200}):
+                pass
+        full = store.trace_bytes()
+
+        store._max_bytes = full // 2
+        with tracer.start_as_current_span("latest"):
+            pass
+
+        assert store.trace_bytes() <= full // 2
+        names = [r[0] for r in store._conn.execute("SELECT name FROM spans")]
+        assert "latest" in names
+        assert "op-0" not in names
+        store.shutdown()
+
+    def test_rollups_do_not_count_against_the_budget(self, tmp_path: Path) -> None:
+        db = tmp_path / "traces.db"
+        store = RollingSpanExporter(max_bytes=1 << 30, db_path=db, run_id="deploy-1")
+        hour = _dt.datetime.now(_dt.UTC).strftime("%Y-%m-%dT%H:00")
+        store.write_rollups({(hour, "query", f"SELECT {i}"): [1, 0, 1, 1] for i in range(5000)})
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(store))
+        tracer = provider.get_tracer("test")
+        with tracer.start_as_current_span("first"):
+            pass
+
+        # Far smaller than the rollups alone, far larger than one span.
+        store._max_bytes = store.live_bytes() // 4
+        with tracer.start_as_current_span("second"):
+            pass
+
+        names = {r[0] for r in store._conn.execute("SELECT name FROM spans")}
+        store.shutdown()
+        assert names == {"first", "second"}
+
+
+class TestBootstrap:
+    def test_production_mode_configures_sampled_store(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("DAZZLE_PERF_ENABLED", "1")
+        monkeypatch.setenv("DAZZLE_PERF_MODE", "production")
+        monkeypatch.setenv("DAZZLE_PERF_RUN_ID", "deploy-7")
+        monkeypatch.setenv("DAZZLE_PERF_SAMPLE_RATE", "not-a-number")
+        monkeypatch.delenv("DAZZLE_PERF_DB", raising=False)
+        try:
+            bootstrap.maybe_configure_tracer()
+            provider = current_provider()
+            assert provider is not None
+            bootstrap.maybe_configure_tracer()
+            assert current_provider() is provider
+        finally:
+            if (configured := current_provider()) is not None:
+                configured.shutdown()
+            reset_tracer()
+
+        db = tmp_path / bootstrap.PRODUCTION_DB
+        runs = sqlite3.connect(db).execute("SELECT run_id FROM runs").fetchall()
+        assert runs == [("deploy-7",)]
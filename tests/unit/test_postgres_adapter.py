@@ -792,3 +792,54 @@ def test_postgres_adapter_send_handler_invoked():
     assert adapter._side_effect_executor is executor, (
         "side-effect executor must be stored on the adapter"
     )
+
+
+# ---------------------------------------------------------------------------
+# Indexed timeout sweep
+# ---------------------------------------------------------------------------
+
+
+@_skip_no_pg
+def test_overdue_task_ids_beyond_old_fetch_window():
+    """Every open overdue task is returned — not just the 50 newest per status."""
+    dsn = _PG
+    assert dsn
+    from dazzle.core.process.adapter import ProcessRun, ProcessStatus, ProcessTask, TaskStatus
+
+    store = _make_store(dsn)
+    run_id = str(uuid.uuid4())
+    store.save_run(
+        ProcessRun(run_id=run_id, process_name="sweep", status=ProcessStatus.WAITING, inputs={})
+    )
+    now = datetime.now(UTC)
+
+    def _task(status: TaskStatus, due: datetime) -> str:
+        task_id = str(uuid.uuid4())
+        store.save_task(
+            ProcessTask(
+                task_id=task_id,
+                run_id=run_id,
+                step_name="approval",
+                surface_name="approval_surface",
+                entity_name="Order",
+                entity_id=task_id,
+                status=status,
+                due_at=due,
+            )
+        )
+        return task_id
+
+    overdue = [_task(TaskStatus.PENDING, now - timedelta(minutes=i + 1)) for i in range(60)]
+    overdue.append(_task(TaskStatus.ESCALATED, now - timedelta(days=1)))
+    _task(TaskStatus.PENDING, now + timedelta(hours=1))
+    _task(TaskStatus.COMPLETED, now - timedelta(days=2))
+
+    try:
+        ids = store.list_overdue_task_ids(limit=1000)
+        mine = [i for i in ids if i in set(overdue)]
+        assert set(mine) == set(overdue)
+        assert mine[0] == overdue[-1], "earliest deadline first"
+    finally:
+        with psycopg.connect(dsn) as conn, conn.cursor() as cur:
+            cur.execute("DELETE FROM process_runs WHERE run_id = %s", (run_id,))
+            conn.commit()
@@ -0,0 +1,149 @@
+"""Concurrent run execution and the indexed timeout sweep of
+``PostgresProcessAdapter`` — against an in-memory fake store (no Postgres)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from dazzle.core.process import postgres_adapter
+from dazzle.core.process.postgres_adapter import PostgresProcessAdapter
+
+
+class _FakeStore:
+    def __init__(self, run_ids: list[str], overdue: list[str] | None = None) -> None:
+        self.run_ids = run_ids
+        self.overdue = overdue or []
+        self.claim_sizes: list[int] = []
+        self.renewals: list[str] = []
+        self.sweeps_with_runs_left: list[int] = []
+
+    def claim_due_runs(self, worker: str, lease_seconds: int, batch: int = 1) -> list[Any]:
+        self.claim_sizes.append(batch)
+        claimed, self.run_ids = self.run_ids[:batch], self.run_ids[batch:]
+        return [SimpleNamespace(run_id=r) for r in claimed]
+
+    def renew_run_lease(self, run_id: str, lease_seconds: int, worker: str | None = None) -> None:
+        self.renewals.append(run_id)
+
+    def list_overdue_task_ids(self, limit: int = 500) -> list[str]:
+        self.sweeps_with_runs_left.append(len(self.run_ids))
+        return self.overdue[:limit]
+
+
+def _adapter(store: _FakeStore, workers: int) -> PostgresProcessAdapter:
+    return PostgresProcessAdapter("postgresql://unused", store=store, workers=workers)  # type: ignore[arg-type]
+
+
+def test_claimed_runs_execute_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    store = _FakeStore([f"run-{i}" for i in range(4)])
+    adapter = _adapter(store, workers=4)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def _slow(run_id: str) -> None:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.2)
+        with lock:
+            active -= 1
+
+    monkeypatch.setattr(adapter, "_execute_process_sync", _slow)
+    started = time.monotonic()
+    asyncio.run(adapter._claim_and_execute_batch())
+    assert time.monotonic() - started < 0.6
+    assert peak == 4
+    assert store.claim_sizes[0] == 4
+
+
+def test_freed_slots_are_refilled_while_a_slow_run_continues(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    store = _FakeStore(["slow", "a", "b", "c"])
+    adapter = _adapter(store, workers=2)
+    finished: list[str] = []
+
+    def _run(run_id: str) -> None:
+        time.sleep(0.5 if run_id == "slow" else 0.05)
+        finished.append(run_id)
+
+    monkeypatch.setattr(adapter, "_execute_process_sync", _run)
+    asyncio.run(adapter._claim_and_execute_batch())
+    # A whole-batch gather would hold "b" and "c" back until "slow" finished
+    assert finished == ["a", "b", "c", "slow"]
+    assert store.claim_sizes[:3] == [2, 1, 1]
+
+
+def test_timeouts_are_swept_while_runs_keep_arriving(monkeypatch: pytest.MonkeyPatch) -> None:
+    store = _FakeStore([f"run-{i}" for i in range(40)])
+    adapter = _adapter(store, workers=2)
+    adapter._poll_interval = 0.1
+
+    monkeypatch.setattr(adapter, "_execute_process_sync", lambda run_id: time.sleep(0.03))
+    asyncio.run(adapter._claim_and_execute_batch())
+    # Sweeping only once the refill loop drained would starve escalations
+    mid_stream = [left for left in store.sweeps_with_runs_left if 0 < left < 40]
+    assert len(mid_stream) >= 2
+
+
+def test_worker_count_bounds_parallelism(monkeypatch: pytest.MonkeyPatch) -> None:
+    store = _FakeStore([f"run-{i}" for i in range(4)])
+    adapter = _adapter(store, workers=2)
+    adapter._batch_size = 4
+    threads: set[str] = set()
+
+    def _record(run_id: str) -> None:
+        threads.add(threading.current_thread().name)
+        time.sleep(0.05)
+
+    monkeypatch.setattr(adapter, "_execute_process_sync", _record)
+    asyncio.run(adapter._claim_and_execute_batch())
+    assert len(threads) == 2
+    assert all(name.startswith("pg-process-run") for name in threads)
+
+
+def test_every_claimed_run_is_heartbeated_while_queued(monkeypatch: pytest.MonkeyPatch) -> None:
+    store = _FakeStore(["slow", "queued"])
+    adapter = _adapter(store, workers=1)
+    adapter._batch_size = 2
+    adapter._lease_seconds = 3  # heartbeat every 1s
+
+    monkeypatch.setattr(adapter, "_execute_process_sync", lambda run_id: time.sleep(1.3))
+    asyncio.run(adapter._claim_and_execute_batch())
+    # "queued" waited behind "slow" for a worker, but its lease was renewed too
+    assert {"slow", "queued"} <= set(store.renewals)
+
+
+def test_failed_run_does_not_stop_the_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    store = _FakeStore(["bad", "good"])
+    adapter = _adapter(store, workers=2)
+    done: list[str] = []
+
+    def _run(run_id: str) -> None:
+        if run_id == "bad":
+            raise RuntimeError("boom")
+        done.append(run_id)
+
+    monkeypatch.setattr(adapter, "_execute_process_sync", _run)
+    asyncio.run(adapter._claim_and_execute_batch())
+    assert done == ["good"]
+
+
+def test_timeout_sweep_checks_every_overdue_task(monkeypatch: pytest.MonkeyPatch) -> None:
+    overdue = [f"task-{i}" for i in range(120)]
+    adapter = _adapter(_FakeStore([], overdue=overdue), workers=1)
+    checked: list[str] = []
+    monkeypatch.setattr(
+        postgres_adapter, "check_task_timeout", lambda store, task_id: checked.append(task_id)
+    )
+    asyncio.run(adapter._poll_task_timeouts())
+    # The old sweep fetched the 50 newest tasks per status and filtered in Python
+    assert checked == overdue
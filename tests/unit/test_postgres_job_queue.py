@@ -0,0 +1,265 @@
+"""Tests for the Postgres-backed job queue and the worker paths it enables.
+
+No Postgres here — the queue's SQL is checked against a mocked
+``DatabaseManager``, and the worker-side behaviour (settling, retry
+``run_at``, process-pool handlers) against an in-memory subclass.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from dazzle.cli.worker import _handler_pool
+from dazzle.http.runtime import postgres_job_queue as pjq
+from dazzle.http.runtime.job_loop import run_worker_loop
+from dazzle.http.runtime.job_queue import JobMessage
+from dazzle.http.runtime.job_worker import WorkerOutcome, process_one
+from dazzle.http.runtime.postgres_job_queue import (
+    PostgresJobQueue,
+    ensure_job_queue_table,
+    visibility_timeout_for,
+)
+
+# ---------------------------------------------------------------------------
+# Handlers (module-level so the process pool can resolve them by path)
+# ---------------------------------------------------------------------------
+
+
+def handler_ok(**kwargs: Any) -> None:
+    return None
+
+
+def handler_fail(**kwargs: Any) -> None:
+    raise RuntimeError("boom")
+
+
+def handler_record_pid(*, path: str) -> None:
+    with open(path, "w") as fh:
+        fh.write(str(os.getpid()))
+
+
+@dataclass
+class _SpecStub:
+    name: str
+    run: str
+    retry: int = 0
+    dead_letter: str = ""
+    retry_backoff: str = "fixed"
+
+
+def _mock_db(row: dict[str, Any] | None = None) -> tuple[MagicMock, MagicMock]:
+    conn = MagicMock()
+    conn.execute.return_value.fetchone.return_value = row
+    db = MagicMock()
+    db.placeholder = "%s"
+    db.connection.return_value.__enter__.return_value = conn
+    return db, conn
+
+
+def _queue(db: MagicMock, **kwargs: Any) -> PostgresJobQueue:
+    with patch("dazzle.core.environment.skip_boot_schema_ddl", return_value=True):
+        return PostgresJobQueue(db, **kwargs)
+
+
+class _FakePgQueue(PostgresJobQueue):
+    """PostgresJobQueue with the table replaced by lists."""
+
+    def __init__(self) -> None:
+        self.submitted: list[dict[str, Any]] = []
+        self.pending: list[JobMessage] = []
+        self.acked: list[str] = []
+        self.dead: list[tuple[str, str]] = []
+
+    async def submit(
+        self,
+        job_name: str,
+        payload: dict[str, Any] | None = None,
+        *,
+        attempt: int = 1,
+        priority: int = 0,
+        run_at: datetime | None = None,
+    ) -> str:
+        job_run_id = f"run-{len(self.submitted)}"
+        self.submitted.append(
+            {"job_name": job_name, "attempt": attempt, "priority": priority, "run_at": run_at}
+        )
+        self.pending.append(
+            JobMessage(job_name, payload or {}, attempt, job_run_id, priority=priority)
+        )
+        return job_run_id
+
+    async def dequeue(self, *, timeout: float | None = None) -> JobMessage | None:
+        if self.pending:
+            return self.pending.pop(0)
+        await asyncio.sleep(timeout or 0)
+        return None
+
+    async def ack(self, job_run_id: str) -> None:
+        self.acked.append(job_run_id)
+
+    async def dead_letter(self, job_run_id: str, reason: str) -> None:
+        self.dead.append((job_run_id, reason))
+
+
+# ---------------------------------------------------------------------------
+# Queue SQL
+# ---------------------------------------------------------------------------
+
+
+class TestSchema:
+    def test_table_and_partial_claim_index(self):
+        cur = MagicMock()
+        ensure_job_queue_table(cur)
+        ddl = " ".join(call.args[0] for call in cur.execute.call_args_list)
+        assert "CREATE TABLE IF NOT EXISTS _dazzle_job_queue" in ddl
+        assert "(priority DESC, run_at) WHERE dead_at IS NULL" in ddl
+
+    def test_boot_ddl_skipped_when_migration_managed(self):
+        db, _ = _mock_db()
+        _queue(db)
+        db.connection.assert_not_called()
+
+    def test_visibility_timeout_covers_longest_job(self):
+        specs = [_SpecStub("a", "x"), MagicMock(timeout_seconds=900)]
+        assert visibility_timeout_for(specs) == 960.0
+        assert visibility_timeout_for([]) == pjq.DEFAULT_VISIBILITY_TIMEOUT
+
+
+class TestClaim:
+    def test_claim_leases_highest_priority_without_blocking(self):
+        db, conn = _mock_db()
+        queue = _queue(db, visibility_timeout=30)
+        now = datetime(2026, 1, 1, tzinfo=UTC)
+
+        assert queue.claim(now) is None
+
+        sql, params = conn.execute.call_args.args
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "ORDER BY priority DESC, run_at ASC" in sql
+        assert "deliveries = q.deliveries + 1" in sql
+        assert params == (now + timedelta(seconds=30), now)
+
+    def test_claimed_row_becomes_message(self):
+        row = {
+            "id": "r1",
+            "job_name": "send",
+            "payload": '{"to": "a@b.c"}',
+            "attempt": 2,
+            "priority": 7,
+            "deliveries": 1,
+        }
+        db, _ = _mock_db(row)
+        message = _queue(db).claim(datetime.now(UTC))
+        assert message == JobMessage("send", {"to": "a@b.c"}, 2, "r1", priority=7)
+
+    def test_poison_message_dead_lettered_and_skipped(self):
+        db, _ = _mock_db()
+        queue = _queue(db, max_deliveries=3)
+        poison = {"id": "p", "job_name": "j", "payload": "{}", "attempt": 1, "priority": 0}
+        good = {**poison, "id": "g"}
+        with (
+            patch.object(
+                queue,
+                "_claim_row",
+                side_effect=[{**poison, "deliveries": 4}, {**good, "deliveries": 3}],
+            ),
+            patch.object(queue, "_mark_dead") as mark_dead,
+        ):
+            message = queue.claim(datetime.now(UTC))
+        assert message is not None and message.job_run_id == "g"
+        mark_dead.assert_called_once_with("p", "lease expired 3 times")
+
+    def test_submit_inserts_priority_and_run_at(self):
+        db, conn = _mock_db()
+        run_at = datetime(2026, 1, 1, tzinfo=UTC)
+        job_run_id = asyncio.run(
+            _queue(db).submit("send", {"n": 1}, attempt=2, priority=5, run_at=run_at)
+        )
+        sql, params = conn.execute.call_args.args
+        assert sql.strip().startswith("INSERT INTO _dazzle_job_queue")
+        assert params == (job_run_id, "send", '{"n": 1}', 2, 5, run_at)
+
+    def test_dequeue_times_out_on_empty_queue(self):
+        db, _ = _mock_db()
+        queue = _queue(db, poll_interval=0.01)
+        assert asyncio.run(queue.dequeue(timeout=0.03)) is None
+
+
+# ---------------------------------------------------------------------------
+# Worker integration
+# ---------------------------------------------------------------------------
+
+
+def _run_loop(queue: _FakePgQueue, specs: dict[str, Any], **kwargs: Any) -> dict[str, int]:
+    async def go() -> dict[str, int]:
+        stop = asyncio.Event()
+        asyncio.get_running_loop().call_later(0.2, stop.set)
+        return await run_worker_loop(
+            queue=queue,
+            job_specs=specs,
+            job_service=None,
+            stop_event=stop,
+            idle_timeout=0.02,
+            **kwargs,
+        )
+
+    return asyncio.run(go())
+
+
+class TestWorker:
+    def test_loop_acks_settled_messages_and_parks_dead_letters(self):
+        queue = _FakePgQueue()
+        specs = {
+            "ok": _SpecStub("ok", f"{__name__}:handler_ok"),
+            "bad": _SpecStub("bad", f"{__name__}:handler_fail", dead_letter="Failed"),
+        }
+        queue.pending = [JobMessage("ok", {}, 1, "a"), JobMessage("bad", {}, 1, "b")]
+
+        stats = _run_loop(queue, specs, concurrency=2)
+
+        assert stats[WorkerOutcome.COMPLETED] == 1
+        assert stats[WorkerOutcome.DEAD_LETTER] == 1
+        assert queue.acked == ["a"]
+        assert queue.dead == [("b", "retries exhausted")]
+
+    def test_retry_reenqueued_with_run_at_instead_of_sleeping(self):
+        queue = _FakePgQueue()
+        spec = _SpecStub("j", f"{__name__}:handler_fail", retry=3)
+        message = JobMessage("j", {}, 1, "a", priority=4)
+
+        with patch("dazzle.http.runtime.job_worker._compute_backoff_delay", return_value=3600):
+            outcome = asyncio.run(
+                process_one(message, job_specs={"j": spec}, job_service=None, queue=queue)
+            )
+
+        assert outcome == WorkerOutcome.RETRIED
+        [retry] = queue.submitted
+        assert retry["attempt"] == 2
+        assert retry["priority"] == 4
+        assert retry["run_at"] > datetime.now(UTC) + timedelta(minutes=59)
+
+    def test_sync_handler_runs_in_process_pool(self, tmp_path):
+        out = tmp_path / "pid"
+        spec = _SpecStub("j", f"{__name__}:handler_record_pid")
+        message = JobMessage("j", {"path": str(out)}, 1, "a")
+
+        executor = _handler_pool(1)
+        assert executor is not None
+        with executor:
+            outcome = asyncio.run(
+                process_one(
+                    message,
+                    job_specs={"j": spec},
+                    job_service=None,
+                    queue=_FakePgQueue(),
+                    executor=executor,
+                )
+            )
+
+        assert outcome == WorkerOutcome.COMPLETED
+        assert int(out.read_text()) != os.getpid()
@@ -112,6 +112,32 @@ class TestCreateAdapterPostgres:
         with pytest.raises(ValueError, match="DATABASE_URL"):
             create_adapter(config)
 
+    def test_postgres_workers_from_config_then_env(self, monkeypatch):
+        """Worker count: PostgresProcessConfig.workers, else DAZZLE_PROCESS_WORKERS."""
+        from dazzle.core.process.factory import PostgresProcessConfig, ProcessConfig, create_adapter
+
+        monkeypatch.setenv("DAZZLE_PROCESS_WORKERS", "12")
+        adapter = create_adapter(
+            ProcessConfig(backend="postgres", postgres=PostgresProcessConfig(dsn=_PG))
+        )
+        assert adapter._workers == 12
+        assert adapter._batch_size == 12
+
+        config = ProcessConfig(
+            backend="postgres", postgres=PostgresProcessConfig(dsn=_PG, workers=3)
+        )
+        assert create_adapter(config)._workers == 3
+
+    def test_postgres_workers_bad_env_uses_default(self, monkeypatch):
+        from dazzle.core.process.factory import PostgresProcessConfig, ProcessConfig, create_adapter
+        from dazzle.core.process.postgres_adapter import DEFAULT_PROCESS_WORKERS
+
+        monkeypatch.setenv("DAZZLE_PROCESS_WORKERS", "many")
+        adapter = create_adapter(
+            ProcessConfig(backend="postgres", postgres=PostgresProcessConfig(dsn=_PG))
+        )
+        assert adapter._workers == DEFAULT_PROCESS_WORKERS
+
 
 class TestBackendTypeLiteral:
     """BackendType includes 'postgres'."""
@@ -0,0 +1,35 @@
+"""Start-method and shutdown helpers shared by the framework's process pools."""
+
+from __future__ import annotations
+
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from dazzle.core.process_pools import pool_context, shutdown_cached_pool
+
+
+def test_pool_context_never_forks() -> None:
+    assert pool_context().get_start_method() in ("forkserver", "spawn")
+
+
+def test_pool_context_falls_back_to_spawn(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(multiprocessing, "get_all_start_methods", lambda: ["fork", "spawn"])
+    assert pool_context().get_start_method() == "spawn"
+
+
+def test_shutdown_cached_pool_stops_and_forgets_the_pool() -> None:
+    @functools.cache
+    def factory() -> ProcessPoolExecutor | None:
+        return ProcessPoolExecutor(max_workers=1, mp_context=pool_context())
+
+    pool = factory()
+    assert pool is not None
+    shutdown_cached_pool(factory)
+
+    assert factory.cache_info().currsize == 0
+    with pytest.raises(RuntimeError):
+        pool.submit(int)
+    shutdown_cached_pool(factory)  # never-started / already-stopped is a no-op
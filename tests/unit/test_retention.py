@@ -1,30 +1,40 @@
-"""Tests for #953 cycle 10 — generic retention-sweep helper.
+"""Tests for the set-based retention purge engine (#953 / #956).
 
-`sweep_old_rows` is the reusable primitive for both `JobRun`
-(#953) and `AuditEntry` (#956). Cycle 11+ wires it into the
-cycle-7b scheduler so old rows get cleaned up periodically.
+`purge_expired` replaces the per-row service sweep: expired rows go
+in `ctid` batches, and range partitions wholly before the cutoff are
+dropped.
 
 Tests cover:
 
-  * `older_than_days=0` is a no-op (matches IR convention for
-    "keep forever")
-  * None service tolerated (early-bootstrap)
-  * List + delete called against the service
-  * List failure stops the sweep cleanly
-  * Per-row delete failures don't kill the sweep
-  * Paged-response shape (dict with "items") supported
-  * Pydantic-model rows supported (id attribute)
-  * Pagination terminates when a short page is returned
+  * `older_than_days=0` and a missing db are no-ops (the IR's "keep
+    forever" convention)
+  * Batch SQL: ctid sub-select, date cutoff, equality filters, LIMIT,
+    SKIP LOCKED
+  * Batching stops on a short or empty batch
+  * Expired partitions detached concurrently and dropped; straddling
+    ones batch-deleted
+  * Filtered targets never drop partitions; `partition_values` keeps
+    partitions holding other values
+  * `partitions_only` skips row deletes
+  * A failing batch ends the target with a partial report
+  * Report throughput and lock-time figures
 """
 
 from __future__ import annotations
 
-import asyncio
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from dazzle.http.runtime.retention import sweep_old_rows
+from dazzle.http.runtime.retention import (
+    PurgeBatch,
+    PurgeReport,
+    PurgeTarget,
+    purge_expired,
+)
+
+_NOW = datetime(2026, 7, 1, tzinfo=UTC)
 
 # ---------------------------------------------------------------------------
 # Stubs
@@ -32,35 +42,67 @@ from dazzle.http.runtime.retention import sweep_old_rows
 
 
 @dataclass
-class _StubService:
-    """Records list/delete calls so tests can assert on them.
-    Default behaviour: returns the rows passed in once, then empty."""
+class _FakeDb:
+    """Records every statement; DELETEs report ``deletes`` rowcounts in order."""
+
+    partitions: list[dict[str, Any]] = field(default_factory=list)
+    deletes: list[int] = field(default_factory=list)
+    fail_on_delete: bool = False
+    others: list[bool] = field(default_factory=list)
+    statements: list[tuple[str, Any]] = field(default_factory=list)
+    transactions: int = 0
+    autocommit: bool = False
+    autocommit_statements: list[str] = field(default_factory=list)
+
+    @contextmanager
+    def connection(self):
+        self.transactions += 1
+        yield self
+
+    def cursor(self) -> _FakeDb:
+        return self
+
+    def commit(self) -> None:
+        return None
+
+    def execute(self, sql: str, params: Any = None) -> None:
+        self.statements.append((sql, params))
+        if self.autocommit:
+            self.autocommit_statements.append(sql)
+        self.rowcount = -1
+        if sql.startswith("DELETE"):
+            if self.fail_on_delete:
+                raise RuntimeError("lock timeout")
+            self.rowcount = self.deletes.pop(0) if self.deletes else 0
+
+    def fetchall(self) -> list[dict[str, Any]]:
+        return self.partitions
+
+    def fetchone(self) -> dict[str, Any]:
+        return {"other": self.others.pop(0)}
+
+    def sql(self, prefix: str) -> list[tuple[str, Any]]:
+        return [s for s in self.statements if s[0].startswith(prefix)]
+
+
+class _Clock:
+    """Advances 2ms per reading."""
 
-    rows: list[Any] = field(default_factory=list)
-    list_calls: list[dict[str, Any]] = field(default_factory=list)
-    delete_calls: list[Any] = field(default_factory=list)
-    list_fail: Exception | None = None
-    delete_fail_for: set[Any] = field(default_factory=set)
+    def __init__(self) -> None:
+        self.now = 0.0
 
-    async def list(self, **kwargs: Any) -> Any:
-        self.list_calls.append(kwargs)
-        if self.list_fail is not None:
-            raise self.list_fail
-        # Return the queued rows once; subsequent calls return [].
-        out = list(self.rows)
-        self.rows = []
-        return out
+    def __call__(self) -> float:
+        self.now += 0.002
+        return self.now
 
-    async def delete(self, row_id: Any) -> bool:
-        self.delete_calls.append(row_id)
-        if row_id in self.delete_fail_for:
-            raise RuntimeError(f"delete fail for {row_id}")
-        return True
 
+def _purge(db: _FakeDb, target: PurgeTarget, **kwargs: Any) -> PurgeReport:
+    kwargs.setdefault("now", _NOW)
+    kwargs.setdefault("clock", _Clock())
+    return purge_expired(db, target, **kwargs)
 
-def _run(coro):
-    return asyncio.run(coro)
 
+_JOB_RUNS = PurgeTarget("JobRun", "created_at", 30)
 
 # ---------------------------------------------------------------------------
 # Tests
@@ -68,123 +110,138 @@ def _run(coro):
 
 
 class TestNoOpPaths:
-    def test_zero_days_returns_zero_without_calling_service(self):
-        svc = _StubService(rows=[{"id": "a"}])
-        deleted = _run(sweep_old_rows(svc, date_field="at", older_than_days=0))
-        assert deleted == 0
-        assert svc.list_calls == []  # never called
-
-    def test_negative_days_is_no_op(self):
-        # Defensive: negative also means "keep forever" rather
-        # than "delete from the future" or similar nonsense.
-        svc = _StubService(rows=[{"id": "a"}])
-        deleted = _run(sweep_old_rows(svc, date_field="at", older_than_days=-5))
-        assert deleted == 0
-        assert svc.list_calls == []
-
-    def test_none_service_returns_zero(self):
-        deleted = _run(sweep_old_rows(None, date_field="at", older_than_days=30))
-        assert deleted == 0
-
-    def test_empty_result_returns_zero(self):
-        svc = _StubService(rows=[])
-        deleted = _run(sweep_old_rows(svc, date_field="at", older_than_days=30))
-        assert deleted == 0
-        assert len(svc.list_calls) == 1  # listed once, found nothing
-
-
-class TestHappyPath:
-    def test_deletes_each_listed_row(self):
-        svc = _StubService(rows=[{"id": "a"}, {"id": "b"}, {"id": "c"}])
-        deleted = _run(sweep_old_rows(svc, date_field="at", older_than_days=30))
-        assert deleted == 3
-        assert svc.delete_calls == ["a", "b", "c"]
-
-    def test_filter_uses_date_field_lt(self):
-        svc = _StubService(rows=[{"id": "a"}])
-        _run(sweep_old_rows(svc, date_field="created_at", older_than_days=7))
-        # Filter key follows Django-style `__lt` so the underlying
-        # repository can translate to `created_at < ?`.
-        call = svc.list_calls[0]
-        assert "created_at__lt" in call["filters"]
-        cutoff = call["filters"]["created_at__lt"]
-        # Cutoff is roughly now - 7 days (allow 5s slop for test
-        # execution time).
-        expected = datetime.now(UTC) - timedelta(days=7)
-        assert abs((cutoff - expected).total_seconds()) < 5
-
-    def test_pydantic_model_rows_supported(self):
-        from pydantic import BaseModel
-
-        class _Row(BaseModel):
-            id: str
-
-        svc = _StubService(rows=[_Row(id="x"), _Row(id="y")])
-        deleted = _run(sweep_old_rows(svc, date_field="at", older_than_days=30))
-        assert deleted == 2
-
-    def test_paged_response_shape_supported(self):
-        # Service may return `{"items": [...], "total": N}` —
-        # helper unwraps the items.
-        svc = _StubService(rows=[])  # initial state empty
-
-        async def list_paged(**_kwargs: Any) -> Any:
-            # First call returns one page, second call returns empty.
-            if not svc.list_calls:
-                svc.list_calls.append(_kwargs)
-                return {"items": [{"id": "a"}, {"id": "b"}], "total": 2}
-            svc.list_calls.append(_kwargs)
-            return {"items": []}
-
-        svc.list = list_paged  # type: ignore[assignment]
-        deleted = _run(sweep_old_rows(svc, date_field="at", older_than_days=30))
-        assert deleted == 2
-
-    def test_short_page_terminates_sweep(self):
-        # Page size 200, page returns 3 — sweep should stop after
-        # one page rather than re-querying.
-        svc = _StubService(rows=[{"id": "a"}, {"id": "b"}, {"id": "c"}])
-        _run(sweep_old_rows(svc, date_field="at", older_than_days=30, page_size=200))
-        assert len(svc.list_calls) == 1
-
-
-class TestErrorResilience:
-    def test_list_failure_stops_sweep_cleanly(self):
-        svc = _StubService(rows=[{"id": "a"}])
-        svc.list_fail = RuntimeError("DB down")
-        deleted = _run(sweep_old_rows(svc, date_field="at", older_than_days=30))
-        # Returns zero (couldn't list anything to delete) without
-        # raising. Operator sees the failure in the WARNING log.
-        assert deleted == 0
-
-    def test_per_row_delete_failure_does_not_kill_sweep(self):
-        # Mid-sweep delete fails on row "b". Rows "a" and "c"
-        # should still be deleted; final count = 2.
-        svc = _StubService(rows=[{"id": "a"}, {"id": "b"}, {"id": "c"}])
-        svc.delete_fail_for = {"b"}
-        deleted = _run(sweep_old_rows(svc, date_field="at", older_than_days=30))
-        assert deleted == 2
-        # All three were attempted — the failure on "b" didn't
-        # short-circuit the loop.
-        assert svc.delete_calls == ["a", "b", "c"]
-
-    def test_row_without_id_skipped(self):
-        # Defensive: malformed row dicts without `id` should be
-        # skipped, not crash with KeyError.
-        svc = _StubService(rows=[{"id": "a"}, {"name": "no_id"}, {"id": "c"}])
-        deleted = _run(sweep_old_rows(svc, date_field="at", older_than_days=30))
-        assert deleted == 2
-        assert svc.delete_calls == ["a", "c"]
-
-
-class TestPagination:
-    def test_full_page_continues_to_next(self):
-        # When the service returns exactly `page_size` rows, the
-        # sweep should query page 2 (even though our stub's
-        # second call returns empty by default).
-        svc = _StubService(rows=[{"id": str(i)} for i in range(5)])
-        _run(sweep_old_rows(svc, date_field="at", older_than_days=30, page_size=5))
-        # Two list calls — page 1 (5 rows), page 2 (empty stop).
-        assert len(svc.list_calls) == 2
-        assert svc.list_calls[0]["page"] == 1
-        assert svc.list_calls[1]["page"] == 2
+    def test_keep_forever_touches_nothing(self):
+        db = _FakeDb(deletes=[5])
+        report = _purge(db, PurgeTarget("JobRun", "created_at", 0))
+        assert report.deleted == 0
+        assert db.statements == []
+
+    def test_missing_db_tolerated(self):
+        assert _purge(None, _JOB_RUNS).deleted == 0  # type: ignore[arg-type]
+
+
+class TestBatchedDelete:
+    def test_batch_sql_is_ctid_subselect_with_skip_locked(self):
+        db = _FakeDb(deletes=[0])
+        target = PurgeTarget("AuditEntry", "at", 90, where={"entity_type": "Order"})
+        _purge(db, target, batch_size=500)
+        [(sql, params)] = db.sql("DELETE")
+        assert sql == (
+            'DELETE FROM "AuditEntry" WHERE ctid IN (SELECT ctid FROM "AuditEntry" '
+            'WHERE "at" < %(cutoff)s AND "entity_type" = %(w0)s '
+            "LIMIT %(limit)s FOR UPDATE SKIP LOCKED)"
+        )
+        assert params == {"cutoff": _NOW - timedelta(days=90), "limit": 500, "w0": "Order"}
+
+    def test_batches_until_a_short_batch(self):
+        db = _FakeDb(deletes=[100, 100, 40, 999])
+        slept: list[float] = []
+        report = _purge(db, _JOB_RUNS, batch_size=100, pause=0.5, sleep=slept.append)
+        assert report.deleted == 240
+        assert [b.rows for b in report.batches] == [100, 100, 40]
+        assert slept == [0.5, 0.5]
+        # One catalog probe, then one short transaction per batch.
+        assert db.transactions == 4
+
+    def test_empty_batch_is_not_reported(self):
+        report = _purge(_FakeDb(deletes=[0]), _JOB_RUNS)
+        assert report.batches == []
+
+    def test_failure_returns_partial_report(self):
+        db = _FakeDb(fail_on_delete=True)
+        report = _purge(db, _JOB_RUNS)
+        assert report.deleted == 0
+        assert report.error == "lock timeout"
+        assert "stopped: lock timeout" in report.summary()
+
+
+class TestPartitions:
+    # With a default partition Postgres refuses DETACH CONCURRENTLY.
+    _parts = [
+        {"name": n, "parent": '"AuditEntry"', "has_default": True, "estimate": r, "expired": e}
+        for n, r, e in [
+            ("audit_2026_04", 1000, True),
+            ("audit_2026_05", 2000, False),
+            ("audit_default", 5, None),
+        ]
+    ]
+    _undefaulted = [
+        {"name": n, "parent": '"AuditEntry"', "has_default": False, "estimate": 10, "expired": e}
+        for n, e in [("audit_2026_03", True), ("audit_2026_04", True), ("audit_2026_05", False)]
+    ]
+
+    def test_expired_partitions_dropped_others_batch_deleted(self):
+        db = _FakeDb(partitions=self._parts, deletes=[7, 0])
+        report = _purge(db, PurgeTarget("AuditEntry", "at", 60))
+        assert [s[0] for s in db.sql("DROP")] == ["DROP TABLE IF EXISTS audit_2026_04"]
+        deleted_from = [s[0].split()[2] for s in db.sql("DELETE")]
+        assert deleted_from == ["audit_2026_05", "audit_default"]
+        assert report.partitions_dropped == ["audit_2026_04"]
+        assert report.deleted == 1007
+
+    def test_expired_partitions_detached_concurrently_before_drop(self):
+        db = _FakeDb(partitions=self._undefaulted[1:])
+        _purge(db, PurgeTarget("AuditEntry", "at", 60, partitions_only=True))
+        assert db.autocommit_statements == [
+            'ALTER TABLE "AuditEntry" DETACH PARTITION audit_2026_04 CONCURRENTLY',
+            "DROP TABLE IF EXISTS audit_2026_04",
+        ]
+        assert db.autocommit is False
+
+    def test_partition_values_keep_partitions_with_other_values(self):
+        db = _FakeDb(partitions=self._undefaulted, others=[True, False])
+        target = PurgeTarget(
+            "AuditEntry",
+            "at",
+            60,
+            partitions_only=True,
+            partition_values={"entity_type": ("Order",)},
+        )
+        report = _purge(db, target)
+        assert report.partitions_dropped == ["audit_2026_04"]
+        sql, params = db.sql("SELECT EXISTS")[0]
+        assert 'NOT coalesce("entity_type" = ANY(%(v0)s), false)' in sql
+        assert "FROM audit_2026_03" in sql
+        assert params == {"v0": ["Order"]}
+
+    def test_probe_matches_the_date_column_key(self):
+        db = _FakeDb()
+        _purge(db, PurgeTarget("AuditEntry", "at", 60))
+        _, params = db.statements[0]
+        assert params["table"] == '"AuditEntry"'
+        assert params["keys"] == ["RANGE (at)", 'RANGE ("at")']
+
+    def test_filtered_target_never_drops(self):
+        db = _FakeDb(partitions=self._parts)
+        _purge(db, PurgeTarget("AuditEntry", "at", 60, where={"entity_type": "Order"}))
+        assert db.sql("DROP") == []
+        assert len(db.sql("DELETE")) == 3
+
+    def test_partitions_only_skips_row_deletes(self):
+        db = _FakeDb(partitions=self._parts, deletes=[50])
+        report = _purge(db, PurgeTarget("AuditEntry", "at", 60, partitions_only=True))
+        assert db.sql("DELETE") == []
+        assert report.partitions_dropped == ["audit_2026_04"]
+
+
+class TestReport:
+    def test_throughput_and_lock_times(self):
+        report = PurgeReport(
+            "JobRun",
+            batches=[PurgeBatch("t", 500, 10.0), PurgeBatch("t", 500, 30.0)],
+            elapsed=0.5,
+        )
+        assert report.deleted == 1000
+        assert report.rows_per_second == 2000
+        assert report.lock_ms_p50 == 20.0
+        assert report.lock_ms_max == 30.0
+        assert report.summary() == (
+            "JobRun: 1000 row(s) in 2 batch(es) + 0 partition(s), 2000 rows/s,"
+            " lock p50 20.0ms max 30.0ms"
+        )
+
+    def test_batches_are_timed(self):
+        report = _purge(_FakeDb(deletes=[10]), _JOB_RUNS, batch_size=100)
+        [batch] = report.batches
+        assert batch.lock_ms == 2.0
+        assert report.elapsed > 0
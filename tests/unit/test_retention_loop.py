@@ -10,7 +10,7 @@ Tests cover:
   * Loop ticks but doesn't fire when cron doesn't match
   * Loop fires when wildcard cron matches; dedupes within the
     same minute
-  * `run_retention_sweep` exception swallowed + counted
+  * `run_retention_purge` exception swallowed + counted
   * Invalid cron logs error + returns immediately
   * Stats keys present in returned dict
 """
@@ -21,6 +21,7 @@ import asyncio
 from typing import Any
 from unittest.mock import patch
 
+from dazzle.http.runtime.retention import PurgeBatch, PurgeReport
 from dazzle.http.runtime.retention_loop import run_retention_loop
 
 
@@ -39,7 +40,7 @@ class TestStopEvent:
             stop = asyncio.Event()
             stop.set()
             return await run_retention_loop(
-                services={},
+                db_manager=None,
                 audits=[],
                 stop_event=stop,
                 tick_interval=0.05,
@@ -55,7 +56,7 @@ class TestStopEvent:
             loop = asyncio.get_running_loop()
             loop.call_later(0.12, stop.set)
             return await run_retention_loop(
-                services={},
+                db_manager=None,
                 audits=[],
                 stop_event=stop,
                 cron="0 1 1 1 *",  # never matches in test window
@@ -74,7 +75,7 @@ class TestStopEvent:
 
 class TestCronFiring:
     def test_wildcard_cron_fires_at_least_once(self):
-        # Patch run_retention_sweep to be a fast no-op so the test
+        # Patch run_retention_purge to be a fast no-op so the test
         # can verify the loop body executes without doing actual
         # DB work.
         async def _stub_sweep(**_kwargs: Any) -> dict[str, int]:
@@ -85,11 +86,11 @@ class TestCronFiring:
             loop = asyncio.get_running_loop()
             loop.call_later(0.15, stop.set)
             with patch(
-                "dazzle.http.runtime.retention_loop.run_retention_sweep",
+                "dazzle.http.runtime.retention_loop.run_retention_purge",
                 side_effect=_stub_sweep,
             ):
                 return await run_retention_loop(
-                    services={},
+                    db_manager=None,
                     audits=[],
                     stop_event=stop,
                     cron="* * * * *",
@@ -126,7 +127,7 @@ class TestCronFiring:
             loop.call_later(0.2, stop.set)
             with (
                 patch(
-                    "dazzle.http.runtime.retention_loop.run_retention_sweep",
+                    "dazzle.http.runtime.retention_loop.run_retention_purge",
                     side_effect=_counting_sweep,
                 ),
                 patch(
@@ -135,7 +136,7 @@ class TestCronFiring:
                 ),
             ):
                 await run_retention_loop(
-                    services={},
+                    db_manager=None,
                     audits=[],
                     stop_event=stop,
                     cron="* * * * *",
@@ -156,11 +157,11 @@ class TestCronFiring:
             loop = asyncio.get_running_loop()
             loop.call_later(0.15, stop.set)
             with patch(
-                "dazzle.http.runtime.retention_loop.run_retention_sweep",
+                "dazzle.http.runtime.retention_loop.run_retention_purge",
                 side_effect=_stub_sweep,
             ):
                 return await run_retention_loop(
-                    services={},
+                    db_manager=None,
                     audits=[],
                     stop_event=stop,
                     cron="0 1 1 1 *",  # Jan 1st 01:00 only
@@ -187,11 +188,11 @@ class TestResilience:
             loop = asyncio.get_running_loop()
             loop.call_later(0.15, stop.set)
             with patch(
-                "dazzle.http.runtime.retention_loop.run_retention_sweep",
+                "dazzle.http.runtime.retention_loop.run_retention_purge",
                 side_effect=_broken_sweep,
             ):
                 return await run_retention_loop(
-                    services={},
+                    db_manager=None,
                     audits=[],
                     stop_event=stop,
                     cron="* * * * *",
@@ -207,7 +208,7 @@ class TestResilience:
         async def go():
             stop = asyncio.Event()
             return await run_retention_loop(
-                services={},
+                db_manager=None,
                 audits=[],
                 stop_event=stop,
                 cron="not a cron",
@@ -230,7 +231,7 @@ class TestStatsShape:
             stop = asyncio.Event()
             stop.set()
             return await run_retention_loop(
-                services={},
+                db_manager=None,
                 audits=[],
                 stop_event=stop,
             )
@@ -240,19 +241,24 @@ class TestStatsShape:
             assert key in stats
 
     def test_last_source_keys_added_after_run(self):
-        async def _sweep_with_stats(**_kwargs: Any) -> dict[str, int]:
-            return {"JobRun": 5, "AuditEntry:Manuscript": 3}
+        async def _sweep_with_stats(**_kwargs: Any) -> dict[str, PurgeReport]:
+            return {
+                "JobRun": PurgeReport("JobRun", [PurgeBatch("JobRun", 5, 1.0)]),
+                "AuditEntry:Manuscript": PurgeReport(
+                    "AuditEntry:Manuscript", [PurgeBatch("AuditEntry", 3, 1.0)]
+                ),
+            }
 
         async def go():
             stop = asyncio.Event()
             loop = asyncio.get_running_loop()
             loop.call_later(0.12, stop.set)
             with patch(
-                "dazzle.http.runtime.retention_loop.run_retention_sweep",
+                "dazzle.http.runtime.retention_loop.run_retention_purge",
                 side_effect=_sweep_with_stats,
             ):
                 return await run_retention_loop(
-                    services={},
+                    db_manager=None,
                     audits=[],
                     stop_event=stop,
                     cron="* * * * *",
@@ -1,34 +1,32 @@
-"""Tests for #953 cycle 11 — retention orchestrator.
+"""Tests for the retention orchestrator (#953 cycle 11, #956 cycle 12).
 
-Cycle 10 shipped the generic `sweep_old_rows` helper. Cycle 11
-ties it to both built-in retention targets:
+`retention_targets` maps the AppSpec onto purge targets for both
+built-in retention tables:
 
   * `JobRun` rows older than `jobrun_retention_days` (default 30)
-  * `AuditEntry` rows per `AuditSpec.retention_days`, filtered
-    by entity_type so a 90-day Manuscript retention doesn't
-    delete a 365-day Order retention's rows.
+  * `AuditEntry` rows per `AuditSpec.retention_days`, filtered by
+    entity_type so a 90-day Manuscript retention doesn't delete a
+    365-day Order retention's rows
 
 Tests cover:
 
-  * Both services missing → empty stats
-  * Only JobRun present → only JobRun swept
-  * Only AuditEntry+audits present → only audit rows swept
-  * Both present → both keys in stats
-  * AuditSpec retention_days=0 → that audit is skipped
-  * AuditSpec entity_name empty → skipped (defensive)
-  * jobrun_retention_days=0 → JobRun key absent (sweep helper
-    short-circuits without touching the service)
-  * Per-entity audit_type filter is applied to the list call
+  * Entities missing → no targets
+  * Per-entity audit filter and window
+  * retention_days=0 / empty entity name skipped
+  * Partition-only AuditEntry target only when every window is finite
+  * `run_retention_purge` runs each target and keys reports by label
+  * No db_manager → empty reports
 """
 
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass, field
-from datetime import UTC, datetime, timedelta
+from dataclasses import dataclass
 from typing import Any
+from unittest.mock import patch
 
-from dazzle.http.runtime.retention_runner import run_retention_sweep
+from dazzle.http.runtime.retention import PurgeReport, PurgeTarget
+from dazzle.http.runtime.retention_runner import retention_targets, run_retention_purge
 
 # ---------------------------------------------------------------------------
 # Stubs
@@ -41,186 +39,87 @@ class _AuditSpec:
     retention_days: int = 0
 
 
-@dataclass
-class _ServiceStub:
-    """Records list / delete calls; can return an arbitrary list of
-    rows once before going empty."""
-
-    rows: list[Any] = field(default_factory=list)
-    list_calls: list[dict[str, Any]] = field(default_factory=list)
-    delete_calls: list[Any] = field(default_factory=list)
-
-    async def list(self, **kwargs: Any) -> Any:
-        self.list_calls.append(kwargs)
-        out = list(self.rows)
-        self.rows = []
-        return out
-
-    async def delete(self, row_id: Any) -> bool:
-        self.delete_calls.append(row_id)
-        return True
-
-
 def _run(coro):
     return asyncio.run(coro)
 
 
+_BOTH = ("JobRun", "AuditEntry")
+
 # ---------------------------------------------------------------------------
-# Service-presence permutations
+# Targets
 # ---------------------------------------------------------------------------
 
 
-class TestServicePresence:
-    def test_both_missing_returns_empty_stats(self):
-        stats = _run(run_retention_sweep(services={}, audits=[]))
-        assert stats == {}
+class TestTargets:
+    def test_no_platform_entities_no_targets(self):
+        assert retention_targets((), [_AuditSpec("Manuscript", 90)]) == []
 
-    def test_only_jobrun_swept(self):
-        jr = _ServiceStub(rows=[{"id": "old-1"}, {"id": "old-2"}])
-        stats = _run(
-            run_retention_sweep(
-                services={"JobRun": jr},
-                audits=[],
-                jobrun_retention_days=30,
-            )
-        )
-        assert stats == {"JobRun": 2}
-        assert jr.delete_calls == ["old-1", "old-2"]
-
-    def test_only_audit_swept(self):
-        ae = _ServiceStub(rows=[{"id": "audit-1"}])
-        stats = _run(
-            run_retention_sweep(
-                services={"AuditEntry": ae},
-                audits=[_AuditSpec(entity="Manuscript", retention_days=90)],
-            )
-        )
-        assert stats == {"AuditEntry:Manuscript": 1}
-
-    def test_both_present_both_swept(self):
-        jr = _ServiceStub(rows=[{"id": "j-1"}])
-        ae = _ServiceStub(rows=[{"id": "a-1"}, {"id": "a-2"}])
-        stats = _run(
-            run_retention_sweep(
-                services={"JobRun": jr, "AuditEntry": ae},
-                audits=[_AuditSpec(entity="Manuscript", retention_days=90)],
-            )
-        )
-        assert stats == {"JobRun": 1, "AuditEntry:Manuscript": 2}
-
-
-# ---------------------------------------------------------------------------
-# Retention=0 honoured
-# ---------------------------------------------------------------------------
+    def test_jobrun_by_created_at(self):
+        assert retention_targets(_BOTH, [], jobrun_retention_days=7) == [
+            PurgeTarget("JobRun", "created_at", 7)
+        ]
 
+    def test_jobrun_retention_zero_no_target(self):
+        assert retention_targets(_BOTH, [], jobrun_retention_days=0) == []
 
-class TestKeepForeverSentinel:
-    def test_audit_retention_zero_skipped(self):
-        # AuditSpec with retention_days=0 ("keep forever") should
-        # not appear in stats and the AuditEntry service should
-        # not be called for it.
-        ae = _ServiceStub(rows=[{"id": "x"}])
-        stats = _run(
-            run_retention_sweep(
-                services={"AuditEntry": ae},
-                audits=[_AuditSpec(entity="Manuscript", retention_days=0)],
-            )
+    def test_each_audit_filtered_by_entity_type(self):
+        targets = retention_targets(
+            ("AuditEntry",),
+            [_AuditSpec("Manuscript", 90), _AuditSpec("Order", 365)],
         )
-        assert stats == {}
-        assert ae.list_calls == []  # never called
-
-    def test_jobrun_retention_zero_no_jobrun_key(self):
-        jr = _ServiceStub(rows=[{"id": "old"}])
-        stats = _run(
-            run_retention_sweep(
-                services={"JobRun": jr},
-                audits=[],
-                jobrun_retention_days=0,
-            )
+        assert targets == [
+            PurgeTarget(
+                "AuditEntry",
+                "at",
+                365,
+                partitions_only=True,
+                partition_values={"entity_type": ("Manuscript", "Order")},
+            ),
+            PurgeTarget(
+                "AuditEntry",
+                "at",
+                90,
+                where={"entity_type": "Manuscript"},
+                label="AuditEntry:Manuscript",
+            ),
+            PurgeTarget(
+                "AuditEntry", "at", 365, where={"entity_type": "Order"}, label="AuditEntry:Order"
+            ),
+        ]
+
+    def test_keep_forever_audit_skipped_and_blocks_partition_drops(self):
+        targets = retention_targets(
+            ("AuditEntry",), [_AuditSpec("Manuscript", 0), _AuditSpec("Order", 30)]
         )
-        # cycle-10 sweep_old_rows short-circuits to 0 — orchestrator
-        # records that as the JobRun count.
-        assert stats == {"JobRun": 0}
-        assert jr.list_calls == []  # cycle-10 didn't list either
+        assert [t.key for t in targets] == ["AuditEntry:Order"]
 
     def test_empty_entity_name_skipped(self):
-        # Defensive: AuditSpec with empty entity name should be
-        # skipped without crashing the run.
-        ae = _ServiceStub(rows=[{"id": "x"}])
-        stats = _run(
-            run_retention_sweep(
-                services={"AuditEntry": ae},
-                audits=[_AuditSpec(entity="", retention_days=30)],
-            )
-        )
-        assert stats == {}
-        assert ae.list_calls == []
+        targets = retention_targets(("AuditEntry",), [_AuditSpec("", 30)])
+        assert targets == []
 
 
 # ---------------------------------------------------------------------------
-# Multi-entity audit filtering
+# Runner
 # ---------------------------------------------------------------------------
 
 
-class TestPerEntityAuditFilter:
-    def test_each_audit_filtered_by_entity_type(self):
-        # Two audits with different windows on different entities.
-        # Each must list with `entity_type` filter pinned to its
-        # entity so they don't overwrite each other's data.
-        ae = _ServiceStub(rows=[{"id": "a-1"}])
-        _run(
-            run_retention_sweep(
-                services={"AuditEntry": ae},
-                audits=[
-                    _AuditSpec(entity="Manuscript", retention_days=90),
-                    _AuditSpec(entity="Order", retention_days=365),
-                ],
-            )
-        )
-        # Two list calls — one per audit spec.
-        list_filters = [c["filters"] for c in ae.list_calls]
-        entity_types = [f.get("entity_type") for f in list_filters]
-        assert "Manuscript" in entity_types
-        assert "Order" in entity_types
-
-    def test_cutoff_per_entity_uses_correct_window(self):
-        # Verify the at__lt cutoff matches each entity's retention
-        # window (90 days for Manuscript, 365 for Order).
-        ae = _ServiceStub(rows=[])
-        _run(
-            run_retention_sweep(
-                services={"AuditEntry": ae},
-                audits=[
-                    _AuditSpec(entity="Manuscript", retention_days=90),
-                    _AuditSpec(entity="Order", retention_days=365),
-                ],
-            )
-        )
-        for call in ae.list_calls:
-            entity = call["filters"]["entity_type"]
-            cutoff = call["filters"]["at__lt"]
-            expected_days = 90 if entity == "Manuscript" else 365
-            expected = datetime.now(UTC) - timedelta(days=expected_days)
-            # 5s slop for test execution time.
-            assert abs((cutoff - expected).total_seconds()) < 5
-
-
-# ---------------------------------------------------------------------------
-# JobRun integration with cycle-10 sweep_old_rows
-# ---------------------------------------------------------------------------
+class TestRunner:
+    def test_reports_keyed_by_target(self):
+        seen: list[PurgeTarget] = []
 
+        def _fake_purge(db: Any, target: PurgeTarget, **kwargs: Any) -> PurgeReport:
+            seen.append(target)
+            assert kwargs == {"batch_size": 250, "pause": 0.1}
+            return PurgeReport(target.key)
 
-class TestJobRunFilterShape:
-    def test_jobrun_uses_created_at_filter(self):
-        jr = _ServiceStub(rows=[{"id": "x"}])
-        _run(
-            run_retention_sweep(
-                services={"JobRun": jr},
-                audits=[],
-                jobrun_retention_days=7,
+        targets = retention_targets(_BOTH, [_AuditSpec("Manuscript", 90)])
+        with patch("dazzle.http.runtime.retention_runner.purge_expired", _fake_purge):
+            reports = _run(
+                run_retention_purge(db_manager=object(), targets=targets, batch_size=250, pause=0.1)
             )
-        )
-        # Cycle-10 sweep filters by `<date_field>__lt`; for JobRun
-        # the date column is `created_at`.
-        call = jr.list_calls[0]
-        assert "created_at__lt" in call["filters"]
+        assert seen == targets
+        assert list(reports) == ["JobRun", "AuditEntry", "AuditEntry:Manuscript"]
+
+    def test_no_db_manager_is_a_no_op(self):
+        targets = retention_targets(_BOTH, [])
+        assert _run(run_retention_purge(db_manager=None, targets=targets)) == {}
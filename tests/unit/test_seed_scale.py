@@ -0,0 +1,167 @@
+"""``dazzle seed scale``: AppSpec → FK-consistent, tenant-partitioned COPY rows."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import uuid
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from dazzle.seed.scale import (
+    RowFactory,
+    copy_text,
+    parse_row_counts,
+    plan_scale,
+    row_id,
+)
+
+_DSL = """\
+module test
+app test_app "Test App"
+
+tenancy:
+  mode: shared_schema
+
+entity Org "Org":
+  archetype: tenant
+  id: uuid pk
+  name: str(200) required
+
+entity Project "Project":
+  id: uuid pk
+  name: str(100) required
+  code: str(8) unique
+  token: uuid unique
+
+entity Ticket "Ticket":
+  id: uuid pk
+  title: str(12) required
+  status: enum[open,assigned,resolved,closed,spam]=open
+  budget: decimal(5,2)
+  weight: float
+  project: ref Project required
+  parent: ref Ticket
+
+  transitions:
+    open -> assigned
+    assigned -> resolved
+    resolved -> closed
+"""
+
+
+def _build_appspec(dsl: str) -> Any:
+    from dazzle.core.linker import build_appspec
+    from dazzle.core.parser import parse_modules
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".dsl", delete=False) as f:
+        f.write(dsl)
+        fpath = Path(f.name)
+    try:
+        modules = parse_modules([fpath])
+        return build_appspec(modules, modules[0].name)
+    finally:
+        os.unlink(fpath)
+
+
+@pytest.fixture(scope="module")
+def appspec() -> Any:
+    return _build_appspec(_DSL)
+
+
+def _rows(appspec: Any, plan: Any, name: str) -> list[dict[str, str]]:
+    entities = {e.name: e for e in appspec.domain.entities}
+    factory = RowFactory(entities[name], plan, entities)
+    lines = factory.lines(0, factory.count).splitlines()
+    return [dict(zip(factory.columns, line.split("\t"), strict=True)) for line in lines]
+
+
+@pytest.fixture(scope="module")
+def plan(appspec: Any) -> Any:
+    return plan_scale(appspec, {"Ticket": 400}, tenants=4, parent_rows=12, seed=7)
+
+
+class TestPlan:
+    def test_parse_row_counts(self) -> None:
+        assert parse_row_counts(["Ticket=1_000", "Project=5"]) == {"Ticket": 1000, "Project": 5}
+        with pytest.raises(ValueError):
+            parse_row_counts(["Ticket"])
+        with pytest.raises(ValueError):
+            parse_row_counts(["Ticket=-1"])
+
+    def test_required_parents_and_tenants_are_added_parents_first(self, appspec: Any) -> None:
+        plan = plan_scale(appspec, {"Ticket": 500}, tenants=4, parent_rows=20)
+        assert plan.order == ["Org", "Project", "Ticket"]
+        assert plan.counts == {"Org": 4, "Project": 20, "Ticket": 500}
+        assert (plan.tenant_entity, plan.partition_key) == ("Org", "tenant_id")
+        assert any("Project" in note for note in plan.notes)
+
+    def test_scoped_parents_get_a_row_per_tenant(self, appspec: Any) -> None:
+        plan = plan_scale(appspec, {"Ticket": 50, "Project": 2}, tenants=8)
+        assert plan.counts["Project"] == 8
+
+    def test_unknown_entity_is_rejected(self, appspec: Any) -> None:
+        with pytest.raises(ValueError, match="Nope"):
+            plan_scale(appspec, {"Nope": 1})
+
+
+class TestRows:
+    def test_refs_stay_inside_the_childs_tenant(self, appspec: Any, plan: Any) -> None:
+        projects = {r["id"]: r["tenant_id"] for r in _rows(appspec, plan, "Project")}
+        tickets = _rows(appspec, plan, "Ticket")
+        orgs = {r["id"] for r in _rows(appspec, plan, "Org")}
+        assert {t["tenant_id"] for t in tickets} == orgs
+        for ticket in tickets:
+            assert projects[ticket["project"]] == ticket["tenant_id"]
+
+    def test_optional_self_ref_points_at_an_earlier_same_tenant_row(
+        self, appspec: Any, plan: Any
+    ) -> None:
+        tickets = _rows(appspec, plan, "Ticket")
+        position = {t["id"]: i for i, t in enumerate(tickets)}
+        parented = [(i, t) for i, t in enumerate(tickets) if t["parent"] != "\\N"]
+        assert parented and len(parented) < len(tickets)
+        for i, ticket in parented:
+            parent = tickets[position[ticket["parent"]]]
+            assert position[ticket["parent"]] <= i
+            assert parent["tenant_id"] == ticket["tenant_id"]
+
+    def test_values_respect_the_ir(self, appspec: Any, plan: Any) -> None:
+        tickets = _rows(appspec, plan, "Ticket")
+        assert {t["status"] for t in tickets} == {"open", "assigned", "resolved", "closed"}
+        assert all(len(t["title"]) <= 12 for t in tickets)
+        assert all(float(t["budget"]) < 1000 for t in tickets)
+        assert all(0 <= float(t["weight"]) <= 1000 for t in tickets)
+        codes = [p["code"] for p in _rows(appspec, plan, "Project")]
+        assert len(set(codes)) == len(codes) and all(len(c) <= 8 for c in codes)
+
+    def test_ids_are_deterministic_and_disjoint_per_seed(self, appspec: Any, plan: Any) -> None:
+        tickets = _rows(appspec, plan, "Ticket")
+        assert tickets[3]["id"] == str(row_id("Ticket", 3, 7))
+        assert len({t["id"] for t in tickets}) == 400
+        assert row_id("Ticket", 3, 7) != row_id("Ticket", 3, 8)
+
+    def test_rows_are_reproducible_for_a_seed(self, appspec: Any, plan: Any) -> None:
+        projects = _rows(appspec, plan, "Project")
+        assert _rows(appspec, plan, "Project") == projects
+        tokens = [uuid.UUID(p["token"]) for p in projects]
+        assert len(set(tokens)) == len(tokens) and all(t.version == 4 for t in tokens)
+
+        other = plan_scale(appspec, {"Ticket": 400}, tenants=4, parent_rows=12, seed=8)
+        assert _rows(appspec, other, "Project")[0]["token"] != projects[0]["token"]
+
+    def test_chunks_cover_every_row(self, appspec: Any, plan: Any) -> None:
+        entities = {e.name: e for e in appspec.domain.entities}
+        factory = RowFactory(entities["Ticket"], plan, entities)
+        data = b"".join(factory.chunks(["id", "status"]))
+        assert data.count(b"\n") == 400
+        assert data.split(b"\n")[0].count(b"\t") == 1
+
+
+def test_copy_text_escaping() -> None:
+    assert copy_text(None) == "\\N"
+    assert copy_text(True) == "t"
+    assert copy_text("a\tb\nc\\") == "a\\tb\\nc\\\\"
+    assert copy_text({"k": 1}) == '{"k": 1}'
@@ -0,0 +1,200 @@
+"""Tests for set-based where-scoped update effects.
+
+``SideEffectExecutor`` hands a ``where:`` update to
+``CRUDService.update_where``; the batched path must leave the same rows and
+fire the same ``on_updated`` stream (the audit / event / cascade feed) as
+calling ``update`` once per matching row.
+"""
+
+import threading
+from typing import Any
+from unittest.mock import MagicMock
+from uuid import UUID
+
+import pytest
+from pydantic import BaseModel
+
+from dazzle.core.ir.process import EffectAction, FieldAssignment, StepEffect
+from dazzle.core.ir.state_machine import InvokeFlowSpec
+from dazzle.http.runtime.repository import Repository
+from dazzle.http.runtime.service_generator import CRUDService
+from dazzle.http.runtime.side_effect_executor import EffectContext, SideEffectExecutor
+from dazzle.http.runtime.state_machine import TransitionError
+from dazzle.http.specs.entity import (
+    EntitySpec,
+    FieldSpec,
+    FieldType,
+    ScalarType,
+    StateMachineSpec,
+    StateTransitionSpec,
+)
+
+
+class Ticket(BaseModel):
+    id: UUID
+    queue: str
+    status: str = "open"
+
+
+class TicketCreate(BaseModel):
+    queue: str
+    status: str = "open"
+
+
+class TicketUpdate(BaseModel):
+    queue: str | None = None
+    status: str | None = None
+
+
+_IDS = [UUID(f"00000000-0000-0000-0000-00000000000{i}") for i in range(1, 5)]
+
+_CLOSE = StepEffect(
+    action=EffectAction.UPDATE,
+    entity_name="Ticket",
+    where="queue = self.queue",
+    assignments=[FieldAssignment(field_path="Ticket.status", value='"closed"')],
+)
+
+
+def _service(
+    state_machine: StateMachineSpec | None = None,
+) -> tuple[CRUDService[Ticket, TicketCreate, TicketUpdate], list[tuple[Any, ...]]]:
+    service = CRUDService(
+        entity_name="Ticket",
+        model_class=Ticket,
+        create_schema=TicketCreate,
+        update_schema=TicketUpdate,
+        state_machine=state_machine,
+    )
+    for ticket_id, queue in zip(_IDS, ["billing", "billing", "sales", "billing"], strict=True):
+        service._store[ticket_id] = Ticket(id=ticket_id, queue=queue)
+    stream: list[tuple[Any, ...]] = []
+
+    async def _record(name: str, entity_id: str, new: Any, old: Any) -> None:
+        stream.append((name, entity_id, new, old))
+
+    service.on_updated(_record)
+    return service, stream
+
+
+def _machine(**transition: Any) -> StateMachineSpec:
+    return StateMachineSpec(
+        status_field="status",
+        states=["open", "closed", "archived"],
+        transitions=[StateTransitionSpec(from_state="open", to_state="closed", **transition)],
+    )
+
+
+async def _run(service: CRUDService[Ticket, TicketCreate, TicketUpdate]) -> int:
+    executor = SideEffectExecutor({"Ticket": service})
+    (result,) = await executor.execute_effects(
+        [_CLOSE], EffectContext(trigger_entity={"queue": "billing"})
+    )
+    assert result.success, result.error
+    return int(result.affected_count)
+
+
+@pytest.mark.asyncio
+async def test_batched_stream_matches_per_row_updates() -> None:
+    batched, batched_stream = _service()
+    per_row, per_row_stream = _service()
+
+    assert await _run(batched) == 3
+    for ticket_id in (_IDS[0], _IDS[1], _IDS[3]):
+        await per_row.update(ticket_id, TicketUpdate(status="closed"))
+
+    assert batched_stream == per_row_stream
+    assert [e[1] for e in batched_stream] == [str(_IDS[0]), str(_IDS[1]), str(_IDS[3])]
+    assert batched._store == per_row._store
+    assert batched._store[_IDS[2]].status == "open"
+
+
+@pytest.mark.asyncio
+async def test_invalid_transition_writes_nothing() -> None:
+    service, stream = _service(_machine())
+    service._store[_IDS[1]] = Ticket(id=_IDS[1], queue="billing", status="archived")
+
+    with pytest.raises(TransitionError):
+        await service.update_where("queue", "billing", TicketUpdate(status="closed"))
+
+    assert stream == []
+    assert service._store[_IDS[0]].status == "open"
+
+
+@pytest.mark.asyncio
+async def test_invoke_transition_needs_per_row_path() -> None:
+    service, stream = _service(
+        _machine(invoke_flow=InvokeFlowSpec(flow_name="settle", bindings=[]))
+    )
+
+    assert await service.update_where("queue", "billing", TicketUpdate(status="closed")) is None
+    assert stream == []
+    assert all(t.status == "open" for t in service._store.values())
+
+
+@pytest.mark.asyncio
+async def test_pre_update_hook_falls_back_to_per_row() -> None:
+    service, stream = _service()
+    seen: list[str] = []
+    service.add_pre_update_hook(lambda _name, entity_id, data, _old: seen.append(entity_id))
+
+    assert await service.update_where("queue", "billing", TicketUpdate(status="closed")) is None
+    assert await _run(service) == 3
+    assert len(seen) == 3
+    assert len(stream) == 3
+
+
+@pytest.mark.asyncio
+async def test_repository_transaction_runs_off_the_event_loop() -> None:
+    service, stream = _service()
+    threads: list[int] = []
+    olds = [Ticket(id=i, queue="billing") for i in _IDS[:2]]
+
+    def _lock(_conn: Any, _field: str, _value: Any) -> list[Ticket]:
+        threads.append(threading.get_ident())
+        return olds
+
+    repo = MagicMock()
+    repo.supports_set_update.return_value = True
+    repo.lock_matching_on_conn.side_effect = _lock
+    repo.update_ids_on_conn.return_value = [t.model_copy(update={"status": "closed"}) for t in olds]
+    service._repository = repo
+
+    updated = await service.update_where("queue", "billing", TicketUpdate(status="closed"))
+
+    assert [t.status for t in updated or []] == ["closed", "closed"]
+    assert threads and threads[0] != threading.get_ident()
+    assert [e[1] for e in stream] == [str(_IDS[0]), str(_IDS[1])]
+
+
+def test_repository_sql_locks_then_updates_in_one_statement() -> None:
+    spec = EntitySpec(
+        name="Ticket",
+        fields=[
+            FieldSpec(name="id", type=FieldType(kind="scalar", scalar_type=ScalarType.UUID)),
+            FieldSpec(name="queue", type=FieldType(kind="scalar", scalar_type=ScalarType.STR)),
+            FieldSpec(name="status", type=FieldType(kind="scalar", scalar_type=ScalarType.STR)),
+        ],
+    )
+    repo: Repository[Ticket] = Repository(
+        db_manager=MagicMock(placeholder="%s"), entity_spec=spec, model_class=Ticket
+    )
+    assert repo.supports_set_update("queue")
+    assert not repo.supports_set_update("nope")
+
+    conn = MagicMock()
+    cursor = conn.cursor.return_value
+    cursor.fetchall.return_value = [
+        {"id": _IDS[1], "queue": "billing", "status": "closed"},
+        {"id": _IDS[0], "queue": "billing", "status": "closed"},
+    ]
+    repo.lock_matching_on_conn(conn, "queue", "billing")
+    lock_sql = cursor.execute.call_args[0][0]
+    assert '"queue" = %s' in lock_sql
+    assert lock_sql.rstrip().endswith("FOR UPDATE")
+
+    updated = repo.update_ids_on_conn(conn, _IDS[:2], {"status": "closed"})
+    update_sql, params = cursor.execute.call_args[0]
+    assert '"id" = ANY(%s) RETURNING *' in update_sql
+    assert params == ["closed", _IDS[:2]]
+    assert [t.id for t in updated] == _IDS[:2]
@@ -378,7 +378,7 @@ class TestSubmitSignature:
         client = TestClient(app)
         token = mint_token(record_id, "a@example.com")
         with mock_patch(
-            "dazzle.signing.routes.generate_pdf",
+            "dazzle.signing.routes.async_generate_pdf",
             side_effect=SigningError(
                 "fpdf2 is not installed. Install with `pip install dazzle-dsl[signing]`."
             ),
@@ -599,7 +599,7 @@ class TestFullSignFlow:
 
     def test_custom_branding_flows_into_pdf_pipeline(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """A custom ``PdfBranding`` passed to ``create_signing_routes``
-        reaches ``generate_pdf`` + ``async_sign_pdf`` unchanged. The
+        reaches ``async_generate_pdf`` + ``async_sign_pdf`` unchanged. The
         PDF content stream is compressed so we can't grep it, but we
         can prove the branding is what the pipeline sees."""
         pytest.importorskip("fpdf")
@@ -616,12 +616,12 @@ class TestFullSignFlow:
         )
 
         captured: dict[str, Any] = {}
-        real_generate_pdf = signing_service.generate_pdf
+        real_generate_pdf = signing_service.async_generate_pdf
         real_async_sign_pdf = signing_service.async_sign_pdf
 
-        def spy_generate_pdf(*args: Any, **kwargs: Any) -> bytes:
+        async def spy_generate_pdf(*args: Any, **kwargs: Any) -> bytes:
             captured["generate_branding"] = kwargs.get("branding")
-            return real_generate_pdf(*args, **kwargs)
+            return await real_generate_pdf(*args, **kwargs)
 
         async def spy_async_sign_pdf(*args: Any, **kwargs: Any) -> bytes:
             captured["sign_branding"] = kwargs.get("branding")
@@ -629,7 +629,7 @@ class TestFullSignFlow:
 
         # Patch the symbols the route handler imported at module load
         # time — those are the names create_signing_routes calls into.
-        monkeypatch.setattr("dazzle.signing.routes.generate_pdf", spy_generate_pdf)
+        monkeypatch.setattr("dazzle.signing.routes.async_generate_pdf", spy_generate_pdf)
         monkeypatch.setattr("dazzle.signing.routes.async_sign_pdf", spy_async_sign_pdf)
 
         app, _ = _app_with_routes(
@@ -13,10 +13,11 @@ integration suite (also gated on REDIS_URL).
 
 from __future__ import annotations
 
+import logging
 import os
 from unittest.mock import patch
 
-from dazzle.cli.worker import _build_queue, worker_app
+from dazzle.cli.worker import _build_queue, _handler_pool, worker_app
 
 # ---------------------------------------------------------------------------
 # Queue selection
@@ -57,6 +58,32 @@ class TestBuildQueue:
             queue, _ = _build_queue(redis_key="x")
         assert isinstance(queue, InMemoryJobQueue)
 
+    def test_postgres_preferred_when_database_available(self, caplog):
+        from dazzle.http.runtime.postgres_job_queue import PostgresJobQueue
+
+        with (
+            patch.dict(os.environ, {"REDIS_URL": "redis://localhost:6379/0"}),
+            patch("dazzle.core.environment.skip_boot_schema_ddl", return_value=True),
+            caplog.at_level(logging.WARNING, logger="dazzle.cli.worker"),
+        ):
+            queue, label = _build_queue(redis_key="x", db_manager=object())
+        assert isinstance(queue, PostgresJobQueue)
+        assert "Postgres" in label
+        assert "REDIS_URL is ignored" in caplog.text
+
+
+class TestHandlerPool:
+    def test_no_pool_without_processes(self):
+        assert _handler_pool(0) is None
+
+    def test_pool_does_not_fork(self):
+        pool = _handler_pool(2)
+        assert pool is not None
+        try:
+            assert pool._mp_context.get_start_method() in ("forkserver", "spawn")
+        finally:
+            pool.shutdown()
+
 
 # ---------------------------------------------------------------------------
 # CLI registration